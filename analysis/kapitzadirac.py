@@ -2,10 +2,10 @@ import os
 
 import numpy as np
 import scipy as sp
-import matplotlib.pyplot as plt
 
 from .. import imageio, imageprocess, filetools, fitfuncs
 from constants import hbar, mp
+import lattice
 
 
 k = 2*np.pi/1064e-9
@@ -19,25 +19,30 @@ def dampedsine(xx, freq, c1, c2, c3, c4):
     return ans
 
 
-def bandgap_dE(depth):
+def bandgap_dE(depth, exact=False):
     """This is the energy gap between the bottoms of the first and third bands.
 
     This energy gap, E_{2,0} - E_{0,0}, determines the frequency of
     population oscillation between those bands that we measure. Note that
-    this is an approximation that becomes inaccurate above lattice depths of
-    about 10 Er. Between 5 and 10 Er seems best to do the calibration.
+    the default is an approximation that becomes inaccurate above lattice
+    depths of about 10 Er. Between 5 and 10 Er seems best to do the
+    calibration. With exact=True the gap is taken from the band structure
+    at q=0, which is valid for all depths.
 
     """
 
+    if exact:
+        bands = lattice.bandstructure(depth, numq=1, nbands=3, coeffs=False)[0]
+        return Er*(bands[..., 2, 0] - bands[..., 0, 0])
     return Er*np.sqrt(16 + 12./25*depth**2)
 
 
-def lat_depth(freq):
+def lat_depth(freq, exact=False):
     """Calculate the lattice depth from Kapitza-Dirac calibration procedure"""
 
     def dE_minus_hw(depth):
         """Lattice depth in recoils"""
-        return bandgap_dE(depth) - hbar*freq
+        return bandgap_dE(depth, exact=exact) - hbar*freq
 
     ans = sp.optimize.fsolve(dE_minus_hw, 10)
     return ans
@@ -73,6 +78,7 @@ def analyze_kapitzadirac(imglist, lat_time, roi, showfig=False):
         odimg = imageprocess.trans2od(transimg)
 
         if showfig:
+            import matplotlib.pyplot as plt
             fig = plt.figure()
             ax = fig.add_subplot(111)
             ax.imshow(odimg, vmin=0, vmax=1.35)
@@ -107,6 +113,7 @@ def show_kd_result(time_on, sum_od, fitparams):
     print 'lattice depth for Na is: ', Na_depth
     print 'lattice depth for Li is: ', Li_depth
 
+    import matplotlib.pyplot as plt
     fig = plt.figure()
     ax = fig.add_subplot(211)
     ax.plot(time_on, sum_od, 'bo')
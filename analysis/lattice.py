@@ -15,10 +15,13 @@ an error of a factor of 4 in all energies.
 
 import numpy as np
 import scipy as sp
-import matplotlib.pyplot as plt
 
 
-def bandstructure(U0, jmax=10, numq=100):
+# the number of bytes of Hamiltonians that are diagonalized in one call
+_CHUNKBYTES = 2**24
+
+
+def bandstructure(U0, jmax=10, numq=100, nbands=None, coeffs=True):
     """Calculate the band energies for a 1D lattice with depth U0.
 
     Got expressions from the thesis of Daley (2005). Greiner (2003) gives
@@ -26,21 +29,37 @@ def bandstructure(U0, jmax=10, numq=100):
     of the Hamiltonian. This term is needed to keep the bottom of the band at
     zero energy.
 
+    The Hamiltonians for all quasi-momenta (and all lattice depths if U0 is
+    an array) are real symmetric and tridiagonal. They are diagonalized with
+    the stacked symmetric eigensolver, many in a single call. For a large
+    grid of depths and quasi-momenta this is done in chunks, of which only
+    the lowest nbands are kept, so the memory used does not grow with the
+    number of bands that is discarded.
+
     **Inputs**
 
-      * U0: scalar, the lattice depth in recoils
+      * U0: scalar or 1D array, the lattice depth(s) in recoils
       * jmax: int, the maximum l considered (see Daley thesis, p.17)
       * numq: int, the number of positive quasi-momenta for which the
               band energies are calculated
+      * nbands: int, the number of (lowest) bands that is kept. Default is
+                all 2*jmax+1 bands.
+      * coeffs: bool, if False only the energies are calculated, which is
+                faster, and blochstate_coeffs is None.
 
     **Outputs**
 
       * band_energies: 2D array, containing the eigen energies in recoils for
-                       several bands and a range (numq values) of quasi momenta
-                       equally distributed from zero to the band edge.
+                       nbands bands and a range (numq values) of quasi momenta
+                       equally distributed from zero to the band edge. If U0
+                       is an array, a 3D array with the lattice depth along
+                       the first axis.
       * blochstate_coeffs: 3D array, containing the coefficients
                            :math:`c_J^{(n,q)}` of the Fourier expansion of
-                           the Bloch functions of the lattice.
+                           the Bloch functions of the lattice, with J along
+                           the first axis and the band n along the second.
+                           If U0 is an array, a 4D array with the lattice
+                           depth along the first axis.
 
     **References**
 
@@ -49,27 +68,78 @@ def bandstructure(U0, jmax=10, numq=100):
 
     """
 
+    depths = np.atleast_1d(np.asarray(U0, dtype=float))
+    nstates = 2*jmax + 1
+    if nbands is None:
+        nbands = nstates
     quasi_k = np.linspace(0, 1, num=numq)
-    band_energies = np.zeros((2*jmax+1, numq))
-    blochstate_coeffs = np.zeros((2*jmax+1, 2*jmax+1, numq))
-
-    for ii, qk in enumerate(quasi_k):
-        # construct the Hamiltonian
-        # diagonal terms given by free-space dispersion relations
-        v_kin = (np.arange(-jmax, jmax+1)*2 + qk)**2 + U0/2.
-        # off-diagonal terms given by the cosine potential
-        v_hop = -np.ones(2*jmax)*U0/4.
-        ham = np.diag(v_hop, 1) + np.diag(v_hop, -1) + np.diag(v_kin, 0)
-
-        energy_ii, blochstate = np.linalg.eig(ham)
-        energy_ii.sort()
-        band_energies[:, ii] = energy_ii
-        blochstate_coeffs[:, :, ii] = blochstate
+
+    # one Hamiltonian for each combination of depth and quasi-momentum
+    problem_depths = depths.repeat(numq)
+    problem_k = np.tile(quasi_k, depths.size)
+    energies = np.empty((problem_depths.size, nbands))
+    if coeffs:
+        blochstates = np.empty((problem_depths.size, nstates, nbands))
+    chunk = max(1, _CHUNKBYTES // (8*nstates**2))
+    for start in xrange(0, problem_depths.size, chunk):
+        part = slice(start, start + chunk)
+        ham = _hamiltonians(problem_depths[part], problem_k[part], jmax)
+        # eigenvalues are sorted ascending, eigenvectors are columns
+        if coeffs:
+            part_energies, part_states = np.linalg.eigh(ham)
+            blochstates[part] = part_states[..., :nbands]
+        else:
+            part_energies = np.linalg.eigvalsh(ham)
+        energies[part] = part_energies[..., :nbands]
+
+    band_energies = np.swapaxes(energies.reshape(depths.size, numq, nbands),
+                                1, 2)
+    if coeffs:
+        blochstate_coeffs = np.rollaxis(blochstates.reshape(depths.size, numq,
+                                                            nstates, nbands),
+                                        1, 4)
+    else:
+        blochstate_coeffs = None
+
+    if np.ndim(U0) == 0:
+        band_energies = band_energies[0]
+        if coeffs:
+            blochstate_coeffs = blochstate_coeffs[0]
 
     return band_energies, blochstate_coeffs
 
 
-def latt_energies(U0, printing=False):
+def _hamiltonians(depths, quasi_k, jmax):
+    """Return the Hamiltonians for pairs of depth and quasi-momentum
+
+    **Inputs**
+
+      * depths: 1D array, the lattice depths in recoils
+      * quasi_k: 1D array, the quasi-momenta, same length as depths
+      * jmax: int, the maximum l considered
+
+    **Outputs**
+
+      * ham: 3D array, indexed by pair, J and J'
+
+    """
+
+    nstates = 2*jmax + 1
+    ham = np.zeros((depths.size, nstates, nstates))
+    diag = np.arange(nstates)
+    # diagonal terms given by free-space dispersion relations
+    ham[:, diag, diag] = (np.arange(-jmax, jmax+1)*2 + \
+                          quasi_k[:, np.newaxis])**2 + \
+                         depths[:, np.newaxis]/2.
+    # off-diagonal terms given by the cosine potential
+    v_hop = -depths[:, np.newaxis]/4.
+    ham[:, diag[:-1], diag[1:]] = v_hop
+    ham[:, diag[1:], diag[:-1]] = v_hop
+
+    return ham
+
+
+def latt_energies(U0, printing=False, nbands=None):
     """Calculate the band structure, gap, width and tunneling element.
 
     The results are for a 1D lattice. For a 3D cubic lattice the bandwidth is
@@ -79,23 +149,31 @@ def latt_energies(U0, printing=False):
 
     **Inputs**
 
-      * U0: scalar, the lattice depth in recoil energies
+      * U0: scalar or 1D array, the lattice depth(s) in recoil energies
       * printing, bool, if True print the results for band width, gap and tJ.
+      * nbands: int, the number of bands returned in band_energies, at least
+                2. Default is all bands.
 
     **Outputs**
 
       * band_energies: 2D array, containing the eigen energies in recoils for
                        several bands and a range (numq values) of quasi momenta
-                       equally distributed from zero to the band edge.
+                       equally distributed from zero to the band edge. 3D if
+                       U0 is an array.
       * bandwidth: float, the band width in recoils
       * bandgap: float, the band gap in recoils
       * tJ: float, the tunneling matrix element in recoils.
 
+      If U0 is an array, bandwidth, bandgap and tJ are arrays of the same
+      length.
+
     """
 
-    bandenergies, blochstates = bandstructure(U0)
-    bandwidth = bandenergies[0, :].max() - bandenergies[0, :].min()
-    bandgap = bandenergies[1, :].min() - bandenergies[0, :].max()
+    bandenergies = bandstructure(U0, nbands=nbands, coeffs=False)[0]
+    bandwidth = bandenergies[..., 0, :].max(axis=-1) - \
+                bandenergies[..., 0, :].min(axis=-1)
+    bandgap = bandenergies[..., 1, :].min(axis=-1) - \
+              bandenergies[..., 0, :].max(axis=-1)
     tJ = bandwidth/4
 
     if printing:
@@ -135,6 +213,13 @@ def Etrap(N, a_lat, mass, wr, wz=None):
     return Et
 
 
+def _foldover(bstruct):
+    """Mirror a band structure from [0, 1] to [-1, 1] along the last axis"""
+
+    mirror_idx = np.arange(bstruct.shape[-1]-1, 0, -1)
+    return np.concatenate((bstruct[..., mirror_idx], bstruct), axis=-1)
+
+
 def plot_bands(bstruct, nbands=3, foldover=True):
     """Show the band structure for a given number of bands
 
@@ -153,17 +238,12 @@ def plot_bands(bstruct, nbands=3, foldover=True):
     """
 
     if foldover:
-        bsize = bstruct.shape
-        temp = np.zeros((bsize[0], bsize[1]*2-1))
-        print temp.shape, bsize
-        temp[:, bsize[1]-1:] = bstruct
-        mirror_idx = np.arange(bsize[1]-1, 0, -1)
-        temp[:, :bsize[1]-1] = bstruct[:, mirror_idx]
-        bstruct = temp
+        bstruct = _foldover(bstruct)
         k_quasi = np.linspace(-1, 1, num=bstruct.shape[1])
     else:
         k_quasi = np.linspace(0, 1, num=bstruct.shape[1])
 
+    import matplotlib.pyplot as plt
     fig = plt.figure()
     ax = fig.add_subplot(111)
     for i in range(nbands):
@@ -172,4 +252,59 @@ def plot_bands(bstruct, nbands=3, foldover=True):
     ax.set_xlabel(r'$qa/\pi$')
     ax.set_ylabel(r'$E (E_r)$')
 
-    return fig
\ No newline at end of file
+    return fig
+
+
+def sweep_bands(U0, nbands=3, foldover=True, jmax=10, numq=100):
+    """Show the band structure with a slider for the lattice depth
+
+    The bands for all depths are calculated in one call to bandstructure()
+    before the figure is shown, moving the slider only redraws the lines.
+
+    **Inputs**
+
+      * U0: 1D array, the lattice depths in recoils the slider can select
+      * nbands: int, the number of bands that is plotted
+      * foldover: bool, if True the plot covers all quasi-momenta instead of
+                  those from 0 to the band edge.
+      * jmax: int, the maximum l considered, see bandstructure()
+      * numq: int, the number of positive quasi-momenta
+
+    **Outputs**
+
+      * fig: matplotlib figure instance
+      * slider: matplotlib Slider instance, keep a reference to it, the
+                slider stops responding when it is garbage collected.
+
+    """
+
+    depths = np.asarray(U0, dtype=float)
+    bstructs = bandstructure(depths, jmax=jmax, numq=numq, nbands=nbands,
+                             coeffs=False)[0]
+    if foldover:
+        bstructs = _foldover(bstructs)
+        k_quasi = np.linspace(-1, 1, num=bstructs.shape[-1])
+    else:
+        k_quasi = np.linspace(0, 1, num=bstructs.shape[-1])
+
+    import matplotlib.pyplot as plt
+    from matplotlib.widgets import Slider
+    fig = plt.figure()
+    ax = fig.add_axes([0.125, 0.2, 0.775, 0.7])
+    lines = [ax.plot(k_quasi, bstructs[0, i, :])[0] for i in range(nbands)]
+    ax.set_ylim(bstructs.min(), bstructs.max())
+    ax.set_xlabel(r'$qa/\pi$')
+    ax.set_ylabel(r'$E (E_r)$')
+
+    slider = Slider(fig.add_axes([0.125, 0.05, 0.775, 0.04]), r'$U_0 (E_r)$',
+                    depths.min(), depths.max(), valinit=depths[0])
+
+    def update(val):
+        idx = np.abs(depths - val).argmin()
+        for i, line in enumerate(lines):
+            line.set_ydata(bstructs[idx, i, :])
+        fig.canvas.draw_idle()
+
+    slider.on_changed(update)
+
+    return fig, slider
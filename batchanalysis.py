@@ -0,0 +1,432 @@
+#!/usr/bin/env python
+"""Headless batch analysis of absorption images.
+
+Processes a directory or a list of image files with the same steps as the
+GUI: import with an import-settings profile, counting the atoms within the
+ncount ROI and fitting the transmission image within the analysis ROI.
+Shots are imported in batches and processed in a pool of worker processes.
+The results are written to a table with one row per shot, as CSV and
+optionally as HDF5, including the time spent on each step.
+
+Neither Qt nor pylab is imported, so this runs on machines without a
+display. Example::
+
+    python batchanalysis.py -p profile.ini --roi 100,300,50,250 \\
+        --fitfunc idealfermi -j 8 -o results.csv /data/2011-05-03
+
+Profiles can be saved from the GUI, see importprocessing.save_profile.
+
+"""
+
+import os
+import sys
+import csv
+import glob
+import time
+import optparse
+import multiprocessing
+
+import numpy as np
+
+import filetools
+import importprocessing
+from imageprocess import integral_image, roi_sum, atom_number
+from fitfermions import fit_img, find_ellipticity
+from shotcache import ShotCache
+
+
+FITFUNCS = ['idealfermi', 'gaussian', 'idealfermi_err', 'none']
+
+# columns of the results table that every shot has, fit parameters follow
+COLUMNS = ['fname', 'shotcounter', 'mtime', 'ncount', 'ToverTF', 'N',
+           'com_x', 'com_y', 'error', 't_import', 't_ncount', 't_fit',
+           't_total']
+
+# settings of the worker processes, set by _init_worker
+_settings = None
+_cache = None
+
+
+def _init_worker(settings):
+    global _settings, _cache
+    _settings = settings
+    if settings['cachedir']:
+        _cache = ShotCache(settings['cachedir'])
+    else:
+        _cache = None
+
+
+def _roi_slice(roi):
+    if roi is None:
+        return (slice(None), slice(None))
+    return (slice(roi[2], roi[3]), slice(roi[0], roi[1]))
+
+
+def analyze_shot(fname, settings, cache=None):
+    """Import, count and fit a single shot
+
+    **Inputs**
+
+      * fname: str, path to the image file
+      * settings: dict, with keys importdict, roi, ncount_roi, fitfunc,
+                  ellipse and pixcal, see parse_args
+      * cache: ShotCache instance, to reuse imports and fits
+
+    **Outputs**
+
+      * row: dict, the values for COLUMNS and the fit parameters
+             (param0, param1, ...)
+
+    """
+
+    return analyze_shots([fname], settings, cache)[0]
+
+
+def analyze_shots(fnames, settings, cache=None):
+    """Import, count and fit a batch of shots
+
+    The shots are imported together, see
+    importprocessing.process_import_batch, so the import treatment is
+    applied once to all shots with the same frames. Counting and fitting is
+    done for each shot; the import time is divided among the shots.
+
+    **Inputs**
+
+      * fnames: list of str, paths to the image files
+      * settings: dict, see analyze_shot
+      * cache: ShotCache instance, to reuse imports and fits
+
+    **Outputs**
+
+      * rows: list of dicts, one per shot, see analyze_shot
+
+    """
+
+    t0 = time.time()
+    rawframes, transimgs, odimgs, errors = \
+            importprocessing.process_import_batch(
+                fnames, dct=settings['importdict'], cache=cache)
+    t_import = (time.time() - t0)/max(len(fnames), 1)
+
+    rows = []
+    for fname, transimg, odimg, error in zip(fnames, transimgs, odimgs,
+                                             errors):
+        row = dict.fromkeys(COLUMNS)
+        row['fname'] = fname
+        row['error'] = ''
+        row['shotcounter'] = filetools.parse_shotcounter(fname)
+        row['t_import'] = t_import
+        rows.append(row)
+        if error is not None:
+            row['error'] = 'Import failed: %s'%error
+            row['t_total'] = t_import
+            continue
+        row['mtime'] = os.path.getmtime(fname)
+
+        t1 = time.time()
+        odsum = roi_sum(integral_image(odimg), settings['ncount_roi'])
+        row['ncount'] = atom_number(odsum, settings['pixcal'])
+        t2 = time.time()
+        row['t_ncount'] = t2 - t1
+
+        if settings['fitfunc'] != 'none':
+            row.update(_fit_shot(fname, transimg, settings, cache))
+        t3 = time.time()
+        row['t_fit'] = t3 - t2
+        row['t_total'] = t_import + t3 - t1
+
+    return rows
+
+
+def _fit_shot(fname, transimg, settings, cache):
+    """Fit the transmission image within the analysis ROI"""
+
+    roi, func = settings['roi'], settings['fitfunc']
+    if cache is not None:
+        # the same key as the GUI, so fits done there are reused
+        if roi is not None:
+            roi = np.array(roi, dtype=np.int32)
+        key = cache.make_key(fname, 'fit', settings['importdict'], roi, func,
+                             settings['ellipse'], settings['pixcal'])
+        fitresult = cache.get_result(key)
+        if fitresult is not None:
+            return _fit_columns(fitresult, roi, func)
+
+    img = transimg[_roi_slice(roi)]
+    try:
+        if settings['ellipse']:
+            elliptic = (find_ellipticity(img), 0)
+        else:
+            elliptic = None
+        fitresult = fit_img(img, showfig=False, full_output='odysseus',
+                            fitfunc=func, elliptic=elliptic,
+                            pixcal=settings['pixcal'])
+    except (ValueError, RuntimeError), e:
+        return {'error':'Fit failed: %s'%e}
+
+    if cache is not None:
+        cache.put_result(key, fitresult)
+
+    return _fit_columns(fitresult, roi, func)
+
+
+def _fit_columns(fitresult, roi, func):
+    """Table columns for a fit result as returned by fit_img"""
+
+    ToverTF, N, com, params = fitresult[:4]
+    if func == 'idealfermi_err':
+        # best fit, followed by the fits at the limits of the errorbar
+        params = params[0]
+    x0, y0 = (roi[0], roi[2]) if roi is not None else (0, 0)
+    columns = {'ToverTF':ToverTF, 'N':N, 'com_x':com[1] + x0,
+               'com_y':com[0] + y0}
+    for i, param in enumerate(params):
+        columns['param%s'%i] = param
+
+    return columns
+
+
+def _analyze(fname):
+    """Run analyze_shot in a worker process"""
+
+    try:
+        return analyze_shot(fname, _settings, _cache)
+    except Exception, e:
+        # one bad shot should not stop the batch
+        return {'fname':fname, 'error':'Analysis failed: %s'%e}
+
+
+def _analyze_batch(fnames):
+    """Run analyze_shots in a worker process"""
+
+    try:
+        return analyze_shots(fnames, _settings, _cache)
+    except Exception:
+        # find the shot that fails, the others are still analyzed
+        return [_analyze(fname) for fname in fnames]
+
+
+def find_shots(paths, ext='TIF'):
+    """Return the image files in paths, directories are searched for ext
+
+    Files from directories are sorted by modification time, oldest first.
+
+    """
+
+    fnames = []
+    for path in paths:
+        if os.path.isdir(path):
+            imgs = filetools.get_files_in_dir(path, ext=ext, sort=False)
+            fnames.extend(filetools.sort_files_by_date(imgs,
+                                                       newestfirst=False))
+        else:
+            fnames.extend(sorted(glob.glob(path)))
+
+    return fnames
+
+
+def run_batch(fnames, settings, workers=None, progress=None, batchsize=8):
+    """Analyze the shots in a pool of worker processes
+
+    **Inputs**
+
+      * fnames: list of str, paths to the image files
+      * settings: dict, see analyze_shot. The key cachedir is the directory
+                  of a ShotCache, or None.
+      * workers: int, number of worker processes, default is the number of
+                 CPUs. With 1 the shots are analyzed in this process.
+      * progress: function, called as progress(num, row) after each shot
+      * batchsize: int, number of shots a worker imports together
+
+    **Outputs**
+
+      * rows: list of dicts, one per shot in the order of fnames
+
+    """
+
+    batches = [fnames[i:i+batchsize] for i in xrange(0, len(fnames),
+                                                      batchsize)]
+    if workers == 1:
+        _init_worker(settings)
+        results = (_analyze_batch(batch) for batch in batches)
+        pool = None
+    else:
+        pool = multiprocessing.Pool(workers, initializer=_init_worker,
+                                    initargs=(settings, ))
+        results = pool.imap(_analyze_batch, batches, chunksize=1)
+
+    rows = []
+    try:
+        for batchrows in results:
+            for row in batchrows:
+                rows.append(row)
+                if progress is not None:
+                    progress(len(rows), row)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    return rows
+
+
+def table_columns(rows):
+    """Return COLUMNS followed by the fit parameter columns of rows"""
+
+    nparams = 0
+    for row in rows:
+        while 'param%s'%nparams in row:
+            nparams += 1
+
+    return COLUMNS + ['param%s'%i for i in range(nparams)]
+
+
+def write_csv(rows, fname):
+    """Write the results table as CSV, empty fields for missing values"""
+
+    columns = table_columns(rows)
+    f = open(fname, 'wb')
+    try:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        for row in rows:
+            writer.writerow([_csv_value(row.get(col)) for col in columns])
+    finally:
+        f.close()
+
+
+def _csv_value(value):
+    if value is None:
+        return ''
+    elif isinstance(value, float):
+        return repr(value)
+    return value
+
+
+def write_hdf5(rows, fname):
+    """Write the results table to an HDF5 file, needs PyTables
+
+    Every column is an array in the group /results. Numerical columns are
+    float64 with NaN for missing values, the others are strings.
+
+    """
+
+    try:
+        import tables
+    except ImportError:
+        raise ImportError, 'Writing HDF5 files needs PyTables'
+
+    h5file = tables.openFile(fname, mode='w')
+    try:
+        group = h5file.createGroup('/', 'results', 'Batch analysis results')
+        for col in table_columns(rows):
+            values = [row.get(col) for row in rows]
+            if col in ['fname', 'error']:
+                data = np.array([str(v or '') for v in values])
+            else:
+                data = np.array([np.nan if v is None else v for v in values],
+                                dtype=np.float64)
+            h5file.createArray(group, col, data)
+    finally:
+        h5file.close()
+
+
+def _parse_roi(option, opt_str, value, parser):
+    try:
+        roi = [int(x) for x in value.split(',')]
+    except ValueError:
+        roi = []
+    if len(roi) != 4:
+        raise optparse.OptionValueError, \
+              '%s needs four integers x0,x1,y0,y1'%opt_str
+    setattr(parser.values, option.dest, roi)
+
+
+def parse_args(argv):
+    """Parse the command line, return (settings, options, paths)"""
+
+    parser = optparse.OptionParser(
+        usage='%prog [options] DIR_OR_FILE [DIR_OR_FILE ...]',
+        description='Batch analysis of absorption images, results are '
+                    'written as a table with one row per shot.')
+    parser.add_option('-p', '--profile', help='import-settings profile, '
+                      'default are the built-in settings')
+    parser.add_option('-r', '--roi', type='string', action='callback',
+                      callback=_parse_roi, metavar='X0,X1,Y0,Y1',
+                      help='analysis ROI for the fit, default whole image')
+    parser.add_option('-n', '--ncount-roi', type='string', action='callback',
+                      callback=_parse_roi, dest='ncount_roi',
+                      metavar='X0,X1,Y0,Y1',
+                      help='ROI for counting atoms, default whole image')
+    parser.add_option('-f', '--fitfunc', choices=FITFUNCS,
+                      default='idealfermi',
+                      help='fit function, one of %s [%%default]'%
+                      ', '.join(FITFUNCS))
+    parser.add_option('-e', '--ellipse', action='store_true', default=False,
+                      help='determine the ellipticity before fitting')
+    parser.add_option('-c', '--pixcal', type='float', default=10.,
+                      help='pixel calibration in um/pixel [%default]')
+    parser.add_option('-j', '--workers', type='int', default=None,
+                      help='number of worker processes, default number of '
+                      'CPUs')
+    parser.add_option('-o', '--output', default='results.csv',
+                      help='CSV file for the results [%default]')
+    parser.add_option('--hdf5', help='also write the results to this HDF5 '
+                      'file')
+    parser.add_option('--cache', help='cache directory, imports and fits '
+                      'are reused from here')
+    parser.add_option('--ext', default='TIF',
+                      help='extension of the images in directories '
+                      '[%default]')
+    parser.add_option('-q', '--quiet', action='store_true', default=False,
+                      help='do not print progress')
+
+    options, paths = parser.parse_args(argv)
+    if not paths:
+        parser.error('no directory or image files given')
+
+    if options.profile:
+        importdict = importprocessing.load_profile(options.profile)
+    else:
+        importdict = importprocessing.image_import_dict
+    settings = dict(importdict=importdict, roi=options.roi,
+                    ncount_roi=options.ncount_roi, fitfunc=options.fitfunc,
+                    ellipse=options.ellipse, pixcal=options.pixcal*1e-6,
+                    cachedir=options.cache)
+
+    return settings, options, paths
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    settings, options, paths = parse_args(argv)
+    fnames = find_shots(paths, ext=options.ext)
+    if not fnames:
+        print >> sys.stderr, 'No images found'
+        return 1
+
+    def progress(num, row):
+        if not options.quiet:
+            msg = '%s/%s %s'%(num, len(fnames), os.path.basename(row['fname']))
+            if row.get('error'):
+                msg = '%s: %s'%(msg, row['error'])
+            print >> sys.stderr, msg
+
+    t0 = time.time()
+    rows = run_batch(fnames, settings, workers=options.workers,
+                     progress=progress)
+    write_csv(rows, options.output)
+    if options.hdf5:
+        write_hdf5(rows, options.hdf5)
+
+    if not options.quiet:
+        nfailed = len([row for row in rows if row.get('error')])
+        print >> sys.stderr, 'Analyzed %s shots in %1.1f s, %s failed'%\
+              (len(rows), time.time() - t0, nfailed)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+"""Measure how long it takes to import the numerical modules.
+
+Worker processes (batch analysis, fitting) import these modules when they
+start, so their import time is paid for every worker. Each module is
+imported in a fresh interpreter, the best of several runs is reported, as
+well as whether the import pulled in a plotting or GUI library.
+
+Usage:
+
+  python benchmark_imports.py [-n RUNS] [module ...]
+
+Run it from the directory containing the modules.
+
+"""
+
+import os
+import sys
+import optparse
+import subprocess
+
+
+MODULES = ['polylog', 'centerofmass', 'imageprocess', 'fitfuncs',
+           'fitfuncs2D', 'imageio', 'fitfermions', 'batchanalysis']
+
+# imports that make a worker start slowly or need a display
+HEAVY = ['matplotlib', 'pylab', 'PyQt4', 'tables']
+
+_SCRIPT = """\
+import sys, time
+t0 = time.time()
+import numpy, scipy
+t1 = time.time()
+__import__(%r)
+t2 = time.time()
+heavy = [name for name in %r if name in sys.modules]
+print t1 - t0, t2 - t1, ','.join(heavy)
+"""
+
+
+def time_import(module, runs=5, python=sys.executable):
+    """Import a module in fresh interpreters and time it
+
+    NumPy and SciPy are imported first and timed separately, every worker
+    needs them anyway.
+
+    **Inputs**
+
+      * module: str, name of the module
+      * runs: int, number of interpreters started, the minimum time is used
+      * python: str, the python executable
+
+    **Outputs**
+
+      * t_numpy: float, time to import numpy and scipy in seconds
+      * t_module: float, time to import the module after that in seconds
+      * heavy: list of str, the modules from HEAVY that were imported
+
+    """
+
+    cwd = os.path.dirname(os.path.abspath(__file__))
+    times = []
+    for i in range(runs):
+        proc = subprocess.Popen([python, '-c', _SCRIPT%(module, HEAVY)],
+                                cwd=cwd, stdout=subprocess.PIPE,
+                                stderr=subprocess.PIPE)
+        out, err = proc.communicate()
+        if proc.returncode != 0:
+            raise RuntimeError, 'importing %s failed:\n%s'%(module, err)
+        fields = out.split()
+        times.append((float(fields[1]), float(fields[0])))
+        heavy = fields[2].split(',') if len(fields) > 2 else []
+
+    t_module, t_numpy = min(times)
+    return t_numpy, t_module, heavy
+
+
+def main(argv=None):
+    parser = optparse.OptionParser(usage='%prog [-n RUNS] [module ...]')
+    parser.add_option('-n', '--runs', type='int', default=5,
+                      help='number of runs per module [%default]')
+    options, modules = parser.parse_args(argv)
+    if not modules:
+        modules = MODULES
+
+    print '%-16s %10s %10s  %s'%('module', 'numpy [ms]', 'import [ms]',
+                                  'heavy imports')
+    for module in modules:
+        t_numpy, t_module, heavy = time_import(module, runs=options.runs)
+        print '%-16s %10.1f %10.1f  %s'%(module, t_numpy*1e3, t_module*1e3,
+                                         ', '.join(heavy) or '-')
+
+
+if __name__ == '__main__':
+    main()
@@ -18,19 +18,144 @@ main program to react to the change.
 
 This daemon is adapted from `dirmon`, which can be found on PyPi.
 
+On Linux the directory is watched with inotify, which reports new files as
+soon as they are written without polling the directory. Elsewhere the
+polling Walker is used. Use create_walker() to get the best one available.
+
 """
 
 
 import os
 import re
 import sys
+import time
+import errno
+import select
+import struct
 import fnmatch
+import ctypes
+import ctypes.util
 from PyQt4.QtCore import *
 from PyQt4.QtGui import *
 
+import imageio
+
+
+# inotify event masks, from <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_Q_OVERFLOW = 0x00004000
+IN_ISDIR = 0x40000000
+
+_EVENT_HEADER = struct.Struct('iIII') # wd, mask, cookie, len
+
+_libc = None
+
+
+def _get_libc():
+    """Return libc if it provides inotify, otherwise None"""
+
+    global _libc
+    if _libc is None:
+        _libc = False
+        libname = ctypes.util.find_library('c')
+        if libname and sys.platform.startswith('linux'):
+            try:
+                libc = ctypes.CDLL(libname, use_errno=True)
+                libc.inotify_init, libc.inotify_add_watch, libc.inotify_rm_watch
+                _libc = libc
+            except (OSError, AttributeError):
+                pass
+
+    return _libc or None
+
+
+def inotify_available():
+    """Return True if directories can be watched with inotify"""
+    return _get_libc() is not None
+
+
+class Inotify(object):
+    """A minimal ctypes wrapper around the Linux inotify API."""
+
+    def __init__(self):
+        libc = _get_libc()
+        if libc is None:
+            raise OSError, 'inotify is not available on this system'
+        self._libc = libc
+        self.fd = libc.inotify_init()
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError, (err, os.strerror(err))
+
+
+    def add_watch(self, path, mask):
+        """Watch `path` for the events in `mask`, return the watch descriptor"""
+
+        wd = self._libc.inotify_add_watch(self.fd, path, mask)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError, (err, os.strerror(err), path)
+
+        return wd
+
+
+    def rm_watch(self, wd):
+        self._libc.inotify_rm_watch(self.fd, wd)
+
+
+    def read_events(self, timeout=None):
+        """Wait up to `timeout` seconds for events
+
+        **Outputs**
+
+          * events: list of (wd, mask, name) tuples, empty on timeout
+
+        """
+
+        try:
+            readable = select.select([self.fd], [], [], timeout)[0]
+        except select.error, e:
+            if e.args[0] == errno.EINTR:
+                return []
+            raise
+        if not readable:
+            return []
+
+        buf = os.read(self.fd, 64*1024)
+        events = []
+        pos = 0
+        while pos + _EVENT_HEADER.size <= len(buf):
+            wd, mask, cookie, namelen = _EVENT_HEADER.unpack_from(buf, pos)
+            pos += _EVENT_HEADER.size
+            name = buf[pos:pos+namelen].rstrip('\0')
+            pos += namelen
+            events.append((wd, mask, name))
+
+        return events
+
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def create_walker(lock, parent=None):
+    """Return an InotifyWalker if possible, otherwise a polling Walker"""
+
+    if inotify_available():
+        return InotifyWalker(lock, parent)
+    else:
+        return Walker(lock, parent)
+
 
 class Walker(QThread):
 
+    # a file whose size did not change for this long (in s) is reported even
+    # if its TIFF structure looks incomplete, so unusual files are not lost
+    stable_timeout = 2.
+
     def __init__(self, lock, parent=None):
         super(Walker, self).__init__(parent)
         self.lock = lock
@@ -39,6 +164,12 @@ class Walker(QThread):
         self.mutex = QMutex()
         self.path = None
         self.mtimes = {}
+        # files that changed but were not completely written yet
+        self.pending = set()
+        # (mtime, size) of each file when it was last reported as changed
+        self.reported = {}
+        # (size, time) since when a pending file has this size
+        self.stable_since = {}
 
 
     def setPath(self, path):
@@ -97,6 +228,82 @@ class Walker(QThread):
         self.emit(SIGNAL("changed"), filename)
 
 
+    def is_complete(self, filename):
+        """Check if a file has been written completely"""
+        return imageio.tiff_complete(filename)
+
+
+    def is_new(self, filename):
+        """Return True if a complete file was not reported in this state yet
+
+        A file that is written page by page can look complete several times;
+        it is only reported again when its mtime or size changed, for example
+        when it was rewritten with a new shot.
+
+        """
+
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return False
+        state = (stat.st_mtime, stat.st_size)
+        if self.reported.get(filename) == state:
+            return False
+        self.reported[filename] = state
+
+        return True
+
+
+    def _stable_for(self, filename, size):
+        """Return for how long (in s) a pending file had the same size"""
+
+        now = time.time()
+        if self.stable_since.get(filename, (None, ))[0] != size:
+            self.stable_since[filename] = (size, now)
+        return now - self.stable_since[filename][1]
+
+
+    def completed(self, filenames, probe_interval=20):
+        """Return the files that are written completely, keep the others
+        pending
+
+        A file is complete if its size did not change between two probes,
+        `probe_interval` ms apart, and its TIFF structure is complete (or its
+        size did not change for `stable_timeout` s). A complete file is
+        only returned if it was not reported with the same mtime and size
+        before.
+
+        """
+
+        if not filenames:
+            return []
+        sizes = {}
+        for filename in filenames:
+            try:
+                sizes[filename] = os.path.getsize(filename)
+            except OSError:
+                self.pending.discard(filename)
+        self.msleep(probe_interval)
+
+        done = []
+        for filename in filenames:
+            try:
+                stable = os.path.getsize(filename) == sizes[filename]
+            except (OSError, KeyError):
+                continue
+            if stable and (self.is_complete(filename) or \
+                    self._stable_for(filename, sizes[filename]) > \
+                    self.stable_timeout):
+                self.pending.discard(filename)
+                self.stable_since.pop(filename, None)
+                if self.is_new(filename):
+                    done.append(filename)
+            else:
+                self.pending.add(filename)
+
+        return done
+
+
     def processFiles(self, path):
         """Note: only .TIF files are monitored"""
 
@@ -105,12 +312,14 @@ class Walker(QThread):
         for filename in filenames:
             filename = os.path.join(path, filename)
             self.mtimes[filename] = os.path.getmtime(filename)
+        self.pending.clear()
 
         while True:
             if self.isWaiting():
                 return
             previous_mtimes = dict(self.mtimes)
             created = {}
+            modified = []
             checked = {}
 
             # check for any changes to .TIF files
@@ -124,10 +333,9 @@ class Walker(QThread):
                     checked[filename] = new_mtime
                     if filename not in self.mtimes:
                         created[filename] = new_mtime
-                    elif new_mtime - self.mtimes[filename] > 2:
-                        # really new data, not just detected twice while writing
-                        self.msleep(300) # wait to be sure writing is done
-                        self.changed([filename])
+                    elif new_mtime != self.mtimes[filename]:
+                        # new data, or still being written
+                        modified.append(filename)
                     self.mtimes[filename] = new_mtime
                 except OSError:
                     # file was removed after creating filelist
@@ -145,12 +353,64 @@ class Walker(QThread):
                         else:
                             pass
                         del self.mtimes[old_fn]
+                        self.reported.pop(old_fn, None)
                 else:
                     for fn, mtime in removed:
                         del self.mtimes[fn]
+                        self.reported.pop(fn, None)
 
-            # call changed() for new/modified file(s) so display gets updates
-            if created:
+            # call changed() for new/modified file(s) so display gets updates,
+            # but only once they are written completely
+            candidates = set(created) | set(modified) | self.pending
+            done = self.completed(sorted(candidates))
+            if done:
                 #send list of new files
-                self.changed(list(created))
-            self.msleep(300)
\ No newline at end of file
+                self.changed(done)
+            self.msleep(300)
+
+
+class InotifyWalker(Walker):
+    """Walker that is notified by the kernel instead of polling.
+
+    New files are reported when they are closed after writing or moved into
+    the directory, so the cost does not depend on the number of files in the
+    directory. Emits the same "changed" signal as Walker.
+
+    """
+
+    # how often (in s) to check whether the walker has to wait or stop
+    timeout = 0.1
+
+    def processFiles(self, path):
+        """Note: only .TIF files are monitored"""
+
+        inotify = Inotify()
+        self.pending.clear()
+        try:
+            inotify.add_watch(path, IN_CLOSE_WRITE | IN_MOVED_TO)
+            while not (self.isWaiting() or self.stop):
+                created = []
+                events = inotify.read_events(self.timeout)
+                if not events and self.pending:
+                    # files that were closed before they were complete
+                    created = self.completed(sorted(self.pending))
+                for wd, mask, name in events:
+                    if mask & IN_Q_OVERFLOW:
+                        print 'inotify event queue overflowed, events lost'
+                        continue
+                    if mask & IN_ISDIR or not fnmatch.fnmatch(name, '*.TIF'):
+                        continue
+                    filename = os.path.join(path, name)
+                    if filename in created:
+                        continue
+                    # closed after writing, so the file size is final
+                    if self.is_complete(filename):
+                        self.pending.discard(filename)
+                        if self.is_new(filename):
+                            created.append(filename)
+                    else:
+                        self.pending.add(filename)
+                if created:
+                    self.changed(created)
+        finally:
+            inotify.close()
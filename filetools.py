@@ -4,6 +4,17 @@
 import os
 import glob
 import re
+import bisect
+import fnmatch
+import cPickle as pickle
+# os.scandir is only in Python >= 3.5, there is a backport on PyPI
+try:
+    from os import scandir
+except ImportError:
+    try:
+        from scandir import scandir
+    except ImportError:
+        scandir = None
 
 
 def sort_files_by_date(filelist, newestfirst=True):
@@ -38,6 +49,11 @@ def get_files_in_dir(dirname, ext='TIF', globexpr=None, sort=True):
       * imgs: list of strings, each string in the list is the complete path to
         a file
 
+    **Notes**
+
+    Every call globs the directory and stats every file again. When the same
+    directory is queried repeatedly, use a DirectoryIndex instead.
+
     """
 
     if globexpr:
@@ -55,28 +71,486 @@ def find_imgnames(imglist, startstr, stopstr):
 
     **Inputs**
 
-      * imglist: list of str, containing paths of images on disc
+      * imglist: list of str, containing paths of images on disc, or a
+                 DirectoryIndex. For an index no files are statted again.
       * startstr: str, part of the name of the oldest image by date that is
-                  wanted
+                  wanted (a regular expression)
       * stopstr: str, part of the name of the newest image by date that is
-                  wanted
+                  wanted (a regular expression)
 
     **Outputs**
 
-      * imgs: list of str, containing the found paths to image files
+      * imgs: list of str, containing the found paths to image files. Empty if
+              either startstr or stopstr does not match any image.
 
     """
 
+    if isinstance(imglist, DirectoryIndex):
+        return list(imglist.select(startstr, stopstr))
+
     imgs = sort_files_by_date(imglist, newestfirst=False)
-    for img in imgs:
-        found_one = re.search(startstr, img)
-        if found_one:
-            start_idx = imgs.index(img)
-            break
-    for img in imgs:
-        found_one = re.search(stopstr, img)
-        if found_one:
-            stop_idx = imgs.index(img)
-            break
-
-    return imgs[start_idx:stop_idx+1]
\ No newline at end of file
+    idx = _pattern_range(imgs, startstr, stopstr)
+    if idx is None:
+        return []
+
+    return imgs[idx]
+
+
+def _pattern_range(names, startstr, stopstr):
+    """Return the slice from the first match of startstr to that of stopstr
+
+    Both patterns are compiled once and the names are searched in a single
+    pass. Returns None if one of the patterns does not match.
+
+    """
+
+    start_re = re.compile(startstr)
+    stop_re = re.compile(stopstr)
+    start_idx = None
+    stop_idx = None
+    for idx, name in enumerate(names):
+        if start_idx is None and start_re.search(name):
+            start_idx = idx
+        if stop_idx is None and stop_re.search(name):
+            stop_idx = idx
+        if start_idx is not None and stop_idx is not None:
+            return slice(start_idx, stop_idx + 1)
+
+    return None
+
+
+def parse_shotcounter(fname, counter_regex=r'(\d+)\D*$'):
+    """Return the shot counter in a file name as an int, or None
+
+    **Inputs**
+
+      * fname: str, file name or path (only the base name is used)
+      * counter_regex: str, regular expression whose first group is the
+                       counter. The default is the last number in the name.
+
+    """
+
+    found = re.search(counter_regex, os.path.basename(fname))
+    if found is None:
+        return None
+
+    return int(found.group(1))
+
+
+class DirectoryIndex(object):
+    """A time-sorted index of the files in a directory.
+
+    The directory is scanned once, after that the index is kept up to date
+    with update() and remove() calls for single files (for example from a
+    directory monitor). The files are kept sorted by (mtime, name), so the
+    newest files or the files in a time window are found by bisection instead
+    of by statting every file again.
+
+    Paths returned by the query methods are complete paths, like the ones
+    returned by get_files_in_dir.
+
+    """
+
+    _version = 2
+
+    def __init__(self, dirname, pattern='*.TIF', indexfile=None):
+        """Build the index, from `indexfile` if it is still valid
+
+        **Inputs**
+
+          * dirname: str, full path to the directory
+          * pattern: str, glob pattern of the files to index
+          * indexfile: str, if given the index is loaded from this file when
+                       the directory did not change since it was saved, and
+                       save() writes to this file.
+
+        """
+
+        self.dirname = dirname
+        self.pattern = pattern
+        self.indexfile = indexfile
+        if not (indexfile and self.load()):
+            self.scan()
+
+
+    def _matches(self, name):
+        # like glob, do not match hidden files unless asked for
+        if name.startswith('.') and not self.pattern.startswith('.'):
+            return False
+        return fnmatch.fnmatch(name, self.pattern)
+
+
+    def scan(self):
+        """(Re)scan the complete directory"""
+
+        stats = {}
+        if scandir is not None:
+            for entry in scandir(self.dirname):
+                if self._matches(entry.name):
+                    try:
+                        stat = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        # file was removed after listing the directory
+                        continue
+                    stats[entry.name] = (stat.st_mtime, stat.st_size)
+        else:
+            for name in os.listdir(self.dirname):
+                if self._matches(name):
+                    try:
+                        stat = os.lstat(os.path.join(self.dirname, name))
+                    except OSError:
+                        continue
+                    stats[name] = (stat.st_mtime, stat.st_size)
+
+        self._set_stats(stats)
+        self._unverified = False
+
+
+    def _set_stats(self, stats):
+        self._stats = stats
+        self._keys = sorted([(stat[0], name) for name, stat in \
+                             stats.iteritems()])
+        self._times = [key[0] for key in self._keys]
+        self._counters = None
+        # True while an IndexSlice refers to _keys
+        self._shared = False
+
+
+    def _writable(self):
+        """Copy the sorted lists before the first change after a select()"""
+
+        if self._shared:
+            self._keys = list(self._keys)
+            self._times = list(self._times)
+            self._shared = False
+        self._counters = None
+
+
+    def _verify(self):
+        """Re-stat the files of a loaded index once, before the first query
+
+        Files that were rewritten in place while the index was on disk did
+        not change the directory mtime, their entries are updated here.
+
+        """
+
+        if self._unverified:
+            self._unverified = False
+            for name in self._stats.keys():
+                self.update(name)
+
+
+    def _delete(self, name):
+        key = (self._stats.pop(name)[0], name)
+        self._writable()
+        idx = bisect.bisect_left(self._keys, key)
+        del self._keys[idx]
+        del self._times[idx]
+
+
+    def update(self, fname):
+        """Add a new or modified file to the index
+
+        A file that no longer exists is removed from the index, so this can be
+        called for any created, modified or deleted file.
+
+        **Inputs**
+
+          * fname: str, the file name, with or without the directory
+
+        """
+
+        name = os.path.basename(str(fname))
+        if not self._matches(name):
+            return
+        try:
+            stat = os.lstat(os.path.join(self.dirname, name))
+        except OSError:
+            self.remove(name)
+            return
+
+        mtime = stat.st_mtime
+        if name in self._stats:
+            if self._stats[name] == (mtime, stat.st_size):
+                return
+            self._delete(name)
+        self._stats[name] = (mtime, stat.st_size)
+        self._writable()
+        idx = bisect.bisect_right(self._keys, (mtime, name))
+        self._keys.insert(idx, (mtime, name))
+        self._times.insert(idx, mtime)
+
+
+    def remove(self, fname):
+        """Remove a (deleted) file from the index"""
+
+        name = os.path.basename(str(fname))
+        if name in self._stats:
+            self._delete(name)
+
+
+    def __len__(self):
+        self._verify()
+        return len(self._keys)
+
+
+    def __contains__(self, fname):
+        self._verify()
+        return os.path.basename(str(fname)) in self._stats
+
+
+    def __iter__(self):
+        """Iterate over all paths, oldest first"""
+        self._verify()
+        for mtime, name in list(self._keys):
+            yield os.path.join(self.dirname, name)
+
+
+    def _paths(self, keys):
+        return [os.path.join(self.dirname, name) for mtime, name in keys]
+
+
+    def mtime(self, fname):
+        """Return the modification time of a file in the index"""
+        self._verify()
+        return self._stats[os.path.basename(str(fname))][0]
+
+
+    def newest(self, num=None):
+        """Return the `num` newest paths, newest first (all if num is None)"""
+
+        self._verify()
+        if num is None:
+            keys = self._keys
+        elif num <= 0:
+            return []
+        else:
+            keys = self._keys[-num:]
+
+        return self._paths(reversed(keys))
+
+
+    def between(self, tstart=None, tstop=None, newestfirst=False):
+        """Return the paths with tstart <= mtime <= tstop
+
+        **Inputs**
+
+          * tstart: float, start time in seconds since the epoch (as returned
+                    by time.time()). None means no lower limit.
+          * tstop: float, stop time, None means no upper limit.
+          * newestfirst: bool, if True the newest file comes first
+
+        **Outputs**
+
+          * paths: list of str
+
+        """
+
+        self._verify()
+        keys = self._keys[self._range(tstart, tstop)]
+        if newestfirst:
+            keys.reverse()
+
+        return self._paths(keys)
+
+
+    def _range(self, tstart, tstop):
+        """Return the slice of self._keys between two times"""
+
+        if tstart is None:
+            lo = 0
+        else:
+            lo = bisect.bisect_left(self._times, tstart)
+        if tstop is None:
+            hi = len(self._times)
+        else:
+            hi = bisect.bisect_right(self._times, tstop)
+
+        return slice(lo, hi)
+
+
+    def glob(self, pattern, tstart=None, tstop=None, newestfirst=False):
+        """Return the paths matching a glob pattern, optionally in a time window
+
+        The time window is found by bisection, only the files inside it are
+        matched against `pattern`.
+
+        """
+
+        self._verify()
+        keys = [key for key in self._keys[self._range(tstart, tstop)] \
+                if fnmatch.fnmatch(key[1], pattern)]
+        if newestfirst:
+            keys.reverse()
+
+        return self._paths(keys)
+
+
+    def select(self, start=None, stop=None, by='name',
+               counter_regex=r'(\d+)\D*$'):
+        """Select a range of files, for example the images of a single scan
+
+        **Inputs**
+
+          * start: the first file of the range, its meaning depends on `by`.
+                   None means from the first file on.
+          * stop: the last file of the range (inclusive). None means up to
+                  the last file.
+          * by: str, one of
+
+              - 'name': start and stop are regular expressions, the range
+                runs from the oldest file matching start to the oldest file
+                matching stop. The patterns are compiled once.
+              - 'time': start and stop are times in seconds since the epoch,
+                found by bisection.
+              - 'counter': start and stop are shot counters parsed from the
+                file names with `counter_regex`, found by bisection. Files
+                are ordered by counter.
+
+          * counter_regex: str, see parse_shotcounter
+
+        **Outputs**
+
+          * selection: IndexSlice, a lazy sequence of paths. It is not
+                       affected by later updates of the index.
+
+        """
+
+        self._verify()
+        if by in ['time', 'name']:
+            # the selection keeps referring to the current lists
+            self._shared = True
+        if by=='time':
+            return IndexSlice(self.dirname, self._keys,
+                              self._range(start, stop))
+        elif by=='counter':
+            counters = self._counter_keys(counter_regex)
+            values = [key[0] for key in counters]
+            lo = 0 if start is None else bisect.bisect_left(values, start)
+            hi = len(values) if stop is None else \
+                 bisect.bisect_right(values, stop)
+            return IndexSlice(self.dirname, counters, slice(lo, hi))
+        elif by=='name':
+            names = [key[1] for key in self._keys]
+            # an empty pattern matches the first name
+            idx = _pattern_range(names, start or '', stop or '')
+            if idx is None:
+                idx = slice(0, 0)
+            elif stop is None:
+                idx = slice(idx.start, len(names))
+            return IndexSlice(self.dirname, self._keys, idx)
+        else:
+            raise ValueError, "by must be one of 'name', 'time', 'counter'"
+
+
+    def _counter_keys(self, counter_regex):
+        """Return (and cache) the files sorted by shot counter"""
+
+        if self._counters is None or self._counters[0] != counter_regex:
+            keys = []
+            for mtime, name in self._keys:
+                counter = parse_shotcounter(name, counter_regex)
+                if counter is not None:
+                    keys.append((counter, mtime, name))
+            keys.sort()
+            self._counters = (counter_regex, keys)
+
+        return self._counters[1]
+
+
+    def save(self, indexfile=None):
+        """Save the index to disk, return True on success"""
+
+        indexfile = indexfile or self.indexfile
+        if not indexfile:
+            return False
+        state = {'version':self._version, 'dirname':self.dirname,
+                 'pattern':self.pattern, 'stats':self._stats}
+        try:
+            f = open(indexfile, 'wb')
+            try:
+                # after creating indexfile, which may be inside the directory
+                state['dirmtime'] = os.stat(self.dirname).st_mtime
+                pickle.dump(state, f, pickle.HIGHEST_PROTOCOL)
+            finally:
+                f.close()
+        except (IOError, OSError):
+            return False
+
+        return True
+
+
+    def load(self, indexfile=None):
+        """Load a saved index, return False if it is missing or out of date
+
+        The saved index is out of date when files were added to or removed
+        from the directory after saving (the directory mtime changed). Files
+        rewritten in place do not change the directory mtime, their mtime and
+        size are checked again before the first query.
+
+        """
+
+        indexfile = indexfile or self.indexfile
+        try:
+            f = open(indexfile, 'rb')
+            try:
+                state = pickle.load(f)
+            finally:
+                f.close()
+            dirmtime = os.stat(self.dirname).st_mtime
+        except (IOError, OSError, EOFError, pickle.UnpicklingError):
+            return False
+
+        if not (state.get('version')==self._version and \
+                state.get('dirname')==self.dirname and \
+                state.get('pattern')==self.pattern and \
+                state.get('dirmtime')==dirmtime):
+            return False
+
+        self._set_stats(state['stats'])
+        self._unverified = True
+
+        return True
+
+
+class IndexSlice(object):
+    """A lazy, read-only sequence of paths selected from a DirectoryIndex.
+
+    Only the bounds of the selection are stored, paths are created when
+    they are accessed.
+
+    """
+
+    def __init__(self, dirname, keys, idx):
+        self.dirname = dirname
+        self._keys = keys
+        self._start, self._stop, self._step = idx.indices(len(keys))
+
+
+    def __len__(self):
+        return len(xrange(self._start, self._stop, self._step))
+
+
+    def __getitem__(self, item):
+        positions = xrange(self._start, self._stop, self._step)
+        if isinstance(item, slice):
+            if not positions:
+                return IndexSlice(self.dirname, self._keys, slice(0, 0))
+            start, stop, step = item.indices(len(positions))
+            first = self._start + start*self._step
+            last = self._start + stop*self._step
+            if last < 0:
+                # stepping backwards up to and including position 0
+                last = None
+            return IndexSlice(self.dirname, self._keys,
+                              slice(first, last, step*self._step))
+        return os.path.join(self.dirname, self._keys[positions[item]][-1])
+
+
+    def __iter__(self):
+        for idx in xrange(self._start, self._stop, self._step):
+            yield os.path.join(self.dirname, self._keys[idx][-1])
+
+
+    def __repr__(self):
+        return 'IndexSlice(%s files in %s)'%(len(self), self.dirname)
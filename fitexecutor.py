@@ -0,0 +1,241 @@
+#!/usr/bin/env python
+"""A long-lived pool of worker processes for fitting.
+
+Fitting spends most of its time in `leastsq`, which holds the GIL, so fits
+are run in separate processes. The executor keeps the same processes for
+all fits instead of starting a new thread or process per fit.
+
+Every job gets an increasing job id. A new job can supersede all older
+jobs: those that have not started yet are skipped by the workers, and the
+results of those already running are discarded (latest wins). Results are
+returned in order of job id. A job that takes longer than `timeout` seconds
+is considered hung; the pool is then restarted and the outstanding jobs
+fail.
+
+The executor does not use Qt, a GUI should call poll() regularly, for
+example from a QTimer.
+
+"""
+
+import time
+import multiprocessing
+
+from fitfermions import fit_img, find_ellipticity
+
+
+# set in the worker processes, the id of the oldest job that is still wanted
+_oldest_wanted = None
+
+
+def _init_worker(oldest_wanted):
+    global _oldest_wanted
+    _oldest_wanted = oldest_wanted
+
+
+def _run_job(jobid, func, args, kwargs):
+    """Run a job in a worker process, unless it was superseded"""
+
+    if _oldest_wanted is not None and jobid < _oldest_wanted.value:
+        return None
+    return func(*args, **kwargs)
+
+
+def fit_transimg(img, func, check_ellipse, pixcal, warmstart=None,
+                 warmkey=None):
+    """Fit a transmission image
+
+    **Inputs**
+
+      * img: 2D array, the transmission image within the analysis ROI
+      * func: str, name of the fit function, see fitfermions.fit_img
+      * check_ellipse: bool, if True the ellipticity is determined first
+      * pixcal: float, pixel calibration in m/pixel
+      * warmstart: WarmStart instance, the parameters of earlier fits. It is
+                   sent with the job, so every fit can start from the last
+                   converged result no matter which worker runs it.
+      * warmkey: hashable, identifies ROI and fit settings for `warmstart`
+
+    **Outputs**
+
+      * fitresult: tuple, the fit result, or a str if the fit failed
+      * nfev: int, number of function evaluations of the fit
+      * warmstart: WarmStart instance, the worker's copy of `warmstart` with
+                   the result of this fit, None without `warmstart`. Keep it
+                   for the next job, see WarmStart.update.
+
+    """
+
+    try:
+        if check_ellipse:
+            elliptic = (find_ellipticity(img), 0)
+        else:
+            elliptic = None
+
+        if warmstart is not None:
+            warmkey = (warmkey, check_ellipse)
+        fitresult = fit_img(img, showfig=False, full_output='odysseus',
+                            fitfunc=func, elliptic=elliptic, pixcal=pixcal,
+                            warmstart=warmstart, warmkey=warmkey)
+        nfev = warmstart.nfev if warmstart is not None else None
+        return fitresult, nfev, warmstart
+
+    except ValueError:
+        return 'Fitting failed - is the analysis ROI set correctly?', None, \
+               None
+
+
+class FitJob(object):
+    """A job submitted to the FitExecutor."""
+
+    def __init__(self, jobid, asyncresult, context):
+        self.jobid = jobid
+        self.context = context
+        self.submitted = time.time()
+        self.cancelled = False
+        self.result = None
+        # str, set if the job failed
+        self.error = None
+        self._asyncresult = asyncresult
+
+
+class FitExecutor(object):
+    """Runs fits in a persistent process pool, the latest fit wins."""
+
+    def __init__(self, processes=None, timeout=60.):
+        """
+        **Inputs**
+
+          * processes: int, number of worker processes. Default is the
+                       number of CPUs.
+          * timeout: float, time in seconds after which a fit is assumed to
+                     hang.
+
+        """
+
+        self.processes = processes
+        self.timeout = timeout
+        self._pool = None
+        self._oldest_wanted = multiprocessing.Value('l', 0)
+        self._jobs = []
+        # cancelled jobs that may still be running in a worker
+        self._cancelled = []
+        self._nextid = 0
+        # time when the last job finished, fits in the queue only start then
+        self._lastdone = time.time()
+
+
+    def _get_pool(self):
+        if self._pool is None:
+            self._pool = multiprocessing.Pool(self.processes,
+                                              initializer=_init_worker,
+                                              initargs=(self._oldest_wanted, ))
+        return self._pool
+
+
+    def submit(self, func, args=(), kwargs={}, context=None, supersede=True):
+        """Submit a job, func(*args, **kwargs) is run in a worker process
+
+        **Inputs**
+
+          * func: function, has to be defined at module level (picklable)
+          * args: tuple, positional arguments to func
+          * kwargs: dict, keyword arguments to func
+          * context: any object, returned with the job by poll(), for example
+                     what is needed to display the result
+          * supersede: bool, if True all outstanding jobs are cancelled
+
+        **Outputs**
+
+          * jobid: int
+
+        """
+
+        jobid = self._nextid
+        self._nextid += 1
+        if supersede:
+            for job in self._jobs:
+                job.cancelled = True
+            self._oldest_wanted.value = jobid
+        if not self._jobs:
+            self._lastdone = time.time()
+        asyncresult = self._get_pool().apply_async(_run_job,
+                                                   (jobid, func, args, kwargs))
+        self._jobs.append(FitJob(jobid, asyncresult, context))
+
+        return jobid
+
+
+    def pending(self):
+        """Return the number of jobs that are queued or running"""
+        return len([job for job in self._jobs if not job.cancelled])
+
+
+    def poll(self):
+        """Return the finished jobs, in order of job id
+
+        Cancelled jobs are not returned. A job is only returned when all
+        jobs submitted before it have finished.
+
+        **Outputs**
+
+          * jobs: list of FitJob, with the result (or error) set
+
+        """
+
+        self._cancelled = [job for job in self._cancelled if \
+                           not job._asyncresult.ready()]
+        finished = []
+        while self._jobs:
+            job = self._jobs[0]
+            if not job._asyncresult.ready():
+                if job.cancelled:
+                    # do not wait for the result, it is not wanted anyway
+                    self._cancelled.append(self._jobs.pop(0))
+                    continue
+                break
+            self._jobs.pop(0)
+            self._lastdone = time.time()
+            try:
+                job.result = job._asyncresult.get()
+            except Exception, e:
+                job.error = 'Fit failed: %s'%e
+            if not job.cancelled:
+                finished.append(job)
+
+        now = time.time()
+        hung = [cancelled for cancelled in self._cancelled if \
+                now - cancelled.submitted > self.timeout]
+        if self._jobs and \
+           now - max(self._jobs[0].submitted, self._lastdone) > self.timeout:
+            hung.append(self._jobs[0])
+        if hung:
+            finished.extend(self._restart())
+
+        return finished
+
+
+    def _restart(self):
+        """Terminate the pool with a hung job, fail the outstanding jobs"""
+
+        self._pool.terminate()
+        self._pool = None
+        failed = []
+        for job in self._jobs:
+            if not job.cancelled:
+                job.error = 'Fit timed out after %s s'%self.timeout
+                failed.append(job)
+        self._jobs = []
+        self._cancelled = []
+
+        return failed
+
+
+    def shutdown(self):
+        """Stop the worker processes, outstanding jobs are discarded"""
+
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+        self._jobs = []
+        self._cancelled = []
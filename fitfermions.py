@@ -71,7 +71,8 @@ def norm_and_guess(transimg, norm=True):
     com = center_of_mass(odimg)
 
     # guess initial fit parameters
-    n0 = odimg[com[0]-5:com[0]+5, com[1]-5:com[1]+5].sum()*1e-2 # av. central OD
+    ci, cj = int(com[0]), int(com[1])
+    n0 = odimg[ci-5:ci+5, cj-5:cj+5].sum()*1e-2 # av. central OD
     a = 4 # log(fugacity)
 
     # approximate cloud size, with minimum 10 pixels in case this does not work
@@ -138,7 +139,8 @@ def find_ellipticity(transimg, normalize=True, tol=2e-3):
     return ellip
 
 
-def do_fit(rcoord, od_prof, od_cutoff, guess, pixcal, fitfunc='idealfermi', T=None):
+def do_fit(rcoord, od_prof, od_cutoff, guess, pixcal, fitfunc='idealfermi', T=None,
+           warmstart=None, warmkey=None):
     """Fits an absorption image with an ideal Fermi gas profile
 
     **Inputs**
@@ -162,12 +164,18 @@ def do_fit(rcoord, od_prof, od_cutoff, guess, pixcal, fitfunc='idealfermi', T=No
       * fitfunc: string, name of the fit function to be used. Valid choices are
         idealfermi, gaussian, idealfermi_fixedT
       * T: float, the temperature for idealfermi_fixedT
+      * warmstart: WarmStart instance, if given the fit starts from the
+                   previous result for the same `warmkey` and fit function
+                   when that is better than `guess`. warmstart.nfev is the
+                   number of function evaluations of the fit.
+      * warmkey: hashable, identifies the fit for `warmstart`, e.g. the ROI
 
     """
 
     def fit_idealfermi():
         ans = fit1dfunc(ideal_fermi_radial, rcoord[od_cutoff:], \
-                        od_prof[od_cutoff:], guess)#, \
+                        od_prof[od_cutoff:], guess, warmstart=warmstart,
+                        warmkey=(warmkey, 'idealfermi'))#, \
                         #weights=np.sqrt(rcoord[od_cutoff:]))
         # compute temperature and number of atoms and print result
         ToverTF, N = ideal_fermi_numbers(ans, pixcal)
@@ -176,23 +184,19 @@ def do_fit(rcoord, od_prof, od_cutoff, guess, pixcal, fitfunc='idealfermi', T=No
 
         return ans, ToverTF, N
 
-    def fit_idealfermi_fixedT():
-        # this is used by texreport.py
-        logfugacity = fugacity_from_temp(T)
-        residuals = lambda p, rr, rrdata: ideal_fermi_radial(rr, p[0], \
-                                                    logfugacity, p[1]) - rrdata
-        ans, cov_x, infodict, mesg, success = sp.optimize.leastsq(residuals, \
-                    [guess[0], guess[2]], args=(rcoord[od_cutoff:], od_prof[od_cutoff:])\
-                    , full_output=True)
+    def fit_fixedT(temps):
+        # all temperatures are fit at once
+        ans, success = fit_idealfermi_fixedT(rcoord[od_cutoff:],
+                                od_prof[od_cutoff:], temps, [guess[0], guess[2]])
         ToverTF = 0 # fix later
         N = 0 # fix later
-        ans = (ans[0], logfugacity, ans[1])
 
-        return ans, ToverTF, N
+        return [tuple(fitparams) for fitparams in ans], ToverTF, N
 
     def fit_gaussian():
         ans = fit1dfunc(gaussian, rcoord[od_cutoff:], \
-                        od_prof[od_cutoff:], [guess[0], guess[2]])
+                        od_prof[od_cutoff:], [guess[0], guess[2]],
+                        warmstart=warmstart, warmkey=(warmkey, 'gaussian'))
         ToverTF = 1e3 # fix later
         N = gaussian_numbers(ans, pixcal)
 
@@ -203,13 +207,12 @@ def do_fit(rcoord, od_prof, od_cutoff, guess, pixcal, fitfunc='idealfermi', T=No
         ans, ToverTF, N = fit_idealfermi()
     elif fitfunc=='idealfermi_err':
         ans, ToverTF, N = fit_idealfermi()
-        T = ToverTF + 0.03
-        ans_plus = fit_idealfermi_fixedT()[0]
-        T = max(0.001, ToverTF - 0.03)
-        ans_min = fit_idealfermi_fixedT()[0]
+        ans_plus, ans_min = fit_fixedT(np.hstack(
+                [ToverTF + 0.03, max(0.001, ToverTF - 0.03)]))[0]
         return ToverTF, N, [ans, ans_plus, ans_min]
     elif fitfunc=='idealfermi_fixedT':
-        ans, ToverTF, N = fit_idealfermi_fixedT()
+        ans, ToverTF, N = fit_fixedT(T)
+        ans = ans[0]
     elif fitfunc=='gaussian':
         ans, ToverTF, N = fit_gaussian()
     else:
@@ -219,7 +222,8 @@ def do_fit(rcoord, od_prof, od_cutoff, guess, pixcal, fitfunc='idealfermi', T=No
 
 
 def fit_img(transimg, odmax=1., showfig=True, elliptic=None, pixcal=10e-6,
-            fitfunc='idealfermi', T=None, full_output=None, norm=True):
+            fitfunc='idealfermi', T=None, full_output=None, norm=True,
+            warmstart=None, warmkey=None):
     """Fits an absorption image with an ideal Fermi gas profile
 
     The image is normalized, then azimuthally averaged, then fitted. If the
@@ -252,6 +256,10 @@ def fit_img(transimg, odmax=1., showfig=True, elliptic=None, pixcal=10e-6,
       * norm: bool, if False the normalization of the image is turned off.
               This is mainly useful if you fit computer-generated images or
               images that you already normalized some other way.
+      * warmstart: WarmStart instance, to start from the parameters of the
+                   previous fit with the same `warmkey`, see do_fit.
+      * warmkey: hashable, identifies ROI and settings of the fit for
+                 `warmstart`. Default is the image shape and ellipticity.
 
     """
 
@@ -285,8 +293,11 @@ def fit_img(transimg, odmax=1., showfig=True, elliptic=None, pixcal=10e-6,
 
     # do the fit
     guess = (n0, a, bprime)
+    if warmkey is None:
+        warmkey = (transimg.shape, elliptic)
     ToverTF, N, ans = do_fit(rcoord, od_prof, od_cutoff, guess, pixcal,
-                             fitfunc=fitfunc, T=T)
+                             fitfunc=fitfunc, T=T, warmstart=warmstart,
+                             warmkey=warmkey)
 
     # plot results
     if showfig:
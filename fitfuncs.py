@@ -117,16 +117,137 @@ def gaussian_numbers(fitparams, pixcal, sigma=None):
     return N
 
 
-def fugacity_from_temp(ToverTF):
-    """Finds the fugacity from the temperature by a minimization routine"""
+def fugacity_from_temp(ToverTF, tol=1e-12, maxiter=50):
+    """Finds the logarithm of the fugacity from the temperature
 
-    def best_fugacity(logfugacity):
-        return abs(ToverTF - (6*fermi_poly3(logfugacity))**(-1./3))
+    Solves T/T_F = (6*fermi_poly3(q))**(-1/3) for q with Newton's method on
+    log(fermi_poly3), whose derivative is fermi_poly2/fermi_poly3. All
+    temperatures are solved at the same time.
 
-    fugacity = sp.optimize.brent(best_fugacity, brack=(1e-5, 1e5), \
-                                 full_output=0, tol=1e-5)
+    **Inputs**
+
+      * ToverTF: float or array, temperature(s) in units of T_F
+
+    **Outputs**
+
+      * logfugacity: float or array of the same shape as ToverTF, q = mu*beta
+
+    **Optional inputs**
+
+      * tol: float, absolute tolerance on q
+      * maxiter: int, maximum number of Newton steps
+
+    """
+
+    ToverTF = np.asarray(ToverTF, dtype=float)
+    target = np.log(1./(6*np.ravel(ToverTF)**3))
+    # fermi_poly3(q) is exp(q) for q << 0 and q**3/6 for q >> 0
+    q = np.where(target < 0, target, np.exp(target/3.)*6**(1./3))
+    for i in range(maxiter):
+        f3 = fermi_poly3(q)
+        step = (np.log(f3) - target)*f3/fermi_poly2(q)
+        # the log is concave for large q, don't let a step overshoot
+        step = np.clip(step, -5., 5.)
+        q = q - step
+        if np.all(np.abs(step) < tol):
+            break
+
+    if ToverTF.ndim == 0:
+        return float(q[0])
+    return q.reshape(ToverTF.shape)
+
+
+def fit_idealfermi_fixedT(r, od_prof, ToverTF, guess, tol=1e-8, maxiter=100):
+    """Fit a radial profile with ideal_fermi_radial at several fixed T
+
+    The fugacity follows from each temperature, so every fit has only n0
+    and r_cloud as free parameters. All fits are done at once by a damped
+    Gauss-Newton (Levenberg-Marquardt) iteration on a (K, len(r)) array of
+    model profiles; a fit drops out of the iteration when it has converged.
 
-    return fugacity
+    **Inputs**
+
+      * r: 1D array containing the radial coordinate
+      * od_prof: 1D array containing the radial OD profile
+      * ToverTF: float or sequence of K floats, the fixed temperatures
+      * guess: sequence, initial n0 and r_cloud, used for all fits
+
+    **Outputs**
+
+      * ans: (K, 3) array, each row contains n0, q and r_cloud, like the
+             parameters of ideal_fermi_radial
+      * success: (K,) bool array, False if a fit did not converge within
+                 maxiter iterations
+
+    **Optional inputs**
+
+      * tol: float, relative tolerance on the sum of squared residuals and
+             on the parameters
+      * maxiter: int, maximum number of iterations
+
+    """
+
+    q = np.atleast_1d(fugacity_from_temp(np.ravel(ToverTF)))
+    r2 = np.asarray(r, dtype=float)**2
+    data = np.asarray(od_prof, dtype=float)
+    # the factor of ideal_fermi_radial, without overflow for large q
+    fq = np.logaddexp(0, q)*(1 + np.exp(-q))
+    norm = fermi_poly2(q)
+
+    def profiles(idx, p):
+        """argument of fermi_poly2, normalized profile and residuals"""
+        u = q[idx, np.newaxis] - r2*(fq[idx]/p[:, 1]**2)[:, np.newaxis]
+        shape = fermi_poly2(u)/norm[idx, np.newaxis]
+        return u, shape, p[:, 0, np.newaxis]*shape - data
+
+    nfits = q.size
+    p = np.empty((nfits, 2))
+    p[:] = guess
+    allfits = np.arange(nfits)
+    u, shape, res = profiles(allfits, p)
+    cost = np.sum(res**2, axis=1)
+    lam = np.ones(nfits)*1e-3
+    active = np.ones(nfits, dtype=bool)
+
+    for i in range(maxiter):
+        idx = allfits[active]
+        if not idx.size:
+            break
+        n0, rc = p[idx, 0], p[idx, 1]
+        # Jacobian columns, d fermi_poly2(u)/du = log(1 + exp(u))
+        jac_n0 = shape[idx]
+        jac_rc = np.logaddexp(0, u[idx])*2*r2/norm[idx, np.newaxis]*\
+                 (n0*fq[idx]/rc**3)[:, np.newaxis]
+        a = np.sum(jac_n0**2, axis=1)*(1 + lam[idx])
+        b = np.sum(jac_n0*jac_rc, axis=1)
+        c = np.sum(jac_rc**2, axis=1)*(1 + lam[idx])
+        g_n0 = np.sum(jac_n0*res[idx], axis=1)
+        g_rc = np.sum(jac_rc*res[idx], axis=1)
+        # solve the damped 2x2 normal equations of all fits
+        det = a*c - b**2
+        step = np.empty((idx.size, 2))
+        step[:, 0] = (b*g_rc - c*g_n0)/det
+        step[:, 1] = (b*g_n0 - a*g_rc)/det
+
+        trial = p[idx] + step
+        u_t, shape_t, res_t = profiles(idx, trial)
+        cost_t = np.sum(res_t**2, axis=1)
+        better = np.isfinite(cost_t) & (cost_t <= cost[idx])
+        small = np.all(np.abs(step) <= tol*np.abs(p[idx]), axis=1) | \
+                (cost[idx] - cost_t <= tol*cost[idx])
+
+        acc = idx[better]
+        p[acc] = trial[better]
+        u[acc], shape[acc], res[acc] = u_t[better], shape_t[better], \
+                                       res_t[better]
+        cost[acc] = cost_t[better]
+        lam[acc] /= 10.
+        lam[idx[~better]] *= 10.
+        # converged, or no step along the gradient lowers the residuals
+        active[idx[(better & small) | (lam[idx] > 1e10)]] = False
+
+    ans = np.column_stack((p[:, 0], q, np.abs(p[:, 1])))
+    return ans, ~active
 
 
 def gaussian(r, n0, sigma):
@@ -173,7 +294,106 @@ def n2D_radial(r, oneDfunc, oneDparams):
     return twoDfunc
 
 
-def fit1dfunc(func, xdata, ydata, guess, weights=None, params=None, tol=1e-8):
+class WarmStart(object):
+    """Seeds fits with the converged parameters of the previous fit.
+
+    In a live sequence consecutive shots are nearly identical, so the result
+    of the last fit with the same ROI and fit function is a better starting
+    point than a fresh guess and the fit needs fewer function evaluations.
+    The previous parameters are only used if their residual is not worse
+    than that of the fresh guess, and if the fit from them does not
+    converge it is repeated from the fresh guess.
+
+    Pass an instance as `warmstart` to fit1dfunc, fit2dfunc, do_fit or
+    fit_img, together with a `warmkey` that identifies ROI and fit function.
+
+    """
+
+    def __init__(self, enabled=True):
+        """
+        **Inputs**
+
+          * enabled: bool, if False every fit starts from the fresh guess,
+                     but the number of function evaluations is still recorded.
+
+        """
+
+        self.enabled = enabled
+        self.params = {}
+        # number of function evaluations of the last fit
+        self.nfev = None
+        # True if the last fit started from the previous parameters
+        self.warm = False
+
+
+    def leastsq(self, key, fitter, residuals, guess):
+        """Run `fitter` from the best starting point
+
+        **Inputs**
+
+          * key: hashable, identifies the fit (ROI, fit function)
+          * fitter: function, fitter(start) runs the fit from `start` and
+                    returns the full output of scipy.optimize.leastsq
+          * residuals: function, residuals(p) returns the residual array
+          * guess: sequence, the fresh initial guess
+
+        **Outputs**
+
+          * the full output of scipy.optimize.leastsq
+
+        """
+
+        start = guess
+        self.warm = False
+        previous = self.params.get(key)
+        if self.enabled and previous is not None and \
+           len(previous) == len(guess) and \
+           _sumsq(residuals, previous) <= _sumsq(residuals, guess):
+            start = previous
+            self.warm = True
+
+        output = fitter(start)
+        nfev = output[2]['nfev']
+        if self.warm and output[4] not in [1, 2, 3, 4]:
+            output = fitter(guess)
+            nfev += output[2]['nfev']
+            self.warm = False
+        if output[4] in [1, 2, 3, 4]:
+            self.params[key] = np.array(output[0], copy=True)
+        self.nfev = nfev
+
+        return output
+
+
+    def update(self, other):
+        """Take over the parameters of `other`
+
+        **Inputs**
+
+          * other: WarmStart instance, for example the copy that was used
+                   for a fit in a worker process
+
+        """
+
+        self.params.update(other.params)
+
+
+    def clear(self):
+        """Forget all previous parameters"""
+        self.params = {}
+
+
+def _sumsq(residuals, p):
+    """Sum of squared residuals, inf if it can not be computed"""
+
+    cost = np.sum(residuals(np.asarray(p))**2)
+    if not np.isfinite(cost):
+        return np.inf
+    return cost
+
+
+def fit1dfunc(func, xdata, ydata, guess, weights=None, params=None, tol=1e-8,
+              warmstart=None, warmkey=None):
     """Convenience function to fit 1d data
 
     Note that if the fitted data has no noise, the fit will sometimes return
@@ -196,6 +416,9 @@ def fit1dfunc(func, xdata, ydata, guess, weights=None, params=None, tol=1e-8):
       * weights: 1D array, the weights of the data points
       * params: sequence, containing the other input parameters to func
       * tol: relative tolerance of the fitting routine
+      * warmstart: WarmStart instance, if given the fit starts from the
+                   previous result for `warmkey` when that is better.
+      * warmkey: hashable, identifies the fit for `warmstart`
 
     """
 
@@ -206,8 +429,13 @@ def fit1dfunc(func, xdata, ydata, guess, weights=None, params=None, tol=1e-8):
     if not weights:
         weights = np.ones(xdata.shape)
     residuals = lambda p, rr, rrdata: (func(rr, *p) - rrdata) * weights
-    ans, cov_x, infodict, mesg, success = sp.optimize.leastsq(residuals, guess,\
+    fitter = lambda start: sp.optimize.leastsq(residuals, start,
                     args=(xdata, ydata), ftol=tol, full_output=True)
+    if warmstart is None:
+        ans, cov_x, infodict, mesg, success = fitter(guess)
+    else:
+        ans, cov_x, infodict, mesg, success = warmstart.leastsq(warmkey,
+                    fitter, lambda p: residuals(p, xdata, ydata), guess)
 
     if success==1:
         # calculate the correlation matrix from the covariance matrix
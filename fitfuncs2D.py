@@ -1,7 +1,6 @@
 import numpy as np
 import scipy as sp
 from scipy import integrate, optimize
-import matplotlib.pyplot as plt
 
 from polylog import fermi_poly2, fermi_poly3
 
@@ -178,7 +177,8 @@ def ideal_fermi_numbers_2D_angled(fitparams, pixcal, sigma=None):
 
     return ToverTF, N
 
-def fit2dfunc(func, data, guess, ind_scale=1., params=None, tol=1e-8):
+def fit2dfunc(func, data, guess, ind_scale=1., params=None, tol=1e-8,
+              warmstart=None, warmkey=None):
     """Convenience function to fit 2-D data.
 
     Note that if the fitted data has no noise (i.e. it was simulated data),
@@ -202,6 +202,9 @@ def fit2dfunc(func, data, guess, ind_scale=1., params=None, tol=1e-8):
                    to obtain the independent values for the fit.
       * params: sequence, containing the other input parameters to func
       * tol: relative tolerance of the fitting routine
+      * warmstart: WarmStart instance (see fitfuncs), if given the fit starts
+                   from the previous result for `warmkey` when that is better.
+      * warmkey: hashable, identifies the fit for `warmstart`
 
     """
 
@@ -217,10 +220,13 @@ def fit2dfunc(func, data, guess, ind_scale=1., params=None, tol=1e-8):
     data = data.ravel()
 
     residuals = lambda p: (func(p, X, Y) - data)
-    ans, cov_x, infodict, mesg, success = sp.optimize.leastsq(residuals,
-                                                              guess,
-                                                              ftol=tol,
-                                                              full_output=True)
+    fitter = lambda start: sp.optimize.leastsq(residuals, start, ftol=tol,
+                                               full_output=True)
+    if warmstart is None:
+        ans, cov_x, infodict, mesg, success = fitter(guess)
+    else:
+        ans, cov_x, infodict, mesg, success = warmstart.leastsq(warmkey,
+                                                fitter, residuals, guess)
 
     if success==1:
         return ans
@@ -335,6 +341,7 @@ def residuals_2D(data, fitparams, func=idealfermi_2D, smooth=None, showfig=False
     if smooth:
         residuals = sp.ndimage.gaussian_filter(residuals, smooth)
     if showfig:
+        import matplotlib.pyplot as plt
         fig = plt.figure()
         ax = fig.add_subplot(111)
         im = ax.imshow(residuals)
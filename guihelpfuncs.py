@@ -170,4 +170,34 @@ class MaxsizeDialog(QDialog):
 
 
     def sizeHint(self):
-        return QSize(850, 1000)
\ No newline at end of file
+        return QSize(850, 1000)
+
+class TimeRangeDialog(QDialog):
+
+    def __init__(self, tstart, tstop, parent=None):
+        """Asks for a start and stop time, tstart and tstop in seconds since
+        the epoch. After exec_(), times() returns the chosen times."""
+        super(TimeRangeDialog, self).__init__(parent)
+        self.setWindowTitle('Odysseus - Select shots by time')
+
+        self.startEdit = QDateTimeEdit(QDateTime.fromTime_t(int(tstart)))
+        self.stopEdit = QDateTimeEdit(QDateTime.fromTime_t(int(tstop)))
+        for edit in [self.startEdit, self.stopEdit]:
+            edit.setCalendarPopup(True)
+            edit.setDisplayFormat('yyyy-MM-dd hh:mm:ss')
+        buttonBox = QDialogButtonBox(QDialogButtonBox.Ok|
+                                     QDialogButtonBox.Cancel)
+
+        layout = QFormLayout()
+        layout.addRow('From', self.startEdit)
+        layout.addRow('To', self.stopEdit)
+        layout.addRow(buttonBox)
+        self.setLayout(layout)
+
+        self.connect(buttonBox, SIGNAL("accepted()"), self, SLOT("accept()"))
+        self.connect(buttonBox, SIGNAL("rejected()"), self, SLOT("reject()"))
+
+
+    def times(self):
+        return (self.startEdit.dateTime().toTime_t(),
+                self.stopEdit.dateTime().toTime_t())
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+"""Icons and images of the GUI, loaded from the resources directory.
+
+Resources are named as in resources.qrc, with the Qt resource prefix, for
+example ':/icon.png'. They are read from disk the first time they are used,
+and the decoded QPixmap or QIcon is kept for later use. This replaces the
+compiled qrcresources module, which had to be unpacked completely before the
+first window could be shown.
+
+"""
+
+import os
+import xml.dom.minidom
+
+from PyQt4.QtGui import QPixmap, QIcon
+
+
+BASEDIR = os.path.dirname(os.path.abspath(__file__))
+QRCFILE = os.path.join(BASEDIR, 'resources.qrc')
+
+# resource name -> file path, read from QRCFILE on first use
+_aliases = None
+_pixmaps = {}
+_icons = {}
+
+
+def _read_aliases(qrcfile=QRCFILE):
+    """Return a dict of resource names to file paths from a .qrc file"""
+
+    aliases = {}
+    dom = xml.dom.minidom.parse(qrcfile)
+    for node in dom.getElementsByTagName('file'):
+        relpath = ''.join([child.data for child in node.childNodes]).strip()
+        name = node.getAttribute('alias') or relpath
+        aliases[name] = os.path.join(os.path.dirname(qrcfile), relpath)
+
+    return aliases
+
+
+def is_resource(name):
+    """Return True if name refers to a resource, like ':/icon.png'"""
+    return name.startswith(':/')
+
+
+def resource_path(name):
+    """Return the path of the file for a resource
+
+    **Inputs**
+
+      * name: str, the resource name, with or without the ':/' prefix
+
+    **Outputs**
+
+      * path: str, path of the file in the resources directory
+
+    """
+
+    global _aliases
+    if _aliases is None:
+        _aliases = _read_aliases()
+    if is_resource(name):
+        name = name[2:]
+    try:
+        return _aliases[name]
+    except KeyError:
+        raise KeyError, 'No resource named %s in %s'%(name, QRCFILE)
+
+
+def pixmap(name):
+    """Return a QPixmap of a resource or of an image file
+
+    Resources are only decoded once. Image files are read every time, since
+    the thumbnails are overwritten when a new image arrives.
+
+    """
+
+    if not is_resource(name):
+        return QPixmap(name)
+    if name not in _pixmaps:
+        _pixmaps[name] = QPixmap(resource_path(name))
+    return _pixmaps[name]
+
+
+def icon(name):
+    """Return a QIcon of a resource, like ':/roi_analysis.svg'"""
+
+    if name not in _icons:
+        _icons[name] = QIcon(resource_path(name))
+    return _icons[name]
@@ -10,48 +10,403 @@ binary (.npy): np.save('filename', img)
 """
 
 import os
+import sys
+import time
+import struct
+import hashlib
+import multiprocessing
 
 import numpy as np
 import scipy as sp
+
+
+class _LazyModule(object):
+    """A module that is only imported when one of its attributes is used
+
+    Keeps importing this module fast, for example in worker processes that
+    never touch an image file or hdf5. The first of `names` that can be
+    imported is used.
+
+    """
+
+    def __init__(self, *names):
+        self._names = names
+        self._module = None
+
+    def available(self):
+        """Return True if one of the modules can be imported"""
+        try:
+            self._load()
+        except ImportError:
+            return False
+        return True
+
+    def _load(self):
+        if self._module is None:
+            for name in self._names:
+                try:
+                    __import__(name)
+                except ImportError:
+                    continue
+                self._module = sys.modules[name]
+                break
+            else:
+                raise ImportError, 'No module named %s'%' or '.join(self._names)
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+
 # if available, use Zach Pincus' pil_lite which has correct 16-bit TIFF loading
-try:
-    import pil_lite.pil_core.Image as Image
-except ImportError:
-    import Image
-#import tables
+Image = _LazyModule('pil_lite.pil_core.Image', 'Image', 'PIL.Image')
+tables = _LazyModule('tables')
 
 
-def list_of_frames(img_name):
+def list_of_frames(img_name, frames=None):
     """Return the list of frames for an image file.
 
     Details are as described in the imgimport_intelligent docstring.
 
+    **Inputs**
+
+      * img_name: string containing the full path to an image
+      * frames: list of int, the frames to decode. Default is all frames.
+
     """
 
-    img = Image.open(img_name)
-    imglist = []
+    stack = FrameStack(img_name)
+    if frames is None:
+        frames = xrange(len(stack))
+
+    return [stack[i] for i in frames]
+
+
+def _decode_frame(img):
+    """Decode the current frame of a PIL image to an array"""
+
+    if img.mode == 'I':
+        imdata = np.asarray(img, dtype=np.int16)
+    else:
+        imdata = np.asarray(img, dtype=np.float32)
+    # fix 3-channel TIFF images
+    if imdata.ndim==3:
+        imdata = imdata[:,:,0] + 256*imdata[:,:,1] + 65536*imdata[:,:,2]
+
+    return imdata
+
+
+class LazyStack(object):
+    """A stack of equally shaped 2D frames that are computed on first access.
+
+    Can be used in place of the 3D array (M, N, nframes) of raw frames:
+    `stack[:, :, k]` and `stack[k]` both return frame k, and np.asarray(stack)
+    creates the full 3D array. Frames are kept after they are computed, until
+    release() is called.
+
+    """
+
+    def __init__(self, getframe, nframes, frameshape, sources=()):
+        """
+        **Inputs**
+
+          * getframe: function, getframe(k) returns frame k as a 2D array
+          * nframes: int, number of frames
+          * frameshape: tuple, shape of a single frame
+          * sources: sequence of LazyStack, the stacks getframe takes its
+                     frames from, they are released together with this one
+
+        """
+
+        self._getframe = getframe
+        self._frames = {}
+        self._sources = list(sources)
+        self.nframes = nframes
+        self.shape = tuple(frameshape) + (nframes, )
+
+
+    def __len__(self):
+        return self.nframes
+
+
+    def __getitem__(self, item):
+        if isinstance(item, tuple) and len(item)==3 and \
+           isinstance(item[2], (int, long, np.integer)):
+            return self[item[2]][item[:2]]
+        elif isinstance(item, (int, long, np.integer)):
+            if item < 0:
+                item += self.nframes
+            if not 0 <= item < self.nframes:
+                raise IndexError, 'frame %s out of range'%item
+            if item not in self._frames:
+                self._frames[item] = self._getframe(item)
+            return self._frames[item]
+        else:
+            return np.asarray(self)[item]
+
+
+    def __iter__(self):
+        for k in xrange(self.nframes):
+            yield self[k]
+
+
+    def is_decoded(self, k):
+        """Return True if frame k is in memory"""
+        return k % self.nframes in self._frames
+
+
+    def decoded_nbytes(self):
+        """Return the number of bytes of the frames that are in memory"""
+
+        # views (like kinetics strips) are counted in their source
+        nbytes = sum([frame.nbytes for frame in self._frames.itervalues() \
+                      if not isinstance(frame.base, np.ndarray)])
+        return nbytes + sum([source.decoded_nbytes() for source in \
+                             self._sources])
+
+
+    def release(self):
+        """Forget the computed frames, they are computed again when needed"""
+
+        self._frames = {}
+        for source in self._sources:
+            source.release()
+
+
+    def __array__(self, dtype=None):
+        img_array = np.dstack(list(self))
+        if dtype is not None:
+            img_array = img_array.astype(dtype)
+        return img_array
+
+
+class FrameStack(LazyStack):
+    """The frames of a multi-page image file, decoded on first access.
+
+    Opening the stack only reads the page headers to count the frames, pixel
+    data is decoded when a frame is indexed. The file is only open while the
+    headers are read or a frame is decoded. If the file was changed or
+    removed after the stack was opened, decoding a frame raises an IOError
+    instead of returning frames of a different shot.
+
+    """
+
+    def __init__(self, img_name, maxframes=8):
+        """
+        **Inputs**
+
+          * img_name: string containing the full path to an image
+          * maxframes: int, frames beyond this number are ignored
+
+        """
+
+        self.img_name = img_name
+        self._stamp = _file_stamp(img_name)
+        img = Image.open(img_name)
+        try:
+            nframes = 1
+            try:
+                while nframes < maxframes:
+                    img.seek(nframes) # next frame, header only
+                    nframes += 1
+            except EOFError:
+                pass
+            # note the reversed order because Image and asarray have reversed
+            # order
+            frameshape = (img.size[1], img.size[0])
+        finally:
+            _close_image(img)
+        LazyStack.__init__(self, self._decode, nframes, frameshape)
+
+
+    def _decode(self, k):
+        if _file_stamp(self.img_name) != self._stamp:
+            raise IOError, '%s changed since it was opened'%self.img_name
+        img = Image.open(self.img_name)
+        try:
+            img.seek(k)
+            return _decode_frame(img)
+        finally:
+            _close_image(img)
+
+
+def _file_stamp(fname):
+    """Return modification time and size of a file, None if it is missing"""
 
     try:
-        for i in xrange(8):
-            if img.mode == 'I':
-                imdata = np.asarray(img, dtype=np.int16)
-            else:
-                imdata = np.asarray(img, dtype=np.float32)
-            # fix 3-channel TIFF images
-            if np.rank(imdata)==3:
-                imdata = imdata[:,:,0] + 256*imdata[:,:,1] + 65536*imdata[:,:,2]
-            imglist.append(imdata)
-            img.seek(i+1) # next frame
-    except EOFError:
-        pass
+        stat = os.stat(fname)
+    except OSError:
+        return None
+    return stat.st_mtime, stat.st_size
 
-    if not imglist:
-        raise ImportError, 'No frames detected in file %s' %img_name
+
+def _close_image(img):
+    """Close the file of a PIL image, older PIL versions have no close()"""
+
+    if hasattr(img, 'close'):
+        img.close()
+    elif getattr(img, 'fp', None) is not None:
+        img.fp.close()
+
+
+def kinetics_strips(frame, lineshift, nstrips, orientation='V', startat='BR'):
+    """Split a frame taken in kinetics mode into its strips, without copying
+
+    **Inputs**
+
+      * frame: 2D array
+      * lineshift: int, size of a strip in pixels
+      * nstrips: int, number of strips in the frame
+      * orientation: str, 'V' if the strips are stacked vertically, 'H' if
+                     they are side by side
+      * startat: str, 'BR' if the first strip is at the bottom/right of the
+                 frame, 'TL' if it is at the top/left
+
+    **Outputs**
+
+      * strips: 3D array, a view of frame with strips[i] the i-th strip
+
+    """
+
+    if orientation=='H':
+        frame = frame.T
+    size = frame.shape[0]
+    if nstrips*lineshift > size:
+        raise ImportError, '%s strips of %s lines do not fit in a frame'\
+              %(nstrips, lineshift)
+
+    if startat=='BR':
+        strips = frame[size - nstrips*lineshift:]
     else:
-        return imglist
+        strips = frame[:nstrips*lineshift]
+    strips = strips.reshape((nstrips, lineshift) + frame.shape[1:])
+    if startat=='BR':
+        strips = strips[::-1]
+    if orientation=='H':
+        strips = strips.transpose(0, 2, 1)
+
+    return strips
+
+
+# TIFF tags that point to the image data, and the sizes of the field types
+_TIFF_OFFSET_TAGS = {273: 279, 324: 325} # StripOffsets, TileOffsets
+_TIFF_DATA_TAGS = (273, 279, 324, 325) # the above with their byte counts
+_TIFF_TYPESIZES = {1: 1, 2: 1, 3: 2, 4: 4, 5: 8, 6: 1, 7: 1, 8: 2, 9: 4,
+                   10: 8, 11: 4, 12: 8}
+_TIFF_PAGENUMBER = 297 # page number and total number of pages
+# bytes after the last IFD and image data that may be padding, more means
+# that the image data of a next page is being written
+_TIFF_TRAILING_SLACK = 16
+
+
+def tiff_complete(fname):
+    """Check if a TIFF file has been written completely
+
+    Only the structure is checked, all image file directories (IFDs) and
+    the image data they point to have to lie within the file. This does
+    not decode any pixel data.
+
+    A multipage file looks complete after its first page while the next
+    page is written, because the next-IFD pointer of the last page is
+    still 0. Therefore the file is also incomplete if it has fewer pages
+    than its PageNumber tag says, or if there are more bytes after the last
+    IFD and image data than padding accounts for.
+
+    **Inputs**
+
+      * fname: str, path to the TIFF file
+
+    **Outputs**
+
+      * complete: bool, False if the file is truncated (or not a TIFF file)
+
+    """
+
+    try:
+        f = open(fname, 'rb')
+    except IOError:
+        return False
+    try:
+        return _tiff_structure_complete(f, os.fstat(f.fileno()).st_size)
+    finally:
+        f.close()
+
+
+def _tiff_structure_complete(f, size):
+    """Walk the IFDs of the open TIFF file f, reading only the headers"""
 
+    def read(pos, nbytes):
+        if pos + nbytes > size:
+            raise ValueError
+        f.seek(pos)
+        return f.read(nbytes)
 
-def full_directory_import(directory_name, import_function):
+    try:
+        header = read(0, 8)
+        if header[:2] == 'II':
+            order = '<'
+        elif header[:2] == 'MM':
+            order = '>'
+        else:
+            return False
+        magic, offset = struct.unpack(order + 'HI', header[2:8])
+        if magic == 43:
+            # BigTIFF, the structure is not checked
+            return True
+        elif magic != 42:
+            return False
+
+        visited = set()
+        # end of the structures and data found so far
+        end = 8
+        totalpages = None
+        while offset:
+            if offset in visited:
+                return False
+            visited.add(offset)
+            numentries = struct.unpack(order + 'H', read(offset, 2))[0]
+            ifd = read(offset + 2, 12*numentries + 4)
+            end = max(end, offset + 2 + 12*numentries + 4)
+            tags = {}
+            for i in xrange(numentries):
+                tag, fieldtype, count = struct.unpack(order + 'HHI',
+                                                      ifd[12*i:12*i+8])
+                typesize = _TIFF_TYPESIZES.get(fieldtype, 1)
+                value = ifd[12*i+8:12*i+12]
+                if count*typesize > 4:
+                    # the value does not fit in the entry, it is elsewhere
+                    valuepos = struct.unpack(order + 'I', value)[0]
+                    if valuepos + count*typesize > size:
+                        return False
+                    end = max(end, valuepos + count*typesize)
+                    if tag in _TIFF_DATA_TAGS:
+                        value = read(valuepos, count*typesize)
+                fmt = {3: 'H', 4: 'I'}.get(fieldtype)
+                if fmt is not None and (tag in _TIFF_DATA_TAGS or \
+                                        tag == _TIFF_PAGENUMBER):
+                    tags[tag] = struct.unpack('%s%s%s'%(order, count, fmt),
+                                              value[:count*typesize])
+            for offsettag, counttag in _TIFF_OFFSET_TAGS.iteritems():
+                if offsettag in tags and counttag in tags:
+                    for start, nbytes in zip(tags[offsettag], tags[counttag]):
+                        if start + nbytes > size:
+                            return False
+                        end = max(end, start + nbytes)
+            if totalpages is None and len(tags.get(_TIFF_PAGENUMBER, ())) == 2:
+                totalpages = tags[_TIFF_PAGENUMBER][1]
+            offset = struct.unpack(order + 'I', ifd[-4:])[0]
+    except (ValueError, struct.error):
+        return False
+
+    if totalpages and len(visited) < totalpages:
+        return False
+    if size - end > _TIFF_TRAILING_SLACK:
+        return False
+
+    return True
+
+
+def full_directory_import(directory_name, import_function, cache=None):
     """Using imgimport_intelligent(img_name)
     imports every image in the specified directory
     
@@ -60,6 +415,9 @@ def full_directory_import(directory_name, import_function):
       from which to open images
       
       * function with which to load the image
+
+      * cache: ShotCache instance, optional. If given, previously imported
+        images are taken from the cache.
       
     **Outputs**
       (imgs, fnames)
@@ -79,7 +437,11 @@ def full_directory_import(directory_name, import_function):
     print("Importing {0} image(s)...".format(len(fnames)))
     
     for fname in fnames:
-        im = import_function(fname)
+        if cache is not None:
+            key = cache.make_key(fname, import_function)
+            im = cache.cached_call(key, import_function, fname)
+        else:
+            im = import_function(fname)
         imgs.append(im)
     
     print("...done")
@@ -87,14 +449,16 @@ def full_directory_import(directory_name, import_function):
     return (imgs,fnames)
     
     
-def full_directory_imgimport_intelligent(directory_name):
+def full_directory_imgimport_intelligent(directory_name, cache=None):
     """Using imgimport_intelligent(img_name)
     imports every image in the specified directory
     
     **Inputs**
       * directory_name: string containing the directory 
       from which to open images
-      
+
+      * cache: ShotCache instance, optional. If given, previously imported
+        images are taken from the cache.
       
     **Outputs**
       (imgs, fnames)
@@ -104,7 +468,8 @@ def full_directory_imgimport_intelligent(directory_name):
       
       """
     
-    return full_directory_import(directory_name, imgimport_intelligent)
+    return full_directory_import(directory_name, imgimport_intelligent,
+                                 cache=cache)
 
 
 
@@ -143,13 +508,14 @@ def imgimport_intelligent(img_name):
 
     
     
-    imglist = list_of_frames(img_name)
+    # frames are only decoded when used, so junk frames are skipped
+    imglist = FrameStack(img_name)
 
     if len(imglist)==1:
         return imglist[0]
     elif len(imglist) in [3, 4]:
         # make an array from the list of frames, with shape (img[0], img[1], 3)
-        img_array = np.dstack(imglist)
+        img_array = np.asarray(imglist)
     elif len(imglist)==6:
         # get rid of first two frames, they're junk. then swap pwoa, pwa.
         img_array = np.dstack([imglist[3], imglist[2], imglist[5], imglist[4]])
@@ -260,6 +626,23 @@ def import_xcamera(img_name, ext='xraw'):
 
     """
 
+    rawnames = _xcamera_rawnames(img_name, ext=ext)
+    try:
+        pwa = np.loadtxt(rawnames[0], dtype=np.int16)
+        pwoa = np.loadtxt(rawnames[1], dtype=np.int16)
+        df = np.loadtxt(rawnames[2], dtype=np.int16)
+    except IOError, e:
+        print e
+        return None
+
+    raw_array = np.dstack([pwa, pwoa, df])
+
+    return raw_array
+
+
+def _xcamera_rawnames(img_name, ext='xraw'):
+    """Return the paths of the three raw files belonging to an XCamera image"""
+
     if ext=='xraw':
         rawext = ['.xraw0', '.xraw1', '.xraw2']
     elif ext=='xroi':
@@ -268,17 +651,8 @@ def import_xcamera(img_name, ext='xraw'):
         raise ValueError, 'Unknown extension for XCamera file'
 
     basename = os.path.splitext(img_name)[0]
-    try:
-        pwa = np.loadtxt(''.join([basename, rawext[0]]), dtype=np.int16)
-        pwoa = np.loadtxt(''.join([basename, rawext[1]]), dtype=np.int16)
-        df = np.loadtxt(''.join([basename, rawext[2]]), dtype=np.int16)
-    except IOError, e:
-        print e
-        return None
-
-    raw_array = np.dstack([pwa, pwoa, df])
 
-    return raw_array
+    return [''.join([basename, rawext_i]) for rawext_i in rawext]
 
 
 def save_tifimage(imgarray, fname, dirname=None):
@@ -412,8 +786,256 @@ def convert_xcamera_to_hdf5(imglist, ext='xraw'):
       * imglist: list of str, paths to .xraw0 files
       * ext: str, the extension of the XCamera file. Normally xraw or xroi.
 
+    **Notes**
+
+    For large numbers of files use batch_convert_xcamera, which converts in
+    parallel, verifies the result and can resume an interrupted conversion.
+
     """
 
     for img in imglist:
         imgarray = import_xcamera(img, ext=ext)
-        save_hdfimage(imgarray, img)
\ No newline at end of file
+        save_hdfimage(imgarray, img)
+
+
+def frames_checksum(imgarray):
+    """Return an md5 checksum of the raw frames in an image array
+
+    The checksum covers shape, dtype and pixel data of every frame, so it can
+    be used to verify that frames survived a conversion to another format.
+
+    **Inputs**
+
+      * imgarray: ndarray, 2D (single frame) or 3D (frames along last axis)
+
+    **Outputs**
+
+      * checksum: str, hexadecimal md5 digest
+
+    """
+
+    imgarray = np.asarray(imgarray)
+    if imgarray.ndim==2:
+        imgarray = imgarray[:, :, np.newaxis]
+
+    md5 = hashlib.md5()
+    md5.update(str(imgarray.shape))
+    md5.update(imgarray.dtype.str)
+    for i in xrange(imgarray.shape[2]):
+        md5.update(np.ascontiguousarray(imgarray[:, :, i]).tostring())
+
+    return md5.hexdigest()
+
+
+def read_conversion_manifest(manifest):
+    """Read the manifest of completed conversions
+
+    Each line of the manifest contains the checksum of the converted frames
+    and the absolute path of the source image, separated by two spaces (the
+    same layout md5sum uses).
+
+    **Inputs**
+
+      * manifest: str, path to the manifest file
+
+    **Outputs**
+
+      * done: dict, maps source image paths to frame checksums. Empty if the
+              manifest does not exist yet.
+
+    """
+
+    done = {}
+    try:
+        f = open(manifest, 'r')
+    except IOError:
+        return done
+    try:
+        for line in f:
+            line = line.rstrip('\n')
+            if not line:
+                continue
+            checksum, img = line.split('  ', 1)
+            done[img] = checksum
+    finally:
+        f.close()
+
+    return done
+
+
+def _convert_xcamera_worker(args):
+    """Load (and in per-shot mode save) a single XCamera image.
+
+    Runs in a worker process of batch_convert_xcamera, so it must be a
+    module-level function. Errors are returned instead of raised, a single
+    bad file should not stop the batch.
+
+    """
+
+    img, ext, archive_mode, verify = args
+    try:
+        nbytes = sum([os.path.getsize(rawname) for rawname in \
+                      _xcamera_rawnames(img, ext=ext)])
+        imgarray = import_xcamera(img, ext=ext)
+        if imgarray is None:
+            return img, None, 0, 'could not read raw files', None
+        checksum = frames_checksum(imgarray)
+        if archive_mode:
+            # the parent process owns the archive, hand the frames back
+            return img, checksum, nbytes, None, imgarray
+
+        save_hdfimage(imgarray, img)
+        if verify and frames_checksum(load_hdfimage(img)) != checksum:
+            return img, None, nbytes, 'checksum mismatch after writing', None
+        return img, checksum, nbytes, None, None
+    except Exception, e:
+        return img, None, 0, str(e), None
+
+
+def _archive_nodename(img):
+    """Turn an image path into a valid HDF5 group name for the run archive"""
+
+    name = os.path.splitext(os.path.split(img)[1])[0]
+    name = ''.join([c if (c.isalnum() or c=='_') else '_' for c in name])
+
+    return ''.join(['shot_', name])
+
+
+def _archive_shot(h5file, img, imgarray, verify=True):
+    """Write the frames of one shot into the run archive, return checksum"""
+
+    nodename = _archive_nodename(img)
+    try:
+        h5file.removeNode('/shots', nodename, recursive=True)
+    except tables.NoSuchNodeError:
+        pass
+    group = h5file.createGroup('/shots', nodename, img)
+    h5file.createArray(group, 'pwa', imgarray[:, :, 0], title='Probe with atoms')
+    h5file.createArray(group, 'pwoa', imgarray[:, :, 1],
+                       title='Probe without atoms')
+    h5file.createArray(group, 'df', imgarray[:, :, 2], title='Dark field')
+
+    if verify:
+        h5file.flush()
+        reloaded = np.dstack([np.asarray(group.pwa), np.asarray(group.pwoa),
+                              np.asarray(group.df)])
+        return frames_checksum(reloaded)
+    else:
+        return frames_checksum(imgarray)
+
+
+def batch_convert_xcamera(imglist, ext='xraw', archive=None, manifest=None,
+                          processes=None, verify=True, report=True):
+    """Convert many XCamera images to hdf5 in a pool of worker processes.
+
+    Unlike convert_xcamera_to_hdf5 a failing file does not stop the batch, and
+    the conversion can be resumed: every completed file is appended to a
+    manifest, and files listed in the manifest are skipped on the next run.
+    After writing, the frames are read back and their checksum is compared to
+    that of the frames that were loaded.
+
+    **Inputs**
+
+      * imglist: list of str, paths to .xraw0 files
+
+    **Outputs**
+
+      * stats: dict, with the number of files 'converted', 'skipped' and
+               'failed' (a list of (path, reason) tuples), the number of raw
+               input bytes processed ('nbytes'), the elapsed time in
+               'seconds' and the throughput in 'mbps' (MB/s) and 'fps'
+               (files/s).
+
+    **Optional inputs**
+
+      * ext: str, the extension of the XCamera file. Normally xraw or xroi.
+      * archive: str, path of a single hdf5 run archive. If given, every shot
+                 is stored as a group `/shots/shot_<name>` in this file instead
+                 of as a separate .h5 file next to the raw files.
+      * manifest: str, path of the manifest file. Defaults to the archive
+                  name with extension .manifest, or to `xcamera2hdf5.manifest`
+                  in the directory of the first image.
+      * processes: int, number of worker processes, default is the number of
+                   CPUs.
+      * verify: bool, if True read back the written frames and compare
+                checksums.
+      * report: bool, if True print progress and the final throughput.
+
+    """
+
+    if not tables.available():
+        raise ImportError, 'PyTables is needed to write hdf5 files'
+
+    imglist = [os.path.abspath(img) for img in imglist]
+    if manifest is None:
+        if archive is not None:
+            manifest = ''.join([os.path.splitext(archive)[0], '.manifest'])
+        elif imglist:
+            manifest = os.path.join(os.path.dirname(imglist[0]),
+                                    'xcamera2hdf5.manifest')
+        else:
+            manifest = 'xcamera2hdf5.manifest'
+
+    done = read_conversion_manifest(manifest)
+    todo = [img for img in imglist if img not in done]
+    stats = {'converted':0, 'skipped':len(imglist) - len(todo), 'failed':[],
+             'nbytes':0, 'seconds':0., 'mbps':0., 'fps':0.}
+    if report:
+        print 'Converting %s image(s), %s already done...'%(len(todo),
+                                                            stats['skipped'])
+    if not todo:
+        return stats
+
+    archive_mode = archive is not None
+    if archive_mode:
+        h5file = tables.openFile(archive, mode='a')
+        try:
+            h5file.getNode('/shots')
+        except tables.NoSuchNodeError:
+            h5file.createGroup('/', 'shots', 'Converted XCamera shots')
+    manifest_file = open(manifest, 'a')
+    pool = multiprocessing.Pool(processes)
+
+    t0 = time.time()
+    try:
+        jobs = [(img, ext, archive_mode, verify) for img in todo]
+        for img, checksum, nbytes, error, imgarray in \
+                pool.imap_unordered(_convert_xcamera_worker, jobs):
+            if error is None and archive_mode:
+                try:
+                    written = _archive_shot(h5file, img, imgarray, verify)
+                    if written != checksum:
+                        error = 'checksum mismatch after writing'
+                except Exception, e:
+                    error = str(e)
+            if error is not None:
+                stats['failed'].append((img, error))
+                if report:
+                    print 'Failed: %s (%s)'%(img, error)
+                continue
+
+            # record completion immediately so an interruption loses nothing
+            manifest_file.write('%s  %s\n'%(checksum, img))
+            manifest_file.flush()
+            stats['converted'] += 1
+            stats['nbytes'] += nbytes
+        pool.close()
+        pool.join()
+    finally:
+        pool.terminate()
+        manifest_file.close()
+        if archive_mode:
+            h5file.close()
+
+    stats['seconds'] = time.time() - t0
+    if stats['seconds'] > 0:
+        stats['mbps'] = stats['nbytes']*1e-6/stats['seconds']
+        stats['fps'] = stats['converted']/stats['seconds']
+    if report:
+        print '...done: %s converted, %s failed in %1.1f s '\
+              '(%1.2f MB/s, %1.2f files/s)'%(stats['converted'],
+                                            len(stats['failed']),
+                                            stats['seconds'], stats['mbps'],
+                                            stats['fps'])
+
+    return stats
@@ -13,9 +13,6 @@ import os
 import scipy as sp
 import scipy.ndimage as ndimage
 import numpy as np
-import Image
-import matplotlib as mpl
-import pylab
 
 
 def trans2od(transimg, maxod=3.5):
@@ -143,6 +140,257 @@ def threshold_image(img, thres=0.5, below=True):
     return thres_img
 
 
+def integral_image(img):
+    """Calculates the summed-area table of an image
+
+    With the summed-area table the sum over any rectangle of the image is
+    found from four of its elements, see roi_sum. Pixels that are not finite
+    count as zero.
+
+    **Inputs**
+
+      * img: 2D array, containing the image
+
+    **Outputs**
+
+      * sat: 2D float64 array of shape (M+1, N+1) for an image of shape
+             (M, N), sat[i, j] is the sum of img[:i, :j].
+
+    """
+
+    img = np.asarray(img)
+    sat = np.zeros((img.shape[0] + 1, img.shape[1] + 1), dtype=np.float64)
+    np.cumsum(np.where(np.isfinite(img), img, 0), axis=0, out=sat[1:, 1:])
+    np.cumsum(sat[1:, 1:], axis=1, out=sat[1:, 1:])
+
+    return sat
+
+
+def _clip_roi(sat, roi):
+    """Return the ROI [x0, x1, y0, y1] clipped to the image of sat"""
+
+    ymax, xmax = sat.shape[0] - 1, sat.shape[1] - 1
+    if roi is None:
+        return 0, xmax, 0, ymax
+    x0, x1 = [min(max(int(x), 0), xmax) for x in roi[:2]]
+    y0, y1 = [min(max(int(y), 0), ymax) for y in roi[2:4]]
+
+    return x0, max(x0, x1), y0, max(y0, y1)
+
+
+def roi_sum(sat, roi=None):
+    """Sum of the image within a ROI, from its summed-area table
+
+    **Inputs**
+
+      * sat: 2D array, the summed-area table of the image, see integral_image
+      * roi: sequence, [x0, x1, y0, y1], the ROI is img[y0:y1, x0:x1]. It is
+             clipped to the image. Default is the whole image.
+
+    **Outputs**
+
+      * total: float, the sum of the pixels within the ROI
+
+    """
+
+    x0, x1, y0, y1 = _clip_roi(sat, roi)
+
+    return sat[y1, x1] - sat[y0, x1] - sat[y1, x0] + sat[y0, x0]
+
+
+def roi_stats(sat, roi=None):
+    """Sum, mean and number of pixels of the image within a ROI
+
+    **Inputs**
+
+      * sat: 2D array, the summed-area table of the image, see integral_image
+      * roi: sequence, [x0, x1, y0, y1], see roi_sum
+
+    **Outputs**
+
+      * total: float, the sum of the pixels within the ROI
+      * mean: float, the mean of the pixels, NaN for an empty ROI
+      * npixels: int, the number of pixels within the ROI
+
+    """
+
+    x0, x1, y0, y1 = _clip_roi(sat, roi)
+    npixels = (x1 - x0)*(y1 - y0)
+    total = roi_sum(sat, (x0, x1, y0, y1))
+    if npixels:
+        mean = total/npixels
+    else:
+        mean = np.nan
+
+    return total, mean, npixels
+
+
+def atom_number(odsum, pixcal, wavelength=671e-9):
+    """Number of atoms from a sum over pixels of the optical density
+
+    Uses the resonant cross section 3*wavelength**2/(2*pi).
+
+    **Inputs**
+
+      * odsum: float, sum of the OD over the pixels, see roi_sum
+      * pixcal: float, pixel size calibration in m/pix
+      * wavelength: float, the wavelength of the imaging light in m
+
+    **Outputs**
+
+      * N: float, the number of atoms
+
+    """
+
+    sigma = 3*wavelength**2/(2*np.pi)
+
+    return odsum*pixcal**2/sigma
+
+
+class ImageHistogram(object):
+    """Fixed-bin histogram of an image, for fast percentiles
+
+    Percentiles are interpolated from the cumulative histogram. The bins
+    span a robust range estimated from a subsample of the pixels, so that a
+    few outliers do not make all bins wide; pixels outside the range are
+    only counted (`below` and `above`). If a precision is requested that the
+    bins do not have, the exact value is found by partitioning only the
+    pixels of one bin, or the few pixels outside the range.
+
+    """
+
+    def __init__(self, img, bins=1024, range=None, nsample=65536, tail=0.1):
+        """
+        **Inputs**
+
+          * img: array, the image. Pixels that are not finite are ignored.
+          * bins: int, number of bins
+          * range: tuple, (min, max) of the bins, default is the range
+                   between the `tail` and 100 - `tail` percentiles of a
+                   subsample of the finite pixels
+          * nsample: int, approximate number of pixels in the subsample
+          * tail: float, percentage of the subsample left out on each side
+                  of the default range
+
+        """
+
+        data = np.asarray(img).ravel()
+        finite = np.isfinite(data)
+        if not finite.all():
+            data = data[finite]
+        if range is None:
+            if data.size:
+                sample = data[::max(1, data.size // nsample)]
+                range = tuple(np.percentile(sample, [tail, 100 - tail]))
+            else:
+                range = (0., 1.)
+        range = (float(range[0]), float(range[1]))
+        if range[1] <= range[0]:
+            range = (range[0], range[0] + 1.)
+
+        self.counts, self.edges = np.histogram(data, bins=bins, range=range)
+        self.below = int(np.count_nonzero(data < range[0]))
+        self.above = int(np.count_nonzero(data > range[1]))
+        # number of pixels up to and including each bin
+        self.cdf = self.below + np.cumsum(self.counts)
+        self.npixels = int(self.cdf[-1]) + self.above
+
+
+    def binwidth(self):
+        return self.edges[1] - self.edges[0]
+
+
+    def _bin_of_rank(self, rank):
+        """Index of the bin that holds the pixel of rank (0 is the lowest)
+
+        -1 stands for the pixels below the range, len(counts) for those
+        above it.
+
+        """
+
+        if rank < self.below:
+            return -1
+        return np.searchsorted(self.cdf, rank, side='right')
+
+
+    def resolves(self, q, precision):
+        """True if the bins give the q-th percentile within `precision`"""
+
+        rank = q/100.*(self.npixels - 1)
+        return self.below <= np.floor(rank) and \
+               np.ceil(rank) < self.cdf[-1] and self.binwidth() <= precision
+
+
+    def _exact_at_rank(self, rank, img):
+        """The pixel value of rank in the sorted img, from a single bin"""
+
+        idx = self._bin_of_rank(rank)
+        data = np.asarray(img).ravel()
+        if idx < 0:
+            inbin = data < self.edges[0]
+            below = 0
+        elif idx == len(self.counts):
+            inbin = data > self.edges[-1]
+            below = self.cdf[-1]
+        else:
+            if idx == len(self.counts) - 1:
+                inbin = (data >= self.edges[idx]) & \
+                        (data <= self.edges[idx + 1])
+            else:
+                inbin = (data >= self.edges[idx]) & (data < self.edges[idx + 1])
+            below = self.cdf[idx - 1] if idx > 0 else self.below
+        binvals = data[inbin]
+        kth = min(max(rank - below, 0), binvals.size - 1)
+
+        return np.partition(binvals, kth)[kth]
+
+
+    def percentile(self, q, img=None, precision=None):
+        """Return the q-th percentile of the pixel values
+
+        Like scipy.stats.scoreatpercentile, the value is interpolated between
+        the two pixels closest to the requested rank. Without the exact
+        value, percentiles of pixels outside the range of the bins are
+        clipped to the range.
+
+        **Inputs**
+
+          * q: float, percentile between 0 and 100
+          * img: array, the image the histogram was made of, needed to get
+                 the exact value
+          * precision: float, if the bins do not resolve the percentile to
+                       this precision and img is given, the exact value is
+                       returned
+
+        **Outputs**
+
+          * value: float
+
+        """
+
+        if not self.npixels:
+            return np.nan
+        rank = q/100.*(self.npixels - 1)
+        lo, hi = int(np.floor(rank)), int(np.ceil(rank))
+
+        if img is not None and precision is not None and \
+           not self.resolves(q, precision):
+            vlo = self._exact_at_rank(lo, img)
+            vhi = vlo if hi == lo else self._exact_at_rank(hi, img)
+            return vlo + (vhi - vlo)*(rank - lo)
+
+        idx = self._bin_of_rank(rank)
+        if idx < 0:
+            return self.edges[0]
+        elif idx == len(self.counts):
+            return self.edges[-1]
+        # assume the pixels are spread evenly within the bin
+        below = self.cdf[idx - 1] if idx > 0 else self.below
+        frac = (rank - below + 0.5)/self.counts[idx]
+
+        return self.edges[idx] + min(max(frac, 0.), 1.)*self.binwidth()
+
+
 def find_fitrange(od_prof, od_max=1, min_cutoff=8):
     """Select a suitable range of radii to use for fitting the image.
 
@@ -172,7 +420,7 @@ def find_fitrange(od_prof, od_max=1, min_cutoff=8):
     """
     try:
         od_new = smooth(od_prof, window_len=15)
-        cutoff = mpl.mlab.find(od_new<od_max).min()
+        cutoff = np.flatnonzero(od_new<od_max).min()
     except ValueError:
         # no values below the cutoff
         cutoff = min_cutoff
@@ -319,10 +567,12 @@ def radialprofile_errors(odprofiles, angles, od_prof, od_cutoff, \
         print 'rms error is ', av_err
 
     if showfig:
+        # only needed for plotting, importing pylab is slow and needs a GUI
+        import pylab
         # angular plot of errors, red for positive, blue for negative values
         pylab.figure()
-        poserr = pylab.find(err>0)
-        negerr = pylab.find(err<0)
+        poserr = np.flatnonzero(err>0)
+        negerr = np.flatnonzero(err<0)
 
         pylab.polar(angles[negerr], np.abs(err[negerr]), 'ko', \
                     angles[poserr], np.abs(err[poserr]), 'wo')
@@ -0,0 +1,338 @@
+#!/usr/bin/env python
+"""Import of raw image files, without any GUI dependencies.
+
+The import settings for each number of frames are held by a FrameSetting,
+they determine which frames are the probe with and without atoms and the
+dark fields, how images taken in kinetics mode are split into strips, and
+optionally a custom function to calculate the transmission image.
+
+Import settings can be saved to and loaded from a profile, an ini-style
+text file, see save_profile and load_profile. The dialog to edit the
+settings is in importsettings.py.
+
+"""
+
+import ast
+import ConfigParser
+
+import numpy as np
+
+import imageio
+import imageprocess
+
+
+def _construct_custom_func(rawinput):
+    """Create the function as given by the user."""
+    funcstr = ("def imgfunc(pwa, pwoa, df1, df2, frames):\n%s\nreturn result"\
+               %rawinput).replace('\n', '\n    ')
+
+    return funcstr
+
+
+def _compile_custom_func(rawinput):
+    """Compile the function given by the user and return it."""
+    code = compile(_construct_custom_func(rawinput),
+                   '<custom import function>', 'exec')
+    namespace = {}
+    # like the formerly exec'd code, the function sees this module's globals
+    exec code in globals(), namespace
+
+    return namespace['imgfunc']
+
+
+class FrameSetting():
+    """Class to hold all import settings for a given number of frames."""
+
+    def __init__(self, pwa=0, pwoa=1, df1=2, df2=2, kinetics=False,
+                 lineshift=256, strips_per_frame=3,
+                 orientation='V', startat='BR'):
+        self.pwa = pwa
+        self.pwoa = pwoa
+        self.df1 = df1
+        self.df2 = df2
+        self.kinetics = kinetics
+        self.lineshift = lineshift
+        self.strips_per_frame = strips_per_frame
+        self.orientation = orientation
+        self.startat = startat
+        self.text = ''
+        self.usetext = False
+        # (text, function) of the last compiled custom function
+        self._compiled = (None, None)
+
+
+    def custom_func(self):
+        """Return the custom import function, compiling it only if the text
+        changed since the last call.
+
+        The function is called as ``imgfunc(pwa, pwoa, df1, df2, frames)``
+        and has to return the transmission image. It should be written with
+        array operations only, then it can also be called with stacks of
+        shots, arrays of shape (nshots, M, N), see process_import_batch.
+
+        """
+
+        text, func = getattr(self, '_compiled', (None, None))
+        if func is None or text != self.text:
+            func = _compile_custom_func(self.text)
+            self._compiled = (self.text, func)
+
+        return func
+
+
+_1frame = FrameSetting(kinetics=True)
+_2frame = FrameSetting(kinetics=True)
+_3frame = FrameSetting()
+_4frame = FrameSetting(df2=3)
+_6frame = FrameSetting(pwa=3, pwoa=2, df1=5, df2=4)
+
+image_import_dict = dict({'1':_1frame, '2':_2frame, '3':_3frame, '4':_4frame,
+                          '6':_6frame})
+
+
+_PROFILE_FIELDS = [('pwa', int), ('pwoa', int), ('df1', int), ('df2', int),
+                   ('kinetics', bool), ('lineshift', int),
+                   ('strips_per_frame', int), ('orientation', str),
+                   ('startat', str), ('usetext', bool), ('text', str)]
+
+
+def save_profile(fname, dct=image_import_dict):
+    """Save import settings to a profile
+
+    **Inputs**
+
+      * fname: str, path of the profile file
+      * dct: dict, the FrameSetting for each number of frames
+
+    """
+
+    config = ConfigParser.RawConfigParser()
+    for nframes in sorted(dct.keys(), key=int):
+        section = 'frames %s'%nframes
+        config.add_section(section)
+        for name, conv in _PROFILE_FIELDS:
+            value = getattr(dct[nframes], name)
+            if name == 'text':
+                # keep the indentation of the custom function
+                value = repr(str(value))
+            config.set(section, name, value)
+
+    f = open(fname, 'w')
+    try:
+        config.write(f)
+    finally:
+        f.close()
+
+
+def load_profile(fname):
+    """Load import settings from a profile
+
+    Settings that are missing in the profile keep their default values.
+
+    **Inputs**
+
+      * fname: str, path of the profile file, see save_profile
+
+    **Outputs**
+
+      * dct: dict, the FrameSetting for each number of frames
+
+    """
+
+    config = ConfigParser.RawConfigParser()
+    if not config.read(fname):
+        raise IOError, 'Cannot read import profile %s'%fname
+
+    dct = {}
+    for section in config.sections():
+        if not section.startswith('frames '):
+            continue
+        fsett = FrameSetting()
+        for name, conv in _PROFILE_FIELDS:
+            if not config.has_option(section, name):
+                continue
+            if conv is bool:
+                value = config.getboolean(section, name)
+            elif name == 'text':
+                value = ast.literal_eval(config.get(section, name))
+            else:
+                value = conv(config.get(section, name))
+            setattr(fsett, name, value)
+        dct[section.split()[1]] = fsett
+
+    return dct
+
+
+def process_import(fname, dct=image_import_dict, cache=None):
+    """Import an image file with the settings for its number of frames
+
+    Only the frames that are needed for the transmission image (pwa, pwoa,
+    df1 and df2 of the FrameSetting, all frames for a custom function) are
+    decoded. The other raw frames are decoded when they are accessed, for
+    example when they are displayed.
+
+    **Inputs**
+
+      * fname: str, path to the image file
+      * dct: dict, the FrameSetting for each number of frames
+      * cache: ShotCache instance, if given the result is looked up in the
+               cache first and stored in it after processing.
+
+    **Outputs**
+
+      * rawframes: LazyStack, the raw frames (the strips in kinetics mode).
+                   Can be indexed like a 3D array, `rawframes[:, :, k]`, and
+                   np.asarray(rawframes) gives the full array.
+      * transimg: 2D array, the transmission image
+      * odimg: 2D array, the optical density image
+
+    """
+
+    stack = imageio.FrameStack(fname)
+    fsett = dct[str(len(stack))]
+    rawframes = _raw_stack(stack, fsett)
+
+    if cache is not None:
+        key = cache.make_key(fname, 'process_import', dct)
+        cached = cache.get_arrays(key)
+        if cached is not None:
+            return rawframes, cached['transimg'], cached['odimg']
+
+    transimg, odimg = _calc_images(rawframes, fsett)
+    if cache is not None:
+        cache.put_arrays(key, transimg=transimg, odimg=odimg)
+
+    return rawframes, transimg, odimg
+
+
+def process_import_batch(fnames, dct=image_import_dict, cache=None):
+    """Import a batch of image files, processing all shots in one call
+
+    Shots with the same number and shape of frames are stacked, and the
+    default treatment or the custom import function is applied once to
+    arrays of shape (nshots, M, N). The per-shot overhead is then only the
+    decoding of the frames. A file that can not be imported does not stop
+    the others, its error is returned instead.
+
+    **Inputs**
+
+      * fnames: list of str, paths to the image files
+      * dct: dict, the FrameSetting for each number of frames
+      * cache: ShotCache instance, shots found in the cache are not
+               processed again, see process_import
+
+    **Outputs**
+
+      * rawframes: list of LazyStack, the raw frames of each shot
+      * transimgs: list of 2D arrays, the transmission images
+      * odimgs: list of 2D arrays, the optical density images
+      * errors: list of str, the reason a shot could not be imported, None
+                for the shots that were imported
+
+    """
+
+    nshots = len(fnames)
+    rawframes, transimgs, odimgs, errors = [[None]*nshots for i in range(4)]
+    keys = [None] * nshots
+    groups = {}
+    for i, fname in enumerate(fnames):
+        try:
+            stack = imageio.FrameStack(fname)
+            fsett = dct[str(len(stack))]
+        except (IOError, KeyError, ImportError), e:
+            errors[i] = str(e)
+            continue
+        rawframes[i] = _raw_stack(stack, fsett)
+        if cache is not None:
+            keys[i] = cache.make_key(fname, 'process_import', dct)
+            cached = cache.get_arrays(keys[i])
+            if cached is not None:
+                transimgs[i], odimgs[i] = cached['transimg'], cached['odimg']
+                continue
+        groups.setdefault((len(stack), rawframes[i].shape), []).append(i)
+
+    for (nframes, shape), idx in groups.iteritems():
+        fsett = dct[str(nframes)]
+        try:
+            images = _calc_batch([rawframes[i] for i in idx], fsett)
+        except Exception:
+            # find the shots that fail, like a truncated file
+            images = []
+            for i in idx:
+                try:
+                    images.append(_calc_images(rawframes[i], fsett))
+                except Exception, e:
+                    errors[i] = str(e)
+                    images.append((None, None))
+        for i, (transimg, odimg) in zip(idx, images):
+            transimgs[i], odimgs[i] = transimg, odimg
+            if keys[i] is not None and transimg is not None:
+                cache.put_arrays(keys[i], transimg=transimg, odimg=odimg)
+
+    return rawframes, transimgs, odimgs, errors
+
+
+def _calc_batch(stacks, fsett):
+    """Calculate the images of several shots with equally shaped frames"""
+
+    shape = stacks[0].shape
+    def getframe(k):
+        return np.array([stack[k] for stack in stacks])
+    batch = imageio.LazyStack(getframe, shape[2], (len(stacks), ) + shape[:2])
+    transimg, odimg = _calc_images(batch, fsett)
+
+    return [(transimg[j], odimg[j]) for j in xrange(len(stacks))]
+
+
+def _raw_stack(stack, fsett):
+    """Return the stack of frames, or of strips if kinetics mode is set"""
+
+    if not fsett.kinetics:
+        return stack
+
+    nstrips = fsett.strips_per_frame
+    def getstrip(k):
+        # the strips are views, so splitting a frame again costs nothing
+        strips = imageio.kinetics_strips(stack[k // nstrips], fsett.lineshift,
+                                         nstrips, orientation=fsett.orientation,
+                                         startat=fsett.startat)
+        return strips[k % nstrips]
+
+    if fsett.orientation == 'V':
+        stripshape = (fsett.lineshift, stack.shape[1])
+    else:
+        stripshape = (stack.shape[0], fsett.lineshift)
+
+    return imageio.LazyStack(getstrip, len(stack)*nstrips, stripshape,
+                             sources=[stack])
+
+
+def _calc_images(imglist, fsett):
+    """Calculate transmission and OD image from the (lazy) frames"""
+
+    pwa, pwoa, df1, df2 = fsett.pwa, fsett.pwoa, fsett.df1, fsett.df2
+    if not fsett.usetext:
+        transimg, odimg = default_calc_transimg(imglist[pwa], imglist[pwoa],
+                                                imglist[df1], imglist[df2])
+    else:
+        imgfunc = fsett.custom_func()
+        transimg = imgfunc(imglist[pwa], imglist[pwoa],
+                           imglist[df1], imglist[df2], imglist)
+        odimg = imageprocess.trans2od(transimg)
+
+    return transimg, odimg
+
+
+def default_calc_transimg(pwa, pwoa, df1, df2):
+    """The default treatment to obtain a transmission image."""
+
+    nom = pwa - df1
+    den = pwoa - df2
+    nom = np.where(nom<1, 1, nom)
+    den = np.where(den<1, 1, den)
+
+    transimg = nom.astype(float)/den
+    odimg = -np.log(transimg)
+
+    return transimg, odimg
+
@@ -3,16 +3,17 @@ from PyQt4.QtCore import *
 from PyQt4.QtGui import *
 
 import numpy as np
-import scipy as sp
-import scipy.stats
 import matplotlib as mpl
-from pylab import show, close
+from pylab import show
 from matplotlib.backends.backend_qt4agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt4agg import NavigationToolbar2QT
 from matplotlib.backend_bases import FigureCanvasBase
 from matplotlib.figure import Figure
 
 from guihelpfuncs import coldict
+import guiresources
+import imageprocess
+import thumbnails
 
 
 class Cursors:
@@ -29,8 +30,8 @@ class MyQTToolbar(NavigationToolbar2QT):
     """
 
     def _icon(self, name):
-        if name.startswith(':/'):
-            return QIcon(name)
+        if guiresources.is_resource(name):
+            return guiresources.icon(name)
         else:
             return QIcon(os.path.join(self.basedir, name))
 
@@ -57,6 +58,8 @@ class MyQTToolbar(NavigationToolbar2QT):
              ':/default_viewlimits.svg', self.setlims_0_135, False),
             ('5/95', 'Adjust contrast to 5/95', ':/five_ninetyfive.svg',
              self.setlims_5_95, False),
+            ('Auto 5/95', 'Adjust contrast of every new image to 5/95',
+             ':/five_ninetyfive.svg', self.set_autoscale, True),
             ('set colormap lims', 'Set colormap limits',
              ':/viewlimits_popup.svg', self.setlims_withdialog, False))
 
@@ -184,6 +187,12 @@ class MyQTToolbar(NavigationToolbar2QT):
             except OverflowError:
                 pass
 
+        # live statistics of the ROI that is being dragged
+        if self._active in ['Analysis ROI', 'Ncount ROI'] and self._xypress \
+           and isinstance(self.canvas, SingleImageCanvas):
+            roi = self._roi_from_press(self._xypress[0], event.x, event.y)
+            self.canvas.showRoiStats(roi)
+
 
     def adjust_width(self):
         """Change the maximum width of the toolbar if canvas size changes"""
@@ -238,6 +247,64 @@ class MyQTToolbar(NavigationToolbar2QT):
                                       a.transData.frozen()))
 
 
+    def _roi_from_press(self, xypress, x, y):
+        """Return the ROI [x0, x1, y0, y1] spanned from the press to x, y
+
+        x and y are display coordinates, the ROI is clipped to the axes.
+
+        """
+
+        lastx, lasty, a, ind, lim, trans = xypress
+
+        # get ROI coordinates
+        inverse = a.transData.inverted()
+        lastx, lasty = inverse.transform_point( (lastx, lasty) )
+        x, y = inverse.transform_point( (x, y) )
+        Xmin, Xmax = a.get_xlim()
+        Ymin, Ymax = a.get_ylim()
+
+        # put coordinates in the correct order
+        if Xmin < Xmax:
+            if x < lastx:
+                x0, x1 = x, lastx
+            else:
+                x0, x1 = lastx, x
+            if x0 < Xmin:
+                x0 = Xmin
+            if x1 > Xmax:
+                x1 = Xmax
+        else:
+            if x > lastx:
+                x0, x1 = x, lastx
+            else:
+                x0, x1 = lastx, x
+            if x0 > Xmin:
+                x0 = Xmin
+            if x1 < Xmax:
+                x1 = Xmax
+
+        if Ymin < Ymax:
+            if y < lasty:
+                y0, y1 = y, lasty
+            else:
+                y0, y1 = lasty, y
+            if y0 < Ymin:
+                y0 = Ymin
+            if y1 > Ymax:
+                y1 = Ymax
+        else:
+            if y > lasty:
+                y0, y1 = y, lasty
+            else:
+                y0, y1 = lasty, y
+            if y0 > Ymin:
+                y0 = Ymin
+            if y1 < Ymax:
+                y1=Ymax
+
+        return np.array([x0, x1, y1, y0], dtype=np.int32)
+
+
     def release_roi(self, event):
         """The release mouse button in set ROI mode callback"""
         if not self._xypress:
@@ -245,7 +312,7 @@ class MyQTToolbar(NavigationToolbar2QT):
 
         for cur_xypress in self._xypress:
             x, y = event.x, event.y
-            lastx, lasty, a, ind, lim, trans = cur_xypress
+            lastx, lasty = cur_xypress[:2]
 
             # ignore singular clicks; 5 pixels is a threshold
             if abs(x - lastx) < 5 or abs(y - lasty) < 5:
@@ -253,53 +320,7 @@ class MyQTToolbar(NavigationToolbar2QT):
                 self.draw()
                 return
 
-            # get ROI coordinates
-            inverse = a.transData.inverted()
-            lastx, lasty = inverse.transform_point( (lastx, lasty) )
-            x, y = inverse.transform_point( (x, y) )
-            Xmin, Xmax = a.get_xlim()
-            Ymin, Ymax = a.get_ylim()
-
-            # put coordinates in the correct order
-            if Xmin < Xmax:
-                if x < lastx:
-                    x0, x1 = x, lastx
-                else:
-                    x0, x1 = lastx, x
-                if x0 < Xmin:
-                    x0 = Xmin
-                if x1 > Xmax:
-                    x1 = Xmax
-            else:
-                if x > lastx:
-                    x0, x1 = x, lastx
-                else:
-                    x0, x1 = lastx, x
-                if x0 > Xmin:
-                    x0 = Xmin
-                if x1 < Xmax:
-                    x1 = Xmax
-
-            if Ymin < Ymax:
-                if y < lasty:
-                    y0, y1 = y, lasty
-                else:
-                    y0, y1 = lasty, y
-                if y0 < Ymin:
-                    y0 = Ymin
-                if y1 > Ymax:
-                    y1 = Ymax
-            else:
-                if y > lasty:
-                    y0, y1 = y, lasty
-                else:
-                    y0, y1 = lasty, y
-                if y0 > Ymin:
-                    y0 = Ymin
-                if y1 < Ymax:
-                    y1=Ymax
-
-            roi = np.array([x0, x1, y1, y0], dtype=np.int32)
+            roi = self._roi_from_press(cur_xypress, x, y)
             if self._active == 'Analysis ROI':
                 self.canvas.rois['analysis'] = roi
                 self.canvas.drawROI('analysis')
@@ -327,17 +348,24 @@ class MyQTToolbar(NavigationToolbar2QT):
             self.canvas.set_viewlimits(0, 1.35)
         else:
             self.canvas.set_viewlimits(None, None)
-        self.canvas.draw()
+        self.canvas.blit_update()
+        self.canvas.showHistogram()
 
 
     def setlims_5_95(self):
         """Set the colormap limits to 5/95th percentiles."""
 
-        displayed_img = self.canvas.img[:, :, self.canvas.rawdata_index].flat
-        vmin = sp.stats.scoreatpercentile(displayed_img, 5)
-        vmax = sp.stats.scoreatpercentile(displayed_img, 95)
-        self.canvas.set_viewlimits(vmin, vmax)
-        self.canvas.draw()
+        self.canvas.set_viewlimits(*self.canvas.percentile_limits(5, 95))
+        self.canvas.blit_update()
+        self.canvas.showHistogram()
+
+
+    def set_autoscale(self):
+        """Toggle 5/95 colormap limits for every new image"""
+
+        self.canvas.autoscale = self.actions['Auto 5/95'].isChecked()
+        if self.canvas.autoscale:
+            self.setlims_5_95()
 
 
     def setlims_withdialog(self):
@@ -351,7 +379,8 @@ class MyQTToolbar(NavigationToolbar2QT):
                                                1.35, vmin, 2147483647, 2)
             if success:
                 self.canvas.set_viewlimits(vmin, vmax)
-                self.canvas.draw()
+                self.canvas.blit_update()
+                self.canvas.showHistogram()
 
 
 class MyMplCanvas(FigureCanvas):
@@ -417,7 +446,15 @@ class MyMplCanvas(FigureCanvas):
 
 
 class SingleImageCanvas(MyMplCanvas):
-    """Holds a single absorption image in an MPL figure."""
+    """Holds a single absorption image in an MPL figure.
+
+    The image, ROIs and marker are animated artists: a full draw only renders
+    the axes background, which is cached, and updates are blitted on top of
+    it. imshow is given a downsampled level of the displayed frame that
+    matches the widget size and zoom, the extent stays in the coordinates of
+    the full-resolution image.
+
+    """
 
     def __init__(self, parent=None, img=np.ones((576, 384, 4))*1.2, \
         width=1.5, aspect=576/384.):
@@ -427,33 +464,193 @@ class SingleImageCanvas(MyMplCanvas):
         self.cmap = mpl.cm.gray  # holds the current colormap
         self.hsizelims = (200, 800)
         self.vsizelims = (200, 600)
+        # the displayed frame and its downsampled levels, see pyramid_level
+        self._pyramid = (None, None, {})
+        self._level = 0
+        # the axes without the animated artists, cached after each full draw
+        self._background = None
+        # histogram of the displayed frame, if the image does not have one
+        self._histogram = (None, None, None)
+        # if True, colormap limits are set to 5/95 for every new image
+        self.autoscale = False
 
         super(SingleImageCanvas, self).__init__(parent, img=img, width=width)
         self.resize(img.shape[1], img.shape[0])
+        self.mpl_connect('draw_event', self._on_draw)
 
 
     def init_figure(self, vmin=0, vmax=1.35):
         """Generate a single image object and ROIs, markers, etc"""
 
-        rawimage = self.img[:, :, self.rawdata_index]
+        imshape = self.img.shape
+        self._level = self.choose_level(imshape[1], imshape[0])
+        rawimage = self.pyramid_level(self._level)
         if self.rawdata_index==0:
             self.imobject = self.ax.imshow(rawimage, cmap=self.cmap,
                                            vmin=vmin, vmax=vmax,
-                                           interpolation='nearest')
+                                           interpolation='nearest',
+                                           extent=self._level_extent(),
+                                           animated=True)
         else:
             self.imobject = self.ax.imshow(rawimage, cmap=self.cmap,
-                                           interpolation='nearest')
+                                           interpolation='nearest',
+                                           extent=self._level_extent(),
+                                           animated=True)
+        self.ax.set_xlim(-0.5, imshape[1] - 0.5)
+        self.ax.set_ylim(imshape[0] - 0.5, -0.5)
         self.ax.set_xticks([])
         self.ax.set_yticks([])
 
 
+    def pyramid_level(self, level):
+        """Return the displayed frame downsampled by a factor 2**level
+
+        Levels are computed from the full-resolution frame when first needed
+        and kept until the frame or shot changes.
+
+        """
+
+        img, index, levels = self._pyramid
+        if img is not self.img or index != self.rawdata_index:
+            levels = {0:self.img[:, :, self.rawdata_index]}
+            self._pyramid = (self.img, self.rawdata_index, levels)
+        if level not in levels:
+            shape = levels[0].shape
+            levels[level] = thumbnails.downsample(levels[0],
+                                                  (shape[0] >> level,
+                                                   shape[1] >> level))
+        return levels[level]
+
+
+    def choose_level(self, xspan=None, yspan=None):
+        """Return the coarsest level with at least one pixel per screen pixel
+
+        xspan and yspan are the number of image pixels in view, by default
+        taken from the current axes limits.
+
+        """
+
+        if xspan is None:
+            xspan = abs(np.diff(self.ax.get_xlim())[0])
+        if yspan is None:
+            yspan = abs(np.diff(self.ax.get_ylim())[0])
+        bbox = self.ax.bbox
+        scale = min(xspan/max(bbox.width, 1), yspan/max(bbox.height, 1))
+        # do not go below 16 pixels along the shortest axis
+        maxlevel = int(np.log2(max(min(self.img.shape[:2]) // 16, 1)))
+        level = 0
+        while level < maxlevel and 2**(level + 1) <= scale:
+            level += 1
+        return level
+
+
+    def _level_extent(self):
+        """Extent of the current level in full-resolution image coordinates"""
+
+        factor = 2**self._level
+        rows, cols = self.pyramid_level(self._level).shape
+        return (-0.5, cols*factor - 0.5, rows*factor - 0.5, -0.5)
+
+
+    def _show_level(self, level):
+        """Let imshow display the given level of the current frame"""
+
+        self._level = level
+        self.imobject.set_array(self.pyramid_level(level))
+        self.imobject.set_extent(self._level_extent())
+
+
+    def _animated_artists(self):
+        artists = [self.imobject]
+        artists.extend([box for box in self.roiboxes.values() if box])
+        if self.markerlines:
+            artists.extend(self.markerlines)
+        return artists
+
+
+    def _on_draw(self, event):
+        """After a full draw, cache the background and draw the image on it"""
+
+        level = self.choose_level()
+        if level != self._level:
+            self._show_level(level)
+        self._background = self.copy_from_bbox(self.ax.bbox)
+        for artist in self._animated_artists():
+            artist.draw(event.renderer)
+
+
+    def blit_update(self):
+        """Redraws image, ROIs and marker on top of the cached background"""
+
+        if self._background is None:
+            self.draw()
+            return
+        self.restore_region(self._background)
+        for artist in self._animated_artists():
+            self.ax.draw_artist(artist)
+        self.blit(self.ax.bbox)
+
+
     def update_img(self):
         """Redraws the image, but leaves zoom, cursor etc unchanged."""
 
-        self.imobject.set_array(self.img[:, :, self.rawdata_index])
         if not self.img.shape==self.imgsize:
             self.shapechange()
-        self.fig.canvas.draw()
+            if self.autoscale:
+                self.set_viewlimits(*self.percentile_limits(5, 95))
+            self.fig.canvas.draw()
+        else:
+            self._show_level(self.choose_level())
+            if self.autoscale:
+                self.set_viewlimits(*self.percentile_limits(5, 95))
+            self.blit_update()
+        self.showHistogram()
+
+
+    def frameHistogram(self):
+        """Return the ImageHistogram of the displayed frame
+
+        Shots from a ShotStore keep their histograms, for other images it is
+        computed once per frame.
+
+        """
+
+        if hasattr(self.img, 'histogram'):
+            return self.img.histogram(self.rawdata_index)
+        img, index, hist = self._histogram
+        if img is not self.img or index != self.rawdata_index:
+            hist = imageprocess.ImageHistogram(
+                self.img[:, :, self.rawdata_index])
+            self._histogram = (self.img, self.rawdata_index, hist)
+        return hist
+
+
+    def percentile_limits(self, low=5, high=95):
+        """Return the low and high percentiles of the displayed frame
+
+        They are taken from the histogram, the pixels are only looked at
+        again if the bins do not resolve one step of the colormap.
+
+        """
+
+        hist = self.frameHistogram()
+        vmin, vmax = hist.percentile(low), hist.percentile(high)
+        precision = (vmax - vmin)/self.cmap.N
+        if not (hist.resolves(low, precision) and \
+                hist.resolves(high, precision)):
+            frame = self.img[:, :, self.rawdata_index]
+            vmin = hist.percentile(low, frame, precision)
+            vmax = hist.percentile(high, frame, precision)
+
+        return vmin, vmax
+
+
+    def showHistogram(self):
+        """Emits the histogram of the displayed frame and colormap limits"""
+
+        norm = self.imobject.norm
+        self.emit(SIGNAL("HistogramChange"), self.frameHistogram(),
+                  norm.vmin, norm.vmax)
 
 
     def set_viewlimits(self, vmin, vmax):
@@ -468,7 +665,7 @@ class SingleImageCanvas(MyMplCanvas):
 
         self.cmap = self.colmaps[cmap]
         self.imobject.set_cmap(self.cmap)
-        self.figure.canvas.draw()
+        self.blit_update()
 
 
     def shapechange(self):
@@ -558,11 +755,12 @@ class SingleImageCanvas(MyMplCanvas):
                                         (roi[1], roi[3]),
                                         (roi[0], roi[3])),
                                        ec=self.roicols[roi_id], fc='none',
-                                       lw=0.5)
+                                       lw=0.5, animated=True)
             self.ax.add_patch(poly)
             self.roiboxes[roi_id] = poly
 
-            self.fig.canvas.draw()
+            self.blit_update()
+            self.emit(SIGNAL("RoiChange"), roi_id)
 
 
     def clearROI(self, roi_id):
@@ -573,8 +771,22 @@ class SingleImageCanvas(MyMplCanvas):
                 self.roiboxes[roi_id].remove()
                 self.roiboxes[roi_id] = None
 
-                self.fig.canvas.draw()
+                self.blit_update()
                 self.rois[roi_id] = None
+                self.emit(SIGNAL("RoiChange"), roi_id)
+
+
+    def showRoiStats(self, roi):
+        """Emits the OD sum, mean OD and number of pixels within roi
+
+        Uses the summed-area table of the OD of the shot, if it has one.
+
+        """
+
+        odsat = getattr(self.img, 'odsat', None)
+        if odsat is not None:
+            total, mean, npixels = imageprocess.roi_stats(odsat, roi)
+            self.emit(SIGNAL("RoiStats"), roi, total, mean, npixels)
 
 
     def drawMarker(self, col=coldict['lightblue']):
@@ -591,12 +803,12 @@ class SingleImageCanvas(MyMplCanvas):
                 marker_vline.set_xdata(np.ones(vpoints)*xx)
             else:
                 self.ax.hold(True)
-                marker_hline = self.ax.axhline(yy, color=col)
-                marker_vline = self.ax.axvline(xx, color=col)
+                marker_hline = self.ax.axhline(yy, color=col, animated=True)
+                marker_vline = self.ax.axvline(xx, color=col, animated=True)
                 self.ax.hold(False)
                 self.markerlines = [marker_hline, marker_vline]
 
-            self.fig.canvas.draw()
+            self.blit_update()
 
             msg = '(X, Y)=(%s, %s) ;  I=%1.2f'\
                 %(xx, yy, self.img[yy, xx, self.rawdata_index])
@@ -612,7 +824,7 @@ class SingleImageCanvas(MyMplCanvas):
                 line.remove()
             self.markerlines = None
 
-        self.fig.canvas.draw()
+        self.blit_update()
         self.emit(SIGNAL("MarkerPixval"), "")
 
 
@@ -709,6 +921,48 @@ class InfoPlotCanvas(MyMplCanvas):
         self.ax.set_ylabel(r'$OD$')
 
 
+class HistogramCanvas(MyMplCanvas):
+    """Displays the histogram of the current image and the colormap limits"""
+
+    def __init__(self, parent=None, figsize=(4, 1.2), dpi=100):
+        """figsize is in inches"""
+
+        self.fig = Figure(figsize=figsize, dpi=dpi)
+        self.fig.subplots_adjust(left=0.02, right=0.98, bottom=0.2, top=0.95)
+        self.ax = self.fig.add_subplot(111)
+        self.ax.hold(False)
+
+        FigureCanvas.__init__(self, self.fig)
+        self.setParent(parent)
+        FigureCanvas.setSizePolicy(self, \
+                    QSizePolicy.Preferred, QSizePolicy.Fixed)
+        FigureCanvas.updateGeometry(self)
+        self.setMinimumSize(150, 60)
+        self.setMaximumSize(400, 120)
+
+
+    def sizeHint(self):
+        w, h = self.get_width_height()
+        return QSize(w, h)
+
+
+    def update_histogram(self, hist, vmin=None, vmax=None):
+        """Plot an ImageHistogram, with lines at the colormap limits"""
+
+        centers = 0.5*(hist.edges[1:] + hist.edges[:-1])
+        # empty bins at the lower level of the log scale
+        self.ax.semilogy(centers, np.maximum(hist.counts, 0.5), 'k-',
+                         drawstyle='steps-mid', lw=0.5)
+        self.ax.set_ylim(ymin=0.5)
+        self.ax.set_yticks([])
+        self.ax.hold(True)
+        for lim in [vmin, vmax]:
+            if lim is not None:
+                self.ax.axvline(lim, color=coldict['blue'], lw=0.5)
+        self.ax.hold(False)
+        self.draw()
+
+
 class PngWidget(QWidget):
     """The widget for the image history"""
 
@@ -719,8 +973,11 @@ class PngWidget(QWidget):
         self.imgpath = pngimg
         self.datapath = datapath
         self.index = int(gridindex)
+        # selected with ctrl+click, for sequence plugins
+        self.selected = False
         self.img = QLabel()
-        self.img.setPixmap(QPixmap(pngimg))
+        self.img.setLineWidth(3)
+        self.img.setPixmap(guiresources.pixmap(pngimg))
         self.ncount = QLabel()
         if ncount:
             self.ncount.setText('N = %1.1fk'%(ncount*1e-3))
@@ -742,14 +999,28 @@ class PngWidget(QWidget):
         if pngimg:
             imgname = os.path.split(pngimg)[1][:-4]
             self.img.setToolTip(imgname)
-            self.img.setPixmap(QPixmap(pngimg))
+            self.img.setPixmap(guiresources.pixmap(pngimg))
             self.ncount.setText('N = %1.2fm'%(ncount*1e-6))
 
 
+    def setSelected(self, selected):
+        self.selected = selected
+        if selected:
+            self.img.setFrameStyle(QFrame.Box | QFrame.Plain)
+        else:
+            self.img.setFrameStyle(QFrame.NoFrame)
+
+
     def mousePressEvent(self,event):
-        """Left-click loads image in rawImage, right-click does plugins"""
+        """Left-click loads image in rawImage, ctrl+left-click selects it,
+        right-click does plugins"""
 
         pngdir, imgname = os.path.split(self.imgpath)
+        # catch ctrl+left click on non-blank images
+        if event.button()==1 and event.modifiers() & Qt.ControlModifier:
+            if not imgname=='blankimg.png':
+                self.emit(SIGNAL("toggleSelection"), self.datapath)
+            return
         # catch left click on non-blank images
         if event.button()==1 and not imgname=='blankimg.png':
             self.emit(SIGNAL("updateAbsImage"), self.index)
@@ -788,28 +1059,12 @@ def save_png(img, path, fname, hsize=1.5, vmin=0., vmax=1.35):
         # if png directory already exists, do nothing
         pass
 
-    aspect = float(img.shape[0])/img.shape[1]
-    mpl.pyplot.rc('figure.subplot', left=1e-3)
-    mpl.pyplot.rc('figure.subplot', bottom=1e-3)
-    mpl.pyplot.rc('figure.subplot', right=1-1e-3)
-    mpl.pyplot.rc('figure.subplot', top=1-1e-3)
-
-    maxvsize = 2.2
-    if aspect < maxvsize:
-        fig = Figure(figsize=(hsize, hsize*aspect))
-    else:
-        fig = Figure(figsize=(maxvsize/aspect, maxvsize))
-    canvas = FigureCanvas(fig)
-
-    ax = fig.add_subplot(111)
-    ax.imshow(img, cmap=mpl.cm.gray, vmin=vmin, vmax=vmax)
-    ax.set_xticks([])
-    ax.set_yticks([])
-
     fname = os.path.splitext(fname)[0] + '.png'
     pngpath = os.path.join(pngdir, fname)
-    fig.savefig(pngpath)
-    close(fig)
+    # hsize is in inches, at 100 dpi
+    thumbnails.render_thumbnail(img, pngpath, vmin=vmin, vmax=vmax,
+                                width=int(round(hsize*100)), maxheight=220,
+                                maxaspect=2.2)
 
     return pngpath
 
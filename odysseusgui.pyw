@@ -9,10 +9,15 @@
 import sys
 import os
 import time
+import copy
+import collections
+import Queue
 import platform
 import glob
+import shutil
 import cgitb # html formatting of tracebacks
 import webbrowser
+import ConfigParser
 
 import numpy as np
 import matplotlib as mpl
@@ -20,13 +25,18 @@ from PyQt4.QtCore import *
 from PyQt4.QtGui import *
 
 import dirmonitor
-from imageprocess import calc_absimage
+from imageprocess import calc_absimage, integral_image, roi_sum, atom_number
 import imageio
 import filetools
-from fitfermions import fit_img, find_ellipticity
-import qrcresources
+import guiresources
 import pluginmanager
+import importprocessing
 import importsettings
+import shotcache
+import shotstore
+import shotpipeline
+import fitexecutor
+import fitfuncs
 from mplwidgets import *
 from guihelpfuncs import *
 
@@ -35,36 +45,6 @@ __version__ = "0.6.0"
 cgitb.enable(display=0, logdir='logs', context=1)
 
 
-class Fitter(QThread):
-    """This class runs the fitting routines. This keeps the GUI responsive."""
-
-    def __init__(self, img, pixcal, parent=None):
-        super(Fitter, self).__init__(parent)
-        self.img = img
-        self.pixcal = pixcal
-        self.func = 'idealfermi'
-        self.check_ellipse = False
-
-
-    def run(self):
-        """Is called by QThread.start(), when returning stops complete thread"""
-
-        try:
-            if self.check_ellipse:
-                elliptic = (find_ellipticity(self.img), 0)
-            else:
-                elliptic = None
-
-            fitresult = fit_img(self.img, showfig=False, full_output='odysseus',
-                                fitfunc=self.func, elliptic=elliptic,
-                                pixcal=self.pixcal)
-            self.emit(SIGNAL("fitresult"), fitresult)
-
-        except ValueError:
-            failmsg = 'Fitting failed - is the analysis ROI set correctly?'
-            self.emit(SIGNAL("fitresult"), failmsg)
-
-
 class GuiFitfuncs(object):
     def __init__(self, com, numatoms, temp, cloudsize):
         """Create reference to gui info boxes, and fit function dict.
@@ -187,9 +167,38 @@ class CentralWidget(QWidget):
         # initialize data structures
         self.img_list = []
         self.ncount = []
+        # stored shots of the thumbnails, their summed-area tables of the OD
+        # are used to recount atoms when the ROI changes
+        self.pngshots = []
         self.pnglist = []
         self.datafilelist = []
-        self.importdict = importsettings.image_import_dict
+        # paths of the shots selected in the thumbnail grid
+        self.selected_shots = set()
+        self.importdict = importprocessing.image_import_dict
+        # processed shots, thumbnails and fits of previously seen files
+        self.cache = shotcache.ShotCache()
+        # compact storage of the shots in img_list and pngshots, spills to
+        # scratch files
+        self.shotstore = shotstore.ShotStore()
+        # time-sorted index of the monitored directory
+        self.dirindex = None
+        # new shots are processed in worker threads, see shot_ready
+        self.pipeline = shotpipeline.ShotPipeline(
+            [shotpipeline.Stage('load', self._load_shot, workers=2),
+             shotpipeline.Stage('absorb', self._absorb_shot),
+             shotpipeline.Stage('thumbnail', self._thumbnail_shot)],
+            publish=lambda shot: self.emit(SIGNAL("shotReady"), shot))
+        # (path, mtime, size) of the last submitted file
+        self.lastsubmitted = None
+        # (path, settings) of shots the pipeline had no room for yet
+        self.waitingshots = collections.deque()
+        # fits run in worker processes, results are collected by poll_fits
+        self.fitexecutor = fitexecutor.FitExecutor()
+        self.fitqueue = 0
+        # the last converged fit parameters, sent with every fit job
+        self.warmstart = fitfuncs.WarmStart()
+        self.fitTimer = QTimer(self)
+        self.fitTimer.start(100)
 
         self.pathLabel, pathLayout = create_labeledbox('Monitoring path:',
                                                        stretch=1)
@@ -229,6 +238,8 @@ class CentralWidget(QWidget):
         self.fitForceButton = QPushButton('Fit now')
         # the figure
         self.plotFigure = InfoPlotCanvas()
+        # histogram of the displayed frame, with the colormap limits
+        self.histogram = HistogramCanvas()
         toolbar2 = NavigationToolbar2QT(self.plotFigure, self)
 
         # infobox layouts
@@ -247,6 +258,7 @@ class CentralWidget(QWidget):
         infoLayout = QVBoxLayout()
         infoLayout.addWidget(self.plotFigure)
         infoLayout.addWidget(toolbar2)
+        infoLayout.addWidget(self.histogram)
 
         ctrlboxLayout = QVBoxLayout()
         ctrlboxLayout.addStretch()
@@ -323,8 +335,37 @@ class CentralWidget(QWidget):
         self.connect(self.cycleButton, SIGNAL("clicked()"), self.cycleImages)
         self.connect(self.fitForceButton, SIGNAL("clicked()"), self.fitImage)
         self.connect(self.absImage, SIGNAL("SizeChange"), self.update)
+        self.connect(self.absImage, SIGNAL("RoiChange"), self.recount_atoms)
+        self.connect(self.absImage, SIGNAL("RoiStats"), self.updateRoiStats)
+        self.connect(self.absImage, SIGNAL("HistogramChange"),
+                     self.histogram.update_histogram)
+        self.connect(self, SIGNAL("shotReady"), self.shot_ready)
+        self.connect(self.fitTimer, SIGNAL("timeout()"), self.poll_fits)
+        self.connect(self.fitTimer, SIGNAL("timeout()"), self.submit_waiting)
         for png in self.gridImages:
-            self.connect(png, SIGNAL("updateAbsImage"), self.updateAbsImage)
+            self._connect_thumbnail(png)
+
+
+    def _connect_thumbnail(self, png):
+        self.connect(png, SIGNAL("updateAbsImage"), self.updateAbsImage)
+        self.connect(png, SIGNAL("toggleSelection"), self.toggle_selection)
+
+
+    def toggle_selection(self, datapath):
+        """Select or deselect a shot in the thumbnail grid"""
+
+        if datapath in self.selected_shots:
+            self.selected_shots.remove(datapath)
+        else:
+            self.selected_shots.add(datapath)
+        self.update_thumbnails()
+
+
+    def selected_paths(self):
+        """Return the paths of the selected shots, oldest first"""
+
+        return [path for path in reversed(self.datafilelist) \
+                if path in self.selected_shots]
 
 
     def mouseMoveEvent(self, event):
@@ -339,7 +380,7 @@ class CentralWidget(QWidget):
             imgs_sorted = filetools.sort_files_by_date(path_or_list,
                                                        newestfirst=True)
         else:
-            imgs_sorted = filetools.get_files_in_dir(str(path_or_list))
+            imgs_sorted = self.index_dir(str(path_or_list)).newest(self.gridnum)
 
         # load as much images as fit in the GUI, if possible
         self.numload = min(self.gridnum, len(imgs_sorted))
@@ -358,56 +399,220 @@ class CentralWidget(QWidget):
             self.emit(SIGNAL("updateStatusBar"), msg)
 
 
+    def index_dir(self, path):
+        """Return the DirectoryIndex of path, scanning it only the first time"""
+
+        if self.dirindex is None or self.dirindex.dirname != path:
+            if self.dirindex is not None:
+                self.dirindex.save()
+            indexfile = os.path.join(path, 'png', 'dirindex.pkl')
+            self.dirindex = filetools.DirectoryIndex(path, indexfile=indexfile)
+
+        return self.dirindex
+
+
     def load_newimg(self, fpathname):
         """Loads new image from path"""
 
+        shot = shotpipeline.Shot(str(fpathname), None, self.shot_settings())
+        try:
+            self._load_shot(shot)
+        except ValueError, e:
+            self.emit(SIGNAL("updateStatusBar"), str(e))
+            return
+        self._absorb_shot(shot)
+        self._thumbnail_shot(shot)
+        self._add_shot(shot)
+
+
+    def submit_shot(self, fpathname):
+        """Process a new image in the background, see shot_ready"""
+
         fpathname = str(fpathname)  # convert QString to Python str if needed
-        file_ext = os.path.splitext(fpathname)[1]
+        try:
+            st = os.stat(fpathname)
+        except OSError:
+            return
+        # a file rewritten under the same name is a new shot
+        key = (fpathname, st.st_mtime, st.st_size)
+        if key == self.lastsubmitted:
+            return
+        self.lastsubmitted = key
+        self.waitingshots.append((fpathname, self.shot_settings()))
+        self.submit_waiting()
+
+
+    def submit_waiting(self):
+        """Hand waiting shots to the pipeline, without blocking the GUI
+
+        Shots that do not fit into the pipeline stay waiting, this is called
+        again by a timer.
+
+        """
+
+        if not self.waitingshots:
+            return
+        self.pipeline.start()
+        while self.waitingshots:
+            fpathname, settings = self.waitingshots[0]
+            try:
+                self.pipeline.submit(fpathname, block=False, **settings)
+            except Queue.Full:
+                return
+            self.waitingshots.popleft()
+
+
+    def shot_settings(self):
+        """Snapshot of the settings used to process a shot"""
+
+        rois = dict([(name, roi if roi is None else list(roi)) for name, roi \
+                     in self.absImage.rois.iteritems()])
+
+        # the import settings can be edited while the shot is processed
+        return dict(importdict=copy.deepcopy(self.importdict),
+                    pixcal=self.pixcal, rois=rois)
+
+
+    def _load_shot(self, shot):
+        """Pipeline stage, decode the image and calculate the transmission"""
+
+        file_ext = os.path.splitext(shot.fname)[1]
         if file_ext == '.TIF':
-            #rawdata = imageio.imgimport_intelligent(fpathname)
-            rawdata, transimg, odimg = importsettings.process_import(fpathname,
-                                                        dct=self.importdict)
+            shot.rawdata, shot.transimg, shot.odimg = \
+                    importprocessing.process_import(shot.fname,
+                                                    dct=shot.settings['importdict'],
+                                                    cache=self.cache)
         elif file_ext == '.xraw0':
-            rawdata = imageio.import_xcamera(fpathname)
+            shot.rawdata = imageio.import_xcamera(shot.fname)
+            shot.transimg, shot.odimg = calc_absimage(shot.rawdata)
         else:
-            msg = 'File does not have a valid extension'
-            self.emit(SIGNAL("updateStatusBar"), msg)
+            raise ValueError, 'File does not have a valid extension'
+
+
+    def _absorb_shot(self, shot):
+        """Pipeline stage, build the display stack and count the atoms"""
+
+        # indexed like the (M, N, nframes+1) stack of transmission image and
+        # raw frames, but with the raw frames kept at their native type
+        # the summed-area table is kept (and spilled) by the shot store
+        shot.img = self.shotstore.add(shot.rawdata, shot.transimg,
+                                      odsat=integral_image(shot.odimg))
+        # for colormap limits and the histogram widget of the transmission
+        # image, raw frames are only decoded when they are displayed
+        shot.img.histogram(0)
+
+        shot.ncount = self.calc_ncount(shot.img.odsat,
+                                       shot.settings['rois']['ncount'],
+                                       shot.settings['pixcal'])
+
+
+    def _thumbnail_shot(self, shot):
+        """Pipeline stage, save the png thumbnail"""
+
+        shot.pngname = self.thumbnail(shot.transimg, shot.fname,
+                                      shot.settings['importdict'])
 
-        if rawdata is not None:
-            #transimg, odimg = calc_absimage(rawdata)
-            pngname = save_png(transimg, *(os.path.split(fpathname)))
 
-            if len(self.img_list) == self.gridnum:
-                # remove last image from list if the list is full
-                self.img_list.pop()
-            if len(self.pnglist) == self.pngnum:
-                # remove last png thumbnail from list if it is full
-                self.ncount.pop()
-                self.pnglist.pop()
-                self.datafilelist.pop()
-
-            img = np.zeros((rawdata.shape[0], rawdata.shape[1],
-                            rawdata.shape[2]+1), dtype=np.float32)
-            img[:, :, 0] = transimg
-            img[:, :, 1:] = rawdata
-            self.img_list.insert(0, img)
-            roi = self.absImage.getImgROI('ncount')[1]
-            if roi is not None:
-                odimg = odimg[roi[2]:roi[3], roi[0]:roi[1]]
-            self.ncount.insert(0, self.calc_ncount(odimg))
-            self.pnglist.insert(0, pngname)
-            self.datafilelist.insert(0, fpathname)
-            self.numload = min(self.gridnum, len(self.img_list))
+    def shot_ready(self, shot):
+        """Show a shot that has been processed by the pipeline"""
+
+        if shot.error is not None:
+            self.emit(SIGNAL("updateStatusBar"), shot.error)
+            return
+
+        self._add_shot(shot)
+        self.emit(SIGNAL("updateStatusBar"),
+                  ''.join(['Latest image: ', shot.fname]))
+        # with autofit on, this submits a fit that supersedes older ones
+        self.display_imgs()
+
+
+    def _add_shot(self, shot):
+        """Add a processed shot to the image lists"""
+
+        dropped = []
+        if len(self.img_list) == self.gridnum:
+            # remove last image from list if the list is full
+            dropped.append(self.img_list.pop())
+        if len(self.pnglist) == self.pngnum:
+            # remove last png thumbnail from list if it is full
+            self.ncount.pop()
+            dropped.append(self.pngshots.pop())
+            self.pnglist.pop()
+            self.datafilelist.pop()
+
+        self.img_list.insert(0, shot.img)
+        self.ncount.insert(0, shot.ncount)
+        self.pngshots.insert(0, shot.img)
+        self.pnglist.insert(0, shot.pngname)
+        self.datafilelist.insert(0, shot.fname)
+        self.numload = min(self.gridnum, len(self.img_list))
+        # a shot is stored as long as it is displayed or has a thumbnail
+        for stored in dropped:
+            if stored not in self.img_list and stored not in self.pngshots:
+                self.shotstore.discard(stored)
+
+
+    def thumbnail(self, transimg, fpathname, importdict):
+        """Return the path of the png thumbnail, reusing a cached one"""
+
+        key = self.cache.make_key(fpathname, 'thumbnail', importdict)
+        cached_png = self.cache.get_file(key, '.png')
+        if cached_png is None:
+            pngname = save_png(transimg, *(os.path.split(fpathname)))
+            self.cache.put_file(key, pngname, '.png')
         else:
-            msg = "Warning: TIF image does not contain 3 frames"
-            self.emit(SIGNAL("updateStatusBar"), msg)
+            path, fname = os.path.split(fpathname)
+            pngdir = os.path.join(path, 'png')
+            pngname = os.path.join(pngdir,
+                                   ''.join([os.path.splitext(fname)[0], '.png']))
+            if not os.path.isfile(pngname):
+                try:
+                    os.mkdir(pngdir)
+                except OSError:
+                    # if png directory already exists, do nothing
+                    pass
+                shutil.copyfile(cached_png, pngname)
+
+        return pngname
 
 
-    def calc_ncount(self, odimg):
-        """Calculates the number of atoms in the image"""
+    def calc_ncount(self, odsat, roi=None, pixcal=None):
+        """Calculates the number of atoms within roi
 
-        sigma = 3*671e-9**2/(2*np.pi)
-        return odimg.sum() * self.pixcal**2/sigma
+        odsat is the summed-area table of the OD, see integral_image.
+
+        """
+
+        return self.odsum_to_ncount(roi_sum(odsat, roi), pixcal)
+
+
+    def odsum_to_ncount(self, odsum, pixcal=None):
+        """Converts a sum over OD pixels to a number of atoms"""
+
+        if pixcal is None:
+            pixcal = self.pixcal
+        return atom_number(odsum, pixcal)
+
+
+    def recount_atoms(self, roi_id):
+        """Recounts the atoms of all thumbnails when the ncount ROI changes"""
+
+        if roi_id != 'ncount':
+            return
+        roi = self.absImage.rois['ncount']
+        self.ncount = [self.calc_ncount(stored.odsat, roi) for stored \
+                       in self.pngshots]
+        self.update_thumbnails()
+
+
+    def updateRoiStats(self, roi, odsum, meanod, npixels):
+        """Shows the statistics of the ROI that is being dragged"""
+
+        msg = '(X; Y)=(%s:%s; %s:%s) ;  %s pixels, mean OD=%1.3f, N=%1.3g'\
+              %(roi[0], roi[1], roi[2], roi[3], npixels, meanod,
+                self.odsum_to_ncount(odsum))
+        self.absMarker.setText(msg)
 
 
     def display_imgs(self):
@@ -419,16 +624,25 @@ class CentralWidget(QWidget):
             self.absImage.update_img()
             if self.autoFit.isChecked():
                 self.fitImage()
+        self.update_thumbnails()
+
+
+    def update_thumbnails(self):
+        """Updates the grid of png thumbnails and their atom numbers"""
+
         try:
             # insert new PngWidget's to fill the grid
             while len(self.gridImages) < len(self.pnglist):
                 idx = len(self.gridImages)
                 self.gridImages.append(PngWidget(":/blankimg.png", None, 0,
                                                  gridindex=idx))
+                self._connect_thumbnail(self.gridImages[idx])
                 self.bottomLayout.addWidget(self.gridImages[idx])
             for i in range(self.pngnum):
                 self.gridImages[i].update(self.pnglist[i], self.datafilelist[i],
                                           self.ncount[i])
+                self.gridImages[i].setSelected(self.datafilelist[i] in \
+                                               self.selected_shots)
         except IndexError:
             # when there are no more images left to display, stop
             pass
@@ -488,36 +702,78 @@ class CentralWidget(QWidget):
 
 
     def fitImage(self):
-        """Takes care of fitting the current image and plotting the result"""
+        """Takes care of fitting the current image and plotting the result
 
-        self.fitForceButton.setText('Fitting...')
+        The fit runs in a worker process, a new fit cancels fits that were
+        submitted earlier and have not finished yet.
 
-        img, roi = self.absImage.getImgROI('analysis')
-        self.guifitfuncs.roi = roi
-        self.guifitfuncs.current_datafilename = self.absImage.datafilepath
-        self.fitobj = Fitter(img, self.pixcal)
-        self.connect(self.fitobj, SIGNAL("fitresult"), self.plotFitImage)
-        self.fitobj.check_ellipse = self.ellipseCalc.isChecked()
+        """
 
+        img, roi = self.absImage.getImgROI('analysis')
         func_idx = self.fitFunc.currentIndex()
-        self.guifitfuncs.current_func = self.guifitfuncs.funcs[func_idx]['func']
-        self.fitobj.func = self.guifitfuncs.funcs[func_idx]['name']
+        func = self.guifitfuncs.funcs[func_idx]['name']
+        check_ellipse = self.ellipseCalc.isChecked()
+        datafilename = self.absImage.datafilepath
+        cachekey = self.cache.make_key(str(datafilename), 'fit',
+                                       self.importdict, roi, func,
+                                       check_ellipse, self.pixcal)
+        context = (roi, datafilename, func_idx, cachekey)
+
+        fitresult = self.cache.get_result(cachekey)
+        if fitresult is not None:
+            self.plotFitImage(fitresult, context)
+            return
+
+        self.fitForceButton.setText('Fitting...')
+        # consecutive fits with the same ROI start from the previous result
+        warmkey = (roi and tuple(roi), func)
+        self.fitexecutor.submit(fitexecutor.fit_transimg,
+                                (img, func, check_ellipse, self.pixcal,
+                                 self.warmstart, warmkey),
+                                context=context)
+        self.poll_fits()
 
-        self.fitobj.start()
 
+    def poll_fits(self):
+        """Plot the results of finished fits, called by a timer"""
 
-    def plotFitImage(self, fitresults):
+        for job in self.fitexecutor.poll():
+            if job.error is not None:
+                self.plotFitImage(job.error, job.context)
+            else:
+                fitresult, nfev, warmstart = job.result
+                if warmstart is not None:
+                    self.warmstart.update(warmstart)
+                if not isinstance(fitresult, str):
+                    self.cache.put_result(job.context[3], fitresult)
+                self.plotFitImage(fitresult, job.context, nfev)
+
+        fitqueue = self.fitexecutor.pending()
+        if fitqueue != self.fitqueue:
+            self.fitqueue = fitqueue
+            self.emit(SIGNAL("updateFitQueue"), fitqueue)
+            if not fitqueue:
+                self.fitForceButton.setText('Fit now')
+
+
+    def plotFitImage(self, fitresults, context, nfev=None):
         """Plot the result of a fit after it has finished"""
 
+        roi, datafilename, func_idx, cachekey = context
         if isinstance(fitresults, str):
             # fit failed if fitresults is a string
             self.emit(SIGNAL("updateStatusBar"), fitresults)
         else:
-            self.emit(SIGNAL("updateStatusBar"), 'Fitting succeeded')
+            msg = 'Fitting succeeded'
+            if nfev is not None:
+                msg = '%s (%s function evaluations)'%(msg, nfev)
+            self.emit(SIGNAL("updateStatusBar"), msg)
+            self.guifitfuncs.roi = roi
+            self.guifitfuncs.current_datafilename = datafilename
+            self.guifitfuncs.current_func = \
+                    self.guifitfuncs.funcs[func_idx]['func']
             self.guifitfuncs.current_func(self.plotFigure, fitresults)
 
-        self.fitForceButton.setText('Fit now')
-
 
 class MainWindow(QMainWindow):
 
@@ -530,7 +786,7 @@ class MainWindow(QMainWindow):
         self.cwidget = CentralWidget()
         self.setCentralWidget(self.cwidget)
 
-        self.dirmonitor = dirmonitor.Walker(self.lock, self)
+        self.dirmonitor = dirmonitor.create_walker(self.lock, self)
         self.connect(self.dirmonitor, SIGNAL("changed"), self.changed)
 
         self.connect(self.cwidget.pathButton, SIGNAL("clicked()"), self.setPath)
@@ -549,6 +805,10 @@ class MainWindow(QMainWindow):
         self.progress.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
         self.progress.setMinimumWidth(125)
         self.status.addPermanentWidget(self.progress)
+        self.fitQueueLabel = QLabel()
+        self.status.addPermanentWidget(self.fitQueueLabel)
+        self.connect(self.cwidget, SIGNAL("updateFitQueue"),
+                     self.updateFitQueue)
         self.status.showMessage(\
             "Click the 'Set Path' button to start monitoring")
 
@@ -558,10 +818,12 @@ class MainWindow(QMainWindow):
         # restore state from previous session
         self._restore_state()
 
-        # import plugin scripts
+        # find plugin scripts, their code is only run when they are used
         plugindir = [os.path.join(sys.path[0], 'plugins')]
-        self.plugin_manager = pluginmanager.PluginManager(directories_list=plugindir,\
-                                            plugin_info_ext="odysseus-plugin")
+        self.plugin_manager = pluginmanager.IndexedPluginManager(\
+            categories_filter={"Default":pluginmanager.IPlugin,
+                               "Sequence":pluginmanager.SequencePlugin},
+            directories_list=plugindir, plugin_info_ext="odysseus-plugin")
         self.plugin_manager.collectPlugins()
         self.pluginwindowlist = []
 
@@ -648,13 +910,15 @@ class MainWindow(QMainWindow):
         except IndexError:
             pass
 
+        if self.cwidget.dirindex is not None:
+            for fname in fnames:
+                self.cwidget.dirindex.update(fname)
+
         try:
             self.updateProgressBar(0)
             if len(fnames) == 1:
-                self.cwidget.load_newimg(fnames[0])
-                self.cwidget.display_imgs()
-                self.status.showMessage(\
-                        ''.join(['Latest image: ', str(fnames[0])]))
+                # shown by CentralWidget.shot_ready when it is processed
+                self.cwidget.submit_shot(fnames[0])
                 self.updateProgressBar(9)
             else:
                 self.cwidget.load_imgs(self.path)
@@ -671,6 +935,15 @@ class MainWindow(QMainWindow):
         self.status.showMessage(msg)
 
 
+    def updateFitQueue(self, num):
+        """Shows the number of queued fits in the status bar"""
+
+        if num:
+            self.fitQueueLabel.setText('Fits queued: %s'%num)
+        else:
+            self.fitQueueLabel.clear()
+
+
     def updateProgressBar(self, val):
         """Updates the progress bar, val should be integer in range (0, 9)"""
 
@@ -725,6 +998,16 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event=None):
         self.dirmonitor.setStopped()
+        self.cwidget.pipeline.stop(timeout=5)
+        self.cwidget.fitexecutor.shutdown()
+        for window in self.pluginwindowlist:
+            # stop plugins still running in worker processes
+            job = getattr(window, 'job', None)
+            if job is not None:
+                job.cancel()
+        self.cwidget.shotstore.clear()
+        if self.cwidget.dirindex is not None:
+            self.cwidget.dirindex.save()
         self._save_state()
 
 
@@ -752,11 +1035,37 @@ class MainWindow(QMainWindow):
         self.importdialog.show()
 
 
+    def saveImportProfile(self):
+        """Save the image import settings, for example for batchanalysis.py"""
+
+        fname = QFileDialog.getSaveFileName(self, "Save import profile",
+                                            self.path,
+                                            "Import profiles (*.ini)")
+        if fname:
+            importprocessing.save_profile(str(fname), self.cwidget.importdict)
+
+
+    def loadImportProfile(self):
+        """Load image import settings saved with saveImportProfile"""
+
+        fname = QFileDialog.getOpenFileName(self, "Load import profile",
+                                            self.path,
+                                            "Import profiles (*.ini)")
+        if fname:
+            try:
+                profile = importprocessing.load_profile(str(fname))
+            except (IOError, ConfigParser.Error), e:
+                QMessageBox.warning(self, "Warning",
+                                    "Loading import profile failed: %s"%e)
+                return
+            self.cwidget.importdict.update(profile)
+
+
     def createAction(self, text, slot=None, shortcut=None, icon=None,
                      tip=None, checkable=False, signal="triggered()"):
         action = QAction(text, self)
         if icon is not None:
-            action.setIcon(QIcon(":/%s.png" % icon))
+            action.setIcon(guiresources.icon(":/%s.png" % icon))
         if shortcut is not None:
             action.setShortcut(shortcut)
         if tip is not None:
@@ -793,6 +1102,10 @@ class MainWindow(QMainWindow):
 
         showImportAction = self.createAction("Image import",
                                              self.showImportSettings)
+        saveProfileAction = self.createAction("Save import profile...",
+                                              self.saveImportProfile)
+        loadProfileAction = self.createAction("Load import profile...",
+                                              self.loadImportProfile)
 
         helpAboutAction = self.createAction("&About Odysseus",
                 self.helpAbout)
@@ -805,7 +1118,8 @@ class MainWindow(QMainWindow):
         self.addActions(fileMenu, (fileOpenAction, fileSaveAction, None,
                                    fileQuitAction))
         self.addActions(preferencesMenu, (setPixCalAction, None,
-                                          showImportAction))
+                                          showImportAction, saveProfileAction,
+                                          loadProfileAction))
         self.addActions(helpMenu, (openManualAction, None, helpAboutAction))
 
 
@@ -842,27 +1156,40 @@ class MainWindow(QMainWindow):
         for plugin in self.plugin_manager.getPluginsOfCategory('Default'):
             # plugin is a PluginInfo object
             contextMenu.addAction(plugin.name)
+        # sequence plugins run over the selected shots or a time range
+        sequenceActions = {}
+        sequencePlugins = self.plugin_manager.getPluginsOfCategory('Sequence')
+        if sequencePlugins:
+            contextMenu.addSeparator()
+            nselected = len(self.cwidget.selected_paths())
+            for plugin in sequencePlugins:
+                subMenu = contextMenu.addMenu(plugin.name)
+                action = subMenu.addAction('Selected shots (%s)'%nselected)
+                action.setEnabled(nselected > 0)
+                sequenceActions[action] = (plugin.name, 'selected')
+                action = subMenu.addAction('Shots in time range...')
+                action.setEnabled(self.cwidget.dirindex is not None)
+                sequenceActions[action] = (plugin.name, 'timerange')
         clickAction = contextMenu.exec_(QCursor.pos())
 
+        if clickAction in sequenceActions:
+            self.runSequencePlugin(*sequenceActions[clickAction])
         # respond to a context menu click
-        if clickAction:
+        elif clickAction:
             # save and reset rc params (so plugins can do whatever they want)
             currentparams = mpl.pyplot.rcParams.copy()
             mpl.pyplot.rcdefaults()
 
             # execute main() function of plugin
             plugin_name = clickAction.text()
-            plugin = self.plugin_manager.getPluginByName(plugin_name)
+            plugin = self._load_plugin(plugin_name, 'Default')
+            if plugin is None:
+                mpl.pyplot.rcParams.update(currentparams)
+                return
             plugin.plugin_object.imgpath = imgpath
             try:
-                roilist = self.cwidget.absImage.rois['analysis']
                 clicked_img = self.cwidget.img_list[imgnumber][:, :, 0]
-                if self.cwidget.absImage.roiboxes['analysis']:
-                    roislice = (slice(roilist[2], roilist[3]),
-                                slice(roilist[0], roilist[1]))
-                else:
-                    roislice = (slice(0, clicked_img.shape[0]),
-                                slice(0, clicked_img.shape[1]))
+                roislice = self._plugin_roi(clicked_img.shape)
                 allframes = self.cwidget.img_list[imgnumber]
                 # TODO: find a good way to pass more arguments to plugins.
                 #       maybe in a dict, so each plugin can use what it needs?
@@ -878,12 +1205,72 @@ class MainWindow(QMainWindow):
             mpl.pyplot.rcParams.update(currentparams)
 
 
+    def _load_plugin(self, plugin_name, category):
+        """Return the PluginInfo of a plugin, with its code loaded"""
+
+        plugin = self.plugin_manager.getPluginByName(plugin_name, category)
+        if plugin.plugin_object is None:
+            QMessageBox.warning(self, "Warning", "Loading plugin %s "
+                                "failed, see pluginlogger.log"%plugin_name)
+            return None
+        return plugin
+
+
+    def _plugin_roi(self, shape=None):
+        """Return the analysis ROI as a tuple of slices
+
+        Without an analysis ROI, the whole image is used; if `shape` is
+        None, the slices have no limits.
+
+        """
+
+        roilist = self.cwidget.absImage.rois['analysis']
+        if self.cwidget.absImage.roiboxes['analysis']:
+            return (slice(roilist[2], roilist[3]),
+                    slice(roilist[0], roilist[1]))
+        elif shape is None:
+            return (slice(None), slice(None))
+        else:
+            return (slice(0, shape[0]), slice(0, shape[1]))
+
+
+    def runSequencePlugin(self, plugin_name, shots):
+        """Run a sequence plugin over the selected shots or a time range"""
+
+        if shots == 'selected':
+            paths = self.cwidget.selected_paths()
+        else:
+            dirindex = self.cwidget.dirindex
+            newest = dirindex.newest(1)
+            tstop = dirindex.mtime(newest[0]) if newest else time.time()
+            dialog = TimeRangeDialog(tstop - 3600, tstop, self)
+            if not dialog.exec_():
+                return
+            tstart, tstop = dialog.times()
+            # the dialog has a resolution of seconds
+            paths = dirindex.between(tstart, tstop + 1)
+        if not paths:
+            self.status.showMessage("No shots to run %s on"%plugin_name)
+            return
+
+        plugin = self._load_plugin(plugin_name, 'Sequence')
+        if plugin is None:
+            return
+        try:
+            self.pluginwindowlist.append(plugin.plugin_object.create_window(\
+                    paths, self.cwidget.importdict, self._plugin_roi(),
+                    plugin_name))
+        except:
+            errordialog = MaxsizeDialog(cgitb.html(sys.exc_info()))
+            errordialog.exec_()
+
+
 def main():
     app = QApplication(sys.argv)
     app.setOrganizationName("Ketterle group, MIT")
     app.setOrganizationDomain("cua.mit.edu/ketterle_group/")
     app.setApplicationName("Odysseus")
-    app.setWindowIcon(QIcon(":/icon.png"))
+    app.setWindowIcon(guiresources.icon(":/icon.png"))
 
     form = MainWindow()
     form.show()
@@ -30,12 +30,17 @@ from PyQt4.QtGui import *
 from matplotlib.backends.backend_qt4agg import NavigationToolbar2QT
 
 from mplwidgets import BlankCanvas
+import pluginrunner
 
 
 # A forbiden string that can later be used to describe lists of
 # plugins for instance (see ``ConfigurablePluginManager``)
 PLUGIN_NAME_FORBIDEN_STRING=";;"
 
+# where IndexedPluginManager keeps its index of the installed plugins
+DEFAULT_INDEXFILE = os.path.join(os.path.expanduser('~'), '.odysseus',
+                                 'plugins.index')
+
 # prints all logged messages with level debug or higher
 logging.basicConfig(level=logging.DEBUG,
                     format='%(asctime)s %(levelname)s %(message)s',
@@ -138,6 +143,112 @@ class VerboseDialogPlugin(IPlugin):
         pass
 
 
+class ProcessDialogPlugin(IPlugin):
+    """Defines the interface for a plugin that computes in a worker process
+
+    The plugin implements `compute`, which runs in a separate process so
+    the GUI stays responsive, and `show_result`, which plots the result in
+    the dialog. `compute` should not use Qt, and its result has to be
+    picklable.
+
+    """
+
+    def create_window(self, rawframes, img, roi, name, path):
+        """Create the dialog and start the computation
+
+        **Inputs**
+
+          * rawframes: 3D array, the transmission image and the raw frames
+          * img: 2d-array, containing the image data
+          * roi: tuple of slices, contains two slice objects, one for each
+                 image axis. The tuple can be used as a 2D slice object.
+          * name: string, the name of the plugin
+          * path: string, the path of the image file
+
+        """
+
+        job = pluginrunner.PluginJob(self.__class__, rawframes, img, roi, path)
+        self.window = ProcessPluginDialog(name, job, self.show_result)
+        self.ax = self.window.ax
+        self.window.show()
+
+        return self.window
+
+
+    def compute(self, rawframes, img, roi, path, progress):
+        """This method is to be implemented by plugins, they do the work
+
+        It is called in a worker process. `progress(fraction, message)` can
+        be called to update the progress bar in the dialog, with fraction
+        between 0 and 1. The return value is passed to show_result.
+
+        """
+        pass
+
+
+    def show_result(self, result):
+        """This method is to be implemented by plugins, plots on self.ax"""
+        pass
+
+
+class SequencePlugin(IPlugin):
+    """Defines the interface for a plugin that analyzes a sequence of shots
+
+    The analysis is split in a per-shot `kernel`, which runs for many shots
+    in parallel in worker processes, and a reduction (`start` and `reduce`)
+    that combines the kernel results in the GUI, in the order of the shots.
+    `show_result` is called whenever new results have been reduced, so the
+    plot is updated while the shots are processed.
+
+    """
+
+    def create_window(self, paths, importdict, roi, name):
+        """Create the dialog and start processing the shots
+
+        **Inputs**
+
+          * paths: list of str, the image files of the shots
+          * importdict: dict, the import settings
+          * roi: tuple of slices, contains two slice objects, one for each
+                 image axis. The tuple can be used as a 2D slice object.
+          * name: string, the name of the plugin
+
+        """
+
+        job = pluginrunner.SequenceJob(self, paths, importdict, roi)
+        self.window = SequencePluginDialog(name, job, self.show_result)
+        self.ax = self.window.ax
+        self.window.show()
+
+        return self.window
+
+
+    def kernel(self, rawframes, img, roi, path):
+        """This method is to be implemented by plugins, called for each shot
+
+        It is called in a worker process with the raw frames and the
+        transmission image of a shot. The return value is passed to reduce,
+        so it has to be picklable.
+
+        """
+        pass
+
+
+    def start(self):
+        """Return the initial state of the reduction"""
+        return None
+
+
+    def reduce(self, state, path, result):
+        """Combine the kernel result of a shot with state, return new state"""
+        return state
+
+
+    def show_result(self, state):
+        """This method is to be implemented by plugins, plots on self.ax"""
+        pass
+
+
 class PluginDialog(QDialog):
     """Handles the window that plugins can pop up"""
 
@@ -156,6 +267,100 @@ class PluginDialog(QDialog):
         self.setLayout(layout)
 
 
+class ProcessPluginDialog(PluginDialog):
+    """A plugin window that shows the progress of a PluginJob
+
+    When the job is done, `show_result` is called with the result. Closing
+    the window cancels the job.
+
+    """
+
+    def __init__(self, name, job, show_result, parent=None):
+        super(ProcessPluginDialog, self).__init__(name, parent)
+        self.job = job
+        self.show_result = show_result
+
+        self.progressbar = QProgressBar()
+        self.progressbar.setRange(0, 100)
+        self.status = QLabel('Running')
+        self.cancelButton = QPushButton('Cancel')
+        progressLayout = QHBoxLayout()
+        progressLayout.addWidget(self.status)
+        progressLayout.addWidget(self.progressbar)
+        progressLayout.addWidget(self.cancelButton)
+        self.layout().insertLayout(0, progressLayout)
+
+        self.timer = QTimer(self)
+        self.connect(self.timer, SIGNAL("timeout()"), self.poll_job)
+        self.connect(self.cancelButton, SIGNAL("clicked()"), self.cancel_job)
+        self.timer.start(100)
+
+
+    def poll_job(self):
+        done = self.job.poll()
+        self.progressbar.setValue(int(self.job.progress*100))
+        if self.job.message:
+            self.status.setText(self.job.message)
+        if not done:
+            return
+
+        self.timer.stop()
+        self.cancelButton.setEnabled(False)
+        if self.job.cancelled:
+            self.status.setText('Cancelled')
+        elif self.job.error is not None:
+            self.status.setText('Failed')
+            logging.debug("Plugin failed: %s" %self.job.error)
+            QMessageBox.warning(self, "Warning", "The plugin failed:\n%s"\
+                                %self.job.error)
+        else:
+            self.progressbar.setValue(100)
+            self.status.setText('Done')
+            self.show_job_result()
+
+
+    def show_job_result(self):
+        self.show_result(self.job.result)
+        self.fig.draw()
+
+
+    def cancel_job(self):
+        self.job.cancel()
+        self.poll_job()
+
+
+    def closeEvent(self, event):
+        self.timer.stop()
+        self.job.cancel()
+        super(ProcessPluginDialog, self).closeEvent(event)
+
+
+class SequencePluginDialog(ProcessPluginDialog):
+    """A plugin window that follows a SequenceJob
+
+    The result is shown again every time new shots have been reduced.
+    Shots that failed are listed in the status and in the plugin log.
+
+    """
+
+    def poll_job(self):
+        ndone = self.job.ndone
+        super(SequencePluginDialog, self).poll_job()
+        if self.job.ndone > ndone and not self.job.done:
+            self.show_job_result()
+        if self.job.done and self.job.errors:
+            for path, error in self.job.errors:
+                logging.debug("Plugin failed for %s: %s" %(path, error))
+            self.status.setText('%s, %s of %s shots failed' \
+                                %(self.status.text(), len(self.job.errors),
+                                  len(self.job.paths)))
+
+
+    def show_job_result(self):
+        self.ax.cla()
+        super(SequencePluginDialog, self).show_job_result()
+
+
 class PluginInfo(object):
     """Gather some info about a plugin
 
@@ -441,52 +646,67 @@ class PluginManager(object):
             # user
             if callback is not None:
                 callback(plugin_info)
-            # now execute the file and get its content into a
-            # specific dictionnary
-            candidate_globals = {"__file__":candidate_filepath+".py"}
-            if "__init__" in  os.path.basename(candidate_filepath):
-                sys.path.append(plugin_info.path)
-            try:
-                execfile(candidate_filepath+".py",candidate_globals)
-            except Exception,e:
-                logging.debug("Unable to execute the code in plugin: %s" \
-                              %candidate_filepath)
-                logging.debug("\t The following problem occured: %s %s " \
-                              %(os.linesep, e))
-                if "__init__" in  os.path.basename(candidate_filepath):
-                    sys.path.remove(plugin_info.path)
-                continue
-
-            if "__init__" in  os.path.basename(candidate_filepath):
-                sys.path.remove(plugin_info.path)
-            # now try to find and initialise the first subclass of the correct
-            #plugin interface
-            for element in candidate_globals.values():
-                current_category = None
-                for category_name in self.categories_interfaces.keys():
-                    try:
-                        is_correct_subclass = issubclass(element, \
-                                                         self.categories_interfaces[category_name])
-                    except:
-                        continue
-                    if is_correct_subclass:
-                        if element is not self.categories_interfaces[category_name]:
-                            current_category = category_name
-                            break
-                if current_category is not None:
-                    if not (candidate_infofile in self._category_file_mapping[current_category]):
-                        # we found a new plugin: initialise it and search for the next one
-                        plugin_info.plugin_object = element()
-                        plugin_info.category = current_category
-                        self.category_mapping[current_category].append(plugin_info)
-                        self._category_file_mapping[current_category].append(candidate_infofile)
-                        current_category = None
-                    break
+            current_category, element = self._executePlugin(candidate_filepath,
+                                                             plugin_info)
+            if current_category is not None:
+                if not (candidate_infofile in self._category_file_mapping[current_category]):
+                    # we found a new plugin: initialise it
+                    plugin_info.plugin_object = element()
+                    plugin_info.category = current_category
+                    self.category_mapping[current_category].append(plugin_info)
+                    self._category_file_mapping[current_category].append(candidate_infofile)
 
         # Remove candidates list since we don't need them any more and
         # don't need to take up the space
         delattr(self, '_candidates')
 
+    def _executePlugin(self, candidate_filepath, plugin_info):
+        """Execute the code of a plugin and find its plugin class.
+
+        Return the category and the first subclass of that category's
+        interface defined by the plugin *in a tuple*, or ``(None, None)``
+        if the code could not be executed or defines no plugin class.
+        """
+        # now execute the file and get its content into a
+        # specific dictionnary
+        candidate_globals = {"__file__":candidate_filepath+".py"}
+        if "__init__" in  os.path.basename(candidate_filepath):
+            sys.path.append(plugin_info.path)
+        try:
+            execfile(candidate_filepath+".py",candidate_globals)
+        except Exception,e:
+            logging.debug("Unable to execute the code in plugin: %s" \
+                          %candidate_filepath)
+            logging.debug("\t The following problem occured: %s %s " \
+                          %(os.linesep, e))
+            return (None, None)
+        finally:
+            if "__init__" in  os.path.basename(candidate_filepath):
+                sys.path.remove(plugin_info.path)
+
+        # now try to find the first subclass of the correct plugin interface,
+        # skipping the interfaces defined here (DialogPlugin etc.)
+        for element in candidate_globals.values():
+            if getattr(element, '__module__', None) == __name__:
+                continue
+            matching = []
+            for category_name in self.categories_interfaces.keys():
+                try:
+                    is_correct_subclass = issubclass(element, \
+                                                     self.categories_interfaces[category_name])
+                except:
+                    continue
+                if is_correct_subclass:
+                    if element is not self.categories_interfaces[category_name]:
+                        matching.append(category_name)
+            if matching:
+                # the most derived interface wins, e.g. SequencePlugin
+                # over IPlugin
+                matching.sort(key=lambda category_name: \
+                    len(self.categories_interfaces[category_name].__mro__))
+                return (matching[-1], element)
+        return (None, None)
+
     def collectPlugins(self):
         """Walk through the plugins' places and look for plugins.
 
@@ -532,6 +752,262 @@ class PluginManager(object):
         return None
 
 
+class LazyPluginInfo(PluginInfo):
+    """Info about a plugin whose code is only executed when it is used.
+
+    The ``plugin_object`` is created by the plugin manager the first time
+    it is accessed.
+    """
+
+    def __init__(self, plugin_name, plugin_path):
+        PluginInfo.__init__(self, plugin_name, plugin_path)
+        # set by IndexedPluginManager, called as loader(plugin_info)
+        self.loader = None
+        self.infofile = None
+        self.filepath = None
+
+    def _getPluginObject(self):
+        if self._plugin_object is None and self.loader is not None:
+            self._plugin_object = self.loader(self)
+        return self._plugin_object
+
+    def _setPluginObject(self, plugin_object):
+        self._plugin_object = plugin_object
+    plugin_object = property(fget=_getPluginObject, fset=_setPluginObject)
+
+    def isLoaded(self):
+        """Return True if the code of the plugin has been executed."""
+        return self._plugin_object is not None
+
+
+class IndexedPluginManager(PluginManager):
+    """A plugin manager that keeps an index of the plugins on disk.
+
+    The index records for every plugin its info file, name, category,
+    documentation and the modification times of the info file and the
+    module. As long as none of these files and none of the plugin
+    directories changed, the plugins are taken from the index without
+    walking the directories or parsing the info files. Only plugins that
+    are new or changed are executed to find their category.
+
+    The code of a plugin is executed when its ``plugin_object`` is first
+    accessed, so starting up does not get slower with more plugins.
+    """
+
+    def __init__(self, categories_filter={"Default":IPlugin}, \
+                 directories_list=None, plugin_info_ext="yapsy-plugin",
+                 index_file=None):
+        """Initialize IndexedPluginManager.
+
+        ``index_file`` is the path of the index, default is
+        DEFAULT_INDEXFILE. The other arguments are as for PluginManager.
+        """
+        PluginManager.__init__(self, categories_filter, directories_list,
+                               plugin_info_ext)
+        self.setPluginInfoClass(LazyPluginInfo)
+        if index_file is None:
+            index_file = DEFAULT_INDEXFILE
+        self.index_file = index_file
+        # set by loadPlugins, True if the index had to be rewritten
+        self.index_refreshed = False
+
+    def _readIndex(self):
+        """Return the index as a ConfigParser, empty if it can't be read."""
+        index = ConfigParser.RawConfigParser()
+        try:
+            index.read(self.index_file)
+        except ConfigParser.Error:
+            logging.debug("Could not parse the plugin index %s" \
+                          %self.index_file)
+            index = ConfigParser.RawConfigParser()
+        # an index of other plugin places or categories is not used
+        try:
+            for option, value in self._indexHeader().items():
+                if index.get("Index", option) != value:
+                    return ConfigParser.RawConfigParser()
+        except ConfigParser.Error:
+            return ConfigParser.RawConfigParser()
+        return index
+
+    def _places(self):
+        return sorted(map(os.path.abspath, self.plugins_places))
+
+    def _indexHeader(self):
+        return {"extension":self.plugin_info_ext,
+                "places":repr(self._places()),
+                "categories":repr(sorted(self.categories_interfaces.keys()))}
+
+    def _indexIsCurrent(self, index):
+        """Check that no plugin directory or indexed file has changed."""
+        sections = index.sections()
+        if "Index" not in sections:
+            return False
+        try:
+            for section in sections:
+                if section.startswith("Directory "):
+                    if _mtime(section[10:]) != index.getfloat(section, "mtime"):
+                        return False
+                elif section.startswith("Plugin "):
+                    if _mtime(section[7:]) != index.getfloat(section, "infomtime") or \
+                       _mtime(index.get(section, "module")+".py") != \
+                       index.getfloat(section, "modulemtime"):
+                        return False
+                    for attr in ["name", "path", "category"] + _DOC_ATTRS:
+                        index.get(section, attr)
+        except (ConfigParser.Error, ValueError):
+            return False
+        return True
+
+    def _indexedPlugin(self, index, section):
+        """Return the LazyPluginInfo of an index section."""
+        plugin_info = self._plugin_info_cls(index.get(section, "name"),
+                                            index.get(section, "path"))
+        for attr in _DOC_ATTRS:
+            setattr(plugin_info, attr, index.get(section, attr))
+        plugin_info.infofile = section[7:]
+        plugin_info.filepath = index.get(section, "module")
+        plugin_info.category = index.get(section, "category")
+        return plugin_info
+
+    def locatePlugins(self):
+        """Find the plugins, from the index if it is still current.
+
+        Return the number of plugins found.
+        """
+        index = self._readIndex()
+        self.index_refreshed = not self._indexIsCurrent(index)
+        if not self.index_refreshed:
+            self._candidates = []
+            for section in index.sections():
+                if section.startswith("Plugin "):
+                    plugin_info = self._indexedPlugin(index, section)
+                    self._candidates.append((plugin_info.infofile,
+                                             plugin_info.filepath,
+                                             plugin_info))
+            return len(self._candidates)
+
+        PluginManager.locatePlugins(self)
+        # reuse the category of plugins whose files did not change
+        for candidate_infofile, candidate_filepath, plugin_info in \
+                self._candidates:
+            plugin_info.infofile = candidate_infofile
+            plugin_info.filepath = candidate_filepath
+            section = "Plugin %s" %candidate_infofile
+            if index.has_section(section) and \
+               _mtime(candidate_infofile) == index.getfloat(section, "infomtime") and \
+               _mtime(candidate_filepath+".py") == \
+               index.getfloat(section, "modulemtime"):
+                plugin_info.category = index.get(section, "category")
+        return len(self._candidates)
+
+    def loadPlugins(self, callback=None):
+        """Register the candidate plugins without executing their code.
+
+        Plugins with an unknown category are executed now to find it, and
+        the index is rewritten if it was not current.
+        """
+        if not hasattr(self, '_candidates'):
+            raise ValueError("locatePlugins must be called before loadPlugins")
+
+        # candidates without a plugin class, indexed with an empty category
+        self._failed_plugins = []
+        for candidate_infofile, candidate_filepath, plugin_info in self._candidates:
+            if plugin_info.category is None:
+                if callback is not None:
+                    callback(plugin_info)
+                category, element = self._executePlugin(candidate_filepath,
+                                                        plugin_info)
+                if category is None:
+                    plugin_info.category = ""
+                else:
+                    plugin_info.category = category
+                    plugin_info.plugin_object = element()
+            if plugin_info.category == "":
+                self._failed_plugins.append(plugin_info)
+                continue
+            if plugin_info.category not in self.category_mapping or \
+               candidate_infofile in self._category_file_mapping[plugin_info.category]:
+                continue
+            plugin_info.loader = self._loadPluginObject
+            self.category_mapping[plugin_info.category].append(plugin_info)
+            self._category_file_mapping[plugin_info.category].append(candidate_infofile)
+
+        if self.index_refreshed:
+            self.writeIndex()
+        delattr(self, '_candidates')
+
+    def _loadPluginObject(self, plugin_info):
+        """Execute the code of a plugin and create its plugin object."""
+        logging.debug("Loading plugin: %s" %plugin_info.name)
+        category, element = self._executePlugin(plugin_info.filepath,
+                                                plugin_info)
+        if category != plugin_info.category:
+            logging.debug("Plugin %s is not of category %s" \
+                          %(plugin_info.name, plugin_info.category))
+            return None
+        return element()
+
+    def writeIndex(self):
+        """Write the index of all plugins that have been found.
+
+        Candidates that could not be executed or define no plugin class are
+        written with an empty category. They are not executed again until
+        their info file or module changes.
+        """
+        index = ConfigParser.RawConfigParser()
+        index.add_section("Index")
+        for option, value in self._indexHeader().items():
+            index.set("Index", option, value)
+        for directory in self._places():
+            for dirpath, dirnames, filenames in os.walk(directory):
+                section = "Directory %s" %dirpath
+                index.add_section(section)
+                index.set(section, "mtime", repr(_mtime(dirpath)))
+        plugins = [(category, plugin_info) for category in \
+                   self.category_mapping for plugin_info in \
+                   self.category_mapping[category]]
+        plugins.extend([("", plugin_info) for plugin_info in \
+                        getattr(self, '_failed_plugins', [])])
+        for category, plugin_info in plugins:
+            section = "Plugin %s" %plugin_info.infofile
+            index.add_section(section)
+            index.set(section, "name", plugin_info.name)
+            index.set(section, "path", plugin_info.path)
+            index.set(section, "module", plugin_info.filepath)
+            index.set(section, "category", category)
+            for attr in _DOC_ATTRS:
+                index.set(section, attr, getattr(plugin_info, attr))
+            index.set(section, "infomtime",
+                      repr(_mtime(plugin_info.infofile)))
+            index.set(section, "modulemtime",
+                      repr(_mtime(plugin_info.filepath+".py")))
+
+        try:
+            indexdir = os.path.dirname(self.index_file)
+            if indexdir and not os.path.isdir(indexdir):
+                os.makedirs(indexdir)
+            f = open(self.index_file, 'w')
+            try:
+                index.write(f)
+            finally:
+                f.close()
+        except (IOError, OSError), e:
+            logging.debug("Could not write the plugin index %s: %s" \
+                          %(self.index_file, e))
+
+
+# the documentation of a plugin that is kept in the index
+_DOC_ATTRS = ["author", "version", "website", "copyright", "description"]
+
+
+def _mtime(path):
+    """Return the modification time of path, or -1 if it does not exist."""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return -1.
+
+
 class PluginManagerDecorator(object):
     """Make it possible to add several responsibilities to a plugin manager.
 
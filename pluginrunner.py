@@ -0,0 +1,387 @@
+#!/usr/bin/env python
+"""Runs the computation of a plugin in a separate process.
+
+A plugin that takes long (a 2D fit, a TeX report) would freeze the GUI if it
+ran in the GUI thread. A PluginJob runs the plugin's `compute` method in a
+worker process instead; the GUI polls the job and shows the result when it
+is done.
+
+The image and the raw frames are not pickled, they are written once to a
+memory-mapped file (in /dev/shm if available, so they stay in memory) that
+the worker maps read-only, with copy-on-write. Only the result is sent back
+through a queue, so it has to be picklable.
+
+The worker process is started for each job, so it can be cancelled
+together with the processes the plugin started, and a plugin that crashes
+the interpreter only ends its own process. Like FitExecutor, this module does not use Qt.
+
+A SequenceJob runs the `kernel` of a sequence plugin for many shots in a
+pool of worker processes. Each worker imports its shots from the image
+files. The per-shot results are passed to the plugin's `reduce` in the GUI
+process as they arrive, in the order of the shots.
+
+"""
+
+import os
+import sys
+import time
+import tempfile
+import threading
+import traceback
+import multiprocessing
+from Queue import Empty
+
+import numpy as np
+
+import importprocessing
+
+
+# shared memory on Linux, the memory-mapped files never touch the disk there
+if os.path.isdir('/dev/shm'):
+    SHM_DIR = '/dev/shm'
+else:
+    SHM_DIR = None
+
+
+class SharedArray(object):
+    """An array in a memory-mapped file that can be passed to a process
+
+    Only the path, dtype and shape are pickled, not the data.
+
+    """
+
+    def __init__(self, arr, tmpdir=SHM_DIR):
+        """Copy arr to a new memory-mapped file in tmpdir"""
+
+        arr = np.asarray(arr)
+        self.dtype = arr.dtype.str
+        self.shape = arr.shape
+        fd, self.path = tempfile.mkstemp(prefix='odysseus-', suffix='.shm',
+                                         dir=tmpdir)
+        os.close(fd)
+        if arr.size:
+            mapped = np.memmap(self.path, dtype=arr.dtype, mode='w+',
+                               shape=arr.shape)
+            mapped[...] = arr
+            mapped.flush()
+            del mapped
+
+
+    def attach(self):
+        """Return the array, changes to it are not written back"""
+
+        if not np.prod(self.shape):
+            return np.empty(self.shape, dtype=self.dtype)
+        return np.memmap(self.path, dtype=self.dtype, mode='c',
+                         shape=self.shape)
+
+
+    def release(self):
+        """Delete the file, after the worker is done with it"""
+
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+def plugin_file(plugin_cls, method='compute'):
+    """Return the file that defines a method of a plugin class
+
+    Plugins are executed by the plugin manager, not imported, so the file
+    is taken from the globals of the method.
+
+    """
+
+    return getattr(plugin_cls, method).im_func.func_globals['__file__']
+
+
+def use_agg():
+    """Make matplotlib draw to files only, a worker can't show windows
+
+    A forked worker inherits the figures of the GUI. Their Qt windows are
+    not usable in the worker, so the figures are forgotten, not closed,
+    before the backend is switched (switching closes all figures).
+
+    """
+
+    import matplotlib
+    from matplotlib import _pylab_helpers
+    _pylab_helpers.Gcf.figs.clear()
+    _pylab_helpers.Gcf._activeQue = []
+    matplotlib.use('Agg', warn=False, force=True)
+    if 'matplotlib.pyplot' in sys.modules:
+        # older matplotlib versions do not switch pyplot in use()
+        sys.modules['matplotlib.pyplot'].switch_backend('Agg')
+
+
+def _load_plugin(filepath, clsname):
+    """Execute a plugin file and return an instance of the plugin class"""
+
+    use_agg()
+    plugindir = os.path.dirname(filepath)
+    if plugindir not in sys.path:
+        sys.path.append(plugindir)
+    plugin_globals = {'__file__':filepath}
+    execfile(filepath, plugin_globals)
+
+    return plugin_globals[clsname]()
+
+
+def _stop_when_cancelled(cancel):
+    """Watcher thread of a worker, ends it and its processes on cancel"""
+
+    cancel.wait()
+    # the processes started by the plugin, like the pool of a report, would
+    # be orphaned by terminating the worker from outside
+    for child in multiprocessing.active_children():
+        child.terminate()
+    os._exit(1)
+
+
+def _run_plugin(filepath, clsname, frames, img, roi, path, queue, cancel):
+    """Run the compute method of a plugin, in the worker process"""
+
+    def progress(fraction, message=''):
+        queue.put(('progress', fraction, message))
+
+    watcher = threading.Thread(target=_stop_when_cancelled, args=(cancel, ))
+    watcher.daemon = True
+    watcher.start()
+    try:
+        plugin = _load_plugin(filepath, clsname)
+        result = plugin.compute(frames.attach(), img.attach(), roi, path,
+                                progress)
+        queue.put(('result', result))
+    except Exception:
+        queue.put(('error', traceback.format_exc()))
+
+
+class PluginJob(object):
+    """The computation of a plugin, running in a worker process."""
+
+    def __init__(self, plugin_cls, rawframes, img, roi, path=None,
+                 tmpdir=SHM_DIR):
+        """Start the worker process
+
+        **Inputs**
+
+          * plugin_cls: class, with a method
+                        compute(rawframes, img, roi, path, progress)
+          * rawframes: 3D array, the transmission image and the raw frames
+          * img: 2D array, the image the plugin was started for
+          * roi: tuple of slices, the analysis ROI
+          * path: str, the path of the image file
+          * tmpdir: str, directory of the memory-mapped files
+
+        """
+
+        self.progress = 0.
+        self.message = ''
+        self.result = None
+        # str, set if the plugin raised an exception or crashed
+        self.error = None
+        self.done = False
+        self.cancelled = False
+
+        self._shared = [SharedArray(rawframes, tmpdir=tmpdir),
+                        SharedArray(img, tmpdir=tmpdir)]
+        self._queue = multiprocessing.Queue()
+        self._cancel = multiprocessing.Event()
+        self._process = multiprocessing.Process(target=_run_plugin,
+            args=(plugin_file(plugin_cls), plugin_cls.__name__,
+                  self._shared[0], self._shared[1], roi, path, self._queue,
+                  self._cancel))
+        # not a daemon, so the plugin can start processes itself (texreport);
+        # the GUI cancels the jobs that are still running when it closes
+        self._process.start()
+
+
+    def _read_queue(self):
+        while not self.done:
+            try:
+                msg = self._queue.get_nowait()
+            except Empty:
+                return
+            if msg[0] == 'progress':
+                self.progress, self.message = msg[1:]
+            elif msg[0] == 'result':
+                self.result = msg[1]
+                self._finish()
+            else:
+                self.error = msg[1]
+                self._finish()
+
+
+    def poll(self):
+        """Read progress and results from the worker
+
+        **Outputs**
+
+          * done: bool, True if the job finished, failed or was cancelled
+
+        """
+
+        if self.done:
+            return True
+        self._read_queue()
+        if not self.done and not self._process.is_alive():
+            # a result may have arrived just before the process ended
+            self._read_queue()
+            if not self.done:
+                self.error = 'Plugin crashed, exit code %s'%\
+                             self._process.exitcode
+                self._finish()
+
+        return self.done
+
+
+    def cancel(self, timeout=2.):
+        """Stop the worker process and the processes it started
+
+        The worker is asked to stop first, it is terminated if it does not
+        end within `timeout` seconds.
+
+        """
+
+        if not self.done:
+            self.cancelled = True
+            self._cancel.set()
+            self._process.join(timeout)
+            if self._process.is_alive():
+                self._process.terminate()
+            self._finish()
+
+
+    def _finish(self):
+        self.done = True
+        self._process.join(1.)
+        for shared in self._shared:
+            shared.release()
+
+
+# set in the workers of a SequenceJob by _init_sequence_worker
+_sequence_plugin = None
+_sequence_settings = None
+
+
+def _init_sequence_worker(filepath, clsname, importdict, roi):
+    global _sequence_plugin, _sequence_settings
+    try:
+        _sequence_plugin = _load_plugin(filepath, clsname)
+    except Exception:
+        # an exception here would make the pool restart the worker forever,
+        # instead every shot fails with the traceback
+        _sequence_plugin = traceback.format_exc()
+    _sequence_settings = (importdict, roi)
+
+
+def _run_kernel(path):
+    """Import a shot and run the kernel of the plugin, in a worker"""
+
+    if isinstance(_sequence_plugin, str):
+        return path, None, _sequence_plugin
+    importdict, roi = _sequence_settings
+    try:
+        rawframes, transimg, odimg = importprocessing.process_import(path,
+                                                            dct=importdict)
+        return path, _sequence_plugin.kernel(rawframes, transimg, roi, path), \
+               None
+    except Exception:
+        return path, None, traceback.format_exc()
+
+
+class SequenceJob(object):
+    """A sequence plugin running over many shots in a process pool."""
+
+    def __init__(self, plugin, paths, importdict, roi, processes=None,
+                 timeout=300.):
+        """Start the workers
+
+        **Inputs**
+
+          * plugin: plugin instance, with the methods kernel, start and
+                    reduce, see pluginmanager.SequencePlugin
+          * paths: list of str, the image files of the shots
+          * importdict: dict, the import settings
+          * roi: tuple of slices, the analysis ROI
+          * processes: int, number of worker processes. Default is the
+                       number of CPUs.
+          * timeout: float, if no shot finishes for this many seconds, a
+                     worker is assumed to hang or to have crashed and the
+                     job fails.
+
+        """
+
+        self.plugin = plugin
+        self.paths = list(paths)
+        self.timeout = timeout
+        self.ndone = 0
+        self.progress = 0.
+        self.message = ''
+        # the state of the reduction
+        self.result = plugin.start()
+        # (path, traceback) of the shots that failed
+        self.errors = []
+        self.error = None
+        self.done = False
+        self.cancelled = False
+
+        self._pool = multiprocessing.Pool(processes,
+            initializer=_init_sequence_worker,
+            initargs=(plugin_file(plugin.__class__, 'kernel'),
+                      plugin.__class__.__name__, importdict, roi))
+        self._results = self._pool.imap(_run_kernel, self.paths, chunksize=1)
+        self._lastdone = time.time()
+        if not self.paths:
+            self._finish()
+
+
+    def poll(self):
+        """Reduce the results that have arrived
+
+        **Outputs**
+
+          * done: bool, True if all shots are done, or the job failed or
+                  was cancelled
+
+        """
+
+        while not self.done:
+            try:
+                path, result, error = self._results.next(timeout=0)
+            except multiprocessing.TimeoutError:
+                if time.time() - self._lastdone > self.timeout:
+                    self.error = 'No shot finished within %s s'%self.timeout
+                    self._pool.terminate()
+                    self._finish()
+                break
+            except StopIteration:
+                self._finish()
+                break
+
+            self._lastdone = time.time()
+            self.ndone += 1
+            if error is None:
+                self.result = self.plugin.reduce(self.result, path, result)
+            else:
+                self.errors.append((path, error))
+            self.progress = float(self.ndone)/len(self.paths)
+            self.message = '%s/%s shots'%(self.ndone, len(self.paths))
+
+        return self.done
+
+
+    def cancel(self):
+        """Stop the worker processes"""
+
+        if not self.done:
+            self.cancelled = True
+            self._pool.terminate()
+            self._finish()
+
+
+    def _finish(self):
+        self.done = True
+        self._pool.close()
+        self._pool.join()
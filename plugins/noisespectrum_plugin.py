@@ -0,0 +1,51 @@
+"""Mean power spectrum of the OD fluctuations of a sequence of shots.
+
+Each shot is processed by `kernel` in a worker process, the reduction sums
+the spectra in the GUI.
+
+"""
+
+import numpy as np
+
+from pluginmanager import SequencePlugin
+from imageprocess import trans2od
+
+
+class NoiseSpectrumPlugin(SequencePlugin):
+    """Averages the 2D power spectrum of the OD within the ROI"""
+
+    def kernel(self, rawframes, img, roi, path):
+        """Return the power spectrum of the OD of a single shot"""
+
+        odimg = trans2od(img[roi])
+        odimg = np.where(np.isfinite(odimg), odimg, 0)
+        fluct = odimg - odimg.mean()
+
+        return np.abs(np.fft.fftshift(np.fft.fft2(fluct)))**2
+
+
+    def start(self):
+        # the sum of the spectra and the number of shots
+        return None, 0
+
+
+    def reduce(self, state, path, spectrum):
+        total, nshots = state
+        if total is None:
+            total = np.zeros(spectrum.shape)
+        elif total.shape != spectrum.shape:
+            # a shot with a different image size, it can't be averaged
+            return state
+        total += spectrum
+
+        return total, nshots + 1
+
+
+    def show_result(self, state):
+        total, nshots = state
+        if not nshots:
+            return
+
+        self.ax.imshow(np.log10(total/nshots + 1e-12), interpolation='nearest')
+        self.ax.set_title(r'log$_{10}$ power spectrum of the OD, %s shots'\
+                          %nshots)
@@ -2,39 +2,43 @@
 
 """
 
+import numpy as np
 
 import texreport
-import imageio
-import imageprocess
-from pluginmanager import IPlugin
+import shotcache
+from pluginmanager import ProcessDialogPlugin
 
 
-class TexreportPlugin(IPlugin):
-    """The plugin class. This one does not need a dialog window."""
+class TexreportPlugin(ProcessDialogPlugin):
+    """The plugin class. The report is generated in a worker process."""
 
-    def create_window(self, img, roi, name):
-        """A misnomer, but this is what the function Odysseus calls.
+    def compute(self, rawframes, img, roi, path, progress):
+        """Generate the report for the image at path, in a worker process
 
         **Inputs**
 
+          * rawframes: 3D array, the transmission image and the raw frames
           * img: 2d-array, containing the image data
           * roi: tuple of slices, contains two slice objects, one for each
                  image axis. The tuple can be used as a 2D slice object.
-          * name: string, the name of the plugin
+          * path: string, the path of the image file
+          * progress: function, reports the progress to the dialog
 
         """
 
-        rawframes = imageio.import_rawframes(self.imgpath)
-        transimg, odimg = imageprocess.calc_absimage(rawframes)
+        # the first three frames of the file, like imageio.import_rawframes
+        rawframes = np.asarray(rawframes[:, :, 1:4])
         # set the ROI
-        transimg = transimg[roi]
-
-        texreport.generate_report(rawframes, transimg, self.imgpath, showpdf=False)
-
-        # no window, so return None
-        return None
-
-
+        transimg = np.asarray(img[roi])
 
+        progress(0.1, 'Generating report')
+        pixcal = 10e-6 # 10um / pix
+        # fits of the GUI and of earlier reports of the shot are reused
+        return texreport.generate_report(rawframes, transimg, path, pixcal,
+                                         showpdf=False,
+                                         cache=shotcache.ShotCache(), roi=roi)
 
 
+    def show_result(self, pdfname):
+        self.ax.text(0.05, 0.5, 'Report written to\n%s'%pdfname)
+        self.ax.set_axis_off()
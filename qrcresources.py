@@ -1,5714 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Resource object code
-#
-# Created: Fri Jun 26 19:46:52 2009
-#      by: The Resource Compiler for PyQt (Qt v4.5.0)
-#
-# WARNING! All changes made in this file will be lost!
-
-from PyQt4 import QtCore
-
-qt_resource_data = "\
-\x00\x00\x18\x4b\
-\x3c\
-\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
-\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x55\x54\x46\
-\x2d\x38\x22\x20\x73\x74\x61\x6e\x64\x61\x6c\x6f\x6e\x65\x3d\x22\
-\x6e\x6f\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x43\x72\x65\x61\x74\
-\x65\x64\x20\x77\x69\x74\x68\x20\x53\x6f\x64\x69\x70\x6f\x64\x69\
-\x20\x28\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x73\x6f\
-\x64\x69\x70\x6f\x64\x69\x2e\x63\x6f\x6d\x2f\x22\x29\x20\x2d\x2d\
-\x3e\x0a\x3c\x73\x76\x67\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\
-\x64\x63\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x70\x75\x72\x6c\x2e\
-\x6f\x72\x67\x2f\x64\x63\x2f\x65\x6c\x65\x6d\x65\x6e\x74\x73\x2f\
-\x31\x2e\x31\x2f\x22\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x63\
-\x63\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x63\x72\x65\x61\x74\x69\
-\x76\x65\x63\x6f\x6d\x6d\x6f\x6e\x73\x2e\x6f\x72\x67\x2f\x6e\x73\
-\x23\x22\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\
-\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\
-\x72\x67\x2f\x31\x39\x39\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\
-\x66\x2d\x73\x79\x6e\x74\x61\x78\x2d\x6e\x73\x23\x22\x0a\x20\x20\
-\x20\x78\x6d\x6c\x6e\x73\x3a\x73\x76\x67\x3d\x22\x68\x74\x74\x70\
-\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
-\x30\x30\x2f\x73\x76\x67\x22\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\
-\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\
-\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\x22\x0a\x20\x20\
-\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\x69\x6e\x6b\x3d\x22\x68\x74\
-\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\
-\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\x6b\x22\x0a\x20\x20\x20\x78\
-\x6d\x6c\x6e\x73\x3a\x73\x6f\x64\x69\x70\x6f\x64\x69\x3d\x22\x68\
-\x74\x74\x70\x3a\x2f\x2f\x73\x6f\x64\x69\x70\x6f\x64\x69\x2e\x73\
-\x6f\x75\x72\x63\x65\x66\x6f\x72\x67\x65\x2e\x6e\x65\x74\x2f\x44\
-\x54\x44\x2f\x73\x6f\x64\x69\x70\x6f\x64\x69\x2d\x30\x2e\x64\x74\
-\x64\x22\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x69\x6e\x6b\x73\
-\x63\x61\x70\x65\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\
-\x2e\x69\x6e\x6b\x73\x63\x61\x70\x65\x2e\x6f\x72\x67\x2f\x6e\x61\
-\x6d\x65\x73\x70\x61\x63\x65\x73\x2f\x69\x6e\x6b\x73\x63\x61\x70\
-\x65\x22\x0a\x20\x20\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
-\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x0a\x20\x20\x20\x77\x69\
-\x64\x74\x68\x3d\x22\x31\x32\x38\x70\x74\x22\x0a\x20\x20\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x31\x32\x38\x70\x74\x22\x0a\x20\x20\
-\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x35\x30\
-\x37\x2e\x39\x34\x36\x20\x35\x30\x37\x2e\x39\x34\x36\x22\x0a\x20\
-\x20\x20\x69\x64\x3d\x22\x73\x76\x67\x34\x39\x22\x0a\x20\x20\x20\
-\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x76\x65\x72\x73\x69\x6f\x6e\
-\x3d\x22\x30\x2e\x33\x32\x22\x0a\x20\x20\x20\x73\x6f\x64\x69\x70\
-\x6f\x64\x69\x3a\x64\x6f\x63\x6e\x61\x6d\x65\x3d\x22\x72\x6f\x69\
-\x5f\x6e\x63\x6f\x75\x6e\x74\x2e\x73\x76\x67\x22\x0a\x20\x20\x20\
-\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x64\x6f\x63\x62\x61\x73\x65\
-\x3d\x22\x2f\x6d\x6e\x74\x2f\x77\x69\x6e\x64\x6f\x77\x73\x2f\x74\
-\x68\x65\x6d\x65\x73\x2f\x57\x6f\x72\x6b\x2f\x42\x6c\x75\x65\x2d\
-\x53\x70\x68\x65\x72\x65\x2f\x22\x0a\x20\x20\x20\x69\x6e\x6b\x73\
-\x63\x61\x70\x65\x3a\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x30\x2e\
-\x34\x36\x22\x0a\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\
-\x6f\x75\x74\x70\x75\x74\x5f\x65\x78\x74\x65\x6e\x73\x69\x6f\x6e\
-\x3d\x22\x6f\x72\x67\x2e\x69\x6e\x6b\x73\x63\x61\x70\x65\x2e\x6f\
-\x75\x74\x70\x75\x74\x2e\x73\x76\x67\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x22\x3e\x3c\x6d\x65\x74\x61\x64\x61\x74\x61\x0a\x20\x20\
-\x20\x69\x64\x3d\x22\x6d\x65\x74\x61\x64\x61\x74\x61\x32\x32\x22\
-\x3e\x3c\x72\x64\x66\x3a\x52\x44\x46\x3e\x3c\x63\x63\x3a\x57\x6f\
-\x72\x6b\x0a\x20\x20\x20\x20\x20\x20\x20\x72\x64\x66\x3a\x61\x62\
-\x6f\x75\x74\x3d\x22\x22\x3e\x3c\x64\x63\x3a\x66\x6f\x72\x6d\x61\
-\x74\x3e\x69\x6d\x61\x67\x65\x2f\x73\x76\x67\x2b\x78\x6d\x6c\x3c\
-\x2f\x64\x63\x3a\x66\x6f\x72\x6d\x61\x74\x3e\x3c\x64\x63\x3a\x74\
-\x79\x70\x65\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x72\x64\x66\
-\x3a\x72\x65\x73\x6f\x75\x72\x63\x65\x3d\x22\x68\x74\x74\x70\x3a\
-\x2f\x2f\x70\x75\x72\x6c\x2e\x6f\x72\x67\x2f\x64\x63\x2f\x64\x63\
-\x6d\x69\x74\x79\x70\x65\x2f\x53\x74\x69\x6c\x6c\x49\x6d\x61\x67\
-\x65\x22\x20\x2f\x3e\x3c\x2f\x63\x63\x3a\x57\x6f\x72\x6b\x3e\x3c\
-\x2f\x72\x64\x66\x3a\x52\x44\x46\x3e\x3c\x2f\x6d\x65\x74\x61\x64\
-\x61\x74\x61\x3e\x0a\x20\x20\x3c\x64\x65\x66\x73\x0a\x20\x20\x20\
-\x69\x64\x3d\x22\x64\x65\x66\x73\x36\x32\x22\x3e\x3c\x69\x6e\x6b\
-\x73\x63\x61\x70\x65\x3a\x70\x65\x72\x73\x70\x65\x63\x74\x69\x76\
-\x65\x0a\x20\x20\x20\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x74\x79\
-\x70\x65\x3d\x22\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x70\x65\x72\
-\x73\x70\x33\x64\x22\x0a\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\
-\x65\x3a\x76\x70\x5f\x78\x3d\x22\x30\x20\x3a\x20\x38\x30\x20\x3a\
-\x20\x31\x22\x0a\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\
-\x76\x70\x5f\x79\x3d\x22\x30\x20\x3a\x20\x31\x30\x30\x30\x20\x3a\
-\x20\x30\x22\x0a\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\
-\x76\x70\x5f\x7a\x3d\x22\x31\x36\x30\x20\x3a\x20\x38\x30\x20\x3a\
-\x20\x31\x22\x0a\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\
-\x70\x65\x72\x73\x70\x33\x64\x2d\x6f\x72\x69\x67\x69\x6e\x3d\x22\
-\x38\x30\x20\x3a\x20\x35\x33\x2e\x33\x33\x33\x33\x33\x33\x20\x3a\
-\x20\x31\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x70\x65\x72\x73\x70\
-\x65\x63\x74\x69\x76\x65\x32\x34\x22\x20\x2f\x3e\x0a\x20\x20\x20\
-\x20\x3c\x72\x61\x64\x69\x61\x6c\x47\x72\x61\x64\x69\x65\x6e\x74\
-\x0a\x20\x20\x20\x69\x64\x3d\x22\x72\x61\x64\x69\x61\x6c\x47\x72\
-\x61\x64\x69\x65\x6e\x74\x39\x33\x22\x0a\x20\x20\x20\x63\x78\x3d\
-\x22\x32\x31\x38\x2e\x39\x34\x30\x34\x22\x0a\x20\x20\x20\x63\x79\
-\x3d\x22\x32\x31\x39\x2e\x37\x37\x31\x35\x22\x0a\x20\x20\x20\x72\
-\x3d\x22\x31\x35\x30\x2e\x37\x30\x36\x33\x22\x0a\x20\x20\x20\x66\
-\x78\x3d\x22\x32\x31\x38\x2e\x39\x34\x30\x34\x22\x0a\x20\x20\x20\
-\x66\x79\x3d\x22\x32\x31\x39\x2e\x37\x37\x31\x35\x22\x0a\x20\x20\
-\x20\x67\x72\x61\x64\x69\x65\x6e\x74\x55\x6e\x69\x74\x73\x3d\x22\
-\x75\x73\x65\x72\x53\x70\x61\x63\x65\x4f\x6e\x55\x73\x65\x22\x0a\
-\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\x73\x74\x72\x6f\x6b\x65\
-\x3a\x23\x30\x30\x30\x30\x30\x30\x3b\x73\x74\x72\x6f\x6b\x65\x2d\
-\x6f\x70\x61\x63\x69\x74\x79\x3a\x30\x2e\x39\x38\x36\x30\x31\x34\
-\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3a\x30\x2e\
-\x39\x38\x31\x36\x31\x32\x3b\x22\x3e\x0a\x20\x20\x20\x20\x20\x20\
-\x3c\x73\x74\x6f\x70\x0a\x20\x20\x20\x6f\x66\x66\x73\x65\x74\x3d\
-\x22\x30\x2e\x30\x30\x30\x30\x30\x30\x22\x0a\x20\x20\x20\x73\x74\
-\x79\x6c\x65\x3d\x22\x73\x74\x6f\x70\x2d\x63\x6f\x6c\x6f\x72\x3a\
-\x23\x32\x35\x61\x36\x63\x61\x3b\x73\x74\x6f\x70\x2d\x6f\x70\x61\
-\x63\x69\x74\x79\x3a\x31\x3b\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\
-\x73\x74\x6f\x70\x39\x34\x22\x20\x2f\x3e\x0a\x20\x20\x20\x20\x20\
-\x20\x3c\x73\x74\x6f\x70\x0a\x20\x20\x20\x6f\x66\x66\x73\x65\x74\
-\x3d\x22\x31\x2e\x30\x30\x30\x30\x30\x30\x22\x0a\x20\x20\x20\x73\
-\x74\x79\x6c\x65\x3d\x22\x73\x74\x6f\x70\x2d\x63\x6f\x6c\x6f\x72\
-\x3a\x23\x32\x65\x61\x36\x62\x39\x3b\x73\x74\x6f\x70\x2d\x6f\x70\
-\x61\x63\x69\x74\x79\x3a\x30\x2e\x38\x34\x33\x31\x33\x37\x3b\x22\
-\x0a\x20\x20\x20\x69\x64\x3d\x22\x73\x74\x6f\x70\x39\x35\x22\x20\
-\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x2f\x72\x61\x64\x69\x61\x6c\x47\
-\x72\x61\x64\x69\x65\x6e\x74\x3e\x0a\x20\x20\x20\x20\x3c\x72\x61\
-\x64\x69\x61\x6c\x47\x72\x61\x64\x69\x65\x6e\x74\x0a\x20\x20\x20\
-\x69\x64\x3d\x22\x61\x69\x67\x72\x64\x31\x22\x0a\x20\x20\x20\x63\
-\x78\x3d\x22\x32\x31\x38\x2e\x39\x34\x30\x34\x22\x0a\x20\x20\x20\
-\x63\x79\x3d\x22\x32\x31\x39\x2e\x37\x37\x31\x35\x22\x0a\x20\x20\
-\x20\x72\x3d\x22\x31\x35\x30\x2e\x37\x30\x36\x33\x22\x0a\x20\x20\
-\x20\x66\x78\x3d\x22\x32\x31\x38\x2e\x39\x34\x30\x34\x22\x0a\x20\
-\x20\x20\x66\x79\x3d\x22\x32\x31\x39\x2e\x37\x37\x31\x35\x22\x0a\
-\x20\x20\x20\x67\x72\x61\x64\x69\x65\x6e\x74\x55\x6e\x69\x74\x73\
-\x3d\x22\x75\x73\x65\x72\x53\x70\x61\x63\x65\x4f\x6e\x55\x73\x65\
-\x22\x0a\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\x73\x74\x72\x6f\
-\x6b\x65\x3a\x23\x30\x30\x30\x30\x30\x30\x3b\x73\x74\x72\x6f\x6b\
-\x65\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\x30\x2e\x39\x38\x36\x30\
-\x31\x34\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3a\
-\x30\x2e\x39\x38\x31\x36\x31\x32\x3b\x22\x3e\x0a\x20\x20\x20\x20\
-\x20\x20\x3c\x73\x74\x6f\x70\x0a\x20\x20\x20\x6f\x66\x66\x73\x65\
-\x74\x3d\x22\x30\x22\x0a\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\
-\x73\x74\x6f\x70\x2d\x63\x6f\x6c\x6f\x72\x3a\x23\x37\x33\x66\x66\
-\x66\x66\x3b\x73\x74\x72\x6f\x6b\x65\x3a\x23\x30\x30\x30\x30\x30\
-\x30\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6f\x70\x61\x63\x69\x74\x79\
-\x3a\x30\x2e\x39\x38\x36\x30\x31\x34\x3b\x73\x74\x72\x6f\x6b\x65\
-\x2d\x77\x69\x64\x74\x68\x3a\x30\x2e\x39\x38\x31\x36\x31\x32\x3b\
-\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x73\x74\x6f\x70\x35\x33\x22\
-\x20\x2f\x3e\x0a\x20\x20\x20\x20\x20\x20\x3c\x73\x74\x6f\x70\x0a\
-\x20\x20\x20\x6f\x66\x66\x73\x65\x74\x3d\x22\x30\x2e\x32\x38\x30\
-\x39\x22\x0a\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\x73\x74\x6f\
-\x70\x2d\x63\x6f\x6c\x6f\x72\x3a\x23\x32\x45\x41\x36\x42\x39\x3b\
-\x73\x74\x72\x6f\x6b\x65\x3a\x23\x30\x30\x30\x30\x30\x30\x3b\x73\
-\x74\x72\x6f\x6b\x65\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\x30\x2e\
-\x39\x38\x36\x30\x31\x34\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\
-\x64\x74\x68\x3a\x30\x2e\x39\x38\x31\x36\x31\x32\x3b\x22\x0a\x20\
-\x20\x20\x69\x64\x3d\x22\x73\x74\x6f\x70\x35\x34\x22\x20\x2f\x3e\
-\x0a\x20\x20\x20\x20\x20\x20\x3c\x73\x74\x6f\x70\x0a\x20\x20\x20\
-\x6f\x66\x66\x73\x65\x74\x3d\x22\x31\x22\x0a\x20\x20\x20\x73\x74\
-\x79\x6c\x65\x3d\x22\x73\x74\x6f\x70\x2d\x63\x6f\x6c\x6f\x72\x3a\
-\x23\x30\x30\x36\x62\x38\x62\x3b\x73\x74\x72\x6f\x6b\x65\x3a\x23\
-\x30\x30\x30\x30\x30\x30\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6f\x70\
-\x61\x63\x69\x74\x79\x3a\x30\x2e\x39\x38\x36\x30\x31\x34\x3b\x73\
-\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3a\x30\x2e\x39\x38\
-\x31\x36\x31\x32\x3b\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x73\x74\
-\x6f\x70\x35\x35\x22\x20\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x2f\x72\
-\x61\x64\x69\x61\x6c\x47\x72\x61\x64\x69\x65\x6e\x74\x3e\x0a\x20\
-\x20\x20\x20\x3c\x6c\x69\x6e\x65\x61\x72\x47\x72\x61\x64\x69\x65\
-\x6e\x74\x0a\x20\x20\x20\x78\x6c\x69\x6e\x6b\x3a\x68\x72\x65\x66\
-\x3d\x22\x23\x61\x69\x67\x72\x64\x31\x22\x0a\x20\x20\x20\x69\x64\
-\x3d\x22\x6c\x69\x6e\x65\x61\x72\x47\x72\x61\x64\x69\x65\x6e\x74\
-\x39\x31\x22\x0a\x20\x20\x20\x78\x31\x3d\x22\x2d\x30\x2e\x32\x39\
-\x35\x37\x32\x33\x22\x0a\x20\x20\x20\x79\x31\x3d\x22\x2d\x30\x2e\
-\x32\x36\x34\x35\x39\x31\x22\x0a\x20\x20\x20\x78\x32\x3d\x22\x30\
-\x2e\x36\x32\x32\x35\x37\x34\x22\x0a\x20\x20\x20\x79\x32\x3d\x22\
-\x30\x2e\x33\x36\x35\x37\x36\x32\x22\x0a\x20\x20\x20\x67\x72\x61\
-\x64\x69\x65\x6e\x74\x55\x6e\x69\x74\x73\x3d\x22\x6f\x62\x6a\x65\
-\x63\x74\x42\x6f\x75\x6e\x64\x69\x6e\x67\x42\x6f\x78\x22\x0a\x20\
-\x20\x20\x67\x72\x61\x64\x69\x65\x6e\x74\x54\x72\x61\x6e\x73\x66\
-\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x39\x39\
-\x36\x31\x31\x34\x2c\x30\x2c\x30\x2c\x31\x2e\x30\x30\x33\x39\x2c\
-\x30\x2e\x34\x39\x36\x31\x32\x34\x2c\x30\x2e\x34\x39\x32\x31\x38\
-\x36\x29\x22\x0a\x20\x20\x20\x73\x70\x72\x65\x61\x64\x4d\x65\x74\
-\x68\x6f\x64\x3d\x22\x70\x61\x64\x22\x20\x2f\x3e\x0a\x20\x20\x20\
-\x20\x3c\x72\x61\x64\x69\x61\x6c\x47\x72\x61\x64\x69\x65\x6e\x74\
-\x0a\x20\x20\x20\x78\x6c\x69\x6e\x6b\x3a\x68\x72\x65\x66\x3d\x22\
-\x23\x61\x69\x67\x72\x64\x31\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\
-\x72\x61\x64\x69\x61\x6c\x47\x72\x61\x64\x69\x65\x6e\x74\x39\x32\
-\x22\x0a\x20\x20\x20\x63\x78\x3d\x22\x2d\x38\x2e\x30\x39\x33\x34\
-\x34\x65\x2d\x30\x35\x22\x0a\x20\x20\x20\x63\x79\x3d\x22\x2d\x37\
-\x2e\x36\x38\x38\x36\x37\x65\x2d\x30\x35\x22\x0a\x20\x20\x20\x66\
-\x78\x3d\x22\x2d\x38\x2e\x30\x39\x33\x34\x34\x65\x2d\x30\x35\x22\
-\x0a\x20\x20\x20\x66\x79\x3d\x22\x2d\x37\x2e\x36\x38\x38\x36\x37\
-\x65\x2d\x30\x35\x22\x0a\x20\x20\x20\x72\x3d\x22\x30\x2e\x37\x38\
-\x39\x31\x32\x37\x22\x0a\x20\x20\x20\x67\x72\x61\x64\x69\x65\x6e\
-\x74\x55\x6e\x69\x74\x73\x3d\x22\x6f\x62\x6a\x65\x63\x74\x42\x6f\
-\x75\x6e\x64\x69\x6e\x67\x42\x6f\x78\x22\x0a\x20\x20\x20\x67\x72\
-\x61\x64\x69\x65\x6e\x74\x54\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\
-\x22\x6d\x61\x74\x72\x69\x78\x28\x31\x2e\x30\x36\x37\x38\x34\x2c\
-\x30\x2c\x30\x2c\x30\x2e\x39\x33\x36\x34\x36\x39\x2c\x30\x2e\x33\
-\x34\x32\x32\x31\x39\x2c\x30\x2e\x33\x34\x34\x37\x31\x32\x29\x22\
-\x0a\x20\x20\x20\x73\x70\x72\x65\x61\x64\x4d\x65\x74\x68\x6f\x64\
-\x3d\x22\x70\x61\x64\x22\x20\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x72\
-\x61\x64\x69\x61\x6c\x47\x72\x61\x64\x69\x65\x6e\x74\x0a\x20\x20\
-\x20\x78\x6c\x69\x6e\x6b\x3a\x68\x72\x65\x66\x3d\x22\x23\x61\x69\
-\x67\x72\x64\x31\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x72\x61\x64\
-\x69\x61\x6c\x47\x72\x61\x64\x69\x65\x6e\x74\x31\x35\x39\x34\x22\
-\x0a\x20\x20\x20\x63\x78\x3d\x22\x31\x2e\x33\x37\x31\x35\x37\x65\
-\x2d\x32\x35\x22\x0a\x20\x20\x20\x63\x79\x3d\x22\x34\x2e\x38\x32\
-\x37\x38\x33\x65\x2d\x32\x36\x22\x0a\x20\x20\x20\x66\x78\x3d\x22\
-\x31\x2e\x33\x37\x31\x35\x37\x65\x2d\x32\x35\x22\x0a\x20\x20\x20\
-\x66\x79\x3d\x22\x34\x2e\x38\x32\x37\x38\x33\x65\x2d\x32\x36\x22\
-\x0a\x20\x20\x20\x72\x3d\x22\x30\x2e\x37\x36\x36\x33\x35\x38\x22\
-\x0a\x20\x20\x20\x67\x72\x61\x64\x69\x65\x6e\x74\x55\x6e\x69\x74\
-\x73\x3d\x22\x6f\x62\x6a\x65\x63\x74\x42\x6f\x75\x6e\x64\x69\x6e\
-\x67\x42\x6f\x78\x22\x0a\x20\x20\x20\x67\x72\x61\x64\x69\x65\x6e\
-\x74\x54\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\
-\x69\x78\x28\x30\x2e\x39\x32\x30\x36\x37\x39\x2c\x2d\x30\x2e\x30\
-\x32\x38\x35\x38\x32\x34\x2c\x30\x2e\x30\x33\x33\x36\x31\x36\x38\
-\x2c\x31\x2e\x30\x38\x35\x31\x31\x2c\x30\x2e\x33\x37\x33\x34\x33\
-\x36\x2c\x30\x2e\x33\x38\x34\x38\x35\x34\x29\x22\x0a\x20\x20\x20\
-\x73\x70\x72\x65\x61\x64\x4d\x65\x74\x68\x6f\x64\x3d\x22\x70\x61\
-\x64\x22\x20\x2f\x3e\x0a\x20\x20\x3c\x2f\x64\x65\x66\x73\x3e\x0a\
-\x20\x20\x3c\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x6e\x61\x6d\x65\
-\x64\x76\x69\x65\x77\x0a\x20\x20\x20\x69\x64\x3d\x22\x62\x61\x73\
-\x65\x22\x0a\x20\x20\x20\x73\x68\x6f\x77\x67\x72\x69\x64\x3d\x22\
-\x66\x61\x6c\x73\x65\x22\x0a\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x3a\x7a\x6f\x6f\x6d\x3d\x22\x32\x2e\x36\x38\x37\x35\x22\
-\x0a\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x63\x78\x3d\
-\x22\x2d\x32\x30\x2e\x35\x33\x36\x36\x33\x37\x22\x0a\x20\x20\x20\
-\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x63\x79\x3d\x22\x38\x30\x22\
-\x0a\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x77\x69\x6e\
-\x64\x6f\x77\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x30\x30\x22\
-\x0a\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x77\x69\x6e\
-\x64\x6f\x77\x2d\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x31\x33\x37\
-\x22\x0a\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x77\x69\
-\x6e\x64\x6f\x77\x2d\x78\x3d\x22\x2d\x34\x22\x0a\x20\x20\x20\x69\
-\x6e\x6b\x73\x63\x61\x70\x65\x3a\x77\x69\x6e\x64\x6f\x77\x2d\x79\
-\x3d\x22\x2d\x34\x22\x0a\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\
-\x65\x3a\x63\x75\x72\x72\x65\x6e\x74\x2d\x6c\x61\x79\x65\x72\x3d\
-\x22\x73\x76\x67\x34\x39\x22\x3e\x0a\x20\x20\x20\x20\x3c\x73\x6f\
-\x64\x69\x70\x6f\x64\x69\x3a\x67\x75\x69\x64\x65\x0a\x20\x20\x20\
-\x6f\x72\x69\x65\x6e\x74\x61\x74\x69\x6f\x6e\x3d\x22\x76\x65\x72\
-\x74\x69\x63\x61\x6c\x22\x0a\x20\x20\x20\x70\x6f\x73\x69\x74\x69\
-\x6f\x6e\x3d\x22\x37\x33\x2e\x36\x39\x30\x38\x34\x39\x22\x0a\x20\
-\x20\x20\x69\x64\x3d\x22\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x67\
-\x75\x69\x64\x65\x31\x32\x37\x22\x20\x2f\x3e\x0a\x20\x20\x20\x20\
-\x3c\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x67\x75\x69\x64\x65\x0a\
-\x20\x20\x20\x6f\x72\x69\x65\x6e\x74\x61\x74\x69\x6f\x6e\x3d\x22\
-\x76\x65\x72\x74\x69\x63\x61\x6c\x22\x0a\x20\x20\x20\x70\x6f\x73\
-\x69\x74\x69\x6f\x6e\x3d\x22\x31\x30\x31\x2e\x31\x34\x38\x32\x36\
-\x32\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x73\x6f\x64\x69\x70\x6f\
-\x64\x69\x3a\x67\x75\x69\x64\x65\x32\x32\x22\x20\x2f\x3e\x0a\x20\
-\x20\x20\x20\x3c\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x67\x75\x69\
-\x64\x65\x0a\x20\x20\x20\x6f\x72\x69\x65\x6e\x74\x61\x74\x69\x6f\
-\x6e\x3d\x22\x76\x65\x72\x74\x69\x63\x61\x6c\x22\x0a\x20\x20\x20\
-\x70\x6f\x73\x69\x74\x69\x6f\x6e\x3d\x22\x35\x37\x2e\x39\x34\x33\
-\x32\x31\x38\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x73\x6f\x64\x69\
-\x70\x6f\x64\x69\x3a\x67\x75\x69\x64\x65\x32\x33\x22\x20\x2f\x3e\
-\x0a\x20\x20\x20\x20\x3c\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x67\
-\x75\x69\x64\x65\x0a\x20\x20\x20\x6f\x72\x69\x65\x6e\x74\x61\x74\
-\x69\x6f\x6e\x3d\x22\x76\x65\x72\x74\x69\x63\x61\x6c\x22\x0a\x20\
-\x20\x20\x70\x6f\x73\x69\x74\x69\x6f\x6e\x3d\x22\x33\x30\x2e\x38\
-\x38\x39\x35\x38\x39\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x73\x6f\
-\x64\x69\x70\x6f\x64\x69\x3a\x67\x75\x69\x64\x65\x31\x35\x39\x33\
-\x22\x20\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x73\x6f\x64\x69\x70\x6f\
-\x64\x69\x3a\x67\x75\x69\x64\x65\x0a\x20\x20\x20\x6f\x72\x69\x65\
-\x6e\x74\x61\x74\x69\x6f\x6e\x3d\x22\x68\x6f\x72\x69\x7a\x6f\x6e\
-\x74\x61\x6c\x22\x0a\x20\x20\x20\x70\x6f\x73\x69\x74\x69\x6f\x6e\
-\x3d\x22\x36\x31\x2e\x39\x38\x31\x30\x37\x31\x22\x0a\x20\x20\x20\
-\x69\x64\x3d\x22\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x67\x75\x69\
-\x64\x65\x31\x36\x36\x32\x22\x20\x2f\x3e\x0a\x20\x20\x3c\x2f\x73\
-\x6f\x64\x69\x70\x6f\x64\x69\x3a\x6e\x61\x6d\x65\x64\x76\x69\x65\
-\x77\x3e\x0a\x20\x20\x0a\x20\x20\x0a\x3c\x72\x65\x63\x74\x0a\x20\
-\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\x6f\x70\x61\x63\x69\x74\x79\
-\x3a\x31\x3b\x66\x69\x6c\x6c\x3a\x23\x61\x34\x63\x39\x65\x65\x3b\
-\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\x30\x2e\x37\
-\x30\x31\x39\x36\x30\x37\x38\x3b\x66\x69\x6c\x6c\x2d\x72\x75\x6c\
-\x65\x3a\x6e\x6f\x6e\x7a\x65\x72\x6f\x3b\x73\x74\x72\x6f\x6b\x65\
-\x3a\x23\x61\x34\x63\x39\x65\x65\x3b\x73\x74\x72\x6f\x6b\x65\x2d\
-\x77\x69\x64\x74\x68\x3a\x36\x2e\x34\x37\x33\x31\x33\x36\x39\x3b\
-\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x6a\x6f\x69\x6e\x3a\
-\x72\x6f\x75\x6e\x64\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6d\x69\x74\
-\x65\x72\x6c\x69\x6d\x69\x74\x3a\x34\x3b\x73\x74\x72\x6f\x6b\x65\
-\x2d\x64\x61\x73\x68\x61\x72\x72\x61\x79\x3a\x6e\x6f\x6e\x65\x3b\
-\x73\x74\x72\x6f\x6b\x65\x2d\x64\x61\x73\x68\x6f\x66\x66\x73\x65\
-\x74\x3a\x30\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6f\x70\x61\x63\x69\
-\x74\x79\x3a\x31\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x72\x65\x63\
-\x74\x32\x33\x39\x37\x22\x0a\x20\x20\x20\x77\x69\x64\x74\x68\x3d\
-\x22\x34\x34\x36\x2e\x31\x32\x35\x35\x38\x22\x0a\x20\x20\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x34\x33\x39\x2e\x30\x33\x37\x39\x36\
-\x22\x0a\x20\x20\x20\x78\x3d\x22\x33\x30\x2e\x39\x31\x30\x32\x31\
-\x22\x0a\x20\x20\x20\x79\x3d\x22\x33\x34\x2e\x34\x35\x34\x30\x31\
-\x38\x22\x20\x2f\x3e\x3c\x74\x65\x78\x74\x0a\x20\x20\x20\x78\x6d\
-\x6c\x3a\x73\x70\x61\x63\x65\x3d\x22\x70\x72\x65\x73\x65\x72\x76\
-\x65\x22\x0a\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\x66\x6f\x6e\
-\x74\x2d\x73\x69\x7a\x65\x3a\x32\x34\x70\x78\x3b\x66\x6f\x6e\x74\
-\x2d\x73\x74\x79\x6c\x65\x3a\x6e\x6f\x72\x6d\x61\x6c\x3b\x66\x6f\
-\x6e\x74\x2d\x76\x61\x72\x69\x61\x6e\x74\x3a\x6e\x6f\x72\x6d\x61\
-\x6c\x3b\x66\x6f\x6e\x74\x2d\x77\x65\x69\x67\x68\x74\x3a\x62\x6f\
-\x6c\x64\x3b\x66\x6f\x6e\x74\x2d\x73\x74\x72\x65\x74\x63\x68\x3a\
-\x6e\x6f\x72\x6d\x61\x6c\x3b\x74\x65\x78\x74\x2d\x61\x6c\x69\x67\
-\x6e\x3a\x73\x74\x61\x72\x74\x3b\x6c\x69\x6e\x65\x2d\x68\x65\x69\
-\x67\x68\x74\x3a\x31\x30\x30\x25\x3b\x77\x72\x69\x74\x69\x6e\x67\
-\x2d\x6d\x6f\x64\x65\x3a\x6c\x72\x2d\x74\x62\x3b\x74\x65\x78\x74\
-\x2d\x61\x6e\x63\x68\x6f\x72\x3a\x73\x74\x61\x72\x74\x3b\x66\x69\
-\x6c\x6c\x3a\x23\x30\x30\x30\x30\x30\x30\x3b\x66\x69\x6c\x6c\x2d\
-\x6f\x70\x61\x63\x69\x74\x79\x3a\x31\x3b\x73\x74\x72\x6f\x6b\x65\
-\x3a\x6e\x6f\x6e\x65\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\
-\x74\x68\x3a\x31\x70\x78\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
-\x6e\x65\x63\x61\x70\x3a\x62\x75\x74\x74\x3b\x73\x74\x72\x6f\x6b\
-\x65\x2d\x6c\x69\x6e\x65\x6a\x6f\x69\x6e\x3a\x6d\x69\x74\x65\x72\
-\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\
-\x31\x3b\x66\x6f\x6e\x74\x2d\x66\x61\x6d\x69\x6c\x79\x3a\x63\x6d\
-\x65\x78\x31\x30\x3b\x2d\x69\x6e\x6b\x73\x63\x61\x70\x65\x2d\x66\
-\x6f\x6e\x74\x2d\x73\x70\x65\x63\x69\x66\x69\x63\x61\x74\x69\x6f\
-\x6e\x3a\x63\x6d\x65\x78\x31\x30\x20\x4d\x65\x64\x69\x75\x6d\x22\
-\x0a\x20\x20\x20\x78\x3d\x22\x32\x30\x30\x2e\x38\x31\x35\x38\x36\
-\x22\x0a\x20\x20\x20\x79\x3d\x22\x32\x35\x33\x2e\x39\x37\x33\x30\
-\x31\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x74\x65\x78\x74\x33\x31\
-\x36\x39\x22\x0a\x20\x20\x20\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\
-\x6c\x69\x6e\x65\x73\x70\x61\x63\x69\x6e\x67\x3d\x22\x31\x30\x30\
-\x25\x22\x3e\x3c\x74\x73\x70\x61\x6e\x0a\x20\x20\x20\x20\x20\x73\
-\x6f\x64\x69\x70\x6f\x64\x69\x3a\x72\x6f\x6c\x65\x3d\x22\x6c\x69\
-\x6e\x65\x22\x0a\x20\x20\x20\x20\x20\x69\x64\x3d\x22\x74\x73\x70\
-\x61\x6e\x33\x31\x37\x31\x22\x0a\x20\x20\x20\x20\x20\x78\x3d\x22\
-\x32\x30\x30\x2e\x38\x31\x35\x38\x36\x22\x0a\x20\x20\x20\x20\x20\
-\x79\x3d\x22\x32\x35\x33\x2e\x39\x37\x33\x30\x31\x22\x20\x2f\x3e\
-\x3c\x2f\x74\x65\x78\x74\x3e\x0a\x0a\x0a\x0a\x0a\x3c\x72\x65\x63\
-\x74\x0a\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\x66\x69\x6c\x6c\
-\x3a\x6e\x6f\x6e\x65\x3b\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\x69\
-\x74\x79\x3a\x30\x2e\x37\x30\x31\x39\x36\x30\x37\x38\x3b\x66\x69\
-\x6c\x6c\x2d\x72\x75\x6c\x65\x3a\x6e\x6f\x6e\x7a\x65\x72\x6f\x3b\
-\x73\x74\x72\x6f\x6b\x65\x3a\x23\x35\x35\x35\x35\x35\x35\x3b\x73\
-\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3a\x36\x2e\x37\x34\
-\x33\x37\x34\x31\x39\x39\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
-\x6e\x65\x6a\x6f\x69\x6e\x3a\x72\x6f\x75\x6e\x64\x3b\x73\x74\x72\
-\x6f\x6b\x65\x2d\x6d\x69\x74\x65\x72\x6c\x69\x6d\x69\x74\x3a\x34\
-\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x64\x61\x73\x68\x61\x72\x72\x61\
-\x79\x3a\x32\x30\x2e\x32\x33\x31\x32\x32\x35\x37\x34\x2c\x20\x36\
-\x2e\x37\x34\x33\x37\x34\x31\x39\x31\x3b\x73\x74\x72\x6f\x6b\x65\
-\x2d\x64\x61\x73\x68\x6f\x66\x66\x73\x65\x74\x3a\x30\x3b\x73\x74\
-\x72\x6f\x6b\x65\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\x31\x22\x0a\
-\x20\x20\x20\x69\x64\x3d\x22\x72\x65\x63\x74\x32\x33\x39\x38\x22\
-\x0a\x20\x20\x20\x77\x69\x64\x74\x68\x3d\x22\x33\x36\x33\x2e\x34\
-\x38\x31\x31\x31\x22\x0a\x20\x20\x20\x68\x65\x69\x67\x68\x74\x3d\
-\x22\x33\x32\x30\x2e\x39\x35\x35\x34\x31\x22\x0a\x20\x20\x20\x78\
-\x3d\x22\x37\x32\x2e\x32\x33\x32\x34\x34\x35\x22\x0a\x20\x20\x20\
-\x79\x3d\x22\x39\x33\x2e\x34\x39\x35\x32\x39\x33\x22\x20\x2f\x3e\
-\x3c\x74\x65\x78\x74\x0a\x20\x20\x20\x78\x6d\x6c\x3a\x73\x70\x61\
-\x63\x65\x3d\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x0a\x20\x20\
-\x20\x73\x74\x79\x6c\x65\x3d\x22\x66\x6f\x6e\x74\x2d\x73\x69\x7a\
-\x65\x3a\x31\x37\x37\x2e\x37\x38\x31\x30\x39\x37\x34\x31\x70\x78\
-\x3b\x66\x6f\x6e\x74\x2d\x73\x74\x79\x6c\x65\x3a\x6e\x6f\x72\x6d\
-\x61\x6c\x3b\x66\x6f\x6e\x74\x2d\x76\x61\x72\x69\x61\x6e\x74\x3a\
-\x6e\x6f\x72\x6d\x61\x6c\x3b\x66\x6f\x6e\x74\x2d\x77\x65\x69\x67\
-\x68\x74\x3a\x62\x6f\x6c\x64\x3b\x66\x6f\x6e\x74\x2d\x73\x74\x72\
-\x65\x74\x63\x68\x3a\x6e\x6f\x72\x6d\x61\x6c\x3b\x74\x65\x78\x74\
-\x2d\x61\x6c\x69\x67\x6e\x3a\x73\x74\x61\x72\x74\x3b\x6c\x69\x6e\
-\x65\x2d\x68\x65\x69\x67\x68\x74\x3a\x31\x30\x30\x25\x3b\x77\x72\
-\x69\x74\x69\x6e\x67\x2d\x6d\x6f\x64\x65\x3a\x6c\x72\x2d\x74\x62\
-\x3b\x74\x65\x78\x74\x2d\x61\x6e\x63\x68\x6f\x72\x3a\x73\x74\x61\
-\x72\x74\x3b\x66\x69\x6c\x6c\x3a\x23\x30\x30\x30\x30\x30\x30\x3b\
-\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\x31\x3b\x73\
-\x74\x72\x6f\x6b\x65\x3a\x6e\x6f\x6e\x65\x3b\x73\x74\x72\x6f\x6b\
-\x65\x2d\x77\x69\x64\x74\x68\x3a\x31\x70\x78\x3b\x73\x74\x72\x6f\
-\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3a\x62\x75\x74\x74\x3b\
-\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x6a\x6f\x69\x6e\x3a\
-\x6d\x69\x74\x65\x72\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6f\x70\x61\
-\x63\x69\x74\x79\x3a\x31\x3b\x66\x6f\x6e\x74\x2d\x66\x61\x6d\x69\
-\x6c\x79\x3a\x42\x69\x74\x73\x74\x72\x65\x61\x6d\x20\x56\x65\x72\
-\x61\x20\x53\x61\x6e\x73\x3b\x2d\x69\x6e\x6b\x73\x63\x61\x70\x65\
-\x2d\x66\x6f\x6e\x74\x2d\x73\x70\x65\x63\x69\x66\x69\x63\x61\x74\
-\x69\x6f\x6e\x3a\x42\x69\x74\x73\x74\x72\x65\x61\x6d\x20\x56\x65\
-\x72\x61\x20\x53\x61\x6e\x73\x20\x42\x6f\x6c\x64\x22\x0a\x20\x20\
-\x20\x78\x3d\x22\x31\x38\x33\x2e\x39\x35\x30\x31\x36\x22\x0a\x20\
-\x20\x20\x79\x3d\x22\x33\x30\x34\x2e\x36\x32\x22\x0a\x20\x20\x20\
-\x69\x64\x3d\x22\x74\x65\x78\x74\x33\x32\x33\x35\x22\x0a\x20\x20\
-\x20\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x6c\x69\x6e\x65\x73\x70\
-\x61\x63\x69\x6e\x67\x3d\x22\x31\x30\x30\x25\x22\x3e\x3c\x74\x73\
-\x70\x61\x6e\x0a\x20\x20\x20\x20\x20\x73\x6f\x64\x69\x70\x6f\x64\
-\x69\x3a\x72\x6f\x6c\x65\x3d\x22\x6c\x69\x6e\x65\x22\x0a\x20\x20\
-\x20\x20\x20\x69\x64\x3d\x22\x74\x73\x70\x61\x6e\x33\x32\x33\x37\
-\x22\x0a\x20\x20\x20\x20\x20\x78\x3d\x22\x31\x38\x33\x2e\x39\x35\
-\x30\x31\x36\x22\x0a\x20\x20\x20\x20\x20\x79\x3d\x22\x33\x30\x34\
-\x2e\x36\x32\x22\x0a\x20\x20\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\
-\x22\x66\x6f\x6e\x74\x2d\x73\x69\x7a\x65\x3a\x31\x37\x37\x2e\x37\
-\x38\x31\x30\x39\x37\x34\x31\x70\x78\x3b\x66\x6f\x6e\x74\x2d\x73\
-\x74\x79\x6c\x65\x3a\x6e\x6f\x72\x6d\x61\x6c\x3b\x66\x6f\x6e\x74\
-\x2d\x76\x61\x72\x69\x61\x6e\x74\x3a\x6e\x6f\x72\x6d\x61\x6c\x3b\
-\x66\x6f\x6e\x74\x2d\x77\x65\x69\x67\x68\x74\x3a\x62\x6f\x6c\x64\
-\x3b\x66\x6f\x6e\x74\x2d\x73\x74\x72\x65\x74\x63\x68\x3a\x6e\x6f\
-\x72\x6d\x61\x6c\x3b\x74\x65\x78\x74\x2d\x61\x6c\x69\x67\x6e\x3a\
-\x73\x74\x61\x72\x74\x3b\x6c\x69\x6e\x65\x2d\x68\x65\x69\x67\x68\
-\x74\x3a\x31\x30\x30\x25\x3b\x77\x72\x69\x74\x69\x6e\x67\x2d\x6d\
-\x6f\x64\x65\x3a\x6c\x72\x2d\x74\x62\x3b\x74\x65\x78\x74\x2d\x61\
-\x6e\x63\x68\x6f\x72\x3a\x73\x74\x61\x72\x74\x3b\x66\x6f\x6e\x74\
-\x2d\x66\x61\x6d\x69\x6c\x79\x3a\x42\x69\x74\x73\x74\x72\x65\x61\
-\x6d\x20\x56\x65\x72\x61\x20\x53\x61\x6e\x73\x3b\x2d\x69\x6e\x6b\
-\x73\x63\x61\x70\x65\x2d\x66\x6f\x6e\x74\x2d\x73\x70\x65\x63\x69\
-\x66\x69\x63\x61\x74\x69\x6f\x6e\x3a\x42\x69\x74\x73\x74\x72\x65\
-\x61\x6d\x20\x56\x65\x72\x61\x20\x53\x61\x6e\x73\x20\x42\x6f\x6c\
-\x64\x22\x3e\x4e\x3c\x2f\x74\x73\x70\x61\x6e\x3e\x3c\x2f\x74\x65\
-\x78\x74\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\
-\x00\x00\x17\x59\
-\x3c\
-\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
-\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x55\x54\x46\
-\x2d\x38\x22\x20\x73\x74\x61\x6e\x64\x61\x6c\x6f\x6e\x65\x3d\x22\
-\x6e\x6f\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x43\x72\x65\x61\x74\
-\x65\x64\x20\x77\x69\x74\x68\x20\x53\x6f\x64\x69\x70\x6f\x64\x69\
-\x20\x28\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x73\x6f\
-\x64\x69\x70\x6f\x64\x69\x2e\x63\x6f\x6d\x2f\x22\x29\x20\x2d\x2d\
-\x3e\x0a\x3c\x73\x76\x67\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\
-\x64\x63\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x70\x75\x72\x6c\x2e\
-\x6f\x72\x67\x2f\x64\x63\x2f\x65\x6c\x65\x6d\x65\x6e\x74\x73\x2f\
-\x31\x2e\x31\x2f\x22\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x63\
-\x63\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x63\x72\x65\x61\x74\x69\
-\x76\x65\x63\x6f\x6d\x6d\x6f\x6e\x73\x2e\x6f\x72\x67\x2f\x6e\x73\
-\x23\x22\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\
-\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\
-\x72\x67\x2f\x31\x39\x39\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\
-\x66\x2d\x73\x79\x6e\x74\x61\x78\x2d\x6e\x73\x23\x22\x0a\x20\x20\
-\x20\x78\x6d\x6c\x6e\x73\x3a\x73\x76\x67\x3d\x22\x68\x74\x74\x70\
-\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
-\x30\x30\x2f\x73\x76\x67\x22\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\
-\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\
-\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\x22\x0a\x20\x20\
-\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\x69\x6e\x6b\x3d\x22\x68\x74\
-\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\
-\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\x6b\x22\x0a\x20\x20\x20\x78\
-\x6d\x6c\x6e\x73\x3a\x73\x6f\x64\x69\x70\x6f\x64\x69\x3d\x22\x68\
-\x74\x74\x70\x3a\x2f\x2f\x73\x6f\x64\x69\x70\x6f\x64\x69\x2e\x73\
-\x6f\x75\x72\x63\x65\x66\x6f\x72\x67\x65\x2e\x6e\x65\x74\x2f\x44\
-\x54\x44\x2f\x73\x6f\x64\x69\x70\x6f\x64\x69\x2d\x30\x2e\x64\x74\
-\x64\x22\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x69\x6e\x6b\x73\
-\x63\x61\x70\x65\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\
-\x2e\x69\x6e\x6b\x73\x63\x61\x70\x65\x2e\x6f\x72\x67\x2f\x6e\x61\
-\x6d\x65\x73\x70\x61\x63\x65\x73\x2f\x69\x6e\x6b\x73\x63\x61\x70\
-\x65\x22\x0a\x20\x20\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
-\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x0a\x20\x20\x20\x77\x69\
-\x64\x74\x68\x3d\x22\x31\x32\x38\x70\x74\x22\x0a\x20\x20\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x31\x32\x38\x70\x74\x22\x0a\x20\x20\
-\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x35\x30\
-\x37\x2e\x39\x34\x36\x20\x35\x30\x37\x2e\x39\x34\x36\x22\x0a\x20\
-\x20\x20\x69\x64\x3d\x22\x73\x76\x67\x34\x39\x22\x0a\x20\x20\x20\
-\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x76\x65\x72\x73\x69\x6f\x6e\
-\x3d\x22\x30\x2e\x33\x32\x22\x0a\x20\x20\x20\x73\x6f\x64\x69\x70\
-\x6f\x64\x69\x3a\x64\x6f\x63\x6e\x61\x6d\x65\x3d\x22\x72\x6f\x69\
-\x5f\x61\x6e\x61\x6c\x79\x73\x69\x73\x2e\x73\x76\x67\x22\x0a\x20\
-\x20\x20\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x64\x6f\x63\x62\x61\
-\x73\x65\x3d\x22\x2f\x6d\x6e\x74\x2f\x77\x69\x6e\x64\x6f\x77\x73\
-\x2f\x74\x68\x65\x6d\x65\x73\x2f\x57\x6f\x72\x6b\x2f\x42\x6c\x75\
-\x65\x2d\x53\x70\x68\x65\x72\x65\x2f\x22\x0a\x20\x20\x20\x69\x6e\
-\x6b\x73\x63\x61\x70\x65\x3a\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\
-\x30\x2e\x34\x36\x22\x0a\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\
-\x65\x3a\x6f\x75\x74\x70\x75\x74\x5f\x65\x78\x74\x65\x6e\x73\x69\
-\x6f\x6e\x3d\x22\x6f\x72\x67\x2e\x69\x6e\x6b\x73\x63\x61\x70\x65\
-\x2e\x6f\x75\x74\x70\x75\x74\x2e\x73\x76\x67\x2e\x69\x6e\x6b\x73\
-\x63\x61\x70\x65\x22\x3e\x3c\x6d\x65\x74\x61\x64\x61\x74\x61\x0a\
-\x20\x20\x20\x69\x64\x3d\x22\x6d\x65\x74\x61\x64\x61\x74\x61\x32\
-\x32\x22\x3e\x3c\x72\x64\x66\x3a\x52\x44\x46\x3e\x3c\x63\x63\x3a\
-\x57\x6f\x72\x6b\x0a\x20\x20\x20\x20\x20\x20\x20\x72\x64\x66\x3a\
-\x61\x62\x6f\x75\x74\x3d\x22\x22\x3e\x3c\x64\x63\x3a\x66\x6f\x72\
-\x6d\x61\x74\x3e\x69\x6d\x61\x67\x65\x2f\x73\x76\x67\x2b\x78\x6d\
-\x6c\x3c\x2f\x64\x63\x3a\x66\x6f\x72\x6d\x61\x74\x3e\x3c\x64\x63\
-\x3a\x74\x79\x70\x65\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x72\
-\x64\x66\x3a\x72\x65\x73\x6f\x75\x72\x63\x65\x3d\x22\x68\x74\x74\
-\x70\x3a\x2f\x2f\x70\x75\x72\x6c\x2e\x6f\x72\x67\x2f\x64\x63\x2f\
-\x64\x63\x6d\x69\x74\x79\x70\x65\x2f\x53\x74\x69\x6c\x6c\x49\x6d\
-\x61\x67\x65\x22\x20\x2f\x3e\x3c\x2f\x63\x63\x3a\x57\x6f\x72\x6b\
-\x3e\x3c\x2f\x72\x64\x66\x3a\x52\x44\x46\x3e\x3c\x2f\x6d\x65\x74\
-\x61\x64\x61\x74\x61\x3e\x0a\x20\x20\x3c\x64\x65\x66\x73\x0a\x20\
-\x20\x20\x69\x64\x3d\x22\x64\x65\x66\x73\x36\x32\x22\x3e\x3c\x69\
-\x6e\x6b\x73\x63\x61\x70\x65\x3a\x70\x65\x72\x73\x70\x65\x63\x74\
-\x69\x76\x65\x0a\x20\x20\x20\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\
-\x74\x79\x70\x65\x3d\x22\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x70\
-\x65\x72\x73\x70\x33\x64\x22\x0a\x20\x20\x20\x69\x6e\x6b\x73\x63\
-\x61\x70\x65\x3a\x76\x70\x5f\x78\x3d\x22\x30\x20\x3a\x20\x38\x30\
-\x20\x3a\x20\x31\x22\x0a\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\
-\x65\x3a\x76\x70\x5f\x79\x3d\x22\x30\x20\x3a\x20\x31\x30\x30\x30\
-\x20\x3a\x20\x30\x22\x0a\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\
-\x65\x3a\x76\x70\x5f\x7a\x3d\x22\x31\x36\x30\x20\x3a\x20\x38\x30\
-\x20\x3a\x20\x31\x22\x0a\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\
-\x65\x3a\x70\x65\x72\x73\x70\x33\x64\x2d\x6f\x72\x69\x67\x69\x6e\
-\x3d\x22\x38\x30\x20\x3a\x20\x35\x33\x2e\x33\x33\x33\x33\x33\x33\
-\x20\x3a\x20\x31\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x70\x65\x72\
-\x73\x70\x65\x63\x74\x69\x76\x65\x32\x34\x22\x20\x2f\x3e\x0a\x20\
-\x20\x20\x20\x3c\x72\x61\x64\x69\x61\x6c\x47\x72\x61\x64\x69\x65\
-\x6e\x74\x0a\x20\x20\x20\x69\x64\x3d\x22\x72\x61\x64\x69\x61\x6c\
-\x47\x72\x61\x64\x69\x65\x6e\x74\x39\x33\x22\x0a\x20\x20\x20\x63\
-\x78\x3d\x22\x32\x31\x38\x2e\x39\x34\x30\x34\x22\x0a\x20\x20\x20\
-\x63\x79\x3d\x22\x32\x31\x39\x2e\x37\x37\x31\x35\x22\x0a\x20\x20\
-\x20\x72\x3d\x22\x31\x35\x30\x2e\x37\x30\x36\x33\x22\x0a\x20\x20\
-\x20\x66\x78\x3d\x22\x32\x31\x38\x2e\x39\x34\x30\x34\x22\x0a\x20\
-\x20\x20\x66\x79\x3d\x22\x32\x31\x39\x2e\x37\x37\x31\x35\x22\x0a\
-\x20\x20\x20\x67\x72\x61\x64\x69\x65\x6e\x74\x55\x6e\x69\x74\x73\
-\x3d\x22\x75\x73\x65\x72\x53\x70\x61\x63\x65\x4f\x6e\x55\x73\x65\
-\x22\x0a\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\x73\x74\x72\x6f\
-\x6b\x65\x3a\x23\x30\x30\x30\x30\x30\x30\x3b\x73\x74\x72\x6f\x6b\
-\x65\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\x30\x2e\x39\x38\x36\x30\
-\x31\x34\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3a\
-\x30\x2e\x39\x38\x31\x36\x31\x32\x3b\x22\x3e\x0a\x20\x20\x20\x20\
-\x20\x20\x3c\x73\x74\x6f\x70\x0a\x20\x20\x20\x6f\x66\x66\x73\x65\
-\x74\x3d\x22\x30\x2e\x30\x30\x30\x30\x30\x30\x22\x0a\x20\x20\x20\
-\x73\x74\x79\x6c\x65\x3d\x22\x73\x74\x6f\x70\x2d\x63\x6f\x6c\x6f\
-\x72\x3a\x23\x32\x35\x61\x36\x63\x61\x3b\x73\x74\x6f\x70\x2d\x6f\
-\x70\x61\x63\x69\x74\x79\x3a\x31\x3b\x22\x0a\x20\x20\x20\x69\x64\
-\x3d\x22\x73\x74\x6f\x70\x39\x34\x22\x20\x2f\x3e\x0a\x20\x20\x20\
-\x20\x20\x20\x3c\x73\x74\x6f\x70\x0a\x20\x20\x20\x6f\x66\x66\x73\
-\x65\x74\x3d\x22\x31\x2e\x30\x30\x30\x30\x30\x30\x22\x0a\x20\x20\
-\x20\x73\x74\x79\x6c\x65\x3d\x22\x73\x74\x6f\x70\x2d\x63\x6f\x6c\
-\x6f\x72\x3a\x23\x32\x65\x61\x36\x62\x39\x3b\x73\x74\x6f\x70\x2d\
-\x6f\x70\x61\x63\x69\x74\x79\x3a\x30\x2e\x38\x34\x33\x31\x33\x37\
-\x3b\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x73\x74\x6f\x70\x39\x35\
-\x22\x20\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x2f\x72\x61\x64\x69\x61\
-\x6c\x47\x72\x61\x64\x69\x65\x6e\x74\x3e\x0a\x20\x20\x20\x20\x3c\
-\x72\x61\x64\x69\x61\x6c\x47\x72\x61\x64\x69\x65\x6e\x74\x0a\x20\
-\x20\x20\x69\x64\x3d\x22\x61\x69\x67\x72\x64\x31\x22\x0a\x20\x20\
-\x20\x63\x78\x3d\x22\x32\x31\x38\x2e\x39\x34\x30\x34\x22\x0a\x20\
-\x20\x20\x63\x79\x3d\x22\x32\x31\x39\x2e\x37\x37\x31\x35\x22\x0a\
-\x20\x20\x20\x72\x3d\x22\x31\x35\x30\x2e\x37\x30\x36\x33\x22\x0a\
-\x20\x20\x20\x66\x78\x3d\x22\x32\x31\x38\x2e\x39\x34\x30\x34\x22\
-\x0a\x20\x20\x20\x66\x79\x3d\x22\x32\x31\x39\x2e\x37\x37\x31\x35\
-\x22\x0a\x20\x20\x20\x67\x72\x61\x64\x69\x65\x6e\x74\x55\x6e\x69\
-\x74\x73\x3d\x22\x75\x73\x65\x72\x53\x70\x61\x63\x65\x4f\x6e\x55\
-\x73\x65\x22\x0a\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\x73\x74\
-\x72\x6f\x6b\x65\x3a\x23\x30\x30\x30\x30\x30\x30\x3b\x73\x74\x72\
-\x6f\x6b\x65\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\x30\x2e\x39\x38\
-\x36\x30\x31\x34\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\
-\x68\x3a\x30\x2e\x39\x38\x31\x36\x31\x32\x3b\x22\x3e\x0a\x20\x20\
-\x20\x20\x20\x20\x3c\x73\x74\x6f\x70\x0a\x20\x20\x20\x6f\x66\x66\
-\x73\x65\x74\x3d\x22\x30\x22\x0a\x20\x20\x20\x73\x74\x79\x6c\x65\
-\x3d\x22\x73\x74\x6f\x70\x2d\x63\x6f\x6c\x6f\x72\x3a\x23\x37\x33\
-\x66\x66\x66\x66\x3b\x73\x74\x72\x6f\x6b\x65\x3a\x23\x30\x30\x30\
-\x30\x30\x30\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6f\x70\x61\x63\x69\
-\x74\x79\x3a\x30\x2e\x39\x38\x36\x30\x31\x34\x3b\x73\x74\x72\x6f\
-\x6b\x65\x2d\x77\x69\x64\x74\x68\x3a\x30\x2e\x39\x38\x31\x36\x31\
-\x32\x3b\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x73\x74\x6f\x70\x35\
-\x33\x22\x20\x2f\x3e\x0a\x20\x20\x20\x20\x20\x20\x3c\x73\x74\x6f\
-\x70\x0a\x20\x20\x20\x6f\x66\x66\x73\x65\x74\x3d\x22\x30\x2e\x32\
-\x38\x30\x39\x22\x0a\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\x73\
-\x74\x6f\x70\x2d\x63\x6f\x6c\x6f\x72\x3a\x23\x32\x45\x41\x36\x42\
-\x39\x3b\x73\x74\x72\x6f\x6b\x65\x3a\x23\x30\x30\x30\x30\x30\x30\
-\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\
-\x30\x2e\x39\x38\x36\x30\x31\x34\x3b\x73\x74\x72\x6f\x6b\x65\x2d\
-\x77\x69\x64\x74\x68\x3a\x30\x2e\x39\x38\x31\x36\x31\x32\x3b\x22\
-\x0a\x20\x20\x20\x69\x64\x3d\x22\x73\x74\x6f\x70\x35\x34\x22\x20\
-\x2f\x3e\x0a\x20\x20\x20\x20\x20\x20\x3c\x73\x74\x6f\x70\x0a\x20\
-\x20\x20\x6f\x66\x66\x73\x65\x74\x3d\x22\x31\x22\x0a\x20\x20\x20\
-\x73\x74\x79\x6c\x65\x3d\x22\x73\x74\x6f\x70\x2d\x63\x6f\x6c\x6f\
-\x72\x3a\x23\x30\x30\x36\x62\x38\x62\x3b\x73\x74\x72\x6f\x6b\x65\
-\x3a\x23\x30\x30\x30\x30\x30\x30\x3b\x73\x74\x72\x6f\x6b\x65\x2d\
-\x6f\x70\x61\x63\x69\x74\x79\x3a\x30\x2e\x39\x38\x36\x30\x31\x34\
-\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3a\x30\x2e\
-\x39\x38\x31\x36\x31\x32\x3b\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\
-\x73\x74\x6f\x70\x35\x35\x22\x20\x2f\x3e\x0a\x20\x20\x20\x20\x3c\
-\x2f\x72\x61\x64\x69\x61\x6c\x47\x72\x61\x64\x69\x65\x6e\x74\x3e\
-\x0a\x20\x20\x20\x20\x3c\x6c\x69\x6e\x65\x61\x72\x47\x72\x61\x64\
-\x69\x65\x6e\x74\x0a\x20\x20\x20\x78\x6c\x69\x6e\x6b\x3a\x68\x72\
-\x65\x66\x3d\x22\x23\x61\x69\x67\x72\x64\x31\x22\x0a\x20\x20\x20\
-\x69\x64\x3d\x22\x6c\x69\x6e\x65\x61\x72\x47\x72\x61\x64\x69\x65\
-\x6e\x74\x39\x31\x22\x0a\x20\x20\x20\x78\x31\x3d\x22\x2d\x30\x2e\
-\x32\x39\x35\x37\x32\x33\x22\x0a\x20\x20\x20\x79\x31\x3d\x22\x2d\
-\x30\x2e\x32\x36\x34\x35\x39\x31\x22\x0a\x20\x20\x20\x78\x32\x3d\
-\x22\x30\x2e\x36\x32\x32\x35\x37\x34\x22\x0a\x20\x20\x20\x79\x32\
-\x3d\x22\x30\x2e\x33\x36\x35\x37\x36\x32\x22\x0a\x20\x20\x20\x67\
-\x72\x61\x64\x69\x65\x6e\x74\x55\x6e\x69\x74\x73\x3d\x22\x6f\x62\
-\x6a\x65\x63\x74\x42\x6f\x75\x6e\x64\x69\x6e\x67\x42\x6f\x78\x22\
-\x0a\x20\x20\x20\x67\x72\x61\x64\x69\x65\x6e\x74\x54\x72\x61\x6e\
-\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\
-\x39\x39\x36\x31\x31\x34\x2c\x30\x2c\x30\x2c\x31\x2e\x30\x30\x33\
-\x39\x2c\x30\x2e\x34\x39\x36\x31\x32\x34\x2c\x30\x2e\x34\x39\x32\
-\x31\x38\x36\x29\x22\x0a\x20\x20\x20\x73\x70\x72\x65\x61\x64\x4d\
-\x65\x74\x68\x6f\x64\x3d\x22\x70\x61\x64\x22\x20\x2f\x3e\x0a\x20\
-\x20\x20\x20\x3c\x72\x61\x64\x69\x61\x6c\x47\x72\x61\x64\x69\x65\
-\x6e\x74\x0a\x20\x20\x20\x78\x6c\x69\x6e\x6b\x3a\x68\x72\x65\x66\
-\x3d\x22\x23\x61\x69\x67\x72\x64\x31\x22\x0a\x20\x20\x20\x69\x64\
-\x3d\x22\x72\x61\x64\x69\x61\x6c\x47\x72\x61\x64\x69\x65\x6e\x74\
-\x39\x32\x22\x0a\x20\x20\x20\x63\x78\x3d\x22\x2d\x38\x2e\x30\x39\
-\x33\x34\x34\x65\x2d\x30\x35\x22\x0a\x20\x20\x20\x63\x79\x3d\x22\
-\x2d\x37\x2e\x36\x38\x38\x36\x37\x65\x2d\x30\x35\x22\x0a\x20\x20\
-\x20\x66\x78\x3d\x22\x2d\x38\x2e\x30\x39\x33\x34\x34\x65\x2d\x30\
-\x35\x22\x0a\x20\x20\x20\x66\x79\x3d\x22\x2d\x37\x2e\x36\x38\x38\
-\x36\x37\x65\x2d\x30\x35\x22\x0a\x20\x20\x20\x72\x3d\x22\x30\x2e\
-\x37\x38\x39\x31\x32\x37\x22\x0a\x20\x20\x20\x67\x72\x61\x64\x69\
-\x65\x6e\x74\x55\x6e\x69\x74\x73\x3d\x22\x6f\x62\x6a\x65\x63\x74\
-\x42\x6f\x75\x6e\x64\x69\x6e\x67\x42\x6f\x78\x22\x0a\x20\x20\x20\
-\x67\x72\x61\x64\x69\x65\x6e\x74\x54\x72\x61\x6e\x73\x66\x6f\x72\
-\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x31\x2e\x30\x36\x37\x38\
-\x34\x2c\x30\x2c\x30\x2c\x30\x2e\x39\x33\x36\x34\x36\x39\x2c\x30\
-\x2e\x33\x34\x32\x32\x31\x39\x2c\x30\x2e\x33\x34\x34\x37\x31\x32\
-\x29\x22\x0a\x20\x20\x20\x73\x70\x72\x65\x61\x64\x4d\x65\x74\x68\
-\x6f\x64\x3d\x22\x70\x61\x64\x22\x20\x2f\x3e\x0a\x20\x20\x20\x20\
-\x3c\x72\x61\x64\x69\x61\x6c\x47\x72\x61\x64\x69\x65\x6e\x74\x0a\
-\x20\x20\x20\x78\x6c\x69\x6e\x6b\x3a\x68\x72\x65\x66\x3d\x22\x23\
-\x61\x69\x67\x72\x64\x31\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x72\
-\x61\x64\x69\x61\x6c\x47\x72\x61\x64\x69\x65\x6e\x74\x31\x35\x39\
-\x34\x22\x0a\x20\x20\x20\x63\x78\x3d\x22\x31\x2e\x33\x37\x31\x35\
-\x37\x65\x2d\x32\x35\x22\x0a\x20\x20\x20\x63\x79\x3d\x22\x34\x2e\
-\x38\x32\x37\x38\x33\x65\x2d\x32\x36\x22\x0a\x20\x20\x20\x66\x78\
-\x3d\x22\x31\x2e\x33\x37\x31\x35\x37\x65\x2d\x32\x35\x22\x0a\x20\
-\x20\x20\x66\x79\x3d\x22\x34\x2e\x38\x32\x37\x38\x33\x65\x2d\x32\
-\x36\x22\x0a\x20\x20\x20\x72\x3d\x22\x30\x2e\x37\x36\x36\x33\x35\
-\x38\x22\x0a\x20\x20\x20\x67\x72\x61\x64\x69\x65\x6e\x74\x55\x6e\
-\x69\x74\x73\x3d\x22\x6f\x62\x6a\x65\x63\x74\x42\x6f\x75\x6e\x64\
-\x69\x6e\x67\x42\x6f\x78\x22\x0a\x20\x20\x20\x67\x72\x61\x64\x69\
-\x65\x6e\x74\x54\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\
-\x74\x72\x69\x78\x28\x30\x2e\x39\x32\x30\x36\x37\x39\x2c\x2d\x30\
-\x2e\x30\x32\x38\x35\x38\x32\x34\x2c\x30\x2e\x30\x33\x33\x36\x31\
-\x36\x38\x2c\x31\x2e\x30\x38\x35\x31\x31\x2c\x30\x2e\x33\x37\x33\
-\x34\x33\x36\x2c\x30\x2e\x33\x38\x34\x38\x35\x34\x29\x22\x0a\x20\
-\x20\x20\x73\x70\x72\x65\x61\x64\x4d\x65\x74\x68\x6f\x64\x3d\x22\
-\x70\x61\x64\x22\x20\x2f\x3e\x0a\x20\x20\x3c\x2f\x64\x65\x66\x73\
-\x3e\x0a\x20\x20\x3c\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x6e\x61\
-\x6d\x65\x64\x76\x69\x65\x77\x0a\x20\x20\x20\x69\x64\x3d\x22\x62\
-\x61\x73\x65\x22\x0a\x20\x20\x20\x73\x68\x6f\x77\x67\x72\x69\x64\
-\x3d\x22\x66\x61\x6c\x73\x65\x22\x0a\x20\x20\x20\x69\x6e\x6b\x73\
-\x63\x61\x70\x65\x3a\x7a\x6f\x6f\x6d\x3d\x22\x32\x2e\x36\x38\x37\
-\x35\x22\x0a\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x63\
-\x78\x3d\x22\x2d\x32\x30\x2e\x31\x36\x34\x35\x34\x34\x22\x0a\x20\
-\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x63\x79\x3d\x22\x38\
-\x30\x22\x0a\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x77\
-\x69\x6e\x64\x6f\x77\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x30\
-\x30\x22\x0a\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x77\
-\x69\x6e\x64\x6f\x77\x2d\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x31\
-\x33\x37\x22\x0a\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\
-\x77\x69\x6e\x64\x6f\x77\x2d\x78\x3d\x22\x2d\x34\x22\x0a\x20\x20\
-\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x77\x69\x6e\x64\x6f\x77\
-\x2d\x79\x3d\x22\x2d\x34\x22\x0a\x20\x20\x20\x69\x6e\x6b\x73\x63\
-\x61\x70\x65\x3a\x63\x75\x72\x72\x65\x6e\x74\x2d\x6c\x61\x79\x65\
-\x72\x3d\x22\x73\x76\x67\x34\x39\x22\x3e\x0a\x20\x20\x20\x20\x3c\
-\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x67\x75\x69\x64\x65\x0a\x20\
-\x20\x20\x6f\x72\x69\x65\x6e\x74\x61\x74\x69\x6f\x6e\x3d\x22\x76\
-\x65\x72\x74\x69\x63\x61\x6c\x22\x0a\x20\x20\x20\x70\x6f\x73\x69\
-\x74\x69\x6f\x6e\x3d\x22\x37\x33\x2e\x36\x39\x30\x38\x34\x39\x22\
-\x0a\x20\x20\x20\x69\x64\x3d\x22\x73\x6f\x64\x69\x70\x6f\x64\x69\
-\x3a\x67\x75\x69\x64\x65\x31\x32\x37\x22\x20\x2f\x3e\x0a\x20\x20\
-\x20\x20\x3c\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x67\x75\x69\x64\
-\x65\x0a\x20\x20\x20\x6f\x72\x69\x65\x6e\x74\x61\x74\x69\x6f\x6e\
-\x3d\x22\x76\x65\x72\x74\x69\x63\x61\x6c\x22\x0a\x20\x20\x20\x70\
-\x6f\x73\x69\x74\x69\x6f\x6e\x3d\x22\x31\x30\x31\x2e\x31\x34\x38\
-\x32\x36\x32\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x73\x6f\x64\x69\
-\x70\x6f\x64\x69\x3a\x67\x75\x69\x64\x65\x32\x32\x22\x20\x2f\x3e\
-\x0a\x20\x20\x20\x20\x3c\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x67\
-\x75\x69\x64\x65\x0a\x20\x20\x20\x6f\x72\x69\x65\x6e\x74\x61\x74\
-\x69\x6f\x6e\x3d\x22\x76\x65\x72\x74\x69\x63\x61\x6c\x22\x0a\x20\
-\x20\x20\x70\x6f\x73\x69\x74\x69\x6f\x6e\x3d\x22\x35\x37\x2e\x39\
-\x34\x33\x32\x31\x38\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x73\x6f\
-\x64\x69\x70\x6f\x64\x69\x3a\x67\x75\x69\x64\x65\x32\x33\x22\x20\
-\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x73\x6f\x64\x69\x70\x6f\x64\x69\
-\x3a\x67\x75\x69\x64\x65\x0a\x20\x20\x20\x6f\x72\x69\x65\x6e\x74\
-\x61\x74\x69\x6f\x6e\x3d\x22\x76\x65\x72\x74\x69\x63\x61\x6c\x22\
-\x0a\x20\x20\x20\x70\x6f\x73\x69\x74\x69\x6f\x6e\x3d\x22\x33\x30\
-\x2e\x38\x38\x39\x35\x38\x39\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\
-\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x67\x75\x69\x64\x65\x31\x35\
-\x39\x33\x22\x20\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x73\x6f\x64\x69\
-\x70\x6f\x64\x69\x3a\x67\x75\x69\x64\x65\x0a\x20\x20\x20\x6f\x72\
-\x69\x65\x6e\x74\x61\x74\x69\x6f\x6e\x3d\x22\x68\x6f\x72\x69\x7a\
-\x6f\x6e\x74\x61\x6c\x22\x0a\x20\x20\x20\x70\x6f\x73\x69\x74\x69\
-\x6f\x6e\x3d\x22\x36\x31\x2e\x39\x38\x31\x30\x37\x31\x22\x0a\x20\
-\x20\x20\x69\x64\x3d\x22\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x67\
-\x75\x69\x64\x65\x31\x36\x36\x32\x22\x20\x2f\x3e\x0a\x20\x20\x3c\
-\x2f\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x6e\x61\x6d\x65\x64\x76\
-\x69\x65\x77\x3e\x0a\x20\x20\x0a\x20\x20\x0a\x3c\x72\x65\x63\x74\
-\x0a\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\x6f\x70\x61\x63\x69\
-\x74\x79\x3a\x31\x3b\x66\x69\x6c\x6c\x3a\x23\x61\x34\x63\x39\x65\
-\x65\x3b\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\x30\
-\x2e\x37\x30\x31\x39\x36\x30\x37\x37\x39\x39\x39\x39\x39\x39\x39\
-\x39\x35\x3b\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3a\x6e\x6f\x6e\
-\x7a\x65\x72\x6f\x3b\x73\x74\x72\x6f\x6b\x65\x3a\x23\x61\x34\x63\
-\x39\x65\x65\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\
-\x3a\x36\x2e\x34\x37\x33\x31\x33\x36\x38\x34\x3b\x73\x74\x72\x6f\
-\x6b\x65\x2d\x6c\x69\x6e\x65\x6a\x6f\x69\x6e\x3a\x72\x6f\x75\x6e\
-\x64\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6d\x69\x74\x65\x72\x6c\x69\
-\x6d\x69\x74\x3a\x34\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x64\x61\x73\
-\x68\x61\x72\x72\x61\x79\x3a\x6e\x6f\x6e\x65\x3b\x73\x74\x72\x6f\
-\x6b\x65\x2d\x64\x61\x73\x68\x6f\x66\x66\x73\x65\x74\x3a\x30\x3b\
-\x73\x74\x72\x6f\x6b\x65\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\x31\
-\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x72\x65\x63\x74\x32\x33\x39\
-\x37\x22\x0a\x20\x20\x20\x77\x69\x64\x74\x68\x3d\x22\x34\x34\x36\
-\x2e\x31\x32\x35\x35\x38\x22\x0a\x20\x20\x20\x68\x65\x69\x67\x68\
-\x74\x3d\x22\x34\x33\x39\x2e\x30\x33\x37\x39\x36\x22\x0a\x20\x20\
-\x20\x78\x3d\x22\x33\x30\x2e\x39\x31\x30\x32\x31\x32\x22\x0a\x20\
-\x20\x20\x79\x3d\x22\x33\x30\x2e\x39\x31\x30\x32\x30\x32\x22\x20\
-\x2f\x3e\x3c\x74\x65\x78\x74\x0a\x20\x20\x20\x78\x6d\x6c\x3a\x73\
-\x70\x61\x63\x65\x3d\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x0a\
-\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\x66\x6f\x6e\x74\x2d\x73\
-\x69\x7a\x65\x3a\x32\x34\x70\x78\x3b\x66\x6f\x6e\x74\x2d\x73\x74\
-\x79\x6c\x65\x3a\x6e\x6f\x72\x6d\x61\x6c\x3b\x66\x6f\x6e\x74\x2d\
-\x76\x61\x72\x69\x61\x6e\x74\x3a\x6e\x6f\x72\x6d\x61\x6c\x3b\x66\
-\x6f\x6e\x74\x2d\x77\x65\x69\x67\x68\x74\x3a\x62\x6f\x6c\x64\x3b\
-\x66\x6f\x6e\x74\x2d\x73\x74\x72\x65\x74\x63\x68\x3a\x6e\x6f\x72\
-\x6d\x61\x6c\x3b\x74\x65\x78\x74\x2d\x61\x6c\x69\x67\x6e\x3a\x73\
-\x74\x61\x72\x74\x3b\x6c\x69\x6e\x65\x2d\x68\x65\x69\x67\x68\x74\
-\x3a\x31\x30\x30\x25\x3b\x77\x72\x69\x74\x69\x6e\x67\x2d\x6d\x6f\
-\x64\x65\x3a\x6c\x72\x2d\x74\x62\x3b\x74\x65\x78\x74\x2d\x61\x6e\
-\x63\x68\x6f\x72\x3a\x73\x74\x61\x72\x74\x3b\x66\x69\x6c\x6c\x3a\
-\x23\x30\x30\x30\x30\x30\x30\x3b\x66\x69\x6c\x6c\x2d\x6f\x70\x61\
-\x63\x69\x74\x79\x3a\x31\x3b\x73\x74\x72\x6f\x6b\x65\x3a\x6e\x6f\
-\x6e\x65\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3a\
-\x31\x70\x78\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\
-\x61\x70\x3a\x62\x75\x74\x74\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6c\
-\x69\x6e\x65\x6a\x6f\x69\x6e\x3a\x6d\x69\x74\x65\x72\x3b\x73\x74\
-\x72\x6f\x6b\x65\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\x31\x3b\x66\
-\x6f\x6e\x74\x2d\x66\x61\x6d\x69\x6c\x79\x3a\x63\x6d\x65\x78\x31\
-\x30\x3b\x2d\x69\x6e\x6b\x73\x63\x61\x70\x65\x2d\x66\x6f\x6e\x74\
-\x2d\x73\x70\x65\x63\x69\x66\x69\x63\x61\x74\x69\x6f\x6e\x3a\x63\
-\x6d\x65\x78\x31\x30\x20\x4d\x65\x64\x69\x75\x6d\x22\x0a\x20\x20\
-\x20\x78\x3d\x22\x32\x30\x30\x2e\x38\x31\x35\x38\x36\x22\x0a\x20\
-\x20\x20\x79\x3d\x22\x32\x35\x33\x2e\x39\x37\x33\x30\x31\x22\x0a\
-\x20\x20\x20\x69\x64\x3d\x22\x74\x65\x78\x74\x33\x31\x36\x39\x22\
-\x0a\x20\x20\x20\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x6c\x69\x6e\
-\x65\x73\x70\x61\x63\x69\x6e\x67\x3d\x22\x31\x30\x30\x25\x22\x3e\
-\x3c\x74\x73\x70\x61\x6e\x0a\x20\x20\x20\x20\x20\x73\x6f\x64\x69\
-\x70\x6f\x64\x69\x3a\x72\x6f\x6c\x65\x3d\x22\x6c\x69\x6e\x65\x22\
-\x0a\x20\x20\x20\x20\x20\x69\x64\x3d\x22\x74\x73\x70\x61\x6e\x33\
-\x31\x37\x31\x22\x0a\x20\x20\x20\x20\x20\x78\x3d\x22\x32\x30\x30\
-\x2e\x38\x31\x35\x38\x36\x22\x0a\x20\x20\x20\x20\x20\x79\x3d\x22\
-\x32\x35\x33\x2e\x39\x37\x33\x30\x31\x22\x20\x2f\x3e\x3c\x2f\x74\
-\x65\x78\x74\x3e\x0a\x0a\x0a\x3c\x74\x65\x78\x74\x0a\x20\x20\x20\
-\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\x22\x70\x72\x65\x73\x65\
-\x72\x76\x65\x22\x0a\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\x66\
-\x6f\x6e\x74\x2d\x73\x69\x7a\x65\x3a\x31\x37\x37\x2e\x37\x38\x31\
-\x31\x3b\x66\x6f\x6e\x74\x2d\x73\x74\x79\x6c\x65\x3a\x6e\x6f\x72\
-\x6d\x61\x6c\x3b\x66\x6f\x6e\x74\x2d\x76\x61\x72\x69\x61\x6e\x74\
-\x3a\x6e\x6f\x72\x6d\x61\x6c\x3b\x66\x6f\x6e\x74\x2d\x77\x65\x69\
-\x67\x68\x74\x3a\x62\x6f\x6c\x64\x3b\x66\x6f\x6e\x74\x2d\x73\x74\
-\x72\x65\x74\x63\x68\x3a\x6e\x6f\x72\x6d\x61\x6c\x3b\x74\x65\x78\
-\x74\x2d\x61\x6c\x69\x67\x6e\x3a\x73\x74\x61\x72\x74\x3b\x6c\x69\
-\x6e\x65\x2d\x68\x65\x69\x67\x68\x74\x3a\x31\x30\x30\x25\x3b\x77\
-\x72\x69\x74\x69\x6e\x67\x2d\x6d\x6f\x64\x65\x3a\x6c\x72\x2d\x74\
-\x62\x3b\x74\x65\x78\x74\x2d\x61\x6e\x63\x68\x6f\x72\x3a\x73\x74\
-\x61\x72\x74\x3b\x66\x69\x6c\x6c\x3a\x23\x30\x30\x30\x30\x30\x30\
-\x3b\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\x31\x3b\
-\x73\x74\x72\x6f\x6b\x65\x3a\x6e\x6f\x6e\x65\x3b\x73\x74\x72\x6f\
-\x6b\x65\x2d\x77\x69\x64\x74\x68\x3a\x31\x70\x78\x3b\x73\x74\x72\
-\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3a\x62\x75\x74\x74\
-\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x6a\x6f\x69\x6e\
-\x3a\x6d\x69\x74\x65\x72\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6f\x70\
-\x61\x63\x69\x74\x79\x3a\x31\x3b\x66\x6f\x6e\x74\x2d\x66\x61\x6d\
-\x69\x6c\x79\x3a\x63\x6d\x65\x78\x31\x30\x3b\x2d\x69\x6e\x6b\x73\
-\x63\x61\x70\x65\x2d\x66\x6f\x6e\x74\x2d\x73\x70\x65\x63\x69\x66\
-\x69\x63\x61\x74\x69\x6f\x6e\x3a\x63\x6d\x65\x78\x31\x30\x20\x4d\
-\x65\x64\x69\x75\x6d\x22\x0a\x20\x20\x20\x78\x3d\x22\x31\x35\x36\
-\x2e\x36\x37\x35\x39\x33\x22\x0a\x20\x20\x20\x79\x3d\x22\x2d\x33\
-\x36\x30\x2e\x36\x34\x31\x36\x36\x22\x0a\x20\x20\x20\x69\x64\x3d\
-\x22\x74\x65\x78\x74\x33\x31\x37\x33\x22\x0a\x20\x20\x20\x73\x6f\
-\x64\x69\x70\x6f\x64\x69\x3a\x6c\x69\x6e\x65\x73\x70\x61\x63\x69\
-\x6e\x67\x3d\x22\x31\x30\x30\x25\x22\x0a\x20\x20\x20\x74\x72\x61\
-\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\x65\x28\x31\x2c\
-\x2d\x31\x29\x22\x3e\x3c\x74\x73\x70\x61\x6e\x0a\x20\x20\x20\x20\
-\x20\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x72\x6f\x6c\x65\x3d\x22\
-\x6c\x69\x6e\x65\x22\x0a\x20\x20\x20\x20\x20\x69\x64\x3d\x22\x74\
-\x73\x70\x61\x6e\x33\x31\x37\x35\x22\x0a\x20\x20\x20\x20\x20\x78\
-\x3d\x22\x31\x35\x36\x2e\x36\x37\x35\x39\x33\x22\x0a\x20\x20\x20\
-\x20\x20\x79\x3d\x22\x2d\x33\x36\x30\x2e\x36\x34\x31\x36\x36\x22\
-\x3e\x61\x3c\x2f\x74\x73\x70\x61\x6e\x3e\x3c\x2f\x74\x65\x78\x74\
-\x3e\x0a\x0a\x0a\x3c\x72\x65\x63\x74\x0a\x20\x20\x20\x73\x74\x79\
-\x6c\x65\x3d\x22\x6f\x70\x61\x63\x69\x74\x79\x3a\x31\x3b\x66\x69\
-\x6c\x6c\x3a\x6e\x6f\x6e\x65\x3b\x66\x69\x6c\x6c\x2d\x6f\x70\x61\
-\x63\x69\x74\x79\x3a\x30\x2e\x37\x30\x31\x39\x36\x30\x37\x38\x3b\
-\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3a\x6e\x6f\x6e\x7a\x65\x72\
-\x6f\x3b\x73\x74\x72\x6f\x6b\x65\x3a\x23\x35\x35\x35\x35\x35\x35\
-\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3a\x36\x2e\
-\x37\x34\x33\x37\x34\x31\x39\x39\x3b\x73\x74\x72\x6f\x6b\x65\x2d\
-\x6c\x69\x6e\x65\x6a\x6f\x69\x6e\x3a\x72\x6f\x75\x6e\x64\x3b\x73\
-\x74\x72\x6f\x6b\x65\x2d\x6d\x69\x74\x65\x72\x6c\x69\x6d\x69\x74\
-\x3a\x34\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x64\x61\x73\x68\x61\x72\
-\x72\x61\x79\x3a\x32\x30\x2e\x32\x33\x31\x32\x32\x35\x37\x34\x2c\
-\x20\x36\x2e\x37\x34\x33\x37\x34\x31\x39\x31\x3b\x73\x74\x72\x6f\
-\x6b\x65\x2d\x64\x61\x73\x68\x6f\x66\x66\x73\x65\x74\x3a\x30\x3b\
-\x73\x74\x72\x6f\x6b\x65\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\x31\
-\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x72\x65\x63\x74\x32\x33\x39\
-\x38\x22\x0a\x20\x20\x20\x77\x69\x64\x74\x68\x3d\x22\x33\x36\x33\
-\x2e\x34\x38\x31\x31\x31\x22\x0a\x20\x20\x20\x68\x65\x69\x67\x68\
-\x74\x3d\x22\x33\x32\x30\x2e\x39\x35\x35\x34\x31\x22\x0a\x20\x20\
-\x20\x78\x3d\x22\x37\x39\x2e\x33\x32\x30\x30\x36\x31\x22\x0a\x20\
-\x20\x20\x79\x3d\x22\x38\x30\x2e\x35\x30\x31\x33\x33\x35\x22\x20\
-\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
-\x00\x00\x18\x21\
-\x3c\
-\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
-\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x55\x54\x46\
-\x2d\x38\x22\x20\x73\x74\x61\x6e\x64\x61\x6c\x6f\x6e\x65\x3d\x22\
-\x6e\x6f\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x43\x72\x65\x61\x74\
-\x65\x64\x20\x77\x69\x74\x68\x20\x53\x6f\x64\x69\x70\x6f\x64\x69\
-\x20\x28\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x73\x6f\
-\x64\x69\x70\x6f\x64\x69\x2e\x63\x6f\x6d\x2f\x22\x29\x20\x2d\x2d\
-\x3e\x0a\x3c\x73\x76\x67\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\
-\x64\x63\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x70\x75\x72\x6c\x2e\
-\x6f\x72\x67\x2f\x64\x63\x2f\x65\x6c\x65\x6d\x65\x6e\x74\x73\x2f\
-\x31\x2e\x31\x2f\x22\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x63\
-\x63\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x63\x72\x65\x61\x74\x69\
-\x76\x65\x63\x6f\x6d\x6d\x6f\x6e\x73\x2e\x6f\x72\x67\x2f\x6e\x73\
-\x23\x22\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\
-\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\
-\x72\x67\x2f\x31\x39\x39\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\
-\x66\x2d\x73\x79\x6e\x74\x61\x78\x2d\x6e\x73\x23\x22\x0a\x20\x20\
-\x20\x78\x6d\x6c\x6e\x73\x3a\x73\x76\x67\x3d\x22\x68\x74\x74\x70\
-\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
-\x30\x30\x2f\x73\x76\x67\x22\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\
-\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\
-\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\x22\x0a\x20\x20\
-\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\x69\x6e\x6b\x3d\x22\x68\x74\
-\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\
-\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\x6b\x22\x0a\x20\x20\x20\x78\
-\x6d\x6c\x6e\x73\x3a\x73\x6f\x64\x69\x70\x6f\x64\x69\x3d\x22\x68\
-\x74\x74\x70\x3a\x2f\x2f\x73\x6f\x64\x69\x70\x6f\x64\x69\x2e\x73\
-\x6f\x75\x72\x63\x65\x66\x6f\x72\x67\x65\x2e\x6e\x65\x74\x2f\x44\
-\x54\x44\x2f\x73\x6f\x64\x69\x70\x6f\x64\x69\x2d\x30\x2e\x64\x74\
-\x64\x22\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x69\x6e\x6b\x73\
-\x63\x61\x70\x65\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\
-\x2e\x69\x6e\x6b\x73\x63\x61\x70\x65\x2e\x6f\x72\x67\x2f\x6e\x61\
-\x6d\x65\x73\x70\x61\x63\x65\x73\x2f\x69\x6e\x6b\x73\x63\x61\x70\
-\x65\x22\x0a\x20\x20\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
-\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x0a\x20\x20\x20\x77\x69\
-\x64\x74\x68\x3d\x22\x31\x32\x38\x70\x74\x22\x0a\x20\x20\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x31\x32\x38\x70\x74\x22\x0a\x20\x20\
-\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x35\x30\
-\x37\x2e\x39\x34\x36\x20\x35\x30\x37\x2e\x39\x34\x36\x22\x0a\x20\
-\x20\x20\x69\x64\x3d\x22\x73\x76\x67\x34\x39\x22\x0a\x20\x20\x20\
-\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x76\x65\x72\x73\x69\x6f\x6e\
-\x3d\x22\x30\x2e\x33\x32\x22\x0a\x20\x20\x20\x73\x6f\x64\x69\x70\
-\x6f\x64\x69\x3a\x64\x6f\x63\x6e\x61\x6d\x65\x3d\x22\x76\x69\x65\
-\x77\x6c\x69\x6d\x69\x74\x73\x5f\x70\x6f\x70\x75\x70\x2e\x73\x76\
-\x67\x22\x0a\x20\x20\x20\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x64\
-\x6f\x63\x62\x61\x73\x65\x3d\x22\x2f\x6d\x6e\x74\x2f\x77\x69\x6e\
-\x64\x6f\x77\x73\x2f\x74\x68\x65\x6d\x65\x73\x2f\x57\x6f\x72\x6b\
-\x2f\x42\x6c\x75\x65\x2d\x53\x70\x68\x65\x72\x65\x2f\x22\x0a\x20\
-\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x76\x65\x72\x73\x69\
-\x6f\x6e\x3d\x22\x30\x2e\x34\x36\x22\x0a\x20\x20\x20\x69\x6e\x6b\
-\x73\x63\x61\x70\x65\x3a\x6f\x75\x74\x70\x75\x74\x5f\x65\x78\x74\
-\x65\x6e\x73\x69\x6f\x6e\x3d\x22\x6f\x72\x67\x2e\x69\x6e\x6b\x73\
-\x63\x61\x70\x65\x2e\x6f\x75\x74\x70\x75\x74\x2e\x73\x76\x67\x2e\
-\x69\x6e\x6b\x73\x63\x61\x70\x65\x22\x3e\x3c\x6d\x65\x74\x61\x64\
-\x61\x74\x61\x0a\x20\x20\x20\x69\x64\x3d\x22\x6d\x65\x74\x61\x64\
-\x61\x74\x61\x32\x32\x22\x3e\x3c\x72\x64\x66\x3a\x52\x44\x46\x3e\
-\x3c\x63\x63\x3a\x57\x6f\x72\x6b\x0a\x20\x20\x20\x20\x20\x20\x20\
-\x72\x64\x66\x3a\x61\x62\x6f\x75\x74\x3d\x22\x22\x3e\x3c\x64\x63\
-\x3a\x66\x6f\x72\x6d\x61\x74\x3e\x69\x6d\x61\x67\x65\x2f\x73\x76\
-\x67\x2b\x78\x6d\x6c\x3c\x2f\x64\x63\x3a\x66\x6f\x72\x6d\x61\x74\
-\x3e\x3c\x64\x63\x3a\x74\x79\x70\x65\x0a\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x72\x64\x66\x3a\x72\x65\x73\x6f\x75\x72\x63\x65\x3d\
-\x22\x68\x74\x74\x70\x3a\x2f\x2f\x70\x75\x72\x6c\x2e\x6f\x72\x67\
-\x2f\x64\x63\x2f\x64\x63\x6d\x69\x74\x79\x70\x65\x2f\x53\x74\x69\
-\x6c\x6c\x49\x6d\x61\x67\x65\x22\x20\x2f\x3e\x3c\x2f\x63\x63\x3a\
-\x57\x6f\x72\x6b\x3e\x3c\x2f\x72\x64\x66\x3a\x52\x44\x46\x3e\x3c\
-\x2f\x6d\x65\x74\x61\x64\x61\x74\x61\x3e\x0a\x20\x20\x3c\x64\x65\
-\x66\x73\x0a\x20\x20\x20\x69\x64\x3d\x22\x64\x65\x66\x73\x36\x32\
-\x22\x3e\x3c\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x70\x65\x72\x73\
-\x70\x65\x63\x74\x69\x76\x65\x0a\x20\x20\x20\x73\x6f\x64\x69\x70\
-\x6f\x64\x69\x3a\x74\x79\x70\x65\x3d\x22\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x3a\x70\x65\x72\x73\x70\x33\x64\x22\x0a\x20\x20\x20\x69\
-\x6e\x6b\x73\x63\x61\x70\x65\x3a\x76\x70\x5f\x78\x3d\x22\x30\x20\
-\x3a\x20\x38\x30\x20\x3a\x20\x31\x22\x0a\x20\x20\x20\x69\x6e\x6b\
-\x73\x63\x61\x70\x65\x3a\x76\x70\x5f\x79\x3d\x22\x30\x20\x3a\x20\
-\x31\x30\x30\x30\x20\x3a\x20\x30\x22\x0a\x20\x20\x20\x69\x6e\x6b\
-\x73\x63\x61\x70\x65\x3a\x76\x70\x5f\x7a\x3d\x22\x31\x36\x30\x20\
-\x3a\x20\x38\x30\x20\x3a\x20\x31\x22\x0a\x20\x20\x20\x69\x6e\x6b\
-\x73\x63\x61\x70\x65\x3a\x70\x65\x72\x73\x70\x33\x64\x2d\x6f\x72\
-\x69\x67\x69\x6e\x3d\x22\x38\x30\x20\x3a\x20\x35\x33\x2e\x33\x33\
-\x33\x33\x33\x33\x20\x3a\x20\x31\x22\x0a\x20\x20\x20\x69\x64\x3d\
-\x22\x70\x65\x72\x73\x70\x65\x63\x74\x69\x76\x65\x32\x34\x22\x20\
-\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x72\x61\x64\x69\x61\x6c\x47\x72\
-\x61\x64\x69\x65\x6e\x74\x0a\x20\x20\x20\x69\x64\x3d\x22\x72\x61\
-\x64\x69\x61\x6c\x47\x72\x61\x64\x69\x65\x6e\x74\x39\x33\x22\x0a\
-\x20\x20\x20\x63\x78\x3d\x22\x32\x31\x38\x2e\x39\x34\x30\x34\x22\
-\x0a\x20\x20\x20\x63\x79\x3d\x22\x32\x31\x39\x2e\x37\x37\x31\x35\
-\x22\x0a\x20\x20\x20\x72\x3d\x22\x31\x35\x30\x2e\x37\x30\x36\x33\
-\x22\x0a\x20\x20\x20\x66\x78\x3d\x22\x32\x31\x38\x2e\x39\x34\x30\
-\x34\x22\x0a\x20\x20\x20\x66\x79\x3d\x22\x32\x31\x39\x2e\x37\x37\
-\x31\x35\x22\x0a\x20\x20\x20\x67\x72\x61\x64\x69\x65\x6e\x74\x55\
-\x6e\x69\x74\x73\x3d\x22\x75\x73\x65\x72\x53\x70\x61\x63\x65\x4f\
-\x6e\x55\x73\x65\x22\x0a\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\
-\x73\x74\x72\x6f\x6b\x65\x3a\x23\x30\x30\x30\x30\x30\x30\x3b\x73\
-\x74\x72\x6f\x6b\x65\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\x30\x2e\
-\x39\x38\x36\x30\x31\x34\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\
-\x64\x74\x68\x3a\x30\x2e\x39\x38\x31\x36\x31\x32\x3b\x22\x3e\x0a\
-\x20\x20\x20\x20\x20\x20\x3c\x73\x74\x6f\x70\x0a\x20\x20\x20\x6f\
-\x66\x66\x73\x65\x74\x3d\x22\x30\x2e\x30\x30\x30\x30\x30\x30\x22\
-\x0a\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\x73\x74\x6f\x70\x2d\
-\x63\x6f\x6c\x6f\x72\x3a\x23\x32\x35\x61\x36\x63\x61\x3b\x73\x74\
-\x6f\x70\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\x31\x3b\x22\x0a\x20\
-\x20\x20\x69\x64\x3d\x22\x73\x74\x6f\x70\x39\x34\x22\x20\x2f\x3e\
-\x0a\x20\x20\x20\x20\x20\x20\x3c\x73\x74\x6f\x70\x0a\x20\x20\x20\
-\x6f\x66\x66\x73\x65\x74\x3d\x22\x31\x2e\x30\x30\x30\x30\x30\x30\
-\x22\x0a\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\x73\x74\x6f\x70\
-\x2d\x63\x6f\x6c\x6f\x72\x3a\x23\x32\x65\x61\x36\x62\x39\x3b\x73\
-\x74\x6f\x70\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\x30\x2e\x38\x34\
-\x33\x31\x33\x37\x3b\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x73\x74\
-\x6f\x70\x39\x35\x22\x20\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x2f\x72\
-\x61\x64\x69\x61\x6c\x47\x72\x61\x64\x69\x65\x6e\x74\x3e\x0a\x20\
-\x20\x20\x20\x3c\x72\x61\x64\x69\x61\x6c\x47\x72\x61\x64\x69\x65\
-\x6e\x74\x0a\x20\x20\x20\x69\x64\x3d\x22\x61\x69\x67\x72\x64\x31\
-\x22\x0a\x20\x20\x20\x63\x78\x3d\x22\x32\x31\x38\x2e\x39\x34\x30\
-\x34\x22\x0a\x20\x20\x20\x63\x79\x3d\x22\x32\x31\x39\x2e\x37\x37\
-\x31\x35\x22\x0a\x20\x20\x20\x72\x3d\x22\x31\x35\x30\x2e\x37\x30\
-\x36\x33\x22\x0a\x20\x20\x20\x66\x78\x3d\x22\x32\x31\x38\x2e\x39\
-\x34\x30\x34\x22\x0a\x20\x20\x20\x66\x79\x3d\x22\x32\x31\x39\x2e\
-\x37\x37\x31\x35\x22\x0a\x20\x20\x20\x67\x72\x61\x64\x69\x65\x6e\
-\x74\x55\x6e\x69\x74\x73\x3d\x22\x75\x73\x65\x72\x53\x70\x61\x63\
-\x65\x4f\x6e\x55\x73\x65\x22\x0a\x20\x20\x20\x73\x74\x79\x6c\x65\
-\x3d\x22\x73\x74\x72\x6f\x6b\x65\x3a\x23\x30\x30\x30\x30\x30\x30\
-\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\
-\x30\x2e\x39\x38\x36\x30\x31\x34\x3b\x73\x74\x72\x6f\x6b\x65\x2d\
-\x77\x69\x64\x74\x68\x3a\x30\x2e\x39\x38\x31\x36\x31\x32\x3b\x22\
-\x3e\x0a\x20\x20\x20\x20\x20\x20\x3c\x73\x74\x6f\x70\x0a\x20\x20\
-\x20\x6f\x66\x66\x73\x65\x74\x3d\x22\x30\x22\x0a\x20\x20\x20\x73\
-\x74\x79\x6c\x65\x3d\x22\x73\x74\x6f\x70\x2d\x63\x6f\x6c\x6f\x72\
-\x3a\x23\x37\x33\x66\x66\x66\x66\x3b\x73\x74\x72\x6f\x6b\x65\x3a\
-\x23\x30\x30\x30\x30\x30\x30\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6f\
-\x70\x61\x63\x69\x74\x79\x3a\x30\x2e\x39\x38\x36\x30\x31\x34\x3b\
-\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3a\x30\x2e\x39\
-\x38\x31\x36\x31\x32\x3b\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x73\
-\x74\x6f\x70\x35\x33\x22\x20\x2f\x3e\x0a\x20\x20\x20\x20\x20\x20\
-\x3c\x73\x74\x6f\x70\x0a\x20\x20\x20\x6f\x66\x66\x73\x65\x74\x3d\
-\x22\x30\x2e\x32\x38\x30\x39\x22\x0a\x20\x20\x20\x73\x74\x79\x6c\
-\x65\x3d\x22\x73\x74\x6f\x70\x2d\x63\x6f\x6c\x6f\x72\x3a\x23\x32\
-\x45\x41\x36\x42\x39\x3b\x73\x74\x72\x6f\x6b\x65\x3a\x23\x30\x30\
-\x30\x30\x30\x30\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6f\x70\x61\x63\
-\x69\x74\x79\x3a\x30\x2e\x39\x38\x36\x30\x31\x34\x3b\x73\x74\x72\
-\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3a\x30\x2e\x39\x38\x31\x36\
-\x31\x32\x3b\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x73\x74\x6f\x70\
-\x35\x34\x22\x20\x2f\x3e\x0a\x20\x20\x20\x20\x20\x20\x3c\x73\x74\
-\x6f\x70\x0a\x20\x20\x20\x6f\x66\x66\x73\x65\x74\x3d\x22\x31\x22\
-\x0a\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\x73\x74\x6f\x70\x2d\
-\x63\x6f\x6c\x6f\x72\x3a\x23\x30\x30\x36\x62\x38\x62\x3b\x73\x74\
-\x72\x6f\x6b\x65\x3a\x23\x30\x30\x30\x30\x30\x30\x3b\x73\x74\x72\
-\x6f\x6b\x65\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\x30\x2e\x39\x38\
-\x36\x30\x31\x34\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\
-\x68\x3a\x30\x2e\x39\x38\x31\x36\x31\x32\x3b\x22\x0a\x20\x20\x20\
-\x69\x64\x3d\x22\x73\x74\x6f\x70\x35\x35\x22\x20\x2f\x3e\x0a\x20\
-\x20\x20\x20\x3c\x2f\x72\x61\x64\x69\x61\x6c\x47\x72\x61\x64\x69\
-\x65\x6e\x74\x3e\x0a\x20\x20\x20\x20\x3c\x6c\x69\x6e\x65\x61\x72\
-\x47\x72\x61\x64\x69\x65\x6e\x74\x0a\x20\x20\x20\x78\x6c\x69\x6e\
-\x6b\x3a\x68\x72\x65\x66\x3d\x22\x23\x61\x69\x67\x72\x64\x31\x22\
-\x0a\x20\x20\x20\x69\x64\x3d\x22\x6c\x69\x6e\x65\x61\x72\x47\x72\
-\x61\x64\x69\x65\x6e\x74\x39\x31\x22\x0a\x20\x20\x20\x78\x31\x3d\
-\x22\x2d\x30\x2e\x32\x39\x35\x37\x32\x33\x22\x0a\x20\x20\x20\x79\
-\x31\x3d\x22\x2d\x30\x2e\x32\x36\x34\x35\x39\x31\x22\x0a\x20\x20\
-\x20\x78\x32\x3d\x22\x30\x2e\x36\x32\x32\x35\x37\x34\x22\x0a\x20\
-\x20\x20\x79\x32\x3d\x22\x30\x2e\x33\x36\x35\x37\x36\x32\x22\x0a\
-\x20\x20\x20\x67\x72\x61\x64\x69\x65\x6e\x74\x55\x6e\x69\x74\x73\
-\x3d\x22\x6f\x62\x6a\x65\x63\x74\x42\x6f\x75\x6e\x64\x69\x6e\x67\
-\x42\x6f\x78\x22\x0a\x20\x20\x20\x67\x72\x61\x64\x69\x65\x6e\x74\
-\x54\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\
-\x78\x28\x30\x2e\x39\x39\x36\x31\x31\x34\x2c\x30\x2c\x30\x2c\x31\
-\x2e\x30\x30\x33\x39\x2c\x30\x2e\x34\x39\x36\x31\x32\x34\x2c\x30\
-\x2e\x34\x39\x32\x31\x38\x36\x29\x22\x0a\x20\x20\x20\x73\x70\x72\
-\x65\x61\x64\x4d\x65\x74\x68\x6f\x64\x3d\x22\x70\x61\x64\x22\x20\
-\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x72\x61\x64\x69\x61\x6c\x47\x72\
-\x61\x64\x69\x65\x6e\x74\x0a\x20\x20\x20\x78\x6c\x69\x6e\x6b\x3a\
-\x68\x72\x65\x66\x3d\x22\x23\x61\x69\x67\x72\x64\x31\x22\x0a\x20\
-\x20\x20\x69\x64\x3d\x22\x72\x61\x64\x69\x61\x6c\x47\x72\x61\x64\
-\x69\x65\x6e\x74\x39\x32\x22\x0a\x20\x20\x20\x63\x78\x3d\x22\x2d\
-\x38\x2e\x30\x39\x33\x34\x34\x65\x2d\x30\x35\x22\x0a\x20\x20\x20\
-\x63\x79\x3d\x22\x2d\x37\x2e\x36\x38\x38\x36\x37\x65\x2d\x30\x35\
-\x22\x0a\x20\x20\x20\x66\x78\x3d\x22\x2d\x38\x2e\x30\x39\x33\x34\
-\x34\x65\x2d\x30\x35\x22\x0a\x20\x20\x20\x66\x79\x3d\x22\x2d\x37\
-\x2e\x36\x38\x38\x36\x37\x65\x2d\x30\x35\x22\x0a\x20\x20\x20\x72\
-\x3d\x22\x30\x2e\x37\x38\x39\x31\x32\x37\x22\x0a\x20\x20\x20\x67\
-\x72\x61\x64\x69\x65\x6e\x74\x55\x6e\x69\x74\x73\x3d\x22\x6f\x62\
-\x6a\x65\x63\x74\x42\x6f\x75\x6e\x64\x69\x6e\x67\x42\x6f\x78\x22\
-\x0a\x20\x20\x20\x67\x72\x61\x64\x69\x65\x6e\x74\x54\x72\x61\x6e\
-\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x31\x2e\
-\x30\x36\x37\x38\x34\x2c\x30\x2c\x30\x2c\x30\x2e\x39\x33\x36\x34\
-\x36\x39\x2c\x30\x2e\x33\x34\x32\x32\x31\x39\x2c\x30\x2e\x33\x34\
-\x34\x37\x31\x32\x29\x22\x0a\x20\x20\x20\x73\x70\x72\x65\x61\x64\
-\x4d\x65\x74\x68\x6f\x64\x3d\x22\x70\x61\x64\x22\x20\x2f\x3e\x0a\
-\x20\x20\x20\x20\x3c\x72\x61\x64\x69\x61\x6c\x47\x72\x61\x64\x69\
-\x65\x6e\x74\x0a\x20\x20\x20\x78\x6c\x69\x6e\x6b\x3a\x68\x72\x65\
-\x66\x3d\x22\x23\x61\x69\x67\x72\x64\x31\x22\x0a\x20\x20\x20\x69\
-\x64\x3d\x22\x72\x61\x64\x69\x61\x6c\x47\x72\x61\x64\x69\x65\x6e\
-\x74\x31\x35\x39\x34\x22\x0a\x20\x20\x20\x63\x78\x3d\x22\x31\x2e\
-\x33\x37\x31\x35\x37\x65\x2d\x32\x35\x22\x0a\x20\x20\x20\x63\x79\
-\x3d\x22\x34\x2e\x38\x32\x37\x38\x33\x65\x2d\x32\x36\x22\x0a\x20\
-\x20\x20\x66\x78\x3d\x22\x31\x2e\x33\x37\x31\x35\x37\x65\x2d\x32\
-\x35\x22\x0a\x20\x20\x20\x66\x79\x3d\x22\x34\x2e\x38\x32\x37\x38\
-\x33\x65\x2d\x32\x36\x22\x0a\x20\x20\x20\x72\x3d\x22\x30\x2e\x37\
-\x36\x36\x33\x35\x38\x22\x0a\x20\x20\x20\x67\x72\x61\x64\x69\x65\
-\x6e\x74\x55\x6e\x69\x74\x73\x3d\x22\x6f\x62\x6a\x65\x63\x74\x42\
-\x6f\x75\x6e\x64\x69\x6e\x67\x42\x6f\x78\x22\x0a\x20\x20\x20\x67\
-\x72\x61\x64\x69\x65\x6e\x74\x54\x72\x61\x6e\x73\x66\x6f\x72\x6d\
-\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x39\x32\x30\x36\x37\
-\x39\x2c\x2d\x30\x2e\x30\x32\x38\x35\x38\x32\x34\x2c\x30\x2e\x30\
-\x33\x33\x36\x31\x36\x38\x2c\x31\x2e\x30\x38\x35\x31\x31\x2c\x30\
-\x2e\x33\x37\x33\x34\x33\x36\x2c\x30\x2e\x33\x38\x34\x38\x35\x34\
-\x29\x22\x0a\x20\x20\x20\x73\x70\x72\x65\x61\x64\x4d\x65\x74\x68\
-\x6f\x64\x3d\x22\x70\x61\x64\x22\x20\x2f\x3e\x0a\x20\x20\x3c\x2f\
-\x64\x65\x66\x73\x3e\x0a\x20\x20\x3c\x73\x6f\x64\x69\x70\x6f\x64\
-\x69\x3a\x6e\x61\x6d\x65\x64\x76\x69\x65\x77\x0a\x20\x20\x20\x69\
-\x64\x3d\x22\x62\x61\x73\x65\x22\x0a\x20\x20\x20\x73\x68\x6f\x77\
-\x67\x72\x69\x64\x3d\x22\x66\x61\x6c\x73\x65\x22\x0a\x20\x20\x20\
-\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x7a\x6f\x6f\x6d\x3d\x22\x32\
-\x2e\x36\x38\x37\x35\x22\x0a\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x3a\x63\x78\x3d\x22\x38\x2e\x33\x37\x35\x30\x36\x39\x39\
-\x22\x0a\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x63\x79\
-\x3d\x22\x31\x33\x39\x2e\x31\x33\x36\x31\x37\x22\x0a\x20\x20\x20\
-\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x77\x69\x6e\x64\x6f\x77\x2d\
-\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x30\x30\x22\x0a\x20\x20\x20\
-\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x77\x69\x6e\x64\x6f\x77\x2d\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x31\x33\x37\x22\x0a\x20\x20\
-\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x77\x69\x6e\x64\x6f\x77\
-\x2d\x78\x3d\x22\x2d\x34\x22\x0a\x20\x20\x20\x69\x6e\x6b\x73\x63\
-\x61\x70\x65\x3a\x77\x69\x6e\x64\x6f\x77\x2d\x79\x3d\x22\x2d\x34\
-\x22\x0a\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x63\x75\
-\x72\x72\x65\x6e\x74\x2d\x6c\x61\x79\x65\x72\x3d\x22\x73\x76\x67\
-\x34\x39\x22\x3e\x0a\x20\x20\x20\x20\x3c\x73\x6f\x64\x69\x70\x6f\
-\x64\x69\x3a\x67\x75\x69\x64\x65\x0a\x20\x20\x20\x6f\x72\x69\x65\
-\x6e\x74\x61\x74\x69\x6f\x6e\x3d\x22\x76\x65\x72\x74\x69\x63\x61\
-\x6c\x22\x0a\x20\x20\x20\x70\x6f\x73\x69\x74\x69\x6f\x6e\x3d\x22\
-\x37\x33\x2e\x36\x39\x30\x38\x34\x39\x22\x0a\x20\x20\x20\x69\x64\
-\x3d\x22\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x67\x75\x69\x64\x65\
-\x31\x32\x37\x22\x20\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x73\x6f\x64\
-\x69\x70\x6f\x64\x69\x3a\x67\x75\x69\x64\x65\x0a\x20\x20\x20\x6f\
-\x72\x69\x65\x6e\x74\x61\x74\x69\x6f\x6e\x3d\x22\x76\x65\x72\x74\
-\x69\x63\x61\x6c\x22\x0a\x20\x20\x20\x70\x6f\x73\x69\x74\x69\x6f\
-\x6e\x3d\x22\x31\x30\x31\x2e\x31\x34\x38\x32\x36\x32\x22\x0a\x20\
-\x20\x20\x69\x64\x3d\x22\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x67\
-\x75\x69\x64\x65\x32\x32\x22\x20\x2f\x3e\x0a\x20\x20\x20\x20\x3c\
-\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x67\x75\x69\x64\x65\x0a\x20\
-\x20\x20\x6f\x72\x69\x65\x6e\x74\x61\x74\x69\x6f\x6e\x3d\x22\x76\
-\x65\x72\x74\x69\x63\x61\x6c\x22\x0a\x20\x20\x20\x70\x6f\x73\x69\
-\x74\x69\x6f\x6e\x3d\x22\x35\x37\x2e\x39\x34\x33\x32\x31\x38\x22\
-\x0a\x20\x20\x20\x69\x64\x3d\x22\x73\x6f\x64\x69\x70\x6f\x64\x69\
-\x3a\x67\x75\x69\x64\x65\x32\x33\x22\x20\x2f\x3e\x0a\x20\x20\x20\
-\x20\x3c\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x67\x75\x69\x64\x65\
-\x0a\x20\x20\x20\x6f\x72\x69\x65\x6e\x74\x61\x74\x69\x6f\x6e\x3d\
-\x22\x76\x65\x72\x74\x69\x63\x61\x6c\x22\x0a\x20\x20\x20\x70\x6f\
-\x73\x69\x74\x69\x6f\x6e\x3d\x22\x33\x30\x2e\x38\x38\x39\x35\x38\
-\x39\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x73\x6f\x64\x69\x70\x6f\
-\x64\x69\x3a\x67\x75\x69\x64\x65\x31\x35\x39\x33\x22\x20\x2f\x3e\
-\x0a\x20\x20\x20\x20\x3c\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x67\
-\x75\x69\x64\x65\x0a\x20\x20\x20\x6f\x72\x69\x65\x6e\x74\x61\x74\
-\x69\x6f\x6e\x3d\x22\x68\x6f\x72\x69\x7a\x6f\x6e\x74\x61\x6c\x22\
-\x0a\x20\x20\x20\x70\x6f\x73\x69\x74\x69\x6f\x6e\x3d\x22\x36\x31\
-\x2e\x39\x38\x31\x30\x37\x31\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\
-\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x67\x75\x69\x64\x65\x31\x36\
-\x36\x32\x22\x20\x2f\x3e\x0a\x20\x20\x3c\x2f\x73\x6f\x64\x69\x70\
-\x6f\x64\x69\x3a\x6e\x61\x6d\x65\x64\x76\x69\x65\x77\x3e\x0a\x20\
-\x20\x0a\x20\x20\x0a\x3c\x74\x65\x78\x74\x0a\x20\x20\x20\x78\x6d\
-\x6c\x3a\x73\x70\x61\x63\x65\x3d\x22\x70\x72\x65\x73\x65\x72\x76\
-\x65\x22\x0a\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\x66\x6f\x6e\
-\x74\x2d\x73\x69\x7a\x65\x3a\x32\x34\x70\x78\x3b\x66\x6f\x6e\x74\
-\x2d\x73\x74\x79\x6c\x65\x3a\x6e\x6f\x72\x6d\x61\x6c\x3b\x66\x6f\
-\x6e\x74\x2d\x76\x61\x72\x69\x61\x6e\x74\x3a\x6e\x6f\x72\x6d\x61\
-\x6c\x3b\x66\x6f\x6e\x74\x2d\x77\x65\x69\x67\x68\x74\x3a\x6e\x6f\
-\x72\x6d\x61\x6c\x3b\x66\x6f\x6e\x74\x2d\x73\x74\x72\x65\x74\x63\
-\x68\x3a\x6e\x6f\x72\x6d\x61\x6c\x3b\x74\x65\x78\x74\x2d\x61\x6c\
-\x69\x67\x6e\x3a\x73\x74\x61\x72\x74\x3b\x6c\x69\x6e\x65\x2d\x68\
-\x65\x69\x67\x68\x74\x3a\x31\x30\x30\x25\x3b\x77\x72\x69\x74\x69\
-\x6e\x67\x2d\x6d\x6f\x64\x65\x3a\x6c\x72\x2d\x74\x62\x3b\x74\x65\
-\x78\x74\x2d\x61\x6e\x63\x68\x6f\x72\x3a\x73\x74\x61\x72\x74\x3b\
-\x66\x69\x6c\x6c\x3a\x23\x30\x30\x30\x30\x30\x30\x3b\x66\x69\x6c\
-\x6c\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\x31\x3b\x73\x74\x72\x6f\
-\x6b\x65\x3a\x6e\x6f\x6e\x65\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x77\
-\x69\x64\x74\x68\x3a\x31\x70\x78\x3b\x73\x74\x72\x6f\x6b\x65\x2d\
-\x6c\x69\x6e\x65\x63\x61\x70\x3a\x62\x75\x74\x74\x3b\x73\x74\x72\
-\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x6a\x6f\x69\x6e\x3a\x6d\x69\x74\
-\x65\x72\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6f\x70\x61\x63\x69\x74\
-\x79\x3a\x31\x3b\x66\x6f\x6e\x74\x2d\x66\x61\x6d\x69\x6c\x79\x3a\
-\x42\x69\x74\x73\x74\x72\x65\x61\x6d\x20\x56\x65\x72\x61\x20\x53\
-\x61\x6e\x73\x3b\x2d\x69\x6e\x6b\x73\x63\x61\x70\x65\x2d\x66\x6f\
-\x6e\x74\x2d\x73\x70\x65\x63\x69\x66\x69\x63\x61\x74\x69\x6f\x6e\
-\x3a\x42\x69\x74\x73\x74\x72\x65\x61\x6d\x20\x56\x65\x72\x61\x20\
-\x53\x61\x6e\x73\x22\x0a\x20\x20\x20\x78\x3d\x22\x32\x30\x30\x2e\
-\x38\x31\x35\x38\x36\x22\x0a\x20\x20\x20\x79\x3d\x22\x32\x35\x33\
-\x2e\x39\x37\x33\x30\x31\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x74\
-\x65\x78\x74\x33\x31\x36\x39\x22\x0a\x20\x20\x20\x73\x6f\x64\x69\
-\x70\x6f\x64\x69\x3a\x6c\x69\x6e\x65\x73\x70\x61\x63\x69\x6e\x67\
-\x3d\x22\x31\x30\x30\x25\x22\x3e\x3c\x74\x73\x70\x61\x6e\x0a\x20\
-\x20\x20\x20\x20\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x72\x6f\x6c\
-\x65\x3d\x22\x6c\x69\x6e\x65\x22\x0a\x20\x20\x20\x20\x20\x69\x64\
-\x3d\x22\x74\x73\x70\x61\x6e\x33\x31\x37\x31\x22\x0a\x20\x20\x20\
-\x20\x20\x78\x3d\x22\x32\x30\x30\x2e\x38\x31\x35\x38\x36\x22\x0a\
-\x20\x20\x20\x20\x20\x79\x3d\x22\x32\x35\x33\x2e\x39\x37\x33\x30\
-\x31\x22\x20\x2f\x3e\x3c\x2f\x74\x65\x78\x74\x3e\x0a\x0a\x0a\x0a\
-\x0a\x0a\x0a\x3c\x74\x65\x78\x74\x0a\x20\x20\x20\x78\x6d\x6c\x3a\
-\x73\x70\x61\x63\x65\x3d\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\
-\x0a\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\x66\x6f\x6e\x74\x2d\
-\x73\x69\x7a\x65\x3a\x32\x30\x33\x2e\x31\x37\x38\x34\x30\x35\x37\
-\x36\x70\x78\x3b\x66\x6f\x6e\x74\x2d\x73\x74\x79\x6c\x65\x3a\x6e\
-\x6f\x72\x6d\x61\x6c\x3b\x66\x6f\x6e\x74\x2d\x76\x61\x72\x69\x61\
-\x6e\x74\x3a\x6e\x6f\x72\x6d\x61\x6c\x3b\x66\x6f\x6e\x74\x2d\x77\
-\x65\x69\x67\x68\x74\x3a\x6e\x6f\x72\x6d\x61\x6c\x3b\x66\x6f\x6e\
-\x74\x2d\x73\x74\x72\x65\x74\x63\x68\x3a\x6e\x6f\x72\x6d\x61\x6c\
-\x3b\x74\x65\x78\x74\x2d\x61\x6c\x69\x67\x6e\x3a\x73\x74\x61\x72\
-\x74\x3b\x6c\x69\x6e\x65\x2d\x68\x65\x69\x67\x68\x74\x3a\x31\x30\
-\x30\x25\x3b\x77\x72\x69\x74\x69\x6e\x67\x2d\x6d\x6f\x64\x65\x3a\
-\x6c\x72\x2d\x74\x62\x3b\x74\x65\x78\x74\x2d\x61\x6e\x63\x68\x6f\
-\x72\x3a\x73\x74\x61\x72\x74\x3b\x66\x69\x6c\x6c\x3a\x23\x30\x30\
-\x30\x30\x30\x30\x3b\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\x69\x74\
-\x79\x3a\x31\x3b\x73\x74\x72\x6f\x6b\x65\x3a\x6e\x6f\x6e\x65\x3b\
-\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3a\x31\x70\x78\
-\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3a\
-\x62\x75\x74\x74\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\
-\x6a\x6f\x69\x6e\x3a\x6d\x69\x74\x65\x72\x3b\x73\x74\x72\x6f\x6b\
-\x65\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\x31\x3b\x66\x6f\x6e\x74\
-\x2d\x66\x61\x6d\x69\x6c\x79\x3a\x42\x69\x74\x73\x74\x72\x65\x61\
-\x6d\x20\x56\x65\x72\x61\x20\x53\x61\x6e\x73\x3b\x2d\x69\x6e\x6b\
-\x73\x63\x61\x70\x65\x2d\x66\x6f\x6e\x74\x2d\x73\x70\x65\x63\x69\
-\x66\x69\x63\x61\x74\x69\x6f\x6e\x3a\x42\x69\x74\x73\x74\x72\x65\
-\x61\x6d\x20\x56\x65\x72\x61\x20\x53\x61\x6e\x73\x22\x0a\x20\x20\
-\x20\x78\x3d\x22\x2d\x39\x2e\x37\x30\x36\x31\x39\x39\x36\x22\x0a\
-\x20\x20\x20\x79\x3d\x22\x33\x39\x31\x2e\x32\x37\x37\x36\x38\x22\
-\x0a\x20\x20\x20\x69\x64\x3d\x22\x74\x65\x78\x74\x32\x33\x39\x39\
-\x22\x0a\x20\x20\x20\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x6c\x69\
-\x6e\x65\x73\x70\x61\x63\x69\x6e\x67\x3d\x22\x31\x30\x30\x25\x22\
-\x3e\x3c\x74\x73\x70\x61\x6e\x0a\x20\x20\x20\x20\x20\x73\x6f\x64\
-\x69\x70\x6f\x64\x69\x3a\x72\x6f\x6c\x65\x3d\x22\x6c\x69\x6e\x65\
-\x22\x0a\x20\x20\x20\x20\x20\x69\x64\x3d\x22\x74\x73\x70\x61\x6e\
-\x32\x34\x30\x31\x22\x0a\x20\x20\x20\x20\x20\x78\x3d\x22\x2d\x39\
-\x2e\x37\x30\x36\x31\x39\x39\x36\x22\x0a\x20\x20\x20\x20\x20\x79\
-\x3d\x22\x33\x39\x31\x2e\x32\x37\x37\x36\x38\x22\x0a\x20\x20\x20\
-\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\x66\x6f\x6e\x74\x2d\x73\x69\
-\x7a\x65\x3a\x33\x37\x30\x70\x78\x3b\x66\x6f\x6e\x74\x2d\x73\x74\
-\x79\x6c\x65\x3a\x6e\x6f\x72\x6d\x61\x6c\x3b\x66\x6f\x6e\x74\x2d\
-\x76\x61\x72\x69\x61\x6e\x74\x3a\x6e\x6f\x72\x6d\x61\x6c\x3b\x66\
-\x6f\x6e\x74\x2d\x77\x65\x69\x67\x68\x74\x3a\x6e\x6f\x72\x6d\x61\
-\x6c\x3b\x66\x6f\x6e\x74\x2d\x73\x74\x72\x65\x74\x63\x68\x3a\x6e\
-\x6f\x72\x6d\x61\x6c\x3b\x74\x65\x78\x74\x2d\x61\x6c\x69\x67\x6e\
-\x3a\x73\x74\x61\x72\x74\x3b\x6c\x69\x6e\x65\x2d\x68\x65\x69\x67\
-\x68\x74\x3a\x31\x30\x30\x25\x3b\x77\x72\x69\x74\x69\x6e\x67\x2d\
-\x6d\x6f\x64\x65\x3a\x6c\x72\x2d\x74\x62\x3b\x74\x65\x78\x74\x2d\
-\x61\x6e\x63\x68\x6f\x72\x3a\x73\x74\x61\x72\x74\x3b\x66\x6f\x6e\
-\x74\x2d\x66\x61\x6d\x69\x6c\x79\x3a\x42\x69\x74\x73\x74\x72\x65\
-\x61\x6d\x20\x56\x65\x72\x61\x20\x53\x61\x6e\x73\x3b\x2d\x69\x6e\
-\x6b\x73\x63\x61\x70\x65\x2d\x66\x6f\x6e\x74\x2d\x73\x70\x65\x63\
-\x69\x66\x69\x63\x61\x74\x69\x6f\x6e\x3a\x42\x69\x74\x73\x74\x72\
-\x65\x61\x6d\x20\x56\x65\x72\x61\x20\x53\x61\x6e\x73\x22\x3e\x3f\
-\x2d\x3f\x3c\x2f\x74\x73\x70\x61\x6e\x3e\x3c\x2f\x74\x65\x78\x74\
-\x3e\x0a\x3c\x74\x65\x78\x74\x0a\x20\x20\x20\x78\x6d\x6c\x3a\x73\
-\x70\x61\x63\x65\x3d\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x0a\
-\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\x66\x6f\x6e\x74\x2d\x73\
-\x69\x7a\x65\x3a\x34\x38\x70\x78\x3b\x66\x6f\x6e\x74\x2d\x73\x74\
-\x79\x6c\x65\x3a\x6e\x6f\x72\x6d\x61\x6c\x3b\x66\x6f\x6e\x74\x2d\
-\x76\x61\x72\x69\x61\x6e\x74\x3a\x6e\x6f\x72\x6d\x61\x6c\x3b\x66\
-\x6f\x6e\x74\x2d\x77\x65\x69\x67\x68\x74\x3a\x6e\x6f\x72\x6d\x61\
-\x6c\x3b\x66\x6f\x6e\x74\x2d\x73\x74\x72\x65\x74\x63\x68\x3a\x6e\
-\x6f\x72\x6d\x61\x6c\x3b\x74\x65\x78\x74\x2d\x61\x6c\x69\x67\x6e\
-\x3a\x73\x74\x61\x72\x74\x3b\x6c\x69\x6e\x65\x2d\x68\x65\x69\x67\
-\x68\x74\x3a\x31\x30\x30\x25\x3b\x77\x72\x69\x74\x69\x6e\x67\x2d\
-\x6d\x6f\x64\x65\x3a\x6c\x72\x2d\x74\x62\x3b\x74\x65\x78\x74\x2d\
-\x61\x6e\x63\x68\x6f\x72\x3a\x73\x74\x61\x72\x74\x3b\x66\x69\x6c\
-\x6c\x3a\x23\x30\x30\x30\x30\x30\x30\x3b\x66\x69\x6c\x6c\x2d\x6f\
-\x70\x61\x63\x69\x74\x79\x3a\x31\x3b\x73\x74\x72\x6f\x6b\x65\x3a\
-\x6e\x6f\x6e\x65\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\
-\x68\x3a\x31\x70\x78\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\
-\x65\x63\x61\x70\x3a\x62\x75\x74\x74\x3b\x73\x74\x72\x6f\x6b\x65\
-\x2d\x6c\x69\x6e\x65\x6a\x6f\x69\x6e\x3a\x6d\x69\x74\x65\x72\x3b\
-\x73\x74\x72\x6f\x6b\x65\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\x31\
-\x3b\x66\x6f\x6e\x74\x2d\x66\x61\x6d\x69\x6c\x79\x3a\x43\x6f\x75\
-\x72\x69\x65\x72\x20\x4e\x65\x77\x3b\x2d\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2d\x66\x6f\x6e\x74\x2d\x73\x70\x65\x63\x69\x66\x69\x63\
-\x61\x74\x69\x6f\x6e\x3a\x43\x6f\x75\x72\x69\x65\x72\x20\x4e\x65\
-\x77\x22\x0a\x20\x20\x20\x78\x3d\x22\x32\x31\x32\x2e\x36\x32\x38\
-\x35\x36\x22\x0a\x20\x20\x20\x79\x3d\x22\x32\x34\x36\x2e\x38\x38\
-\x35\x33\x38\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x74\x65\x78\x74\
-\x32\x34\x30\x33\x22\x0a\x20\x20\x20\x73\x6f\x64\x69\x70\x6f\x64\
-\x69\x3a\x6c\x69\x6e\x65\x73\x70\x61\x63\x69\x6e\x67\x3d\x22\x31\
-\x30\x30\x25\x22\x3e\x3c\x74\x73\x70\x61\x6e\x0a\x20\x20\x20\x20\
-\x20\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x72\x6f\x6c\x65\x3d\x22\
-\x6c\x69\x6e\x65\x22\x0a\x20\x20\x20\x20\x20\x69\x64\x3d\x22\x74\
-\x73\x70\x61\x6e\x32\x34\x30\x35\x22\x0a\x20\x20\x20\x20\x20\x78\
-\x3d\x22\x32\x31\x32\x2e\x36\x32\x38\x35\x36\x22\x0a\x20\x20\x20\
-\x20\x20\x79\x3d\x22\x32\x34\x36\x2e\x38\x38\x35\x33\x38\x22\x20\
-\x2f\x3e\x3c\x2f\x74\x65\x78\x74\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\
-\
-\x00\x00\x70\x78\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\x00\x00\x5c\x72\xa8\x66\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xaf\xc8\x37\x05\x8a\xe9\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x70\x0a\x49\x44\x41\x54\x78\xda\xec\
-\x7d\x09\xd8\x24\x55\x75\xf6\x3d\xf5\x2d\x33\x03\x03\x83\x28\x8b\
-\x82\x20\x06\x25\x6a\xa2\xc6\x3d\x1a\x63\x7e\x23\xd1\x68\xc4\x68\
-\x7c\x24\xc1\x98\x18\x35\xfa\x47\xe3\x12\x57\x34\x2e\x31\xe4\x8f\
-\x44\x4d\x8c\x8a\xb8\xa0\x28\x88\x1b\x51\xa2\x02\x22\x20\xa8\xb8\
-\xb1\xba\xb0\xc8\x2a\xfb\x36\x0b\x30\xeb\xb7\x76\xd7\xf9\xab\xaa\
-\xeb\xde\x7b\xee\xb9\xe7\xde\xba\xd5\xdd\xdf\xac\x55\xf3\xd4\xf4\
-\x56\x5f\x77\x75\xf5\x3d\xe7\xbc\xe7\x3d\x1b\x20\xa2\xea\xb6\x6e\
-\xeb\xb6\x5d\x73\xcb\xba\x4b\xd0\x6d\xdd\xd6\x29\x80\x6e\xeb\xb6\
-\x6e\xeb\x14\x40\xb7\x75\x5b\xb7\x75\x0a\xa0\xdb\xba\xad\xdb\x76\
-\x89\x0d\xba\x4b\xd0\x6d\xdd\xb6\xf3\x6e\x4d\x24\x3f\x7c\xf9\xbf\
-\x1e\xa4\x76\x5f\x36\xaf\xfa\x79\x07\x06\xba\xad\xdb\x76\xb4\xed\
-\x45\xaf\x5f\x3b\xd2\xdf\x4f\x76\x97\xb0\xdb\xba\x6d\xe7\xdd\x8e\
-\xfe\xd7\x13\x83\xaf\x5d\x70\xf1\x4d\x9d\x02\x18\xd7\x76\xe5\xe2\
-\xa7\x1e\x0b\x0a\x26\x8a\xbb\x8f\x1f\x60\x2b\xeb\x5d\x01\x48\xbe\
-\x57\xc4\xfb\x02\x68\xf0\xdb\x76\x2c\xcf\x0d\x15\x72\x5c\xca\x5f\
-\xbb\xac\x78\xea\xa6\x47\x4d\xbe\xfa\xde\x6e\x25\x8d\xfb\xda\xcb\
-\xdb\x1d\x77\x6f\x50\xeb\x37\xce\x76\x0a\x60\x68\x81\x5f\xf8\xe4\
-\x3e\x85\xa0\x1e\x59\xdc\x7d\x5e\x21\x90\xcf\x28\x44\x72\x85\x16\
-\x5c\x2a\xbf\x9e\xb0\x0a\xc2\x1d\x14\xe8\x26\x45\xb0\xa3\xe8\x01\
-\x84\xc8\xb2\xc4\xfa\x1a\xa0\xba\xba\x7f\xc2\xad\x85\x42\xf8\x59\
-\xa1\x0c\xbe\x5e\x3c\x75\x66\xa1\x10\x66\xbb\x95\x36\xfe\xad\xd7\
-\xcb\xd5\xaf\xaf\x5f\xd3\xb9\x00\xc3\x6c\x57\xcc\x7f\x72\xff\x62\
-\xb5\xbe\xbf\x10\xda\x57\x16\x6b\x76\x02\xb4\x14\x6a\xe1\xa7\xeb\
-\x1b\x80\xdc\x05\xd1\x96\x73\x71\x70\x0f\xc3\xb8\x92\xc0\x1d\x40\
-\x13\x14\xd2\x0c\x01\x7d\x30\x00\x02\x60\x2e\x05\x22\x1e\x54\xdc\
-\x39\xa8\xb8\x6a\x47\x16\x2f\x6d\xb8\x72\xf1\xd3\xdf\xe8\xf7\x16\
-\x8f\x7d\xcc\x8a\x7f\xbc\xbe\x5b\x79\x43\x5f\x7e\x6f\xbb\xfe\xe6\
-\x75\x6a\x6e\x7e\xb1\x53\x00\x6d\xb6\xcb\xe7\x3f\xb9\xb2\x90\xb3\
-\xb7\x15\x0b\xf5\xcd\xc5\x22\x5d\xa9\x85\x0e\xa9\xe0\xd3\xc7\xd4\
-\x05\x50\x10\x92\xfd\x38\x12\x20\xef\x11\x57\x24\x91\x37\xdd\xd6\
-\x00\x94\x9d\xef\x80\x95\x06\x63\xf5\xad\x1b\x00\xd5\x3f\xd4\x7f\
-\x83\xb8\xaa\xf8\xff\x15\x13\x53\xd3\x7f\x7d\xf9\xc2\xa7\x3e\xbf\
-\x65\xd3\xfa\x77\x7f\xe8\x5f\x5e\x79\xcf\x69\x1f\xdf\xa7\xcb\x5d\
-\x1f\x61\xdb\x32\x33\xaf\x7e\x73\xcb\x3d\xe6\x71\x47\xfd\xa7\x08\
-\xff\xdc\xf1\x87\x15\x4b\xf3\x17\xc5\xdd\xf7\x16\xfb\x4a\xba\xa4\
-\x81\x59\x38\xd0\x3b\xda\x5d\x82\xee\xa0\xf8\x0e\xec\x18\xf0\x5e\
-\xaf\x9e\x41\x65\x76\xff\x3d\xd0\xec\x59\xf1\xc4\xb6\xda\xed\x79\
-\xb8\xe7\x37\x38\x67\xf2\x0f\xea\xdd\x3c\xae\x5f\xc7\x72\x61\xea\
-\xd7\xd4\x74\x01\xb3\x5e\xb3\xc7\x9e\xf7\xbb\xe9\x5f\x3e\x74\xea\
-\xbb\xbf\x77\xcb\xd1\xbb\x77\x2b\xb2\x25\x04\x20\xfb\xd5\x37\xac\
-\x75\x42\x83\x9d\x02\x68\xd8\x7e\x35\x77\xfc\x73\x8a\x55\x78\x69\
-\x61\xd9\x0f\xad\x96\x31\x64\xc6\xca\x5b\x69\x26\xbb\x16\x45\xb0\
-\x3b\x97\x84\x81\xfc\x82\xb3\x87\xde\x47\x99\xd7\xc8\xc3\x42\xca\
-\x20\xe3\x7f\x93\x39\x3b\x7f\x7f\xf7\xb3\xb2\x91\xf6\xd8\x7b\x87\
-\xdf\x1f\xcc\x79\x0f\xce\x5d\x99\xef\x09\xf5\xeb\xfa\xb8\x52\x8b\
-\x20\x7d\x2d\xcb\x4a\x65\xb0\x32\x9b\x98\xfc\xd7\x7d\x1f\xf8\x90\
-\x9f\x5e\x74\xdf\x07\x0f\x7b\xd1\xeb\xd7\x76\x39\x2c\x89\x24\xa0\
-\xde\xef\x59\x3f\xa3\xee\x5e\xbb\xd1\x79\xbd\x53\x00\x91\xed\x97\
-\xb3\xc7\xff\x43\x71\x73\x06\x96\x90\x1f\x81\x41\x6c\x62\x73\xb1\
-\x76\x6c\x91\x08\x02\x72\x25\x0c\xce\x2e\xd9\x6f\xd7\x96\xdb\x1f\
-\xce\x7d\x2d\x63\xef\x93\xd5\x3b\x57\x18\xe1\x1d\xd9\xc2\x68\xbb\
-\x37\xbd\xbf\xac\xc8\x32\xb3\xdb\xf3\x06\xc2\x93\xf0\x63\xf5\x6b\
-\xf6\xba\x0e\x14\x02\x3c\x7a\xc5\x6e\x7b\x5e\x76\xf4\xbf\x7d\xf1\
-\xf0\x42\x09\x4c\x74\x8a\x20\x0d\x00\xe4\x39\xaa\xab\xae\x5b\xed\
-\xbd\xde\x29\x80\xa0\xf0\x7f\xe2\xa8\x62\x65\x1d\x5f\xdc\x9d\x00\
-\x24\xa2\xcf\x60\xbd\xaf\x16\xac\x2d\x74\x25\x07\x19\x1c\x46\xe7\
-\x39\x0e\xd5\x38\x74\x16\x61\x3f\xf3\xaf\x25\xf7\x83\xee\x25\xac\
-\x5e\xca\x5d\xfc\x5c\xe9\x1a\x19\xf7\x86\xfe\x93\xdd\x22\x30\x2e\
-\x53\xed\x12\x54\x14\x01\xec\xbe\x62\xf9\x6e\xa7\x1f\xfd\xaf\x27\
-\xbd\xac\xfc\x7d\x3a\x25\xd0\xac\x01\x6e\xbb\x73\xbd\xda\xb8\x79\
-\xae\x53\x00\x29\xdb\x2f\x66\x3f\xf1\xd8\x62\x99\x7d\x76\xc0\x56\
-\xd7\x96\x88\x12\x72\x8e\x35\x35\xe2\x6e\xe0\xbd\xb7\xe4\x05\xcb\
-\x1b\xb2\xc6\xee\xf3\xae\x7b\x00\x59\xc6\xac\xab\x2b\x54\x9e\xf5\
-\xcd\x32\x67\xa7\x6e\xc9\x52\xec\xfc\xf3\x14\x3b\x5f\xed\xf3\x73\
-\xd7\x69\xf0\xbd\x32\xe2\x3e\x08\x28\x02\x06\xd7\x43\xbf\x67\xf1\
-\x79\xd3\xcb\x77\x5b\xf9\xd9\xb7\xbc\xf7\xb3\x2f\x2a\xc9\xec\x4e\
-\x09\x84\x5d\x80\x85\x5e\x5f\x5d\x7b\xa3\x9c\x31\xd8\x29\x00\xb6\
-\xfd\x7c\xe6\xb8\xe9\xe2\xaa\x7d\xb5\xb8\x74\x2b\x1c\x06\xbe\xd0\
-\xa2\x25\x79\x82\x94\xcd\xae\x2d\x3b\x55\xb6\x95\xe1\x27\xc7\xa2\
-\x22\x8f\x9d\x63\xf5\x73\xd6\xf0\x9b\xe7\x95\x9c\xc0\x21\xbd\x8f\
-\x16\x26\xd1\x65\x18\x15\xeb\x8f\x63\x17\xdc\x1a\x39\x32\x60\x11\
-\x0d\xd2\xeb\x69\xae\x3f\xfd\x31\xcc\xdd\x89\x95\x2b\x57\x9d\xf4\
-\xfa\xa3\x8f\x7b\x7a\xa7\x04\x42\x0a\x00\xd5\xf5\x37\xad\x53\x8b\
-\x85\x12\xe8\x14\x40\xda\x15\x7b\x5b\xf1\xff\x61\x8e\xef\x89\x34\
-\x66\x6d\x7d\xfe\x81\x0e\x00\x57\x80\x15\x21\xf9\x1c\xe1\xb6\x7f\
-\x6b\x77\xf6\xb7\x14\x46\x20\x98\xc7\xe2\xfb\x50\xd2\x0d\xc9\xae\
-\xc2\x3e\x7e\x13\xef\x30\xae\x3d\xfa\xf9\xe6\x3c\x33\x2f\x56\xa0\
-\xbf\x1f\xd4\x5c\x01\x00\xe1\x04\x20\x33\xdf\x5b\x7f\xcf\x2a\x6c\
-\x08\xd9\xf2\xbd\xee\xb7\xdf\x29\x2f\x3a\xea\x8d\x07\x74\x4a\xc0\
-\xdf\x66\x66\x16\xd5\xad\x05\xfc\x0f\x6d\x9d\x02\x20\xdb\x65\x9b\
-\x8f\xdb\xbf\x58\x60\xff\xec\x08\x1c\xd2\x5c\x35\x59\xf8\x39\xe1\
-\x42\x05\x3b\xbc\xcb\xc2\x4f\x5f\x93\x84\xdf\xf9\x5c\x43\x3c\xc6\
-\x85\x5c\x7b\xe9\x5b\x4b\x01\x44\x3f\x8f\xa0\x15\xa3\x10\x6a\x65\
-\xc0\x15\x01\x12\xe2\x95\x12\xa7\x2e\x31\x58\xbe\x65\xf6\xc0\x87\
-\x3d\xf2\x89\x9f\x2a\xee\x2e\xd3\x9c\xc0\xe4\xb2\xfd\xbb\x05\x5d\
-\x6c\xbf\xbe\x61\x4d\xb4\x22\xb0\x4b\x04\x72\x59\xb4\x37\x0e\x52\
-\x7a\x9d\x28\x95\xd2\x54\xc0\x40\xf4\x40\xd9\x04\x17\x14\x92\xf0\
-\xc0\x03\xf0\x00\xa0\xc2\x59\xd9\x81\x53\x61\x7f\x03\x3a\x14\x48\
-\xd9\x05\x60\xaf\xab\x40\x2a\x10\x6c\xab\xcb\x09\x2e\x96\x27\xe7\
-\x8a\x4e\x12\x50\xfd\x55\xea\xe7\xa1\x76\x0b\x06\xf9\x40\xda\x63\
-\x40\x72\x7f\x70\x65\xf4\xd7\x2f\x75\xc3\xf4\xd4\xb2\x67\xbf\xea\
-\x0d\xff\xf1\x27\x9f\xfd\xd8\x3b\xbe\x5b\x3c\x35\x7f\xc4\xab\xaf\
-\xc8\x2f\xbe\xe8\x87\x98\x2f\xae\x57\xfd\x85\x7b\x54\x6f\xee\x6e\
-\x95\xf7\x67\xd4\xe2\xec\xad\x4a\xe5\xf3\x6a\x61\xe6\xe6\xe2\xf1\
-\x5c\xf1\xfc\x9d\x3b\xf5\x92\x5e\x77\xef\xe6\xe8\xeb\x9d\x02\xa8\
-\xb7\x4b\x37\x7d\x7c\xba\x58\x79\xaf\x1e\xc8\x9d\x25\xf8\x00\xdd\
-\x2c\x3c\x6b\xb9\x94\x59\xa0\xcd\x44\x2c\xfa\x8c\x3d\xb8\xc8\x21\
-\x22\x45\x03\xa8\x8b\x56\xa8\x50\x19\xfd\x43\x24\x82\xf8\xcf\xfc\
-\xb3\xb6\x71\xee\x1c\x46\xd2\x98\x6d\xf6\x9f\x86\x50\xe0\xaa\xca\
-\xf2\x1a\xe7\xf4\x8f\x80\x78\xb7\x1a\x0d\x0c\x9e\xdf\x67\xdf\x07\
-\x1f\x53\xdc\xf9\x41\xb1\x97\x7f\xb1\x50\x5e\xf8\x6c\x72\x95\x2a\
-\xf7\xa9\xdd\x1e\x1a\x3c\xbf\x4a\x49\x2c\xde\x5b\x28\x83\x35\x85\
-\x52\xd8\x54\x28\x89\xdb\xcb\x27\x0b\x25\xf1\x9b\x9d\x5e\x49\x74\
-\x0a\xc0\x6e\xcf\x2b\x56\xd3\xde\x76\x31\xba\xd2\x0a\x8a\xa6\xb1\
-\x62\xc4\xe2\x61\x50\x09\x38\xa9\xbd\x82\x52\x50\x31\x30\x01\x5a\
-\x19\x59\xcb\xa8\x9f\x33\x96\x54\xa3\x00\xa6\x51\x70\x5b\xd7\x0a\
-\x08\x1a\x0e\x85\x07\x1a\x13\x68\xf2\x10\xf5\x7d\xa2\x04\x50\x60\
-\x06\xb5\x4b\x31\x31\x39\xf5\xc8\xd7\xfc\xd3\x7f\xfd\xd5\xa7\x3f\
-\xf2\xe6\x2f\x16\x0f\xfb\x4f\x7a\xca\x1f\xe1\xc5\x17\x7e\xbf\x51\
-\xfd\x65\x53\xab\xaa\x7d\x6a\xb7\x43\x82\xc7\xf4\x7b\x1b\x0b\x24\
-\xb1\x4e\xf5\xe7\xd7\x55\xf7\x7b\x95\x92\x58\x28\x94\xc4\x8d\xc5\
-\xb9\x2d\x0c\x94\x46\xa7\x00\x76\x60\xee\x0f\xd5\xe1\x1a\xeb\x03\
-\x0e\xc2\x5a\xa0\xad\x17\x32\x48\xab\x2d\x13\xfa\x8c\xab\x3e\xa6\
-\xb7\xb8\x70\xe3\xfa\xfb\xd6\x9c\x77\xeb\x4d\x57\x5f\xf4\xb3\x0b\
-\xbe\x75\xf5\xba\x35\xb7\xcf\x97\xcf\x2f\x5b\xbe\x5b\xf6\xcc\xe7\
-\xbc\xf4\x11\x0f\x39\xf4\x77\x9f\xbc\xd7\xde\xfb\x3d\x63\xd9\xb2\
-\x15\x8f\x6a\x82\xd1\x54\xed\xb8\xc2\x0f\x8e\xc5\x07\x2a\x1b\x0e\
-\xc4\x50\xcd\xca\x66\xc9\xae\x2b\xca\x3e\x88\x53\x12\x6c\x71\x3d\
-\x3a\x1a\x01\x5c\x05\xe1\x44\x4a\x40\xb9\xe1\x92\xc1\x73\x7b\xdd\
-\x7f\xff\xb7\xad\xda\x6b\x9f\xd3\x36\xac\x5f\xdb\x1b\x20\x01\xec\
-\x8f\xe3\x7b\x4c\x4c\xee\x51\xed\x2a\xa2\x24\xf2\xde\x66\xd5\x5b\
-\x58\x5b\x2b\x89\x0d\x05\x72\xb8\xab\xd0\x1c\x73\x95\xbb\x81\x38\
-\xaf\x16\x67\x6e\xeb\x14\xc0\x76\xab\x00\x40\x1d\x0e\x8a\xd7\xae\
-\xd7\xe2\x47\x7c\x56\x25\x40\x6c\xba\x2d\x2e\xce\xdf\x72\xf3\x6f\
-\xae\x3c\xfe\x2b\x9f\x3b\xe6\x3c\xb2\x3c\x73\x6d\xa8\xe6\xe7\x66\
-\xd4\x59\xdf\x3c\xe1\x97\xc5\xfd\x72\xff\xcc\x8b\x5e\xfa\x96\x27\
-\x1f\xf6\xa8\x27\xbd\x69\x7a\xd9\x8a\x47\xf8\xe8\x41\xf3\x0c\xf4\
-\xf3\xc1\x2d\x39\xd4\x5c\x04\xc9\x45\x30\x62\xe5\x14\x13\xe1\x56\
-\x22\x04\x30\x89\x7f\x10\x11\x40\xad\xe5\x90\xbb\x47\xc0\x42\x83\
-\x44\x2f\x38\x21\xc2\xe2\xf9\x89\x89\xc9\x83\xff\xfc\xa8\x37\x3d\
-\xf7\xa4\xe3\xff\xf9\x1b\xa5\x1e\x7e\xd2\x53\x9e\x99\x5f\xfc\xb3\
-\xf3\xb6\x8a\x13\x94\x4d\xec\xae\xa6\x57\xec\xae\xd4\x8a\x87\x34\
-\x28\x89\xc2\xd5\x58\xb8\xaf\x30\x12\x85\xeb\x31\x7f\x77\xa1\xa2\
-\x06\xdc\x44\xe9\x6e\x2c\xce\xde\xd6\x29\x80\xad\xbd\x5d\xb4\xe1\
-\x63\x25\xf1\x77\x88\xb1\xf2\x60\xe3\xe8\xc8\x2c\x71\x6c\xdb\xb4\
-\xe1\x9e\xd3\x4f\x39\xe1\x7d\xc7\xde\xb3\xe6\x8e\xb9\x7a\x59\x96\
-\x82\x5f\x5a\xa2\x7e\xbd\xe7\xee\x72\x55\xd9\x69\x5f\xfa\xcf\x0b\
-\x96\xaf\x58\xf9\xb3\x57\xbd\xf1\x3f\xdf\xb4\xf7\x03\x1e\xf8\x0a\
-\x13\xf9\xf2\x3c\x11\x10\x91\x81\x73\x1f\x5c\x6b\x8f\xb8\x2d\x18\
-\x40\x48\x54\x12\x20\x40\x7a\x30\x02\x4d\x15\x96\xc9\xb9\x20\xe5\
-\xd3\xc8\x2c\x3f\xea\xe3\x8a\xdb\xbd\xef\xff\xc0\x17\x17\x77\xce\
-\xa8\x78\x80\xea\xba\x8f\x07\x05\x8c\x45\x49\x4c\x16\x4a\x62\xf2\
-\x90\x38\x92\x28\x14\x42\xaf\x50\x0c\xf9\x62\x81\x22\x16\xee\x2d\
-\x5c\x8f\x35\x0a\x7b\x5b\x06\x4a\xa2\x74\x37\x66\x6e\xe9\x14\xc0\
-\x98\x61\xea\x0b\xab\x6e\x3e\x80\xae\x45\x51\xca\x67\xfa\x02\xcc\
-\x5f\x01\xf1\x4f\xf8\xf4\x7f\xbe\xe1\xd3\xf5\x5f\xf7\x6b\xc1\x5f\
-\xac\x17\xe1\x02\x51\x04\x54\x01\x94\x1d\x84\x26\xe7\x66\x37\x4f\
-\x1d\x77\xec\x6b\x8e\x7d\xe5\x1b\x3e\x7c\xf3\x01\x07\x3d\xec\x5f\
-\x45\x26\xc1\x90\x81\x81\x73\x21\xc2\x6f\x8f\xb1\xef\x04\xdb\x98\
-\x07\x68\x6a\x4e\x89\x84\x08\x70\x94\x00\x2a\x37\xf9\xca\x68\x36\
-\x9a\x48\x65\x93\xb2\xca\xfb\x85\x9b\xf5\x47\x07\x1e\xfc\xdb\xab\
-\x6e\xbf\xe5\x9a\xf9\x0a\x05\xfc\xfe\xb3\x0a\x14\x70\xee\x0e\x53\
-\x46\x9c\x4d\xac\x50\xd3\x11\x05\x51\x29\x89\x7c\x6e\xe0\x62\xa8\
-\x57\x8f\xf6\x59\x9d\xf8\x57\xe2\xb1\x2a\x16\xb3\xb7\xc9\x2d\x72\
-\x7c\x7f\xc3\xfa\x75\xa7\xd5\xc2\xaf\x2d\x7e\xb9\xf0\xb6\x14\x7b\
-\x59\x7a\xb5\xa1\xbe\xdd\x54\xec\x9b\xd9\xbe\x89\x1e\xf3\xb9\x8f\
-\xbd\xf5\xe4\x7b\xd7\xdd\xfd\xf1\x68\xfe\x80\x62\xe7\xe6\xe4\x13\
-\x00\x2b\x3c\xd2\x4a\x20\x25\x2f\x61\x69\x77\x2f\x59\x88\xe5\x43\
-\xd8\x1c\x07\x45\x12\xb0\xc0\x7d\x4c\xbe\x9f\x22\x09\x41\xd6\x1d\
-\x30\xc9\x51\xcb\x9f\xf8\xd4\xe7\x3d\xae\x78\x6a\xba\x56\xb2\xdb\
-\xfe\x02\x8c\x79\xcf\x60\x59\xe1\x6e\x3c\x64\x74\x65\xd3\x09\x7f\
-\xa9\x4d\xf3\xca\xf6\xa3\x63\x81\xd0\x4f\xe3\x15\xf6\xde\xe2\xc2\
-\x6d\x27\x7d\xe2\xe8\x0f\x11\xe1\x9f\xab\x85\x5b\x0b\x7d\xa9\x08\
-\x66\x6b\xa5\xb0\x70\xda\xc7\xf7\xa9\xf6\x1a\x15\xcc\xd7\xaf\xcd\
-\x68\x65\x70\xd2\xf1\xef\xfc\xf0\xc2\xfc\xec\x65\xf4\x73\xf9\xee\
-\xa6\x1b\xd7\xff\xa4\xe3\xd8\xf9\x6f\x4f\x3b\x45\x06\x7e\x2a\x34\
-\x3a\x44\xbf\x41\x02\xfc\x7b\x29\x24\xd6\x5f\x91\xdf\x48\xa9\x07\
-\xec\xff\xe0\xa7\xd5\x0a\xa0\x44\xb9\xd9\xf6\x90\x15\xbd\x24\x99\
-\xd6\x9d\x0b\x30\x2e\xcf\x55\x86\xc8\x36\xc1\x46\x7e\xfd\xa6\xeb\
-\x7f\xf5\xb1\x4d\x1b\xef\xad\x7d\x4d\x63\xf9\xb7\xd4\x8a\xa0\x74\
-\x01\x72\xa9\x8b\x4d\xfd\x5c\xf5\xfc\x8b\x5e\xbf\x36\xd7\x3c\x41\
-\xf1\x5e\xf9\x6d\x37\x5f\xf3\xde\x87\x3e\xfc\xf7\xce\x8c\x9f\x30\
-\x88\xe7\x69\xba\xed\xec\x20\x0d\x03\x2d\x5f\x61\x5d\x95\xa0\xbb\
-\xc0\xc2\xb1\x26\x05\x02\xd1\x73\x91\x0a\x37\xe0\xd0\xe2\x66\x4a\
-\x2b\x80\x27\x3f\xf5\x4f\xe0\xa2\x9f\x9e\xd3\x75\x13\xea\x14\x80\
-\x4c\x49\xe5\x75\x09\xae\x09\xb9\x55\x61\xb6\x38\x77\xde\xeb\x2d\
-\xde\xf6\x3f\x27\x7f\xe0\xfc\x5a\x78\x17\x6a\x4b\xae\x2d\xfe\x62\
-\x21\xe4\x79\xca\xe7\xd7\xca\xa0\x5f\x28\x82\x4a\x29\x7c\xe9\x84\
-\xf7\xfd\xe4\x1d\xff\x7e\xea\xc5\x53\x53\xcb\x9f\x54\x2d\x6c\x74\
-\xcf\x01\x88\xf0\x18\xc1\x69\x41\xc5\x6d\x2d\xe5\xd0\x76\xf2\x34\
-\xd2\xd8\x3e\x46\x50\x80\x62\xe8\x46\xb9\x69\xdb\xe5\x3e\x39\x39\
-\x7d\x88\xe6\x58\x94\x69\x30\xd0\x8d\xc2\xee\x5c\x00\x59\x03\xac\
-\x52\xa6\x10\xa5\xce\x67\xa7\x35\xf8\x08\x7e\x85\x5b\x71\xbb\xf1\
-\xbe\xb5\x3a\xd4\xa7\xa1\xff\x8c\xb6\xfc\xa9\xc2\xcf\x14\x81\x71\
-\x23\xe6\x67\x67\x4f\xc5\x1c\x5b\x62\x42\x30\x6d\xb7\xa4\xd7\xa5\
-\xb6\x62\x4b\xb9\x83\xf0\x2f\xf5\x3b\xc4\xaa\x0b\xed\xef\x01\x4e\
-\x9f\x04\x7a\xdc\xc4\xc4\xd4\xfd\x88\x02\x98\x50\xdb\x4d\x79\xe4\
-\xf6\xe5\x04\x74\x08\xa0\xb6\xfe\x19\xd4\xb9\xe6\xd4\x82\xd6\x2c\
-\x3b\x28\x39\x2a\x70\xc7\x6d\xd7\x5f\x54\xfb\xfe\x8b\xb5\xe0\xcf\
-\x0f\x2b\xfc\x54\x09\x14\x48\xa0\x37\x3b\xbb\xf9\x82\x15\xbb\xaf\
-\x52\x80\x82\xe5\x17\xac\x3c\x24\x58\xff\xed\xc9\x29\x08\xa1\x03\
-\x44\x8c\xa2\x00\xed\xe7\x9b\xfb\x8a\x94\x5c\x3b\x7a\x04\x56\xd6\
-\x06\x6e\x82\x20\x80\x6e\xb1\x77\x08\x20\xe0\x03\x44\xac\x98\x23\
-\x42\xe4\xb5\x5b\x6e\xbc\xe2\x66\x02\xff\xe7\xb5\xcf\x3f\x0e\x9d\
-\x74\xfd\xaf\x2f\xfe\x75\xf5\xbe\xf9\xce\xc9\x5e\xc5\xd1\x40\xf8\
-\x35\x70\xac\x3e\x04\xff\xa6\x78\x6d\x37\xe5\xf6\x4b\x53\x3b\x5b\
-\x24\x60\x1c\x1e\x4d\x87\x00\x2a\x04\x90\x17\xce\x74\xa6\xb3\xcf\
-\x95\xa9\x07\x62\x89\x40\xdc\x82\xdc\xf2\x9b\x2b\xee\x51\x36\xde\
-\x1f\x24\xfc\x86\x40\x01\xf8\xa2\xd7\x9f\x34\xf7\xa4\x3f\x78\xc1\
-\x16\x84\x6c\x9a\xe4\x06\x05\xce\x8d\x97\xc9\xc8\x16\x7f\xbb\xb4\
-\x7f\x4e\x4a\xb0\x7d\x0e\x15\x9a\x48\x8c\xf3\x98\xa4\x02\x88\x51\
-\x11\x83\x0e\xcc\x25\x30\x4a\x00\x3b\x04\xd0\x29\x80\x24\x56\x1a\
-\x92\xc7\x6f\xf1\x6c\xbf\x7c\x9c\x7a\x69\xd0\x12\x77\x17\xff\x3d\
-\x0c\x21\x2b\x8c\x18\x63\x44\xa8\xa9\xdb\xb6\x4a\x85\xf5\x66\xeb\
-\x14\x40\xa7\x00\x24\x49\xcb\x07\x1d\x2c\x07\x3d\xe9\xb1\x0e\x37\
-\xb9\xd4\xbb\xa4\x0e\x0e\x39\xf4\xb1\x7b\x5d\x7e\xd9\x79\xeb\x95\
-\x9f\xe6\x3b\xf2\xf6\xaa\x7f\xfa\xc4\x74\x71\x5e\x2b\x35\xed\xe0\
-\x0c\x20\x72\x7a\x14\x08\xfd\x0a\x20\xe0\xf7\x6f\x8f\x91\xc1\x18\
-\x02\x30\xf7\xed\x6d\x45\x8c\x2a\x9a\x4f\xe0\x66\x04\x3a\xd9\x81\
-\xae\x12\xe8\x38\x80\x4e\x01\x84\x09\xa9\x58\xc8\xca\xd4\xac\xb3\
-\xed\xa1\x87\x3d\xe1\xb0\x42\x01\xdc\xa4\x2d\xff\x38\xa7\xd6\xec\
-\xb5\xf7\x7e\x8f\x28\xce\x69\x42\x30\x87\xca\x29\x8f\x83\x40\xa5\
-\x1d\xc0\x8e\xf4\x03\x78\x0a\x60\xf0\x58\x70\x03\x94\x8a\x24\x3a\
-\x45\xfa\x26\x76\x00\xa0\x53\x00\x4d\x1c\x60\xdb\x6d\xef\x7d\x0e\
-\x78\x42\x71\xf3\xdd\x25\x3a\xa7\x23\xb8\x92\x02\xd2\x0e\x07\x01\
-\xdb\x4f\x09\xde\xce\x15\x03\x06\x1e\x7b\xb7\x04\xf6\x87\x03\x63\
-\xa0\x3a\x0d\xd0\xbc\x75\x51\x00\xa5\x9c\x34\x5f\x24\xb7\x5e\xba\
-\x2d\xfb\xb7\x72\xcf\xfb\x3f\x77\xaf\xfb\xef\x3f\x5d\x5f\x47\x18\
-\x67\x43\xca\xe2\x63\x8f\xf4\x52\x68\xf3\xbc\x24\x2c\xe5\xf4\xda\
-\x5c\x7e\x3e\x97\x8e\x0b\x1c\xbb\xcd\xd3\x83\x87\xfe\x5b\x19\x15\
-\x84\x90\xde\xce\xb4\x77\x0a\x60\x4c\x08\x54\x2c\xba\xd1\xd6\x36\
-\xb0\x43\x36\xb1\xef\x9f\xbd\xe4\x2d\x2f\x51\x4e\xac\x79\xf4\xed\
-\x47\xf7\x1e\xff\xc2\xe2\xfd\x1f\x19\x2b\x02\xa2\x7b\xee\xdc\xaf\
-\x05\x22\x47\xf1\x75\xb3\x97\xaf\xe7\xb8\xe3\x46\xc0\x54\xb8\xb9\
-\x2a\xeb\xd6\x2e\x60\xbd\x2e\x11\xa8\x73\x01\x42\x1c\x80\x71\xb1\
-\x49\x50\x2d\x02\x9d\xef\xf7\x80\x07\xbd\xe1\x11\x8f\x79\xc6\xd7\
-\xae\xfe\xd5\x0f\x67\x6a\x25\x30\x52\x24\xe0\x82\x75\xc7\x4d\x2b\
-\xc0\x0f\x0e\x05\xeb\xf9\x79\x92\xc7\x18\xd2\x4e\x98\xd6\xe8\x64\
-\x9b\x11\x81\x5e\x28\xd0\x2f\x0e\xe2\xc9\x41\x18\x88\x18\x74\x2e\
-\x40\x87\x00\x02\xbe\xa7\x00\x97\x13\x61\x72\x21\x35\x7b\x3f\xe3\
-\x39\x7f\xfb\xa9\x55\x7b\xef\xb7\x5c\x8d\x61\x4c\x55\xf1\x9e\x9f\
-\x2d\xf6\x43\x95\x13\xd3\xc6\x00\xbc\xcf\x5b\x3e\xdf\xf0\x7d\xb6\
-\x63\xf7\x20\xb8\x13\x25\xd1\x4c\x02\x76\x89\x40\x9d\x02\x08\x20\
-\x43\x53\x4c\x92\x13\x18\x9d\xb8\x4f\x4e\x2d\x7f\xc6\x91\xaf\xfc\
-\x7f\x1f\xdd\xf7\x81\x87\x8c\xa4\x04\xbe\xbf\xe6\xe3\xef\x2f\xde\
-\xef\x65\x0e\x8c\x15\x21\x3f\x56\xe7\x29\xba\x01\x35\xac\x97\x5c\
-\x81\xa0\x3b\xb0\x03\xbb\x07\x2a\xe2\x1e\x75\x2e\x40\xe7\x02\xb4\
-\xe0\x00\x5c\xfe\xb8\xed\xa5\x9d\x9a\x5e\xf1\x57\x2f\xfa\x9b\xf7\
-\xed\x77\xe3\xb5\x97\x1c\x75\xce\x37\x3f\xb1\xb6\xcd\x5b\x9c\x7f\
-\xf7\x47\x57\x14\xf0\xfb\xf8\xe2\x4f\x5e\x1e\xfe\x70\x08\xbb\x23\
-\x88\x66\xe0\x06\x30\x64\x03\x0a\xbc\xbf\x49\xee\x0e\xb8\xb5\xa2\
-\x06\x0d\x2e\x80\x11\x5d\xa4\x2e\x00\xcf\x03\xf0\x09\xc5\xce\x05\
-\xe8\x14\x40\x2b\x12\x50\x14\x39\xf0\xd7\x0e\x04\x66\xdb\x65\x13\
-\x53\xcf\x3c\xf4\x91\xbf\x7f\xe5\xc1\x87\x3e\xee\x98\x8f\x7d\xe7\
-\xa7\x9f\xfc\xc1\x59\x9f\xeb\x35\xe5\x06\x9c\x77\xf7\x47\x8f\x2a\
-\x6e\xfe\xad\x78\xff\x43\x62\x73\x06\x42\x7a\x81\x76\x22\x8e\x0a\
-\xae\xf0\x1c\x6e\x2f\x4a\x00\x85\xbb\xe8\x36\xfc\xe4\x25\xbf\x8a\
-\x13\x7f\x1c\x15\xa0\x7c\xad\xba\xad\x53\x00\xb2\x02\x20\x3d\xe8\
-\x9d\x5b\xdd\x60\x83\x74\xe1\x8d\x87\x5f\xe0\x01\x53\xd3\xcb\x3f\
-\xfa\xc8\xc7\xfe\xd1\xbb\x1e\xf1\x98\x67\x9c\x7e\xee\x1d\xea\x5b\
-\x00\x59\xd9\xbc\xed\x97\xcf\x7a\xd0\x3f\xf5\xbf\x77\xe7\x47\x7e\
-\xb7\xb8\xbf\x7f\xf1\x3e\xcf\x29\x6e\x5f\x5c\x7c\xc8\x41\x6c\x00\
-\x40\xba\xa5\x72\x0a\x00\x18\x0a\x40\x24\x93\x76\x20\xaa\x04\x1a\
-\xd1\xc0\x52\x2b\x81\x44\x04\xe0\xf4\x03\x08\x20\x00\x15\x0d\x91\
-\x75\x0a\xa0\x53\x00\x32\xf1\xc6\x16\x0c\x8c\x61\xb1\xc0\x7e\x85\
-\xd0\xbc\xaa\xb8\xf3\x2a\xfd\x4e\xe7\xde\xf9\x11\x67\xd1\x03\x8d\
-\x34\xd0\xfe\x9e\x00\xd1\x21\x24\xfc\x59\x1f\x05\x50\x81\x57\xbe\
-\x12\xa8\x15\x59\x6b\x34\xb0\x4d\x14\x00\xb1\xde\x82\xd0\x3b\xf7\
-\x59\x6e\x40\xb7\x75\x0a\x20\x7d\xfd\x61\x58\xe4\x2d\x18\x70\xd3\
-\xc9\x63\x99\x78\x31\xb8\x09\xca\x1d\x83\xed\x87\x1e\x53\x3c\x74\
-\x41\x64\x25\xab\x1f\x52\x12\x6d\x5d\x82\xa5\x44\x01\x89\x2e\x80\
-\x04\xfb\x9d\xfb\x4d\x24\x20\x86\x23\xb4\x5b\xb3\x85\x1a\x6e\x47\
-\xda\xa9\x53\x00\x4a\x11\x8b\x81\x5e\xba\x7d\x4c\x88\x87\xf5\x29\
-\x51\x31\x2b\x8c\xa4\xb7\x2d\x6d\xf3\x95\xd2\xc4\xca\x0c\xce\x70\
-\x09\x3f\xfb\x98\x00\x82\x04\x25\xb0\x6d\xb5\xf0\xf0\x08\x40\x25\
-\x65\xc9\xc5\xc6\xb1\x6d\x3d\xa1\x8c\x5d\xf2\xad\xad\x1c\x3a\x05\
-\xa0\x06\xa1\x31\x20\xe3\xbf\xa8\xd7\x2f\xe9\x82\x94\x21\x21\x49\
-\x2b\x00\xc3\x0e\x87\x37\x9e\x90\x09\x0b\x5d\xc8\x10\x5c\xc2\xbe\
-\x12\x50\xaa\xb9\x86\x60\x5b\xa2\x00\x0f\x01\x30\x34\x10\x42\x00\
-\x2a\x21\x0c\x08\x30\xba\xa0\x37\x21\x85\x51\x05\xd8\xe7\x6e\xb1\
-\x53\x00\x5b\xc1\xfc\x98\x62\x1b\x4a\x06\x9a\x2e\xb3\xc0\xfd\xe7\
-\x24\x71\x49\xf2\x79\x5d\xaf\x02\x8c\x70\xa3\x3b\x96\x68\x70\x7e\
-\xb4\xd4\x17\x29\x62\x70\x11\x84\x33\x3f\x0b\x24\x98\x4d\x0b\x8b\
-\x7c\xe0\x8f\x31\x2b\x85\x4b\xf7\x1b\xb8\x97\xc6\x6f\x1f\x5e\xa7\
-\x6c\x05\x2a\x03\x75\x85\x86\x52\x18\x8a\x91\x37\x08\x53\x92\x1b\
-\xd0\xf4\x1e\x63\x76\x03\x20\xfd\xa3\x3b\x05\x30\x2a\x07\x15\xbb\
-\xc0\x40\x24\xd6\x2d\x35\x1f\x11\x04\xb4\x7d\xaf\x26\xb6\xce\x28\
-\xac\xc1\x81\x49\x53\x88\xb7\x2d\x05\x18\x94\x2f\xe9\xbe\x14\x0a\
-\x94\xc2\x81\x29\x8a\xca\xbf\x2c\x38\x56\x8e\x20\x5a\x62\x0e\xad\
-\x75\x0b\xcb\xf2\xc6\x4e\x01\x8c\xd3\xf8\xd0\xf6\xda\x48\x01\x78\
-\xd0\x11\x0f\x30\xf4\xd0\x7e\xa1\xf3\x11\x5e\xfc\xc7\x95\x20\xbe\
-\xef\xf3\x2b\x37\xaa\x40\x04\x5b\x52\x02\xfe\x73\xae\x12\x08\xa3\
-\xfd\xa5\x52\x16\x89\x08\x80\xe4\xfd\xbb\xc3\x42\xfc\xe1\x29\xd2\
-\x45\x07\x88\x37\x08\x0a\x23\x9f\xf6\x02\x07\xc9\xbf\xbf\x64\xed\
-\xc7\x83\x34\x3a\x05\x90\xa8\xa9\x11\x13\xf0\x2d\x51\x06\x10\xf8\
-\x45\xda\xaf\x93\x31\x84\x1c\x23\xc4\x1f\xd0\x05\xd5\xa8\x04\xb6\
-\xb1\x16\x8e\x28\x00\xa7\x13\xf0\x90\x0a\x00\xc0\x87\x06\xd1\xef\
-\x3f\xee\x6b\xc3\x5c\xbf\x18\x5a\x58\x0a\x6b\xdf\x29\x80\xc8\xef\
-\x82\x66\xb0\x26\x78\x62\xe9\x13\x72\x8c\x04\x1c\x4a\x86\x61\x48\
-\x21\x01\x9f\xf9\x17\x91\x41\xf8\x98\x54\x57\x60\x5b\x04\x09\x42\
-\x2e\x80\xc2\x70\x36\x60\x28\x1c\x28\x30\x3d\x9e\xe0\x4b\xcf\x71\
-\xa5\x34\xaa\x92\x44\x91\x3b\x8a\xbf\xe6\x0e\x81\x5d\x3a\x65\xd0\
-\x29\x00\xba\x38\x0c\xf9\xd7\xc2\x92\x37\x0a\x7f\x3a\x9b\xe6\xc3\
-\xff\x30\xbf\x6f\x73\x09\x22\xed\xc1\x02\x21\xc2\xed\x13\x05\xb4\
-\x43\x00\x14\xb9\x89\x09\x41\x2a\xe4\x02\xb8\xda\x05\x58\xf9\x34\
-\x44\x9c\xf3\x61\x79\x00\x68\xf1\x1a\x9f\xf4\xc4\xd7\x21\x74\x1c\
-\xc0\xf8\xb7\x6a\x30\x08\x1f\x03\x56\x13\x69\x55\x37\x5a\xc6\xd8\
-\x41\x82\x80\x43\x02\xb1\x94\x4c\x41\x39\x72\xab\xa5\x5a\x58\xac\
-\x84\x00\x04\xa1\x29\x78\x48\x09\xb8\xef\xe5\xa2\x00\x48\x40\x0a\
-\xdb\x56\x01\xa0\x33\xc8\x55\x91\x71\x61\x31\x44\x4f\xaf\xa7\xcf\
-\x85\xc8\xc2\x3e\x4e\x3d\x89\x54\x19\x51\xc1\x8f\x24\x6c\x22\x8f\
-\x1e\x75\x73\x01\xc6\xb3\x85\x7e\x58\x18\x72\x91\x2f\x09\x45\x86\
-\xb2\xdf\x08\x00\xc9\x7c\xc0\xb8\x3e\x77\x47\xf6\xf5\x68\x5f\x45\
-\x8a\x06\xf8\x75\x84\x25\xfc\x5d\x63\xa8\xc0\x5c\xf3\x00\x2a\xe0\
-\x55\xab\x9d\x02\x18\xc3\xd6\xeb\xf7\x7f\x06\xfd\xfc\xc4\x7e\x7f\
-\x71\xba\xdf\xef\x4d\x63\x9e\x4f\x94\x23\x68\x40\x1c\xc2\xc5\x35\
-\xc6\xb8\x2d\x05\x84\x95\x50\x48\x51\x49\x1f\xc8\xa7\x1a\xd7\x37\
-\x2b\xf7\x78\xc0\x8b\x18\xa4\x08\x58\xc2\xa5\xe3\xc2\xc6\x89\x00\
-\x14\x1d\x04\xe2\xd4\x01\x84\x22\x34\xc8\x90\x00\x88\xdf\x1f\xc6\
-\xa4\x01\x40\x88\x22\x71\x57\x8f\xa2\x01\x1f\x19\x28\xf1\xb5\xce\
-\x05\x18\xe3\xf6\xb5\x4f\xbd\xee\x82\xe2\xa6\x9c\xf3\xb7\x67\xbd\
-\x57\x8d\x3d\x76\xc6\xef\xfa\x77\x6f\xf9\xca\x8b\xd2\x84\x71\xdb\
-\x98\xfd\x26\x12\x90\x67\x03\xea\x5b\x9e\x0d\x18\xe2\x79\x40\x87\
-\x4c\xc1\x7d\xce\x13\x70\x90\x95\xc7\xb0\x3a\x7d\x18\x79\xa5\x39\
-\x5a\x7a\x04\x7a\x8c\x50\xec\x14\xc0\x68\xe6\x47\x4f\xf9\x9d\xaf\
-\x9f\xdb\x29\x15\x40\xd9\x2e\x2c\xc8\x05\x6c\xf3\x9f\xa0\x19\x01\
-\x28\xd6\xfd\x97\x0e\x06\x71\x4b\x81\x25\xe2\x14\x2d\xdc\x47\x6b\
-\xfd\x81\x10\xa9\xf6\xb9\x66\x77\x30\x9e\xd3\xef\x1f\x8b\x5c\xa3\
-\x45\xd8\x1f\xea\x26\xa0\x19\x5d\xdf\x21\x80\xa5\x5c\x7d\xfd\x5a\
-\xf8\xcb\x4b\xbc\xa8\xb6\xcf\x39\x3a\x63\xf1\x3f\xb7\xdf\x9f\xa0\
-\xa5\x02\xa0\x8f\x69\x3f\x40\x15\xee\x08\x04\x9a\x24\x2d\x1d\x3c\
-\xf0\x09\x3f\x67\x02\x53\xc8\xfa\x27\x28\x4e\x10\x68\x7c\x10\x4b\
-\xbe\xb9\x4b\x80\x02\xcf\xe3\xbe\xa4\x15\xc1\x38\x7e\xca\x4e\x01\
-\xd8\x4d\x2b\x80\xf2\x76\xa7\xed\x95\x88\x3b\xd0\xf9\x25\x0f\x0a\
-\x61\x30\x2e\x58\xd6\x0d\xe8\xb2\x3a\x68\x7d\xf4\xc1\xf8\x35\x92\
-\x91\x29\x08\xbb\x1b\x89\x09\xf3\x2f\x52\x0c\xdf\x61\xf5\x9d\x6a\
-\x4f\x4c\xfa\xb6\x54\xe8\x41\x35\x13\x89\x9d\x02\x68\xb1\x0d\xa6\
-\xf1\xae\xcd\x09\x12\xd8\x79\xa1\x0e\x62\x90\xdb\xc2\xed\x40\xf4\
-\xd1\x29\x01\xa4\xdd\x80\x7c\x04\xe0\xc6\xfe\x95\xd3\x45\x59\x05\
-\xbf\xa7\xb6\xfe\x56\x29\x68\x41\x36\xb2\xac\xdd\x00\x62\xf9\x5d\
-\x94\xd0\x50\x4d\x49\xfb\x2f\x7a\xe1\x3d\xd6\xfc\x45\x71\x44\x80\
-\x71\xcd\x08\x5d\x22\xd0\x92\x29\x81\xe5\x7b\x3d\x01\x57\xee\xfb\
-\x27\x0a\xb2\xe5\x3b\xed\xf7\xfc\xd4\x19\xdb\xbb\x82\xf2\x17\xbd\
-\x21\xff\xd8\xad\x3e\x9e\x77\x07\x8e\x65\x02\x9a\x0c\x40\xea\xef\
-\x07\x42\x80\xc0\x05\x9a\x1f\x97\x50\x1a\x0c\x3c\x87\x04\xc0\xc0\
-\x7a\xac\xd9\x48\x37\xbe\xcf\x5e\x17\xb4\xb4\x25\x3f\xbb\x3c\x80\
-\xf1\x68\xc1\x65\xfb\xa9\x95\xfb\x1f\xa1\xa6\x56\x1c\xb8\x83\x00\
-\xe5\xd1\x04\x0c\x49\xd9\x70\x4a\x16\xf3\xd6\x21\x43\x5a\x20\x00\
-\xa2\x05\x1c\x02\x50\xb9\xc9\x40\x92\x5f\xce\x51\x00\x9f\xbc\x6c\
-\x43\x85\xc0\xd0\x40\xd8\x15\x08\x35\x89\x75\x2b\xae\x99\xe2\x31\
-\x42\x4e\xa0\x7d\xac\xdf\x24\xfa\x24\xe0\x38\x38\xdc\xad\xa6\x00\
-\x4e\xfe\xc5\x7b\x1e\x5f\x5c\xf2\xe7\x15\x67\x7d\x68\xf1\xf0\x91\
-\xc5\xbe\x4f\xb1\x1f\x24\x6b\x52\x18\x6a\x35\x82\x0a\xbf\x0f\x48\
-\x35\xfc\x42\x53\x0d\x82\x03\xc3\x1f\x09\xb0\xd5\xc4\x24\xfc\x23\
-\x43\xe0\xae\x9f\xee\x26\xb6\x01\x05\xe1\x83\x30\x50\xfd\x00\xdb\
-\x87\x02\x30\x02\xef\x29\x00\xa1\x33\x50\x20\x0a\xc0\x85\xdd\xee\
-\x9a\x1c\x54\x36\x9b\xd2\xbb\x0d\xad\x33\x8c\xfe\x66\x08\xf6\xbb\
-\x19\xbf\x9f\x08\xbf\x72\x2c\x3e\x3a\xdc\x80\xbd\x8f\xcc\x6f\xd8\
-\x01\xa2\x00\x27\xfd\xe2\x3d\x87\x17\x17\xeb\x39\xc5\xb7\x38\xb2\
-\x38\xe9\x03\xd0\x83\x4e\x10\x92\xb0\xa1\x6c\x92\xdc\xc8\x82\xf4\
-\xdf\x83\x80\x50\x03\x70\xea\xc7\xcd\xc4\x4a\x54\x50\x4b\x11\x55\
-\x8b\xe6\x7d\x81\xaf\x00\x31\x45\x49\x01\x48\x62\x1e\xfc\x4e\x5b\
-\x13\x0f\x35\xf5\xf2\xc5\xc8\x63\x4c\xc2\x6f\x68\xba\x3e\x81\x73\
-\xdf\x5d\x8e\xd4\x3d\xb0\x4a\x03\x22\xc6\x26\xf4\x69\xe8\xd5\x6d\
-\x20\xeb\x09\x89\xc4\xa2\x9b\x26\x34\x4a\x08\x1d\xf2\x68\xc0\xf6\
-\xe8\x02\x7c\xe1\xe7\xef\x5e\x51\x7c\x89\x57\x16\x77\x8f\x2e\xbe\
-\xc1\x01\xca\x49\x47\x85\xb0\xdf\x07\xd0\x42\x05\x60\xab\xf7\xb2\
-\x4a\x13\x99\xc0\xd7\xaf\xa0\x4b\x08\xd1\x1f\x89\xbc\xa9\xbb\x88\
-\x92\x1a\x3a\xc0\xd2\xa8\x02\xd6\x52\x8c\x2e\x36\x6e\xcd\x5d\x5e\
-\x1b\xe5\xfe\x06\x31\xeb\xbf\x1d\x91\x80\x34\x34\xd8\xd4\x1b\x50\
-\xae\x07\x26\x16\x14\xca\xf5\xa9\x3e\x60\xa4\x9f\x22\x01\x92\x31\
-\xe8\x5a\x7d\x64\x99\x83\xad\x7e\xb6\x5b\x8b\xbd\x1c\x18\xf3\xeb\
-\xe2\x3c\x6e\x2a\xce\xf1\xdb\xc5\xdf\x5f\xa6\x51\x01\x18\x12\xd3\
-\xf6\x73\x71\xbf\x87\x84\x00\xb6\x33\x05\xf0\x85\xcb\xde\xf3\xe2\
-\xe2\xe4\xfe\xb3\xb8\x34\x07\xb9\x9d\x6f\xc1\xb1\xad\xa8\x04\x68\
-\x8a\x02\x50\x4d\x89\xb7\x46\x19\x53\x90\x2d\x29\xca\x6e\x01\xc6\
-\x3a\xfe\x42\x48\xd8\x97\x16\x1f\xcb\x61\xa6\x06\x7f\x01\xb9\xb1\
-\x90\x15\xe2\xf0\xcb\x67\xe9\xbe\x73\x8c\x04\xa4\xaf\x37\xf5\x06\
-\x94\xcf\xba\xf6\xfd\xad\xcc\x93\x1d\x49\x37\x48\xea\x16\xd4\x7d\
-\x22\xc5\xfc\x00\x48\x90\x7f\xa3\xb0\x0e\x2a\x0e\x3f\xa8\x38\xb7\
-\xc7\x57\x56\x1e\xd4\x7b\x8b\xa7\xef\x28\x5e\xff\x5a\xaf\xd7\x3f\
-\x3b\xcb\xb2\x73\x06\xe7\x16\xe2\x2f\xc0\xb6\x3b\x1b\x63\x2e\xc7\
-\x58\x14\xc0\x89\x97\xfe\xf3\xde\xc5\xa9\x7f\xbe\x50\x63\x47\x94\
-\xdf\x0c\x40\x9f\x28\x10\xd6\x75\x70\xf5\xdc\xa1\x15\x0d\x50\x2a\
-\xd0\xc3\x3e\x04\x0f\xfd\x09\x39\xd2\x9a\xc5\x80\xc0\xcb\x7e\x1b\
-\xd3\x48\xc1\x33\x58\xaa\x92\xda\x24\x98\x27\x54\x2b\x8a\x83\xce\
-\x24\xe2\x2f\x62\xfd\xc7\x95\x6c\xb2\xd4\x08\x80\x87\x08\x43\xd7\
-\x4c\xe7\x01\xd4\xd0\x1a\xb2\x6c\xb0\x56\xb3\xac\x5e\x9b\xe0\xd6\
-\x0b\x80\x71\x01\xe8\x6f\x9c\x8e\x02\xa4\x76\x92\xf6\xfc\xab\xfb\
-\x07\x14\xaf\xbf\x79\x6a\x2a\x7b\x73\xf1\xf8\x8e\x7e\x3f\xff\x8f\
-\x75\xf7\x6c\xf8\xdc\x3e\xf7\xdf\x73\x46\x5f\x7b\x3b\xf0\x94\x5c\
-\x13\x48\x73\x76\x52\xb6\x91\x13\x5e\x4e\xbc\xe4\xdd\x4f\x2a\xce\
-\xe8\x17\xc5\x7e\xc4\xe0\xed\xb4\x4e\xcd\x82\x7a\xb6\x7a\xad\xb4\
-\xf8\x7a\xb6\x7b\xfd\x3c\xd2\xd7\xe9\x5e\x1f\x6b\xf6\xa0\x0e\xe7\
-\xa3\x13\xc9\xfb\xa2\xdd\xa5\x73\xf3\xfe\x16\x41\xd8\x55\xf8\xb3\
-\xb7\xc5\x70\x4c\xf3\xdd\x48\x1f\x3c\xe7\x18\x70\x8f\x45\xb5\x4b\
-\xed\x21\x44\x65\x23\x00\xa0\x4a\x25\xa0\xcc\x73\xb5\x42\x28\x9f\
-\x87\x4c\x69\x05\x31\x38\x2e\x33\xc7\x0f\x94\x86\xbe\x3f\x78\x4d\
-\xde\x41\xd8\xed\xfb\x98\xbf\x2f\x3f\xab\x70\x97\x27\x27\xb3\x8f\
-\xed\xbb\xcf\x5e\xd7\xf4\xfa\xf9\x4b\x1e\xf5\xc4\x57\x82\xfe\x6c\
-\x7a\xbe\x03\x94\x00\x0e\x42\xd9\x66\x0a\xe0\x73\x97\xfc\xf3\x11\
-\x85\x6e\xfa\x41\xb1\xba\x0e\x42\x5f\xbb\x91\xb0\x93\x0b\xbd\xd1\
-\x81\xa6\x20\xfa\xb2\x48\x7a\xbb\xfa\xc2\x19\xfa\xc1\xb9\x60\x86\
-\xad\x2a\xb2\x29\x32\xfe\x8e\x89\x7f\xbb\x35\x47\x61\xf3\xeb\x40\
-\xda\x5f\x39\x8a\x41\x29\xe4\xd7\x51\x9a\x9e\xe3\x7c\x1f\xb5\xdd\
-\x8f\x01\x4f\x3b\x47\x15\x44\x01\x50\x8f\x7f\xa6\xe6\x66\x80\x88\
-\xf4\x9e\x33\x53\x84\xaa\xd2\x0f\xe6\xbe\xfb\x5c\x56\x29\x0b\xf7\
-\x75\x7d\x0c\x7f\xdd\xde\xf2\xbf\xe7\x9f\x87\x0f\x9e\x9e\x9a\xf8\
-\xda\x15\x17\x9f\xf0\xed\x5b\x6f\x5b\xbd\xcf\xef\x3c\xe9\x95\x00\
-\x9e\x89\x24\xe7\xbf\xad\x5c\x80\xcf\x5e\xfc\xae\x72\xa8\xe5\xc9\
-\xc5\x77\x98\x40\x50\x5e\x2f\x7d\xe7\x3e\x5a\x17\x1f\x10\x88\x2b\
-\xee\x4c\xad\x18\x19\x4a\x37\xcc\xec\x6b\x1d\x6a\x6b\xcd\xb2\x2e\
-\xf9\x10\x4d\x14\xdd\x1d\xe4\x21\xbb\x50\xc3\xd1\x20\xf4\x0f\xb0\
-\xff\xb1\x29\xc5\x5b\xdb\x05\x20\x3d\x00\x1b\x5d\x80\x86\x31\x4f\
-\xb5\x3a\xa9\xc9\x00\xb4\x09\x02\x34\x38\x45\x9e\x77\x73\x05\x80\
-\xdd\xc6\x97\x01\x8d\xef\xd3\x24\x1f\x45\xda\xd0\x59\xad\x6d\x84\
-\x44\x4d\xc2\xc4\x9f\x1d\x74\xd0\xbe\x97\xfd\xec\xfc\x8f\xfe\xe5\
-\xef\x3c\xf9\xef\x2f\x2c\x5f\xbd\xfc\xc2\x4f\x63\x02\x0f\xbe\xf4\
-\x08\xe0\x84\x8b\xde\x75\x78\x71\xb2\x9f\x57\x55\xc5\x9c\x86\xc0\
-\x60\xc8\xbc\x0a\x7a\xea\xfb\x1a\xd6\x6b\xc8\xaf\xa1\x79\x08\x8a\
-\x87\x60\xee\x10\xbb\xeb\x4a\xc0\x68\xf0\x3d\xe5\x33\x97\x0a\xca\
-\x72\x17\x08\xd9\x67\x89\xe8\x08\x1c\x17\x40\xf1\xef\x12\x72\x15\
-\x02\x13\x77\xb7\xbb\x3d\x86\x04\x83\x2e\x00\xb5\xfc\xdc\xda\xe7\
-\x8d\xbf\x30\xb5\xe2\xe5\xf1\x8e\xb5\xf7\x1d\x57\x07\x15\xd8\x3d\
-\x6c\xfd\xf9\xf9\x14\xc7\x3c\x78\xcf\x3d\x56\x9c\xf7\xb3\xf3\x3e\
-\x52\x96\x70\x67\x8f\x7e\xca\x6b\x2c\x1a\x80\xf1\x20\x80\xd6\x0a\
-\xe0\x33\x17\xbe\xf3\xb0\xe2\x73\x4f\x2b\x34\xe8\xb4\x11\x68\xb4\
-\x11\xcf\x90\xc5\xa5\x0b\xd4\x83\xd3\x8a\x17\x72\x80\xeb\x1e\x0c\
-\xb9\x0f\x0d\xad\x45\xb7\x03\x3d\xc8\xbd\xb5\x76\x11\x0e\xd3\x7f\
-\xa2\x3b\x43\x72\xe2\x83\xb0\x7f\x07\x80\xfe\x89\xee\x81\x72\x5c\
-\x85\x10\x93\x5e\x9b\x1f\x20\x21\x3e\x9a\x0c\x64\xd8\x7f\xac\x7d\
-\xf4\x01\x41\x68\x93\x85\xd0\x3c\xce\x6a\x42\xdb\xc0\x7c\x40\x6f\
-\xb7\x2e\x40\x7d\x7c\x4d\x38\xd2\xf7\xd4\x8f\xe9\xe7\x0d\x38\x08\
-\xfd\x18\x96\xaf\x5a\xb5\xfb\x57\x2f\x3a\xff\xbf\x5f\x56\x1a\xdc\
-\x47\xff\xfe\xff\x05\x7b\xae\x5b\x59\x01\x7c\xfa\x67\x47\x97\x42\
-\xff\xd5\xe2\x63\x57\xa2\x11\x7e\x1d\xee\xcb\xea\xc5\xaa\x2d\x3e\
-\xb1\xf4\x08\x84\x45\xe7\x64\x5a\x16\xb7\x6e\xe3\xb0\xcc\x09\x96\
-\x5b\xb2\xb2\xa1\x7d\xab\x58\xb7\xa8\x32\x52\x82\x05\x07\xdf\x92\
-\x4b\xd7\x2a\x62\xf9\x9b\xad\xff\xf6\x43\x24\x2a\x0c\x8f\x04\x0b\
-\x0f\x07\x75\xfd\x7e\x8d\x02\x5c\x34\x90\x3b\x7e\x3d\xe7\x01\xb4\
-\xb5\xa7\x9c\x00\xf5\xf7\xe9\xee\x71\x07\x8a\xf3\x05\x2a\x68\xfd\
-\xd9\xdf\x4e\xec\xb1\xc7\xf2\x4f\x9f\x7f\xfa\x07\x9e\x5b\xba\xed\
-\x8f\xfe\xfd\x7f\x80\x71\x71\x00\x59\x4b\x37\xed\xfd\x85\x6e\x7d\
-\xac\x17\x93\xad\xcb\x9b\x0c\xe1\x67\x2c\x0d\xb9\xef\xf8\xd4\xe0\
-\x59\xaa\x64\x4b\x3c\x46\x84\x20\x5a\xd9\xed\xe1\x5f\x23\xc9\xe5\
-\x13\x96\xdc\xe2\x2b\x09\xe5\x34\x58\x7e\xa5\x70\xc7\x47\x03\x4e\
-\xa7\x60\xd9\xff\x17\x3d\x41\x87\x93\xae\x43\x6d\x60\xf9\x00\xc8\
-\xe8\x71\xee\xeb\x90\x81\xf8\x9e\xf4\xf9\xc1\xdf\x93\x70\x22\x79\
-\xdf\xf2\xb8\xc1\xad\xbe\x0f\xce\x39\xc1\x20\xf2\x30\xbd\xdf\x7e\
-\x7b\x7d\xf9\xd4\x93\x8e\xfe\x9d\x4a\x09\x3c\xf5\x75\x63\xa9\x0b\
-\x4c\x26\x01\x3f\xf5\x93\x77\x1c\x5a\x9c\xcc\x9b\xa1\x26\xf4\xdc\
-\x6e\x25\x40\xf8\x0b\x1c\xa4\xce\xe2\x00\xa2\x68\x34\x00\x40\x63\
-\xef\x52\xec\x1c\x92\xab\x52\x70\x29\x33\xd5\x86\x6a\xf1\xbd\xf5\
-\x33\xe6\x54\x20\xff\x21\x98\x8c\xe8\x95\x96\x61\x22\xe9\xd7\x8e\
-\xfc\x5b\xec\xe5\xde\xef\x53\x9e\xdf\xd4\x64\x96\xf4\xbd\x50\x98\
-\x0e\x6a\x4c\x03\x2a\x56\x0a\xac\x3c\x22\x10\xa3\xb3\xc1\x6c\x23\
-\x90\x01\x19\xe7\x16\xed\xd8\x50\x9b\x0b\xfb\x81\x76\x87\x04\xf4\
-\x08\xc0\x18\x14\xe7\xd7\xd5\xa4\xf7\x6a\x72\x50\x4c\x6e\x1e\xb8\
-\x02\xb9\x2e\x50\x87\x8a\xb2\x2c\x9f\xdb\xfd\xb7\x1f\x7e\xe0\xc9\
-\xcf\xfe\xe3\xc7\x3d\xe3\xec\xf3\x7e\xbe\xe9\xb1\x4f\xfd\xc7\xde\
-\xa8\x8c\x6c\xb2\x02\x28\x84\xfa\x83\xc5\x99\x4c\xf3\x62\x19\x28\
-\xd4\x16\x02\x49\x96\x04\x9d\xfc\x43\x32\xfe\xc0\x4d\xad\xb5\x43\
-\x19\xa0\xa5\x6c\xed\x94\x4d\x7a\x12\x73\xef\x20\x5d\x25\x40\xbb\
-\xeb\x17\xca\xf7\x2f\xd7\x69\xaf\xd7\x2f\x84\x1a\x8b\xdb\xbc\x6a\
-\x9f\x9e\xe7\xa8\xfa\xd5\xca\x1c\x6c\xfd\x7e\x5e\x3d\xd7\x0a\x76\
-\x16\x16\x6d\x62\x62\xa0\x10\xa6\x26\x27\xea\x5b\x50\x93\xc5\xfd\
-\x89\x62\x95\x4f\x4c\x40\xf0\xfb\x49\xf7\x53\x6b\x01\xc0\xf8\x0b\
-\x19\x69\x0f\x16\xc8\x28\x41\x12\x73\x47\xd2\x37\x40\xd7\x0e\xd8\
-\x8e\x22\x5e\x9e\x01\x8f\x20\x45\x0b\x7e\xd0\x0d\x8c\xd3\xfb\x25\
-\xfc\xcf\x6b\x65\x56\x82\x82\xf2\x7e\xa1\x48\x7f\xe7\x7d\x47\xff\
-\xe5\xfb\x0a\x05\xf0\x2e\x65\xfb\x57\xe0\x92\x2a\x80\xe3\x7f\xfc\
-\xf6\x47\x16\x57\xe1\x85\x83\x93\x06\x52\xc6\x58\xb7\x9f\xc6\xba\
-\x63\x59\xad\x29\xd1\xc9\xad\xaf\xad\x3e\x90\xa2\x08\xa9\xb9\x01\
-\xb6\x4b\xac\x4e\x11\x8c\x9d\x69\x8b\xa2\x1e\x48\xd5\x08\x18\xb4\
-\x50\x8b\x8b\xb9\xea\x15\xc2\x5c\x0a\xfc\xe0\x76\xf0\x78\x29\x14\
-\x6f\xa9\x30\xf2\x7c\xd0\x77\x65\x71\xb1\xef\x9e\x5b\x6d\x19\x27\
-\x4a\x85\x50\x28\x89\xc9\x02\x39\x4c\x96\x04\x59\xa1\x14\xa6\x8a\
-\xc7\x6e\x25\xa0\x0a\x86\x02\x53\x10\x80\x02\xa9\xe2\x0f\x58\x0d\
-\x80\x6f\xf5\x01\x90\x35\x0d\xa1\xe1\x3f\x14\x2d\x3f\x71\x7e\xd9\
-\x6b\x18\x0d\xe9\xd9\x39\xaf\x68\x32\x6c\x57\xed\xb9\xe2\x1f\x3e\
-\x7a\xec\xab\x4e\x79\xe3\xd1\x9f\xbd\x52\x8d\xd8\xc4\x66\x32\x6d\
-\xf1\xc1\xdb\xa0\x26\xf7\xac\x12\x20\xa1\xbf\xfa\x4c\xf5\x31\x8a\
-\x1c\xa7\x48\xfc\x1f\x59\xf5\x1f\x60\x8b\x32\xe0\x61\x10\xfb\xb6\
-\x31\xd5\xdb\x83\x57\x10\x3d\x91\xd2\x6a\x2f\x2c\xf6\x8a\xdd\x0a\
-\xfb\xf6\xf4\x85\x4a\xe1\x2c\x15\x92\x51\x0e\x04\xf6\x97\xe8\x60\
-\x7a\x6a\xa2\x42\x0c\x25\x7a\x28\xa1\xb2\x34\x2e\x2c\xac\x46\x4b\
-\xe1\xcf\x4c\x48\x10\x4b\x02\xb0\x5a\xcb\xee\xad\x3d\x5e\x67\x9f\
-\xa2\x37\x45\x48\x81\x3f\x34\xae\xf9\x87\xf1\x6b\x19\xa9\x90\xdb\
-\x74\x67\x34\x46\x14\x91\xe5\xb6\x16\x5f\xfd\x29\x4f\x7a\xf8\x31\
-\xc5\x13\x7f\x55\xea\xd3\xfa\xc5\x7c\x49\x14\xc0\x71\x3f\x7a\xfb\
-\x8a\xe2\xfd\x5f\x58\x91\x11\x08\x6e\x43\x42\xfd\x9c\xae\x66\x02\
-\x24\x05\x67\xfa\x49\x52\xa6\xaa\x61\x14\x42\xe0\xf2\xe0\x8e\x8f\
-\xf2\x71\x7b\xd1\x38\xee\x89\x94\xc2\xbe\xb8\xd0\x57\xf3\x85\xe0\
-\x5b\xcb\xbe\xe3\xb9\x5b\x15\x32\xe9\x59\xc5\x50\xba\x13\x93\x85\
-\x32\x58\x56\x2b\x05\xa7\x7e\x5e\xcc\x03\x00\x87\xfd\xa5\xb5\xfe\
-\x6e\xde\xbf\xb2\x85\x43\x40\x91\x01\xb5\xfe\x9c\xcb\x8a\x8d\x59\
-\x43\x0f\x09\xe8\xbf\x45\xaa\xc1\x40\x6a\x38\x42\xe4\xaa\x3e\xb7\
-\x95\xbb\x2f\x7b\xf6\x47\x8f\x7d\xe5\xef\xbd\xf1\xe8\xcf\x5d\x4c\
-\xdc\x00\x1c\xbb\x02\x28\xce\xed\x88\xe2\xab\xaf\x42\x33\x34\xcf\
-\x7a\x4a\x03\xf2\x0f\x8c\x12\x18\x24\x57\x81\x30\x48\x13\x8c\xb2\
-\x68\xf4\xfd\x71\xc7\x58\x88\xdb\xfb\x96\x57\x56\xb4\x6f\x2c\x7d\
-\xba\x9f\xbe\x63\x5d\xef\x92\x8f\xe8\xcf\xa3\x9a\x9f\x5f\xac\x04\
-\xa9\x44\x08\x25\xe1\x58\x2a\x04\x91\xd4\x00\x5e\x85\x4a\x48\x3e\
-\x7e\x5f\x41\x9d\x70\x03\xa4\x62\x04\xdc\xe3\x94\xff\x7e\x29\x57\
-\x12\x89\x12\x70\x9e\x45\xfe\x3c\x6d\x64\x8a\xce\x73\x4f\xf8\xbd\
-\x87\xbe\xb6\xb8\xb9\x5c\x0d\xda\xd9\xe7\x4b\xa2\x00\x8a\x2f\x74\
-\x38\x92\x46\x05\x66\xb0\x82\x81\x47\x56\xa7\xd1\x2a\xc0\xca\x67\
-\x41\x6b\xf9\x35\x7a\xf0\x60\x13\xa6\x5c\xaa\x6e\x8b\xb1\xcc\x16\
-\xda\x63\x65\xe1\x07\x82\xdf\xd6\x2d\xdc\xf1\x14\x2d\x06\xdc\x9b\
-\x12\x21\xcc\xce\x2e\x08\xd7\x4a\x1b\xc9\xcc\x88\xa0\x26\xac\x07\
-\xf7\x6b\xd7\x00\xb2\xfa\xba\xe6\x86\xe8\xb6\x4c\x3f\xc8\x15\x82\
-\xc9\x97\x17\x5d\x5e\xc7\x69\xed\x65\x61\xbe\x39\xc2\x44\x2b\xd0\
-\x96\x0a\xd7\x89\x46\x7b\xee\xb1\xe2\x4f\x9f\xf8\xb8\x43\xf7\xba\
-\xe4\xe7\x37\x2c\x0c\x8b\x02\xb2\xe6\x8b\x0c\x87\xd3\x62\x1b\x9e\
-\x14\x42\xb3\x01\xcd\xf3\x35\xa9\xe7\xde\x0f\x25\xa2\x40\x72\x25\
-\x57\xb7\xc9\x84\xda\xec\xdc\xa2\xba\x6f\xc3\xac\xba\x77\xc3\x8c\
-\xda\x32\xb3\x90\x28\xfc\x69\x85\x53\xdb\x5e\xca\x71\xac\xef\x65\
-\x59\x7e\x9b\x75\xa5\x43\xfa\xfa\x75\xfd\x9a\x61\xad\xc8\xa2\xa4\
-\x7f\x3f\x08\xe5\x63\xb5\xdb\xf7\x16\xae\x6c\x7d\x0c\x38\xc7\x10\
-\xa5\xc1\x16\x3f\x7d\x9d\x9e\x03\xb0\x14\x86\x89\x4c\xed\xf6\x96\
-\x7f\xfc\xb3\x32\x39\x68\x5a\x0d\x06\xd9\xb4\xfe\x21\xa3\x08\xe0\
-\x5f\xbe\xf5\xba\xbd\x97\x4d\x2f\x1c\xb4\x7c\xf9\x54\x01\xad\x34\
-\x55\x69\xeb\xc9\x69\x99\x89\xb1\xfe\x60\xbd\x2c\x87\xe5\x77\x2c\
-\x3f\x6b\x57\x01\x9d\xdd\x1f\xc6\x17\x9e\x5f\xe8\x15\x7b\x3f\xa1\
-\x68\x69\x7b\xb7\xee\xb8\x95\x3e\x25\xb7\xb9\x7c\xb5\x15\x55\x90\
-\x9b\xfc\x3b\x00\x7b\x6b\xbb\x46\xa1\x79\xac\x93\x77\x50\xd1\x50\
-\x76\x60\xcc\x18\x21\x34\xf9\x6c\x00\x93\x8c\x24\x84\xfe\x2c\x17\
-\x60\xad\xbd\xd1\x52\xaa\x46\x25\xfa\x3d\x8b\xe7\xf6\xdf\x77\xd5\
-\x1f\x16\xf7\xbe\xa1\x06\x33\x2d\x7a\x6d\xc9\xc0\x06\x17\x00\x0e\
-\x9b\xaf\xe0\x64\xae\xa6\xa7\x27\xd5\x8a\xe5\xd3\x55\xfc\x76\x40\
-\xf0\x11\xcb\x81\xd4\xe3\xf7\x9b\x74\xa0\x13\x68\xf6\x1b\x75\x8e\
-\xa6\xe4\x77\x2d\x8e\xa0\x12\xfa\x79\x4e\xe4\x75\x3c\x49\xba\xa2\
-\x71\x49\x40\x0a\xe3\x95\xe9\xfc\xe3\x12\x81\x7e\xd2\x14\x90\xee\
-\xc2\xca\x23\x02\x25\x17\xcd\xe9\xfe\xab\x68\x87\x5f\x5a\x13\x2b\
-\x41\x7f\xb7\x99\xa8\xa1\xe1\x6a\xe2\x70\xaf\x55\xbb\x3d\xb5\x46\
-\x00\x93\xca\x56\xbd\xe1\x98\x14\x80\x3a\xd4\x61\x91\x7b\x73\x6a\
-\x7a\x6a\x52\x55\x88\x20\xcb\x5c\xeb\xcf\x33\xcd\xa8\xdf\x1f\xf0\
-\x5d\x11\xc7\x21\xd0\x3b\x3f\x56\x28\xaf\x53\x79\xfd\xe7\xe6\x17\
-\x5b\x27\xdd\xec\x5c\xe2\x3b\xda\x77\xd7\x79\xff\x66\x32\x47\x55\
-\xdb\x91\x55\x46\x73\x50\x96\x9b\x9b\x7c\x14\x20\x3c\x81\x72\x30\
-\xaf\x22\x9c\x81\x72\xa6\x0b\x49\x68\xd6\x9f\xe5\x89\xc4\xd0\xa3\
-\xd3\xa1\xc9\x60\x8e\x32\x14\x49\x72\x1c\x6c\xcb\xda\x9c\x94\xdc\
-\x0d\xea\x05\xa6\x26\xe1\x81\x7f\xfa\xac\xc7\xdc\xff\xac\xef\xfd\
-\x6a\x4b\xed\x06\xf4\xc6\xa8\x00\x70\x2f\x60\xb4\xe9\x40\x11\x94\
-\x88\x60\x4a\x2d\x2b\x50\xc1\x44\x06\x44\x11\x80\xed\x9f\x49\xfb\
-\xf2\x31\xeb\xef\x0b\x7f\x67\xc1\x42\x0b\x7e\xa1\x0c\xdd\x15\x16\
-\x3f\xef\x88\x91\xb1\x5c\x51\xa7\x93\x0e\x6b\xaf\xed\x5a\x73\x3a\
-\x31\xa8\x76\x6d\x9d\xb4\x60\x14\x8e\x0d\x93\xb4\xe8\x74\x65\x23\
-\x9d\x1a\x85\xf1\x60\x06\x19\x08\x63\xc3\x01\xad\x22\xd4\x9e\xc9\
-\x33\x9e\xf6\xdb\x0f\x2b\x14\xc0\x5d\xc3\xf0\x00\x4d\x08\x60\x25\
-\x13\x5d\xab\x08\x16\x06\xe1\xa5\x32\x7d\xb3\x54\x04\x93\x93\x13\
-\x8d\xfa\xd7\xa4\x40\x0a\xcf\x77\x1b\xb3\xf8\xc9\xfe\xfd\xae\x04\
-\xdf\x47\xbd\xae\x58\x13\xd3\xa4\x66\x00\xdc\x0a\x4b\x23\xac\xac\
-\x45\x37\x5f\xb2\xa0\xa4\x1c\xff\x34\x3e\x13\x49\xa3\x13\xa7\xb6\
-\x81\x7c\x4f\x3e\xfe\xcc\x99\x89\xa0\xdc\xc2\xad\x03\x0f\xb8\xff\
-\xc1\xb5\x2c\x4f\xd4\x6e\x40\x7f\x5c\x0a\x20\xac\xd2\xea\xad\x5f\
-\xa0\x81\x99\xfe\x62\x81\x04\xfa\x15\x4f\x30\x55\xb8\x08\x3a\x4b\
-\xa0\xb9\xa9\x7c\x67\xf9\xf9\x02\x99\xaf\x15\x6b\x27\xf8\x4b\xa5\
-\x44\x72\x06\xe9\x33\x62\xd1\x33\xc2\x01\x48\xa5\x82\x4a\xf9\x51\
-\x13\x69\x6c\xb8\x3f\x1b\x90\x2a\x09\xea\xcf\x2b\x10\xda\x7f\x2b\
-\x37\x03\xd0\xa6\xde\x0f\x22\x09\x58\x7f\x0f\x9d\x98\xb4\x6c\x59\
-\xb6\x67\x2d\xfc\x13\x6d\x79\x80\x26\x12\x50\x39\x4d\xd3\xbd\x2f\
-\x6d\x9f\xeb\x97\xe1\xa8\xc2\x47\x2d\x17\xf0\xe4\xe4\x64\x95\xa6\
-\x39\x21\x54\x80\x75\x22\x1f\xb6\xf8\x8b\xbd\x7e\x17\x02\x5d\x4a\
-\x7c\x80\xa4\x55\x18\x8b\x39\x3b\xad\xb9\x94\x44\x67\x2b\x59\xd0\
-\x49\x8b\x2f\xe7\x7d\x28\xbe\xf5\x1e\xb3\xe7\x49\xf8\x0f\x49\xbb\
-\x23\x20\x88\x01\x08\x6a\x31\xcc\x5a\xfd\x78\x7a\x72\x72\xb7\x5a\
-\xf0\xc7\xeb\x02\xa0\x30\x13\x27\xe5\x1a\x97\x89\x28\xe5\x9e\x4d\
-\x64\x95\x22\x28\x0b\x3a\x74\x47\x14\x85\x9d\x2a\xd0\x5b\xc9\xe4\
-\x97\x42\x1f\xcf\xc5\xef\xc8\xbe\x28\x9e\x6e\x05\x5e\x51\xb9\x91\
-\x80\x8c\x20\x82\x50\x4e\x04\xb7\xfc\x28\x1a\xc0\x38\x22\x08\xf5\
-\x97\xe4\x3e\xbf\xaa\x8b\xe6\x90\xf1\x02\x34\x75\x79\x40\x12\xd2\
-\xe7\xa6\xa7\x60\x0f\xe5\xf7\xbe\x1b\x07\x02\x88\x7c\xbd\xc0\xc4\
-\x54\xba\x95\x8c\x75\x05\x69\x17\xa0\xce\xd9\xce\xaa\x30\xe2\x44\
-\x96\xed\xba\x8b\xbb\x4c\xd1\xad\xb3\xd5\x76\x65\x46\x7f\xac\xf0\
-\xa9\x15\x09\x08\x2a\xa5\x70\x58\x0c\xfd\x8d\xd4\x82\x23\x54\x9b\
-\xc0\xab\x04\x48\x81\x10\x21\x02\xe9\xad\x9d\x61\x68\x67\x1c\xa8\
-\x21\xb3\xba\x96\x60\x36\x20\x04\x95\x41\x95\xa1\x56\xec\x55\xb9\
-\xe7\xc4\x44\x55\xee\xc9\x6b\xbf\x77\xd6\x35\x5a\xa5\xa8\x16\x7b\
-\xbf\xdf\x59\xfb\x25\xe4\xf9\x22\xcd\x40\x06\x96\x13\xcd\xb0\x1a\
-\x5d\xaa\x3e\xc8\x53\xa1\x15\xae\x6e\xa5\xab\x96\xb2\xdc\x28\x02\
-\x44\x6c\x85\x00\x24\x3e\xc0\x69\x9d\xaf\x94\xdb\xc9\xc8\xeb\xd8\
-\xa4\x94\x34\x06\x0d\xfd\x41\xa8\xad\x95\xc0\x64\xa3\x28\x43\xf8\
-\xdd\x7c\xb0\xe4\x4f\xa6\x0d\x5d\x88\xaa\xee\xbc\x57\x2b\x83\xba\
-\x41\xc4\x44\x06\x4b\xdf\x5a\x7b\x2b\x5a\xfa\x92\x17\xe9\x77\x42\
-\xbf\x84\x52\x8f\x51\xeb\x1a\xe4\x00\xc0\xde\x07\x4a\xe7\xa3\xee\
-\xd7\xad\x9c\x51\x8a\x63\x0b\x52\xb1\x06\x01\x3e\x0f\xa0\xbc\xb6\
-\xc7\x96\x17\x20\xfe\x7f\x7c\x28\x46\xab\xad\x05\x02\x80\x91\x5e\
-\x0e\x1d\x5c\x29\x83\x3e\x9a\xcc\x36\x3a\x41\x25\x23\x93\x59\x77\
-\x84\x6d\xd0\x2d\xa7\x6c\x76\x91\x77\xf0\x7e\x6b\x2b\x8c\x24\x57\
-\x00\x65\x1f\xdc\xc9\x0e\x64\x24\xdf\xd8\xa0\x49\x93\xa2\x42\x96\
-\x33\x20\x75\x09\x42\x91\x13\x60\xae\xc9\xb6\x76\x01\x46\x17\xa2\
-\x81\xf0\x58\xc8\x55\x29\x84\xba\x4d\x32\x00\x2c\xd9\x1c\xbe\x36\
-\xd6\xbd\xfc\x91\xca\xe4\x1c\xcc\xd1\xb4\xca\xea\xb6\x71\x88\x08\
-\x0a\x42\xed\x0f\xfb\xc0\x21\xd0\x84\x6e\x07\x5e\x03\xd4\x3d\x29\
-\x01\x38\x58\x53\xb9\xe3\x1e\x84\xc2\x80\x81\x21\xf3\x62\xda\x70\
-\xaa\x02\x70\x88\x42\x70\xfb\x1a\xda\x1e\x86\xfa\x98\x5c\x39\x6d\
-\xc5\x46\xd8\xda\x29\x00\x48\x75\x06\xc6\x0c\xa5\x0b\x84\xd0\x67\
-\xa7\xa1\x15\x41\x56\x9f\x53\x35\xe3\x4d\x8d\x7b\x48\x67\x29\xdc\
-\xca\x08\x79\xb4\xe3\x6c\xb7\x8d\x66\x0d\x5b\x71\x79\x18\xfc\x53\
-\xd3\x15\xa8\x91\x03\x28\x93\xdc\x06\xfe\x3c\x1a\x9f\xdf\xfa\xfe\
-\x65\x2a\x30\x92\xf1\xb5\x28\x32\xff\xed\x3b\x5a\xd1\x91\x79\xc6\
-\x98\x30\xc3\xa2\xc8\xf4\x23\xb7\x4b\xb4\x0a\xf0\x00\xf9\x56\x52\
-\x00\xdb\x11\xa9\xa6\x2f\x42\x3f\xa0\xa7\x20\xd0\xac\x31\x46\xcc\
-\x68\x04\xd2\x6d\x5b\x1b\xbe\xc7\xac\x7f\x4c\x69\xe0\x08\x9f\x0f\
-\x2b\x79\x54\x40\x4a\x05\x5e\xfa\x6b\xd0\xd4\xe6\x14\x05\x57\xc1\
-\x6d\x13\x36\xca\xb9\x8e\xa0\x00\x60\x07\x50\x10\xe3\x22\x9b\xb6\
-\x35\xd9\xb5\xeb\xe9\x04\xd7\x29\x90\xe0\x3f\x2d\x9f\xa5\x39\xbc\
-\x91\x16\xdd\xba\xc6\x7e\x70\xc8\x3e\xba\xf8\xc7\x70\x00\x75\xaf\
-\x40\xdb\xf5\x4a\x45\x6e\x6b\x77\xa0\x6d\x6e\x0b\x22\x93\x67\x12\
-\x0a\x74\x88\x40\x45\x08\x3f\xa5\xa2\x13\x5f\xd4\x2e\x86\x00\x76\
-\xb0\x15\xdc\x6d\x49\x1e\x40\x93\xf5\x6f\x7a\xcd\x6f\xb6\x19\xdb\
-\xb2\x4c\x3d\xc4\x0d\x5a\xc9\x2e\x24\xd4\x3d\xc0\x39\x80\xdc\xda\
-\x3c\x54\x4a\xad\xc1\x56\x52\x00\xd0\xad\xd8\x6e\x1b\xdb\x25\xc3\
-\x28\xac\x47\xa7\x0d\xb8\xf3\xc6\xda\x0f\x4e\xf4\xff\x5d\xec\x80\
-\xd3\x85\xaf\x7f\x58\xd5\xa3\x12\x32\xe3\x0a\xd2\xf8\xbf\x99\x6d\
-\x81\x64\xde\xf5\x08\x39\x00\x31\x0e\xc0\xa8\x2c\xc2\x01\xf0\x3c\
-\x00\x3a\xef\x70\x80\x0a\x72\x87\x23\xe8\x10\xc0\xf6\x26\xf0\x9d\
-\xbe\x48\x17\xfa\x54\xe1\x47\xe1\x2f\x03\xf0\x1f\xf3\x7c\xb3\xff\
-\x01\x03\xd6\xbf\xf8\xf7\xa4\x32\xfd\x44\x81\x7d\xce\x0a\x30\x71\
-\x09\x1a\xe0\xff\x70\xc6\x71\x14\x0e\x20\x16\x16\xec\x14\xc0\xb6\
-\x11\x7a\xdc\x0a\x82\xb1\x4b\x5c\x7a\x41\xf8\x03\xf6\xdb\xb7\xfe\
-\xee\xfd\x8a\x1c\xee\xcd\xfd\x52\x82\xd1\xf5\xfe\x07\x21\xe2\x0f\
-\xc6\x99\xee\x12\x59\x30\x74\x4a\xd0\xae\xa1\x00\x60\x27\x10\x7a\
-\xec\x04\x79\x69\x05\x9f\x09\x3f\xb3\xfe\xde\xf1\xe8\x4d\xa9\x35\
-\x57\x7e\x6e\xd3\x5d\xdf\xe5\xd2\x02\x4a\x77\xfc\x81\xc3\x79\x2b\
-\x70\x3d\x0a\xcc\xd6\xeb\x5a\x37\x40\x89\xb0\x7f\x48\x04\xc0\xc7\
-\x05\xf1\xef\x83\x2a\x9a\x09\x28\x8f\x87\xee\x48\xc0\xa5\x13\x7c\
-\xec\x84\x7d\x69\x05\x3e\x4d\xf8\x39\xf3\xef\x5b\x7f\x62\x09\x73\
-\x9c\x5f\x7d\xd3\x0f\x7f\xa4\x6c\x03\x00\x3b\xc7\x1a\xd4\x3e\xc5\
-\xfe\x0c\x2b\xb2\xbe\xe5\x07\xe5\x77\xfa\xe1\x5d\x82\xbc\xbf\x49\
-\x0e\x1d\xb6\x75\x01\x94\x60\xe9\x3b\x17\x60\xa9\x99\xa9\xa5\x13\
-\xf8\x2e\x89\x28\x78\xb1\xdd\x70\x9f\x20\xfc\x14\xfa\xd3\x70\x98\
-\x63\xfd\x51\x2d\xce\x6f\x38\x73\xcb\x7d\xb7\x6c\x52\x83\xce\x38\
-\x7d\x47\x09\xa0\x3a\xaa\xb8\x33\xe1\x74\xf2\xad\xdb\xd5\xfb\xa9\
-\xb8\x7e\xff\x6b\xff\x7e\x3b\x83\xe2\x1a\x7c\x74\x3a\x05\xdb\x62\
-\x20\x52\x1c\xa4\xd8\x58\x78\xc5\x47\xba\x8f\xb6\x4d\x76\xc2\xdf\
-\xfc\x72\x2b\xa1\xef\x04\xbc\xbd\xd0\x3b\x4f\xbb\x90\xd8\x15\x7e\
-\x12\x2f\xe7\xbc\x80\x55\x18\x8b\xab\x6f\xba\xe0\xc4\x5a\xe8\x4b\
-\xe1\x5f\xd4\x4a\xa0\xee\x07\x70\x94\x69\xf3\x4d\x08\x3f\x80\xe6\
-\xd8\xbf\xd4\xf3\x7a\x7c\xeb\xb1\xc9\xfa\xc7\x2c\x7f\x87\x00\xc6\
-\x2e\xf8\x4b\xd5\x94\x62\x28\xee\x61\xa7\xfa\x25\x42\x29\xc0\xbe\
-\x6f\xcf\x85\x9f\xdf\xa7\x33\xf5\xf4\xb1\xf3\x33\xf7\x7c\xe9\xde\
-\x3b\x2e\xbb\x8b\x08\xbf\x56\x00\x65\xe1\xef\x33\xab\x08\x80\xf1\
-\xfd\x2d\xef\x6f\x1e\xa3\x1d\x07\x66\x66\x09\x8e\x75\x38\x89\xf2\
-\x7d\x7e\x0a\x61\x38\x0f\xa0\x98\xef\xaf\x78\x42\xd0\x68\xeb\x70\
-\x72\x97\x16\xfe\x61\x04\x7f\xa8\xaa\xb3\x8e\x37\x08\x5f\x16\x3f\
-\x0f\x00\x99\x0b\xe0\x0a\xbc\xeb\x0e\x28\x52\x39\x87\x79\x7f\xcd\
-\xad\x57\x7c\x5d\x5b\xff\xb2\x3d\x76\x39\x2c\xa3\x1a\x9b\x75\xd5\
-\x8f\xde\x58\x96\x6f\x1d\xad\xad\xbf\xdb\xdd\x17\x58\x11\x90\x6b\
-\xfd\xad\xaf\x0f\x63\x4e\x17\x1e\x17\x02\xe8\x48\xc0\xa5\x15\x7c\
-\x6c\x57\xe1\x85\x2d\x3f\x7b\x97\x47\x61\x88\x9e\x63\xa0\x78\xb7\
-\x5c\x26\xfc\x48\x5c\x06\x7d\x7f\xc3\xea\xab\xde\x3f\xbb\xe9\xae\
-\x2d\x44\xf8\xed\xb4\x9c\x2a\xf4\xa7\x0e\x37\xad\xc0\xcd\xa4\x5d\
-\x30\xd3\x7e\x06\x82\x5d\xff\x07\x7c\x9a\x2f\x8c\x45\x71\x87\x82\
-\x9d\x48\xc8\x4c\x24\x8f\xd1\xfc\x53\xec\x9e\x62\xf7\x3a\x05\x30\
-\x94\xf0\x0f\x27\xf8\x98\x00\x69\x3b\xc9\x4f\x45\x52\xb2\xe0\x37\
-\x09\xbf\x4b\x08\xce\xcf\xac\xfb\xc2\xad\x57\x7e\xe3\x42\x02\xfd\
-\x8d\x02\xf8\xce\x57\x5e\x36\x05\x98\x7f\xdc\x99\xe8\x8b\x7a\xec\
-\xb6\x46\x03\x58\x4f\xaf\x26\x28\xa0\x7e\x5e\x1e\x60\xcb\x26\x5c\
-\xe1\x30\x1a\x60\x18\x17\x40\x75\x61\xc0\x25\x17\xfe\x86\x4a\x34\
-\x0c\x16\xa6\xe3\x58\x04\x62\xd7\xc2\x01\x42\x7c\x9f\x5e\xe1\x26\
-\xe1\x2f\xfe\xef\x2d\x6c\xbe\xe0\xda\x9f\x7e\xfc\xb8\xfa\xcd\x4a\
-\xe1\x9f\x2b\xf6\xd9\xfa\x7e\x7e\xf0\x81\xab\xde\x5a\x08\xe9\x63\
-\xa1\x9e\xae\x69\xc3\x78\xed\xfa\xfc\x8d\x3f\xfd\x7f\x18\x17\x40\
-\xa9\x71\x85\x00\xb7\x1f\x05\x30\xae\x2b\x1b\xd2\x84\x63\x10\xfc\
-\xd6\x42\x8f\x38\x8c\x8a\xda\x75\xe0\x7f\xe0\x5a\x47\x05\x9f\xf8\
-\xfc\xfa\x71\xde\x9b\xbf\xee\x37\x97\x7d\xfe\x9d\xcc\xef\x9f\xd5\
-\xd6\xff\xaa\x0b\x5e\xf7\xe8\xc2\x8a\xbf\xdf\x23\xfb\x6a\x50\x1f\
-\xba\xa5\x09\x40\xc6\xdf\x0f\xb4\xfe\x1e\x89\x04\xe4\x68\x20\x68\
-\xed\x39\x4a\x60\xc9\x41\xdb\xbd\x02\x00\xda\x47\x05\x1c\xba\xc5\
-\x85\x55\x29\x61\x16\x14\xfe\x2e\xf7\x14\x89\x1b\xce\xc5\xb0\xf0\
-\xa7\x08\x3e\xa6\x2f\x68\x1c\x55\xe4\x77\xa9\x50\x22\xf3\xff\xd9\
-\x98\xac\x98\xf0\x63\x7f\xf1\xee\x3b\xae\x39\xf3\x4d\xf3\x5b\xd6\
-\xcd\xd5\xd0\xbf\xbc\x9d\xd1\xd6\xff\xa7\x67\xbe\x62\x8f\x02\xd7\
-\xff\x8f\x2a\x87\x67\x82\xc1\xfd\xc6\x07\x40\x27\x04\x88\xf5\x44\
-\x60\x74\x08\x3f\xde\x34\x4c\x82\xff\x38\xac\xfc\x27\x73\x00\x32\
-\x17\x60\x1f\x6f\x6f\x2e\x00\xd8\xe6\x9e\x46\xf3\x3a\x17\x0f\x4c\
-\xc3\x51\x5f\x13\xf0\xde\x86\xd2\xe5\xcd\x04\x48\x04\x5e\xae\x06\
-\x50\x0d\x00\x24\xe9\xc3\xd1\xba\x98\x28\xf8\x98\xe6\xc3\xee\xb2\
-\x82\xdc\x0e\xef\x60\xf0\x1a\x35\x0b\xfe\x60\xc6\xe7\xe2\x9d\x77\
-\x5c\x7b\xd6\xab\xef\xbb\xeb\x57\xab\x6b\xe1\xd7\x96\xbf\xb2\xfe\
-\x27\xfe\xf7\x11\x13\x7b\xae\x9c\x3e\x05\x10\x0f\xd5\x3e\xbe\x32\
-\x56\xde\x45\x00\x0a\xf9\x7c\x40\xf0\x07\x86\xa8\x31\x58\xff\xa1\
-\x10\x80\xf2\xad\xbd\xf4\x78\x9b\x2a\x80\x3a\xa0\x0a\xc1\xb1\x49\
-\xb4\xb5\x30\x0b\xb3\x34\x16\x5f\x40\xe4\x1a\x72\xd2\x86\x1d\x05\
-\x5a\x59\xe8\xa1\x0b\x60\x9f\xd6\x62\x4e\x1b\x3f\x22\x26\x0b\x3e\
-\x46\x7d\xd8\x74\x04\xb0\xcb\xa8\x88\x94\xeb\xc3\xe3\xff\x04\xc6\
-\x51\xe1\xcf\xfb\xf3\x57\x17\x96\xff\x2d\x82\xf0\x6f\xa9\x51\x40\
-\xef\x49\xbf\xb7\xff\x17\x33\xc0\xe7\x99\xa6\x99\xc0\xe2\xfb\x3a\
-\x14\x08\x68\x52\x7f\x2d\x1f\xe0\x86\xfe\x42\xe4\xdf\xd6\xe1\x00\
-\x94\x8a\xa7\x02\x2b\xb5\x6d\xc2\x80\x62\x03\x05\x10\x06\x86\xf8\
-\xdd\x8a\x3d\x17\x80\xbe\x07\x1d\xa3\x1a\x54\x0a\xca\x9f\xcc\x48\
-\xfe\x7e\x30\x7a\x09\x5c\x0a\x85\x40\x3f\xea\x1b\xd0\x49\xaf\x58\
-\x27\x82\x20\xbf\xa8\xc9\x42\x1f\x71\x03\x3a\x34\xe0\x5f\x99\x60\
-\x24\x80\x73\x02\xda\xd2\xe5\x33\xb3\x9b\xef\xfe\xf4\x8d\x97\x7d\
-\xe1\x2b\xfd\xde\xbc\x4e\xf3\x5d\xa0\xc2\xff\xda\x97\x3f\x3e\x7f\
-\xed\xcb\x1f\x77\x5c\x06\xea\xa8\xba\xa2\xdf\x5a\x7b\x9a\xe4\xc3\
-\xc7\xd9\x2b\x67\x7c\xaf\x63\xed\x41\x2d\x95\xcc\xc7\x10\x40\xc8\
-\xe7\x57\x2c\x21\x68\x34\x33\xd2\x52\x01\xd4\x49\x14\x8e\x75\x86\
-\xa0\x85\x77\xec\x33\xad\xb4\xf2\xec\xba\x34\x4f\xa0\xe1\x4b\x41\
-\x26\xf8\x0f\xc8\xb4\xf7\x80\x18\xd4\x3f\x24\x52\xf9\x37\xe7\x4c\
-\x89\x27\xd2\xfe\x91\xfc\x0d\x26\x08\x3d\x26\x0b\xfa\x4e\xae\x08\
-\x10\x5b\x7e\x7b\x19\x71\x39\x70\x1f\xf3\xcd\x8b\x73\xeb\x4f\x5f\
-\x7d\xe3\x0f\xbe\x58\x58\xfd\x35\xca\xa6\xf9\x2e\xd4\x3e\x7f\x29\
-\xfc\xb3\x1f\x7e\xdf\x1f\xab\x67\xff\x9f\x87\x7e\xa9\x58\x1a\x2f\
-\x36\xca\xde\xc4\xf4\xc1\x7d\xec\x3d\xaf\x6a\x34\x88\x41\xbf\x1e\
-\xc0\xcd\x05\x68\xeb\xff\xb7\xe3\x00\x64\xff\x5f\x79\xfe\xff\x68\
-\xd9\x09\xcd\x0a\x00\x68\xdb\x64\x22\xba\x74\x36\x11\xc9\x95\x46\
-\x8a\x0a\x8c\xb2\xa0\xc7\x22\xb3\xd8\xa1\xf6\x4a\xe1\xc4\x0b\x90\
-\xc9\x03\x85\xec\xa9\x2a\x73\xac\xee\xf8\x32\xf8\x9d\x6b\x28\x68\
-\xa7\x33\x16\x2b\x89\xc6\x79\x89\x7f\x90\x2b\x42\x12\xf1\x75\x2d\
-\xe7\xa5\x37\x59\xb9\x5d\x0a\xf2\x27\x87\x63\x65\x74\x85\x79\x7e\
-\x5f\x7f\x71\xe6\x92\xd9\x4d\x77\x9e\x77\xe7\x75\x67\xff\x78\x7e\
-\xcb\xba\x79\x65\xab\xfb\x34\xdb\x3f\xa7\x2d\xff\x77\xbf\x72\xe4\
-\x3e\x07\x3e\x68\x8f\x53\x0a\x0b\xff\x07\x95\xc5\x07\x1b\xe6\x0b\
-\xde\x9a\xe3\x7c\xfb\x63\x42\x85\x5b\xed\x1a\x61\xc3\x73\x4d\x95\
-\x81\x4b\xa1\x00\x1c\x01\xb6\xbe\xbe\x12\x3b\xa3\xbb\xe8\xc0\x58\
-\x68\xa6\x40\x3c\x97\x40\x9a\x67\x42\xc3\x2d\xb1\xeb\xc6\xfb\xb4\
-\xa1\xe3\xdd\x13\x5e\x62\xd0\xda\x5b\xb1\x74\x4f\x4d\x0a\x9a\xcc\
-\x30\x93\x5d\x8a\x06\x1d\xd8\x06\x8d\x14\x90\x02\x0b\x39\x6a\x2b\
-\x96\x2f\xe6\xfd\xc5\x1b\x7a\xbd\xb9\x9b\x8a\xbf\x9b\x0b\x0a\x02\
-\xee\xda\x0a\x20\xa4\x12\x0b\xa1\xef\x2d\xce\x6f\xbc\x76\x66\xc3\
-\x6d\x57\xdf\x75\xfd\xb9\xd7\xb1\x15\x4e\x8b\x7b\x34\xec\x2f\xaf\
-\xf1\xdc\x65\xe7\xfc\xed\xe1\xcb\xa6\x27\xbe\x50\x98\x8c\xbd\x75\
-\x82\x8f\x81\xfd\x40\x71\xaa\xef\x0e\x38\x29\x80\x11\xe8\xef\x93\
-\x81\x43\xfe\x8e\x43\xbb\x00\x11\x32\x70\xa9\x14\x00\x50\xa8\x0c\
-\xae\xb4\x02\x43\x08\x2e\x2e\x02\xa7\xba\x0a\xbc\xf9\x62\xed\xda\
-\xae\x80\xe2\x82\x2d\x04\x11\xcd\x53\xe8\x84\x6e\xf4\xc5\xd5\x1a\
-\x1d\xf5\xb9\x20\x57\x08\x48\xf8\x4a\x28\xfb\x83\x9b\xf7\x41\x40\
-\x3b\x36\xaa\x5e\x48\x83\x43\x7a\x6b\x7a\xf3\x9b\x2f\x9a\xdd\xbc\
-\xf6\xa2\x0d\xab\xaf\xfc\xe5\x3d\xb7\x5f\x72\x77\x44\x9d\x77\x5b\
-\x3b\x31\xe1\x82\xdf\x23\xc2\x5f\x65\xf9\x7d\xef\xd4\x97\xfc\xd6\
-\xbe\x0f\xd8\xed\x98\x2c\x53\xcf\x87\x7a\xaa\x2e\xd4\x0d\x3c\x21\
-\xb3\xf6\x4a\x5b\x79\x60\x44\xa0\x11\xec\x7a\xdd\x84\x88\xbf\xa5\
-\x6b\x13\x8e\x2d\x09\xc1\x90\xe5\x5f\x2a\x12\x50\x5f\x45\x53\x36\
-\x49\xfc\xf9\xea\xf9\x8c\x11\x7f\x19\x79\x5d\x45\x49\x40\xc7\x02\
-\x8b\x25\xd6\x10\x57\x4a\xf4\x82\x91\xb6\x6e\xba\x96\xdb\x84\xfb\
-\xd0\xfa\x79\x46\xa7\x97\xd6\xdb\xa6\x7b\xfb\x20\x0a\x89\x8a\xaf\
-\xe6\xb4\xd3\xe8\x40\x3e\xb3\x30\xbf\xf1\xbc\x4d\xf7\xfc\xe6\x3b\
-\xb7\x5e\xf1\x3f\x97\x08\x56\x4a\xba\xdf\x6d\xed\xa5\x42\x0b\x3e\
-\x17\xfe\xc5\xaf\x9f\x70\xc4\x3e\x0f\x3b\x64\xaf\xf7\x4c\x4c\xc0\
-\xdf\x99\x36\x5f\x66\x59\xa2\x49\xe1\xa5\xa4\x9f\x46\x00\x94\xeb\
-\xb3\xed\xc0\xa9\x77\xda\x4c\xfc\x8d\xa4\x0f\x1a\x11\x80\x0a\x24\
-\xfe\xa8\x40\x28\x50\x2d\x6d\x18\xd0\x15\x78\x65\x7d\xea\x5a\x70\
-\x9d\x3a\x6a\x70\x49\x40\x2a\xec\xa0\x19\x13\x92\x00\x00\x2a\x93\
-\xad\x7e\xca\x05\xd6\xe7\x43\x85\x5f\xe9\x1f\xbf\x7e\x7f\x24\x44\
-\x1f\xda\x16\x50\xee\x50\xe6\xf2\x98\x5c\x01\xe9\xed\x9e\x43\xad\
-\x51\x73\x8b\x0a\x54\x3f\xdf\x3c\xb7\x65\xed\xa9\x77\x5c\x73\xe6\
-\x29\x1b\xd7\x5d\xb7\x91\x08\x77\x9f\x2d\xd6\x9c\xdc\x76\x4a\x60\
-\xb8\x2d\x67\x96\xbf\xba\xfd\xe6\xe7\x8f\xd8\xef\xe0\x03\xf7\x7c\
-\xe3\xe4\x64\xf6\x9a\xe2\x67\x5e\x51\xd7\xf7\x3b\x04\x1f\x9a\x59\
-\x79\x9c\xf4\x23\x71\x1f\x70\x93\x7e\x80\x14\x06\xb9\xab\xc3\x27\
-\xfe\xc6\x6b\xf3\x25\x12\x30\x94\x04\xa4\x44\x1a\xd0\xef\x8d\x3c\
-\xf6\x28\x80\x0b\xef\x01\xc0\x87\xfe\x40\x99\x7f\x70\x51\x81\x52\
-\x56\xd0\x81\x08\x37\x80\xa9\xb0\x92\x62\xfd\xb2\x0a\x46\xc9\x3f\
-\x60\x47\x10\x28\x81\x54\xc8\xb5\xe5\xaf\x49\x40\xb4\xba\x63\xd0\
-\x0a\x3a\xb7\xc9\x42\xb9\xfd\xbe\x58\x38\xa6\x73\x5b\xee\xfd\xda\
-\xad\x97\x9f\xfa\xe9\xcd\xf7\xdd\xb4\x59\x80\xa5\xda\x3a\xe9\x5b\
-\xde\x85\xa6\x73\x07\x86\x77\x01\xf2\x42\xe8\xf7\x3f\xe8\x41\x2b\
-\x0f\x9f\x98\xc8\x5e\x92\x65\xf0\x2c\x00\xf3\x8b\xd6\x16\x9e\x2e\
-\x45\xfa\x3c\x4d\xef\xb5\xd6\xdd\x49\xfe\xb1\xf6\x21\x39\xc1\x67\
-\x64\x6f\x20\x15\x01\x88\xbc\xc0\xd6\x4e\x04\x22\x4c\x3f\x40\x66\
-\xf9\x00\x64\xaf\xf1\xc8\x00\x0b\x0d\x42\xed\x47\x3b\xc7\xf1\xa8\
-\x42\x90\xed\x97\x18\x63\xf4\xf4\x81\x9d\xe3\x06\xf6\xe2\x10\x44\
-\x82\xb5\xf0\x1b\xa5\x60\x9a\x42\xea\xe1\x8b\xc4\x87\xa8\xef\xf6\
-\x16\xe7\xaf\x5a\x7b\xd3\x8f\x8e\xb9\xf3\xba\xb3\x6f\x60\x0c\xf4\
-\x22\x81\xa4\x0b\x44\x01\x84\x2c\x7f\x27\xfc\x0d\xdb\xe9\x27\x1d\
-\xb1\xf7\x3e\x0f\x58\xf1\x90\x89\x2c\xdb\x27\x03\x75\xe8\xc4\x24\
-\x3c\x2e\x03\x78\x5a\x21\x98\x87\x7a\x20\x94\x3d\x56\x40\xc8\x3e\
-\xe3\xcf\x83\xe3\xfb\x6b\xee\xc6\xa6\xfd\xca\xa3\xc0\x60\xab\xf8\
-\xfe\xa3\x70\x00\xa1\x48\xc0\x52\x45\x01\x00\x5c\xc1\x57\x8a\x08\
-\xbd\x56\x0c\x8c\x20\x04\xf0\x12\x79\xec\x71\xca\x85\xfe\x21\x68\
-\x1f\xb1\xfe\xa0\x58\xe2\x8f\x80\x22\x8c\x3c\x3b\x24\x60\x7d\x7c\
-\x3d\x09\x56\x27\x06\x20\x52\xb7\x64\xa0\x03\x0a\xb8\xff\xa5\xeb\
-\x2e\xfc\xd4\x71\x8b\x73\x1b\x16\x18\x03\x3d\x4f\xf6\x4a\x11\x7c\
-\xec\x98\x3f\x5c\xf9\x84\xc7\xec\xfb\x82\xe9\xe9\xc9\x3f\x2b\xde\
-\xfa\xb7\xca\xca\x33\x1a\x0e\x85\x61\x93\xc9\x50\x35\x2a\xc9\x1d\
-\x71\x83\xc8\x4f\x4e\x23\x3f\x5c\xe8\xed\x38\x6c\xf0\x04\x9f\xbe\
-\xe6\x2a\x01\x82\x0c\x46\x14\xfe\xad\x53\x0d\x28\xdd\xdf\x46\x0a\
-\x40\x8c\xf9\x6b\xe1\xa7\xfe\x3e\xc9\x0a\xe4\xd9\x7d\x40\x08\x44\
-\x31\x6a\xd0\x08\xb9\x78\xac\x9f\x25\x8e\xf0\x5f\x45\xc7\xfa\xf5\
-\x5d\xd2\xd2\x19\x8d\xf0\x5b\x7e\xa0\x9a\x08\x53\xf3\x00\x65\xa8\
-\xb0\x78\x3c\xbf\x7e\xf5\x55\xef\xfc\xcd\xa5\x9f\xbf\x80\xf8\xf8\
-\x5a\xf0\xe7\xea\x7d\xfe\xc8\x23\x1e\x96\xbd\xe1\x55\x8f\xfe\xe3\
-\x65\x53\x93\x2f\x2d\xde\xf2\xb9\x03\x9f\xd4\xa1\x47\x4c\x6a\x69\
-\x28\xed\x09\x93\x25\x05\xc7\x80\x23\x30\xed\x2d\x5a\x7e\xc6\xb0\
-\x23\xb2\xfc\x51\x5b\xf6\x04\x80\xd4\x91\x50\xe5\x6d\x15\x02\xeb\
-\xe0\x09\x9c\x3c\xa2\xe9\xdd\xd4\x9d\x43\xf7\xcf\xc8\xa4\x1f\xcf\
-\xef\x47\x5f\xf8\xc7\x91\xcc\xe9\x35\x05\xa5\xeb\x1a\xed\x5c\x4b\
-\x8b\xf4\xb1\x71\x62\xd0\xd2\xf5\x03\x00\x6b\xed\x81\x26\xfd\x50\
-\x08\x2f\x29\x07\xc5\xf9\x01\xf0\x5d\xf7\x21\x47\x8d\x7b\x0a\xa1\
-\x6a\xf6\xe2\xbb\x0a\x21\x1e\x17\xd0\x46\x06\x72\xcd\x02\x94\x4e\
-\x7f\x05\x08\xf2\x8d\xeb\x6e\xbd\xf0\x4d\xb7\x5c\xf1\xf5\xcb\x09\
-\xdc\xd7\x31\xe7\xaa\xc8\xe4\x5d\x6f\x78\xfc\xf4\x0b\x9e\xfd\xd0\
-\x63\x26\x27\xe0\x6f\x8a\xc7\x7b\xeb\xc4\x12\x1a\x4a\xb2\xc4\xa7\
-\xbf\xa8\x53\xac\x09\x0e\x63\x40\x1a\x8f\xf5\x2d\x1a\xb6\xbf\xfc\
-\x49\x27\x91\xaa\x13\xbc\x6b\x22\x22\x02\x7b\x5d\x2d\xfa\x74\x9f\
-\xf3\xad\x3e\xb2\xf7\x23\x79\xfe\xdb\x1c\xf6\x8f\x13\x01\x8c\xee\
-\x5d\x36\x22\x00\x70\x58\x16\x56\xf4\x63\xc2\x84\x8a\x91\x7f\x8c\
-\x04\x0c\x85\x05\x23\xb9\x01\x10\x23\xff\xd0\x42\x7c\xa7\x32\xd0\
-\xe9\xed\xac\x41\x0a\x1a\xeb\x6f\x19\xdd\x9a\x7c\xd4\x28\x20\x2f\
-\x1f\xe7\x9b\x57\xdf\xf8\xc3\xff\x7b\xfb\xaf\x4f\xbf\x96\x08\x3f\
-\x2d\x2f\x9d\xff\xd1\xb7\xfe\xfc\xd9\xcb\x97\x4d\x7e\xbc\x38\xfa\
-\x00\x47\x0f\x32\xdf\xd4\xb1\x62\x10\x16\x0a\x08\x14\x3d\x26\xcb\
-\x20\x8c\xba\xee\x1a\x50\xc1\x98\xe4\x20\xac\x10\x7c\xd7\xcd\x13\
-\x78\x07\x61\xba\x7f\x03\xe2\x73\x68\x22\x3a\xd4\xf7\x57\xb4\x18\
-\x8c\x94\x87\xc7\x92\x7d\xc6\x46\xfc\x25\x91\x80\x2a\x52\x09\x48\
-\xd6\x37\x0f\x0f\xaa\x25\x25\x01\x95\xb3\xba\x41\x67\x58\x28\x4b\
-\x0a\x82\x20\xf4\x2e\x07\x00\x5e\x06\x61\xd0\xa7\x6d\x01\x27\x6d\
-\x5a\x0f\x6d\xd6\x40\x9f\xc5\x5a\x49\x64\x35\x01\xa8\x95\x42\x4d\
-\x48\xd6\x0b\x22\xcf\x2b\xbe\x6e\x7e\xcd\xcd\x3f\x7e\x1d\x11\xfe\
-\xc5\x5a\xe8\x67\xea\x7d\xfe\xc2\x33\xff\xe2\x4d\x85\xd5\x3f\xd6\
-\x24\x9a\x80\x72\x4b\x9e\x41\x31\xa8\xea\xfb\xff\x10\x4a\x6d\x06\
-\x90\x85\x79\x1c\xb1\xe6\xa8\xe2\x68\x40\x05\x30\x5e\x45\x20\xff\
-\xc4\x3e\x3a\x52\x12\x02\x50\x20\x2a\x08\x7b\x9d\x7d\xab\xcf\x91\
-\x83\x34\x00\xa4\xc9\xf2\x2f\xed\x10\xe0\x50\x31\x59\x9b\x71\x61\
-\x4b\x49\x02\xea\xc2\x1a\x1d\x05\xa0\xee\x00\x67\xf3\xb9\x0b\x00\
-\xd6\x3a\xc7\x39\x00\x68\x77\xb1\xbd\x7c\x7f\xf2\x3e\xac\xbd\x13\
-\x30\x46\x50\xe7\x09\x58\xf8\x30\x58\x10\xeb\xef\xbe\xea\xdd\xb7\
-\x5e\x71\xda\x95\xb5\xf0\xd3\xea\xb2\x4a\xf8\x2f\x3a\xeb\x85\xef\
-\x98\x00\x3c\x46\x27\x9a\x80\x29\x7f\x26\x99\x67\x9c\x78\xd2\xfe\
-\x26\xaa\x04\xf8\x1f\x48\x15\x80\x34\xc1\xc6\x51\x91\x41\x13\xfa\
-\x10\x14\xc1\x58\xc6\x63\x33\x8e\x03\xa4\x0c\x50\x24\x7e\xbf\xe2\
-\xa5\x66\x56\xa9\x8a\x56\x9f\xfe\x05\xf9\x3d\xb6\x89\xe5\x1f\x0b\
-\x02\x50\x42\x1a\xf0\x12\x22\x00\x50\xe0\x44\x02\xb8\xb5\x07\x9e\
-\x17\xc0\xb2\x06\x7d\x0e\x00\x6c\xc3\x85\x20\x0a\x68\x90\x78\xe2\
-\xe5\x57\x29\xc7\x99\xe3\x0f\x98\x8a\x3f\x55\xa7\xef\xe6\x64\xd6\
-\x9b\x2e\x05\xa4\xeb\x79\x6e\xcb\xda\x93\xaf\xbb\xe8\x84\xef\x33\
-\xcb\xbf\xb9\x16\xfe\x85\x8b\xcf\xfa\xf3\x37\x4c\x00\x1c\x43\xb3\
-\xcc\x32\x60\x0c\x33\x61\x9f\xcd\x02\xcd\xe8\xad\x4e\x3c\x89\x2d\
-\xb0\x21\x20\x80\xb0\x98\x71\x18\x64\xd0\x96\x8f\xc0\xe1\x92\x4f\
-\x00\x1a\xc8\x66\x91\x10\x0c\x28\x1d\x60\x02\x0e\xee\xf3\x28\x58\
-\x7d\x14\x74\x59\x28\xd1\x67\x98\x4a\xbf\xf6\x5e\x3f\x32\x1b\x1e\
-\xaa\x04\x6c\xee\x10\xb4\x44\x2e\x40\x40\xe8\x8d\xff\xaf\x98\xd0\
-\x03\x4b\x05\xae\x11\x80\x3e\xd6\xfb\x85\x21\xb2\x06\x9b\xf0\xa7\
-\x6e\x01\x96\xd7\x46\x1e\x45\x64\x01\x9a\x30\x80\x01\x12\x40\xd2\
-\xfa\xa9\xdf\x9b\xbf\xea\x9a\x1f\x7d\xec\x93\xc4\xe7\x77\x2d\xff\
-\x99\x47\x1c\x59\x9c\xf9\x87\xab\x4c\xc1\x0c\x94\x13\xfc\x00\x5b\
-\x7a\x4c\x38\xc0\x3a\x34\x45\x98\x67\x07\xc6\xfa\x3d\x4b\x52\xa4\
-\x0e\x00\x5a\x0b\x6e\x14\x19\xb4\x1a\x6d\x80\x61\xd7\xa0\x35\x11\
-\x19\x66\xfe\x9b\x88\x41\xc7\xda\x93\xee\x4f\x40\xf2\xb9\xc1\xc9\
-\x51\x89\x5b\xfd\xad\x6e\xf9\x5b\x21\x00\x6a\xf1\x95\x3f\x04\xc4\
-\x43\x00\x4b\x14\x05\x00\x89\xcc\x73\x18\x7f\x25\x70\x00\x9c\x38\
-\x74\xd8\x1a\xb7\x3c\xd8\xe1\x19\x30\x6d\x45\x3b\xe4\x1f\x12\x37\
-\x03\x2b\x5f\xdf\x72\x02\x35\xd1\x57\x0b\xbb\x5d\x3a\x75\x5a\x30\
-\xa8\xc5\xbb\xae\x3d\xe7\xbd\x0b\x83\x38\x3f\x25\xfc\x2a\xcb\xff\
-\xb3\x33\x9e\xff\xbb\x13\x13\x70\x42\xb9\xc0\xb2\x6c\xe0\x5e\xd0\
-\xf2\x51\x27\xd1\x84\x96\x95\x7a\x84\x15\xbd\x96\x31\x21\x88\xc9\
-\x20\x0e\xb5\xc8\x60\x14\xf2\x10\xf8\x7b\xe1\xe8\x4a\xa5\x41\xa1\
-\x51\xa8\x1f\x74\x09\xbc\x08\x80\x74\x31\x51\x41\x3c\x61\x74\x1b\
-\xf9\xfc\xa9\x1c\x40\x8c\x07\x18\x4f\x19\x70\x58\x01\x48\xec\xab\
-\x47\x79\x93\x5c\x00\xc8\x7c\x0e\x80\x90\x7e\x83\xa3\x33\x31\x0a\
-\x00\x91\x82\xa1\xf8\x65\x23\xec\xb1\xdb\x5a\xc8\xeb\x09\x60\x2c\
-\x43\x6e\x79\xe7\x52\x98\xe7\x36\xad\xfd\xd2\x1d\xd7\x9e\x7d\xb3\
-\xb2\x2d\xa5\x0c\xe1\x77\xce\x57\x9f\xbd\x7c\x6a\x02\xbe\x51\xbc\
-\xdb\x0a\x3a\x22\x4a\xa7\x95\x66\xc0\x8a\x4c\xc0\x1d\x1f\xe1\xfa\
-\xae\x6c\x61\x43\x40\x00\xb0\x81\xab\x53\xcd\xf3\x86\x52\x2c\xf4\
-\x50\x8c\x3f\xf8\x8a\xa0\xad\x52\x81\x06\xe8\x23\x46\x49\x3c\xd7\
-\x20\xa0\x1c\x5a\x0b\xbe\xda\x0e\x84\x7f\x58\x05\x30\x5e\x45\x30\
-\x19\xbb\x5a\x40\xea\x2a\xc1\x49\xf9\xb5\xfe\xbc\x55\x04\x94\x04\
-\xcc\x18\xe1\x47\x05\x5e\xaa\x21\x90\x7f\xf8\x41\x8c\x3f\x13\x2e\
-\x89\xb5\xf4\xc6\x0b\xc2\x81\x32\xaa\x16\x49\x8e\x36\xd5\x97\x92\
-\x7f\x5a\x5b\xe4\xfd\x8d\xd7\x5f\x74\xe2\x89\xc4\xef\xd7\x7d\xe4\
-\x4b\x45\xd0\xbf\xdf\xaa\xe9\xc2\xe7\xc7\x43\x9c\x06\x12\xf5\xe2\
-\x2a\xd1\x80\x5b\x66\x0a\x6e\xa0\x83\x32\xd2\xe0\x5b\x3c\x6e\xe5\
-\x54\x0b\x0a\x20\x28\xd7\x98\xce\xea\x41\x5b\xc6\x1f\x42\xaf\xe3\
-\xd0\xe0\x42\xfc\xbd\xa5\x4b\x12\x22\x75\x55\x00\xea\x37\xa0\x9f\
-\x58\xbe\xff\x56\x0b\xff\x0f\xed\x02\xc4\x08\xc0\x71\x28\x00\x69\
-\xa1\x38\x3e\xbf\x2d\x01\x76\x04\xdf\x10\x7b\xae\xd0\x0f\x80\x01\
-\x41\x0b\x59\xa0\x38\x28\x62\x72\x1c\xe1\x77\x7a\x7f\xda\x76\x60\
-\x92\xf3\x80\x75\x59\x32\x62\x9f\xf4\x27\x40\x93\x26\x30\xbb\x69\
-\xf5\x57\xb6\xac\xbf\x75\x8b\xb2\xad\xa4\x75\x73\x89\xde\x25\x67\
-\x3d\xff\xc9\x85\xb0\xff\xa3\xad\x2b\xb7\x39\xe6\x03\xe1\x07\x37\
-\xec\x07\xa4\x01\x85\x1f\x1c\x71\x19\x6c\x68\x21\x10\x2d\xa2\x00\
-\x8e\xfc\x60\x02\x2e\x8f\xa1\x02\x68\x3c\x39\xb7\x83\x92\x1a\x43\
-\x1e\x01\xa4\xa1\x0a\xf4\x2e\xa2\x4b\xf0\x85\xbe\xb9\x56\xc0\xc1\
-\x0e\x53\xb0\xad\x52\x7f\x52\x48\xc0\x38\x01\x38\x6a\x53\xb0\x49\
-\x0e\xf1\x64\x0e\x80\x76\xf5\xe1\xf0\x9e\x08\x3d\x28\x5b\x34\x44\
-\xa9\xf0\x5a\x69\x84\x7e\x59\x00\x9b\xa8\x23\xe2\x4e\x89\x08\xd0\
-\x0a\x90\xd4\x75\x9b\x99\xe9\x60\x61\xbb\x49\x00\xaa\x6e\xb3\x72\
-\x80\xe4\xcc\xcd\x97\x7f\xfd\x6b\xca\xf6\x94\xd3\xe9\xbd\x8b\x9f\
-\x3c\xf6\x29\x65\x66\xc0\xf1\xc5\xf1\x13\x66\x8a\x0c\x0b\xf5\x01\
-\xcd\x47\xf7\x38\x80\x70\x02\x10\xef\x81\x20\xcd\x1b\x90\x48\xb1\
-\x34\xf3\xdd\xd8\x46\x41\x46\x05\x18\xbf\xd2\xc1\x53\x49\xfd\xfb\
-\xe4\x8c\xc0\x36\x2f\x62\xc0\x5d\x88\x71\x0d\xd8\xfe\x73\x77\x18\
-\x17\xa0\x2d\x13\xcb\x15\x00\x34\x59\x20\x9b\x03\x60\x05\xdf\x12\
-\x7d\x95\x9d\x06\x3f\xf5\xd7\x2f\x08\x62\xa9\xc3\x2c\x84\x33\x52\
-\x5c\x19\x91\x21\x91\x3a\xaf\xba\x42\x02\x68\x2b\x01\xcb\xf1\xd1\
-\x73\xf7\x9d\xbb\xfe\xee\xab\x36\x10\x05\xa0\x27\xc8\xe6\x4f\x78\
-\xcc\xde\x7f\x56\x1c\xf3\x58\x9b\xfb\xc0\xaa\xca\x1c\xcb\xef\x13\
-\x80\x4e\x1a\x2a\x13\x7c\x37\x51\x05\x05\xff\x1e\x93\xfb\xa1\xb6\
-\x66\xe2\xb1\xd9\x3d\x68\xed\x1a\x78\xdc\xc0\x08\x48\x00\x23\xd2\
-\x88\x28\xe9\x80\xa8\x7e\xa1\x85\x5f\x51\xc1\xc7\x6d\x2c\xf3\xa9\
-\x2e\x80\x8a\x95\x05\xab\xd1\xf2\x00\x78\xfb\x0e\xe7\x46\xc7\xf9\
-\x4d\x4d\x40\x16\xa8\x03\x70\xb3\x02\x81\x47\x04\x68\x4f\x40\xaf\
-\xa7\xa0\x94\x05\x17\xfb\x85\x58\xca\xaf\xae\xd2\x25\xcd\x3c\x07\
-\xc2\x4f\x5a\x7d\xe9\x16\x65\xc5\xdd\x8d\xab\xaf\x39\x93\xf8\xfe\
-\xba\xaa\xaf\x7f\xf1\x77\x9e\x53\x26\x04\x1f\xed\x24\xf5\x38\x3d\
-\xe4\x29\x0f\x1a\x16\xfe\x90\xe0\x0b\xcd\x8b\x7d\x59\x6c\x10\xb2\
-\x24\x65\x10\x73\x11\x5a\x4e\x36\xc7\x94\xf3\xf0\x34\x07\xb6\x3f\
-\x3f\x95\xee\x26\x35\x0a\x7d\x83\x64\xc3\x76\x55\x58\x39\x0a\x02\
-\x90\x6e\x87\x74\x01\xc2\x33\x10\xc0\xfa\xdc\x64\xae\x3a\x15\x72\
-\xa8\xe0\xbd\xdb\x07\x00\x68\x16\x0c\x58\xee\x38\x63\xf9\x01\x1e\
-\xee\x00\x01\xea\x2b\x2a\xef\x72\x27\xe0\x0a\xda\x1b\xf8\xaf\xc5\
-\x2f\x33\x0d\x40\x74\x8b\x80\x3e\xf6\xee\xbe\xfe\xe2\xcf\x5f\xa6\
-\xdc\x0a\xbf\xaa\x89\x47\x21\xa8\x8f\x2f\x6e\x7f\x9f\xd7\x3b\xf1\
-\x96\x53\x1a\xad\x50\x12\xd0\x66\x08\xc6\x05\xdf\x55\x82\xed\x7c\
-\x7c\x95\xc6\xc1\x45\x5d\x84\xa4\x36\x9d\x44\xaf\x82\x6a\x19\xff\
-\x87\xb0\x12\x48\xb6\xba\x2d\x6a\x22\x00\x40\xb6\xa6\xdb\x9b\xd5\
-\x6f\x8b\x00\x3c\x44\xb0\x84\x08\x20\xc6\xc8\x53\xa8\xef\x44\x01\
-\xa8\x5b\x40\x1f\x1b\xa1\xa7\xe9\xc1\x9c\x20\xe4\xc2\x1e\x2a\x0c\
-\x42\x25\xf7\xfd\xd7\x66\x1e\xea\x28\x81\x22\xe9\xb6\x99\x32\x89\
-\x41\x35\x89\x58\xf8\xfc\xa6\x80\xa9\x6c\xe0\xa9\xdc\x2a\xbf\x72\
-\xef\x5f\x78\xc6\x9f\x94\x97\xf0\xc5\xd6\x87\xa7\x31\xff\xba\xbb\
-\x20\xd8\xbc\x02\x37\xfb\x0f\x89\x92\x60\xe9\xc8\xe0\x32\x4c\x88\
-\xd8\xe0\xef\xca\x74\x87\x28\x14\xd0\xb0\x9a\x21\x0e\x99\x31\xd1\
-\x3d\x80\x50\x25\x72\x23\x22\x40\xd9\x46\x41\xba\x90\x63\x83\xd0\
-\x37\x91\x5f\x00\xe3\xf0\x92\x47\x11\xf6\xbe\xca\xf3\x79\xdf\x5b\
-\xad\xef\xe4\xfd\x59\x87\x0b\xb2\x4d\x7e\x90\xcd\xff\x1c\x3c\xce\
-\xeb\xfb\x79\x89\x55\xb3\xe5\x55\xf9\x7a\x59\xca\xd2\xef\xcf\x8c\
-\xca\x01\x84\x32\xcd\x32\x46\xfe\x51\x3e\xc0\x5a\x7b\xda\x2d\x08\
-\xc0\x3d\xde\x99\x29\x00\x4a\xb9\x95\x82\x52\x87\xe1\x14\xc0\x47\
-\x93\x80\x90\x4c\xfb\xc8\xab\xe7\x90\x4c\x77\x1d\x9c\x5b\xd9\xe1\
-\x37\x53\x73\x1b\xef\xba\x84\x29\x80\xf2\x36\xcf\xb2\xf2\x55\xf5\
-\xbc\x4c\x18\x1b\xad\x4f\x29\xab\xbf\x52\x46\x78\x00\x07\xfe\x33\
-\xab\x4f\x09\xa8\xf2\x14\xbc\x34\x54\xd2\xb6\xae\x51\x88\x13\xac\
-\x17\xa6\xf6\x0c\xc0\x66\xc1\xf3\x24\x14\x03\xa7\xd0\xe4\x9e\xb0\
-\x76\xea\x6d\x37\x99\x17\x4a\x17\xfa\x91\xe5\x37\x5f\x28\x96\x50\
-\xb1\x44\xf2\xc5\xe2\x76\x71\x60\x7a\xfa\x73\x75\xe6\x5d\xb1\xa6\
-\xfa\x73\xb5\x2c\x2f\x96\x1d\xe1\xd3\xe9\x2a\x66\xe4\xad\x02\x40\
-\xb9\xf7\x67\xdd\xbb\x26\xcf\xad\x62\x28\x95\x41\x29\xfc\xe5\x6d\
-\x6f\xa6\x37\x62\x14\x20\xb0\xf0\x28\x07\xe0\x0b\x7e\x6d\x71\x81\
-\x35\x07\x25\xa1\x42\x6f\x78\x88\xe1\x11\x33\x89\x72\x0c\xac\x4c\
-\x66\xb7\x30\x17\x9a\x80\x90\x10\x91\x09\x02\x0c\x42\x8f\x15\x02\
-\xa8\x53\x81\xd7\xdd\x76\xe9\x2f\x88\xff\xaf\xfb\xf7\xe9\x52\xa1\
-\x47\x72\xa1\x84\x2c\xb3\x9d\x64\x40\xee\x56\x03\x75\x8f\x41\x9a\
-\x66\x40\xc7\x50\xeb\xf3\xcb\x02\x46\x12\x13\xdd\xfc\xd4\x28\x00\
-\x02\xa6\xb9\x13\x49\x69\xc8\xd8\xfc\xe7\x31\xb7\xc0\x41\x11\x2e\
-\x22\x00\x48\xc8\x6e\x4a\x84\xb6\x30\x54\x6a\x72\x6d\x81\x0b\x21\
-\x57\x85\x90\x97\xf7\xcb\xdb\x4a\xe8\xb5\xe0\xef\x02\xdb\xa4\x6a\
-\x10\xbe\xa8\xe0\x1b\x41\xc8\x14\x0d\x15\xd2\x2c\x41\x2a\xf0\x10\
-\x9a\x27\x28\xfc\x92\xc1\x8c\xb3\x5a\x94\x9c\x08\x2a\x0c\xd4\xa1\
-\x09\xb5\xa1\x0d\x01\x0e\xce\xa1\xec\xf6\xd3\xdf\x78\xd7\xf5\xdf\
-\xbf\x4b\xb9\xcd\x3c\xf3\x9f\x7d\xeb\xf1\x25\x3b\x50\x7c\xf4\xc4\
-\x44\x59\x58\x54\xe5\xfc\xab\xc1\x2d\x40\x5e\x7f\x27\x24\x2e\x11\
-\x4f\x23\x05\xb7\x0d\x22\x2b\x40\x01\x64\xdd\x6b\x98\x00\x80\x4a\
-\xe0\x08\x31\x5d\x19\x80\x43\xfc\x25\xb8\x08\x3c\x27\x00\x12\x14\
-\x01\x06\x94\x56\x02\x51\x08\x21\x28\xd2\x2a\x95\xb8\x4d\x80\xa8\
-\xb0\xce\xfd\x52\xa8\xe7\x6a\x81\x9f\xaf\xf7\x85\xed\x8a\xfe\x1b\
-\xfd\xc0\x71\x22\x00\xc7\xcc\x29\xc2\xf0\x67\xd6\xc2\x81\x4e\xc8\
-\x61\x90\xbf\x12\x38\xde\x3e\x8c\x0b\x3e\x08\x53\x87\xda\x5d\x3e\
-\xe0\xcc\x98\x99\x15\x58\xbb\x01\x5a\x29\xd4\x21\x26\xec\x2d\xde\
-\xac\xdc\xde\x7e\x55\x03\xcf\xfe\x7c\xa1\x13\xfa\xab\x55\x36\xb9\
-\x4a\x4d\x4d\xdf\xaf\x78\x9b\x15\x4e\x71\x8f\xa1\x36\x68\x07\x19\
-\xc9\xfa\xb3\xea\x40\x67\x0a\xb1\xce\x71\x80\x04\x27\x5f\x42\xfe\
-\x4d\x42\x92\xd0\x58\x04\x9d\xa1\x9b\xcd\xae\x01\x26\xb0\x73\xad\
-\xf9\x81\x16\x03\x94\x01\xda\x0b\x45\x29\xd8\x79\xe1\x0f\x97\x3b\
-\x96\xb7\xa5\xff\x5d\x26\x83\x75\x5b\x82\x02\x10\xb5\xb4\x9b\x03\
-\x60\x7a\xfe\x39\xb1\x7e\x45\x18\xfe\xcc\xab\x0e\x34\x63\x5a\x44\
-\x0e\x40\x70\x01\xcc\x81\x18\x11\x16\x3d\xe8\xd3\x8e\xf4\xd2\x5c\
-\x1b\xd6\x44\x60\xb5\x38\x0b\x08\x5f\xac\x86\x4a\x5d\xf4\x71\xf1\
-\x6e\x65\x7b\xfc\x99\xb6\xdd\xba\x76\x1f\x7b\xeb\x55\x2f\x5f\xaf\
-\x26\x26\x57\x28\x35\xb5\x97\xca\xa6\xf6\x2c\xde\x73\x52\xd1\x32\
-\x33\xdf\xfa\x2b\x7f\xd2\x19\x4f\x00\x22\x7e\x80\x0c\x06\x84\xf1\
-\xe3\xe0\xba\x10\xcd\x49\x3e\x89\xca\x00\x22\x8a\x00\x22\x8a\xa0\
-\x41\xf1\x88\x55\xcd\x10\x76\x09\xdc\x91\xdf\xf2\xe7\x37\x52\x19\
-\xa5\x5f\x9e\xcf\x0c\xac\x7a\x2d\xf4\xa3\x54\xc5\xed\x28\xdb\xb8\
-\x01\xc1\x24\x80\xf2\x12\x3a\x9c\xc5\xec\x84\xff\x54\xed\xdf\x13\
-\x6b\xaf\x0b\x82\x88\xe5\xd7\x68\x81\x2a\x0b\xb7\x22\x10\x64\xc2\
-\x4f\x50\x42\x88\xa2\xcb\xef\xae\xaf\x6c\x60\x26\x41\x77\xfe\xd1\
-\xd1\x80\xaa\x09\x68\x1d\x0e\xcc\x7b\x9b\x95\x3b\x70\x22\xff\xf1\
-\xff\x3c\xc8\xcf\xa2\x2f\x16\x54\x8e\x73\x6a\x71\x71\xb5\x9a\x98\
-\xda\x5d\x4d\x56\x8a\x60\x0f\xe2\xe6\x50\xe2\x8f\x5a\x7f\xf4\x2d\
-\x38\x53\x16\x00\xf1\x16\x61\x48\xc6\x9b\x39\x17\xa0\x69\x41\xe0\
-\x90\x2b\x07\x13\xf5\x89\x98\x47\x80\x9e\x4b\x20\xbe\x25\xc6\xd0\
-\x06\x26\x2f\xea\x12\xca\xe7\xbd\x2d\xc5\xbe\xa9\x50\xd6\x5b\x76\
-\x19\x1f\x7d\xab\x21\x00\x08\xb8\x00\x40\x13\x7d\xa8\x70\x83\x5b\
-\x01\x08\x8e\x0b\xa0\xd8\xb8\x30\x20\x10\x59\xb1\x11\xe1\x21\x33\
-\x17\x6e\x97\x04\xc6\x9a\x6a\xc8\xef\xff\x2d\x9a\xa2\xa4\xbe\xe6\
-\x03\x66\x88\x8f\xa0\xfb\xf6\x2b\x13\xc0\xc8\xdc\xa1\x47\x55\xbb\
-\xf0\x7c\xb3\xea\x2d\x6c\x56\xd9\x62\xe1\xec\x4c\xae\x54\x93\xd3\
-\xab\xaa\xdb\xe0\xd8\x32\x48\x30\xcc\x29\x6e\x39\xa6\x77\xa1\xa5\
-\x41\x9c\x46\xce\x40\xb0\xc8\xa9\xae\x41\xaa\xdf\x00\x29\x91\x82\
-\x94\xc2\xa2\x42\x69\x57\x02\x5f\x5a\xf7\x52\xe8\x59\x38\x6d\x57\
-\xdb\x10\x97\x58\x01\xc8\x0b\x9a\xf8\xea\x0e\x11\x68\xc9\x38\x27\
-\xd3\x8f\xb8\x00\x83\xd7\x32\x3b\x43\x10\xa8\x0b\x60\xff\xde\x73\
-\x02\x5a\xb7\xb3\xca\x6a\x81\xa7\xd1\x81\xda\x0d\xa8\xef\x57\x43\
-\xc0\xf3\x2a\x4e\xe3\x29\x00\x51\x88\xbd\xd3\xa9\x95\xc1\xfc\x66\
-\xd5\x5f\xc8\x0a\x37\xa1\x44\x06\xb5\x32\xe0\x56\x5e\xc9\x9c\x81\
-\x08\x61\x02\x6b\x9f\xa3\x04\x4c\x14\xd0\x46\x32\x3c\x90\x1b\x10\
-\x8d\x1c\x80\x92\x8b\x87\xb0\x05\x94\x80\xf8\x7b\x6b\x24\x50\xfe\
-\x44\x79\x6f\x43\x21\xf4\xa5\xa5\xaf\xf5\xf5\xae\x30\x52\x05\xdb\
-\x09\xfd\x38\x95\x41\xb4\x18\x48\xb1\xde\x7f\x3a\x23\xd0\x21\xf9\
-\x78\x38\x70\x40\x08\x78\xed\xc4\x68\xbd\x2c\x28\xb9\x4e\x80\x9a\
-\x49\x7f\x78\x08\xb2\x89\xbe\xaa\x16\x7a\x55\x67\x02\xeb\x1a\x80\
-\xdc\x66\x1f\x9a\x11\x64\x99\xb6\xee\x14\x32\xa0\xcd\xe2\x03\x2f\
-\xd7\x3f\xf3\xb2\x01\xc1\x14\x03\xa9\xbc\x54\x04\x9b\x55\xbe\x38\
-\x51\x28\x83\x3d\x0a\x45\xb0\x87\x52\x13\xbb\x47\xb4\xf7\x88\x23\
-\xc2\x63\xe1\x70\x90\x57\x46\x62\xf5\xae\x4b\x56\x86\xce\x55\x92\
-\x5b\x50\x8d\x91\x02\xf1\x15\x0f\xd8\xf5\x55\xbf\xb7\xb1\xb8\x96\
-\x1b\x2a\xf7\x2b\x99\x50\xec\xac\xf8\x98\x14\x40\x04\xb7\x02\x63\
-\xf5\x81\xe5\xc8\xda\xec\x3f\xca\x13\x70\x25\x91\x91\x29\x42\xae\
-\x52\x81\x40\x08\x50\xce\x83\x16\xaa\xc2\xb4\xd0\x67\xf9\x60\x45\
-\x62\x6e\x2c\xbe\xf7\x79\x2a\x73\xfd\x08\x95\x3e\xa3\x04\x82\xa7\
-\xd9\x2f\x2c\xd5\xfa\xc2\x62\x6d\xa8\x72\x06\xb2\x6c\x85\xca\x26\
-\x0a\x85\x30\xb1\x5b\x71\xe0\x54\x33\x9b\x9d\x22\x70\x6d\x15\x05\
-\xca\x11\x05\x6c\xaa\xf7\x27\x53\x73\xa3\x49\x45\xd1\x68\x01\x26\
-\x5a\xfd\xbc\xa2\x64\xf2\x52\xf0\x7b\x5b\xe8\x2f\xa2\xc4\x0e\x7d\
-\x3b\x91\x12\x48\x5d\x07\xb8\x95\x94\x49\x30\x11\xc8\xd0\x75\x3a\
-\x9e\x4f\x70\x29\x90\x7e\x80\x7e\x54\x80\x42\xfe\x4c\x68\x17\xa6\
-\x0c\x37\xe0\x28\x9a\x14\x2a\xdb\x91\xdf\xdc\x5c\x38\x5b\xef\xed\
-\xf6\x11\xc0\x6a\xea\x6f\xfd\xd9\x59\xd8\x0b\x07\x1a\xac\xa0\x91\
-\x4a\x36\xf5\x8c\x8f\x3e\xa4\xaf\x95\xe7\x93\xe7\x5b\x8a\xb5\xbd\
-\xa5\x40\x07\xc5\xc7\x4d\x2c\x53\x50\xa0\x82\xd2\x5d\x28\x43\x8b\
-\x29\xca\x45\x54\x08\x89\x71\x72\x71\x41\xb4\x59\x25\x20\x10\x7a\
-\x80\xcd\x0a\x43\x44\x19\x12\x41\x88\xaa\x5f\x42\xfb\xc5\x8d\x15\
-\xc4\x57\x18\x2a\x56\x00\x99\x1c\xdc\x15\x94\x80\x72\x7b\x7d\x78\
-\xab\x5e\x08\x18\x29\x1c\x6d\x76\xf1\x64\x93\xb5\x03\x42\xd6\xd9\
-\x12\xe0\x52\x9e\x32\x37\xd6\x9f\x31\xb2\xd0\xc9\x1f\x70\xe9\x6f\
-\x70\x7c\x75\x4e\x3a\x36\xad\x76\xed\x40\x67\x96\xe5\xb7\xc9\xf6\
-\xa6\x30\x08\x06\x1d\x3c\xf4\xb8\x2f\x39\xe5\xd6\x13\x62\xa5\xc6\
-\x31\x86\xaf\x0a\x3c\xe0\xbc\xc2\x5e\xb1\xf7\xef\x1d\x5c\x87\x0a\
-\x1d\xac\x28\x6e\x97\x17\xe7\xb6\x22\x09\xed\x63\x0b\x01\x16\xeb\
-\x62\x22\x91\x04\x4c\xb9\xcc\xaa\x45\x8a\xb1\x28\xa4\x58\x29\xc5\
-\x92\xc4\xab\x7c\x7a\xcc\xfd\x70\x21\x86\xe0\x0a\xa6\x73\x09\xbb\
-\x92\x4b\x30\xe6\xef\x3f\x09\xc4\xe4\x8b\x59\xb8\xbc\x0a\xb0\xf6\
-\xf1\x4d\x53\x50\xc3\xe8\x67\x0e\xf1\xe7\x34\x06\x05\x56\x16\x2c\
-\x4d\x06\x16\xb1\x32\x28\x69\x4c\x92\x6d\xfa\x91\xb3\x34\x62\x9a\
-\x67\x36\x08\xff\xe9\x5a\x00\x80\xac\x71\xed\xea\x3d\x03\xf7\xbe\
-\x0a\xe8\x09\x49\x6f\x40\xe0\x57\x2b\x63\xd6\xfd\x7c\xc6\xd2\x9e\
-\x85\x22\xa8\x14\x02\x14\x48\x21\x5b\x56\x3c\x37\xd1\x1e\x1d\x28\
-\x15\xad\xbe\xf5\x85\x8d\x71\x04\x10\xe1\x08\x78\x32\x53\x2c\x2a\
-\xe1\x18\x7c\x1c\x24\xe2\x94\x42\x5f\x59\xfa\xbc\xf9\xdc\x50\x26\
-\x19\x76\x56\x24\x80\x43\x28\x09\xfa\xdb\x8f\xf3\xeb\x1b\x12\x10\
-\x24\x4d\x0c\xd9\x02\xef\x0a\xc4\xdd\x01\xc5\x2b\x06\x6b\xa5\x61\
-\x92\x83\x14\xe5\x05\x38\xe4\x17\xb8\x81\x86\xaf\xe8\xd6\x07\x66\
-\x8a\x4e\x4a\x45\x92\x0d\x68\x14\x55\xce\x45\x55\x80\xfe\xd4\xef\
-\x31\x4a\x4f\xd9\xf6\xdf\x40\x4a\x99\x49\x4f\x00\x02\x93\xd8\xf7\
-\x63\xcd\x2b\x3d\x48\x57\x2a\x84\xd9\x42\x21\xcc\x92\xe3\x26\x2b\
-\x45\x60\x76\xb5\x8c\xd5\x4c\x70\x2b\xdf\x3c\x14\x00\x42\xd6\x06\
-\x13\x3d\x8c\x10\x3f\x80\x8c\x07\xc9\xe7\xaa\x54\xdb\x0a\xf1\xe4\
-\x73\x16\x37\xb0\xd6\x61\x4d\xd1\x80\x04\xa6\x71\x87\x55\x02\xe3\
-\xb6\xf6\x4b\xc7\x01\x38\xb3\x17\x60\xb3\x72\xda\xff\x83\x63\xf1\
-\x41\x31\xab\x0e\x8c\xf9\x57\x8c\x28\xa4\xae\x84\x60\xfd\x81\xd9\
-\x5a\xbf\x4d\x18\x1f\x8b\x9c\x9b\x8b\x81\x4e\xb1\x8e\x2e\x0b\x06\
-\xa3\x14\x20\x83\xf0\x0a\x07\x88\x58\xdf\x61\x86\x98\x42\xc3\x43\
-\x1f\x56\x97\x89\x2d\xd8\xef\x29\xd5\xdf\x42\x0e\x9c\x18\x28\x06\
-\x98\xae\x48\x45\x28\x89\xc5\xac\xbe\x8d\x41\x68\x49\x19\xd0\x90\
-\xa2\xa0\x19\x1a\x6b\x0f\xea\x73\x1c\x14\xcc\xcc\x57\x55\x71\x65\
-\x35\x5c\x28\x21\xc7\x95\x5f\x3f\xd3\xcc\xa3\x17\x20\x86\x42\x04\
-\x6a\x70\x67\x71\x07\x50\x46\x76\xee\x14\x61\xf9\x67\xd1\x9c\x41\
-\xbf\x8f\x8b\x23\x29\x00\x50\xce\x70\x1d\xfa\x11\x77\xbb\xf9\xfd\
-\x75\x91\x9d\x86\x0c\x59\xc6\x72\xfd\xed\x2f\x0c\x8e\x79\xcd\x1c\
-\xa1\xb7\x6d\xc4\x28\xe3\x08\xb2\x58\xb9\xf3\x9c\x07\x5f\x7b\x30\
-\xcf\xaf\x4e\xfb\xc5\x5a\xa0\xf2\xda\xe7\xef\xd7\xb3\x00\xa0\x9e\
-\x1d\xa2\x13\x82\xa0\x99\x03\x88\x91\x7c\x29\xaf\x4b\x82\x18\xac\
-\xa3\x65\x3a\x90\x29\x05\xac\xad\x6b\xd9\xd8\x14\xd5\xbc\xcf\xc2\
-\x57\x4a\x00\x2a\x17\x62\xa0\xe8\x26\xed\xf3\x8a\x23\x87\xe9\xc8\
-\xfa\x5b\xac\xaf\x27\x79\xae\x2c\x96\xa9\x72\x27\x7a\x83\x32\xd7\
-\xea\x3c\x16\x45\xb8\x1f\xb3\xce\xbe\x12\x70\xd9\x43\x31\xfd\x80\
-\x0b\xb6\xae\xf0\x54\x6a\x87\x8d\x0e\x20\x26\x10\x7a\xca\x2d\x03\
-\x0e\x1d\x2f\x91\x84\xf3\x0b\xd5\x24\xab\x31\x46\x01\x8c\xcf\xd7\
-\xbf\xc1\xb4\xdc\x2c\x63\xe3\x4e\xf9\x6f\xa6\x1c\xe2\x80\x28\x0a\
-\x97\xfd\xcf\x7c\xcb\x0f\xb6\x9c\xa7\x0c\x9f\xc9\x17\x0d\x3d\x08\
-\x6c\xea\xfc\x81\x0a\xbe\x56\xa3\x5a\xe1\xe8\x2e\xa9\x59\x35\x36\
-\xac\x24\x01\xc3\x1c\x43\xdc\x90\xc7\xf4\x40\xa6\x5a\x76\x93\x85\
-\x80\x1f\x83\xb2\x52\xa0\x0a\x41\xd2\x1d\x03\xc1\x2d\x6f\x17\x84\
-\x85\x94\xc6\x15\x78\x87\x49\xa1\x28\x8c\x09\x38\x84\x23\x05\x28\
-\x70\x0d\x11\x9e\x01\xb9\x42\x46\x99\x13\xd8\x91\x94\x00\xb6\xec\
-\xda\xd4\xe8\xff\xa3\x1f\x01\x28\xb7\x85\x1e\x0e\xdd\x11\x24\x13\
-\x63\xe1\x35\xfb\xbf\xe6\xa6\x9f\x5e\x5b\x76\xd1\xd6\x4c\xbf\x69\
-\xc4\x4d\xca\x7b\xc1\x1b\x19\x66\xff\x9e\x96\xff\x52\x12\x10\xc0\
-\xd6\x13\xb8\x8b\xd5\x75\x1d\xaa\x63\x33\x72\xab\xef\x93\xa2\x22\
-\x50\x7c\x46\x61\x46\x9e\xcb\xec\x6d\x60\xf8\x18\x28\xb9\xf5\x17\
-\x44\x2c\x3f\xb0\xfb\xd2\xdf\x02\xc8\xe0\x40\x44\x08\xe2\x81\x94\
-\x40\x75\xe7\x0e\x88\x1a\xca\x31\x9a\x20\x4f\xdc\x85\x00\x07\x02\
-\x32\xeb\x48\x5b\x3a\x84\xde\x0b\x14\xc8\xd3\x8d\xa5\x8c\x4a\x08\
-\xbb\x47\xd0\xa4\x98\x79\x27\xea\x54\x6f\x6c\x2b\x0b\x3c\xdd\x43\
-\xf2\xee\xc2\x7b\xb9\x09\x88\x42\x19\xfe\xa3\x80\x28\xd6\x6f\xcc\
-\xd7\x31\x1f\x39\x5d\x01\x48\x52\xa1\x85\xe5\xba\x0b\x4f\xec\x17\
-\xa7\x77\x29\x6d\x10\x62\x11\x3b\x0f\xeb\xb9\xc8\xc0\x11\x40\x21\
-\x12\xa0\x3b\x09\x81\x4e\xc2\xa7\x03\x48\x3c\x81\x77\xbb\x0d\xf9\
-\xaf\x65\x86\x9c\xa4\x1d\x7a\x9c\x79\x86\x19\xc4\x4d\xfc\x38\x36\
-\x08\x87\x16\x1c\x05\x11\xfb\xe8\x44\x65\x10\x74\x65\x86\x50\x04\
-\x2e\x45\xa3\x15\x33\x59\xc8\x6c\x1e\x85\xd7\xb1\x06\x55\x3d\x8a\
-\xad\xe9\x18\xfd\x18\xea\xdd\x5f\xf4\xa1\xbf\x45\xe7\x6f\x13\x8e\
-\xdd\x06\x7b\xcc\xd0\x7b\xc2\x8f\xf1\x30\xaf\xd3\x1e\x10\x65\x57\
-\x42\x3f\xbe\xe1\xd6\xde\x6d\xc3\xe2\xa0\x8c\xb7\xe6\x06\x3e\x7f\
-\x05\xf3\xf3\x28\xdb\x0d\x4e\x26\x9f\xf2\xfc\x7f\x1d\x1a\x44\x1a\
-\x26\x34\xd3\x79\x5d\x2b\xe0\x58\x78\x93\x60\x94\xd9\x8c\x1c\xa4\
-\x13\x8a\x33\xd2\xf0\xc3\xed\x2b\xe0\x8e\x31\x27\x59\x3d\xac\x1f\
-\x41\x1a\xce\x0f\x75\x04\xe5\x7b\xf3\x71\x5e\xe4\x51\xf0\x27\xa8\
-\x52\x88\x2a\x03\x36\x46\xcd\x43\x05\x10\xb3\xf4\x2e\x4a\x0a\x09\
-\x8c\x03\x2f\x99\xa6\x01\x15\x89\xd4\x5a\x27\x2f\xd0\xa0\x5f\x42\
-\x02\xd2\x0b\xe9\x48\x60\x47\x08\xf5\x79\xdd\xfb\x85\x26\xbe\x31\
-\xeb\x2f\xc1\x7f\xfe\x5b\xf5\x73\x35\x7f\xfa\xf9\xb3\xb7\x2a\x9b\
-\x1d\xd7\x0a\x05\x64\x8a\xb5\xb1\xa6\x8b\xe8\xdb\x9f\xd9\x0f\x17\
-\xe6\x37\x7d\x93\xd6\xed\xa1\x4d\x0b\xaa\x85\x9c\x76\x02\xaa\x7b\
-\xf1\x83\xe5\x0d\xcc\x6b\x99\xdb\x43\xc0\xa0\x86\xba\xab\xaf\x85\
-\xeb\x56\x71\x94\xca\x01\x81\xa1\x8d\x2c\x23\xb9\xf9\x6e\x3d\xc2\
-\x00\x7d\x64\xc4\x52\x0a\x6d\xc9\x3d\xb3\xc7\x32\x15\x45\x4e\xcf\
-\xff\x27\xcb\x68\xc0\x5f\x88\xf9\x04\x4c\x97\x35\xba\x0e\x20\xa0\
-\x02\x15\x6f\xa7\xe8\x0a\x39\x6b\xd1\x1e\x70\x0d\xe4\x07\x69\x2e\
-\xc1\xd6\x52\x02\xdb\xd2\x15\xc0\x86\x5d\x72\x0d\x5c\x41\xc6\x60\
-\x43\x5f\x4f\x41\x2b\xa1\x01\x70\xfd\xf7\x5b\x66\xf0\xaa\x35\xf7\
-\xf6\x17\x23\x1f\xdf\xde\x05\xa0\xdb\xcf\x4e\x7d\xed\x55\x98\xf7\
-\x7f\x09\x7a\xd4\xb5\x81\xfd\xd4\x25\xa8\x59\x77\x2d\xf8\x48\x9b\
-\x09\x51\xd8\x6f\xc5\xc9\x20\x8a\x2c\xf3\x05\x2d\xcb\x9c\x16\x5b\
-\x40\x38\x01\x55\x13\x87\x6e\x7b\x72\x17\x89\x00\x0b\x3f\x06\xa7\
-\xd1\x2a\x9b\xf4\x93\x09\xd6\x16\x42\x29\xc0\x7c\x56\xaa\x12\xa0\
-\xbe\x48\x22\x4a\x8a\x21\xd1\x75\x88\xc1\x78\x70\x95\xb0\xb3\x88\
-\x42\xc0\x27\x32\x45\x93\xa3\x01\xac\x7f\xdf\x24\x97\x80\x68\x33\
-\x4f\x30\x80\xc1\x61\xf3\x18\xbc\x63\x1a\x85\x0c\xac\x31\x0a\x7d\
-\xc6\x52\xee\x6d\xf8\x00\x7a\x92\xba\x7d\x3d\x06\x04\xde\xb5\xf4\
-\xbe\xf5\xe7\xa8\x61\xed\xbd\xfd\x0b\x95\x5b\xe5\x9a\xb7\x51\x02\
-\x93\x09\xda\x13\xfb\xf9\xc2\x17\x32\x58\xf6\xdf\x40\x5c\x85\xf2\
-\xc3\x33\x8e\xc4\x89\x2b\x30\x08\xf5\xd1\x88\x02\x28\x7f\x6a\xb8\
-\x8b\x61\x91\x5b\x86\xba\xb7\x9f\x8e\x17\xe9\x19\x00\x83\x8b\x60\
-\x2b\x01\x15\x5a\xe5\xa2\x3f\x07\xeb\x56\xe1\x36\x71\x25\x4b\x84\
-\xd8\x23\xfa\xfd\x82\x4f\xee\xc8\xaa\x40\x63\xbb\xdf\x5b\x88\x8d\
-\xd1\xf7\xc1\x78\x43\x4e\x24\x38\x2d\x9a\x76\x4b\x5e\x40\xc4\x20\
-\x33\xed\xf4\x25\x20\x0f\x28\xbb\x8f\x81\xd6\x0d\xc1\xbc\x02\x94\
-\x22\x0d\xa0\xa4\x12\xc2\x78\x25\xa1\xbe\x7e\x23\x56\x5b\x2e\x35\
-\x54\x60\x70\x3e\x34\xef\x53\xa1\xef\xfb\xa3\x92\xb8\x14\xfb\x8d\
-\x7f\x70\xf1\xfc\xf7\x95\xdb\xe8\xa6\xbd\x0b\x00\xf1\xd5\x9f\xdf\
-\x78\xd9\x57\x3f\x5f\x9c\xfc\x5d\x46\x7a\x4d\xbb\x2a\x70\xd6\xad\
-\x89\xbf\x9b\x10\x19\x10\xa6\x58\xb1\x5e\x01\x7e\x07\xa0\x41\x82\
-\x1d\x0c\x76\xe5\x16\x1d\xa1\xe7\xaf\xd7\xc7\x51\xff\xb6\x2e\xfa\
-\x41\xa2\xa8\xb4\xdb\xd0\x5a\xc0\xa1\xc5\x3e\xe2\xfb\xb2\x19\xca\
-\x3e\x42\xe0\x24\x2d\xc8\x5d\x92\x90\x4a\x26\xc8\x3c\x01\x0a\x4c\
-\xb2\x1b\x45\x61\xc7\xf1\xbf\x63\x96\x3d\xa6\x14\x81\x8e\x91\x0f\
-\xba\x0c\x2d\xdc\x81\xc0\xfb\x8c\x9b\xcb\x1d\xab\x3f\xa0\x5c\xab\
-\x9f\x22\xfc\x48\x5a\x84\x87\xac\x7f\xb9\xcd\xcc\xe2\xd5\x5f\xf8\
-\xdf\xcd\xbf\x51\xb6\xd5\xbd\x6e\x75\xd7\xd2\x05\x68\xb8\x7a\xb7\
-\xff\xfa\xac\xd9\xde\xfc\xa6\x0f\x9b\x59\xbc\x04\x1b\xa3\xf6\x29\
-\xb3\x8c\xfd\xa0\x76\x20\x28\x82\x12\xa6\x0c\x93\x25\xc2\x52\x89\
-\x6d\x9d\x91\x9b\x3d\x08\xa6\x27\x81\x69\x3a\x4c\xe0\x2c\x0b\x0b\
-\xd2\xc9\xc4\x4a\x85\x6b\x01\x20\x0e\xbb\x21\x45\x96\x63\x61\xc3\
-\x14\xdf\x54\xf8\x6c\x45\x15\x42\x40\x19\x18\x9d\x8a\x21\x01\x23\
-\x6f\x8a\x2a\x9c\x35\xa8\x6c\x7d\x34\xf2\x98\x3c\x0b\x19\x4a\x5a\
-\x02\x42\xcc\x97\x7e\x1d\x41\x16\x14\x6d\x38\x9c\xe3\x41\x7e\x5d\
-\x78\x5f\x17\xf7\x43\x80\x79\xdb\xba\xfe\x80\x11\x76\xba\xab\x78\
-\x14\x45\x14\x7e\xf1\x79\x2b\xfd\xe5\xcd\x6f\x6e\xeb\x7d\x4b\xd9\
-\x3e\x97\x3d\x82\x00\x46\xe0\x00\xd8\xf6\xed\x13\xf6\xaf\xfc\x8b\
-\xcb\xcf\x3d\xf6\x84\x3e\xf6\xae\x52\x54\xab\x93\x66\x9c\xb6\x1f\
-\x9f\x85\xf6\x95\x72\xc8\xc0\xa6\x72\x02\xf1\x85\xc1\x4f\xb7\xb5\
-\x16\xc6\x45\x0a\xb6\x2a\x31\x73\x2c\x1c\xd2\x2c\x42\x60\x03\x46\
-\x82\x43\x4a\xd9\xa2\x76\xc6\x7a\xbb\xb3\x10\x95\xa3\x98\xfc\x5d\
-\x09\x29\xd0\x0e\x89\xc9\x1a\x8d\x24\x23\x07\x77\x94\x82\xa0\x0c\
-\x88\x0c\xa2\xaf\x38\xb8\x22\xb0\xac\x3e\x1f\xa3\xee\xfa\xdc\x94\
-\x1b\x40\x36\x9e\x5e\x0c\x75\xb1\x28\x81\x82\xe1\x23\x04\xa3\x22\
-\x01\x24\x27\x89\xdb\x70\x17\x75\x4e\x80\x2b\x89\x09\x3f\x36\x90\
-\x81\x8b\x3d\xb5\xe6\x5f\x8e\xdb\xf0\x4d\x22\xfc\x8b\xc3\x23\x80\
-\xa0\x74\x98\x2b\x9d\xaf\x5f\x7d\xcd\xfc\xcc\x7d\xb7\xbf\xb9\x78\
-\xaa\x6f\x7f\x4b\x3b\x95\x17\x29\x3b\x6e\x16\x7d\x1d\xb3\xa5\xd3\
-\x70\xcd\x6f\x96\xf9\x50\x15\x78\xa2\x87\x8d\x1d\x6a\x22\x4a\x49\
-\xc4\x1a\x0d\x39\x66\x19\xd5\x11\x24\x79\x29\x16\xfc\x56\xe3\x1d\
-\x29\xe3\xd5\x54\x0b\x8a\x44\x05\xfa\x0b\x84\x94\x81\xe0\x26\x60\
-\xe4\x58\x87\x7d\x06\xff\x00\x31\xbb\x50\x8a\x14\x38\x1c\x02\x61\
-\x01\x15\xb1\x6e\x7a\xf1\x63\x3d\xb7\xde\xb1\x7e\xf6\x39\x65\xc6\
-\x5e\x09\xc7\x78\xc2\xab\xe2\xc2\xc6\xde\x27\x35\x3c\xb8\x35\x00\
-\x41\x30\x57\x40\x09\x79\x11\x01\xe1\x57\x82\xf0\x2b\x12\x39\xb8\
-\xe6\xc6\xc5\x13\xd7\xde\xdb\x5f\x50\xb6\xcd\xbd\x56\x00\x43\xe4\
-\x01\x40\x44\xb3\x17\x77\x4f\xff\x6c\x85\x02\xfa\x17\x7e\xe3\x4d\
-\x3f\x29\xb4\xc0\x7f\x78\x50\x13\x69\x5a\xac\xe9\xa2\x57\xcf\xee\
-\xe3\xb1\x7a\x82\x5b\x89\xb5\x71\x21\x35\xb0\x1c\x7e\xdb\x8e\x0b\
-\x18\xd4\xe7\x64\x9a\xf9\x7b\xe5\x0a\x5d\xe3\xe2\x80\x21\xfd\xff\
-\xb6\x70\x9f\x29\x06\x9e\x5a\x10\x7c\x1f\x90\x7c\x5e\xd9\x3d\x80\
-\x48\x23\x4e\x74\xa2\x38\x6c\x81\x49\x81\x01\xba\x5a\xc3\xa3\x79\
-\x5d\xdd\xd0\x10\x21\x10\x99\x7a\x20\x7c\x03\x8f\x0e\x40\x22\xaa\
-\x97\x22\x03\xe0\x7b\x15\x12\x53\x3f\xae\x3d\xcf\x13\x05\x3f\x8f\
-\x0b\x7f\xce\x73\x34\xd0\x8e\x05\x2b\x7c\xff\xeb\xde\xfe\xe1\xfb\
-\xbe\xa1\xec\x94\xab\x85\xfa\xb6\x55\x04\xa0\x52\x00\xd0\x20\xfc\
-\x94\x0c\x2c\x3f\xe4\x87\x5f\xfc\xdb\x0f\xf5\x17\x67\xcf\x75\xae\
-\x22\x83\x71\x68\x40\xbc\x9b\x3c\x84\x84\xdd\x1f\x30\xe2\xe8\x08\
-\x28\xd6\xd5\x7b\xc8\x8d\xa7\xfe\x59\x99\x80\x98\xc5\xec\x7d\x8e\
-\xcb\x1d\x20\x44\x92\x58\x02\x71\xf9\x04\xc3\x2c\x87\xe6\x55\x4b\
-\xe5\x20\xba\x11\xcc\xa0\x49\x90\xd7\x3b\x3f\x70\x26\x21\x4b\xba\
-\x01\xd9\xc9\x3a\xe1\x5a\x2e\x5e\xfa\x37\xaa\xcf\x49\xcc\xec\xa3\
-\x61\xc3\x94\x7c\x81\x26\x77\x40\x54\xc8\x20\x12\x87\x21\x17\x65\
-\xb0\x43\x52\xa6\xe0\xb8\x95\x40\x8e\xbe\x52\xca\x31\x2c\xf8\x39\
-\xa6\x09\x3f\x7d\xbd\x50\x30\xf9\xd9\x3f\x9e\x3b\x76\xcb\x0c\x6a\
-\xe8\x5f\x0a\xff\x7c\x7d\x3f\x1f\x02\x01\xf8\xc3\x39\x41\xe8\xd9\
-\x79\xfa\xe7\xf6\xd7\x64\xc3\xfc\xe5\xe7\x7d\xf8\x95\xfd\xde\xc2\
-\xa5\x52\x2c\xd9\x40\x7f\x05\x64\xa4\x37\x3a\xdd\x7e\xec\x82\xb4\
-\xb5\x00\x86\xb6\x33\xdd\x7b\x08\xcc\x25\x31\x7f\xda\xcc\x8f\x37\
-\x33\x41\x1d\x99\xa0\x63\xc9\xea\xd0\x1b\x84\x32\x81\x03\x79\xfc\
-\xc1\x5c\x9e\x86\xbc\x00\x10\xb2\xfb\x20\xa6\x1c\x62\xe8\xc0\x69\
-\xa5\xde\xcc\x82\x7b\x3c\x81\x28\xf8\xca\xc0\x72\xe7\x77\x13\x9c\
-\x7c\xba\x08\x25\x97\xc0\x8b\x12\xd4\x19\xa0\x72\xac\x9f\xfb\xbe\
-\x10\x48\xf5\x25\x3a\x48\xa5\xa7\xdd\xfa\x82\x2e\x28\x81\x04\x81\
-\x1d\x76\xcf\xa5\xcf\x20\x79\x79\x8e\xc5\x27\x56\xbf\x1c\xf8\x99\
-\x93\xe3\xf3\x90\xe2\xd2\xc4\xdf\xad\xbd\xe3\x3f\x72\xd2\xc6\x5f\
-\xd5\xb2\xa8\x85\x7f\x61\x18\x02\xd0\xe5\x00\x9c\x94\xde\x20\xe1\
-\x52\xa1\x80\x35\x37\x5d\xb8\xfe\xea\x1f\x1d\xff\xd7\xbd\x85\x99\
-\x9f\xd8\xd5\x6d\x7d\x40\xdd\xea\x39\x34\x5a\x12\x49\x50\x1b\x8c\
-\x6f\x83\x56\x82\x32\x20\xaf\x13\x97\xc2\x90\x81\x24\x0c\x69\x84\
-\x1f\x5c\x41\x07\x9b\x89\x18\x0c\x0b\xc3\x12\x65\x91\x81\x40\xe6\
-\x09\xb5\x00\x49\x0a\x81\x92\x8a\x0e\xf2\x09\x20\x19\x64\x8a\x80\
-\x5b\x65\x0c\x74\x03\xd1\xca\x26\xe0\x12\xf0\x28\x01\x26\x66\x0f\
-\x46\x87\x4f\x87\x42\x84\x2a\x52\x3b\xa0\x84\xba\x81\x40\x52\x4d\
-\x10\x8a\x87\x04\xb6\xcd\x9e\xbb\x3b\xd7\x08\x98\xfb\x8a\x26\x37\
-\x6e\x02\xda\x49\xbf\x4a\x66\xfb\xcd\xe3\xdc\xfa\xfd\xf7\x6e\xc8\
-\x2f\x78\xe5\xbb\xef\xf9\x02\x81\xfe\xa5\xf0\xcf\x11\xf8\xaf\x86\
-\x53\x00\xa1\xbe\x18\xe0\xb2\xc3\x67\x9c\xf8\x40\x83\x02\x6e\xbf\
-\xfa\x9c\xbb\x2f\xf8\xd2\xab\x8e\x9a\xdf\x72\xcf\x97\x40\xd9\xe4\
-\x1f\x70\xe2\xf4\xca\xfd\x35\xd9\xfa\x00\xeb\x88\xd4\x8b\x4b\x5b\
-\x26\x8b\x1a\xdc\x98\xb2\xee\xb6\xa3\x07\x78\x6a\x9f\x52\x67\x10\
-\x92\x70\x20\xe5\x85\xfc\x1a\x07\x19\xb3\x43\xc4\xe4\x07\xf3\xff\
-\x41\x4c\x29\x96\x73\x6c\xfd\x8f\xf3\x20\xb8\xe8\x96\x40\x50\x19\
-\x70\x2b\xc8\x11\x33\x02\x75\x0d\xd0\xe5\x10\xd0\xc9\xb9\x1a\x58\
-\x4d\x9a\x4d\xa8\xe4\x28\x41\x08\x56\xbb\x96\x38\x92\x39\x98\x80\
-\x04\x42\x7a\x39\x5a\x3c\x84\xfc\xbc\x85\x4c\x41\x94\x05\x36\xb4\
-\x73\x41\x37\x7b\x04\x55\x50\x64\x41\x85\x5e\x5b\x7c\x6f\xf4\xb7\
-\xa8\xb4\xd0\x11\xfe\x2d\xb3\x78\xf9\x1b\xfe\xed\xbe\x77\x92\x98\
-\x7f\x29\xfc\xb3\xf5\xed\x50\xd6\xdf\x41\x00\x4d\xc2\xaf\xb7\x5a\
-\x09\x94\x27\x30\x57\x08\xff\xa6\xf3\x4f\xfc\xab\xa3\x37\xac\xbd\
-\xe1\xbd\xc5\xa9\x2e\x3a\x56\x9f\x08\x3d\x9a\x8c\x3c\x64\x7d\xfb\
-\x34\x84\x45\xb2\x83\x35\x2f\x84\x7c\x32\xaa\x81\x60\x4b\xe3\xeb\
-\x72\xa2\x5b\xb9\x16\x0d\x20\xd0\xf0\x44\xaa\xc4\x81\x30\xe2\x8e\
-\x85\xf0\xc3\xcd\x03\x98\x62\x51\x32\xdb\x26\xb9\x0e\x22\x07\xc0\
-\xaa\x30\x63\xb9\xf9\x08\xbc\xcb\x12\xfb\x8e\xbc\x4b\x10\x58\xd7\
-\x8c\x03\x04\xba\x40\xc5\xc4\xa1\xb6\x4a\x00\xd3\xdc\x01\xf7\x3d\
-\xc1\x0d\x61\x06\xc8\x3e\x07\xf2\xb1\x03\x53\xfc\xf8\x5c\x10\xe4\
-\x26\xf8\x9f\x33\xdf\xdd\x5a\x79\x2b\xf4\x79\x20\xf6\x9f\xd7\xe4\
-\x61\x6e\x5c\x00\x57\x49\x6c\xd8\x94\x5f\xf4\x8e\x0f\xaf\x7f\xc3\
-\xad\x77\xf5\xe6\xb4\x01\xae\x85\x7f\x24\xeb\x1f\x0e\x03\x06\x84\
-\x9f\x28\x01\xad\x85\xca\x93\xd8\xf2\xe3\xaf\xbc\xe6\xf3\x77\x5c\
-\x7d\xee\x91\x8b\xbd\xd9\x2b\x81\x30\x78\xf5\x10\xaf\x81\x60\xa3\
-\x5d\x4a\xe8\x78\xf8\x04\x0a\x91\xe1\x9f\x2e\xdb\x83\x36\x18\x48\
-\x60\x2c\x90\xae\x96\x28\xb4\x35\x42\x45\x5b\x98\x25\xf6\x03\x00\
-\x3f\x87\x26\xd5\xf0\xa7\x71\x00\x10\x2e\xb4\x07\xce\xa5\xf8\x4a\
-\x45\x8a\xc5\x83\x1f\x27\x74\xd2\x80\x41\xa7\xa1\x06\x52\x08\xb9\
-\xa0\x2b\x02\xf7\xb9\x39\xe6\x85\x45\x7e\xa8\xb1\xa5\x3b\x10\x29\
-\x22\x72\x64\x97\x45\x06\x14\xe5\x77\x24\xcb\xed\x84\xcf\x08\xb9\
-\x26\x28\x0f\x49\x80\x7d\x76\x1f\x83\x3b\x0d\x47\x3a\xf0\x5e\x12\
-\xfa\x9c\x29\x9a\x5c\x08\xf5\x91\xbf\xb9\x63\x75\xff\xd4\x23\xdf\
-\xbc\xee\xf5\x97\x5f\xbb\xb0\x89\x58\xfe\x99\x7a\x1f\xc9\xfa\xd7\
-\xe9\x7a\x61\x5f\x38\x56\x44\x43\xfc\x90\x52\x09\x6c\xfe\xd5\x39\
-\xc7\x5e\x74\xf6\x71\xcf\x7d\xe1\x9a\x5b\x2e\x79\x53\xbf\x37\x77\
-\x63\xd5\xcf\xcf\xe4\xa4\xa3\x85\xe2\xb5\x30\x0f\x62\xb9\x36\x99\
-\x1c\x42\xe9\x55\xc2\x04\x21\xc8\xc0\xce\xb5\x13\xd2\xd0\x6c\xee\
-\x01\x06\xc7\x8a\x2c\x89\xef\x9f\xc8\x01\x38\xc2\x20\x22\x04\xc5\
-\x87\x32\xc9\x9c\x81\xa0\x08\x40\x80\x2f\xa8\x07\x9a\xba\xb0\xcb\
-\x08\x2e\x0a\x11\x06\x44\x37\x99\x42\x12\x74\x1a\x4d\x08\x5b\xed\
-\x44\x24\x10\x48\x04\xf4\xea\x18\x04\xbf\x24\x48\x9a\x29\xab\x34\
-\x72\xcf\xd2\xcb\x02\x4c\x85\xd8\x15\xf2\x66\xb4\x90\x37\x84\xfc\
-\x72\x66\xf1\x1d\x25\x51\x43\x7e\xfd\x3e\xfd\xbe\x5a\xbc\xfc\xda\
-\xc5\x7f\xff\xab\xb7\xac\xfb\xe0\xcc\xac\x61\xfc\xa9\xf0\xcf\xd5\
-\xcf\x8d\x54\xf5\x90\x81\x6a\x27\xfc\xfa\xb8\x33\x3f\xff\x20\x5d\
-\x81\xb4\xa0\x95\x40\xb9\x5f\x74\xda\x5b\xbf\x7d\xee\x67\x5e\xf4\
-\x82\xf5\x77\x5d\x75\x4c\x6f\x71\xee\x5a\xc3\xd6\xd3\x44\x0f\xf2\
-\x6b\x8a\x85\x30\x1e\x05\xad\x48\x42\x89\x72\x22\x07\xca\x64\x18\
-\x82\x2b\x34\xd6\xa1\x48\x6b\xdd\x15\x63\xe9\xdb\xe6\x01\x34\xc4\
-\x0e\x41\xaa\xf4\x63\x83\x53\x15\x04\xdc\x04\x41\x19\x20\x06\x12\
-\xb8\x22\x3d\x50\xb4\xbf\x1f\xec\x0a\x06\xae\xd0\x43\x80\x64\xf3\
-\xd6\x4a\x2a\x12\x10\xb3\x74\xc0\xb8\x76\xc1\x5e\x05\xaa\x21\x9d\
-\x16\xeb\x60\x38\x13\x76\x9a\x68\x24\x09\x74\x14\xf6\x87\x22\x11\
-\x31\xae\x40\x52\x10\xb9\xdd\xb9\xe0\xd3\xef\x52\xf8\xfb\x57\x9d\
-\xfa\xdd\x99\x57\xfc\xe3\x31\xf7\x9e\x46\x0c\x6d\x29\xf0\x5b\x6a\
-\x39\x2b\xe5\xad\xf7\xdd\x13\xf6\x1d\x79\x1e\xfa\xa4\x04\xcd\xa2\
-\x96\x9f\x1c\x7c\xe6\x17\x2a\x25\x80\xcf\x7b\xf9\x9d\x74\xf0\x66\
-\x21\xf7\x9b\x7a\x3f\xfa\xf2\x6b\x4e\x2e\xee\x7f\xf5\x51\xcf\x78\
-\xdd\x23\xf6\x3f\xf4\x69\xcf\x5a\xbe\x72\x9f\xc7\x4f\x2d\xdb\xe3\
-\xb1\x90\x4d\x4c\x99\x28\x36\x29\x2a\xa2\x04\x95\x14\xf4\x06\xe2\
-\x1e\x20\x77\xf4\x48\x1a\xa6\x4e\x3b\x2e\x7b\xd5\x01\xea\x89\x61\
-\xd0\xd0\x70\x83\xa4\x1d\xd3\x0c\x43\xe5\xd7\xfb\x87\xe7\x01\x80\
-\x69\x9b\x6d\x7a\xe5\x49\x7d\x00\x31\x92\x0a\xcb\xd9\xf7\xd0\x74\
-\x50\x08\x1c\x8f\x9c\xac\x43\x8b\x92\xa8\x60\xe7\x74\x8a\x18\x28\
-\xda\xde\x13\xea\xd7\xd1\x09\xee\xf8\x1f\x80\x62\x32\x90\xd0\xfe\
-\x3b\x50\x4d\x18\x9d\x33\x00\x4a\xce\xe9\xaf\x5f\xca\x85\x4e\xc3\
-\x6e\xb1\x0c\x7a\x45\x34\x03\x9e\x01\x1b\xc7\x97\x37\x75\xf6\x89\
-\x66\x19\x46\xde\xcb\x6b\xeb\x87\xe8\x15\xf8\xcc\xcd\xe3\x8d\x97\
-\x5e\xb9\xf0\xc9\x77\x7d\x64\xfd\xf7\xa9\x3c\xd5\xc2\x4f\x2d\x7f\
-\xe5\xf7\x8f\xa3\x35\xb8\x30\x19\x28\x26\xfc\xb2\xa6\xff\xce\x49\
-\x0f\xca\x9f\xfb\xb7\x77\x6a\x32\x42\xa7\x26\x2e\x2f\xf6\x65\x57\
-\xfd\xf0\x13\x97\x17\xfb\xd5\xf5\x67\x65\x8f\x78\xfa\xab\x7f\x6b\
-\xd5\xbe\x0f\x3b\x68\xd9\x6e\x7b\x3f\xa0\x7c\x93\xe9\x15\x7b\xee\
-\x3f\x35\xbd\xfb\x5e\xbe\x69\x90\xac\x98\xf0\xc3\x9a\x2e\xc1\xd5\
-\x70\x2e\x37\x55\x35\xaf\xcb\x86\x8b\xe7\xb6\xac\xbf\xfd\x4a\x29\
-\x0c\x45\x05\x78\xe8\x8c\x40\xca\xbe\x23\x78\xef\xed\x84\xb7\x68\
-\x2b\x5c\xa1\xf9\xa5\x58\x15\xcc\x32\x26\x9d\xce\xba\x4c\x11\xa0\
-\xa0\x08\x68\xf9\x28\x0a\x0d\x49\xd1\xc4\xff\x88\xc5\x47\x2d\x68\
-\x5c\x11\x60\xa4\xc1\x28\x84\x4b\x8b\x51\x29\x51\xf2\x85\x12\x5f\
-\xde\xfe\xd3\xeb\xa4\x03\xc2\x2c\x3d\xa1\xd4\xd6\x3b\xd5\xba\xb1\
-\x68\x8e\xe2\x92\x4a\x57\x04\x2d\x5e\x43\xf6\x82\xd7\xe3\xaf\xce\
-\xec\xbb\xe1\xd6\xde\xd7\xdf\xfe\xe1\xfb\xbe\x59\xc3\x7d\x24\x72\
-\x34\x57\x5b\x7c\xed\xf3\x57\xc6\xf6\xac\xcf\xec\x3b\x96\xd1\x00\
-\x93\xe9\x96\x1f\x64\x32\x19\x8c\x12\xc0\x42\x09\xf4\x99\x12\x28\
-\x4f\x78\x59\xbd\x97\xfd\xaa\x27\xaf\xfe\xd1\x67\x4a\x65\x70\xad\
-\x72\x7b\x75\x8f\x71\x30\x57\x70\xd3\xe7\xe6\xf4\xad\x68\x0d\xe3\
-\x53\xf2\x09\xa4\x6f\x83\xb2\xa2\x41\x08\x08\x03\x43\x06\x6e\xfe\
-\x84\x95\x74\x07\xa2\x07\xa7\x69\xd7\x22\x45\x04\xdf\x09\x19\x56\
-\xc2\x4e\xa6\x2e\x33\x43\x8e\x8c\x24\xd0\x9d\x80\xa5\x7a\x7f\x88\
-\x20\x01\xb1\xb5\x3f\xc9\x3d\xe0\x8a\x82\x0e\x21\xe1\x48\xc6\x55\
-\x74\xe8\xe6\xcf\x73\x9b\x41\x2f\x71\x6e\x95\x0b\x06\x8e\x19\x19\
-\x0d\x20\xca\x28\x40\x27\xd3\x14\x96\x6a\xcb\x0c\x5e\xbe\x6e\x7d\
-\xff\x92\x1f\x5e\x32\x7f\xde\xe7\xbe\xbe\xf9\x06\xb2\x2e\x79\x86\
-\x9f\x66\xfb\x17\x34\xec\xc7\x31\x4e\x4d\x9f\x1c\x87\xf0\xeb\x27\
-\xbe\x73\xf2\xc0\x25\x78\xee\xdf\xdc\xb9\xc8\xbe\xc8\x5c\xad\x00\
-\xa6\xea\xcf\x9c\xac\x15\x40\xa6\x86\xcf\xa6\x6f\xbb\x69\xbe\xa2\
-\xa7\xa4\x9c\xe9\x40\x59\xb0\x6a\xe8\x0e\x0c\x52\x2b\xeb\x08\xd4\
-\x0f\x2a\x84\x44\x65\xe0\xce\xfd\x03\x2f\xb1\xc7\xb8\x3d\xc8\xa1\
-\x3f\x98\x04\xad\x3b\x56\xf7\x4e\xe3\x56\x48\x3f\xc8\x89\x24\x49\
-\xcd\x28\xc5\x7e\x75\x22\x94\xc6\xc0\xdf\x08\xcf\x05\xde\x97\x03\
-\x76\xb7\xa1\x26\xbd\xef\x0b\x5c\xa8\x91\xa6\x22\xc9\x35\xa1\xf3\
-\x49\xd1\x00\xa9\xca\x61\x66\x0e\xd7\x6f\xdc\x8c\x77\x97\xf7\xd7\
-\x6f\xca\xd7\x5d\x77\xf3\xe2\xed\x27\xfd\xef\x96\x1b\x3d\xe6\xda\
-\xc2\x7d\x6d\x38\xe7\x89\xe0\x57\xf2\x54\x08\x3f\x4a\xcd\x42\x47\
-\x52\x00\x4d\xfd\x32\xc5\xa9\x39\x4a\x45\xb3\xe8\x6a\x45\xd0\x2f\
-\x14\x01\x45\x03\x13\x6c\xcf\xea\x5b\xa7\xd5\xfe\x12\x22\x00\x24\
-\x17\xb7\xef\x25\xe4\x28\xb9\xfd\x56\x6a\x1f\x10\x89\xe1\x07\x90\
-\x17\x78\x48\x21\xa4\x28\x03\x00\x06\x5d\x09\xc3\x49\x4b\xae\x1d\
-\x7e\x80\x91\x84\x4f\x7b\xe1\xed\xff\xae\x86\xe8\x1f\xd7\x6d\x23\
-\xaf\x3f\x7e\x4b\x3b\xf9\x70\xe1\xd7\xc6\xaa\x62\xfa\xa9\xf0\x8b\
-\x8a\x79\x24\x04\x10\x80\x67\x8d\x96\xbf\x41\x5c\xbf\xf3\xc5\x5a\
-\x11\xbc\xec\x4e\xad\xdd\x32\x26\xec\xd9\x56\xb2\xfe\x14\x05\x98\
-\xc6\x09\x10\x63\xa0\xc4\x6e\xc0\x20\x6b\x05\x44\x9f\xe4\x0a\x28\
-\xcc\x60\x8b\x2b\x90\x95\x01\x86\xc6\xe2\x00\xf9\x68\x69\x82\xa7\
-\x7e\x3d\x67\x24\x19\x3a\x8b\x4f\x46\x43\xdd\xb6\x94\xc2\x8f\x4c\
-\xf8\x7b\x44\xf8\xf5\x6e\xba\xfb\x18\xc1\x17\x85\x1f\xc7\xa1\x00\
-\x7c\x7b\x96\x0c\xfb\x1b\x7c\x62\xfd\x3e\x67\x9d\x72\x80\xf6\xb9\
-\x4d\xbd\xf2\x9f\xbe\xf4\x0e\x50\x4b\x97\x8d\xdf\xf4\x63\xe0\xa5\
-\x67\x1f\x8c\x6e\xb6\x0e\xf8\xec\x7b\x6a\x4b\x20\xde\x49\x54\xe4\
-\x00\x30\xc8\x73\x62\x48\x19\xa0\xcb\x19\x48\xa3\xba\x4d\xff\x43\
-\xc5\x11\x41\xd4\x0f\xa7\xa1\xa5\xa1\xea\xc8\xbb\x6d\xa8\x75\x97\
-\x33\x05\xd0\x17\xf6\x5c\x12\x7c\xbd\x84\xb0\x69\x80\xe3\x50\x24\
-\xa0\x37\xca\x69\x34\xcb\x1f\x8b\x1a\xe8\xf7\xf9\xee\x97\x0f\xf0\
-\x8a\xcc\x1b\x33\xc5\xf4\x53\x19\x8f\x5c\xd8\xe7\x32\x52\x4e\x9b\
-\xe9\x09\x65\x19\xd4\x8f\xc1\x3e\x17\x89\xf3\xf3\x84\x39\x29\xcb\
-\x4f\x8c\x77\x43\x80\x14\xe4\xe5\xb2\x88\x61\x84\x80\x7e\x64\xc1\
-\x43\x05\x6c\xa8\x1e\x80\xcf\x92\x8b\x68\xc0\xbe\xa7\x76\x87\x68\
-\x58\xa9\xdb\xb6\x2e\x0a\xc8\x85\x5b\x55\x0a\xbe\x11\x76\x15\xe2\
-\x33\x70\x69\xa6\x03\x8f\x2c\xfc\x10\xe0\x0d\x20\x24\xe0\xcd\xc2\
-\x0f\x0a\xc2\x18\x81\xcf\x17\xf5\xb4\x42\x44\xa1\x80\x7f\x18\x44\
-\x08\xfd\x28\x00\x08\xf8\x31\xb4\x27\x62\x9c\x00\x20\x08\xc1\x69\
-\xdc\xc1\x85\x3a\x5d\x11\x48\x68\x80\x15\xf7\xf5\x09\x41\xbb\xd0\
-\xc9\xe7\x56\x55\x02\xd5\xfd\xb3\x3f\x6b\x85\x9d\x5a\xf8\x98\xe0\
-\xab\x25\xe1\x00\xc6\x24\xfc\xaa\xc1\xea\xb7\x11\x7c\xc7\xea\x37\
-\xcc\xf5\x04\x25\xc0\x78\x41\x2a\x01\x12\x47\x72\xb5\x99\x08\x0c\
-\xb1\x13\x12\xdd\x7b\x56\x86\xcb\x10\x02\x53\x04\x5e\x6c\x1f\x12\
-\x78\x02\xcf\xe2\x83\xd3\xb8\x85\xc3\xd0\xdf\xfc\xf4\x90\xbe\x5e\
-\x4c\x79\x4e\x86\x92\x92\xd8\xb5\xa1\x0e\x72\xf7\xcb\xe4\x1e\x8b\
-\xee\xc7\xd9\xad\x8e\x6b\x8a\x0c\xb0\xcf\x13\x13\x69\xec\x39\x98\
-\xe7\x72\x4b\xf0\xe8\x61\xb0\xa6\xab\x6e\x6e\xcf\x51\xaa\x5c\xd4\
-\x77\xe8\x31\x0e\xa9\xaa\xe2\xc2\xd6\x46\x08\x51\x48\x74\x75\xbf\
-\x5b\x9a\xe0\x8f\x4b\xf8\x2b\x05\x10\xab\x3c\x1b\xd9\xf2\x8b\x06\
-\x2f\x22\xfc\xa1\x29\x45\x31\x96\x20\x46\xdd\x87\x2c\x79\x72\xe0\
-\x31\x65\xf4\x6c\xe4\x18\x29\x15\x57\xf0\xf5\x91\xd5\xe5\x4b\xbc\
-\x01\x8a\x30\x5f\x91\x76\xec\x3e\x59\xa8\x2f\x4d\x8e\x16\x0d\x00\
-\x04\x32\x05\x6a\x1d\x51\xe6\x86\xe7\x2c\x49\xc9\xe6\x09\x95\xbd\
-\x1a\x88\x12\x10\xf9\x05\xa8\x3e\x03\x85\x90\x68\x28\x47\x00\x48\
-\xe3\x52\x2d\xc0\xa0\x02\xe1\x2e\xd4\xb1\xce\x88\x69\x65\x75\xf6\
-\xfa\x1a\x04\xbb\x19\xa1\x4d\x96\xc2\x31\x08\x5b\x53\x4e\x41\x30\
-\x57\x2a\x20\xf8\x21\xab\x3f\xe6\x28\x00\x04\xfd\xd2\xd6\xc2\xdf\
-\x60\xf9\x5b\xc3\xfd\x58\xe7\x1c\xce\xc1\xa5\x08\x3c\x13\x5e\x77\
-\x8a\x31\x43\x0b\x52\xd3\x52\x8f\x2b\x00\x9b\x0a\x8c\x34\x18\x20\
-\xa4\xfb\x89\xe1\x3f\xc1\x55\x40\xe5\x0f\xe2\x88\x20\x82\xc1\x2c\
-\x85\x62\xa1\x03\x49\x89\xd6\xe9\xd5\xe8\x2a\x90\x9b\x2f\x3a\xe4\
-\x72\x2a\x28\xae\x4c\x0e\x06\xba\x54\x82\x98\x11\x81\x0c\x28\x81\
-\x92\x53\xc9\x73\x41\x09\x50\xfb\x19\x52\x02\x31\x4d\x14\xd5\xad\
-\xe0\xa0\x13\x27\x63\xc9\xfd\x9b\xb7\x17\x8f\x3f\xa4\x53\x9b\xc5\
-\xe6\x21\xb4\x59\xa9\x52\x5e\x6f\xc3\x54\x6b\xdf\x06\x21\x60\xa3\
-\x62\xc0\xe8\xeb\x38\xc6\x98\xcd\x64\x9a\xaf\x3e\xaa\xf0\x47\x30\
-\x71\x13\xdc\x87\xd0\x87\xba\x0f\xd3\x04\x5e\x11\x61\x77\x67\x0f\
-\x34\x36\x05\x4e\xcc\x12\x74\xb8\x05\xc6\x0e\x8a\xa1\x1b\xf0\x15\
-\x81\x51\x06\x11\x44\x40\xfb\x02\x52\x21\xa0\x2d\xd8\x8d\xd0\x65\
-\x84\x17\xd0\x8a\x2a\x47\x47\x7f\xe6\xe8\xba\x0e\xa0\xa1\x40\x50\
-\x09\x28\x83\xad\x0d\x6a\xd0\xbf\x07\x06\x0d\xb5\xab\x04\x24\x14\
-\xc0\xd5\x73\x48\x09\x40\x58\x48\xb1\xbe\x80\xbd\x1e\x3e\xe0\x0f\
-\x5f\x7a\xf7\xa4\x76\x77\x7e\x70\xca\xfe\xb6\x2d\x65\x4e\xfa\xef\
-\x2b\xdd\x75\x48\x1e\xc6\x21\x09\x5d\x8a\x10\xa6\xe4\x16\x61\x20\
-\x2e\x1c\x44\x0c\x18\x7f\xff\xb6\x5b\x16\x15\xdc\xa6\x76\xd5\x21\
-\xe1\x07\x59\xf8\xa5\x5e\x83\x1e\xe4\x8f\x32\x70\xbe\x99\x6f\xe6\
-\xd7\xc0\xe9\xd1\xef\x09\x3b\x04\x04\xbc\xb1\x55\x57\x22\x5f\xc0\
-\xbd\x95\x50\xa7\x62\x10\x90\x4c\x68\x22\x71\xc4\x85\xb2\x33\x14\
-\xfc\x91\xe8\x4e\x2a\x43\xe6\xa2\x31\xb1\x67\x62\x1d\x3d\xa1\xef\
-\x13\x6a\x58\xe2\x5f\x53\x3e\xab\xa1\x05\x6c\x8e\x55\x0e\x42\x40\
-\xd0\x04\xfb\x31\xb7\xa0\xa6\x8b\x9b\x15\x6a\x90\x81\x3a\xf1\x47\
-\x7f\x7d\x37\x50\xcb\x2f\xcd\xda\x53\x42\x49\x2f\xef\xf4\x9b\xd2\
-\x28\x24\x4f\xec\x18\xcc\xcb\xd8\x43\x95\x90\x5e\xc7\xa3\xf1\x21\
-\x00\x90\xe7\xc8\x8d\x02\xfb\x95\x2c\xfc\x41\xc8\x9f\x62\xf5\x85\
-\xcf\x80\xa0\x83\x6f\x4b\x84\x21\xd2\x5e\x5b\x25\x2e\xce\xa1\x37\
-\x88\x9b\x05\x5b\x09\xc9\x5e\x84\x30\x67\x80\x8c\x30\x04\xc9\x2d\
-\xb0\xaa\xcf\x44\x0a\x40\x09\xb9\xfb\x24\x3d\x58\xff\xa6\xb9\xb2\
-\x15\x81\xfa\x18\x40\x17\x09\x58\x2b\xef\x16\x07\xf9\xb5\x03\x2e\
-\x0c\x70\xcf\x11\xbc\xe1\x97\x9c\x0f\xa0\x15\x73\x82\x5a\x37\x35\
-\x09\x86\x60\x24\x3d\x11\x4b\xe4\x30\x37\x8f\x65\x0d\xca\x1e\x6a\
-\x90\x4f\x3f\xab\x4c\x65\x30\xba\x31\x39\x8c\xfb\xe2\xd8\xd6\xf2\
-\x63\x3a\x26\x68\x42\x16\x88\xcd\xa8\x62\x34\x05\xc0\x7a\xfb\x8f\
-\x1b\xf6\x43\xf0\x3d\x20\xc1\xd7\x87\xb0\x72\x69\xb0\xb2\x41\x4b\
-\x1d\xe3\x11\x9b\x5a\x00\x2a\xbf\x7f\x07\x30\x8b\xed\x72\x00\x0d\
-\x4a\x81\x85\xef\x10\x21\xee\x22\xf0\x96\x57\x60\xbb\x31\x92\x0a\
-\x6b\x27\xfa\x97\x95\x6d\xd6\xb1\x2e\x8f\x36\xf0\x5e\x4b\xba\x85\
-\xcb\x5a\x72\x34\xb2\x2f\x8f\xa9\xca\x86\x75\x6f\x3d\x41\xc0\x40\
-\xbb\x03\x60\x3f\xdf\x87\xfd\xa0\x9c\xb8\xb5\xc4\x07\x34\x71\xad\
-\xbc\x2a\xda\x68\x1a\xa6\x60\x58\xc6\xdc\xfc\x3c\x4e\xd5\x08\x40\
-\xb7\xd1\x72\x46\x26\xf8\xa4\x20\xb8\xc8\x80\x17\x2a\x25\x29\x00\
-\x1c\x89\x20\x4c\x15\xfa\x31\xe7\x01\x40\x7c\xf4\x52\x2a\xec\x97\
-\xde\x20\xd5\xdf\x8f\x9c\x40\x5c\xf0\xc1\x81\xb6\x4d\x1c\x80\x52\
-\xb2\x00\xfb\xce\xa5\xd8\x73\x3b\x10\x4b\xb4\x19\x36\x9a\x65\x07\
-\x88\xe6\xfe\x88\xca\x00\x18\xa6\x47\x21\xa3\xcf\x23\x0c\x51\x20\
-\xce\xdc\x53\x92\x8b\x94\xca\x84\x28\xa2\x04\x00\xc9\xf8\x36\x2d\
-\xcf\x44\x09\xd0\x81\x2f\x12\xf3\x1f\x52\x02\x98\x4a\x0a\x32\x3e\
-\x60\x40\x2c\xda\x49\xc7\x8a\x23\x18\xce\x79\x08\x97\xb6\x8f\x38\
-\xa1\xe1\xbf\x76\x77\xbd\xd1\x5b\x5e\x68\xce\xf6\x47\x90\x49\xb7\
-\xf6\x02\x3e\x0e\xb2\x70\x29\x84\xdf\x25\x01\x61\xfc\xc2\xef\xe7\
-\x03\x8d\xc1\xea\xfb\xef\x96\x88\x0a\x02\x6a\x25\x94\xf3\x9f\x52\
-\x12\xcc\xdb\xf9\x40\xe8\xc4\xd1\x6f\xc5\x87\xa9\xc8\xc0\x8e\x57\
-\x93\x08\x43\x87\x2c\x44\x94\xcb\x02\x28\x74\xc8\x90\xc0\xfb\xda\
-\xc5\x60\x4a\x40\x23\x04\xa1\xef\x46\x64\xf9\x13\x4b\x4f\x3d\x03\
-\xa2\x4f\x81\x75\xf0\xf1\x14\x24\xca\xc1\x00\xc7\xcf\x6f\x22\x04\
-\x13\x22\xb7\x20\xbc\x1f\xb2\x52\xe2\x50\xda\xed\x68\x2e\x40\x82\
-\x22\xd8\x0a\x42\xef\xbb\x00\x63\xb6\xfc\x22\x39\xd5\x90\xd4\xc3\
-\xa5\x3e\x86\x48\xa4\x81\x24\x31\xc1\x17\xcc\xce\xd2\xce\x94\xf6\
-\x33\x94\x3c\x13\x16\x45\x07\x10\x52\x04\xe8\xbb\x01\x84\x84\x2b\
-\x6b\xdd\x3d\x6e\xc0\x4c\x09\x1a\xf8\xf0\x50\x87\xf1\x9c\x2a\xe2\
-\x88\x12\x70\xa2\x0d\xf5\x44\xc7\x5c\x44\x01\x2a\xea\xfb\x78\xcd\
-\x44\x80\x71\x05\xc1\xa2\x27\x3a\x3c\x46\xe8\x5f\x28\x7d\x5e\x44\
-\x09\xa0\x8a\xf4\x2e\x14\x92\x81\x78\x23\x8f\xb6\xc2\x38\x6c\xb4\
-\x60\xa9\x05\xdf\x47\x00\x8d\x8b\x39\x8d\xf0\x6b\x2a\x15\x6e\x84\
-\xfc\x10\x13\xfc\x04\x92\xcd\x89\x0e\xf0\xca\x3e\x88\xbb\x05\x4a\
-\xc5\x3b\x01\x2b\x79\x74\x80\xc7\xb0\x43\x13\xe4\x87\x34\x65\xe0\
-\x29\x02\xf0\xdc\x82\x20\x49\x28\x10\x84\x90\x59\x25\x80\x8c\x70\
-\x04\xc7\x62\x13\x22\x95\xfb\xf4\x35\x29\x88\x3c\xf3\x30\x60\xf1\
-\x73\x8c\x48\x66\x02\x1f\x80\xfc\x82\x86\xe4\x9d\xff\x5d\x2a\x0a\
-\xf0\x84\x11\x9d\x0c\x41\x4c\xf4\xd3\x93\x94\xc1\x18\x95\xc6\xb8\
-\x94\xc3\x24\x40\xb3\x65\x86\x36\x71\xfe\x14\xcb\xdf\x34\x26\x3a\
-\x45\xf8\x63\x42\xac\x04\xa9\x94\xf4\x04\x13\xd8\x2c\x0b\x5f\xe8\
-\xd0\xe7\x87\x5e\x6b\xe4\x00\x02\xd9\x3f\x62\x1b\x40\xf0\x79\x02\
-\xd1\x2d\xa0\xd1\x00\xe6\x12\x18\x59\xad\x95\x40\x59\x34\x95\x13\
-\xf2\xb0\xa6\x05\x06\x04\x20\x0c\x2c\x76\x95\xd1\xa7\x9f\x67\xd1\
-\x83\xac\x4c\x9f\xe5\xd0\xbb\xf6\xdb\xbd\x8e\x41\x3c\x02\x10\xe8\
-\x26\x84\x81\x1e\x80\x3c\x42\x38\x98\x98\xd3\x82\x5f\x91\x50\x80\
-\x14\xf2\x53\x34\x2f\xc0\x6f\xa3\x86\xf9\x68\x82\x3d\x2e\x41\x1e\
-\x3b\x07\x10\xb3\x58\xc1\x36\x7d\xd0\xe0\xf3\x43\x0b\xb2\x0f\x12\
-\x05\x3f\xe6\xdf\x43\x44\x11\x29\x9f\xc1\x8f\xfb\xf4\x02\x1f\xa0\
-\x04\x7e\x00\x98\x10\xc6\xb2\x82\x9b\xac\x3c\x63\xf6\xc4\xdf\x84\
-\x45\x6b\xa4\xdf\xac\x4a\xca\xe1\xa8\xcc\x74\x56\x76\x09\xb4\x66\
-\x25\xc0\x3e\x37\xf3\xc3\x83\x68\x04\xdf\x3d\x51\x2d\x3e\x96\xd0\
-\x73\xbf\x84\xe4\x87\x37\x66\x09\x46\xb1\x32\x25\x19\x46\x87\xe4\
-\xe1\xbc\xfc\xe1\x05\x7e\x14\xc1\x5d\x3a\x0e\x40\x25\xfa\xfd\xa3\
-\x0a\x3f\x34\x99\xfc\x76\x56\xdf\xf3\xef\x1b\x42\x7c\x51\x81\xe7\
-\xd9\x2d\xad\xb8\x01\x10\x50\x07\x1a\x21\x90\x46\x75\x37\x2b\x03\
-\x3f\x6f\x1f\x03\x35\x00\xda\x5a\xd1\xe7\x9d\xcc\x3c\x01\x70\x00\
-\xe9\xb7\xe7\x28\x01\x0e\xe7\x49\x5e\xbf\x24\xb0\x5e\x33\x02\xc1\
-\x95\xb7\xb9\xf8\x18\xb7\xf8\x31\xe1\x22\xb3\x0c\x34\xaa\x11\x3d\
-\x0b\x94\x23\x02\x4d\x82\xc5\xad\x3f\x27\x29\x42\xde\xc7\x52\xfa\
-\xe7\xb8\x95\x5a\xb4\x4c\x26\xfb\xfd\x4a\x05\x31\x3a\xb4\x26\xfc\
-\xe2\x96\x3f\x66\xf5\x41\x09\x82\x0f\x31\x54\x10\x80\x01\x91\xbf\
-\x69\x1a\x03\xe8\xf9\xff\x5e\x2f\x11\x08\x28\x39\x39\xf1\x25\xa8\
-\x0c\x84\x76\xdc\x32\x4b\xee\x87\x07\x32\xc5\xbb\x9f\xd6\x48\x20\
-\xa6\x04\x94\xb5\xf4\x86\x00\x44\x32\x87\x31\x12\x19\xf0\x49\x32\
-\xda\x7c\x73\x20\xb4\x9b\x67\xf1\xaa\x4d\x9b\xf2\x6b\x49\xa7\xdc\
-\x89\xbd\xf6\x9c\x78\xd4\xf2\x65\x70\x68\x1b\x66\xdf\x42\xf2\x76\
-\x04\xa0\x13\xad\x50\x72\x63\x66\x9e\x17\x30\x2a\x09\xb8\x3d\x09\
-\x7b\x73\x14\xc0\x61\xf7\x9b\x18\xff\x06\x61\x1d\x12\xf6\x37\x09\
-\x7f\x0a\xf3\x6f\x2f\x6c\x5d\xe8\x03\x24\xde\x15\x10\xf8\xd6\x6c\
-\x4e\xe4\xb3\x41\xf8\x3e\xe8\xe5\xab\x62\x10\x19\xf8\xd6\x1e\x7c\
-\x34\x00\x36\x63\x2f\x94\x48\x64\x12\xf5\x48\xa8\x30\x55\x09\x70\
-\x24\xe0\x91\x82\xec\x3d\xd1\xc9\x1e\xb4\x7c\xc0\xdc\x7c\xff\x96\
-\xab\xae\x5b\x38\xf9\x84\x2f\x6f\xfc\xfe\x4f\x2f\x9b\xdb\xa8\xfc\
-\xde\x78\xea\x88\xc3\x77\xdf\xf7\xc8\xe7\xef\xfe\xac\x87\x1d\x3c\
-\xf5\x37\x93\x93\xb0\x2f\x4d\xc3\x50\x5e\x6b\x72\x15\x8c\x08\xc4\
-\xf2\x02\xc6\x25\xa0\xdb\xd2\x5f\xdf\x6a\x08\x00\x52\x19\xff\x50\
-\x92\xcf\x98\x85\x1f\x9a\x30\x7d\x6c\xf0\xa7\x37\x70\xcf\x9d\x72\
-\x13\x4c\x15\x76\x5c\x04\x95\x34\x13\x20\x85\xa0\x44\x94\x5c\x0d\
-\x8c\xc6\xc0\x39\x9d\xef\xf9\xe7\x1e\x41\x88\xbe\xae\x49\x50\x02\
-\x34\xbd\x96\x12\x8a\x40\x90\x40\x28\x54\x67\x94\x80\xed\x2e\x3c\
-\x7f\xd5\xb5\xf3\x1f\xfd\xfb\x77\xac\xf9\xfa\x96\x99\xbc\xaf\xdc\
-\xb6\xd7\x4e\x7b\xf6\x6f\x9f\xbb\xe5\xb6\x62\x3f\xe9\xb7\x0e\x9e\
-\x3a\xf5\x83\xef\xdc\xfb\xef\x1e\x72\xe0\xd4\x6b\x8a\xd3\xc8\xb8\
-\xb2\x45\x29\xe9\xa9\x45\xa1\x90\xe8\x4e\x61\xf8\xef\x30\xe0\x89\
-\x28\xdc\x31\x84\x3b\x65\xcb\x14\xf3\xf3\x83\x04\x7d\x42\x8a\x6f\
-\x2b\xe1\x8f\xb5\xd5\x0a\xe6\x0f\x27\xc4\xff\x99\xe0\x07\xdd\x81\
-\x90\x80\x0b\xa8\x27\x04\xfd\x45\xa4\x93\x54\x10\x24\x44\x2d\x20\
-\x1e\x45\xe0\x3f\x84\xf7\x1e\x10\x56\xe0\xe5\xc3\x8c\x65\x33\xd2\
-\x1c\x26\xa8\x95\xaa\x2e\x24\xa2\x23\x63\x4d\x64\x04\xe8\x73\x71\
-\xe8\x35\xbf\x80\x77\x9f\x72\xda\xc6\x57\x1d\xf5\xfa\xbb\x4f\x2d\
-\x84\x5f\x37\xb8\xd4\x23\xe4\xca\x36\x64\xe5\x78\xab\x4d\x6c\xdf\
-\xfc\x9b\x5b\x16\xef\xfd\x8b\xff\xbb\xfa\xa3\xdf\xfb\xc9\xec\xab\
-\x0b\x05\xb2\xc1\xf5\x31\x02\x8d\xa6\x40\xb5\x0b\x01\x04\xcd\x59\
-\xf8\x58\xd8\x01\x2d\x7b\xb2\x02\x80\x98\xdf\x0f\x2d\xc3\x7d\x6d\
-\x2c\xbf\x0a\x08\xbf\x28\xdf\x90\x96\x13\x20\x08\x7e\x54\xe8\xb9\
-\xb0\x79\x82\xde\x0c\x01\x68\x8f\x80\xa0\x82\x80\x30\xda\x71\x22\
-\x18\xc2\x49\xcb\xef\xa7\x3f\x5b\x98\x54\x1c\x81\x50\x41\x25\xa0\
-\xac\x12\xa0\x8a\x9c\x47\x88\xab\xea\xc0\x98\xe2\x29\xf6\x5e\x1f\
-\xd7\xbc\xff\xbf\xee\x79\xc5\x87\x3e\x75\xdf\xaf\x95\x6d\x09\x5f\
-\x4d\x91\x2e\xf6\xd2\x05\x58\x5f\xec\x1b\x84\x5d\x3f\xbf\xe9\x1d\
-\x1f\xb8\xe7\xbc\xaf\x9f\xb5\xf9\x65\x79\x5e\x29\x8a\x06\xbf\x93\
-\x3c\x9d\x25\x54\x1f\x42\xbb\xc7\xc3\x16\x04\xed\x58\x08\x20\x02\
-\xfd\x5b\x91\x7e\xa3\x5a\x7e\xc9\xb0\x33\xc8\x1f\xb6\xc0\x89\x82\
-\x2f\x0a\xab\x8f\xf9\x11\xdb\x8e\x06\x12\x14\x83\x24\x9c\x29\x59\
-\x8b\x01\x45\x10\xba\xc6\x8e\x32\xc9\xe8\x5b\xc8\x4a\xc0\x34\x55\
-\x05\xbf\x8e\xc2\xfe\xbd\xfb\xb7\x99\xf0\xc1\x7e\x6f\x13\xc8\x4f\
-\x3d\x7d\xf3\xdb\x0a\x38\xbf\x5a\xd9\x41\x2c\xda\xe2\x6f\xa8\x15\
-\xc0\xe6\x5a\x19\xcc\x28\x5b\xa5\x37\xa3\xec\xe0\xcb\xf2\x98\x8d\
-\xc7\x1e\xbf\xfe\xe7\x97\x5f\x33\xff\x96\xa8\x9b\x28\xd9\x2d\x8a\
-\x64\x62\x9e\x61\x2a\x0a\x68\x4c\x49\xdf\xb1\xb7\xc9\x18\xea\x86\
-\x26\xe5\xdb\x18\xee\x6b\x6f\xf9\x63\x33\x64\xe3\x99\x80\x28\x4e\
-\x37\x42\xfd\x3c\xb8\x88\xc2\x10\x84\x4a\x80\xe1\xd0\x72\x0f\x9e\
-\x32\x55\x9a\x3e\x89\x27\x39\x9b\x00\xc2\x31\x18\x22\x09\x65\x5e\
-\xc0\x34\x00\x41\xb9\x0d\x17\xd4\xaa\x5f\x93\x76\x74\xe8\xab\x49\
-\x37\xe6\x53\x81\x15\xe9\x2c\x24\x34\xff\x28\x9f\xbb\xed\xce\xc5\
-\x53\xfe\xfd\xe3\xf7\x5e\xc9\x84\x5f\x0b\xba\x99\xca\xf4\x8b\xb3\
-\x1e\x8c\x3c\xe9\xa7\xbc\x3e\xbf\xf7\xdc\xdb\x69\x7f\xfc\xde\x2b\
-\xde\xbe\xf6\x5b\x3f\xf8\xea\x83\x9e\xb7\xe7\xca\xec\x08\x69\x31\
-\xe8\x31\xf3\x49\x9d\xdb\x46\xda\x96\xfc\x03\xb6\x25\x02\x00\x3f\
-\x63\x0e\x12\xfc\xfe\x61\x84\x1f\x9a\x61\x7f\xcc\x62\x8b\xaf\xa9\
-\x38\x91\x47\xad\x3c\x2a\x81\x14\x8c\xf2\x0e\x2d\xda\x30\x71\x62\
-\x2e\x08\xc9\xc1\x77\x15\x9a\x3a\x95\xc6\xd0\x80\x33\xdd\xd8\xa7\
-\x4c\x2a\xff\x3f\x0b\x8c\xef\xce\x94\x3c\xf0\x15\x7c\xb7\x20\xf8\
-\x3b\x83\x21\xfd\x66\xfe\xed\xa3\xf7\x7e\x41\xd9\x96\xe3\x1a\xf6\
-\x6f\xd1\x0a\xe0\x17\xdf\x3d\xa8\x5f\x0a\xbf\x88\x1e\x8a\x67\x7f\
-\x7e\xe6\x81\x58\xec\x8e\xdb\xf0\xa3\x8b\xe7\x8e\xa9\x5c\x89\xa6\
-\x09\x56\x6d\xe5\xb9\xcd\xe3\x9d\x78\xcb\x82\x17\x47\x12\xfe\x54\
-\x98\x30\x84\xf0\xbb\xfe\x7e\xe3\xbc\x32\xd5\x54\x0d\xe8\x42\x3d\
-\xf7\x83\x90\xf7\xdf\x92\xdc\xf5\x48\x5e\x80\x8a\xf5\x0b\x88\x72\
-\x0e\x3e\xc4\xf0\x14\x81\xf0\xf9\x2a\xe6\x3a\x25\x44\x66\x34\x71\
-\x07\x52\x1b\x75\x70\xf9\x00\xd3\xfd\x27\x10\xd5\x81\x40\x8e\xc8\
-\xda\x7b\xfb\xe7\xfd\xf8\x92\xd9\x0d\xca\x1f\x67\x5d\x8d\x62\xfb\
-\xe5\xd9\x07\x61\x34\x62\x43\x7e\xcf\x42\x09\x98\xb1\xd8\xef\xf9\
-\xaf\x7b\xaf\x99\x5f\xc0\x0b\x64\xe4\x08\x43\x91\x81\xd0\x96\x0c\
-\xdc\x89\xdd\x80\x2c\x9a\xeb\xa3\x54\x9c\xf4\x6b\xd0\xa2\x6d\x84\
-\x5f\xf2\x15\x7c\xcb\x1f\x2b\xf2\xe7\x94\x81\x3d\x16\x11\x83\x04\
-\x23\x15\xea\x41\x32\x59\xe2\x40\xc8\x14\x9e\x41\xa5\xf4\x2a\xb4\
-\x8a\xa0\x79\x15\x46\xae\x4f\x04\x09\x38\x8c\x36\x8f\x8a\x06\x84\
-\x09\x40\xc9\xbd\x17\x81\x2e\x1a\x2b\x19\x57\x5e\x33\xff\x7d\xe5\
-\x4e\x1c\xd2\xb0\xbf\x12\x7e\x2f\x69\x09\x82\xf3\x52\xb5\x12\x30\
-\xb3\x0b\x66\xe7\xf1\x8c\xb6\x46\x5d\x6d\xfb\x3f\xd8\x81\x10\x00\
-\x8c\x19\xfa\x43\x9c\xac\x4a\x15\x7e\x09\xe6\x8a\x02\x29\x85\xd5\
-\x54\xc0\x72\x2a\xb7\xd7\x1e\xed\x0c\xcb\x25\x0b\x15\xa4\xa7\x04\
-\x02\x44\x11\x7c\x34\xdf\x40\x10\xce\xb0\x22\x6c\x72\x09\x22\x39\
-\x1a\xa0\x9c\xde\x88\xdc\x7a\x02\x40\x40\x97\x83\xe8\x5e\xd0\x03\
-\xcf\xfb\xf1\xcc\xd5\xca\x86\xfb\xe6\xa9\xf0\x87\xdc\x06\x05\x61\
-\x14\x50\x29\x81\x33\x2a\x25\xd0\x9b\x99\xcd\x7f\x12\x5e\x4b\xe0\
-\xb7\xb3\x1b\xd6\xcd\xdf\x05\xdd\x80\x2c\x85\xf5\x8f\x42\xff\xc4\
-\x9e\xff\xd0\xd4\x07\x20\x9a\x10\x14\x98\xd5\x07\x01\xe1\x87\xb0\
-\xe0\x7b\xe1\x9c\x40\x2c\x2d\xdc\xbb\x3d\x54\xef\x8e\xa2\x42\x40\
-\x14\x60\xbd\x8a\x59\x68\x08\x16\x2d\x79\x91\x82\x21\x94\x80\x84\
-\x69\x33\x4f\xe1\x80\xcc\xaa\x4b\x4b\xa2\xcc\x20\xcc\xd5\xfc\xff\
-\x9e\xb5\x79\xb5\xb2\xe3\xe0\x2b\xc2\xef\xf2\xef\x1d\x9c\xab\x48\
-\xc4\x26\x10\x49\xe0\xc7\xe3\xbd\xeb\xf3\x9b\x83\xd7\xbc\xad\xc1\
-\x86\xa4\x97\x77\x19\x37\x20\x1b\x9a\xf5\x4f\xf1\xfb\x1b\xae\x30\
-\xb4\x15\xfe\x20\xc9\x27\xbb\x06\x94\x02\xe0\x35\xed\x88\x2a\x3c\
-\xfa\x1c\x1d\x07\x42\x85\xa2\x73\x8d\xb3\x45\x42\xe8\x00\x84\xee\
-\xba\x10\x51\xbe\x89\xab\xb5\x0d\x12\x08\xb9\x76\xa2\x94\x07\xac\
-\x77\x66\xa3\x12\x33\xca\x0e\xbb\xd4\xd3\x6d\xf3\x24\x8b\xdb\x90\
-\xce\x5d\xa2\x80\xbf\x79\xf3\x9a\x75\x51\x44\xa9\xdc\xc1\x47\xa3\
-\x54\xeb\x21\x26\x2e\xde\x9d\x92\x04\x84\x26\xf2\xa4\xa1\xc2\xaf\
-\xb5\xdf\x3f\x84\xf0\x7b\xc2\x08\x36\x64\xe6\x0d\xd6\x50\x61\x13\
-\xca\x41\x05\x9f\xc9\x97\xd0\x31\x08\xd9\xf1\x10\x03\x4d\x29\x8a\
-\x80\xfd\x06\xdc\x12\x4b\xdf\x3d\x0e\xad\x62\x4a\x00\x82\x5e\x5b\
-\xa3\xeb\xc7\x3f\x25\x83\x65\xca\x9d\x78\x6b\x46\x8e\x43\xb0\xd8\
-\x02\x52\x97\x9d\x3a\xff\x2b\x0f\xda\xcd\x4f\xd0\xf1\x63\xa7\xcd\
-\x02\xec\xba\x8e\xc1\x91\x6d\xbb\x90\x1b\x90\xa9\x48\x77\x2c\x48\
-\x98\x7b\x27\x9b\xa2\x44\xbf\x7f\x04\xe1\x0f\xe1\x32\x20\xc2\x1f\
-\xec\xe2\x82\x6e\x2a\x3f\xaf\x66\x73\x16\x13\xd4\x71\x6e\x48\x57\
-\x0e\xda\xd5\x30\x82\x8a\x0d\xa8\x00\x62\x85\x4e\xd0\x1c\x09\x00\
-\x68\xbc\x8e\x10\x19\x92\x22\x02\x80\xc0\xc0\x14\x60\xe1\xd3\x7a\
-\x0a\xf3\x6e\xff\xe7\x69\xbb\xed\xa9\xec\xcc\xfb\xfc\x8a\xf3\x0f\
-\x46\x87\x0c\x85\x04\x77\xd2\x37\x35\xd5\x6b\xbb\xaf\x80\x83\x42\
-\x7f\x8b\xc3\x18\x69\x76\x8d\x46\xca\xec\x83\x1d\x5d\x01\x04\x70\
-\x7b\xa3\xf6\x87\x00\xf4\x4f\x16\x7e\x18\x41\xf8\x21\x28\xfc\x7e\
-\x88\x0f\x1c\xbf\xd2\x71\x0b\x5c\x56\x7f\x83\x75\x17\xa8\x86\xa8\
-\xbf\x39\x0e\x86\x6d\x54\xb7\x48\x04\x01\xac\x92\x08\x85\x17\xa3\
-\xa3\xcd\x68\x1d\x46\xd0\x02\xc5\xc3\x85\xc9\xd7\x33\x81\x0f\x80\
-\x21\xe1\xfa\x91\xcf\xdf\xe3\x31\x8a\xb5\xe3\x08\xf1\x15\xd1\x72\
-\x73\xe1\x1c\xa7\x26\xe1\x89\xae\xd0\x63\x23\x77\x97\xda\x7d\xb7\
-\x95\xf0\x0b\x44\xe5\x0e\x8f\x00\xa0\x0d\x4b\x92\x02\xfd\x23\xbf\
-\x2d\x24\xa9\xcd\x14\xe1\x57\xe2\x3c\x40\x8f\xf1\x03\xbf\xfc\x97\
-\xb7\x79\x32\xe1\xbf\x1c\xef\xab\x1a\x4a\xa0\x9d\xac\xa3\xeb\xf1\
-\xe5\xc1\x8c\x75\x0a\x5c\xbd\xdb\x7f\x16\x29\x60\xd4\x6f\x90\x2f\
-\x56\xcc\x25\x68\x46\x59\x71\x25\x20\x65\x19\xda\x4a\x3f\xe2\x06\
-\x81\x9b\x7a\x28\x45\x05\x9c\x1c\x83\xe2\xfe\xa3\x7e\x7b\xd9\x33\
-\x55\x24\xb0\x1e\xec\xce\xc6\xc7\xb5\x67\xe2\x31\xcf\x73\x06\x80\
-\x48\x42\x0d\xe0\xc1\x82\xf9\x45\xdc\x10\x77\xe1\x30\x78\x3e\x5e\
-\xb5\xe5\x30\x0a\x63\x87\xe3\x00\x5a\xfa\x7e\xaa\x29\x17\x20\x00\
-\xef\xc2\xd0\x3f\x51\xf8\x03\x06\x4e\x24\xf6\xe8\xa8\x6c\xe6\xef\
-\x99\x41\x19\x83\xe5\x79\xab\x5e\xdc\x48\x90\x84\x71\x03\x94\x6d\
-\xab\xe5\xb9\x02\x84\x3f\x30\x64\x14\xda\xf7\x12\x09\x4c\x3e\x02\
-\xaa\x46\x2a\x7c\x3e\xbc\x1b\xa1\x84\x70\xc9\x74\x83\x12\xc0\xc8\
-\xe2\xe5\x29\xc6\xb1\x91\xed\xa1\xdf\x78\xef\xbd\x27\xfe\xe4\x8f\
-\x9f\x5e\xb9\x01\x55\x7e\xe1\xef\x3e\xf3\x16\x17\xec\x01\x34\xab\
-\x7e\x39\x2c\x7a\x40\xb1\x1f\x61\x5c\x37\xb2\x46\xa4\x71\xdb\xf4\
-\x7a\x6f\xd8\x94\xaf\x89\xf1\x37\xe9\x46\x69\x67\xe6\x00\x52\xfd\
-\x9a\x61\xac\x7f\x2b\xd2\x6f\x38\xcb\xaf\x20\x02\x3b\x40\xd0\xf8\
-\x24\xc3\xcd\x0a\x7f\x39\x44\x42\x5d\x8d\x0a\xfd\xbe\xf0\x10\x48\
-\x07\x26\xf3\xe5\x1c\x21\x75\x50\x06\x1a\x24\xe1\x19\x7e\x68\xee\
-\x4e\x0e\x2c\x17\xdf\x0e\xae\x50\xc1\x39\x72\xd2\xd0\x0b\x9e\x84\
-\x43\x7f\x1f\x29\x41\x87\x9f\x84\x90\x47\xe5\xa1\x80\x89\x4c\xad\
-\x7c\xf7\x1b\xef\xff\x0f\x6a\x50\x5f\x32\xa1\x22\x13\xe3\xdd\x04\
-\x2c\x68\xaa\xa9\xf8\x40\xb1\x4f\xab\x64\xc5\x21\x46\x03\x9c\xcb\
-\x1f\x9d\xc9\xd0\xa4\x0e\x24\x37\x00\x76\x0a\x05\x20\x5f\x85\x91\
-\xac\x7f\x32\xe9\xd7\x42\xf8\xa9\x95\x05\x56\x18\xe3\xdc\x45\xd1\
-\x2a\x18\xcb\x8c\x56\x29\x54\xd9\x26\x3d\xbc\x90\x5b\x4a\x3e\x40\
-\x92\x0b\x5e\x68\x24\x95\x72\xdc\x00\x3b\xae\xdb\xa2\x0b\x72\x2c\
-\x4f\xf0\x8b\x11\x84\x21\x62\x30\x44\x8e\x46\xe0\x12\x55\x70\x22\
-\x2c\x66\xaf\x39\xc7\x06\x04\x66\xbf\x7d\x26\xff\xfa\xbf\xde\xbf\
-\xef\xef\xd6\x4a\x20\xe3\x10\x1f\xda\x1a\x17\x05\xcf\x2c\x9e\x3a\
-\x2a\x06\xc5\x1d\x64\x43\xa3\x01\x01\x9e\x70\x18\x04\xbf\x73\x96\
-\x01\x69\x05\x90\xd2\x88\xb3\xc9\xfa\x27\x15\xf9\xc4\xfc\xd3\x98\
-\x66\x0f\x30\xfd\x2c\x88\xae\x95\x82\xd4\x2d\xc7\x90\x77\x26\xb2\
-\xcf\x2d\xb5\x52\xf7\xde\xd3\xbf\x00\xd9\x94\x18\x0f\x42\xd3\x5e\
-\x72\xbc\x2b\x30\xe5\x13\xbc\xe1\x92\xf5\xbf\x1a\x11\xd0\x70\xaa\
-\xa3\xa4\xb8\x4b\x20\xbd\x26\x21\x01\xc1\xe2\xd3\xbf\x97\x94\x14\
-\x85\xfd\x1c\x04\x78\x23\xb8\x00\x44\x41\x00\xf6\xa3\x14\x28\x60\
-\xb7\xc3\x9f\xbe\xdb\x89\x6f\x7f\xed\xde\xfb\x97\x4a\xa0\x70\x03\
-\x32\xd7\xbf\x0f\x31\x4e\xa2\x46\x29\xfb\x04\x7e\xb5\xb8\x9d\x48\
-\xe1\x89\xb8\x52\x26\x27\xcc\x07\xf7\xfa\x8a\x04\xdd\x6b\xba\xb3\
-\xfa\xfb\x61\x04\x30\x4c\x5e\x74\x2b\xe8\xaf\x9a\x5b\x0d\x25\x76\
-\x04\x0e\x76\x25\x56\x2a\x3e\x87\x50\xc5\xdb\x3d\xff\xf1\xf3\x6f\
-\xbc\xa5\x9f\xab\x6b\x14\xe9\xe4\x4b\x8f\x01\xb2\x2a\x80\x2d\x1c\
-\x3a\x57\x0a\x4c\x44\xc0\x9f\x38\xa3\x27\xd9\xe8\xd4\x63\x8e\x1a\
-\x14\x04\x90\xd1\xb0\x48\x20\x98\x34\x03\xc2\x00\x4a\x14\x85\x0b\
-\xe5\x39\x1e\x41\xa3\x30\x39\x09\x0f\x7e\xe9\x0b\xf7\xfc\xd6\xa7\
-\xff\x63\xbf\x87\x96\xae\x40\xc5\x05\x30\xc2\x10\xb2\xc6\x05\x56\
-\xa2\x88\x73\x8a\x7d\x9f\x54\xcb\xec\xaf\x17\x54\xe7\xfe\x64\xf6\
-\x52\xef\x50\x9a\xfe\x9d\x10\x25\xd8\xa5\x38\x80\x28\xf9\xd7\x3a\
-\x77\x32\x21\xe4\xd7\x28\xfc\x89\x2d\xc9\x3d\x22\x90\x89\x3e\x70\
-\x6b\x61\x4d\x03\x98\xc4\x01\x85\x8b\x0b\xf8\x75\x87\x84\x33\x3b\
-\x04\x77\x07\x1d\x30\x2b\x04\x10\xf0\xcf\xf9\x69\x81\x30\xa3\x7e\
-\x2c\x48\x00\x3c\x45\x44\xaf\x0f\x45\x27\x12\xa9\x26\xb1\xec\xa0\
-\x22\x29\xb8\xf5\x35\x9e\x5e\x06\xbf\xfd\xb4\x27\xae\xf8\xfe\x0f\
-\x4f\x3b\xf0\x85\x5a\x09\x40\xa8\x0b\xb3\xf2\x0a\x25\x5f\x5e\xfc\
-\xff\xd3\x62\x3f\xc4\x53\xe1\xc2\x80\x20\x6f\xac\x57\x7d\xbd\xca\
-\xf2\xe4\x33\xce\x9f\x59\xc3\xf5\x45\xd2\xd4\xe6\x5d\x88\x16\xcc\
-\x42\xdf\x38\xdc\xda\x1b\xe2\x44\x4c\x5b\xe8\x9f\x98\x7c\x2d\x25\
-\xa9\x84\x2d\x3f\x15\x0a\xf4\x17\x3f\x79\x4f\xb2\x20\xf0\xce\xd5\
-\xbd\x53\x8a\x27\xfb\x56\xf0\xc0\x58\x0b\x57\xb0\xe8\x7b\xd6\x24\
-\x1f\xfa\xfe\x3d\x8d\x16\x78\xc2\xa9\xd8\x84\x1a\xb4\x6e\x82\x76\
-\x34\x34\x5a\x40\xa5\xc8\x7d\x14\xef\x13\x47\x83\xfd\xa3\x42\x4e\
-\x9e\xaf\xef\x53\x25\xa5\x94\x00\x85\xa5\xa4\x2a\xa7\x2f\xa7\x1c\
-\xf9\xcb\x32\xb5\xef\x03\xf6\x9e\xf8\xda\xe5\xe7\x1f\x7c\xfe\x25\
-\x67\x1d\xf4\xdc\x4b\x7e\x35\x37\x09\x10\x64\xec\x56\x14\xef\xf3\
-\xc2\xe2\xee\x2f\x8a\xfd\xf3\xc5\xe3\x95\xcd\xc2\x19\x4f\xea\xdf\
-\xb4\x39\xbf\x82\x7c\x83\x7c\xac\xee\xfc\x4e\x44\x04\x4e\xb6\x4a\
-\x5c\x19\xe6\xfb\x36\x77\x19\x6d\xf4\xfb\x9b\x84\x1f\x49\x17\x5b\
-\xea\xe7\x8b\x89\x35\x7c\x38\x65\x5d\x4d\x76\xe5\xc5\x0f\xc7\xdf\
-\x79\xd2\x75\x37\xfe\xea\xc2\x87\x9f\xb1\x6c\x99\x7a\x81\xe7\xc7\
-\xb3\x99\xf1\x9c\x25\x73\xe7\x65\x80\x43\xa6\x19\x7f\x5b\x77\xd0\
-\x41\xf9\x42\x21\xef\xba\xcb\x49\xce\xda\xfd\xf0\xa7\x06\xc9\x23\
-\x7c\x81\x7e\xc7\x1c\x85\x48\x86\x3d\xd8\x83\xfa\x28\x71\x19\xa5\
-\xa2\xcb\xa3\xe4\x18\xfd\xcc\xf2\xbb\x4e\x64\xf8\xf4\x15\xcb\xe1\
-\xe9\x4f\x7c\xec\xf2\x0d\xc5\x9f\x7e\xaf\x78\xfa\x9e\xe2\x90\xcb\
-\x8a\xd3\x99\xae\xa1\xfe\xfe\xc5\xe3\xc3\x8b\x43\x57\xf8\xef\xa1\
-\xc4\x41\x22\xa1\xa1\x9e\x46\x39\x17\xff\xd6\xdc\xd3\xbf\x84\x08\
-\x7f\x6e\x94\x00\x81\xff\x1c\x59\x39\x17\x70\xe7\x6d\x02\xc4\x14\
-\x40\x4c\xa0\x23\xe4\x1f\x67\x78\x65\xdf\x7f\x18\xe8\x1f\x83\xfd\
-\x11\xe5\xe2\xc0\x5a\xdf\x9d\x41\x06\x77\x90\x2d\xf6\xfa\xfc\xf2\
-\x5b\x6f\x5f\xfc\xf7\x43\x1f\x3a\xfd\x82\xd2\x42\x3a\xa4\x61\xfd\
-\xae\x4e\x12\x8d\x7e\x4e\xbf\x97\x81\xe1\xc8\xf2\x16\xd8\x54\x5c\
-\x49\x7a\xd8\x30\x0d\xe0\xc2\x50\x3f\xa0\xf0\xdb\x6d\x53\x4d\xc6\
-\x73\x2b\x15\x9c\xc0\xe3\x8d\xea\x42\x37\x45\x5a\x09\x42\x56\xb5\
-\xf9\x77\xc6\xfd\x28\x27\x97\x81\xb6\x13\x97\x04\xa7\xbe\x14\xab\
-\x8a\xfd\x2f\xcc\x73\x99\x30\x6b\x2f\x28\x74\x7e\xbe\x2e\x36\x30\
-\xf5\x67\x5f\x30\xfb\x3d\xc5\x6a\x13\xbe\x77\xf2\x03\xd1\x6b\x21\
-\x16\x68\xf3\x8d\x3b\x51\xeb\xef\x34\x12\x10\x02\xec\x6e\x1a\x67\
-\x1b\xf0\xfd\x87\x84\x10\x10\x0d\x0b\xb4\x22\x13\x91\x11\x77\x48\
-\xfc\x44\xcf\x0a\x14\x0b\xe5\xf9\x2f\xbe\xe9\x57\x73\x73\xf9\x37\
-\x2c\x2c\xa7\xc7\xa1\x97\x50\x84\xc4\xb1\xf7\x27\xcc\x68\x88\x6e\
-\xdd\x83\x3c\x57\x7e\xf8\x90\x92\x81\x08\x61\x66\x9f\x72\x02\x4d\
-\x7c\x40\x43\x6e\x80\xf5\x41\xc0\xce\x0e\x60\xef\x85\xa8\xbc\xbc\
-\x06\x4f\xa9\xc0\x10\x1d\x73\x01\xa2\x3f\x67\x6c\x04\x97\x34\xc5\
-\x07\x89\x65\x2f\x1f\x6f\x9e\xc1\x5f\x7e\xf5\x8c\x2d\xb7\x12\x05\
-\xd0\x57\x4d\xd5\x89\x09\x3c\xc0\xce\xa8\x0c\xb2\xc6\x8b\xd0\x26\
-\x23\x2c\xc9\xf7\x4f\x80\xfe\x2a\x01\xfa\x4b\x64\xa5\x40\x64\xf1\
-\xd6\x57\xca\x8b\x0a\x58\xd6\xff\xca\x4b\x1e\x5e\x75\xa1\x39\xed\
-\xdb\x1b\xdf\xd2\xcf\xd5\x7a\x54\x3e\x79\x57\x1e\x9f\x7b\xa4\x1e\
-\x51\x14\x82\x80\xe7\x39\x7a\x33\xe8\x78\x1c\x9b\x2b\x81\x52\x51\
-\xe4\xd8\x40\x0c\x2a\x59\xc0\xc5\xc7\x5a\x09\xe5\xfc\xbd\xc2\x90\
-\x1a\x1d\x25\x87\xce\x67\x83\x92\xa7\xf9\x0a\xf4\xac\xdc\x16\xdd\
-\x0f\x2a\x89\x8b\x0a\x51\x26\x00\x11\x95\xd8\x04\xb6\xdc\x7e\x78\
-\xd1\xdc\xf1\xca\x0e\x21\x59\xac\x6f\xd1\xc9\xeb\x40\xd9\x85\xd8\
-\xd5\xb6\x2c\x5d\x1b\xb6\x24\xff\x5a\xe4\x13\x04\xeb\x06\x9a\x98\
-\xd9\x48\xa2\x12\x6f\xaa\x8b\x52\xe6\x1e\xb2\x8a\xc0\x1a\x05\x1c\
-\x73\xec\xea\xd5\x77\xdc\xb9\xf8\x36\xfa\x37\xa5\x40\xda\x05\x33\
-\x50\x02\x54\x40\x4b\x21\xaf\x04\x9d\x52\x04\x52\xaa\x6a\x29\xdc\
-\x48\xc3\x81\x32\xb1\xa7\x85\x34\xaf\x3f\xbb\xfa\x9b\xdc\xdf\x95\
-\xf7\xdc\xc0\x24\xa3\x3e\x5f\x2d\xf0\xf5\x6b\x22\xaa\x40\xf0\x94\
-\x07\x0f\x97\x85\xb2\x22\xd1\x97\xe2\x66\x81\x8f\x70\x08\x7e\xc3\
-\x16\xff\xf3\xf8\xf9\x53\x62\x76\xc3\xe6\xfc\xc7\x1f\xf8\xe4\xfa\
-\xcb\x88\xf0\x2f\xa6\x20\x80\xe1\x94\xc0\x8e\x4f\x04\x66\x0d\x5f\
-\x69\x64\x72\x10\x92\xaf\x50\xa4\xd7\x00\x24\xb6\x26\x13\xd6\x22\
-\x0a\x2b\xd1\x4f\xb1\x45\x1a\xbe\xab\x12\x03\x0f\x7f\xfe\x8d\x5f\
-\xdb\xb0\xa1\xff\x25\x54\x72\x28\x4d\x3f\x97\x4b\xca\x21\xaf\x51\
-\x02\xb3\xb8\x54\xd3\x54\x42\x97\xb3\xe4\x15\x76\x1f\xbc\x64\x02\
-\x6d\x89\x49\x64\xc0\x79\x0e\x89\x9b\x42\x94\x0a\x92\xa8\x02\x7b\
-\x5e\xef\x39\xb2\xe8\x01\x53\x96\xbc\x6e\xc1\x70\x88\x4a\xce\xad\
-\xb0\x23\x38\x41\x14\x30\x94\xac\x7d\x60\x89\xd0\xb9\x8a\x54\x11\
-\x71\xe1\x2f\x2f\xfb\x37\xcf\xd9\x72\x9c\xfe\x0d\xa9\x02\x38\xf7\
-\xe4\xfd\x11\x55\x20\x3f\x83\x69\x1f\xe3\x4a\x25\x2c\xf4\x1d\x1d\
-\x3c\x64\xaa\xa5\xc0\x43\x92\xb5\x87\x96\xd6\x3f\x52\x92\x1a\x29\
-\x19\x15\xe3\xd1\x94\xd4\x51\xee\xc2\xd1\x7c\x40\x2c\x67\xfe\x8a\
-\x4b\x0e\xd3\xcc\xf1\xe2\x6b\xff\xe9\xce\xb7\xcd\xcc\xe4\x3f\xe5\
-\x21\x32\x07\x82\x2b\xb7\x90\xc7\x2a\x03\x8b\x08\x72\x02\xe1\x1d\
-\x65\xa1\xdf\x27\xb7\x1c\x82\x28\x74\x31\xa8\x1f\x7a\xae\xc9\x15\
-\x20\x7b\x2e\x58\x55\x4d\x14\x4a\x50\x99\x73\x10\x22\x79\xa8\xc2\
-\x73\x10\xc4\xde\x0b\xa2\x20\x46\x3e\xdf\xb8\x53\xf6\x2f\x6f\xb9\
-\xa3\xf7\xb9\x13\xbe\xba\xe9\x7a\x62\xfd\xe7\x09\x02\x10\x8d\x1c\
-\xb6\xb1\xdc\x3b\x61\x62\x40\x96\xe6\xdf\x43\xbb\xeb\x33\xea\x85\
-\x4a\x82\xfe\x01\x85\x22\x3c\x72\x86\x5c\x00\x49\xe9\x0d\xc4\xe5\
-\xaf\xbc\xf4\xb0\x4a\x01\x5c\xf6\x8b\x99\x8d\xef\xf9\xd7\xbb\x5f\
-\x36\x3b\x9b\xff\x82\x5a\x78\x0f\x8a\xd7\x16\x34\x47\x9b\x20\xa4\
-\x05\x7d\xe0\xff\xd7\x16\xd6\x0e\xce\x24\x8a\x80\x28\x8e\xbc\x86\
-\xfb\x39\x85\xfd\x96\x0f\xc8\x73\xc6\x07\xd0\x74\xdf\x10\x21\xc8\
-\x85\x1d\xed\xfb\xa3\x70\x1e\xbe\xbb\x53\x7f\x17\x12\xcc\xe0\x49\
-\x4b\x8a\x90\xa1\x54\x28\xfd\x10\x9d\x2f\xe8\x1e\x8f\x40\x88\x4c\
-\xa0\x16\x5f\xf9\xc2\x4f\xdf\xf7\x9e\x0d\xf9\x79\x7f\xfd\x4f\x6b\
-\x3e\xad\xdc\xce\xc4\xf3\x35\x12\x40\x89\x4b\x69\x22\x19\x9b\xdc\
-\x95\x9d\x41\x27\x64\xa3\xc8\x25\x40\x12\xd9\x9b\x76\xa9\x22\xd6\
-\x3f\xa9\x53\x93\x57\x2c\xe2\x0b\xbf\x58\x12\x0b\xe0\x66\xdb\x55\
-\x96\x7b\x20\xa7\xc5\xbe\x70\xc6\x59\x1b\xd7\xbd\xfd\x9f\xef\x3a\
-\x72\xd3\xe6\xfc\x27\x94\x08\xf4\x8a\x7a\x08\xec\x1e\x08\x0c\x78\
-\x42\x96\xd7\xa8\x40\xfb\xfd\x9a\x37\xc8\x43\x16\x0e\xfd\xc8\x80\
-\x51\x06\x7c\x57\x81\xe7\x73\x57\xe0\x63\x88\xc1\x39\x4e\x24\x40\
-\x39\x31\x49\xdd\x08\x5f\x99\x2a\xe5\xc2\x75\x50\xbe\xef\xee\x94\
-\x58\xab\x70\xe6\xa4\x7b\x4e\xe8\xd4\x65\xcf\xcc\xe2\x75\xaf\x7f\
-\xdf\xba\xf7\xd6\xbf\x59\xaf\x16\xfc\x52\x01\x54\x9d\x89\xcf\x29\
-\xe1\x3f\xfa\x46\x2e\x16\xbd\x40\xdc\xa9\x0d\xbf\x10\x06\x54\x0d\
-\xa9\xbf\xc9\x64\xdf\x90\xf0\x3f\x95\x26\x60\xed\xb1\x50\x8c\x0f\
-\xfb\x39\xf4\x62\x88\x4e\x09\xbe\x79\x2d\xe0\x57\x5c\x7a\x98\x66\
-\x91\xe7\xcf\x39\x6f\xd3\xda\xa3\x5e\x7e\xcb\xcb\xd6\xac\xe9\x9d\
-\x6a\x05\x4a\x0b\xb0\x2b\x70\x96\x24\xc4\x81\x12\x40\xe6\x1a\x28\
-\x6b\xed\xa9\x90\xe5\x5a\x41\x94\xbb\x42\xef\x3e\xd2\xd7\x2b\x14\
-\x62\x95\x87\x21\x20\xcd\x73\x44\xb9\x48\x8f\x39\xd2\x20\x11\x07\
-\xc7\x0d\x30\x9c\x81\x45\x33\x54\x3a\x1d\xa1\x54\x42\xad\x05\x46\
-\x60\x7c\xa5\xd7\xc0\x25\x4c\x85\x63\x94\x47\xe0\xba\x96\xbf\x14\
-\xfe\x63\x3f\xb9\xfe\xf5\x05\xfc\x9f\xd3\xbf\x97\x1a\xcc\x24\x98\
-\xab\x91\x80\xd3\xf7\x43\xf3\x2e\x10\xe0\x26\x46\x45\xaa\x3b\x2e\
-\x02\x18\xf1\xcb\x40\x1b\xf3\xbc\x54\xd6\x1f\xe4\x48\x80\xd8\x0a\
-\x9c\xe4\xe7\x3a\x06\x85\x2c\xf6\x2b\x6a\x57\xa0\x5c\x4c\xd7\x5e\
-\x3f\xbf\xfe\x0f\x9e\x75\xc3\x5b\x7f\x79\xf9\xec\x5b\x7b\x7d\xb5\
-\xd9\x71\x09\xa8\x05\x25\xe4\x9f\x26\xdd\x3c\xeb\xac\x18\x89\xc8\
-\x14\x88\x4a\xa9\xf5\x57\x69\xfe\xbe\x18\xde\x73\xa0\x3a\x25\x02\
-\x99\x92\x71\xdc\x1e\xb7\x80\x49\x2b\x36\x95\xc0\x43\x28\x1e\xb6\
-\x54\xe1\x92\x6a\xcf\x6d\x11\x53\xb1\x07\xd7\x6a\xfd\xc6\xfc\xc7\
-\xaf\x7d\xef\xda\x57\x9d\xf7\xd3\xd9\x75\x44\xf8\xf5\x44\xa2\x05\
-\x4d\xfe\x89\x51\x85\x16\x11\x00\xdc\x89\xb5\x40\x36\xec\xf7\x69\
-\x07\xff\x13\x5f\x87\xa6\xb8\x60\xda\xf5\xd7\x29\xb5\x1c\x60\x98\
-\xb4\x58\x9e\xd7\xce\xeb\x05\xa8\xc5\x73\x67\xdd\x6d\x3e\xf2\x65\
-\xb7\x7c\xed\xdf\x8e\x5d\xfd\xec\xb5\xeb\x7a\xa7\x5b\x88\x8d\x26\
-\xd6\x6f\x60\xb4\x72\xfd\xfa\xc1\x63\x72\x9c\xe7\x6b\xdb\x10\x21\
-\xf5\xf9\x1d\xff\x5f\xf3\x01\x39\xe3\x0c\x10\x64\xab\x9e\xfb\xef\
-\x11\x74\x21\xb8\xe0\xb2\xd0\x22\x12\xc5\xe6\xb8\x09\x9e\x5b\x00\
-\x8d\x6e\x04\xb5\xfa\x5c\x81\xe5\xc8\x05\xdf\x57\xd0\xfd\x42\x01\
-\x5f\x75\xfd\xc2\x07\x9f\xfb\x77\x77\xbd\xe9\xba\x1b\x17\xb7\x08\
-\xc2\x5f\xf9\xfe\xe7\xd6\xd0\x5f\xe2\x21\x50\x61\x70\xd2\x53\xe3\
-\x04\x28\xa6\x19\x76\xe4\x50\x60\x96\x64\xdb\x47\x4a\xfc\x6f\x30\
-\xdd\x09\x2d\x08\x9b\x50\x46\x68\xf4\x17\x0f\x4d\xf1\xee\x36\x9c\
-\x13\xf0\x5b\x70\x29\x75\xf9\x20\x39\x28\xa7\x4a\xe0\xcb\x5f\xbb\
-\xef\xe6\xa7\x3d\xf3\x86\x37\x7f\xed\x7f\xd6\xbf\xe4\xbe\xf5\xfd\
-\xf3\xad\xbf\x8d\x36\x0c\x98\x93\x05\x4d\x04\x95\xe6\x0c\xe4\x24\
-\x04\xe7\x42\xf4\x1a\xce\x0b\xcf\x3b\xc2\x8c\xbe\xa0\x53\x24\x12\
-\xdc\xab\x63\xc1\x51\x24\x34\x6f\x00\x05\x01\xa6\x8a\x8d\x66\x35\
-\x72\x25\x96\xe7\x3e\x1a\xc8\xb9\xc5\xe7\xdc\x83\x23\xe0\xe8\x24\
-\x4f\x39\xc4\x67\xae\x16\xef\x58\xdd\x3f\xf5\xad\xff\xef\x9e\x23\
-\x5e\x7d\xf4\xda\x53\x89\xcf\x5f\xc2\x7d\x3d\x88\xb4\x82\xfe\xe7\
-\x7e\xf1\x81\x39\x0d\x35\x7a\x61\x3f\x04\x37\x71\xcc\x13\xe6\xd4\
-\x98\xf7\x8e\x1d\x08\x9c\x5c\x72\x77\x67\xdc\x1a\x31\xa1\x99\x88\
-\x2e\x59\xd5\x0d\x28\x4c\xb1\x10\x0e\xea\xd1\x91\x17\xcb\xe8\xc8\
-\x34\xf5\x49\x99\x12\x78\xf4\x13\xaf\xd3\x23\xaf\x4d\xff\xfb\xf7\
-\x1e\x73\xf7\x25\xc5\x7e\xc5\x5f\xbe\x78\xaf\x03\x5e\xf2\x17\x7b\
-\x1d\x7e\xe0\x81\x53\x4f\x5f\xb5\xe7\xc4\x53\xb2\x4c\x65\xb6\x1e\
-\x40\x37\x24\xd1\x05\x4a\x6e\xba\xa2\xe9\x3d\xe0\xc4\xa4\x90\x3d\
-\xc7\xc2\x63\x2a\xd0\xf2\x06\x59\x61\x0f\xed\xec\x21\x84\xea\x94\
-\x94\xda\x1b\xc8\x81\x77\x2a\x17\xe9\xb9\x6a\x2e\x25\x47\xe7\xa3\
-\x68\x64\xc0\x75\xe8\x07\x6e\x06\x7d\xac\xbf\x8f\xdc\xc6\xac\xb8\
-\xe8\x0b\x78\xe7\x5d\x6b\xfb\xe7\x7c\xeb\xec\x2d\xdf\xfa\xca\xb7\
-\x37\xdd\xa6\x6c\x96\x9f\x9e\x44\xa4\x2d\xbf\x26\xfe\x72\x25\x19\
-\x00\xae\xf0\x73\x29\xb4\x1c\x7f\xec\xd7\x2b\x80\xdc\x5c\x74\x47\
-\x51\x00\x20\x11\x80\xc9\x61\x80\x21\xe8\xf9\x44\xf2\xaf\x15\xac\
-\x02\xb7\xcb\x4d\xc8\xe7\x30\x85\x3f\x19\xc9\x04\x04\x5a\x17\x42\
-\x0a\x7e\xd8\x87\x5f\x3e\xc8\x0f\x28\x14\xc1\xb5\x8b\xca\xe6\x98\
-\x57\xc9\x26\x5f\xfd\xfa\xfa\x9b\x8b\xfd\xa4\xe2\xfe\x97\x9e\xfc\
-\xc4\xdd\xf6\xfc\xfb\x57\xdc\xff\xa9\x87\x3e\x74\xfa\x29\xbb\xef\
-\x96\x1d\x30\x35\x05\x7b\xee\xbe\x7b\xf6\x08\xb3\xd8\x69\x6b\x32\
-\xf0\xfd\x60\xe7\x0b\x09\x0b\x50\xaa\x97\x41\x41\xc8\xb8\xf3\xca\
-\xbb\xe5\xe4\x39\x57\x2a\xf4\x31\x0a\x0a\x01\x9d\xd0\x1d\x57\x22\
-\x7e\xc7\x64\x57\xf7\x28\x92\x6c\xe5\x84\x14\xc9\xb1\xe5\xdd\xb9\
-\x39\xbc\xa1\x5f\x58\xfa\x8d\x9b\xfb\xd7\x6d\xd9\x92\xdf\x71\xf6\
-\x0f\x67\xce\x3b\xf9\x1b\x9b\x6e\x21\x67\xa3\xad\xfe\x22\x61\xfb\
-\x67\x95\x8d\xf9\xe7\xdf\x3b\xe5\x81\x38\x40\x36\x2e\x95\x8f\x79\
-\x40\xa8\x71\x74\x9b\xb4\xa3\xaa\x80\xc9\x61\xcc\x37\x34\x0d\x06\
-\x1e\x65\xc2\x0a\x44\x46\x3a\x43\x5b\xa5\x80\x66\x32\x0d\xbd\xcf\
-\x7f\xfb\x8c\x2c\x48\xa7\xc2\x0f\x5c\x08\x59\x3e\x2c\x14\x41\x5e\
-\x28\x01\x54\x6e\xae\x79\x69\x75\xca\xe9\x38\xd3\x17\x5d\x32\x33\
-\x5f\xec\x67\x16\xf7\xbf\x5b\xbf\xb5\xd0\x3f\xb8\xdb\x12\x36\x9e\
-\x1f\x99\x33\xab\xaf\x85\x5f\x0b\x7e\x15\xef\x2f\xa0\xbf\xf5\xfb\
-\x6b\x0d\xeb\x45\x16\xb4\x32\x00\xe5\x24\x08\x23\xee\x04\x12\xbd\
-\xeb\x05\x32\xb6\xe9\xb5\x2b\xf7\x89\x5a\x91\x96\x7b\x59\xe3\x3e\
-\x45\xf6\x89\x7a\xcf\x3a\x25\x30\x94\x02\xa0\xf5\xfc\x3d\xe5\x0e\
-\x1f\xd5\xbb\xae\xf6\xc3\xee\x92\xf9\xdb\x23\xff\xf0\xad\xe3\xe1\
-\x00\xba\x2d\xb8\x40\x39\x12\xa0\x0a\x41\xef\x5a\x09\x64\x9d\x02\
-\x68\x2d\xfc\x7d\x62\xf9\x7b\xc4\xda\xf7\x15\x6d\xf4\xd1\x6d\x1d\
-\x02\xd8\x4e\xae\x67\x46\x90\x41\xd6\x21\x80\x91\x95\x2b\xed\xe8\
-\xc3\x85\xbe\xb3\xfa\x9d\x02\xd8\xee\x5d\x04\x2e\xf8\xdd\x35\x6f\
-\xef\xff\x07\xdb\x7a\x77\x5b\xb7\x75\x5b\xb7\x75\x5b\xb7\x75\x5b\
-\xb7\x75\x5b\x6b\x98\xca\x8b\x69\x00\x3a\x84\xda\x6d\xdd\xb6\xab\
-\x6c\x59\x77\x09\xba\xad\xdb\x3a\x04\xd0\x6d\xdd\xd6\x6d\x1d\x02\
-\xe8\xb6\x6e\xeb\xb6\x4e\x01\x74\x5b\xb7\x75\xdb\x2e\xb1\xfd\x7f\
-\x01\x06\x00\x25\x55\x46\xec\x38\xcf\x47\x91\x00\x00\x00\x00\x49\
-\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x19\x7a\
-\x3c\
-\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
-\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x55\x54\x46\
-\x2d\x38\x22\x20\x73\x74\x61\x6e\x64\x61\x6c\x6f\x6e\x65\x3d\x22\
-\x6e\x6f\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x43\x72\x65\x61\x74\
-\x65\x64\x20\x77\x69\x74\x68\x20\x53\x6f\x64\x69\x70\x6f\x64\x69\
-\x20\x28\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x73\x6f\
-\x64\x69\x70\x6f\x64\x69\x2e\x63\x6f\x6d\x2f\x22\x29\x20\x2d\x2d\
-\x3e\x0a\x3c\x73\x76\x67\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\
-\x64\x63\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x70\x75\x72\x6c\x2e\
-\x6f\x72\x67\x2f\x64\x63\x2f\x65\x6c\x65\x6d\x65\x6e\x74\x73\x2f\
-\x31\x2e\x31\x2f\x22\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x63\
-\x63\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x63\x72\x65\x61\x74\x69\
-\x76\x65\x63\x6f\x6d\x6d\x6f\x6e\x73\x2e\x6f\x72\x67\x2f\x6e\x73\
-\x23\x22\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\
-\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\
-\x72\x67\x2f\x31\x39\x39\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\
-\x66\x2d\x73\x79\x6e\x74\x61\x78\x2d\x6e\x73\x23\x22\x0a\x20\x20\
-\x20\x78\x6d\x6c\x6e\x73\x3a\x73\x76\x67\x3d\x22\x68\x74\x74\x70\
-\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
-\x30\x30\x2f\x73\x76\x67\x22\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\
-\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\
-\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\x22\x0a\x20\x20\
-\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\x69\x6e\x6b\x3d\x22\x68\x74\
-\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\
-\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\x6b\x22\x0a\x20\x20\x20\x78\
-\x6d\x6c\x6e\x73\x3a\x73\x6f\x64\x69\x70\x6f\x64\x69\x3d\x22\x68\
-\x74\x74\x70\x3a\x2f\x2f\x73\x6f\x64\x69\x70\x6f\x64\x69\x2e\x73\
-\x6f\x75\x72\x63\x65\x66\x6f\x72\x67\x65\x2e\x6e\x65\x74\x2f\x44\
-\x54\x44\x2f\x73\x6f\x64\x69\x70\x6f\x64\x69\x2d\x30\x2e\x64\x74\
-\x64\x22\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x69\x6e\x6b\x73\
-\x63\x61\x70\x65\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\
-\x2e\x69\x6e\x6b\x73\x63\x61\x70\x65\x2e\x6f\x72\x67\x2f\x6e\x61\
-\x6d\x65\x73\x70\x61\x63\x65\x73\x2f\x69\x6e\x6b\x73\x63\x61\x70\
-\x65\x22\x0a\x20\x20\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
-\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x0a\x20\x20\x20\x77\x69\
-\x64\x74\x68\x3d\x22\x31\x32\x38\x70\x74\x22\x0a\x20\x20\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x31\x32\x38\x70\x74\x22\x0a\x20\x20\
-\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x35\x30\
-\x37\x2e\x39\x34\x36\x20\x35\x30\x37\x2e\x39\x34\x36\x22\x0a\x20\
-\x20\x20\x69\x64\x3d\x22\x73\x76\x67\x34\x39\x22\x0a\x20\x20\x20\
-\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x76\x65\x72\x73\x69\x6f\x6e\
-\x3d\x22\x30\x2e\x33\x32\x22\x0a\x20\x20\x20\x73\x6f\x64\x69\x70\
-\x6f\x64\x69\x3a\x64\x6f\x63\x6e\x61\x6d\x65\x3d\x22\x64\x65\x66\
-\x61\x75\x6c\x74\x5f\x76\x69\x65\x77\x6c\x69\x6d\x69\x74\x73\x2e\
-\x73\x76\x67\x22\x0a\x20\x20\x20\x73\x6f\x64\x69\x70\x6f\x64\x69\
-\x3a\x64\x6f\x63\x62\x61\x73\x65\x3d\x22\x2f\x6d\x6e\x74\x2f\x77\
-\x69\x6e\x64\x6f\x77\x73\x2f\x74\x68\x65\x6d\x65\x73\x2f\x57\x6f\
-\x72\x6b\x2f\x42\x6c\x75\x65\x2d\x53\x70\x68\x65\x72\x65\x2f\x22\
-\x0a\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x76\x65\x72\
-\x73\x69\x6f\x6e\x3d\x22\x30\x2e\x34\x36\x22\x0a\x20\x20\x20\x69\
-\x6e\x6b\x73\x63\x61\x70\x65\x3a\x6f\x75\x74\x70\x75\x74\x5f\x65\
-\x78\x74\x65\x6e\x73\x69\x6f\x6e\x3d\x22\x6f\x72\x67\x2e\x69\x6e\
-\x6b\x73\x63\x61\x70\x65\x2e\x6f\x75\x74\x70\x75\x74\x2e\x73\x76\
-\x67\x2e\x69\x6e\x6b\x73\x63\x61\x70\x65\x22\x3e\x3c\x6d\x65\x74\
-\x61\x64\x61\x74\x61\x0a\x20\x20\x20\x69\x64\x3d\x22\x6d\x65\x74\
-\x61\x64\x61\x74\x61\x32\x32\x22\x3e\x3c\x72\x64\x66\x3a\x52\x44\
-\x46\x3e\x3c\x63\x63\x3a\x57\x6f\x72\x6b\x0a\x20\x20\x20\x20\x20\
-\x20\x20\x72\x64\x66\x3a\x61\x62\x6f\x75\x74\x3d\x22\x22\x3e\x3c\
-\x64\x63\x3a\x66\x6f\x72\x6d\x61\x74\x3e\x69\x6d\x61\x67\x65\x2f\
-\x73\x76\x67\x2b\x78\x6d\x6c\x3c\x2f\x64\x63\x3a\x66\x6f\x72\x6d\
-\x61\x74\x3e\x3c\x64\x63\x3a\x74\x79\x70\x65\x0a\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x72\x64\x66\x3a\x72\x65\x73\x6f\x75\x72\x63\
-\x65\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x70\x75\x72\x6c\x2e\x6f\
-\x72\x67\x2f\x64\x63\x2f\x64\x63\x6d\x69\x74\x79\x70\x65\x2f\x53\
-\x74\x69\x6c\x6c\x49\x6d\x61\x67\x65\x22\x20\x2f\x3e\x3c\x2f\x63\
-\x63\x3a\x57\x6f\x72\x6b\x3e\x3c\x2f\x72\x64\x66\x3a\x52\x44\x46\
-\x3e\x3c\x2f\x6d\x65\x74\x61\x64\x61\x74\x61\x3e\x0a\x20\x20\x3c\
-\x64\x65\x66\x73\x0a\x20\x20\x20\x69\x64\x3d\x22\x64\x65\x66\x73\
-\x36\x32\x22\x3e\x3c\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x70\x65\
-\x72\x73\x70\x65\x63\x74\x69\x76\x65\x0a\x20\x20\x20\x73\x6f\x64\
-\x69\x70\x6f\x64\x69\x3a\x74\x79\x70\x65\x3d\x22\x69\x6e\x6b\x73\
-\x63\x61\x70\x65\x3a\x70\x65\x72\x73\x70\x33\x64\x22\x0a\x20\x20\
-\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x76\x70\x5f\x78\x3d\x22\
-\x30\x20\x3a\x20\x38\x30\x20\x3a\x20\x31\x22\x0a\x20\x20\x20\x69\
-\x6e\x6b\x73\x63\x61\x70\x65\x3a\x76\x70\x5f\x79\x3d\x22\x30\x20\
-\x3a\x20\x31\x30\x30\x30\x20\x3a\x20\x30\x22\x0a\x20\x20\x20\x69\
-\x6e\x6b\x73\x63\x61\x70\x65\x3a\x76\x70\x5f\x7a\x3d\x22\x31\x36\
-\x30\x20\x3a\x20\x38\x30\x20\x3a\x20\x31\x22\x0a\x20\x20\x20\x69\
-\x6e\x6b\x73\x63\x61\x70\x65\x3a\x70\x65\x72\x73\x70\x33\x64\x2d\
-\x6f\x72\x69\x67\x69\x6e\x3d\x22\x38\x30\x20\x3a\x20\x35\x33\x2e\
-\x33\x33\x33\x33\x33\x33\x20\x3a\x20\x31\x22\x0a\x20\x20\x20\x69\
-\x64\x3d\x22\x70\x65\x72\x73\x70\x65\x63\x74\x69\x76\x65\x32\x34\
-\x22\x20\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x72\x61\x64\x69\x61\x6c\
-\x47\x72\x61\x64\x69\x65\x6e\x74\x0a\x20\x20\x20\x69\x64\x3d\x22\
-\x72\x61\x64\x69\x61\x6c\x47\x72\x61\x64\x69\x65\x6e\x74\x39\x33\
-\x22\x0a\x20\x20\x20\x63\x78\x3d\x22\x32\x31\x38\x2e\x39\x34\x30\
-\x34\x22\x0a\x20\x20\x20\x63\x79\x3d\x22\x32\x31\x39\x2e\x37\x37\
-\x31\x35\x22\x0a\x20\x20\x20\x72\x3d\x22\x31\x35\x30\x2e\x37\x30\
-\x36\x33\x22\x0a\x20\x20\x20\x66\x78\x3d\x22\x32\x31\x38\x2e\x39\
-\x34\x30\x34\x22\x0a\x20\x20\x20\x66\x79\x3d\x22\x32\x31\x39\x2e\
-\x37\x37\x31\x35\x22\x0a\x20\x20\x20\x67\x72\x61\x64\x69\x65\x6e\
-\x74\x55\x6e\x69\x74\x73\x3d\x22\x75\x73\x65\x72\x53\x70\x61\x63\
-\x65\x4f\x6e\x55\x73\x65\x22\x0a\x20\x20\x20\x73\x74\x79\x6c\x65\
-\x3d\x22\x73\x74\x72\x6f\x6b\x65\x3a\x23\x30\x30\x30\x30\x30\x30\
-\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\
-\x30\x2e\x39\x38\x36\x30\x31\x34\x3b\x73\x74\x72\x6f\x6b\x65\x2d\
-\x77\x69\x64\x74\x68\x3a\x30\x2e\x39\x38\x31\x36\x31\x32\x3b\x22\
-\x3e\x0a\x20\x20\x20\x20\x20\x20\x3c\x73\x74\x6f\x70\x0a\x20\x20\
-\x20\x6f\x66\x66\x73\x65\x74\x3d\x22\x30\x2e\x30\x30\x30\x30\x30\
-\x30\x22\x0a\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\x73\x74\x6f\
-\x70\x2d\x63\x6f\x6c\x6f\x72\x3a\x23\x32\x35\x61\x36\x63\x61\x3b\
-\x73\x74\x6f\x70\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\x31\x3b\x22\
-\x0a\x20\x20\x20\x69\x64\x3d\x22\x73\x74\x6f\x70\x39\x34\x22\x20\
-\x2f\x3e\x0a\x20\x20\x20\x20\x20\x20\x3c\x73\x74\x6f\x70\x0a\x20\
-\x20\x20\x6f\x66\x66\x73\x65\x74\x3d\x22\x31\x2e\x30\x30\x30\x30\
-\x30\x30\x22\x0a\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\x73\x74\
-\x6f\x70\x2d\x63\x6f\x6c\x6f\x72\x3a\x23\x32\x65\x61\x36\x62\x39\
-\x3b\x73\x74\x6f\x70\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\x30\x2e\
-\x38\x34\x33\x31\x33\x37\x3b\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\
-\x73\x74\x6f\x70\x39\x35\x22\x20\x2f\x3e\x0a\x20\x20\x20\x20\x3c\
-\x2f\x72\x61\x64\x69\x61\x6c\x47\x72\x61\x64\x69\x65\x6e\x74\x3e\
-\x0a\x20\x20\x20\x20\x3c\x72\x61\x64\x69\x61\x6c\x47\x72\x61\x64\
-\x69\x65\x6e\x74\x0a\x20\x20\x20\x69\x64\x3d\x22\x61\x69\x67\x72\
-\x64\x31\x22\x0a\x20\x20\x20\x63\x78\x3d\x22\x32\x31\x38\x2e\x39\
-\x34\x30\x34\x22\x0a\x20\x20\x20\x63\x79\x3d\x22\x32\x31\x39\x2e\
-\x37\x37\x31\x35\x22\x0a\x20\x20\x20\x72\x3d\x22\x31\x35\x30\x2e\
-\x37\x30\x36\x33\x22\x0a\x20\x20\x20\x66\x78\x3d\x22\x32\x31\x38\
-\x2e\x39\x34\x30\x34\x22\x0a\x20\x20\x20\x66\x79\x3d\x22\x32\x31\
-\x39\x2e\x37\x37\x31\x35\x22\x0a\x20\x20\x20\x67\x72\x61\x64\x69\
-\x65\x6e\x74\x55\x6e\x69\x74\x73\x3d\x22\x75\x73\x65\x72\x53\x70\
-\x61\x63\x65\x4f\x6e\x55\x73\x65\x22\x0a\x20\x20\x20\x73\x74\x79\
-\x6c\x65\x3d\x22\x73\x74\x72\x6f\x6b\x65\x3a\x23\x30\x30\x30\x30\
-\x30\x30\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6f\x70\x61\x63\x69\x74\
-\x79\x3a\x30\x2e\x39\x38\x36\x30\x31\x34\x3b\x73\x74\x72\x6f\x6b\
-\x65\x2d\x77\x69\x64\x74\x68\x3a\x30\x2e\x39\x38\x31\x36\x31\x32\
-\x3b\x22\x3e\x0a\x20\x20\x20\x20\x20\x20\x3c\x73\x74\x6f\x70\x0a\
-\x20\x20\x20\x6f\x66\x66\x73\x65\x74\x3d\x22\x30\x22\x0a\x20\x20\
-\x20\x73\x74\x79\x6c\x65\x3d\x22\x73\x74\x6f\x70\x2d\x63\x6f\x6c\
-\x6f\x72\x3a\x23\x37\x33\x66\x66\x66\x66\x3b\x73\x74\x72\x6f\x6b\
-\x65\x3a\x23\x30\x30\x30\x30\x30\x30\x3b\x73\x74\x72\x6f\x6b\x65\
-\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\x30\x2e\x39\x38\x36\x30\x31\
-\x34\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3a\x30\
-\x2e\x39\x38\x31\x36\x31\x32\x3b\x22\x0a\x20\x20\x20\x69\x64\x3d\
-\x22\x73\x74\x6f\x70\x35\x33\x22\x20\x2f\x3e\x0a\x20\x20\x20\x20\
-\x20\x20\x3c\x73\x74\x6f\x70\x0a\x20\x20\x20\x6f\x66\x66\x73\x65\
-\x74\x3d\x22\x30\x2e\x32\x38\x30\x39\x22\x0a\x20\x20\x20\x73\x74\
-\x79\x6c\x65\x3d\x22\x73\x74\x6f\x70\x2d\x63\x6f\x6c\x6f\x72\x3a\
-\x23\x32\x45\x41\x36\x42\x39\x3b\x73\x74\x72\x6f\x6b\x65\x3a\x23\
-\x30\x30\x30\x30\x30\x30\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6f\x70\
-\x61\x63\x69\x74\x79\x3a\x30\x2e\x39\x38\x36\x30\x31\x34\x3b\x73\
-\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3a\x30\x2e\x39\x38\
-\x31\x36\x31\x32\x3b\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x73\x74\
-\x6f\x70\x35\x34\x22\x20\x2f\x3e\x0a\x20\x20\x20\x20\x20\x20\x3c\
-\x73\x74\x6f\x70\x0a\x20\x20\x20\x6f\x66\x66\x73\x65\x74\x3d\x22\
-\x31\x22\x0a\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\x73\x74\x6f\
-\x70\x2d\x63\x6f\x6c\x6f\x72\x3a\x23\x30\x30\x36\x62\x38\x62\x3b\
-\x73\x74\x72\x6f\x6b\x65\x3a\x23\x30\x30\x30\x30\x30\x30\x3b\x73\
-\x74\x72\x6f\x6b\x65\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\x30\x2e\
-\x39\x38\x36\x30\x31\x34\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\
-\x64\x74\x68\x3a\x30\x2e\x39\x38\x31\x36\x31\x32\x3b\x22\x0a\x20\
-\x20\x20\x69\x64\x3d\x22\x73\x74\x6f\x70\x35\x35\x22\x20\x2f\x3e\
-\x0a\x20\x20\x20\x20\x3c\x2f\x72\x61\x64\x69\x61\x6c\x47\x72\x61\
-\x64\x69\x65\x6e\x74\x3e\x0a\x20\x20\x20\x20\x3c\x6c\x69\x6e\x65\
-\x61\x72\x47\x72\x61\x64\x69\x65\x6e\x74\x0a\x20\x20\x20\x78\x6c\
-\x69\x6e\x6b\x3a\x68\x72\x65\x66\x3d\x22\x23\x61\x69\x67\x72\x64\
-\x31\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x6c\x69\x6e\x65\x61\x72\
-\x47\x72\x61\x64\x69\x65\x6e\x74\x39\x31\x22\x0a\x20\x20\x20\x78\
-\x31\x3d\x22\x2d\x30\x2e\x32\x39\x35\x37\x32\x33\x22\x0a\x20\x20\
-\x20\x79\x31\x3d\x22\x2d\x30\x2e\x32\x36\x34\x35\x39\x31\x22\x0a\
-\x20\x20\x20\x78\x32\x3d\x22\x30\x2e\x36\x32\x32\x35\x37\x34\x22\
-\x0a\x20\x20\x20\x79\x32\x3d\x22\x30\x2e\x33\x36\x35\x37\x36\x32\
-\x22\x0a\x20\x20\x20\x67\x72\x61\x64\x69\x65\x6e\x74\x55\x6e\x69\
-\x74\x73\x3d\x22\x6f\x62\x6a\x65\x63\x74\x42\x6f\x75\x6e\x64\x69\
-\x6e\x67\x42\x6f\x78\x22\x0a\x20\x20\x20\x67\x72\x61\x64\x69\x65\
-\x6e\x74\x54\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\
-\x72\x69\x78\x28\x30\x2e\x39\x39\x36\x31\x31\x34\x2c\x30\x2c\x30\
-\x2c\x31\x2e\x30\x30\x33\x39\x2c\x30\x2e\x34\x39\x36\x31\x32\x34\
-\x2c\x30\x2e\x34\x39\x32\x31\x38\x36\x29\x22\x0a\x20\x20\x20\x73\
-\x70\x72\x65\x61\x64\x4d\x65\x74\x68\x6f\x64\x3d\x22\x70\x61\x64\
-\x22\x20\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x72\x61\x64\x69\x61\x6c\
-\x47\x72\x61\x64\x69\x65\x6e\x74\x0a\x20\x20\x20\x78\x6c\x69\x6e\
-\x6b\x3a\x68\x72\x65\x66\x3d\x22\x23\x61\x69\x67\x72\x64\x31\x22\
-\x0a\x20\x20\x20\x69\x64\x3d\x22\x72\x61\x64\x69\x61\x6c\x47\x72\
-\x61\x64\x69\x65\x6e\x74\x39\x32\x22\x0a\x20\x20\x20\x63\x78\x3d\
-\x22\x2d\x38\x2e\x30\x39\x33\x34\x34\x65\x2d\x30\x35\x22\x0a\x20\
-\x20\x20\x63\x79\x3d\x22\x2d\x37\x2e\x36\x38\x38\x36\x37\x65\x2d\
-\x30\x35\x22\x0a\x20\x20\x20\x66\x78\x3d\x22\x2d\x38\x2e\x30\x39\
-\x33\x34\x34\x65\x2d\x30\x35\x22\x0a\x20\x20\x20\x66\x79\x3d\x22\
-\x2d\x37\x2e\x36\x38\x38\x36\x37\x65\x2d\x30\x35\x22\x0a\x20\x20\
-\x20\x72\x3d\x22\x30\x2e\x37\x38\x39\x31\x32\x37\x22\x0a\x20\x20\
-\x20\x67\x72\x61\x64\x69\x65\x6e\x74\x55\x6e\x69\x74\x73\x3d\x22\
-\x6f\x62\x6a\x65\x63\x74\x42\x6f\x75\x6e\x64\x69\x6e\x67\x42\x6f\
-\x78\x22\x0a\x20\x20\x20\x67\x72\x61\x64\x69\x65\x6e\x74\x54\x72\
-\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\
-\x31\x2e\x30\x36\x37\x38\x34\x2c\x30\x2c\x30\x2c\x30\x2e\x39\x33\
-\x36\x34\x36\x39\x2c\x30\x2e\x33\x34\x32\x32\x31\x39\x2c\x30\x2e\
-\x33\x34\x34\x37\x31\x32\x29\x22\x0a\x20\x20\x20\x73\x70\x72\x65\
-\x61\x64\x4d\x65\x74\x68\x6f\x64\x3d\x22\x70\x61\x64\x22\x20\x2f\
-\x3e\x0a\x20\x20\x20\x20\x3c\x72\x61\x64\x69\x61\x6c\x47\x72\x61\
-\x64\x69\x65\x6e\x74\x0a\x20\x20\x20\x78\x6c\x69\x6e\x6b\x3a\x68\
-\x72\x65\x66\x3d\x22\x23\x61\x69\x67\x72\x64\x31\x22\x0a\x20\x20\
-\x20\x69\x64\x3d\x22\x72\x61\x64\x69\x61\x6c\x47\x72\x61\x64\x69\
-\x65\x6e\x74\x31\x35\x39\x34\x22\x0a\x20\x20\x20\x63\x78\x3d\x22\
-\x31\x2e\x33\x37\x31\x35\x37\x65\x2d\x32\x35\x22\x0a\x20\x20\x20\
-\x63\x79\x3d\x22\x34\x2e\x38\x32\x37\x38\x33\x65\x2d\x32\x36\x22\
-\x0a\x20\x20\x20\x66\x78\x3d\x22\x31\x2e\x33\x37\x31\x35\x37\x65\
-\x2d\x32\x35\x22\x0a\x20\x20\x20\x66\x79\x3d\x22\x34\x2e\x38\x32\
-\x37\x38\x33\x65\x2d\x32\x36\x22\x0a\x20\x20\x20\x72\x3d\x22\x30\
-\x2e\x37\x36\x36\x33\x35\x38\x22\x0a\x20\x20\x20\x67\x72\x61\x64\
-\x69\x65\x6e\x74\x55\x6e\x69\x74\x73\x3d\x22\x6f\x62\x6a\x65\x63\
-\x74\x42\x6f\x75\x6e\x64\x69\x6e\x67\x42\x6f\x78\x22\x0a\x20\x20\
-\x20\x67\x72\x61\x64\x69\x65\x6e\x74\x54\x72\x61\x6e\x73\x66\x6f\
-\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x39\x32\x30\
-\x36\x37\x39\x2c\x2d\x30\x2e\x30\x32\x38\x35\x38\x32\x34\x2c\x30\
-\x2e\x30\x33\x33\x36\x31\x36\x38\x2c\x31\x2e\x30\x38\x35\x31\x31\
-\x2c\x30\x2e\x33\x37\x33\x34\x33\x36\x2c\x30\x2e\x33\x38\x34\x38\
-\x35\x34\x29\x22\x0a\x20\x20\x20\x73\x70\x72\x65\x61\x64\x4d\x65\
-\x74\x68\x6f\x64\x3d\x22\x70\x61\x64\x22\x20\x2f\x3e\x0a\x20\x20\
-\x3c\x2f\x64\x65\x66\x73\x3e\x0a\x20\x20\x3c\x73\x6f\x64\x69\x70\
-\x6f\x64\x69\x3a\x6e\x61\x6d\x65\x64\x76\x69\x65\x77\x0a\x20\x20\
-\x20\x69\x64\x3d\x22\x62\x61\x73\x65\x22\x0a\x20\x20\x20\x73\x68\
-\x6f\x77\x67\x72\x69\x64\x3d\x22\x66\x61\x6c\x73\x65\x22\x0a\x20\
-\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x7a\x6f\x6f\x6d\x3d\
-\x22\x32\x2e\x36\x38\x37\x35\x22\x0a\x20\x20\x20\x69\x6e\x6b\x73\
-\x63\x61\x70\x65\x3a\x63\x78\x3d\x22\x38\x2e\x33\x37\x35\x30\x36\
-\x39\x39\x22\x0a\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\
-\x63\x79\x3d\x22\x31\x33\x39\x2e\x31\x33\x36\x31\x37\x22\x0a\x20\
-\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x77\x69\x6e\x64\x6f\
-\x77\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x30\x30\x22\x0a\x20\
-\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x77\x69\x6e\x64\x6f\
-\x77\x2d\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x31\x33\x37\x22\x0a\
-\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x77\x69\x6e\x64\
-\x6f\x77\x2d\x78\x3d\x22\x2d\x34\x22\x0a\x20\x20\x20\x69\x6e\x6b\
-\x73\x63\x61\x70\x65\x3a\x77\x69\x6e\x64\x6f\x77\x2d\x79\x3d\x22\
-\x2d\x34\x22\x0a\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\
-\x63\x75\x72\x72\x65\x6e\x74\x2d\x6c\x61\x79\x65\x72\x3d\x22\x73\
-\x76\x67\x34\x39\x22\x3e\x0a\x20\x20\x20\x20\x3c\x73\x6f\x64\x69\
-\x70\x6f\x64\x69\x3a\x67\x75\x69\x64\x65\x0a\x20\x20\x20\x6f\x72\
-\x69\x65\x6e\x74\x61\x74\x69\x6f\x6e\x3d\x22\x76\x65\x72\x74\x69\
-\x63\x61\x6c\x22\x0a\x20\x20\x20\x70\x6f\x73\x69\x74\x69\x6f\x6e\
-\x3d\x22\x37\x33\x2e\x36\x39\x30\x38\x34\x39\x22\x0a\x20\x20\x20\
-\x69\x64\x3d\x22\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x67\x75\x69\
-\x64\x65\x31\x32\x37\x22\x20\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x73\
-\x6f\x64\x69\x70\x6f\x64\x69\x3a\x67\x75\x69\x64\x65\x0a\x20\x20\
-\x20\x6f\x72\x69\x65\x6e\x74\x61\x74\x69\x6f\x6e\x3d\x22\x76\x65\
-\x72\x74\x69\x63\x61\x6c\x22\x0a\x20\x20\x20\x70\x6f\x73\x69\x74\
-\x69\x6f\x6e\x3d\x22\x31\x30\x31\x2e\x31\x34\x38\x32\x36\x32\x22\
-\x0a\x20\x20\x20\x69\x64\x3d\x22\x73\x6f\x64\x69\x70\x6f\x64\x69\
-\x3a\x67\x75\x69\x64\x65\x32\x32\x22\x20\x2f\x3e\x0a\x20\x20\x20\
-\x20\x3c\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x67\x75\x69\x64\x65\
-\x0a\x20\x20\x20\x6f\x72\x69\x65\x6e\x74\x61\x74\x69\x6f\x6e\x3d\
-\x22\x76\x65\x72\x74\x69\x63\x61\x6c\x22\x0a\x20\x20\x20\x70\x6f\
-\x73\x69\x74\x69\x6f\x6e\x3d\x22\x35\x37\x2e\x39\x34\x33\x32\x31\
-\x38\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x73\x6f\x64\x69\x70\x6f\
-\x64\x69\x3a\x67\x75\x69\x64\x65\x32\x33\x22\x20\x2f\x3e\x0a\x20\
-\x20\x20\x20\x3c\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x67\x75\x69\
-\x64\x65\x0a\x20\x20\x20\x6f\x72\x69\x65\x6e\x74\x61\x74\x69\x6f\
-\x6e\x3d\x22\x76\x65\x72\x74\x69\x63\x61\x6c\x22\x0a\x20\x20\x20\
-\x70\x6f\x73\x69\x74\x69\x6f\x6e\x3d\x22\x33\x30\x2e\x38\x38\x39\
-\x35\x38\x39\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x73\x6f\x64\x69\
-\x70\x6f\x64\x69\x3a\x67\x75\x69\x64\x65\x31\x35\x39\x33\x22\x20\
-\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x73\x6f\x64\x69\x70\x6f\x64\x69\
-\x3a\x67\x75\x69\x64\x65\x0a\x20\x20\x20\x6f\x72\x69\x65\x6e\x74\
-\x61\x74\x69\x6f\x6e\x3d\x22\x68\x6f\x72\x69\x7a\x6f\x6e\x74\x61\
-\x6c\x22\x0a\x20\x20\x20\x70\x6f\x73\x69\x74\x69\x6f\x6e\x3d\x22\
-\x36\x31\x2e\x39\x38\x31\x30\x37\x31\x22\x0a\x20\x20\x20\x69\x64\
-\x3d\x22\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x67\x75\x69\x64\x65\
-\x31\x36\x36\x32\x22\x20\x2f\x3e\x0a\x20\x20\x3c\x2f\x73\x6f\x64\
-\x69\x70\x6f\x64\x69\x3a\x6e\x61\x6d\x65\x64\x76\x69\x65\x77\x3e\
-\x0a\x20\x20\x0a\x20\x20\x0a\x3c\x74\x65\x78\x74\x0a\x20\x20\x20\
-\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\x22\x70\x72\x65\x73\x65\
-\x72\x76\x65\x22\x0a\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\x66\
-\x6f\x6e\x74\x2d\x73\x69\x7a\x65\x3a\x32\x34\x70\x78\x3b\x66\x6f\
-\x6e\x74\x2d\x73\x74\x79\x6c\x65\x3a\x6e\x6f\x72\x6d\x61\x6c\x3b\
-\x66\x6f\x6e\x74\x2d\x76\x61\x72\x69\x61\x6e\x74\x3a\x6e\x6f\x72\
-\x6d\x61\x6c\x3b\x66\x6f\x6e\x74\x2d\x77\x65\x69\x67\x68\x74\x3a\
-\x6e\x6f\x72\x6d\x61\x6c\x3b\x66\x6f\x6e\x74\x2d\x73\x74\x72\x65\
-\x74\x63\x68\x3a\x6e\x6f\x72\x6d\x61\x6c\x3b\x74\x65\x78\x74\x2d\
-\x61\x6c\x69\x67\x6e\x3a\x73\x74\x61\x72\x74\x3b\x6c\x69\x6e\x65\
-\x2d\x68\x65\x69\x67\x68\x74\x3a\x31\x30\x30\x25\x3b\x77\x72\x69\
-\x74\x69\x6e\x67\x2d\x6d\x6f\x64\x65\x3a\x6c\x72\x2d\x74\x62\x3b\
-\x74\x65\x78\x74\x2d\x61\x6e\x63\x68\x6f\x72\x3a\x73\x74\x61\x72\
-\x74\x3b\x66\x69\x6c\x6c\x3a\x23\x30\x30\x30\x30\x30\x30\x3b\x66\
-\x69\x6c\x6c\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\x31\x3b\x73\x74\
-\x72\x6f\x6b\x65\x3a\x6e\x6f\x6e\x65\x3b\x73\x74\x72\x6f\x6b\x65\
-\x2d\x77\x69\x64\x74\x68\x3a\x31\x70\x78\x3b\x73\x74\x72\x6f\x6b\
-\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3a\x62\x75\x74\x74\x3b\x73\
-\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x6a\x6f\x69\x6e\x3a\x6d\
-\x69\x74\x65\x72\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6f\x70\x61\x63\
-\x69\x74\x79\x3a\x31\x3b\x66\x6f\x6e\x74\x2d\x66\x61\x6d\x69\x6c\
-\x79\x3a\x42\x69\x74\x73\x74\x72\x65\x61\x6d\x20\x56\x65\x72\x61\
-\x20\x53\x61\x6e\x73\x3b\x2d\x69\x6e\x6b\x73\x63\x61\x70\x65\x2d\
-\x66\x6f\x6e\x74\x2d\x73\x70\x65\x63\x69\x66\x69\x63\x61\x74\x69\
-\x6f\x6e\x3a\x42\x69\x74\x73\x74\x72\x65\x61\x6d\x20\x56\x65\x72\
-\x61\x20\x53\x61\x6e\x73\x22\x0a\x20\x20\x20\x78\x3d\x22\x32\x30\
-\x30\x2e\x38\x31\x35\x38\x36\x22\x0a\x20\x20\x20\x79\x3d\x22\x32\
-\x35\x33\x2e\x39\x37\x33\x30\x31\x22\x0a\x20\x20\x20\x69\x64\x3d\
-\x22\x74\x65\x78\x74\x33\x31\x36\x39\x22\x0a\x20\x20\x20\x73\x6f\
-\x64\x69\x70\x6f\x64\x69\x3a\x6c\x69\x6e\x65\x73\x70\x61\x63\x69\
-\x6e\x67\x3d\x22\x31\x30\x30\x25\x22\x3e\x3c\x74\x73\x70\x61\x6e\
-\x0a\x20\x20\x20\x20\x20\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x72\
-\x6f\x6c\x65\x3d\x22\x6c\x69\x6e\x65\x22\x0a\x20\x20\x20\x20\x20\
-\x69\x64\x3d\x22\x74\x73\x70\x61\x6e\x33\x31\x37\x31\x22\x0a\x20\
-\x20\x20\x20\x20\x78\x3d\x22\x32\x30\x30\x2e\x38\x31\x35\x38\x36\
-\x22\x0a\x20\x20\x20\x20\x20\x79\x3d\x22\x32\x35\x33\x2e\x39\x37\
-\x33\x30\x31\x22\x20\x2f\x3e\x3c\x2f\x74\x65\x78\x74\x3e\x0a\x0a\
-\x0a\x0a\x0a\x0a\x0a\x3c\x74\x65\x78\x74\x0a\x20\x20\x20\x78\x6d\
-\x6c\x3a\x73\x70\x61\x63\x65\x3d\x22\x70\x72\x65\x73\x65\x72\x76\
-\x65\x22\x0a\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\x66\x6f\x6e\
-\x74\x2d\x73\x69\x7a\x65\x3a\x32\x30\x33\x2e\x31\x37\x38\x34\x30\
-\x35\x37\x36\x70\x78\x3b\x66\x6f\x6e\x74\x2d\x73\x74\x79\x6c\x65\
-\x3a\x6e\x6f\x72\x6d\x61\x6c\x3b\x66\x6f\x6e\x74\x2d\x76\x61\x72\
-\x69\x61\x6e\x74\x3a\x6e\x6f\x72\x6d\x61\x6c\x3b\x66\x6f\x6e\x74\
-\x2d\x77\x65\x69\x67\x68\x74\x3a\x6e\x6f\x72\x6d\x61\x6c\x3b\x66\
-\x6f\x6e\x74\x2d\x73\x74\x72\x65\x74\x63\x68\x3a\x6e\x6f\x72\x6d\
-\x61\x6c\x3b\x74\x65\x78\x74\x2d\x61\x6c\x69\x67\x6e\x3a\x73\x74\
-\x61\x72\x74\x3b\x6c\x69\x6e\x65\x2d\x68\x65\x69\x67\x68\x74\x3a\
-\x31\x30\x30\x25\x3b\x77\x72\x69\x74\x69\x6e\x67\x2d\x6d\x6f\x64\
-\x65\x3a\x6c\x72\x2d\x74\x62\x3b\x74\x65\x78\x74\x2d\x61\x6e\x63\
-\x68\x6f\x72\x3a\x73\x74\x61\x72\x74\x3b\x66\x69\x6c\x6c\x3a\x23\
-\x30\x30\x30\x30\x30\x30\x3b\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\
-\x69\x74\x79\x3a\x31\x3b\x73\x74\x72\x6f\x6b\x65\x3a\x6e\x6f\x6e\
-\x65\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3a\x31\
-\x70\x78\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\
-\x70\x3a\x62\x75\x74\x74\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
-\x6e\x65\x6a\x6f\x69\x6e\x3a\x6d\x69\x74\x65\x72\x3b\x73\x74\x72\
-\x6f\x6b\x65\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\x31\x3b\x66\x6f\
-\x6e\x74\x2d\x66\x61\x6d\x69\x6c\x79\x3a\x42\x69\x74\x73\x74\x72\
-\x65\x61\x6d\x20\x56\x65\x72\x61\x20\x53\x61\x6e\x73\x3b\x2d\x69\
-\x6e\x6b\x73\x63\x61\x70\x65\x2d\x66\x6f\x6e\x74\x2d\x73\x70\x65\
-\x63\x69\x66\x69\x63\x61\x74\x69\x6f\x6e\x3a\x42\x69\x74\x73\x74\
-\x72\x65\x61\x6d\x20\x56\x65\x72\x61\x20\x53\x61\x6e\x73\x22\x0a\
-\x20\x20\x20\x78\x3d\x22\x31\x35\x30\x2e\x38\x39\x35\x36\x38\x22\
-\x0a\x20\x20\x20\x79\x3d\x22\x32\x30\x39\x2e\x39\x37\x30\x36\x39\
-\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x74\x65\x78\x74\x32\x33\x39\
-\x39\x22\x0a\x20\x20\x20\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x6c\
-\x69\x6e\x65\x73\x70\x61\x63\x69\x6e\x67\x3d\x22\x31\x30\x30\x25\
-\x22\x3e\x3c\x74\x73\x70\x61\x6e\x0a\x20\x20\x20\x20\x20\x73\x6f\
-\x64\x69\x70\x6f\x64\x69\x3a\x72\x6f\x6c\x65\x3d\x22\x6c\x69\x6e\
-\x65\x22\x0a\x20\x20\x20\x20\x20\x69\x64\x3d\x22\x74\x73\x70\x61\
-\x6e\x32\x34\x30\x31\x22\x0a\x20\x20\x20\x20\x20\x78\x3d\x22\x31\
-\x35\x30\x2e\x38\x39\x35\x36\x38\x22\x0a\x20\x20\x20\x20\x20\x79\
-\x3d\x22\x32\x30\x39\x2e\x39\x37\x30\x36\x39\x22\x3e\x30\x2d\x3c\
-\x2f\x74\x73\x70\x61\x6e\x3e\x3c\x2f\x74\x65\x78\x74\x3e\x0a\x3c\
-\x74\x65\x78\x74\x0a\x20\x20\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\
-\x65\x3d\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x0a\x20\x20\x20\
-\x73\x74\x79\x6c\x65\x3d\x22\x66\x6f\x6e\x74\x2d\x73\x69\x7a\x65\
-\x3a\x34\x38\x70\x78\x3b\x66\x6f\x6e\x74\x2d\x73\x74\x79\x6c\x65\
-\x3a\x6e\x6f\x72\x6d\x61\x6c\x3b\x66\x6f\x6e\x74\x2d\x76\x61\x72\
-\x69\x61\x6e\x74\x3a\x6e\x6f\x72\x6d\x61\x6c\x3b\x66\x6f\x6e\x74\
-\x2d\x77\x65\x69\x67\x68\x74\x3a\x6e\x6f\x72\x6d\x61\x6c\x3b\x66\
-\x6f\x6e\x74\x2d\x73\x74\x72\x65\x74\x63\x68\x3a\x6e\x6f\x72\x6d\
-\x61\x6c\x3b\x74\x65\x78\x74\x2d\x61\x6c\x69\x67\x6e\x3a\x73\x74\
-\x61\x72\x74\x3b\x6c\x69\x6e\x65\x2d\x68\x65\x69\x67\x68\x74\x3a\
-\x31\x30\x30\x25\x3b\x77\x72\x69\x74\x69\x6e\x67\x2d\x6d\x6f\x64\
-\x65\x3a\x6c\x72\x2d\x74\x62\x3b\x74\x65\x78\x74\x2d\x61\x6e\x63\
-\x68\x6f\x72\x3a\x73\x74\x61\x72\x74\x3b\x66\x69\x6c\x6c\x3a\x23\
-\x30\x30\x30\x30\x30\x30\x3b\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\
-\x69\x74\x79\x3a\x31\x3b\x73\x74\x72\x6f\x6b\x65\x3a\x6e\x6f\x6e\
-\x65\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3a\x31\
-\x70\x78\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\
-\x70\x3a\x62\x75\x74\x74\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
-\x6e\x65\x6a\x6f\x69\x6e\x3a\x6d\x69\x74\x65\x72\x3b\x73\x74\x72\
-\x6f\x6b\x65\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\x31\x3b\x66\x6f\
-\x6e\x74\x2d\x66\x61\x6d\x69\x6c\x79\x3a\x43\x6f\x75\x72\x69\x65\
-\x72\x20\x4e\x65\x77\x3b\x2d\x69\x6e\x6b\x73\x63\x61\x70\x65\x2d\
-\x66\x6f\x6e\x74\x2d\x73\x70\x65\x63\x69\x66\x69\x63\x61\x74\x69\
-\x6f\x6e\x3a\x43\x6f\x75\x72\x69\x65\x72\x20\x4e\x65\x77\x22\x0a\
-\x20\x20\x20\x78\x3d\x22\x32\x31\x32\x2e\x36\x32\x38\x35\x36\x22\
-\x0a\x20\x20\x20\x79\x3d\x22\x32\x34\x36\x2e\x38\x38\x35\x33\x38\
-\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x74\x65\x78\x74\x32\x34\x30\
-\x33\x22\x0a\x20\x20\x20\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x6c\
-\x69\x6e\x65\x73\x70\x61\x63\x69\x6e\x67\x3d\x22\x31\x30\x30\x25\
-\x22\x3e\x3c\x74\x73\x70\x61\x6e\x0a\x20\x20\x20\x20\x20\x73\x6f\
-\x64\x69\x70\x6f\x64\x69\x3a\x72\x6f\x6c\x65\x3d\x22\x6c\x69\x6e\
-\x65\x22\x0a\x20\x20\x20\x20\x20\x69\x64\x3d\x22\x74\x73\x70\x61\
-\x6e\x32\x34\x30\x35\x22\x0a\x20\x20\x20\x20\x20\x78\x3d\x22\x32\
-\x31\x32\x2e\x36\x32\x38\x35\x36\x22\x0a\x20\x20\x20\x20\x20\x79\
-\x3d\x22\x32\x34\x36\x2e\x38\x38\x35\x33\x38\x22\x20\x2f\x3e\x3c\
-\x2f\x74\x65\x78\x74\x3e\x0a\x3c\x74\x65\x78\x74\x0a\x20\x20\x20\
-\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\x22\x70\x72\x65\x73\x65\
-\x72\x76\x65\x22\x0a\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\x66\
-\x6f\x6e\x74\x2d\x73\x69\x7a\x65\x3a\x32\x30\x33\x2e\x31\x37\x38\
-\x34\x30\x35\x37\x36\x70\x78\x3b\x66\x6f\x6e\x74\x2d\x73\x74\x79\
-\x6c\x65\x3a\x6e\x6f\x72\x6d\x61\x6c\x3b\x66\x6f\x6e\x74\x2d\x76\
-\x61\x72\x69\x61\x6e\x74\x3a\x6e\x6f\x72\x6d\x61\x6c\x3b\x66\x6f\
-\x6e\x74\x2d\x77\x65\x69\x67\x68\x74\x3a\x6e\x6f\x72\x6d\x61\x6c\
-\x3b\x66\x6f\x6e\x74\x2d\x73\x74\x72\x65\x74\x63\x68\x3a\x6e\x6f\
-\x72\x6d\x61\x6c\x3b\x74\x65\x78\x74\x2d\x61\x6c\x69\x67\x6e\x3a\
-\x73\x74\x61\x72\x74\x3b\x6c\x69\x6e\x65\x2d\x68\x65\x69\x67\x68\
-\x74\x3a\x31\x30\x30\x25\x3b\x77\x72\x69\x74\x69\x6e\x67\x2d\x6d\
-\x6f\x64\x65\x3a\x6c\x72\x2d\x74\x62\x3b\x74\x65\x78\x74\x2d\x61\
-\x6e\x63\x68\x6f\x72\x3a\x73\x74\x61\x72\x74\x3b\x66\x69\x6c\x6c\
-\x3a\x23\x30\x30\x30\x30\x30\x30\x3b\x66\x69\x6c\x6c\x2d\x6f\x70\
-\x61\x63\x69\x74\x79\x3a\x31\x3b\x73\x74\x72\x6f\x6b\x65\x3a\x6e\
-\x6f\x6e\x65\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\
-\x3a\x31\x70\x78\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\
-\x63\x61\x70\x3a\x62\x75\x74\x74\x3b\x73\x74\x72\x6f\x6b\x65\x2d\
-\x6c\x69\x6e\x65\x6a\x6f\x69\x6e\x3a\x6d\x69\x74\x65\x72\x3b\x73\
-\x74\x72\x6f\x6b\x65\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\x31\x3b\
-\x66\x6f\x6e\x74\x2d\x66\x61\x6d\x69\x6c\x79\x3a\x42\x69\x74\x73\
-\x74\x72\x65\x61\x6d\x20\x56\x65\x72\x61\x20\x53\x61\x6e\x73\x3b\
-\x2d\x69\x6e\x6b\x73\x63\x61\x70\x65\x2d\x66\x6f\x6e\x74\x2d\x73\
-\x70\x65\x63\x69\x66\x69\x63\x61\x74\x69\x6f\x6e\x3a\x42\x69\x74\
-\x73\x74\x72\x65\x61\x6d\x20\x56\x65\x72\x61\x20\x53\x61\x6e\x73\
-\x22\x0a\x20\x20\x20\x78\x3d\x22\x32\x35\x2e\x33\x34\x37\x36\x38\
-\x35\x22\x0a\x20\x20\x20\x79\x3d\x22\x34\x32\x37\x2e\x35\x39\x32\
-\x30\x31\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x74\x65\x78\x74\x32\
-\x34\x30\x37\x22\x0a\x20\x20\x20\x73\x6f\x64\x69\x70\x6f\x64\x69\
-\x3a\x6c\x69\x6e\x65\x73\x70\x61\x63\x69\x6e\x67\x3d\x22\x31\x30\
-\x30\x25\x22\x3e\x3c\x74\x73\x70\x61\x6e\x0a\x20\x20\x20\x20\x20\
-\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x72\x6f\x6c\x65\x3d\x22\x6c\
-\x69\x6e\x65\x22\x0a\x20\x20\x20\x20\x20\x69\x64\x3d\x22\x74\x73\
-\x70\x61\x6e\x32\x34\x30\x39\x22\x0a\x20\x20\x20\x20\x20\x78\x3d\
-\x22\x32\x35\x2e\x33\x34\x37\x36\x38\x35\x22\x0a\x20\x20\x20\x20\
-\x20\x79\x3d\x22\x34\x32\x37\x2e\x35\x39\x32\x30\x31\x22\x3e\x31\
-\x2e\x33\x35\x3c\x2f\x74\x73\x70\x61\x6e\x3e\x3c\x2f\x74\x65\x78\
-\x74\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\
-\x00\x00\x70\x78\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\x00\x00\x5c\x72\xa8\x66\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xaf\xc8\x37\x05\x8a\xe9\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x70\x0a\x49\x44\x41\x54\x78\xda\xec\
-\x7d\x09\xd8\x24\x55\x75\xf6\x3d\xf5\x2d\x33\x03\x03\x83\x28\x8b\
-\x82\x20\x06\x25\x6a\xa2\xc6\x3d\x1a\x63\x7e\x23\xd1\x68\xc4\x68\
-\x7c\x24\xc1\x98\x18\x35\xfa\x47\xe3\x12\x57\x34\x2e\x31\xe4\x8f\
-\x44\x4d\x8c\x8a\xb8\xa0\x28\x88\x1b\x51\xa2\x02\x22\x20\xa8\xb8\
-\xb1\xba\xb0\xc8\x2a\xfb\x36\x0b\x30\xeb\xb7\x76\xd7\xf9\xab\xaa\
-\xeb\xde\x7b\xee\xb9\xe7\xde\xba\xd5\xdd\xdf\xac\x55\xf3\xd4\xf4\
-\x56\x5f\x77\x75\xf5\x3d\xe7\xbc\xe7\x3d\x1b\x20\xa2\xea\xb6\x6e\
-\xeb\xb6\x5d\x73\xcb\xba\x4b\xd0\x6d\xdd\xd6\x29\x80\x6e\xeb\xb6\
-\x6e\xeb\x14\x40\xb7\x75\x5b\xb7\x75\x0a\xa0\xdb\xba\xad\xdb\x76\
-\x89\x0d\xba\x4b\xd0\x6d\xdd\xb6\xf3\x6e\x4d\x24\x3f\x7c\xf9\xbf\
-\x1e\xa4\x76\x5f\x36\xaf\xfa\x79\x07\x06\xba\xad\xdb\x76\xb4\xed\
-\x45\xaf\x5f\x3b\xd2\xdf\x4f\x76\x97\xb0\xdb\xba\x6d\xe7\xdd\x8e\
-\xfe\xd7\x13\x83\xaf\x5d\x70\xf1\x4d\x9d\x02\x18\xd7\x76\xe5\xe2\
-\xa7\x1e\x0b\x0a\x26\x8a\xbb\x8f\x1f\x60\x2b\xeb\x5d\x01\x48\xbe\
-\x57\xc4\xfb\x02\x68\xf0\xdb\x76\x2c\xcf\x0d\x15\x72\x5c\xca\x5f\
-\xbb\xac\x78\xea\xa6\x47\x4d\xbe\xfa\xde\x6e\x25\x8d\xfb\xda\xcb\
-\xdb\x1d\x77\x6f\x50\xeb\x37\xce\x76\x0a\x60\x68\x81\x5f\xf8\xe4\
-\x3e\x85\xa0\x1e\x59\xdc\x7d\x5e\x21\x90\xcf\x28\x44\x72\x85\x16\
-\x5c\x2a\xbf\x9e\xb0\x0a\xc2\x1d\x14\xe8\x26\x45\xb0\xa3\xe8\x01\
-\x84\xc8\xb2\xc4\xfa\x1a\xa0\xba\xba\x7f\xc2\xad\x85\x42\xf8\x59\
-\xa1\x0c\xbe\x5e\x3c\x75\x66\xa1\x10\x66\xbb\x95\x36\xfe\xad\xd7\
-\xcb\xd5\xaf\xaf\x5f\xd3\xb9\x00\xc3\x6c\x57\xcc\x7f\x72\xff\x62\
-\xb5\xbe\xbf\x10\xda\x57\x16\x6b\x76\x02\xb4\x14\x6a\xe1\xa7\xeb\
-\x1b\x80\xdc\x05\xd1\x96\x73\x71\x70\x0f\xc3\xb8\x92\xc0\x1d\x40\
-\x13\x14\xd2\x0c\x01\x7d\x30\x00\x02\x60\x2e\x05\x22\x1e\x54\xdc\
-\x39\xa8\xb8\x6a\x47\x16\x2f\x6d\xb8\x72\xf1\xd3\xdf\xe8\xf7\x16\
-\x8f\x7d\xcc\x8a\x7f\xbc\xbe\x5b\x79\x43\x5f\x7e\x6f\xbb\xfe\xe6\
-\x75\x6a\x6e\x7e\xb1\x53\x00\x6d\xb6\xcb\xe7\x3f\xb9\xb2\x90\xb3\
-\xb7\x15\x0b\xf5\xcd\xc5\x22\x5d\xa9\x85\x0e\xa9\xe0\xd3\xc7\xd4\
-\x05\x50\x10\x92\xfd\x38\x12\x20\xef\x11\x57\x24\x91\x37\xdd\xd6\
-\x00\x94\x9d\xef\x80\x95\x06\x63\xf5\xad\x1b\x00\xd5\x3f\xd4\x7f\
-\x83\xb8\xaa\xf8\xff\x15\x13\x53\xd3\x7f\x7d\xf9\xc2\xa7\x3e\xbf\
-\x65\xd3\xfa\x77\x7f\xe8\x5f\x5e\x79\xcf\x69\x1f\xdf\xa7\xcb\x5d\
-\x1f\x61\xdb\x32\x33\xaf\x7e\x73\xcb\x3d\xe6\x71\x47\xfd\xa7\x08\
-\xff\xdc\xf1\x87\x15\x4b\xf3\x17\xc5\xdd\xf7\x16\xfb\x4a\xba\xa4\
-\x81\x59\x38\xd0\x3b\xda\x5d\x82\xee\xa0\xf8\x0e\xec\x18\xf0\x5e\
-\xaf\x9e\x41\x65\x76\xff\x3d\xd0\xec\x59\xf1\xc4\xb6\xda\xed\x79\
-\xb8\xe7\x37\x38\x67\xf2\x0f\xea\xdd\x3c\xae\x5f\xc7\x72\x61\xea\
-\xd7\xd4\x74\x01\xb3\x5e\xb3\xc7\x9e\xf7\xbb\xe9\x5f\x3e\x74\xea\
-\xbb\xbf\x77\xcb\xd1\xbb\x77\x2b\xb2\x25\x04\x20\xfb\xd5\x37\xac\
-\x75\x42\x83\x9d\x02\x68\xd8\x7e\x35\x77\xfc\x73\x8a\x55\x78\x69\
-\x61\xd9\x0f\xad\x96\x31\x64\xc6\xca\x5b\x69\x26\xbb\x16\x45\xb0\
-\x3b\x97\x84\x81\xfc\x82\xb3\x87\xde\x47\x99\xd7\xc8\xc3\x42\xca\
-\x20\xe3\x7f\x93\x39\x3b\x7f\x7f\xf7\xb3\xb2\x91\xf6\xd8\x7b\x87\
-\xdf\x1f\xcc\x79\x0f\xce\x5d\x99\xef\x09\xf5\xeb\xfa\xb8\x52\x8b\
-\x20\x7d\x2d\xcb\x4a\x65\xb0\x32\x9b\x98\xfc\xd7\x7d\x1f\xf8\x90\
-\x9f\x5e\x74\xdf\x07\x0f\x7b\xd1\xeb\xd7\x76\x39\x2c\x89\x24\xa0\
-\xde\xef\x59\x3f\xa3\xee\x5e\xbb\xd1\x79\xbd\x53\x00\x91\xed\x97\
-\xb3\xc7\xff\x43\x71\x73\x06\x96\x90\x1f\x81\x41\x6c\x62\x73\xb1\
-\x76\x6c\x91\x08\x02\x72\x25\x0c\xce\x2e\xd9\x6f\xd7\x96\xdb\x1f\
-\xce\x7d\x2d\x63\xef\x93\xd5\x3b\x57\x18\xe1\x1d\xd9\xc2\x68\xbb\
-\x37\xbd\xbf\xac\xc8\x32\xb3\xdb\xf3\x06\xc2\x93\xf0\x63\xf5\x6b\
-\xf6\xba\x0e\x14\x02\x3c\x7a\xc5\x6e\x7b\x5e\x76\xf4\xbf\x7d\xf1\
-\xf0\x42\x09\x4c\x74\x8a\x20\x0d\x00\xe4\x39\xaa\xab\xae\x5b\xed\
-\xbd\xde\x29\x80\xa0\xf0\x7f\xe2\xa8\x62\x65\x1d\x5f\xdc\x9d\x00\
-\x24\xa2\xcf\x60\xbd\xaf\x16\xac\x2d\x74\x25\x07\x19\x1c\x46\xe7\
-\x39\x0e\xd5\x38\x74\x16\x61\x3f\xf3\xaf\x25\xf7\x83\xee\x25\xac\
-\x5e\xca\x5d\xfc\x5c\xe9\x1a\x19\xf7\x86\xfe\x93\xdd\x22\x30\x2e\
-\x53\xed\x12\x54\x14\x01\xec\xbe\x62\xf9\x6e\xa7\x1f\xfd\xaf\x27\
-\xbd\xac\xfc\x7d\x3a\x25\xd0\xac\x01\x6e\xbb\x73\xbd\xda\xb8\x79\
-\xae\x53\x00\x29\xdb\x2f\x66\x3f\xf1\xd8\x62\x99\x7d\x76\xc0\x56\
-\xd7\x96\x88\x12\x72\x8e\x35\x35\xe2\x6e\xe0\xbd\xb7\xe4\x05\xcb\
-\x1b\xb2\xc6\xee\xf3\xae\x7b\x00\x59\xc6\xac\xab\x2b\x54\x9e\xf5\
-\xcd\x32\x67\xa7\x6e\xc9\x52\xec\xfc\xf3\x14\x3b\x5f\xed\xf3\x73\
-\xd7\x69\xf0\xbd\x32\xe2\x3e\x08\x28\x02\x06\xd7\x43\xbf\x67\xf1\
-\x79\xd3\xcb\x77\x5b\xf9\xd9\xb7\xbc\xf7\xb3\x2f\x2a\xc9\xec\x4e\
-\x09\x84\x5d\x80\x85\x5e\x5f\x5d\x7b\xa3\x9c\x31\xd8\x29\x00\xb6\
-\xfd\x7c\xe6\xb8\xe9\xe2\xaa\x7d\xb5\xb8\x74\x2b\x1c\x06\xbe\xd0\
-\xa2\x25\x79\x82\x94\xcd\xae\x2d\x3b\x55\xb6\x95\xe1\x27\xc7\xa2\
-\x22\x8f\x9d\x63\xf5\x73\xd6\xf0\x9b\xe7\x95\x9c\xc0\x21\xbd\x8f\
-\x16\x26\xd1\x65\x18\x15\xeb\x8f\x63\x17\xdc\x1a\x39\x32\x60\x11\
-\x0d\xd2\xeb\x69\xae\x3f\xfd\x31\xcc\xdd\x89\x95\x2b\x57\x9d\xf4\
-\xfa\xa3\x8f\x7b\x7a\xa7\x04\x42\x0a\x00\xd5\xf5\x37\xad\x53\x8b\
-\x85\x12\xe8\x14\x40\xda\x15\x7b\x5b\xf1\xff\x61\x8e\xef\x89\x34\
-\x66\x6d\x7d\xfe\x81\x0e\x00\x57\x80\x15\x21\xf9\x1c\xe1\xb6\x7f\
-\x6b\x77\xf6\xb7\x14\x46\x20\x98\xc7\xe2\xfb\x50\xd2\x0d\xc9\xae\
-\xc2\x3e\x7e\x13\xef\x30\xae\x3d\xfa\xf9\xe6\x3c\x33\x2f\x56\xa0\
-\xbf\x1f\xd4\x5c\x01\x00\xe1\x04\x20\x33\xdf\x5b\x7f\xcf\x2a\x6c\
-\x08\xd9\xf2\xbd\xee\xb7\xdf\x29\x2f\x3a\xea\x8d\x07\x74\x4a\xc0\
-\xdf\x66\x66\x16\xd5\xad\x05\xfc\x0f\x6d\x9d\x02\x20\xdb\x65\x9b\
-\x8f\xdb\xbf\x58\x60\xff\xec\x08\x1c\xd2\x5c\x35\x59\xf8\x39\xe1\
-\x42\x05\x3b\xbc\xcb\xc2\x4f\x5f\x93\x84\xdf\xf9\x5c\x43\x3c\xc6\
-\x85\x5c\x7b\xe9\x5b\x4b\x01\x44\x3f\x8f\xa0\x15\xa3\x10\x6a\x65\
-\xc0\x15\x01\x12\xe2\x95\x12\xa7\x2e\x31\x58\xbe\x65\xf6\xc0\x87\
-\x3d\xf2\x89\x9f\x2a\xee\x2e\xd3\x9c\xc0\xe4\xb2\xfd\xbb\x05\x5d\
-\x6c\xbf\xbe\x61\x4d\xb4\x22\xb0\x4b\x04\x72\x59\xb4\x37\x0e\x52\
-\x7a\x9d\x28\x95\xd2\x54\xc0\x40\xf4\x40\xd9\x04\x17\x14\x92\xf0\
-\xc0\x03\xf0\x00\xa0\xc2\x59\xd9\x81\x53\x61\x7f\x03\x3a\x14\x48\
-\xd9\x05\x60\xaf\xab\x40\x2a\x10\x6c\xab\xcb\x09\x2e\x96\x27\xe7\
-\x8a\x4e\x12\x50\xfd\x55\xea\xe7\xa1\x76\x0b\x06\xf9\x40\xda\x63\
-\x40\x72\x7f\x70\x65\xf4\xd7\x2f\x75\xc3\xf4\xd4\xb2\x67\xbf\xea\
-\x0d\xff\xf1\x27\x9f\xfd\xd8\x3b\xbe\x5b\x3c\x35\x7f\xc4\xab\xaf\
-\xc8\x2f\xbe\xe8\x87\x98\x2f\xae\x57\xfd\x85\x7b\x54\x6f\xee\x6e\
-\x95\xf7\x67\xd4\xe2\xec\xad\x4a\xe5\xf3\x6a\x61\xe6\xe6\xe2\xf1\
-\x5c\xf1\xfc\x9d\x3b\xf5\x92\x5e\x77\xef\xe6\xe8\xeb\x9d\x02\xa8\
-\xb7\x4b\x37\x7d\x7c\xba\x58\x79\xaf\x1e\xc8\x9d\x25\xf8\x00\xdd\
-\x2c\x3c\x6b\xb9\x94\x59\xa0\xcd\x44\x2c\xfa\x8c\x3d\xb8\xc8\x21\
-\x22\x45\x03\xa8\x8b\x56\xa8\x50\x19\xfd\x43\x24\x82\xf8\xcf\xfc\
-\xb3\xb6\x71\xee\x1c\x46\xd2\x98\x6d\xf6\x9f\x86\x50\xe0\xaa\xca\
-\xf2\x1a\xe7\xf4\x8f\x80\x78\xb7\x1a\x0d\x0c\x9e\xdf\x67\xdf\x07\
-\x1f\x53\xdc\xf9\x41\xb1\x97\x7f\xb1\x50\x5e\xf8\x6c\x72\x95\x2a\
-\xf7\xa9\xdd\x1e\x1a\x3c\xbf\x4a\x49\x2c\xde\x5b\x28\x83\x35\x85\
-\x52\xd8\x54\x28\x89\xdb\xcb\x27\x0b\x25\xf1\x9b\x9d\x5e\x49\x74\
-\x0a\xc0\x6e\xcf\x2b\x56\xd3\xde\x76\x31\xba\xd2\x0a\x8a\xa6\xb1\
-\x62\xc4\xe2\x61\x50\x09\x38\xa9\xbd\x82\x52\x50\x31\x30\x01\x5a\
-\x19\x59\xcb\xa8\x9f\x33\x96\x54\xa3\x00\xa6\x51\x70\x5b\xd7\x0a\
-\x08\x1a\x0e\x85\x07\x1a\x13\x68\xf2\x10\xf5\x7d\xa2\x04\x50\x60\
-\x06\xb5\x4b\x31\x31\x39\xf5\xc8\xd7\xfc\xd3\x7f\xfd\xd5\xa7\x3f\
-\xf2\xe6\x2f\x16\x0f\xfb\x4f\x7a\xca\x1f\xe1\xc5\x17\x7e\xbf\x51\
-\xfd\x65\x53\xab\xaa\x7d\x6a\xb7\x43\x82\xc7\xf4\x7b\x1b\x0b\x24\
-\xb1\x4e\xf5\xe7\xd7\x55\xf7\x7b\x95\x92\x58\x28\x94\xc4\x8d\xc5\
-\xb9\x2d\x0c\x94\x46\xa7\x00\x76\x60\xee\x0f\xd5\xe1\x1a\xeb\x03\
-\x0e\xc2\x5a\xa0\xad\x17\x32\x48\xab\x2d\x13\xfa\x8c\xab\x3e\xa6\
-\xb7\xb8\x70\xe3\xfa\xfb\xd6\x9c\x77\xeb\x4d\x57\x5f\xf4\xb3\x0b\
-\xbe\x75\xf5\xba\x35\xb7\xcf\x97\xcf\x2f\x5b\xbe\x5b\xf6\xcc\xe7\
-\xbc\xf4\x11\x0f\x39\xf4\x77\x9f\xbc\xd7\xde\xfb\x3d\x63\xd9\xb2\
-\x15\x8f\x6a\x82\xd1\x54\xed\xb8\xc2\x0f\x8e\xc5\x07\x2a\x1b\x0e\
-\xc4\x50\xcd\xca\x66\xc9\xae\x2b\xca\x3e\x88\x53\x12\x6c\x71\x3d\
-\x3a\x1a\x01\x5c\x05\xe1\x44\x4a\x40\xb9\xe1\x92\xc1\x73\x7b\xdd\
-\x7f\xff\xb7\xad\xda\x6b\x9f\xd3\x36\xac\x5f\xdb\x1b\x20\x01\xec\
-\x8f\xe3\x7b\x4c\x4c\xee\x51\xed\x2a\xa2\x24\xf2\xde\x66\xd5\x5b\
-\x58\x5b\x2b\x89\x0d\x05\x72\xb8\xab\xd0\x1c\x73\x95\xbb\x81\x38\
-\xaf\x16\x67\x6e\xeb\x14\xc0\x76\xab\x00\x40\x1d\x0e\x8a\xd7\xae\
-\xd7\xe2\x47\x7c\x56\x25\x40\x6c\xba\x2d\x2e\xce\xdf\x72\xf3\x6f\
-\xae\x3c\xfe\x2b\x9f\x3b\xe6\x3c\xb2\x3c\x73\x6d\xa8\xe6\xe7\x66\
-\xd4\x59\xdf\x3c\xe1\x97\xc5\xfd\x72\xff\xcc\x8b\x5e\xfa\x96\x27\
-\x1f\xf6\xa8\x27\xbd\x69\x7a\xd9\x8a\x47\xf8\xe8\x41\xf3\x0c\xf4\
-\xf3\xc1\x2d\x39\xd4\x5c\x04\xc9\x45\x30\x62\xe5\x14\x13\xe1\x56\
-\x22\x04\x30\x89\x7f\x10\x11\x40\xad\xe5\x90\xbb\x47\xc0\x42\x83\
-\x44\x2f\x38\x21\xc2\xe2\xf9\x89\x89\xc9\x83\xff\xfc\xa8\x37\x3d\
-\xf7\xa4\xe3\xff\xf9\x1b\xa5\x1e\x7e\xd2\x53\x9e\x99\x5f\xfc\xb3\
-\xf3\xb6\x8a\x13\x94\x4d\xec\xae\xa6\x57\xec\xae\xd4\x8a\x87\x34\
-\x28\x89\xc2\xd5\x58\xb8\xaf\x30\x12\x85\xeb\x31\x7f\x77\xa1\xa2\
-\x06\xdc\x44\xe9\x6e\x2c\xce\xde\xd6\x29\x80\xad\xbd\x5d\xb4\xe1\
-\x63\x25\xf1\x77\x88\xb1\xf2\x60\xe3\xe8\xc8\x2c\x71\x6c\xdb\xb4\
-\xe1\x9e\xd3\x4f\x39\xe1\x7d\xc7\xde\xb3\xe6\x8e\xb9\x7a\x59\x96\
-\x82\x5f\x5a\xa2\x7e\xbd\xe7\xee\x72\x55\xd9\x69\x5f\xfa\xcf\x0b\
-\x96\xaf\x58\xf9\xb3\x57\xbd\xf1\x3f\xdf\xb4\xf7\x03\x1e\xf8\x0a\
-\x13\xf9\xf2\x3c\x11\x10\x91\x81\x73\x1f\x5c\x6b\x8f\xb8\x2d\x18\
-\x40\x48\x54\x12\x20\x40\x7a\x30\x02\x4d\x15\x96\xc9\xb9\x20\xe5\
-\xd3\xc8\x2c\x3f\xea\xe3\x8a\xdb\xbd\xef\xff\xc0\x17\x17\x77\xce\
-\xa8\x78\x80\xea\xba\x8f\x07\x05\x8c\x45\x49\x4c\x16\x4a\x62\xf2\
-\x90\x38\x92\x28\x14\x42\xaf\x50\x0c\xf9\x62\x81\x22\x16\xee\x2d\
-\x5c\x8f\x35\x0a\x7b\x5b\x06\x4a\xa2\x74\x37\x66\x6e\xe9\x14\xc0\
-\x98\x61\xea\x0b\xab\x6e\x3e\x80\xae\x45\x51\xca\x67\xfa\x02\xcc\
-\x5f\x01\xf1\x4f\xf8\xf4\x7f\xbe\xe1\xd3\xf5\x5f\xf7\x6b\xc1\x5f\
-\xac\x17\xe1\x02\x51\x04\x54\x01\x94\x1d\x84\x26\xe7\x66\x37\x4f\
-\x1d\x77\xec\x6b\x8e\x7d\xe5\x1b\x3e\x7c\xf3\x01\x07\x3d\xec\x5f\
-\x45\x26\xc1\x90\x81\x81\x73\x21\xc2\x6f\x8f\xb1\xef\x04\xdb\x98\
-\x07\x68\x6a\x4e\x89\x84\x08\x70\x94\x00\x2a\x37\xf9\xca\x68\x36\
-\x9a\x48\x65\x93\xb2\xca\xfb\x85\x9b\xf5\x47\x07\x1e\xfc\xdb\xab\
-\x6e\xbf\xe5\x9a\xf9\x0a\x05\xfc\xfe\xb3\x0a\x14\x70\xee\x0e\x53\
-\x46\x9c\x4d\xac\x50\xd3\x11\x05\x51\x29\x89\x7c\x6e\xe0\x62\xa8\
-\x57\x8f\xf6\x59\x9d\xf8\x57\xe2\xb1\x2a\x16\xb3\xb7\xc9\x2d\x72\
-\x7c\x7f\xc3\xfa\x75\xa7\xd5\xc2\xaf\x2d\x7e\xb9\xf0\xb6\x14\x7b\
-\x59\x7a\xb5\xa1\xbe\xdd\x54\xec\x9b\xd9\xbe\x89\x1e\xf3\xb9\x8f\
-\xbd\xf5\xe4\x7b\xd7\xdd\xfd\xf1\x68\xfe\x80\x62\xe7\xe6\xe4\x13\
-\x00\x2b\x3c\xd2\x4a\x20\x25\x2f\x61\x69\x77\x2f\x59\x88\xe5\x43\
-\xd8\x1c\x07\x45\x12\xb0\xc0\x7d\x4c\xbe\x9f\x22\x09\x41\xd6\x1d\
-\x30\xc9\x51\xcb\x9f\xf8\xd4\xe7\x3d\xae\x78\x6a\xba\x56\xb2\xdb\
-\xfe\x02\x8c\x79\xcf\x60\x59\xe1\x6e\x3c\x64\x74\x65\xd3\x09\x7f\
-\xa9\x4d\xf3\xca\xf6\xa3\x63\x81\xd0\x4f\xe3\x15\xf6\xde\xe2\xc2\
-\x6d\x27\x7d\xe2\xe8\x0f\x11\xe1\x9f\xab\x85\x5b\x0b\x7d\xa9\x08\
-\x66\x6b\xa5\xb0\x70\xda\xc7\xf7\xa9\xf6\x1a\x15\xcc\xd7\xaf\xcd\
-\x68\x65\x70\xd2\xf1\xef\xfc\xf0\xc2\xfc\xec\x65\xf4\x73\xf9\xee\
-\xa6\x1b\xd7\xff\xa4\xe3\xd8\xf9\x6f\x4f\x3b\x45\x06\x7e\x2a\x34\
-\x3a\x44\xbf\x41\x02\xfc\x7b\x29\x24\xd6\x5f\x91\xdf\x48\xa9\x07\
-\xec\xff\xe0\xa7\xd5\x0a\xa0\x44\xb9\xd9\xf6\x90\x15\xbd\x24\x99\
-\xd6\x9d\x0b\x30\x2e\xcf\x55\x86\xc8\x36\xc1\x46\x7e\xfd\xa6\xeb\
-\x7f\xf5\xb1\x4d\x1b\xef\xad\x7d\x4d\x63\xf9\xb7\xd4\x8a\xa0\x74\
-\x01\x72\xa9\x8b\x4d\xfd\x5c\xf5\xfc\x8b\x5e\xbf\x36\xd7\x3c\x41\
-\xf1\x5e\xf9\x6d\x37\x5f\xf3\xde\x87\x3e\xfc\xf7\xce\x8c\x9f\x30\
-\x88\xe7\x69\xba\xed\xec\x20\x0d\x03\x2d\x5f\x61\x5d\x95\xa0\xbb\
-\xc0\xc2\xb1\x26\x05\x02\xd1\x73\x91\x0a\x37\xe0\xd0\xe2\x66\x4a\
-\x2b\x80\x27\x3f\xf5\x4f\xe0\xa2\x9f\x9e\xd3\x75\x13\xea\x14\x80\
-\x4c\x49\xe5\x75\x09\xae\x09\xb9\x55\x61\xb6\x38\x77\xde\xeb\x2d\
-\xde\xf6\x3f\x27\x7f\xe0\xfc\x5a\x78\x17\x6a\x4b\xae\x2d\xfe\x62\
-\x21\xe4\x79\xca\xe7\xd7\xca\xa0\x5f\x28\x82\x4a\x29\x7c\xe9\x84\
-\xf7\xfd\xe4\x1d\xff\x7e\xea\xc5\x53\x53\xcb\x9f\x54\x2d\x6c\x74\
-\xcf\x01\x88\xf0\x18\xc1\x69\x41\xc5\x6d\x2d\xe5\xd0\x76\xf2\x34\
-\xd2\xd8\x3e\x46\x50\x80\x62\xe8\x46\xb9\x69\xdb\xe5\x3e\x39\x39\
-\x7d\x88\xe6\x58\x94\x69\x30\xd0\x8d\xc2\xee\x5c\x00\x59\x03\xac\
-\x52\xa6\x10\xa5\xce\x67\xa7\x35\xf8\x08\x7e\x85\x5b\x71\xbb\xf1\
-\xbe\xb5\x3a\xd4\xa7\xa1\xff\x8c\xb6\xfc\xa9\xc2\xcf\x14\x81\x71\
-\x23\xe6\x67\x67\x4f\xc5\x1c\x5b\x62\x42\x30\x6d\xb7\xa4\xd7\xa5\
-\xb6\x62\x4b\xb9\x83\xf0\x2f\xf5\x3b\xc4\xaa\x0b\xed\xef\x01\x4e\
-\x9f\x04\x7a\xdc\xc4\xc4\xd4\xfd\x88\x02\x98\x50\xdb\x4d\x79\xe4\
-\xf6\xe5\x04\x74\x08\xa0\xb6\xfe\x19\xd4\xb9\xe6\xd4\x82\xd6\x2c\
-\x3b\x28\x39\x2a\x70\xc7\x6d\xd7\x5f\x54\xfb\xfe\x8b\xb5\xe0\xcf\
-\x0f\x2b\xfc\x54\x09\x14\x48\xa0\x37\x3b\xbb\xf9\x82\x15\xbb\xaf\
-\x52\x80\x82\xe5\x17\xac\x3c\x24\x58\xff\xed\xc9\x29\x08\xa1\x03\
-\x44\x8c\xa2\x00\xed\xe7\x9b\xfb\x8a\x94\x5c\x3b\x7a\x04\x56\xd6\
-\x06\x6e\x82\x20\x80\x6e\xb1\x77\x08\x20\xe0\x03\x44\xac\x98\x23\
-\x42\xe4\xb5\x5b\x6e\xbc\xe2\x66\x02\xff\xe7\xb5\xcf\x3f\x0e\x9d\
-\x74\xfd\xaf\x2f\xfe\x75\xf5\xbe\xf9\xce\xc9\x5e\xc5\xd1\x40\xf8\
-\x35\x70\xac\x3e\x04\xff\xa6\x78\x6d\x37\xe5\xf6\x4b\x53\x3b\x5b\
-\x24\x60\x1c\x1e\x4d\x87\x00\x2a\x04\x90\x17\xce\x74\xa6\xb3\xcf\
-\x95\xa9\x07\x62\x89\x40\xdc\x82\xdc\xf2\x9b\x2b\xee\x51\x36\xde\
-\x1f\x24\xfc\x86\x40\x01\xf8\xa2\xd7\x9f\x34\xf7\xa4\x3f\x78\xc1\
-\x16\x84\x6c\x9a\xe4\x06\x05\xce\x8d\x97\xc9\xc8\x16\x7f\xbb\xb4\
-\x7f\x4e\x4a\xb0\x7d\x0e\x15\x9a\x48\x8c\xf3\x98\xa4\x02\x88\x51\
-\x11\x83\x0e\xcc\x25\x30\x4a\x00\x3b\x04\xd0\x29\x80\x24\x56\x1a\
-\x92\xc7\x6f\xf1\x6c\xbf\x7c\x9c\x7a\x69\xd0\x12\x77\x17\xff\x3d\
-\x0c\x21\x2b\x8c\x18\x63\x44\xa8\xa9\xdb\xb6\x4a\x85\xf5\x66\xeb\
-\x14\x40\xa7\x00\x24\x49\xcb\x07\x1d\x2c\x07\x3d\xe9\xb1\x0e\x37\
-\xb9\xd4\xbb\xa4\x0e\x0e\x39\xf4\xb1\x7b\x5d\x7e\xd9\x79\xeb\x95\
-\x9f\xe6\x3b\xf2\xf6\xaa\x7f\xfa\xc4\x74\x71\x5e\x2b\x35\xed\xe0\
-\x0c\x20\x72\x7a\x14\x08\xfd\x0a\x20\xe0\xf7\x6f\x8f\x91\xc1\x18\
-\x02\x30\xf7\xed\x6d\x45\x8c\x2a\x9a\x4f\xe0\x66\x04\x3a\xd9\x81\
-\xae\x12\xe8\x38\x80\x4e\x01\x84\x09\xa9\x58\xc8\xca\xd4\xac\xb3\
-\xed\xa1\x87\x3d\xe1\xb0\x42\x01\xdc\xa4\x2d\xff\x38\xa7\xd6\xec\
-\xb5\xf7\x7e\x8f\x28\xce\x69\x42\x30\x87\xca\x29\x8f\x83\x40\xa5\
-\x1d\xc0\x8e\xf4\x03\x78\x0a\x60\xf0\x58\x70\x03\x94\x8a\x24\x3a\
-\x45\xfa\x26\x76\x00\xa0\x53\x00\x4d\x1c\x60\xdb\x6d\xef\x7d\x0e\
-\x78\x42\x71\xf3\xdd\x25\x3a\xa7\x23\xb8\x92\x02\xd2\x0e\x07\x01\
-\xdb\x4f\x09\xde\xce\x15\x03\x06\x1e\x7b\xb7\x04\xf6\x87\x03\x63\
-\xa0\x3a\x0d\xd0\xbc\x75\x51\x00\xa5\x9c\x34\x5f\x24\xb7\x5e\xba\
-\x2d\xfb\xb7\x72\xcf\xfb\x3f\x77\xaf\xfb\xef\x3f\x5d\x5f\x47\x18\
-\x67\x43\xca\xe2\x63\x8f\xf4\x52\x68\xf3\xbc\x24\x2c\xe5\xf4\xda\
-\x5c\x7e\x3e\x97\x8e\x0b\x1c\xbb\xcd\xd3\x83\x87\xfe\x5b\x19\x15\
-\x84\x90\xde\xce\xb4\x77\x0a\x60\x4c\x08\x54\x2c\xba\xd1\xd6\x36\
-\xb0\x43\x36\xb1\xef\x9f\xbd\xe4\x2d\x2f\x51\x4e\xac\x79\xf4\xed\
-\x47\xf7\x1e\xff\xc2\xe2\xfd\x1f\x19\x2b\x02\xa2\x7b\xee\xdc\xaf\
-\x05\x22\x47\xf1\x75\xb3\x97\xaf\xe7\xb8\xe3\x46\xc0\x54\xb8\xb9\
-\x2a\xeb\xd6\x2e\x60\xbd\x2e\x11\xa8\x73\x01\x42\x1c\x80\x71\xb1\
-\x49\x50\x2d\x02\x9d\xef\xf7\x80\x07\xbd\xe1\x11\x8f\x79\xc6\xd7\
-\xae\xfe\xd5\x0f\x67\x6a\x25\x30\x52\x24\xe0\x82\x75\xc7\x4d\x2b\
-\xc0\x0f\x0e\x05\xeb\xf9\x79\x92\xc7\x18\xd2\x4e\x98\xd6\xe8\x64\
-\x9b\x11\x81\x5e\x28\xd0\x2f\x0e\xe2\xc9\x41\x18\x88\x18\x74\x2e\
-\x40\x87\x00\x02\xbe\xa7\x00\x97\x13\x61\x72\x21\x35\x7b\x3f\xe3\
-\x39\x7f\xfb\xa9\x55\x7b\xef\xb7\x5c\x8d\x61\x4c\x55\xf1\x9e\x9f\
-\x2d\xf6\x43\x95\x13\xd3\xc6\x00\xbc\xcf\x5b\x3e\xdf\xf0\x7d\xb6\
-\x63\xf7\x20\xb8\x13\x25\xd1\x4c\x02\x76\x89\x40\x9d\x02\x08\x20\
-\x43\x53\x4c\x92\x13\x18\x9d\xb8\x4f\x4e\x2d\x7f\xc6\x91\xaf\xfc\
-\x7f\x1f\xdd\xf7\x81\x87\x8c\xa4\x04\xbe\xbf\xe6\xe3\xef\x2f\xde\
-\xef\x65\x0e\x8c\x15\x21\x3f\x56\xe7\x29\xba\x01\x35\xac\x97\x5c\
-\x81\xa0\x3b\xb0\x03\xbb\x07\x2a\xe2\x1e\x75\x2e\x40\xe7\x02\xb4\
-\xe0\x00\x5c\xfe\xb8\xed\xa5\x9d\x9a\x5e\xf1\x57\x2f\xfa\x9b\xf7\
-\xed\x77\xe3\xb5\x97\x1c\x75\xce\x37\x3f\xb1\xb6\xcd\x5b\x9c\x7f\
-\xf7\x47\x57\x14\xf0\xfb\xf8\xe2\x4f\x5e\x1e\xfe\x70\x08\xbb\x23\
-\x88\x66\xe0\x06\x30\x64\x03\x0a\xbc\xbf\x49\xee\x0e\xb8\xb5\xa2\
-\x06\x0d\x2e\x80\x11\x5d\xa4\x2e\x00\xcf\x03\xf0\x09\xc5\xce\x05\
-\xe8\x14\x40\x2b\x12\x50\x14\x39\xf0\xd7\x0e\x04\x66\xdb\x65\x13\
-\x53\xcf\x3c\xf4\x91\xbf\x7f\xe5\xc1\x87\x3e\xee\x98\x8f\x7d\xe7\
-\xa7\x9f\xfc\xc1\x59\x9f\xeb\x35\xe5\x06\x9c\x77\xf7\x47\x8f\x2a\
-\x6e\xfe\xad\x78\xff\x43\x62\x73\x06\x42\x7a\x81\x76\x22\x8e\x0a\
-\xae\xf0\x1c\x6e\x2f\x4a\x00\x85\xbb\xe8\x36\xfc\xe4\x25\xbf\x8a\
-\x13\x7f\x1c\x15\xa0\x7c\xad\xba\xad\x53\x00\xb2\x02\x20\x3d\xe8\
-\x9d\x5b\xdd\x60\x83\x74\xe1\x8d\x87\x5f\xe0\x01\x53\xd3\xcb\x3f\
-\xfa\xc8\xc7\xfe\xd1\xbb\x1e\xf1\x98\x67\x9c\x7e\xee\x1d\xea\x5b\
-\x00\x59\xd9\xbc\xed\x97\xcf\x7a\xd0\x3f\xf5\xbf\x77\xe7\x47\x7e\
-\xb7\xb8\xbf\x7f\xf1\x3e\xcf\x29\x6e\x5f\x5c\x7c\xc8\x41\x6c\x00\
-\x40\xba\xa5\x72\x0a\x00\x18\x0a\x40\x24\x93\x76\x20\xaa\x04\x1a\
-\xd1\xc0\x52\x2b\x81\x44\x04\xe0\xf4\x03\x08\x20\x00\x15\x0d\x91\
-\x75\x0a\xa0\x53\x00\x32\xf1\xc6\x16\x0c\x8c\x61\xb1\xc0\x7e\x85\
-\xd0\xbc\xaa\xb8\xf3\x2a\xfd\x4e\xe7\xde\xf9\x11\x67\xd1\x03\x8d\
-\x34\xd0\xfe\x9e\x00\xd1\x21\x24\xfc\x59\x1f\x05\x50\x81\x57\xbe\
-\x12\xa8\x15\x59\x6b\x34\xb0\x4d\x14\x00\xb1\xde\x82\xd0\x3b\xf7\
-\x59\x6e\x40\xb7\x75\x0a\x20\x7d\xfd\x61\x58\xe4\x2d\x18\x70\xd3\
-\xc9\x63\x99\x78\x31\xb8\x09\xca\x1d\x83\xed\x87\x1e\x53\x3c\x74\
-\x41\x64\x25\xab\x1f\x52\x12\x6d\x5d\x82\xa5\x44\x01\x89\x2e\x80\
-\x04\xfb\x9d\xfb\x4d\x24\x20\x86\x23\xb4\x5b\xb3\x85\x1a\x6e\x47\
-\xda\xa9\x53\x00\x4a\x11\x8b\x81\x5e\xba\x7d\x4c\x88\x87\xf5\x29\
-\x51\x31\x2b\x8c\xa4\xb7\x2d\x6d\xf3\x95\xd2\xc4\xca\x0c\xce\x70\
-\x09\x3f\xfb\x98\x00\x82\x04\x25\xb0\x6d\xb5\xf0\xf0\x08\x40\x25\
-\x65\xc9\xc5\xc6\xb1\x6d\x3d\xa1\x8c\x5d\xf2\xad\xad\x1c\x3a\x05\
-\xa0\x06\xa1\x31\x20\xe3\xbf\xa8\xd7\x2f\xe9\x82\x94\x21\x21\x49\
-\x2b\x00\xc3\x0e\x87\x37\x9e\x90\x09\x0b\x5d\xc8\x10\x5c\xc2\xbe\
-\x12\x50\xaa\xb9\x86\x60\x5b\xa2\x00\x0f\x01\x30\x34\x10\x42\x00\
-\x2a\x21\x0c\x08\x30\xba\xa0\x37\x21\x85\x51\x05\xd8\xe7\x6e\xb1\
-\x53\x00\x5b\xc1\xfc\x98\x62\x1b\x4a\x06\x9a\x2e\xb3\xc0\xfd\xe7\
-\x24\x71\x49\xf2\x79\x5d\xaf\x02\x8c\x70\xa3\x3b\x96\x68\x70\x7e\
-\xb4\xd4\x17\x29\x62\x70\x11\x84\x33\x3f\x0b\x24\x98\x4d\x0b\x8b\
-\x7c\xe0\x8f\x31\x2b\x85\x4b\xf7\x1b\xb8\x97\xc6\x6f\x1f\x5e\xa7\
-\x6c\x05\x2a\x03\x75\x85\x86\x52\x18\x8a\x91\x37\x08\x53\x92\x1b\
-\xd0\xf4\x1e\x63\x76\x03\x20\xfd\xa3\x3b\x05\x30\x2a\x07\x15\xbb\
-\xc0\x40\x24\xd6\x2d\x35\x1f\x11\x04\xb4\x7d\xaf\x26\xb6\xce\x28\
-\xac\xc1\x81\x49\x53\x88\xb7\x2d\x05\x18\x94\x2f\xe9\xbe\x14\x0a\
-\x94\xc2\x81\x29\x8a\xca\xbf\x2c\x38\x56\x8e\x20\x5a\x62\x0e\xad\
-\x75\x0b\xcb\xf2\xc6\x4e\x01\x8c\xd3\xf8\xd0\xf6\xda\x48\x01\x78\
-\xd0\x11\x0f\x30\xf4\xd0\x7e\xa1\xf3\x11\x5e\xfc\xc7\x95\x20\xbe\
-\xef\xf3\x2b\x37\xaa\x40\x04\x5b\x52\x02\xfe\x73\xae\x12\x08\xa3\
-\xfd\xa5\x52\x16\x89\x08\x80\xe4\xfd\xbb\xc3\x42\xfc\xe1\x29\xd2\
-\x45\x07\x88\x37\x08\x0a\x23\x9f\xf6\x02\x07\xc9\xbf\xbf\x64\xed\
-\xc7\x83\x34\x3a\x05\x90\xa8\xa9\x11\x13\xf0\x2d\x51\x06\x10\xf8\
-\x45\xda\xaf\x93\x31\x84\x1c\x23\xc4\x1f\xd0\x05\xd5\xa8\x04\xb6\
-\xb1\x16\x8e\x28\x00\xa7\x13\xf0\x90\x0a\x00\xc0\x87\x06\xd1\xef\
-\x3f\xee\x6b\xc3\x5c\xbf\x18\x5a\x58\x0a\x6b\xdf\x29\x80\xc8\xef\
-\x82\x66\xb0\x26\x78\x62\xe9\x13\x72\x8c\x04\x1c\x4a\x86\x61\x48\
-\x21\x01\x9f\xf9\x17\x91\x41\xf8\x98\x54\x57\x60\x5b\x04\x09\x42\
-\x2e\x80\xc2\x70\x36\x60\x28\x1c\x28\x30\x3d\x9e\xe0\x4b\xcf\x71\
-\xa5\x34\xaa\x92\x44\x91\x3b\x8a\xbf\xe6\x0e\x81\x5d\x3a\x65\xd0\
-\x29\x00\xba\x38\x0c\xf9\xd7\xc2\x92\x37\x0a\x7f\x3a\x9b\xe6\xc3\
-\xff\x30\xbf\x6f\x73\x09\x22\xed\xc1\x02\x21\xc2\xed\x13\x05\xb4\
-\x43\x00\x14\xb9\x89\x09\x41\x2a\xe4\x02\xb8\xda\x05\x58\xf9\x34\
-\x44\x9c\xf3\x61\x79\x00\x68\xf1\x1a\x9f\xf4\xc4\xd7\x21\x74\x1c\
-\xc0\xf8\xb7\x6a\x30\x08\x1f\x03\x56\x13\x69\x55\x37\x5a\xc6\xd8\
-\x41\x82\x80\x43\x02\xb1\x94\x4c\x41\x39\x72\xab\xa5\x5a\x58\xac\
-\x84\x00\x04\xa1\x29\x78\x48\x09\xb8\xef\xe5\xa2\x00\x48\x40\x0a\
-\xdb\x56\x01\xa0\x33\xc8\x55\x91\x71\x61\x31\x44\x4f\xaf\xa7\xcf\
-\x85\xc8\xc2\x3e\x4e\x3d\x89\x54\x19\x51\xc1\x8f\x24\x6c\x22\x8f\
-\x1e\x75\x73\x01\xc6\xb3\x85\x7e\x58\x18\x72\x91\x2f\x09\x45\x86\
-\xb2\xdf\x08\x00\xc9\x7c\xc0\xb8\x3e\x77\x47\xf6\xf5\x68\x5f\x45\
-\x8a\x06\xf8\x75\x84\x25\xfc\x5d\x63\xa8\xc0\x5c\xf3\x00\x2a\xe0\
-\x55\xab\x9d\x02\x18\xc3\xd6\xeb\xf7\x7f\x06\xfd\xfc\xc4\x7e\x7f\
-\x71\xba\xdf\xef\x4d\x63\x9e\x4f\x94\x23\x68\x40\x1c\xc2\xc5\x35\
-\xc6\xb8\x2d\x05\x84\x95\x50\x48\x51\x49\x1f\xc8\xa7\x1a\xd7\x37\
-\x2b\xf7\x78\xc0\x8b\x18\xa4\x08\x58\xc2\xa5\xe3\xc2\xc6\x89\x00\
-\x14\x1d\x04\xe2\xd4\x01\x84\x22\x34\xc8\x90\x00\x88\xdf\x1f\xc6\
-\xa4\x01\x40\x88\x22\x71\x57\x8f\xa2\x01\x1f\x19\x28\xf1\xb5\xce\
-\x05\x18\xe3\xf6\xb5\x4f\xbd\xee\x82\xe2\xa6\x9c\xf3\xb7\x67\xbd\
-\x57\x8d\x3d\x76\xc6\xef\xfa\x77\x6f\xf9\xca\x8b\xd2\x84\x71\xdb\
-\x98\xfd\x26\x12\x90\x67\x03\xea\x5b\x9e\x0d\x18\xe2\x79\x40\x87\
-\x4c\xc1\x7d\xce\x13\x70\x90\x95\xc7\xb0\x3a\x7d\x18\x79\xa5\x39\
-\x5a\x7a\x04\x7a\x8c\x50\xec\x14\xc0\x68\xe6\x47\x4f\xf9\x9d\xaf\
-\x9f\xdb\x29\x15\x40\xd9\x2e\x2c\xc8\x05\x6c\xf3\x9f\xa0\x19\x01\
-\x28\xd6\xfd\x97\x0e\x06\x71\x4b\x81\x25\xe2\x14\x2d\xdc\x47\x6b\
-\xfd\x81\x10\xa9\xf6\xb9\x66\x77\x30\x9e\xd3\xef\x1f\x8b\x5c\xa3\
-\x45\xd8\x1f\xea\x26\xa0\x19\x5d\xdf\x21\x80\xa5\x5c\x7d\xfd\x5a\
-\xf8\xcb\x4b\xbc\xa8\xb6\xcf\x39\x3a\x63\xf1\x3f\xb7\xdf\x9f\xa0\
-\xa5\x02\xa0\x8f\x69\x3f\x40\x15\xee\x08\x04\x9a\x24\x2d\x1d\x3c\
-\xf0\x09\x3f\x67\x02\x53\xc8\xfa\x27\x28\x4e\x10\x68\x7c\x10\x4b\
-\xbe\xb9\x4b\x80\x02\xcf\xe3\xbe\xa4\x15\xc1\x38\x7e\xca\x4e\x01\
-\xd8\x4d\x2b\x80\xf2\x76\xa7\xed\x95\x88\x3b\xd0\xf9\x25\x0f\x0a\
-\x61\x30\x2e\x58\xd6\x0d\xe8\xb2\x3a\x68\x7d\xf4\xc1\xf8\x35\x92\
-\x91\x29\x08\xbb\x1b\x89\x09\xf3\x2f\x52\x0c\xdf\x61\xf5\x9d\x6a\
-\x4f\x4c\xfa\xb6\x54\xe8\x41\x35\x13\x89\x9d\x02\x68\xb1\x0d\xa6\
-\xf1\xae\xcd\x09\x12\xd8\x79\xa1\x0e\x62\x90\xdb\xc2\xed\x40\xf4\
-\xd1\x29\x01\xa4\xdd\x80\x7c\x04\xe0\xc6\xfe\x95\xd3\x45\x59\x05\
-\xbf\xa7\xb6\xfe\x56\x29\x68\x41\x36\xb2\xac\xdd\x00\x62\xf9\x5d\
-\x94\xd0\x50\x4d\x49\xfb\x2f\x7a\xe1\x3d\xd6\xfc\x45\x71\x44\x80\
-\x71\xcd\x08\x5d\x22\xd0\x92\x29\x81\xe5\x7b\x3d\x01\x57\xee\xfb\
-\x27\x0a\xb2\xe5\x3b\xed\xf7\xfc\xd4\x19\xdb\xbb\x82\xf2\x17\xbd\
-\x21\xff\xd8\xad\x3e\x9e\x77\x07\x8e\x65\x02\x9a\x0c\x40\xea\xef\
-\x07\x42\x80\xc0\x05\x9a\x1f\x97\x50\x1a\x0c\x3c\x87\x04\xc0\xc0\
-\x7a\xac\xd9\x48\x37\xbe\xcf\x5e\x17\xb4\xb4\x25\x3f\xbb\x3c\x80\
-\xf1\x68\xc1\x65\xfb\xa9\x95\xfb\x1f\xa1\xa6\x56\x1c\xb8\x83\x00\
-\xe5\xd1\x04\x0c\x49\xd9\x70\x4a\x16\xf3\xd6\x21\x43\x5a\x20\x00\
-\xa2\x05\x1c\x02\x50\xb9\xc9\x40\x92\x5f\xce\x51\x00\x9f\xbc\x6c\
-\x43\x85\xc0\xd0\x40\xd8\x15\x08\x35\x89\x75\x2b\xae\x99\xe2\x31\
-\x42\x4e\xa0\x7d\xac\xdf\x24\xfa\x24\xe0\x38\x38\xdc\xad\xa6\x00\
-\x4e\xfe\xc5\x7b\x1e\x5f\x5c\xf2\xe7\x15\x67\x7d\x68\xf1\xf0\x91\
-\xc5\xbe\x4f\xb1\x1f\x24\x6b\x52\x18\x6a\x35\x82\x0a\xbf\x0f\x48\
-\x35\xfc\x42\x53\x0d\x82\x03\xc3\x1f\x09\xb0\xd5\xc4\x24\xfc\x23\
-\x43\xe0\xae\x9f\xee\x26\xb6\x01\x05\xe1\x83\x30\x50\xfd\x00\xdb\
-\x87\x02\x30\x02\xef\x29\x00\xa1\x33\x50\x20\x0a\xc0\x85\xdd\xee\
-\x9a\x1c\x54\x36\x9b\xd2\xbb\x0d\xad\x33\x8c\xfe\x66\x08\xf6\xbb\
-\x19\xbf\x9f\x08\xbf\x72\x2c\x3e\x3a\xdc\x80\xbd\x8f\xcc\x6f\xd8\
-\x01\xa2\x00\x27\xfd\xe2\x3d\x87\x17\x17\xeb\x39\xc5\xb7\x38\xb2\
-\x38\xe9\x03\xd0\x83\x4e\x10\x92\xb0\xa1\x6c\x92\xdc\xc8\x82\xf4\
-\xdf\x83\x80\x50\x03\x70\xea\xc7\xcd\xc4\x4a\x54\x50\x4b\x11\x55\
-\x8b\xe6\x7d\x81\xaf\x00\x31\x45\x49\x01\x48\x62\x1e\xfc\x4e\x5b\
-\x13\x0f\x35\xf5\xf2\xc5\xc8\x63\x4c\xc2\x6f\x68\xba\x3e\x81\x73\
-\xdf\x5d\x8e\xd4\x3d\xb0\x4a\x03\x22\xc6\x26\xf4\x69\xe8\xd5\x6d\
-\x20\xeb\x09\x89\xc4\xa2\x9b\x26\x34\x4a\x08\x1d\xf2\x68\xc0\xf6\
-\xe8\x02\x7c\xe1\xe7\xef\x5e\x51\x7c\x89\x57\x16\x77\x8f\x2e\xbe\
-\xc1\x01\xca\x49\x47\x85\xb0\xdf\x07\xd0\x42\x05\x60\xab\xf7\xb2\
-\x4a\x13\x99\xc0\xd7\xaf\xa0\x4b\x08\xd1\x1f\x89\xbc\xa9\xbb\x88\
-\x92\x1a\x3a\xc0\xd2\xa8\x02\xd6\x52\x8c\x2e\x36\x6e\xcd\x5d\x5e\
-\x1b\xe5\xfe\x06\x31\xeb\xbf\x1d\x91\x80\x34\x34\xd8\xd4\x1b\x50\
-\xae\x07\x26\x16\x14\xca\xf5\xa9\x3e\x60\xa4\x9f\x22\x01\x92\x31\
-\xe8\x5a\x7d\x64\x99\x83\xad\x7e\xb6\x5b\x8b\xbd\x1c\x18\xf3\xeb\
-\xe2\x3c\x6e\x2a\xce\xf1\xdb\xc5\xdf\x5f\xa6\x51\x01\x18\x12\xd3\
-\xf6\x73\x71\xbf\x87\x84\x00\xb6\x33\x05\xf0\x85\xcb\xde\xf3\xe2\
-\xe2\xe4\xfe\xb3\xb8\x34\x07\xb9\x9d\x6f\xc1\xb1\xad\xa8\x04\x68\
-\x8a\x02\x50\x4d\x89\xb7\x46\x19\x53\x90\x2d\x29\xca\x6e\x01\xc6\
-\x3a\xfe\x42\x48\xd8\x97\x16\x1f\xcb\x61\xa6\x06\x7f\x01\xb9\xb1\
-\x90\x15\xe2\xf0\xcb\x67\xe9\xbe\x73\x8c\x04\xa4\xaf\x37\xf5\x06\
-\x94\xcf\xba\xf6\xfd\xad\xcc\x93\x1d\x49\x37\x48\xea\x16\xd4\x7d\
-\x22\xc5\xfc\x00\x48\x90\x7f\xa3\xb0\x0e\x2a\x0e\x3f\xa8\x38\xb7\
-\xc7\x57\x56\x1e\xd4\x7b\x8b\xa7\xef\x28\x5e\xff\x5a\xaf\xd7\x3f\
-\x3b\xcb\xb2\x73\x06\xe7\x16\xe2\x2f\xc0\xb6\x3b\x1b\x63\x2e\xc7\
-\x58\x14\xc0\x89\x97\xfe\xf3\xde\xc5\xa9\x7f\xbe\x50\x63\x47\x94\
-\xdf\x0c\x40\x9f\x28\x10\xd6\x75\x70\xf5\xdc\xa1\x15\x0d\x50\x2a\
-\xd0\xc3\x3e\x04\x0f\xfd\x09\x39\xd2\x9a\xc5\x80\xc0\xcb\x7e\x1b\
-\xd3\x48\xc1\x33\x58\xaa\x92\xda\x24\x98\x27\x54\x2b\x8a\x83\xce\
-\x24\xe2\x2f\x62\xfd\xc7\x95\x6c\xb2\xd4\x08\x80\x87\x08\x43\xd7\
-\x4c\xe7\x01\xd4\xd0\x1a\xb2\x6c\xb0\x56\xb3\xac\x5e\x9b\xe0\xd6\
-\x0b\x80\x71\x01\xe8\x6f\x9c\x8e\x02\xa4\x76\x92\xf6\xfc\xab\xfb\
-\x07\x14\xaf\xbf\x79\x6a\x2a\x7b\x73\xf1\xf8\x8e\x7e\x3f\xff\x8f\
-\x75\xf7\x6c\xf8\xdc\x3e\xf7\xdf\x73\x46\x5f\x7b\x3b\xf0\x94\x5c\
-\x13\x48\x73\x76\x52\xb6\x91\x13\x5e\x4e\xbc\xe4\xdd\x4f\x2a\xce\
-\xe8\x17\xc5\x7e\xc4\xe0\xed\xb4\x4e\xcd\x82\x7a\xb6\x7a\xad\xb4\
-\xf8\x7a\xb6\x7b\xfd\x3c\xd2\xd7\xe9\x5e\x1f\x6b\xf6\xa0\x0e\xe7\
-\xa3\x13\xc9\xfb\xa2\xdd\xa5\x73\xf3\xfe\x16\x41\xd8\x55\xf8\xb3\
-\xb7\xc5\x70\x4c\xf3\xdd\x48\x1f\x3c\xe7\x18\x70\x8f\x45\xb5\x4b\
-\xed\x21\x44\x65\x23\x00\xa0\x4a\x25\xa0\xcc\x73\xb5\x42\x28\x9f\
-\x87\x4c\x69\x05\x31\x38\x2e\x33\xc7\x0f\x94\x86\xbe\x3f\x78\x4d\
-\xde\x41\xd8\xed\xfb\x98\xbf\x2f\x3f\xab\x70\x97\x27\x27\xb3\x8f\
-\xed\xbb\xcf\x5e\xd7\xf4\xfa\xf9\x4b\x1e\xf5\xc4\x57\x82\xfe\x6c\
-\x7a\xbe\x03\x94\x00\x0e\x42\xd9\x66\x0a\xe0\x73\x97\xfc\xf3\x11\
-\x85\x6e\xfa\x41\xb1\xba\x0e\x42\x5f\xbb\x91\xb0\x93\x0b\xbd\xd1\
-\x81\xa6\x20\xfa\xb2\x48\x7a\xbb\xfa\xc2\x19\xfa\xc1\xb9\x60\x86\
-\xad\x2a\xb2\x29\x32\xfe\x8e\x89\x7f\xbb\x35\x47\x61\xf3\xeb\x40\
-\xda\x5f\x39\x8a\x41\x29\xe4\xd7\x51\x9a\x9e\xe3\x7c\x1f\xb5\xdd\
-\x8f\x01\x4f\x3b\x47\x15\x44\x01\x50\x8f\x7f\xa6\xe6\x66\x80\x88\
-\xf4\x9e\x33\x53\x84\xaa\xd2\x0f\xe6\xbe\xfb\x5c\x56\x29\x0b\xf7\
-\x75\x7d\x0c\x7f\xdd\xde\xf2\xbf\xe7\x9f\x87\x0f\x9e\x9e\x9a\xf8\
-\xda\x15\x17\x9f\xf0\xed\x5b\x6f\x5b\xbd\xcf\xef\x3c\xe9\x95\x00\
-\x9e\x89\x24\xe7\xbf\xad\x5c\x80\xcf\x5e\xfc\xae\x72\xa8\xe5\xc9\
-\xc5\x77\x98\x40\x50\x5e\x2f\x7d\xe7\x3e\x5a\x17\x1f\x10\x88\x2b\
-\xee\x4c\xad\x18\x19\x4a\x37\xcc\xec\x6b\x1d\x6a\x6b\xcd\xb2\x2e\
-\xf9\x10\x4d\x14\xdd\x1d\xe4\x21\xbb\x50\xc3\xd1\x20\xf4\x0f\xb0\
-\xff\xb1\x29\xc5\x5b\xdb\x05\x20\x3d\x00\x1b\x5d\x80\x86\x31\x4f\
-\xb5\x3a\xa9\xc9\x00\xb4\x09\x02\x34\x38\x45\x9e\x77\x73\x05\x80\
-\xdd\xc6\x97\x01\x8d\xef\xd3\x24\x1f\x45\xda\xd0\x59\xad\x6d\x84\
-\x44\x4d\xc2\xc4\x9f\x1d\x74\xd0\xbe\x97\xfd\xec\xfc\x8f\xfe\xe5\
-\xef\x3c\xf9\xef\x2f\x2c\x5f\xbd\xfc\xc2\x4f\x63\x02\x0f\xbe\xf4\
-\x08\xe0\x84\x8b\xde\x75\x78\x71\xb2\x9f\x57\x55\xc5\x9c\x86\xc0\
-\x60\xc8\xbc\x0a\x7a\xea\xfb\x1a\xd6\x6b\xc8\xaf\xa1\x79\x08\x8a\
-\x87\x60\xee\x10\xbb\xeb\x4a\xc0\x68\xf0\x3d\xe5\x33\x97\x0a\xca\
-\x72\x17\x08\xd9\x67\x89\xe8\x08\x1c\x17\x40\xf1\xef\x12\x72\x15\
-\x02\x13\x77\xb7\xbb\x3d\x86\x04\x83\x2e\x00\xb5\xfc\xdc\xda\xe7\
-\x8d\xbf\x30\xb5\xe2\xe5\xf1\x8e\xb5\xf7\x1d\x57\x07\x15\xd8\x3d\
-\x6c\xfd\xf9\xf9\x14\xc7\x3c\x78\xcf\x3d\x56\x9c\xf7\xb3\xf3\x3e\
-\x52\x96\x70\x67\x8f\x7e\xca\x6b\x2c\x1a\x80\xf1\x20\x80\xd6\x0a\
-\xe0\x33\x17\xbe\xf3\xb0\xe2\x73\x4f\x2b\x34\xe8\xb4\x11\x68\xb4\
-\x11\xcf\x90\xc5\xa5\x0b\xd4\x83\xd3\x8a\x17\x72\x80\xeb\x1e\x0c\
-\xb9\x0f\x0d\xad\x45\xb7\x03\x3d\xc8\xbd\xb5\x76\x11\x0e\xd3\x7f\
-\xa2\x3b\x43\x72\xe2\x83\xb0\x7f\x07\x80\xfe\x89\xee\x81\x72\x5c\
-\x85\x10\x93\x5e\x9b\x1f\x20\x21\x3e\x9a\x0c\x64\xd8\x7f\xac\x7d\
-\xf4\x01\x41\x68\x93\x85\xd0\x3c\xce\x6a\x42\xdb\xc0\x7c\x40\x6f\
-\xb7\x2e\x40\x7d\x7c\x4d\x38\xd2\xf7\xd4\x8f\xe9\xe7\x0d\x38\x08\
-\xfd\x18\x96\xaf\x5a\xb5\xfb\x57\x2f\x3a\xff\xbf\x5f\x56\x1a\xdc\
-\x47\xff\xfe\xff\x05\x7b\xae\x5b\x59\x01\x7c\xfa\x67\x47\x97\x42\
-\xff\xd5\xe2\x63\x57\xa2\x11\x7e\x1d\xee\xcb\xea\xc5\xaa\x2d\x3e\
-\xb1\xf4\x08\x84\x45\xe7\x64\x5a\x16\xb7\x6e\xe3\xb0\xcc\x09\x96\
-\x5b\xb2\xb2\xa1\x7d\xab\x58\xb7\xa8\x32\x52\x82\x05\x07\xdf\x92\
-\x4b\xd7\x2a\x62\xf9\x9b\xad\xff\xf6\x43\x24\x2a\x0c\x8f\x04\x0b\
-\x0f\x07\x75\xfd\x7e\x8d\x02\x5c\x34\x90\x3b\x7e\x3d\xe7\x01\xb4\
-\xb5\xa7\x9c\x00\xf5\xf7\xe9\xee\x71\x07\x8a\xf3\x05\x2a\x68\xfd\
-\xd9\xdf\x4e\xec\xb1\xc7\xf2\x4f\x9f\x7f\xfa\x07\x9e\x5b\xba\xed\
-\x8f\xfe\xfd\x7f\x80\x71\x71\x00\x59\x4b\x37\xed\xfd\x85\x6e\x7d\
-\xac\x17\x93\xad\xcb\x9b\x0c\xe1\x67\x2c\x0d\xb9\xef\xf8\xd4\xe0\
-\x59\xaa\x64\x4b\x3c\x46\x84\x20\x5a\xd9\xed\xe1\x5f\x23\xc9\xe5\
-\x13\x96\xdc\xe2\x2b\x09\xe5\x34\x58\x7e\xa5\x70\xc7\x47\x03\x4e\
-\xa7\x60\xd9\xff\x17\x3d\x41\x87\x93\xae\x43\x6d\x60\xf9\x00\xc8\
-\xe8\x71\xee\xeb\x90\x81\xf8\x9e\xf4\xf9\xc1\xdf\x93\x70\x22\x79\
-\xdf\xf2\xb8\xc1\xad\xbe\x0f\xce\x39\xc1\x20\xf2\x30\xbd\xdf\x7e\
-\x7b\x7d\xf9\xd4\x93\x8e\xfe\x9d\x4a\x09\x3c\xf5\x75\x63\xa9\x0b\
-\x4c\x26\x01\x3f\xf5\x93\x77\x1c\x5a\x9c\xcc\x9b\xa1\x26\xf4\xdc\
-\x6e\x25\x40\xf8\x0b\x1c\xa4\xce\xe2\x00\xa2\x68\x34\x00\x40\x63\
-\xef\x52\xec\x1c\x92\xab\x52\x70\x29\x33\xd5\x86\x6a\xf1\xbd\xf5\
-\x33\xe6\x54\x20\xff\x21\x98\x8c\xe8\x95\x96\x61\x22\xe9\xd7\x8e\
-\xfc\x5b\xec\xe5\xde\xef\x53\x9e\xdf\xd4\x64\x96\xf4\xbd\x50\x98\
-\x0e\x6a\x4c\x03\x2a\x56\x0a\xac\x3c\x22\x10\xa3\xb3\xc1\x6c\x23\
-\x90\x01\x19\xe7\x16\xed\xd8\x50\x9b\x0b\xfb\x81\x76\x87\x04\xf4\
-\x08\xc0\x18\x14\xe7\xd7\xd5\xa4\xf7\x6a\x72\x50\x4c\x6e\x1e\xb8\
-\x02\xb9\x2e\x50\x87\x8a\xb2\x2c\x9f\xdb\xfd\xb7\x1f\x7e\xe0\xc9\
-\xcf\xfe\xe3\xc7\x3d\xe3\xec\xf3\x7e\xbe\xe9\xb1\x4f\xfd\xc7\xde\
-\xa8\x8c\x6c\xb2\x02\x28\x84\xfa\x83\xc5\x99\x4c\xf3\x62\x19\x28\
-\xd4\x16\x02\x49\x96\x04\x9d\xfc\x43\x32\xfe\xc0\x4d\xad\xb5\x43\
-\x19\xa0\xa5\x6c\xed\x94\x4d\x7a\x12\x73\xef\x20\x5d\x25\x40\xbb\
-\xeb\x17\xca\xf7\x2f\xd7\x69\xaf\xd7\x2f\x84\x1a\x8b\xdb\xbc\x6a\
-\x9f\x9e\xe7\xa8\xfa\xd5\xca\x1c\x6c\xfd\x7e\x5e\x3d\xd7\x0a\x76\
-\x16\x16\x6d\x62\x62\xa0\x10\xa6\x26\x27\xea\x5b\x50\x93\xc5\xfd\
-\x89\x62\x95\x4f\x4c\x40\xf0\xfb\x49\xf7\x53\x6b\x01\xc0\xf8\x0b\
-\x19\x69\x0f\x16\xc8\x28\x41\x12\x73\x47\xd2\x37\x40\xd7\x0e\xd8\
-\x8e\x22\x5e\x9e\x01\x8f\x20\x45\x0b\x7e\xd0\x0d\x8c\xd3\xfb\x25\
-\xfc\xcf\x6b\x65\x56\x82\x82\xf2\x7e\xa1\x48\x7f\xe7\x7d\x47\xff\
-\xe5\xfb\x0a\x05\xf0\x2e\x65\xfb\x57\xe0\x92\x2a\x80\xe3\x7f\xfc\
-\xf6\x47\x16\x57\xe1\x85\x83\x93\x06\x52\xc6\x58\xb7\x9f\xc6\xba\
-\x63\x59\xad\x29\xd1\xc9\xad\xaf\xad\x3e\x90\xa2\x08\xa9\xb9\x01\
-\xb6\x4b\xac\x4e\x11\x8c\x9d\x69\x8b\xa2\x1e\x48\xd5\x08\x18\xb4\
-\x50\x8b\x8b\xb9\xea\x15\xc2\x5c\x0a\xfc\xe0\x76\xf0\x78\x29\x14\
-\x6f\xa9\x30\xf2\x7c\xd0\x77\x65\x71\xb1\xef\x9e\x5b\x6d\x19\x27\
-\x4a\x85\x50\x28\x89\xc9\x02\x39\x4c\x96\x04\x59\xa1\x14\xa6\x8a\
-\xc7\x6e\x25\xa0\x0a\x86\x02\x53\x10\x80\x02\xa9\xe2\x0f\x58\x0d\
-\x80\x6f\xf5\x01\x90\x35\x0d\xa1\xe1\x3f\x14\x2d\x3f\x71\x7e\xd9\
-\x6b\x18\x0d\xe9\xd9\x39\xaf\x68\x32\x6c\x57\xed\xb9\xe2\x1f\x3e\
-\x7a\xec\xab\x4e\x79\xe3\xd1\x9f\xbd\x52\x8d\xd8\xc4\x66\x32\x6d\
-\xf1\xc1\xdb\xa0\x26\xf7\xac\x12\x20\xa1\xbf\xfa\x4c\xf5\x31\x8a\
-\x1c\xa7\x48\xfc\x1f\x59\xf5\x1f\x60\x8b\x32\xe0\x61\x10\xfb\xb6\
-\x31\xd5\xdb\x83\x57\x10\x3d\x91\xd2\x6a\x2f\x2c\xf6\x8a\xdd\x0a\
-\xfb\xf6\xf4\x85\x4a\xe1\x2c\x15\x92\x51\x0e\x04\xf6\x97\xe8\x60\
-\x7a\x6a\xa2\x42\x0c\x25\x7a\x28\xa1\xb2\x34\x2e\x2c\xac\x46\x4b\
-\xe1\xcf\x4c\x48\x10\x4b\x02\xb0\x5a\xcb\xee\xad\x3d\x5e\x67\x9f\
-\xa2\x37\x45\x48\x81\x3f\x34\xae\xf9\x87\xf1\x6b\x19\xa9\x90\xdb\
-\x74\x67\x34\x46\x14\x91\xe5\xb6\x16\x5f\xfd\x29\x4f\x7a\xf8\x31\
-\xc5\x13\x7f\x55\xea\xd3\xfa\xc5\x7c\x49\x14\xc0\x71\x3f\x7a\xfb\
-\x8a\xe2\xfd\x5f\x58\x91\x11\x08\x6e\x43\x42\xfd\x9c\xae\x66\x02\
-\x24\x05\x67\xfa\x49\x52\xa6\xaa\x61\x14\x42\xe0\xf2\xe0\x8e\x8f\
-\xf2\x71\x7b\xd1\x38\xee\x89\x94\xc2\xbe\xb8\xd0\x57\xf3\x85\xe0\
-\x5b\xcb\xbe\xe3\xb9\x5b\x15\x32\xe9\x59\xc5\x50\xba\x13\x93\x85\
-\x32\x58\x56\x2b\x05\xa7\x7e\x5e\xcc\x03\x00\x87\xfd\xa5\xb5\xfe\
-\x6e\xde\xbf\xb2\x85\x43\x40\x91\x01\xb5\xfe\x9c\xcb\x8a\x8d\x59\
-\x43\x0f\x09\xe8\xbf\x45\xaa\xc1\x40\x6a\x38\x42\xe4\xaa\x3e\xb7\
-\x95\xbb\x2f\x7b\xf6\x47\x8f\x7d\xe5\xef\xbd\xf1\xe8\xcf\x5d\x4c\
-\xdc\x00\x1c\xbb\x02\x28\xce\xed\x88\xe2\xab\xaf\x42\x33\x34\xcf\
-\x7a\x4a\x03\xf2\x0f\x8c\x12\x18\x24\x57\x81\x30\x48\x13\x8c\xb2\
-\x68\xf4\xfd\x71\xc7\x58\x88\xdb\xfb\x96\x57\x56\xb4\x6f\x2c\x7d\
-\xba\x9f\xbe\x63\x5d\xef\x92\x8f\xe8\xcf\xa3\x9a\x9f\x5f\xac\x04\
-\xa9\x44\x08\x25\xe1\x58\x2a\x04\x91\xd4\x00\x5e\x85\x4a\x48\x3e\
-\x7e\x5f\x41\x9d\x70\x03\xa4\x62\x04\xdc\xe3\x94\xff\x7e\x29\x57\
-\x12\x89\x12\x70\x9e\x45\xfe\x3c\x6d\x64\x8a\xce\x73\x4f\xf8\xbd\
-\x87\xbe\xb6\xb8\xb9\x5c\x0d\xda\xd9\xe7\x4b\xa2\x00\x8a\x2f\x74\
-\x38\x92\x46\x05\x66\xb0\x82\x81\x47\x56\xa7\xd1\x2a\xc0\xca\x67\
-\x41\x6b\xf9\x35\x7a\xf0\x60\x13\xa6\x5c\xaa\x6e\x8b\xb1\xcc\x16\
-\xda\x63\x65\xe1\x07\x82\xdf\xd6\x2d\xdc\xf1\x14\x2d\x06\xdc\x9b\
-\x12\x21\xcc\xce\x2e\x08\xd7\x4a\x1b\xc9\xcc\x88\xa0\x26\xac\x07\
-\xf7\x6b\xd7\x00\xb2\xfa\xba\xe6\x86\xe8\xb6\x4c\x3f\xc8\x15\x82\
-\xc9\x97\x17\x5d\x5e\xc7\x69\xed\x65\x61\xbe\x39\xc2\x44\x2b\xd0\
-\x96\x0a\xd7\x89\x46\x7b\xee\xb1\xe2\x4f\x9f\xf8\xb8\x43\xf7\xba\
-\xe4\xe7\x37\x2c\x0c\x8b\x02\xb2\xe6\x8b\x0c\x87\xd3\x62\x1b\x9e\
-\x14\x42\xb3\x01\xcd\xf3\x35\xa9\xe7\xde\x0f\x25\xa2\x40\x72\x25\
-\x57\xb7\xc9\x84\xda\xec\xdc\xa2\xba\x6f\xc3\xac\xba\x77\xc3\x8c\
-\xda\x32\xb3\x90\x28\xfc\x69\x85\x53\xdb\x5e\xca\x71\xac\xef\x65\
-\x59\x7e\x9b\x75\xa5\x43\xfa\xfa\x75\xfd\x9a\x61\xad\xc8\xa2\xa4\
-\x7f\x3f\x08\xe5\x63\xb5\xdb\xf7\x16\xae\x6c\x7d\x0c\x38\xc7\x10\
-\xa5\xc1\x16\x3f\x7d\x9d\x9e\x03\xb0\x14\x86\x89\x4c\xed\xf6\x96\
-\x7f\xfc\xb3\x32\x39\x68\x5a\x0d\x06\xd9\xb4\xfe\x21\xa3\x08\xe0\
-\x5f\xbe\xf5\xba\xbd\x97\x4d\x2f\x1c\xb4\x7c\xf9\x54\x01\xad\x34\
-\x55\x69\xeb\xc9\x69\x99\x89\xb1\xfe\x60\xbd\x2c\x87\xe5\x77\x2c\
-\x3f\x6b\x57\x01\x9d\xdd\x1f\xc6\x17\x9e\x5f\xe8\x15\x7b\x3f\xa1\
-\x68\x69\x7b\xb7\xee\xb8\x95\x3e\x25\xb7\xb9\x7c\xb5\x15\x55\x90\
-\x9b\xfc\x3b\x00\x7b\x6b\xbb\x46\xa1\x79\xac\x93\x77\x50\xd1\x50\
-\x76\x60\xcc\x18\x21\x34\xf9\x6c\x00\x93\x8c\x24\x84\xfe\x2c\x17\
-\x60\xad\xbd\xd1\x52\xaa\x46\x25\xfa\x3d\x8b\xe7\xf6\xdf\x77\xd5\
-\x1f\x16\xf7\xbe\xa1\x06\x33\x2d\x7a\x6d\xc9\xc0\x06\x17\x00\x0e\
-\x9b\xaf\xe0\x64\xae\xa6\xa7\x27\xd5\x8a\xe5\xd3\x55\xfc\x76\x40\
-\xf0\x11\xcb\x81\xd4\xe3\xf7\x9b\x74\xa0\x13\x68\xf6\x1b\x75\x8e\
-\xa6\xe4\x77\x2d\x8e\xa0\x12\xfa\x79\x4e\xe4\x75\x3c\x49\xba\xa2\
-\x71\x49\x40\x0a\xe3\x95\xe9\xfc\xe3\x12\x81\x7e\xd2\x14\x90\xee\
-\xc2\xca\x23\x02\x25\x17\xcd\xe9\xfe\xab\x68\x87\x5f\x5a\x13\x2b\
-\x41\x7f\xb7\x99\xa8\xa1\xe1\x6a\xe2\x70\xaf\x55\xbb\x3d\xb5\x46\
-\x00\x93\xca\x56\xbd\xe1\x98\x14\x80\x3a\xd4\x61\x91\x7b\x73\x6a\
-\x7a\x6a\x52\x55\x88\x20\xcb\x5c\xeb\xcf\x33\xcd\xa8\xdf\x1f\xf0\
-\x5d\x11\xc7\x21\xd0\x3b\x3f\x56\x28\xaf\x53\x79\xfd\xe7\xe6\x17\
-\x5b\x27\xdd\xec\x5c\xe2\x3b\xda\x77\xd7\x79\xff\x66\x32\x47\x55\
-\xdb\x91\x55\x46\x73\x50\x96\x9b\x9b\x7c\x14\x20\x3c\x81\x72\x30\
-\xaf\x22\x9c\x81\x72\xa6\x0b\x49\x68\xd6\x9f\xe5\x89\xc4\xd0\xa3\
-\xd3\xa1\xc9\x60\x8e\x32\x14\x49\x72\x1c\x6c\xcb\xda\x9c\x94\xdc\
-\x0d\xea\x05\xa6\x26\xe1\x81\x7f\xfa\xac\xc7\xdc\xff\xac\xef\xfd\
-\x6a\x4b\xed\x06\xf4\xc6\xa8\x00\x70\x2f\x60\xb4\xe9\x40\x11\x94\
-\x88\x60\x4a\x2d\x2b\x50\xc1\x44\x06\x44\x11\x80\xed\x9f\x49\xfb\
-\xf2\x31\xeb\xef\x0b\x7f\x67\xc1\x42\x0b\x7e\xa1\x0c\xdd\x15\x16\
-\x3f\xef\x88\x91\xb1\x5c\x51\xa7\x93\x0e\x6b\xaf\xed\x5a\x73\x3a\
-\x31\xa8\x76\x6d\x9d\xb4\x60\x14\x8e\x0d\x93\xb4\xe8\x74\x65\x23\
-\x9d\x1a\x85\xf1\x60\x06\x19\x08\x63\xc3\x01\xad\x22\xd4\x9e\xc9\
-\x33\x9e\xf6\xdb\x0f\x2b\x14\xc0\x5d\xc3\xf0\x00\x4d\x08\x60\x25\
-\x13\x5d\xab\x08\x16\x06\xe1\xa5\x32\x7d\xb3\x54\x04\x93\x93\x13\
-\x8d\xfa\xd7\xa4\x40\x0a\xcf\x77\x1b\xb3\xf8\xc9\xfe\xfd\xae\x04\
-\xdf\x47\xbd\xae\x58\x13\xd3\xa4\x66\x00\xdc\x0a\x4b\x23\xac\xac\
-\x45\x37\x5f\xb2\xa0\xa4\x1c\xff\x34\x3e\x13\x49\xa3\x13\xa7\xb6\
-\x81\x7c\x4f\x3e\xfe\xcc\x99\x89\xa0\xdc\xc2\xad\x03\x0f\xb8\xff\
-\xc1\xb5\x2c\x4f\xd4\x6e\x40\x7f\x5c\x0a\x20\xac\xd2\xea\xad\x5f\
-\xa0\x81\x99\xfe\x62\x81\x04\xfa\x15\x4f\x30\x55\xb8\x08\x3a\x4b\
-\xa0\xb9\xa9\x7c\x67\xf9\xf9\x02\x99\xaf\x15\x6b\x27\xf8\x4b\xa5\
-\x44\x72\x06\xe9\x33\x62\xd1\x33\xc2\x01\x48\xa5\x82\x4a\xf9\x51\
-\x13\x69\x6c\xb8\x3f\x1b\x90\x2a\x09\xea\xcf\x2b\x10\xda\x7f\x2b\
-\x37\x03\xd0\xa6\xde\x0f\x22\x09\x58\x7f\x0f\x9d\x98\xb4\x6c\x59\
-\xb6\x67\x2d\xfc\x13\x6d\x79\x80\x26\x12\x50\x39\x4d\xd3\xbd\x2f\
-\x6d\x9f\xeb\x97\xe1\xa8\xc2\x47\x2d\x17\xf0\xe4\xe4\x64\x95\xa6\
-\x39\x21\x54\x80\x75\x22\x1f\xb6\xf8\x8b\xbd\x7e\x17\x02\x5d\x4a\
-\x7c\x80\xa4\x55\x18\x8b\x39\x3b\xad\xb9\x94\x44\x67\x2b\x59\xd0\
-\x49\x8b\x2f\xe7\x7d\x28\xbe\xf5\x1e\xb3\xe7\x49\xf8\x0f\x49\xbb\
-\x23\x20\x88\x01\x08\x6a\x31\xcc\x5a\xfd\x78\x7a\x72\x72\xb7\x5a\
-\xf0\xc7\xeb\x02\xa0\x30\x13\x27\xe5\x1a\x97\x89\x28\xe5\x9e\x4d\
-\x64\x95\x22\x28\x0b\x3a\x74\x47\x14\x85\x9d\x2a\xd0\x5b\xc9\xe4\
-\x97\x42\x1f\xcf\xc5\xef\xc8\xbe\x28\x9e\x6e\x05\x5e\x51\xb9\x91\
-\x80\x8c\x20\x82\x50\x4e\x04\xb7\xfc\x28\x1a\xc0\x38\x22\x08\xf5\
-\x97\xe4\x3e\xbf\xaa\x8b\xe6\x90\xf1\x02\x34\x75\x79\x40\x12\xd2\
-\xe7\xa6\xa7\x60\x0f\xe5\xf7\xbe\x1b\x07\x02\x88\x7c\xbd\xc0\xc4\
-\x54\xba\x95\x8c\x75\x05\x69\x17\xa0\xce\xd9\xce\xaa\x30\xe2\x44\
-\x96\xed\xba\x8b\xbb\x4c\xd1\xad\xb3\xd5\x76\x65\x46\x7f\xac\xf0\
-\xa9\x15\x09\x08\x2a\xa5\x70\x58\x0c\xfd\x8d\xd4\x82\x23\x54\x9b\
-\xc0\xab\x04\x48\x81\x10\x21\x02\xe9\xad\x9d\x61\x68\x67\x1c\xa8\
-\x21\xb3\xba\x96\x60\x36\x20\x04\x95\x41\x95\xa1\x56\xec\x55\xb9\
-\xe7\xc4\x44\x55\xee\xc9\x6b\xbf\x77\xd6\x35\x5a\xa5\xa8\x16\x7b\
-\xbf\xdf\x59\xfb\x25\xe4\xf9\x22\xcd\x40\x06\x96\x13\xcd\xb0\x1a\
-\x5d\xaa\x3e\xc8\x53\xa1\x15\xae\x6e\xa5\xab\x96\xb2\xdc\x28\x02\
-\x44\x6c\x85\x00\x24\x3e\xc0\x69\x9d\xaf\x94\xdb\xc9\xc8\xeb\xd8\
-\xa4\x94\x34\x06\x0d\xfd\x41\xa8\xad\x95\xc0\x64\xa3\x28\x43\xf8\
-\xdd\x7c\xb0\xe4\x4f\xa6\x0d\x5d\x88\xaa\xee\xbc\x57\x2b\x83\xba\
-\x41\xc4\x44\x06\x4b\xdf\x5a\x7b\x2b\x5a\xfa\x92\x17\xe9\x77\x42\
-\xbf\x84\x52\x8f\x51\xeb\x1a\xe4\x00\xc0\xde\x07\x4a\xe7\xa3\xee\
-\xd7\xad\x9c\x51\x8a\x63\x0b\x52\xb1\x06\x01\x3e\x0f\xa0\xbc\xb6\
-\xc7\x96\x17\x20\xfe\x7f\x7c\x28\x46\xab\xad\x05\x02\x80\x91\x5e\
-\x0e\x1d\x5c\x29\x83\x3e\x9a\xcc\x36\x3a\x41\x25\x23\x93\x59\x77\
-\x84\x6d\xd0\x2d\xa7\x6c\x76\x91\x77\xf0\x7e\x6b\x2b\x8c\x24\x57\
-\x00\x65\x1f\xdc\xc9\x0e\x64\x24\xdf\xd8\xa0\x49\x93\xa2\x42\x96\
-\x33\x20\x75\x09\x42\x91\x13\x60\xae\xc9\xb6\x76\x01\x46\x17\xa2\
-\x81\xf0\x58\xc8\x55\x29\x84\xba\x4d\x32\x00\x2c\xd9\x1c\xbe\x36\
-\xd6\xbd\xfc\x91\xca\xe4\x1c\xcc\xd1\xb4\xca\xea\xb6\x71\x88\x08\
-\x0a\x42\xed\x0f\xfb\xc0\x21\xd0\x84\x6e\x07\x5e\x03\xd4\x3d\x29\
-\x01\x38\x58\x53\xb9\xe3\x1e\x84\xc2\x80\x81\x21\xf3\x62\xda\x70\
-\xaa\x02\x70\x88\x42\x70\xfb\x1a\xda\x1e\x86\xfa\x98\x5c\x39\x6d\
-\xc5\x46\xd8\xda\x29\x00\x48\x75\x06\xc6\x0c\xa5\x0b\x84\xd0\x67\
-\xa7\xa1\x15\x41\x56\x9f\x53\x35\xe3\x4d\x8d\x7b\x48\x67\x29\xdc\
-\xca\x08\x79\xb4\xe3\x6c\xb7\x8d\x66\x0d\x5b\x71\x79\x18\xfc\x53\
-\xd3\x15\xa8\x91\x03\x28\x93\xdc\x06\xfe\x3c\x1a\x9f\xdf\xfa\xfe\
-\x65\x2a\x30\x92\xf1\xb5\x28\x32\xff\xed\x3b\x5a\xd1\x91\x79\xc6\
-\x98\x30\xc3\xa2\xc8\xf4\x23\xb7\x4b\xb4\x0a\xf0\x00\xf9\x56\x52\
-\x00\xdb\x11\xa9\xa6\x2f\x42\x3f\xa0\xa7\x20\xd0\xac\x31\x46\xcc\
-\x68\x04\xd2\x6d\x5b\x1b\xbe\xc7\xac\x7f\x4c\x69\xe0\x08\x9f\x0f\
-\x2b\x79\x54\x40\x4a\x05\x5e\xfa\x6b\xd0\xd4\xe6\x14\x05\x57\xc1\
-\x6d\x13\x36\xca\xb9\x8e\xa0\x00\x60\x07\x50\x10\xe3\x22\x9b\xb6\
-\x35\xd9\xb5\xeb\xe9\x04\xd7\x29\x90\xe0\x3f\x2d\x9f\xa5\x39\xbc\
-\x91\x16\xdd\xba\xc6\x7e\x70\xc8\x3e\xba\xf8\xc7\x70\x00\x75\xaf\
-\x40\xdb\xf5\x4a\x45\x6e\x6b\x77\xa0\x6d\x6e\x0b\x22\x93\x67\x12\
-\x0a\x74\x88\x40\x45\x08\x3f\xa5\xa2\x13\x5f\xd4\x2e\x86\x00\x76\
-\xb0\x15\xdc\x6d\x49\x1e\x40\x93\xf5\x6f\x7a\xcd\x6f\xb6\x19\xdb\
-\xb2\x4c\x3d\xc4\x0d\x5a\xc9\x2e\x24\xd4\x3d\xc0\x39\x80\xdc\xda\
-\x3c\x54\x4a\xad\xc1\x56\x52\x00\xd0\xad\xd8\x6e\x1b\xdb\x25\xc3\
-\x28\xac\x47\xa7\x0d\xb8\xf3\xc6\xda\x0f\x4e\xf4\xff\x5d\xec\x80\
-\xd3\x85\xaf\x7f\x58\xd5\xa3\x12\x32\xe3\x0a\xd2\xf8\xbf\x99\x6d\
-\x81\x64\xde\xf5\x08\x39\x00\x31\x0e\xc0\xa8\x2c\xc2\x01\xf0\x3c\
-\x00\x3a\xef\x70\x80\x0a\x72\x87\x23\xe8\x10\xc0\xf6\x26\xf0\x9d\
-\xbe\x48\x17\xfa\x54\xe1\x47\xe1\x2f\x03\xf0\x1f\xf3\x7c\xb3\xff\
-\x01\x03\xd6\xbf\xf8\xf7\xa4\x32\xfd\x44\x81\x7d\xce\x0a\x30\x71\
-\x09\x1a\xe0\xff\x70\xc6\x71\x14\x0e\x20\x16\x16\xec\x14\xc0\xb6\
-\x11\x7a\xdc\x0a\x82\xb1\x4b\x5c\x7a\x41\xf8\x03\xf6\xdb\xb7\xfe\
-\xee\xfd\x8a\x1c\xee\xcd\xfd\x52\x82\xd1\xf5\xfe\x07\x21\xe2\x0f\
-\xc6\x99\xee\x12\x59\x30\x74\x4a\xd0\xae\xa1\x00\x60\x27\x10\x7a\
-\xec\x04\x79\x69\x05\x9f\x09\x3f\xb3\xfe\xde\xf1\xe8\x4d\xa9\x35\
-\x57\x7e\x6e\xd3\x5d\xdf\xe5\xd2\x02\x4a\x77\xfc\x81\xc3\x79\x2b\
-\x70\x3d\x0a\xcc\xd6\xeb\x5a\x37\x40\x89\xb0\x7f\x48\x04\xc0\xc7\
-\x05\xf1\xef\x83\x2a\x9a\x09\x28\x8f\x87\xee\x48\xc0\xa5\x13\x7c\
-\xec\x84\x7d\x69\x05\x3e\x4d\xf8\x39\xf3\xef\x5b\x7f\x62\x09\x73\
-\x9c\x5f\x7d\xd3\x0f\x7f\xa4\x6c\x03\x00\x3b\xc7\x1a\xd4\x3e\xc5\
-\xfe\x0c\x2b\xb2\xbe\xe5\x07\xe5\x77\xfa\xe1\x5d\x82\xbc\xbf\x49\
-\x0e\x1d\xb6\x75\x01\x94\x60\xe9\x3b\x17\x60\xa9\x99\xa9\xa5\x13\
-\xf8\x2e\x89\x28\x78\xb1\xdd\x70\x9f\x20\xfc\x14\xfa\xd3\x70\x98\
-\x63\xfd\x51\x2d\xce\x6f\x38\x73\xcb\x7d\xb7\x6c\x52\x83\xce\x38\
-\x7d\x47\x09\xa0\x3a\xaa\xb8\x33\xe1\x74\xf2\xad\xdb\xd5\xfb\xa9\
-\xb8\x7e\xff\x6b\xff\x7e\x3b\x83\xe2\x1a\x7c\x74\x3a\x05\xdb\x62\
-\x20\x52\x1c\xa4\xd8\x58\x78\xc5\x47\xba\x8f\xb6\x4d\x76\xc2\xdf\
-\xfc\x72\x2b\xa1\xef\x04\xbc\xbd\xd0\x3b\x4f\xbb\x90\xd8\x15\x7e\
-\x12\x2f\xe7\xbc\x80\x55\x18\x8b\xab\x6f\xba\xe0\xc4\x5a\xe8\x4b\
-\xe1\x5f\xd4\x4a\xa0\xee\x07\x70\x94\x69\xf3\x4d\x08\x3f\x80\xe6\
-\xd8\xbf\xd4\xf3\x7a\x7c\xeb\xb1\xc9\xfa\xc7\x2c\x7f\x87\x00\xc6\
-\x2e\xf8\x4b\xd5\x94\x62\x28\xee\x61\xa7\xfa\x25\x42\x29\xc0\xbe\
-\x6f\xcf\x85\x9f\xdf\xa7\x33\xf5\xf4\xb1\xf3\x33\xf7\x7c\xe9\xde\
-\x3b\x2e\xbb\x8b\x08\xbf\x56\x00\x65\xe1\xef\x33\xab\x08\x80\xf1\
-\xfd\x2d\xef\x6f\x1e\xa3\x1d\x07\x66\x66\x09\x8e\x75\x38\x89\xf2\
-\x7d\x7e\x0a\x61\x38\x0f\xa0\x98\xef\xaf\x78\x42\xd0\x68\xeb\x70\
-\x72\x97\x16\xfe\x61\x04\x7f\xa8\xaa\xb3\x8e\x37\x08\x5f\x16\x3f\
-\x0f\x00\x99\x0b\xe0\x0a\xbc\xeb\x0e\x28\x52\x39\x87\x79\x7f\xcd\
-\xad\x57\x7c\x5d\x5b\xff\xb2\x3d\x76\x39\x2c\xa3\x1a\x9b\x75\xd5\
-\x8f\xde\x58\x96\x6f\x1d\xad\xad\xbf\xdb\xdd\x17\x58\x11\x90\x6b\
-\xfd\xad\xaf\x0f\x63\x4e\x17\x1e\x17\x02\xe8\x48\xc0\xa5\x15\x7c\
-\x6c\x57\xe1\x85\x2d\x3f\x7b\x97\x47\x61\x88\x9e\x63\xa0\x78\xb7\
-\x5c\x26\xfc\x48\x5c\x06\x7d\x7f\xc3\xea\xab\xde\x3f\xbb\xe9\xae\
-\x2d\x44\xf8\xed\xb4\x9c\x2a\xf4\xa7\x0e\x37\xad\xc0\xcd\xa4\x5d\
-\x30\xd3\x7e\x06\x82\x5d\xff\x07\x7c\x9a\x2f\x8c\x45\x71\x87\x82\
-\x9d\x48\xc8\x4c\x24\x8f\xd1\xfc\x53\xec\x9e\x62\xf7\x3a\x05\x30\
-\x94\xf0\x0f\x27\xf8\x98\x00\x69\x3b\xc9\x4f\x45\x52\xb2\xe0\x37\
-\x09\xbf\x4b\x08\xce\xcf\xac\xfb\xc2\xad\x57\x7e\xe3\x42\x02\xfd\
-\x8d\x02\xf8\xce\x57\x5e\x36\x05\x98\x7f\xdc\x99\xe8\x8b\x7a\xec\
-\xb6\x46\x03\x58\x4f\xaf\x26\x28\xa0\x7e\x5e\x1e\x60\xcb\x26\x5c\
-\xe1\x30\x1a\x60\x18\x17\x40\x75\x61\xc0\x25\x17\xfe\x86\x4a\x34\
-\x0c\x16\xa6\xe3\x58\x04\x62\xd7\xc2\x01\x42\x7c\x9f\x5e\xe1\x26\
-\xe1\x2f\xfe\xef\x2d\x6c\xbe\xe0\xda\x9f\x7e\xfc\xb8\xfa\xcd\x4a\
-\xe1\x9f\x2b\xf6\xd9\xfa\x7e\x7e\xf0\x81\xab\xde\x5a\x08\xe9\x63\
-\xa1\x9e\xae\x69\xc3\x78\xed\xfa\xfc\x8d\x3f\xfd\x7f\x18\x17\x40\
-\xa9\x71\x85\x00\xb7\x1f\x05\x30\xae\x2b\x1b\xd2\x84\x63\x10\xfc\
-\xd6\x42\x8f\x38\x8c\x8a\xda\x75\xe0\x7f\xe0\x5a\x47\x05\x9f\xf8\
-\xfc\xfa\x71\xde\x9b\xbf\xee\x37\x97\x7d\xfe\x9d\xcc\xef\x9f\xd5\
-\xd6\xff\xaa\x0b\x5e\xf7\xe8\xc2\x8a\xbf\xdf\x23\xfb\x6a\x50\x1f\
-\xba\xa5\x09\x40\xc6\xdf\x0f\xb4\xfe\x1e\x89\x04\xe4\x68\x20\x68\
-\xed\x39\x4a\x60\xc9\x41\xdb\xbd\x02\x00\xda\x47\x05\x1c\xba\xc5\
-\x85\x55\x29\x61\x16\x14\xfe\x2e\xf7\x14\x89\x1b\xce\xc5\xb0\xf0\
-\xa7\x08\x3e\xa6\x2f\x68\x1c\x55\xe4\x77\xa9\x50\x22\xf3\xff\xd9\
-\x98\xac\x98\xf0\x63\x7f\xf1\xee\x3b\xae\x39\xf3\x4d\xf3\x5b\xd6\
-\xcd\xd5\xd0\xbf\xbc\x9d\xd1\xd6\xff\xa7\x67\xbe\x62\x8f\x02\xd7\
-\xff\x8f\x2a\x87\x67\x82\xc1\xfd\xc6\x07\x40\x27\x04\x88\xf5\x44\
-\x60\x74\x08\x3f\xde\x34\x4c\x82\xff\x38\xac\xfc\x27\x73\x00\x32\
-\x17\x60\x1f\x6f\x6f\x2e\x00\xd8\xe6\x9e\x46\xf3\x3a\x17\x0f\x4c\
-\xc3\x51\x5f\x13\xf0\xde\x86\xd2\xe5\xcd\x04\x48\x04\x5e\xae\x06\
-\x50\x0d\x00\x24\xe9\xc3\xd1\xba\x98\x28\xf8\x98\xe6\xc3\xee\xb2\
-\x82\xdc\x0e\xef\x60\xf0\x1a\x35\x0b\xfe\x60\xc6\xe7\xe2\x9d\x77\
-\x5c\x7b\xd6\xab\xef\xbb\xeb\x57\xab\x6b\xe1\xd7\x96\xbf\xb2\xfe\
-\x27\xfe\xf7\x11\x13\x7b\xae\x9c\x3e\x05\x10\x0f\xd5\x3e\xbe\x32\
-\x56\xde\x45\x00\x0a\xf9\x7c\x40\xf0\x07\x86\xa8\x31\x58\xff\xa1\
-\x10\x80\xf2\xad\xbd\xf4\x78\x9b\x2a\x80\x3a\xa0\x0a\xc1\xb1\x49\
-\xb4\xb5\x30\x0b\xb3\x34\x16\x5f\x40\xe4\x1a\x72\xd2\x86\x1d\x05\
-\x5a\x59\xe8\xa1\x0b\x60\x9f\xd6\x62\x4e\x1b\x3f\x22\x26\x0b\x3e\
-\x46\x7d\xd8\x74\x04\xb0\xcb\xa8\x88\x94\xeb\xc3\xe3\xff\x04\xc6\
-\x51\xe1\xcf\xfb\xf3\x57\x17\x96\xff\x2d\x82\xf0\x6f\xa9\x51\x40\
-\xef\x49\xbf\xb7\xff\x17\x33\xc0\xe7\x99\xa6\x99\xc0\xe2\xfb\x3a\
-\x14\x08\x68\x52\x7f\x2d\x1f\xe0\x86\xfe\x42\xe4\xdf\xd6\xe1\x00\
-\x94\x8a\xa7\x02\x2b\xb5\x6d\xc2\x80\x62\x03\x05\x10\x06\x86\xf8\
-\xdd\x8a\x3d\x17\x80\xbe\x07\x1d\xa3\x1a\x54\x0a\xca\x9f\xcc\x48\
-\xfe\x7e\x30\x7a\x09\x5c\x0a\x85\x40\x3f\xea\x1b\xd0\x49\xaf\x58\
-\x27\x82\x20\xbf\xa8\xc9\x42\x1f\x71\x03\x3a\x34\xe0\x5f\x99\x60\
-\x24\x80\x73\x02\xda\xd2\xe5\x33\xb3\x9b\xef\xfe\xf4\x8d\x97\x7d\
-\xe1\x2b\xfd\xde\xbc\x4e\xf3\x5d\xa0\xc2\xff\xda\x97\x3f\x3e\x7f\
-\xed\xcb\x1f\x77\x5c\x06\xea\xa8\xba\xa2\xdf\x5a\x7b\x9a\xe4\xc3\
-\xc7\xd9\x2b\x67\x7c\xaf\x63\xed\x41\x2d\x95\xcc\xc7\x10\x40\xc8\
-\xe7\x57\x2c\x21\x68\x34\x33\xd2\x52\x01\xd4\x49\x14\x8e\x75\x86\
-\xa0\x85\x77\xec\x33\xad\xb4\xf2\xec\xba\x34\x4f\xa0\xe1\x4b\x41\
-\x26\xf8\x0f\xc8\xb4\xf7\x80\x18\xd4\x3f\x24\x52\xf9\x37\xe7\x4c\
-\x89\x27\xd2\xfe\x91\xfc\x0d\x26\x08\x3d\x26\x0b\xfa\x4e\xae\x08\
-\x10\x5b\x7e\x7b\x19\x71\x39\x70\x1f\xf3\xcd\x8b\x73\xeb\x4f\x5f\
-\x7d\xe3\x0f\xbe\x58\x58\xfd\x35\xca\xa6\xf9\x2e\xd4\x3e\x7f\x29\
-\xfc\xb3\x1f\x7e\xdf\x1f\xab\x67\xff\x9f\x87\x7e\xa9\x58\x1a\x2f\
-\x36\xca\xde\xc4\xf4\xc1\x7d\xec\x3d\xaf\x6a\x34\x88\x41\xbf\x1e\
-\xc0\xcd\x05\x68\xeb\xff\xb7\xe3\x00\x64\xff\x5f\x79\xfe\xff\x68\
-\xd9\x09\xcd\x0a\x00\x68\xdb\x64\x22\xba\x74\x36\x11\xc9\x95\x46\
-\x8a\x0a\x8c\xb2\xa0\xc7\x22\xb3\xd8\xa1\xf6\x4a\xe1\xc4\x0b\x90\
-\xc9\x03\x85\xec\xa9\x2a\x73\xac\xee\xf8\x32\xf8\x9d\x6b\x28\x68\
-\xa7\x33\x16\x2b\x89\xc6\x79\x89\x7f\x90\x2b\x42\x12\xf1\x75\x2d\
-\xe7\xa5\x37\x59\xb9\x5d\x0a\xf2\x27\x87\x63\x65\x74\x85\x79\x7e\
-\x5f\x7f\x71\xe6\x92\xd9\x4d\x77\x9e\x77\xe7\x75\x67\xff\x78\x7e\
-\xcb\xba\x79\x65\xab\xfb\x34\xdb\x3f\xa7\x2d\xff\x77\xbf\x72\xe4\
-\x3e\x07\x3e\x68\x8f\x53\x0a\x0b\xff\x07\x95\xc5\x07\x1b\xe6\x0b\
-\xde\x9a\xe3\x7c\xfb\x63\x42\x85\x5b\xed\x1a\x61\xc3\x73\x4d\x95\
-\x81\x4b\xa1\x00\x1c\x01\xb6\xbe\xbe\x12\x3b\xa3\xbb\xe8\xc0\x58\
-\x68\xa6\x40\x3c\x97\x40\x9a\x67\x42\xc3\x2d\xb1\xeb\xc6\xfb\xb4\
-\xa1\xe3\xdd\x13\x5e\x62\xd0\xda\x5b\xb1\x74\x4f\x4d\x0a\x9a\xcc\
-\x30\x93\x5d\x8a\x06\x1d\xd8\x06\x8d\x14\x90\x02\x0b\x39\x6a\x2b\
-\x96\x2f\xe6\xfd\xc5\x1b\x7a\xbd\xb9\x9b\x8a\xbf\x9b\x0b\x0a\x02\
-\xee\xda\x0a\x20\xa4\x12\x0b\xa1\xef\x2d\xce\x6f\xbc\x76\x66\xc3\
-\x6d\x57\xdf\x75\xfd\xb9\xd7\xb1\x15\x4e\x8b\x7b\x34\xec\x2f\xaf\
-\xf1\xdc\x65\xe7\xfc\xed\xe1\xcb\xa6\x27\xbe\x50\x98\x8c\xbd\x75\
-\x82\x8f\x81\xfd\x40\x71\xaa\xef\x0e\x38\x29\x80\x11\xe8\xef\x93\
-\x81\x43\xfe\x8e\x43\xbb\x00\x11\x32\x70\xa9\x14\x00\x50\xa8\x0c\
-\xae\xb4\x02\x43\x08\x2e\x2e\x02\xa7\xba\x0a\xbc\xf9\x62\xed\xda\
-\xae\x80\xe2\x82\x2d\x04\x11\xcd\x53\xe8\x84\x6e\xf4\xc5\xd5\x1a\
-\x1d\xf5\xb9\x20\x57\x08\x48\xf8\x4a\x28\xfb\x83\x9b\xf7\x41\x40\
-\x3b\x36\xaa\x5e\x48\x83\x43\x7a\x6b\x7a\xf3\x9b\x2f\x9a\xdd\xbc\
-\xf6\xa2\x0d\xab\xaf\xfc\xe5\x3d\xb7\x5f\x72\x77\x44\x9d\x77\x5b\
-\x3b\x31\xe1\x82\xdf\x23\xc2\x5f\x65\xf9\x7d\xef\xd4\x97\xfc\xd6\
-\xbe\x0f\xd8\xed\x98\x2c\x53\xcf\x87\x7a\xaa\x2e\xd4\x0d\x3c\x21\
-\xb3\xf6\x4a\x5b\x79\x60\x44\xa0\x11\xec\x7a\xdd\x84\x88\xbf\xa5\
-\x6b\x13\x8e\x2d\x09\xc1\x90\xe5\x5f\x2a\x12\x50\x5f\x45\x53\x36\
-\x49\xfc\xf9\xea\xf9\x8c\x11\x7f\x19\x79\x5d\x45\x49\x40\xc7\x02\
-\x8b\x25\xd6\x10\x57\x4a\xf4\x82\x91\xb6\x6e\xba\x96\xdb\x84\xfb\
-\xd0\xfa\x79\x46\xa7\x97\xd6\xdb\xa6\x7b\xfb\x20\x0a\x89\x8a\xaf\
-\xe6\xb4\xd3\xe8\x40\x3e\xb3\x30\xbf\xf1\xbc\x4d\xf7\xfc\xe6\x3b\
-\xb7\x5e\xf1\x3f\x97\x08\x56\x4a\xba\xdf\x6d\xed\xa5\x42\x0b\x3e\
-\x17\xfe\xc5\xaf\x9f\x70\xc4\x3e\x0f\x3b\x64\xaf\xf7\x4c\x4c\xc0\
-\xdf\x99\x36\x5f\x66\x59\xa2\x49\xe1\xa5\xa4\x9f\x46\x00\x94\xeb\
-\xb3\xed\xc0\xa9\x77\xda\x4c\xfc\x8d\xa4\x0f\x1a\x11\x80\x0a\x24\
-\xfe\xa8\x40\x28\x50\x2d\x6d\x18\xd0\x15\x78\x65\x7d\xea\x5a\x70\
-\x9d\x3a\x6a\x70\x49\x40\x2a\xec\xa0\x19\x13\x92\x00\x00\x2a\x93\
-\xad\x7e\xca\x05\xd6\xe7\x43\x85\x5f\xe9\x1f\xbf\x7e\x7f\x24\x44\
-\x1f\xda\x16\x50\xee\x50\xe6\xf2\x98\x5c\x01\xe9\xed\x9e\x43\xad\
-\x51\x73\x8b\x0a\x54\x3f\xdf\x3c\xb7\x65\xed\xa9\x77\x5c\x73\xe6\
-\x29\x1b\xd7\x5d\xb7\x91\x08\x77\x9f\x2d\xd6\x9c\xdc\x76\x4a\x60\
-\xb8\x2d\x67\x96\xbf\xba\xfd\xe6\xe7\x8f\xd8\xef\xe0\x03\xf7\x7c\
-\xe3\xe4\x64\xf6\x9a\xe2\x67\x5e\x51\xd7\xf7\x3b\x04\x1f\x9a\x59\
-\x79\x9c\xf4\x23\x71\x1f\x70\x93\x7e\x80\x14\x06\xb9\xab\xc3\x27\
-\xfe\xc6\x6b\xf3\x25\x12\x30\x94\x04\xa4\x44\x1a\xd0\xef\x8d\x3c\
-\xf6\x28\x80\x0b\xef\x01\xc0\x87\xfe\x40\x99\x7f\x70\x51\x81\x52\
-\x56\xd0\x81\x08\x37\x80\xa9\xb0\x92\x62\xfd\xb2\x0a\x46\xc9\x3f\
-\x60\x47\x10\x28\x81\x54\xc8\xb5\xe5\xaf\x49\x40\xb4\xba\x63\xd0\
-\x0a\x3a\xb7\xc9\x42\xb9\xfd\xbe\x58\x38\xa6\x73\x5b\xee\xfd\xda\
-\xad\x97\x9f\xfa\xe9\xcd\xf7\xdd\xb4\x59\x80\xa5\xda\x3a\xe9\x5b\
-\xde\x85\xa6\x73\x07\x86\x77\x01\xf2\x42\xe8\xf7\x3f\xe8\x41\x2b\
-\x0f\x9f\x98\xc8\x5e\x92\x65\xf0\x2c\x00\xf3\x8b\xd6\x16\x9e\x2e\
-\x45\xfa\x3c\x4d\xef\xb5\xd6\xdd\x49\xfe\xb1\xf6\x21\x39\xc1\x67\
-\x64\x6f\x20\x15\x01\x88\xbc\xc0\xd6\x4e\x04\x22\x4c\x3f\x40\x66\
-\xf9\x00\x64\xaf\xf1\xc8\x00\x0b\x0d\x42\xed\x47\x3b\xc7\xf1\xa8\
-\x42\x90\xed\x97\x18\x63\xf4\xf4\x81\x9d\xe3\x06\xf6\xe2\x10\x44\
-\x82\xb5\xf0\x1b\xa5\x60\x9a\x42\xea\xe1\x8b\xc4\x87\xa8\xef\xf6\
-\x16\xe7\xaf\x5a\x7b\xd3\x8f\x8e\xb9\xf3\xba\xb3\x6f\x60\x0c\xf4\
-\x22\x81\xa4\x0b\x44\x01\x84\x2c\x7f\x27\xfc\x0d\xdb\xe9\x27\x1d\
-\xb1\xf7\x3e\x0f\x58\xf1\x90\x89\x2c\xdb\x27\x03\x75\xe8\xc4\x24\
-\x3c\x2e\x03\x78\x5a\x21\x98\x87\x7a\x20\x94\x3d\x56\x40\xc8\x3e\
-\xe3\xcf\x83\xe3\xfb\x6b\xee\xc6\xa6\xfd\xca\xa3\xc0\x60\xab\xf8\
-\xfe\xa3\x70\x00\xa1\x48\xc0\x52\x45\x01\x00\x5c\xc1\x57\x8a\x08\
-\xbd\x56\x0c\x8c\x20\x04\xf0\x12\x79\xec\x71\xca\x85\xfe\x21\x68\
-\x1f\xb1\xfe\xa0\x58\xe2\x8f\x80\x22\x8c\x3c\x3b\x24\x60\x7d\x7c\
-\x3d\x09\x56\x27\x06\x20\x52\xb7\x64\xa0\x03\x0a\xb8\xff\xa5\xeb\
-\x2e\xfc\xd4\x71\x8b\x73\x1b\x16\x18\x03\x3d\x4f\xf6\x4a\x11\x7c\
-\xec\x98\x3f\x5c\xf9\x84\xc7\xec\xfb\x82\xe9\xe9\xc9\x3f\x2b\xde\
-\xfa\xb7\xca\xca\x33\x1a\x0e\x85\x61\x93\xc9\x50\x35\x2a\xc9\x1d\
-\x71\x83\xc8\x4f\x4e\x23\x3f\x5c\xe8\xed\x38\x6c\xf0\x04\x9f\xbe\
-\xe6\x2a\x01\x82\x0c\x46\x14\xfe\xad\x53\x0d\x28\xdd\xdf\x46\x0a\
-\x40\x8c\xf9\x6b\xe1\xa7\xfe\x3e\xc9\x0a\xe4\xd9\x7d\x40\x08\x44\
-\x31\x6a\xd0\x08\xb9\x78\xac\x9f\x25\x8e\xf0\x5f\x45\xc7\xfa\xf5\
-\x5d\xd2\xd2\x19\x8d\xf0\x5b\x7e\xa0\x9a\x08\x53\xf3\x00\x65\xa8\
-\xb0\x78\x3c\xbf\x7e\xf5\x55\xef\xfc\xcd\xa5\x9f\xbf\x80\xf8\xf8\
-\x5a\xf0\xe7\xea\x7d\xfe\xc8\x23\x1e\x96\xbd\xe1\x55\x8f\xfe\xe3\
-\x65\x53\x93\x2f\x2d\xde\xf2\xb9\x03\x9f\xd4\xa1\x47\x4c\x6a\x69\
-\x28\xed\x09\x93\x25\x05\xc7\x80\x23\x30\xed\x2d\x5a\x7e\xc6\xb0\
-\x23\xb2\xfc\x51\x5b\xf6\x04\x80\xd4\x91\x50\xe5\x6d\x15\x02\xeb\
-\xe0\x09\x9c\x3c\xa2\xe9\xdd\xd4\x9d\x43\xf7\xcf\xc8\xa4\x1f\xcf\
-\xef\x47\x5f\xf8\xc7\x91\xcc\xe9\x35\x05\xa5\xeb\x1a\xed\x5c\x4b\
-\x8b\xf4\xb1\x71\x62\xd0\xd2\xf5\x03\x00\x6b\xed\x81\x26\xfd\x50\
-\x08\x2f\x29\x07\xc5\xf9\x01\xf0\x5d\xf7\x21\x47\x8d\x7b\x0a\xa1\
-\x6a\xf6\xe2\xbb\x0a\x21\x1e\x17\xd0\x46\x06\x72\xcd\x02\x94\x4e\
-\x7f\x05\x08\xf2\x8d\xeb\x6e\xbd\xf0\x4d\xb7\x5c\xf1\xf5\xcb\x09\
-\xdc\xd7\x31\xe7\xaa\xc8\xe4\x5d\x6f\x78\xfc\xf4\x0b\x9e\xfd\xd0\
-\x63\x26\x27\xe0\x6f\x8a\xc7\x7b\xeb\xc4\x12\x1a\x4a\xb2\xc4\xa7\
-\xbf\xa8\x53\xac\x09\x0e\x63\x40\x1a\x8f\xf5\x2d\x1a\xb6\xbf\xfc\
-\x49\x27\x91\xaa\x13\xbc\x6b\x22\x22\x02\x7b\x5d\x2d\xfa\x74\x9f\
-\xf3\xad\x3e\xb2\xf7\x23\x79\xfe\xdb\x1c\xf6\x8f\x13\x01\x8c\xee\
-\x5d\x36\x22\x00\x70\x58\x16\x56\xf4\x63\xc2\x84\x8a\x91\x7f\x8c\
-\x04\x0c\x85\x05\x23\xb9\x01\x10\x23\xff\xd0\x42\x7c\xa7\x32\xd0\
-\xe9\xed\xac\x41\x0a\x1a\xeb\x6f\x19\xdd\x9a\x7c\xd4\x28\x20\x2f\
-\x1f\xe7\x9b\x57\xdf\xf8\xc3\xff\x7b\xfb\xaf\x4f\xbf\x96\x08\x3f\
-\x2d\x2f\x9d\xff\xd1\xb7\xfe\xfc\xd9\xcb\x97\x4d\x7e\xbc\x38\xfa\
-\x00\x47\x0f\x32\xdf\xd4\xb1\x62\x10\x16\x0a\x08\x14\x3d\x26\xcb\
-\x20\x8c\xba\xee\x1a\x50\xc1\x98\xe4\x20\xac\x10\x7c\xd7\xcd\x13\
-\x78\x07\x61\xba\x7f\x03\xe2\x73\x68\x22\x3a\xd4\xf7\x57\xb4\x18\
-\x8c\x94\x87\xc7\x92\x7d\xc6\x46\xfc\x25\x91\x80\x2a\x52\x09\x48\
-\xd6\x37\x0f\x0f\xaa\x25\x25\x01\x95\xb3\xba\x41\x67\x58\x28\x4b\
-\x0a\x82\x20\xf4\x2e\x07\x00\x5e\x06\x61\xd0\xa7\x6d\x01\x27\x6d\
-\x5a\x0f\x6d\xd6\x40\x9f\xc5\x5a\x49\x64\x35\x01\xa8\x95\x42\x4d\
-\x48\xd6\x0b\x22\xcf\x2b\xbe\x6e\x7e\xcd\xcd\x3f\x7e\x1d\x11\xfe\
-\xc5\x5a\xe8\x67\xea\x7d\xfe\xc2\x33\xff\xe2\x4d\x85\xd5\x3f\xd6\
-\x24\x9a\x80\x72\x4b\x9e\x41\x31\xa8\xea\xfb\xff\x10\x4a\x6d\x06\
-\x90\x85\x79\x1c\xb1\xe6\xa8\xe2\x68\x40\x05\x30\x5e\x45\x20\xff\
-\xc4\x3e\x3a\x52\x12\x02\x50\x20\x2a\x08\x7b\x9d\x7d\xab\xcf\x91\
-\x83\x34\x00\xa4\xc9\xf2\x2f\xed\x10\xe0\x50\x31\x59\x9b\x71\x61\
-\x4b\x49\x02\xea\xc2\x1a\x1d\x05\xa0\xee\x00\x67\xf3\xb9\x0b\x00\
-\xd6\x3a\xc7\x39\x00\x68\x77\xb1\xbd\x7c\x7f\xf2\x3e\xac\xbd\x13\
-\x30\x46\x50\xe7\x09\x58\xf8\x30\x58\x10\xeb\xef\xbe\xea\xdd\xb7\
-\x5e\x71\xda\x95\xb5\xf0\xd3\xea\xb2\x4a\xf8\x2f\x3a\xeb\x85\xef\
-\x98\x00\x3c\x46\x27\x9a\x80\x29\x7f\x26\x99\x67\x9c\x78\xd2\xfe\
-\x26\xaa\x04\xf8\x1f\x48\x15\x80\x34\xc1\xc6\x51\x91\x41\x13\xfa\
-\x10\x14\xc1\x58\xc6\x63\x33\x8e\x03\xa4\x0c\x50\x24\x7e\xbf\xe2\
-\xa5\x66\x56\xa9\x8a\x56\x9f\xfe\x05\xf9\x3d\xb6\x89\xe5\x1f\x0b\
-\x02\x50\x42\x1a\xf0\x12\x22\x00\x50\xe0\x44\x02\xb8\xb5\x07\x9e\
-\x17\xc0\xb2\x06\x7d\x0e\x00\x6c\xc3\x85\x20\x0a\x68\x90\x78\xe2\
-\xe5\x57\x29\xc7\x99\xe3\x0f\x98\x8a\x3f\x55\xa7\xef\xe6\x64\xd6\
-\x9b\x2e\x05\xa4\xeb\x79\x6e\xcb\xda\x93\xaf\xbb\xe8\x84\xef\x33\
-\xcb\xbf\xb9\x16\xfe\x85\x8b\xcf\xfa\xf3\x37\x4c\x00\x1c\x43\xb3\
-\xcc\x32\x60\x0c\x33\x61\x9f\xcd\x02\xcd\xe8\xad\x4e\x3c\x89\x2d\
-\xb0\x21\x20\x80\xb0\x98\x71\x18\x64\xd0\x96\x8f\xc0\xe1\x92\x4f\
-\x00\x1a\xc8\x66\x91\x10\x0c\x28\x1d\x60\x02\x0e\xee\xf3\x28\x58\
-\x7d\x14\x74\x59\x28\xd1\x67\x98\x4a\xbf\xf6\x5e\x3f\x32\x1b\x1e\
-\xaa\x04\x6c\xee\x10\xb4\x44\x2e\x40\x40\xe8\x8d\xff\xaf\x98\xd0\
-\x03\x4b\x05\xae\x11\x80\x3e\xd6\xfb\x85\x21\xb2\x06\x9b\xf0\xa7\
-\x6e\x01\x96\xd7\x46\x1e\x45\x64\x01\x9a\x30\x80\x01\x12\x40\xd2\
-\xfa\xa9\xdf\x9b\xbf\xea\x9a\x1f\x7d\xec\x93\xc4\xe7\x77\x2d\xff\
-\x99\x47\x1c\x59\x9c\xf9\x87\xab\x4c\xc1\x0c\x94\x13\xfc\x00\x5b\
-\x7a\x4c\x38\xc0\x3a\x34\x45\x98\x67\x07\xc6\xfa\x3d\x4b\x52\xa4\
-\x0e\x00\x5a\x0b\x6e\x14\x19\xb4\x1a\x6d\x80\x61\xd7\xa0\x35\x11\
-\x19\x66\xfe\x9b\x88\x41\xc7\xda\x93\xee\x4f\x40\xf2\xb9\xc1\xc9\
-\x51\x89\x5b\xfd\xad\x6e\xf9\x5b\x21\x00\x6a\xf1\x95\x3f\x04\xc4\
-\x43\x00\x4b\x14\x05\x00\x89\xcc\x73\x18\x7f\x25\x70\x00\x9c\x38\
-\x74\xd8\x1a\xb7\x3c\xd8\xe1\x19\x30\x6d\x45\x3b\xe4\x1f\x12\x37\
-\x03\x2b\x5f\xdf\x72\x02\x35\xd1\x57\x0b\xbb\x5d\x3a\x75\x5a\x30\
-\xa8\xc5\xbb\xae\x3d\xe7\xbd\x0b\x83\x38\x3f\x25\xfc\x2a\xcb\xff\
-\xb3\x33\x9e\xff\xbb\x13\x13\x70\x42\xb9\xc0\xb2\x6c\xe0\x5e\xd0\
-\xf2\x51\x27\xd1\x84\x96\x95\x7a\x84\x15\xbd\x96\x31\x21\x88\xc9\
-\x20\x0e\xb5\xc8\x60\x14\xf2\x10\xf8\x7b\xe1\xe8\x4a\xa5\x41\xa1\
-\x51\xa8\x1f\x74\x09\xbc\x08\x80\x74\x31\x51\x41\x3c\x61\x74\x1b\
-\xf9\xfc\xa9\x1c\x40\x8c\x07\x18\x4f\x19\x70\x58\x01\x48\xec\xab\
-\x47\x79\x93\x5c\x00\xc8\x7c\x0e\x80\x90\x7e\x83\xa3\x33\x31\x0a\
-\x00\x91\x82\xa1\xf8\x65\x23\xec\xb1\xdb\x5a\xc8\xeb\x09\x60\x2c\
-\x43\x6e\x79\xe7\x52\x98\xe7\x36\xad\xfd\xd2\x1d\xd7\x9e\x7d\xb3\
-\xb2\x2d\xa5\x0c\xe1\x77\xce\x57\x9f\xbd\x7c\x6a\x02\xbe\x51\xbc\
-\xdb\x0a\x3a\x22\x4a\xa7\x95\x66\xc0\x8a\x4c\xc0\x1d\x1f\xe1\xfa\
-\xae\x6c\x61\x43\x40\x00\xb0\x81\xab\x53\xcd\xf3\x86\x52\x2c\xf4\
-\x50\x8c\x3f\xf8\x8a\xa0\xad\x52\x81\x06\xe8\x23\x46\x49\x3c\xd7\
-\x20\xa0\x1c\x5a\x0b\xbe\xda\x0e\x84\x7f\x58\x05\x30\x5e\x45\x30\
-\x19\xbb\x5a\x40\xea\x2a\xc1\x49\xf9\xb5\xfe\xbc\x55\x04\x94\x04\
-\xcc\x18\xe1\x47\x05\x5e\xaa\x21\x90\x7f\xf8\x41\x8c\x3f\x13\x2e\
-\x89\xb5\xf4\xc6\x0b\xc2\x81\x32\xaa\x16\x49\x8e\x36\xd5\x97\x92\
-\x7f\x5a\x5b\xe4\xfd\x8d\xd7\x5f\x74\xe2\x89\xc4\xef\xd7\x7d\xe4\
-\x4b\x45\xd0\xbf\xdf\xaa\xe9\xc2\xe7\xc7\x43\x9c\x06\x12\xf5\xe2\
-\x2a\xd1\x80\x5b\x66\x0a\x6e\xa0\x83\x32\xd2\xe0\x5b\x3c\x6e\xe5\
-\x54\x0b\x0a\x20\x28\xd7\x98\xce\xea\x41\x5b\xc6\x1f\x42\xaf\xe3\
-\xd0\xe0\x42\xfc\xbd\xa5\x4b\x12\x22\x75\x55\x00\xea\x37\xa0\x9f\
-\x58\xbe\xff\x56\x0b\xff\x0f\xed\x02\xc4\x08\xc0\x71\x28\x00\x69\
-\xa1\x38\x3e\xbf\x2d\x01\x76\x04\xdf\x10\x7b\xae\xd0\x0f\x80\x01\
-\x41\x0b\x59\xa0\x38\x28\x62\x72\x1c\xe1\x77\x7a\x7f\xda\x76\x60\
-\x92\xf3\x80\x75\x59\x32\x62\x9f\xf4\x27\x40\x93\x26\x30\xbb\x69\
-\xf5\x57\xb6\xac\xbf\x75\x8b\xb2\xad\xa4\x75\x73\x89\xde\x25\x67\
-\x3d\xff\xc9\x85\xb0\xff\xa3\xad\x2b\xb7\x39\xe6\x03\xe1\x07\x37\
-\xec\x07\xa4\x01\x85\x1f\x1c\x71\x19\x6c\x68\x21\x10\x2d\xa2\x00\
-\x8e\xfc\x60\x02\x2e\x8f\xa1\x02\x68\x3c\x39\xb7\x83\x92\x1a\x43\
-\x1e\x01\xa4\xa1\x0a\xf4\x2e\xa2\x4b\xf0\x85\xbe\xb9\x56\xc0\xc1\
-\x0e\x53\xb0\xad\x52\x7f\x52\x48\xc0\x38\x01\x38\x6a\x53\xb0\x49\
-\x0e\xf1\x64\x0e\x80\x76\xf5\xe1\xf0\x9e\x08\x3d\x28\x5b\x34\x44\
-\xa9\xf0\x5a\x69\x84\x7e\x59\x00\x9b\xa8\x23\xe2\x4e\x89\x08\xd0\
-\x0a\x90\xd4\x75\x9b\x99\xe9\x60\x61\xbb\x49\x00\xaa\x6e\xb3\x72\
-\x80\xe4\xcc\xcd\x97\x7f\xfd\x6b\xca\xf6\x94\xd3\xe9\xbd\x8b\x9f\
-\x3c\xf6\x29\x65\x66\xc0\xf1\xc5\xf1\x13\x66\x8a\x0c\x0b\xf5\x01\
-\xcd\x47\xf7\x38\x80\x70\x02\x10\xef\x81\x20\xcd\x1b\x90\x48\xb1\
-\x34\xf3\xdd\xd8\x46\x41\x46\x05\x18\xbf\xd2\xc1\x53\x49\xfd\xfb\
-\xe4\x8c\xc0\x36\x2f\x62\xc0\x5d\x88\x71\x0d\xd8\xfe\x73\x77\x18\
-\x17\xa0\x2d\x13\xcb\x15\x00\x34\x59\x20\x9b\x03\x60\x05\xdf\x12\
-\x7d\x95\x9d\x06\x3f\xf5\xd7\x2f\x08\x62\xa9\xc3\x2c\x84\x33\x52\
-\x5c\x19\x91\x21\x91\x3a\xaf\xba\x42\x02\x68\x2b\x01\xcb\xf1\xd1\
-\x73\xf7\x9d\xbb\xfe\xee\xab\x36\x10\x05\xa0\x27\xc8\xe6\x4f\x78\
-\xcc\xde\x7f\x56\x1c\xf3\x58\x9b\xfb\xc0\xaa\xca\x1c\xcb\xef\x13\
-\x80\x4e\x1a\x2a\x13\x7c\x37\x51\x05\x05\xff\x1e\x93\xfb\xa1\xb6\
-\x66\xe2\xb1\xd9\x3d\x68\xed\x1a\x78\xdc\xc0\x08\x48\x00\x23\xd2\
-\x88\x28\xe9\x80\xa8\x7e\xa1\x85\x5f\x51\xc1\xc7\x6d\x2c\xf3\xa9\
-\x2e\x80\x8a\x95\x05\xab\xd1\xf2\x00\x78\xfb\x0e\xe7\x46\xc7\xf9\
-\x4d\x4d\x40\x16\xa8\x03\x70\xb3\x02\x81\x47\x04\x68\x4f\x40\xaf\
-\xa7\xa0\x94\x05\x17\xfb\x85\x58\xca\xaf\xae\xd2\x25\xcd\x3c\x07\
-\xc2\x4f\x5a\x7d\xe9\x16\x65\xc5\xdd\x8d\xab\xaf\x39\x93\xf8\xfe\
-\xba\xaa\xaf\x7f\xf1\x77\x9e\x53\x26\x04\x1f\xed\x24\xf5\x38\x3d\
-\xe4\x29\x0f\x1a\x16\xfe\x90\xe0\x0b\xcd\x8b\x7d\x59\x6c\x10\xb2\
-\x24\x65\x10\x73\x11\x5a\x4e\x36\xc7\x94\xf3\xf0\x34\x07\xb6\x3f\
-\x3f\x95\xee\x26\x35\x0a\x7d\x83\x64\xc3\x76\x55\x58\x39\x0a\x02\
-\x90\x6e\x87\x74\x01\xc2\x33\x10\xc0\xfa\xdc\x64\xae\x3a\x15\x72\
-\xa8\xe0\xbd\xdb\x07\x00\x68\x16\x0c\x58\xee\x38\x63\xf9\x01\x1e\
-\xee\x00\x01\xea\x2b\x2a\xef\x72\x27\xe0\x0a\xda\x1b\xf8\xaf\xc5\
-\x2f\x33\x0d\x40\x74\x8b\x80\x3e\xf6\xee\xbe\xfe\xe2\xcf\x5f\xa6\
-\xdc\x0a\xbf\xaa\x89\x47\x21\xa8\x8f\x2f\x6e\x7f\x9f\xd7\x3b\xf1\
-\x96\x53\x1a\xad\x50\x12\xd0\x66\x08\xc6\x05\xdf\x55\x82\xed\x7c\
-\x7c\x95\xc6\xc1\x45\x5d\x84\xa4\x36\x9d\x44\xaf\x82\x6a\x19\xff\
-\x87\xb0\x12\x48\xb6\xba\x2d\x6a\x22\x00\x40\xb6\xa6\xdb\x9b\xd5\
-\x6f\x8b\x00\x3c\x44\xb0\x84\x08\x20\xc6\xc8\x53\xa8\xef\x44\x01\
-\xa8\x5b\x40\x1f\x1b\xa1\xa7\xe9\xc1\x9c\x20\xe4\xc2\x1e\x2a\x0c\
-\x42\x25\xf7\xfd\xd7\x66\x1e\xea\x28\x81\x22\xe9\xb6\x99\x32\x89\
-\x41\x35\x89\x58\xf8\xfc\xa6\x80\xa9\x6c\xe0\xa9\xdc\x2a\xbf\x72\
-\xef\x5f\x78\xc6\x9f\x94\x97\xf0\xc5\xd6\x87\xa7\x31\xff\xba\xbb\
-\x20\xd8\xbc\x02\x37\xfb\x0f\x89\x92\x60\xe9\xc8\xe0\x32\x4c\x88\
-\xd8\xe0\xef\xca\x74\x87\x28\x14\xd0\xb0\x9a\x21\x0e\x99\x31\xd1\
-\x3d\x80\x50\x25\x72\x23\x22\x40\xd9\x46\x41\xba\x90\x63\x83\xd0\
-\x37\x91\x5f\x00\xe3\xf0\x92\x47\x11\xf6\xbe\xca\xf3\x79\xdf\x5b\
-\xad\xef\xe4\xfd\x59\x87\x0b\xb2\x4d\x7e\x90\xcd\xff\x1c\x3c\xce\
-\xeb\xfb\x79\x89\x55\xb3\xe5\x55\xf9\x7a\x59\xca\xd2\xef\xcf\x8c\
-\xca\x01\x84\x32\xcd\x32\x46\xfe\x51\x3e\xc0\x5a\x7b\xda\x2d\x08\
-\xc0\x3d\xde\x99\x29\x00\x4a\xb9\x95\x82\x52\x87\xe1\x14\xc0\x47\
-\x93\x80\x90\x4c\xfb\xc8\xab\xe7\x90\x4c\x77\x1d\x9c\x5b\xd9\xe1\
-\x37\x53\x73\x1b\xef\xba\x84\x29\x80\xf2\x36\xcf\xb2\xf2\x55\xf5\
-\xbc\x4c\x18\x1b\xad\x4f\x29\xab\xbf\x52\x46\x78\x00\x07\xfe\x33\
-\xab\x4f\x09\xa8\xf2\x14\xbc\x34\x54\xd2\xb6\xae\x51\x88\x13\xac\
-\x17\xa6\xf6\x0c\xc0\x66\xc1\xf3\x24\x14\x03\xa7\xd0\xe4\x9e\xb0\
-\x76\xea\x6d\x37\x99\x17\x4a\x17\xfa\x91\xe5\x37\x5f\x28\x96\x50\
-\xb1\x44\xf2\xc5\xe2\x76\x71\x60\x7a\xfa\x73\x75\xe6\x5d\xb1\xa6\
-\xfa\x73\xb5\x2c\x2f\x96\x1d\xe1\xd3\xe9\x2a\x66\xe4\xad\x02\x40\
-\xb9\xf7\x67\xdd\xbb\x26\xcf\xad\x62\x28\x95\x41\x29\xfc\xe5\x6d\
-\x6f\xa6\x37\x62\x14\x20\xb0\xf0\x28\x07\xe0\x0b\x7e\x6d\x71\x81\
-\x35\x07\x25\xa1\x42\x6f\x78\x88\xe1\x11\x33\x89\x72\x0c\xac\x4c\
-\x66\xb7\x30\x17\x9a\x80\x90\x10\x91\x09\x02\x0c\x42\x8f\x15\x02\
-\xa8\x53\x81\xd7\xdd\x76\xe9\x2f\x88\xff\xaf\xfb\xf7\xe9\x52\xa1\
-\x47\x72\xa1\x84\x2c\xb3\x9d\x64\x40\xee\x56\x03\x75\x8f\x41\x9a\
-\x66\x40\xc7\x50\xeb\xf3\xcb\x02\x46\x12\x13\xdd\xfc\xd4\x28\x00\
-\x02\xa6\xb9\x13\x49\x69\xc8\xd8\xfc\xe7\x31\xb7\xc0\x41\x11\x2e\
-\x22\x00\x48\xc8\x6e\x4a\x84\xb6\x30\x54\x6a\x72\x6d\x81\x0b\x21\
-\x57\x85\x90\x97\xf7\xcb\xdb\x4a\xe8\xb5\xe0\xef\x02\xdb\xa4\x6a\
-\x10\xbe\xa8\xe0\x1b\x41\xc8\x14\x0d\x15\xd2\x2c\x41\x2a\xf0\x10\
-\x9a\x27\x28\xfc\x92\xc1\x8c\xb3\x5a\x94\x9c\x08\x2a\x0c\xd4\xa1\
-\x09\xb5\xa1\x0d\x01\x0e\xce\xa1\xec\xf6\xd3\xdf\x78\xd7\xf5\xdf\
-\xbf\x4b\xb9\xcd\x3c\xf3\x9f\x7d\xeb\xf1\x25\x3b\x50\x7c\xf4\xc4\
-\x44\x59\x58\x54\xe5\xfc\xab\xc1\x2d\x40\x5e\x7f\x27\x24\x2e\x11\
-\x4f\x23\x05\xb7\x0d\x22\x2b\x40\x01\x64\xdd\x6b\x98\x00\x80\x4a\
-\xe0\x08\x31\x5d\x19\x80\x43\xfc\x25\xb8\x08\x3c\x27\x00\x12\x14\
-\x01\x06\x94\x56\x02\x51\x08\x21\x28\xd2\x2a\x95\xb8\x4d\x80\xa8\
-\xb0\xce\xfd\x52\xa8\xe7\x6a\x81\x9f\xaf\xf7\x85\xed\x8a\xfe\x1b\
-\xfd\xc0\x71\x22\x00\xc7\xcc\x29\xc2\xf0\x67\xd6\xc2\x81\x4e\xc8\
-\x61\x90\xbf\x12\x38\xde\x3e\x8c\x0b\x3e\x08\x53\x87\xda\x5d\x3e\
-\xe0\xcc\x98\x99\x15\x58\xbb\x01\x5a\x29\xd4\x21\x26\xec\x2d\xde\
-\xac\xdc\xde\x7e\x55\x03\xcf\xfe\x7c\xa1\x13\xfa\xab\x55\x36\xb9\
-\x4a\x4d\x4d\xdf\xaf\x78\x9b\x15\x4e\x71\x8f\xa1\x36\x68\x07\x19\
-\xc9\xfa\xb3\xea\x40\x67\x0a\xb1\xce\x71\x80\x04\x27\x5f\x42\xfe\
-\x4d\x42\x92\xd0\x58\x04\x9d\xa1\x9b\xcd\xae\x01\x26\xb0\x73\xad\
-\xf9\x81\x16\x03\x94\x01\xda\x0b\x45\x29\xd8\x79\xe1\x0f\x97\x3b\
-\x96\xb7\xa5\xff\x5d\x26\x83\x75\x5b\x82\x02\x10\xb5\xb4\x9b\x03\
-\x60\x7a\xfe\x39\xb1\x7e\x45\x18\xfe\xcc\xab\x0e\x34\x63\x5a\x44\
-\x0e\x40\x70\x01\xcc\x81\x18\x11\x16\x3d\xe8\xd3\x8e\xf4\xd2\x5c\
-\x1b\xd6\x44\x60\xb5\x38\x0b\x08\x5f\xac\x86\x4a\x5d\xf4\x71\xf1\
-\x6e\x65\x7b\xfc\x99\xb6\xdd\xba\x76\x1f\x7b\xeb\x55\x2f\x5f\xaf\
-\x26\x26\x57\x28\x35\xb5\x97\xca\xa6\xf6\x2c\xde\x73\x52\xd1\x32\
-\x33\xdf\xfa\x2b\x7f\xd2\x19\x4f\x00\x22\x7e\x80\x0c\x06\x84\xf1\
-\xe3\xe0\xba\x10\xcd\x49\x3e\x89\xca\x00\x22\x8a\x00\x22\x8a\xa0\
-\x41\xf1\x88\x55\xcd\x10\x76\x09\xdc\x91\xdf\xf2\xe7\x37\x52\x19\
-\xa5\x5f\x9e\xcf\x0c\xac\x7a\x2d\xf4\xa3\x54\xc5\xed\x28\xdb\xb8\
-\x01\xc1\x24\x80\xf2\x12\x3a\x9c\xc5\xec\x84\xff\x54\xed\xdf\x13\
-\x6b\xaf\x0b\x82\x88\xe5\xd7\x68\x81\x2a\x0b\xb7\x22\x10\x64\xc2\
-\x4f\x50\x42\x88\xa2\xcb\xef\xae\xaf\x6c\x60\x26\x41\x77\xfe\xd1\
-\xd1\x80\xaa\x09\x68\x1d\x0e\xcc\x7b\x9b\x95\x3b\x70\x22\xff\xf1\
-\xff\x3c\xc8\xcf\xa2\x2f\x16\x54\x8e\x73\x6a\x71\x71\xb5\x9a\x98\
-\xda\x5d\x4d\x56\x8a\x60\x0f\xe2\xe6\x50\xe2\x8f\x5a\x7f\xf4\x2d\
-\x38\x53\x16\x00\xf1\x16\x61\x48\xc6\x9b\x39\x17\xa0\x69\x41\xe0\
-\x90\x2b\x07\x13\xf5\x89\x98\x47\x80\x9e\x4b\x20\xbe\x25\xc6\xd0\
-\x06\x26\x2f\xea\x12\xca\xe7\xbd\x2d\xc5\xbe\xa9\x50\xd6\x5b\x76\
-\x19\x1f\x7d\xab\x21\x00\x08\xb8\x00\x40\x13\x7d\xa8\x70\x83\x5b\
-\x01\x08\x8e\x0b\xa0\xd8\xb8\x30\x20\x10\x59\xb1\x11\xe1\x21\x33\
-\x17\x6e\x97\x04\xc6\x9a\x6a\xc8\xef\xff\x2d\x9a\xa2\xa4\xbe\xe6\
-\x03\x66\x88\x8f\xa0\xfb\xf6\x2b\x13\xc0\xc8\xdc\xa1\x47\x55\xbb\
-\xf0\x7c\xb3\xea\x2d\x6c\x56\xd9\x62\xe1\xec\x4c\xae\x54\x93\xd3\
-\xab\xaa\xdb\xe0\xd8\x32\x48\x30\xcc\x29\x6e\x39\xa6\x77\xa1\xa5\
-\x41\x9c\x46\xce\x40\xb0\xc8\xa9\xae\x41\xaa\xdf\x00\x29\x91\x82\
-\x94\xc2\xa2\x42\x69\x57\x02\x5f\x5a\xf7\x52\xe8\x59\x38\x6d\x57\
-\xdb\x10\x97\x58\x01\xc8\x0b\x9a\xf8\xea\x0e\x11\x68\xc9\x38\x27\
-\xd3\x8f\xb8\x00\x83\xd7\x32\x3b\x43\x10\xa8\x0b\x60\xff\xde\x73\
-\x02\x5a\xb7\xb3\xca\x6a\x81\xa7\xd1\x81\xda\x0d\xa8\xef\x57\x43\
-\xc0\xf3\x2a\x4e\xe3\x29\x00\x51\x88\xbd\xd3\xa9\x95\xc1\xfc\x66\
-\xd5\x5f\xc8\x0a\x37\xa1\x44\x06\xb5\x32\xe0\x56\x5e\xc9\x9c\x81\
-\x08\x61\x02\x6b\x9f\xa3\x04\x4c\x14\xd0\x46\x32\x3c\x90\x1b\x10\
-\x8d\x1c\x80\x92\x8b\x87\xb0\x05\x94\x80\xf8\x7b\x6b\x24\x50\xfe\
-\x44\x79\x6f\x43\x21\xf4\xa5\xa5\xaf\xf5\xf5\xae\x30\x52\x05\xdb\
-\x09\xfd\x38\x95\x41\xb4\x18\x48\xb1\xde\x7f\x3a\x23\xd0\x21\xf9\
-\x78\x38\x70\x40\x08\x78\xed\xc4\x68\xbd\x2c\x28\xb9\x4e\x80\x9a\
-\x49\x7f\x78\x08\xb2\x89\xbe\xaa\x16\x7a\x55\x67\x02\xeb\x1a\x80\
-\xdc\x66\x1f\x9a\x11\x64\x99\xb6\xee\x14\x32\xa0\xcd\xe2\x03\x2f\
-\xd7\x3f\xf3\xb2\x01\xc1\x14\x03\xa9\xbc\x54\x04\x9b\x55\xbe\x38\
-\x51\x28\x83\x3d\x0a\x45\xb0\x87\x52\x13\xbb\x47\xb4\xf7\x88\x23\
-\xc2\x63\xe1\x70\x90\x57\x46\x62\xf5\xae\x4b\x56\x86\xce\x55\x92\
-\x5b\x50\x8d\x91\x02\xf1\x15\x0f\xd8\xf5\x55\xbf\xb7\xb1\xb8\x96\
-\x1b\x2a\xf7\x2b\x99\x50\xec\xac\xf8\x98\x14\x40\x04\xb7\x02\x63\
-\xf5\x81\xe5\xc8\xda\xec\x3f\xca\x13\x70\x25\x91\x91\x29\x42\xae\
-\x52\x81\x40\x08\x50\xce\x83\x16\xaa\xc2\xb4\xd0\x67\xf9\x60\x45\
-\x62\x6e\x2c\xbe\xf7\x79\x2a\x73\xfd\x08\x95\x3e\xa3\x04\x82\xa7\
-\xd9\x2f\x2c\xd5\xfa\xc2\x62\x6d\xa8\x72\x06\xb2\x6c\x85\xca\x26\
-\x0a\x85\x30\xb1\x5b\x71\xe0\x54\x33\x9b\x9d\x22\x70\x6d\x15\x05\
-\xca\x11\x05\x6c\xaa\xf7\x27\x53\x73\xa3\x49\x45\xd1\x68\x01\x26\
-\x5a\xfd\xbc\xa2\x64\xf2\x52\xf0\x7b\x5b\xe8\x2f\xa2\xc4\x0e\x7d\
-\x3b\x91\x12\x48\x5d\x07\xb8\x95\x94\x49\x30\x11\xc8\xd0\x75\x3a\
-\x9e\x4f\x70\x29\x90\x7e\x80\x7e\x54\x80\x42\xfe\x4c\x68\x17\xa6\
-\x0c\x37\xe0\x28\x9a\x14\x2a\xdb\x91\xdf\xdc\x5c\x38\x5b\xef\xed\
-\xf6\x11\xc0\x6a\xea\x6f\xfd\xd9\x59\xd8\x0b\x07\x1a\xac\xa0\x91\
-\x4a\x36\xf5\x8c\x8f\x3e\xa4\xaf\x95\xe7\x93\xe7\x5b\x8a\xb5\xbd\
-\xa5\x40\x07\xc5\xc7\x4d\x2c\x53\x50\xa0\x82\xd2\x5d\x28\x43\x8b\
-\x29\xca\x45\x54\x08\x89\x71\x72\x71\x41\xb4\x59\x25\x20\x10\x7a\
-\x80\xcd\x0a\x43\x44\x19\x12\x41\x88\xaa\x5f\x42\xfb\xc5\x8d\x15\
-\xc4\x57\x18\x2a\x56\x00\x99\x1c\xdc\x15\x94\x80\x72\x7b\x7d\x78\
-\xab\x5e\x08\x18\x29\x1c\x6d\x76\xf1\x64\x93\xb5\x03\x42\xd6\xd9\
-\x12\xe0\x52\x9e\x32\x37\xd6\x9f\x31\xb2\xd0\xc9\x1f\x70\xe9\x6f\
-\x70\x7c\x75\x4e\x3a\x36\xad\x76\xed\x40\x67\x96\xe5\xb7\xc9\xf6\
-\xa6\x30\x08\x06\x1d\x3c\xf4\xb8\x2f\x39\xe5\xd6\x13\x62\xa5\xc6\
-\x31\x86\xaf\x0a\x3c\xe0\xbc\xc2\x5e\xb1\xf7\xef\x1d\x5c\x87\x0a\
-\x1d\xac\x28\x6e\x97\x17\xe7\xb6\x22\x09\xed\x63\x0b\x01\x16\xeb\
-\x62\x22\x91\x04\x4c\xb9\xcc\xaa\x45\x8a\xb1\x28\xa4\x58\x29\xc5\
-\x92\xc4\xab\x7c\x7a\xcc\xfd\x70\x21\x86\xe0\x0a\xa6\x73\x09\xbb\
-\x92\x4b\x30\xe6\xef\x3f\x09\xc4\xe4\x8b\x59\xb8\xbc\x0a\xb0\xf6\
-\xf1\x4d\x53\x50\xc3\xe8\x67\x0e\xf1\xe7\x34\x06\x05\x56\x16\x2c\
-\x4d\x06\x16\xb1\x32\x28\x69\x4c\x92\x6d\xfa\x91\xb3\x34\x62\x9a\
-\x67\x36\x08\xff\xe9\x5a\x00\x80\xac\x71\xed\xea\x3d\x03\xf7\xbe\
-\x0a\xe8\x09\x49\x6f\x40\xe0\x57\x2b\x63\xd6\xfd\x7c\xc6\xd2\x9e\
-\x85\x22\xa8\x14\x02\x14\x48\x21\x5b\x56\x3c\x37\xd1\x1e\x1d\x28\
-\x15\xad\xbe\xf5\x85\x8d\x71\x04\x10\xe1\x08\x78\x32\x53\x2c\x2a\
-\xe1\x18\x7c\x1c\x24\xe2\x94\x42\x5f\x59\xfa\xbc\xf9\xdc\x50\x26\
-\x19\x76\x56\x24\x80\x43\x28\x09\xfa\xdb\x8f\xf3\xeb\x1b\x12\x10\
-\x24\x4d\x0c\xd9\x02\xef\x0a\xc4\xdd\x01\xc5\x2b\x06\x6b\xa5\x61\
-\x92\x83\x14\xe5\x05\x38\xe4\x17\xb8\x81\x86\xaf\xe8\xd6\x07\x66\
-\x8a\x4e\x4a\x45\x92\x0d\x68\x14\x55\xce\x45\x55\x80\xfe\xd4\xef\
-\x31\x4a\x4f\xd9\xf6\xdf\x40\x4a\x99\x49\x4f\x00\x02\x93\xd8\xf7\
-\x63\xcd\x2b\x3d\x48\x57\x2a\x84\xd9\x42\x21\xcc\x92\xe3\x26\x2b\
-\x45\x60\x76\xb5\x8c\xd5\x4c\x70\x2b\xdf\x3c\x14\x00\x42\xd6\x06\
-\x13\x3d\x8c\x10\x3f\x80\x8c\x07\xc9\xe7\xaa\x54\xdb\x0a\xf1\xe4\
-\x73\x16\x37\xb0\xd6\x61\x4d\xd1\x80\x04\xa6\x71\x87\x55\x02\xe3\
-\xb6\xf6\x4b\xc7\x01\x38\xb3\x17\x60\xb3\x72\xda\xff\x83\x63\xf1\
-\x41\x31\xab\x0e\x8c\xf9\x57\x8c\x28\xa4\xae\x84\x60\xfd\x81\xd9\
-\x5a\xbf\x4d\x18\x1f\x8b\x9c\x9b\x8b\x81\x4e\xb1\x8e\x2e\x0b\x06\
-\xa3\x14\x20\x83\xf0\x0a\x07\x88\x58\xdf\x61\x86\x98\x42\xc3\x43\
-\x1f\x56\x97\x89\x2d\xd8\xef\x29\xd5\xdf\x42\x0e\x9c\x18\x28\x06\
-\x98\xae\x48\x45\x28\x89\xc5\xac\xbe\x8d\x41\x68\x49\x19\xd0\x90\
-\xa2\xa0\x19\x1a\x6b\x0f\xea\x73\x1c\x14\xcc\xcc\x57\x55\x71\x65\
-\x35\x5c\x28\x21\xc7\x95\x5f\x3f\xd3\xcc\xa3\x17\x20\x86\x42\x04\
-\x6a\x70\x67\x71\x07\x50\x46\x76\xee\x14\x61\xf9\x67\xd1\x9c\x41\
-\xbf\x8f\x8b\x23\x29\x00\x50\xce\x70\x1d\xfa\x11\x77\xbb\xf9\xfd\
-\x75\x91\x9d\x86\x0c\x59\xc6\x72\xfd\xed\x2f\x0c\x8e\x79\xcd\x1c\
-\xa1\xb7\x6d\xc4\x28\xe3\x08\xb2\x58\xb9\xf3\x9c\x07\x5f\x7b\x30\
-\xcf\xaf\x4e\xfb\xc5\x5a\xa0\xf2\xda\xe7\xef\xd7\xb3\x00\xa0\x9e\
-\x1d\xa2\x13\x82\xa0\x99\x03\x88\x91\x7c\x29\xaf\x4b\x82\x18\xac\
-\xa3\x65\x3a\x90\x29\x05\xac\xad\x6b\xd9\xd8\x14\xd5\xbc\xcf\xc2\
-\x57\x4a\x00\x2a\x17\x62\xa0\xe8\x26\xed\xf3\x8a\x23\x87\xe9\xc8\
-\xfa\x5b\xac\xaf\x27\x79\xae\x2c\x96\xa9\x72\x27\x7a\x83\x32\xd7\
-\xea\x3c\x16\x45\xb8\x1f\xb3\xce\xbe\x12\x70\xd9\x43\x31\xfd\x80\
-\x0b\xb6\xae\xf0\x54\x6a\x87\x8d\x0e\x20\x26\x10\x7a\xca\x2d\x03\
-\x0e\x1d\x2f\x91\x84\xf3\x0b\xd5\x24\xab\x31\x46\x01\x8c\xcf\xd7\
-\xbf\xc1\xb4\xdc\x2c\x63\xe3\x4e\xf9\x6f\xa6\x1c\xe2\x80\x28\x0a\
-\x97\xfd\xcf\x7c\xcb\x0f\xb6\x9c\xa7\x0c\x9f\xc9\x17\x0d\x3d\x08\
-\x6c\xea\xfc\x81\x0a\xbe\x56\xa3\x5a\xe1\xe8\x2e\xa9\x59\x35\x36\
-\xac\x24\x01\xc3\x1c\x43\xdc\x90\xc7\xf4\x40\xa6\x5a\x76\x93\x85\
-\x80\x1f\x83\xb2\x52\xa0\x0a\x41\xd2\x1d\x03\xc1\x2d\x6f\x17\x84\
-\x85\x94\xc6\x15\x78\x87\x49\xa1\x28\x8c\x09\x38\x84\x23\x05\x28\
-\x70\x0d\x11\x9e\x01\xb9\x42\x46\x99\x13\xd8\x91\x94\x00\xb6\xec\
-\xda\xd4\xe8\xff\xa3\x1f\x01\x28\xb7\x85\x1e\x0e\xdd\x11\x24\x13\
-\x63\xe1\x35\xfb\xbf\xe6\xa6\x9f\x5e\x5b\x76\xd1\xd6\x4c\xbf\x69\
-\xc4\x4d\xca\x7b\xc1\x1b\x19\x66\xff\x9e\x96\xff\x52\x12\x10\xc0\
-\xd6\x13\xb8\x8b\xd5\x75\x1d\xaa\x63\x33\x72\xab\xef\x93\xa2\x22\
-\x50\x7c\x46\x61\x46\x9e\xcb\xec\x6d\x60\xf8\x18\x28\xb9\xf5\x17\
-\x44\x2c\x3f\xb0\xfb\xd2\xdf\x02\xc8\xe0\x40\x44\x08\xe2\x81\x94\
-\x40\x75\xe7\x0e\x88\x1a\xca\x31\x9a\x20\x4f\xdc\x85\x00\x07\x02\
-\x32\xeb\x48\x5b\x3a\x84\xde\x0b\x14\xc8\xd3\x8d\xa5\x8c\x4a\x08\
-\xbb\x47\xd0\xa4\x98\x79\x27\xea\x54\x6f\x6c\x2b\x0b\x3c\xdd\x43\
-\xf2\xee\xc2\x7b\xb9\x09\x88\x42\x19\xfe\xa3\x80\x28\xd6\x6f\xcc\
-\xd7\x31\x1f\x39\x5d\x01\x48\x52\xa1\x85\xe5\xba\x0b\x4f\xec\x17\
-\xa7\x77\x29\x6d\x10\x62\x11\x3b\x0f\xeb\xb9\xc8\xc0\x11\x40\x21\
-\x12\xa0\x3b\x09\x81\x4e\xc2\xa7\x03\x48\x3c\x81\x77\xbb\x0d\xf9\
-\xaf\x65\x86\x9c\xa4\x1d\x7a\x9c\x79\x86\x19\xc4\x4d\xfc\x38\x36\
-\x08\x87\x16\x1c\x05\x11\xfb\xe8\x44\x65\x10\x74\x65\x86\x50\x04\
-\x2e\x45\xa3\x15\x33\x59\xc8\x6c\x1e\x85\xd7\xb1\x06\x55\x3d\x8a\
-\xad\xe9\x18\xfd\x18\xea\xdd\x5f\xf4\xa1\xbf\x45\xe7\x6f\x13\x8e\
-\xdd\x06\x7b\xcc\xd0\x7b\xc2\x8f\xf1\x30\xaf\xd3\x1e\x10\x65\x57\
-\x42\x3f\xbe\xe1\xd6\xde\x6d\xc3\xe2\xa0\x8c\xb7\xe6\x06\x3e\x7f\
-\x05\xf3\xf3\x28\xdb\x0d\x4e\x26\x9f\xf2\xfc\x7f\x1d\x1a\x44\x1a\
-\x26\x34\xd3\x79\x5d\x2b\xe0\x58\x78\x93\x60\x94\xd9\x8c\x1c\xa4\
-\x13\x8a\x33\xd2\xf0\xc3\xed\x2b\xe0\x8e\x31\x27\x59\x3d\xac\x1f\
-\x41\x1a\xce\x0f\x75\x04\xe5\x7b\xf3\x71\x5e\xe4\x51\xf0\x27\xa8\
-\x52\x88\x2a\x03\x36\x46\xcd\x43\x05\x10\xb3\xf4\x2e\x4a\x0a\x09\
-\x8c\x03\x2f\x99\xa6\x01\x15\x89\xd4\x5a\x27\x2f\xd0\xa0\x5f\x42\
-\x02\xd2\x0b\xe9\x48\x60\x47\x08\xf5\x79\xdd\xfb\x85\x26\xbe\x31\
-\xeb\x2f\xc1\x7f\xfe\x5b\xf5\x73\x35\x7f\xfa\xf9\xb3\xb7\x2a\x9b\
-\x1d\xd7\x0a\x05\x64\x8a\xb5\xb1\xa6\x8b\xe8\xdb\x9f\xd9\x0f\x17\
-\xe6\x37\x7d\x93\xd6\xed\xa1\x4d\x0b\xaa\x85\x9c\x76\x02\xaa\x7b\
-\xf1\x83\xe5\x0d\xcc\x6b\x99\xdb\x43\xc0\xa0\x86\xba\xab\xaf\x85\
-\xeb\x56\x71\x94\xca\x01\x81\xa1\x8d\x2c\x23\xb9\xf9\x6e\x3d\xc2\
-\x00\x7d\x64\xc4\x52\x0a\x6d\xc9\x3d\xb3\xc7\x32\x15\x45\x4e\xcf\
-\xff\x27\xcb\x68\xc0\x5f\x88\xf9\x04\x4c\x97\x35\xba\x0e\x20\xa0\
-\x02\x15\x6f\xa7\xe8\x0a\x39\x6b\xd1\x1e\x70\x0d\xe4\x07\x69\x2e\
-\xc1\xd6\x52\x02\xdb\xd2\x15\xc0\x86\x5d\x72\x0d\x5c\x41\xc6\x60\
-\x43\x5f\x4f\x41\x2b\xa1\x01\x70\xfd\xf7\x5b\x66\xf0\xaa\x35\xf7\
-\xf6\x17\x23\x1f\xdf\xde\x05\xa0\xdb\xcf\x4e\x7d\xed\x55\x98\xf7\
-\x7f\x09\x7a\xd4\xb5\x81\xfd\xd4\x25\xa8\x59\x77\x2d\xf8\x48\x9b\
-\x09\x51\xd8\x6f\xc5\xc9\x20\x8a\x2c\xf3\x05\x2d\xcb\x9c\x16\x5b\
-\x40\x38\x01\x55\x13\x87\x6e\x7b\x72\x17\x89\x00\x0b\x3f\x06\xa7\
-\xd1\x2a\x9b\xf4\x93\x09\xd6\x16\x42\x29\xc0\x7c\x56\xaa\x12\xa0\
-\xbe\x48\x22\x4a\x8a\x21\xd1\x75\x88\xc1\x78\x70\x95\xb0\xb3\x88\
-\x42\xc0\x27\x32\x45\x93\xa3\x01\xac\x7f\xdf\x24\x97\x80\x68\x33\
-\x4f\x30\x80\xc1\x61\xf3\x18\xbc\x63\x1a\x85\x0c\xac\x31\x0a\x7d\
-\xc6\x52\xee\x6d\xf8\x00\x7a\x92\xba\x7d\x3d\x06\x04\xde\xb5\xf4\
-\xbe\xf5\xe7\xa8\x61\xed\xbd\xfd\x0b\x95\x5b\xe5\x9a\xb7\x51\x02\
-\x93\x09\xda\x13\xfb\xf9\xc2\x17\x32\x58\xf6\xdf\x40\x5c\x85\xf2\
-\xc3\x33\x8e\xc4\x89\x2b\x30\x08\xf5\xd1\x88\x02\x28\x7f\x6a\xb8\
-\x8b\x61\x91\x5b\x86\xba\xb7\x9f\x8e\x17\xe9\x19\x00\x83\x8b\x60\
-\x2b\x01\x15\x5a\xe5\xa2\x3f\x07\xeb\x56\xe1\x36\x71\x25\x4b\x84\
-\xd8\x23\xfa\xfd\x82\x4f\xee\xc8\xaa\x40\x63\xbb\xdf\x5b\x88\x8d\
-\xd1\xf7\xc1\x78\x43\x4e\x24\x38\x2d\x9a\x76\x4b\x5e\x40\xc4\x20\
-\x33\xed\xf4\x25\x20\x0f\x28\xbb\x8f\x81\xd6\x0d\xc1\xbc\x02\x94\
-\x22\x0d\xa0\xa4\x12\xc2\x78\x25\xa1\xbe\x7e\x23\x56\x5b\x2e\x35\
-\x54\x60\x70\x3e\x34\xef\x53\xa1\xef\xfb\xa3\x92\xb8\x14\xfb\x8d\
-\x7f\x70\xf1\xfc\xf7\x95\xdb\xe8\xa6\xbd\x0b\x00\xf1\xd5\x9f\xdf\
-\x78\xd9\x57\x3f\x5f\x9c\xfc\x5d\x46\x7a\x4d\xbb\x2a\x70\xd6\xad\
-\x89\xbf\x9b\x10\x19\x10\xa6\x58\xb1\x5e\x01\x7e\x07\xa0\x41\x82\
-\x1d\x0c\x76\xe5\x16\x1d\xa1\xe7\xaf\xd7\xc7\x51\xff\xb6\x2e\xfa\
-\x41\xa2\xa8\xb4\xdb\xd0\x5a\xc0\xa1\xc5\x3e\xe2\xfb\xb2\x19\xca\
-\x3e\x42\xe0\x24\x2d\xc8\x5d\x92\x90\x4a\x26\xc8\x3c\x01\x0a\x4c\
-\xb2\x1b\x45\x61\xc7\xf1\xbf\x63\x96\x3d\xa6\x14\x81\x8e\x91\x0f\
-\xba\x0c\x2d\xdc\x81\xc0\xfb\x8c\x9b\xcb\x1d\xab\x3f\xa0\x5c\xab\
-\x9f\x22\xfc\x48\x5a\x84\x87\xac\x7f\xb9\xcd\xcc\xe2\xd5\x5f\xf8\
-\xdf\xcd\xbf\x51\xb6\xd5\xbd\x6e\x75\xd7\xd2\x05\x68\xb8\x7a\xb7\
-\xff\xfa\xac\xd9\xde\xfc\xa6\x0f\x9b\x59\xbc\x04\x1b\xa3\xf6\x29\
-\xb3\x8c\xfd\xa0\x76\x20\x28\x82\x12\xa6\x0c\x93\x25\xc2\x52\x89\
-\x6d\x9d\x91\x9b\x3d\x08\xa6\x27\x81\x69\x3a\x4c\xe0\x2c\x0b\x0b\
-\xd2\xc9\xc4\x4a\x85\x6b\x01\x20\x0e\xbb\x21\x45\x96\x63\x61\xc3\
-\x14\xdf\x54\xf8\x6c\x45\x15\x42\x40\x19\x18\x9d\x8a\x21\x01\x23\
-\x6f\x8a\x2a\x9c\x35\xa8\x6c\x7d\x34\xf2\x98\x3c\x0b\x19\x4a\x5a\
-\x02\x42\xcc\x97\x7e\x1d\x41\x16\x14\x6d\x38\x9c\xe3\x41\x7e\x5d\
-\x78\x5f\x17\xf7\x43\x80\x79\xdb\xba\xfe\x80\x11\x76\xba\xab\x78\
-\x14\x45\x14\x7e\xf1\x79\x2b\xfd\xe5\xcd\x6f\x6e\xeb\x7d\x4b\xd9\
-\x3e\x97\x3d\x82\x00\x46\xe0\x00\xd8\xf6\xed\x13\xf6\xaf\xfc\x8b\
-\xcb\xcf\x3d\xf6\x84\x3e\xf6\xae\x52\x54\xab\x93\x66\x9c\xb6\x1f\
-\x9f\x85\xf6\x95\x72\xc8\xc0\xa6\x72\x02\xf1\x85\xc1\x4f\xb7\xb5\
-\x16\xc6\x45\x0a\xb6\x2a\x31\x73\x2c\x1c\xd2\x2c\x42\x60\x03\x46\
-\x82\x43\x4a\xd9\xa2\x76\xc6\x7a\xbb\xb3\x10\x95\xa3\x98\xfc\x5d\
-\x09\x29\xd0\x0e\x89\xc9\x1a\x8d\x24\x23\x07\x77\x94\x82\xa0\x0c\
-\x88\x0c\xa2\xaf\x38\xb8\x22\xb0\xac\x3e\x1f\xa3\xee\xfa\xdc\x94\
-\x1b\x40\x36\x9e\x5e\x0c\x75\xb1\x28\x81\x82\xe1\x23\x04\xa3\x22\
-\x01\x24\x27\x89\xdb\x70\x17\x75\x4e\x80\x2b\x89\x09\x3f\x36\x90\
-\x81\x8b\x3d\xb5\xe6\x5f\x8e\xdb\xf0\x4d\x22\xfc\x8b\xc3\x23\x80\
-\xa0\x74\x98\x2b\x9d\xaf\x5f\x7d\xcd\xfc\xcc\x7d\xb7\xbf\xb9\x78\
-\xaa\x6f\x7f\x4b\x3b\x95\x17\x29\x3b\x6e\x16\x7d\x1d\xb3\xa5\xd3\
-\x70\xcd\x6f\x96\xf9\x50\x15\x78\xa2\x87\x8d\x1d\x6a\x22\x4a\x49\
-\xc4\x1a\x0d\x39\x66\x19\xd5\x11\x24\x79\x29\x16\xfc\x56\xe3\x1d\
-\x29\xe3\xd5\x54\x0b\x8a\x44\x05\xfa\x0b\x84\x94\x81\xe0\x26\x60\
-\xe4\x58\x87\x7d\x06\xff\x00\x31\xbb\x50\x8a\x14\x38\x1c\x02\x61\
-\x01\x15\xb1\x6e\x7a\xf1\x63\x3d\xb7\xde\xb1\x7e\xf6\x39\x65\xc6\
-\x5e\x09\xc7\x78\xc2\xab\xe2\xc2\xc6\xde\x27\x35\x3c\xb8\x35\x00\
-\x41\x30\x57\x40\x09\x79\x11\x01\xe1\x57\x82\xf0\x2b\x12\x39\xb8\
-\xe6\xc6\xc5\x13\xd7\xde\xdb\x5f\x50\xb6\xcd\xbd\x56\x00\x43\xe4\
-\x01\x40\x44\xb3\x17\x77\x4f\xff\x6c\x85\x02\xfa\x17\x7e\xe3\x4d\
-\x3f\x29\xb4\xc0\x7f\x78\x50\x13\x69\x5a\xac\xe9\xa2\x57\xcf\xee\
-\xe3\xb1\x7a\x82\x5b\x89\xb5\x71\x21\x35\xb0\x1c\x7e\xdb\x8e\x0b\
-\x18\xd4\xe7\x64\x9a\xf9\x7b\xe5\x0a\x5d\xe3\xe2\x80\x21\xfd\xff\
-\xb6\x70\x9f\x29\x06\x9e\x5a\x10\x7c\x1f\x90\x7c\x5e\xd9\x3d\x80\
-\x48\x23\x4e\x74\xa2\x38\x6c\x81\x49\x81\x01\xba\x5a\xc3\xa3\x79\
-\x5d\xdd\xd0\x10\x21\x10\x99\x7a\x20\x7c\x03\x8f\x0e\x40\x22\xaa\
-\x97\x22\x03\xe0\x7b\x15\x12\x53\x3f\xae\x3d\xcf\x13\x05\x3f\x8f\
-\x0b\x7f\xce\x73\x34\xd0\x8e\x05\x2b\x7c\xff\xeb\xde\xfe\xe1\xfb\
-\xbe\xa1\xec\x94\xab\x85\xfa\xb6\x55\x04\xa0\x52\x00\xd0\x20\xfc\
-\x94\x0c\x2c\x3f\xe4\x87\x5f\xfc\xdb\x0f\xf5\x17\x67\xcf\x75\xae\
-\x22\x83\x71\x68\x40\xbc\x9b\x3c\x84\x84\xdd\x1f\x30\xe2\xe8\x08\
-\x28\xd6\xd5\x7b\xc8\x8d\xa7\xfe\x59\x99\x80\x98\xc5\xec\x7d\x8e\
-\xcb\x1d\x20\x44\x92\x58\x02\x71\xf9\x04\xc3\x2c\x87\xe6\x55\x4b\
-\xe5\x20\xba\x11\xcc\xa0\x49\x90\xd7\x3b\x3f\x70\x26\x21\x4b\xba\
-\x01\xd9\xc9\x3a\xe1\x5a\x2e\x5e\xfa\x37\xaa\xcf\x49\xcc\xec\xa3\
-\x61\xc3\x94\x7c\x81\x26\x77\x40\x54\xc8\x20\x12\x87\x21\x17\x65\
-\xb0\x43\x52\xa6\xe0\xb8\x95\x40\x8e\xbe\x52\xca\x31\x2c\xf8\x39\
-\xa6\x09\x3f\x7d\xbd\x50\x30\xf9\xd9\x3f\x9e\x3b\x76\xcb\x0c\x6a\
-\xe8\x5f\x0a\xff\x7c\x7d\x3f\x1f\x02\x01\xf8\xc3\x39\x41\xe8\xd9\
-\x79\xfa\xe7\xf6\xd7\x64\xc3\xfc\xe5\xe7\x7d\xf8\x95\xfd\xde\xc2\
-\xa5\x52\x2c\xd9\x40\x7f\x05\x64\xa4\x37\x3a\xdd\x7e\xec\x82\xb4\
-\xb5\x00\x86\xb6\x33\xdd\x7b\x08\xcc\x25\x31\x7f\xda\xcc\x8f\x37\
-\x33\x41\x1d\x99\xa0\x63\xc9\xea\xd0\x1b\x84\x32\x81\x03\x79\xfc\
-\xc1\x5c\x9e\x86\xbc\x00\x10\xb2\xfb\x20\xa6\x1c\x62\xe8\xc0\x69\
-\xa5\xde\xcc\x82\x7b\x3c\x81\x28\xf8\xca\xc0\x72\xe7\x77\x13\x9c\
-\x7c\xba\x08\x25\x97\xc0\x8b\x12\xd4\x19\xa0\x72\xac\x9f\xfb\xbe\
-\x10\x48\xf5\x25\x3a\x48\xa5\xa7\xdd\xfa\x82\x2e\x28\x81\x04\x81\
-\x1d\x76\xcf\xa5\xcf\x20\x79\x79\x8e\xc5\x27\x56\xbf\x1c\xf8\x99\
-\x93\xe3\xf3\x90\xe2\xd2\xc4\xdf\xad\xbd\xe3\x3f\x72\xd2\xc6\x5f\
-\xd5\xb2\xa8\x85\x7f\x61\x18\x02\xd0\xe5\x00\x9c\x94\xde\x20\xe1\
-\x52\xa1\x80\x35\x37\x5d\xb8\xfe\xea\x1f\x1d\xff\xd7\xbd\x85\x99\
-\x9f\xd8\xd5\x6d\x7d\x40\xdd\xea\x39\x34\x5a\x12\x49\x50\x1b\x8c\
-\x6f\x83\x56\x82\x32\x20\xaf\x13\x97\xc2\x90\x81\x24\x0c\x69\x84\
-\x1f\x5c\x41\x07\x9b\x89\x18\x0c\x0b\xc3\x12\x65\x91\x81\x40\xe6\
-\x09\xb5\x00\x49\x0a\x81\x92\x8a\x0e\xf2\x09\x20\x19\x64\x8a\x80\
-\x5b\x65\x0c\x74\x03\xd1\xca\x26\xe0\x12\xf0\x28\x01\x26\x66\x0f\
-\x46\x87\x4f\x87\x42\x84\x2a\x52\x3b\xa0\x84\xba\x81\x40\x52\x4d\
-\x10\x8a\x87\x04\xb6\xcd\x9e\xbb\x3b\xd7\x08\x98\xfb\x8a\x26\x37\
-\x6e\x02\xda\x49\xbf\x4a\x66\xfb\xcd\xe3\xdc\xfa\xfd\xf7\x6e\xc8\
-\x2f\x78\xe5\xbb\xef\xf9\x02\x81\xfe\xa5\xf0\xcf\x11\xf8\xaf\x86\
-\x53\x00\xa1\xbe\x18\xe0\xb2\xc3\x67\x9c\xf8\x40\x83\x02\x6e\xbf\
-\xfa\x9c\xbb\x2f\xf8\xd2\xab\x8e\x9a\xdf\x72\xcf\x97\x40\xd9\xe4\
-\x1f\x70\xe2\xf4\xca\xfd\x35\xd9\xfa\x00\xeb\x88\xd4\x8b\x4b\x5b\
-\x26\x8b\x1a\xdc\x98\xb2\xee\xb6\xa3\x07\x78\x6a\x9f\x52\x67\x10\
-\x92\x70\x20\xe5\x85\xfc\x1a\x07\x19\xb3\x43\xc4\xe4\x07\xf3\xff\
-\x41\x4c\x29\x96\x73\x6c\xfd\x8f\xf3\x20\xb8\xe8\x96\x40\x50\x19\
-\x70\x2b\xc8\x11\x33\x02\x75\x0d\xd0\xe5\x10\xd0\xc9\xb9\x1a\x58\
-\x4d\x9a\x4d\xa8\xe4\x28\x41\x08\x56\xbb\x96\x38\x92\x39\x98\x80\
-\x04\x42\x7a\x39\x5a\x3c\x84\xfc\xbc\x85\x4c\x41\x94\x05\x36\xb4\
-\x73\x41\x37\x7b\x04\x55\x50\x64\x41\x85\x5e\x5b\x7c\x6f\xf4\xb7\
-\xa8\xb4\xd0\x11\xfe\x2d\xb3\x78\xf9\x1b\xfe\xed\xbe\x77\x92\x98\
-\x7f\x29\xfc\xb3\xf5\xed\x50\xd6\xdf\x41\x00\x4d\xc2\xaf\xb7\x5a\
-\x09\x94\x27\x30\x57\x08\xff\xa6\xf3\x4f\xfc\xab\xa3\x37\xac\xbd\
-\xe1\xbd\xc5\xa9\x2e\x3a\x56\x9f\x08\x3d\x9a\x8c\x3c\x64\x7d\xfb\
-\x34\x84\x45\xb2\x83\x35\x2f\x84\x7c\x32\xaa\x81\x60\x4b\xe3\xeb\
-\x72\xa2\x5b\xb9\x16\x0d\x20\xd0\xf0\x44\xaa\xc4\x81\x30\xe2\x8e\
-\x85\xf0\xc3\xcd\x03\x98\x62\x51\x32\xdb\x26\xb9\x0e\x22\x07\xc0\
-\xaa\x30\x63\xb9\xf9\x08\xbc\xcb\x12\xfb\x8e\xbc\x4b\x10\x58\xd7\
-\x8c\x03\x04\xba\x40\xc5\xc4\xa1\xb6\x4a\x00\xd3\xdc\x01\xf7\x3d\
-\xc1\x0d\x61\x06\xc8\x3e\x07\xf2\xb1\x03\x53\xfc\xf8\x5c\x10\xe4\
-\x26\xf8\x9f\x33\xdf\xdd\x5a\x79\x2b\xf4\x79\x20\xf6\x9f\xd7\xe4\
-\x61\x6e\x5c\x00\x57\x49\x6c\xd8\x94\x5f\xf4\x8e\x0f\xaf\x7f\xc3\
-\xad\x77\xf5\xe6\xb4\x01\xae\x85\x7f\x24\xeb\x1f\x0e\x03\x06\x84\
-\x9f\x28\x01\xad\x85\xca\x93\xd8\xf2\xe3\xaf\xbc\xe6\xf3\x77\x5c\
-\x7d\xee\x91\x8b\xbd\xd9\x2b\x81\x30\x78\xf5\x10\xaf\x81\x60\xa3\
-\x5d\x4a\xe8\x78\xf8\x04\x0a\x91\xe1\x9f\x2e\xdb\x83\x36\x18\x48\
-\x60\x2c\x90\xae\x96\x28\xb4\x35\x42\x45\x5b\x98\x25\xf6\x03\x00\
-\x3f\x87\x26\xd5\xf0\xa7\x71\x00\x10\x2e\xb4\x07\xce\xa5\xf8\x4a\
-\x45\x8a\xc5\x83\x1f\x27\x74\xd2\x80\x41\xa7\xa1\x06\x52\x08\xb9\
-\xa0\x2b\x02\xf7\xb9\x39\xe6\x85\x45\x7e\xa8\xb1\xa5\x3b\x10\x29\
-\x22\x72\x64\x97\x45\x06\x14\xe5\x77\x24\xcb\xed\x84\xcf\x08\xb9\
-\x26\x28\x0f\x49\x80\x7d\x76\x1f\x83\x3b\x0d\x47\x3a\xf0\x5e\x12\
-\xfa\x9c\x29\x9a\x5c\x08\xf5\x91\xbf\xb9\x63\x75\xff\xd4\x23\xdf\
-\xbc\xee\xf5\x97\x5f\xbb\xb0\x89\x58\xfe\x99\x7a\x1f\xc9\xfa\xd7\
-\xe9\x7a\x61\x5f\x38\x56\x44\x43\xfc\x90\x52\x09\x6c\xfe\xd5\x39\
-\xc7\x5e\x74\xf6\x71\xcf\x7d\xe1\x9a\x5b\x2e\x79\x53\xbf\x37\x77\
-\x63\xd5\xcf\xcf\xe4\xa4\xa3\x85\xe2\xb5\x30\x0f\x62\xb9\x36\x99\
-\x1c\x42\xe9\x55\xc2\x04\x21\xc8\xc0\xce\xb5\x13\xd2\xd0\x6c\xee\
-\x01\x06\xc7\x8a\x2c\x89\xef\x9f\xc8\x01\x38\xc2\x20\x22\x04\xc5\
-\x87\x32\xc9\x9c\x81\xa0\x08\x40\x80\x2f\xa8\x07\x9a\xba\xb0\xcb\
-\x08\x2e\x0a\x11\x06\x44\x37\x99\x42\x12\x74\x1a\x4d\x08\x5b\xed\
-\x44\x24\x10\x48\x04\xf4\xea\x18\x04\xbf\x24\x48\x9a\x29\xab\x34\
-\x72\xcf\xd2\xcb\x02\x4c\x85\xd8\x15\xf2\x66\xb4\x90\x37\x84\xfc\
-\x72\x66\xf1\x1d\x25\x51\x43\x7e\xfd\x3e\xfd\xbe\x5a\xbc\xfc\xda\
-\xc5\x7f\xff\xab\xb7\xac\xfb\xe0\xcc\xac\x61\xfc\xa9\xf0\xcf\xd5\
-\xcf\x8d\x54\xf5\x90\x81\x6a\x27\xfc\xfa\xb8\x33\x3f\xff\x20\x5d\
-\x81\xb4\xa0\x95\x40\xb9\x5f\x74\xda\x5b\xbf\x7d\xee\x67\x5e\xf4\
-\x82\xf5\x77\x5d\x75\x4c\x6f\x71\xee\x5a\xc3\xd6\xd3\x44\x0f\xf2\
-\x6b\x8a\x85\x30\x1e\x05\xad\x48\x42\x89\x72\x22\x07\xca\x64\x18\
-\x82\x2b\x34\xd6\xa1\x48\x6b\xdd\x15\x63\xe9\xdb\xe6\x01\x34\xc4\
-\x0e\x41\xaa\xf4\x63\x83\x53\x15\x04\xdc\x04\x41\x19\x20\x06\x12\
-\xb8\x22\x3d\x50\xb4\xbf\x1f\xec\x0a\x06\xae\xd0\x43\x80\x64\xf3\
-\xd6\x4a\x2a\x12\x10\xb3\x74\xc0\xb8\x76\xc1\x5e\x05\xaa\x21\x9d\
-\x16\xeb\x60\x38\x13\x76\x9a\x68\x24\x09\x74\x14\xf6\x87\x22\x11\
-\x31\xae\x40\x52\x10\xb9\xdd\xb9\xe0\xd3\xef\x52\xf8\xfb\x57\x9d\
-\xfa\xdd\x99\x57\xfc\xe3\x31\xf7\x9e\x46\x0c\x6d\x29\xf0\x5b\x6a\
-\x39\x2b\xe5\xad\xf7\xdd\x13\xf6\x1d\x79\x1e\xfa\xa4\x04\xcd\xa2\
-\x96\x9f\x1c\x7c\xe6\x17\x2a\x25\x80\xcf\x7b\xf9\x9d\x74\xf0\x66\
-\x21\xf7\x9b\x7a\x3f\xfa\xf2\x6b\x4e\x2e\xee\x7f\xf5\x51\xcf\x78\
-\xdd\x23\xf6\x3f\xf4\x69\xcf\x5a\xbe\x72\x9f\xc7\x4f\x2d\xdb\xe3\
-\xb1\x90\x4d\x4c\x99\x28\x36\x29\x2a\xa2\x04\x95\x14\xf4\x06\xe2\
-\x1e\x20\x77\xf4\x48\x1a\xa6\x4e\x3b\x2e\x7b\xd5\x01\xea\x89\x61\
-\xd0\xd0\x70\x83\xa4\x1d\xd3\x0c\x43\xe5\xd7\xfb\x87\xe7\x01\x80\
-\x69\x9b\x6d\x7a\xe5\x49\x7d\x00\x31\x92\x0a\xcb\xd9\xf7\xd0\x74\
-\x50\x08\x1c\x8f\x9c\xac\x43\x8b\x92\xa8\x60\xe7\x74\x8a\x18\x28\
-\xda\xde\x13\xea\xd7\xd1\x09\xee\xf8\x1f\x80\x62\x32\x90\xd0\xfe\
-\x3b\x50\x4d\x18\x9d\x33\x00\x4a\xce\xe9\xaf\x5f\xca\x85\x4e\xc3\
-\x6e\xb1\x0c\x7a\x45\x34\x03\x9e\x01\x1b\xc7\x97\x37\x75\xf6\x89\
-\x66\x19\x46\xde\xcb\x6b\xeb\x87\xe8\x15\xf8\xcc\xcd\xe3\x8d\x97\
-\x5e\xb9\xf0\xc9\x77\x7d\x64\xfd\xf7\xa9\x3c\xd5\xc2\x4f\x2d\x7f\
-\xe5\xf7\x8f\xa3\x35\xb8\x30\x19\x28\x26\xfc\xb2\xa6\xff\xce\x49\
-\x0f\xca\x9f\xfb\xb7\x77\x6a\x32\x42\xa7\x26\x2e\x2f\xf6\x65\x57\
-\xfd\xf0\x13\x97\x17\xfb\xd5\xf5\x67\x65\x8f\x78\xfa\xab\x7f\x6b\
-\xd5\xbe\x0f\x3b\x68\xd9\x6e\x7b\x3f\xa0\x7c\x93\xe9\x15\x7b\xee\
-\x3f\x35\xbd\xfb\x5e\xbe\x69\x90\xac\x98\xf0\xc3\x9a\x2e\xc1\xd5\
-\x70\x2e\x37\x55\x35\xaf\xcb\x86\x8b\xe7\xb6\xac\xbf\xfd\x4a\x29\
-\x0c\x45\x05\x78\xe8\x8c\x40\xca\xbe\x23\x78\xef\xed\x84\xb7\x68\
-\x2b\x5c\xa1\xf9\xa5\x58\x15\xcc\x32\x26\x9d\xce\xba\x4c\x11\xa0\
-\xa0\x08\x68\xf9\x28\x0a\x0d\x49\xd1\xc4\xff\x88\xc5\x47\x2d\x68\
-\x5c\x11\x60\xa4\xc1\x28\x84\x4b\x8b\x51\x29\x51\xf2\x85\x12\x5f\
-\xde\xfe\xd3\xeb\xa4\x03\xc2\x2c\x3d\xa1\xd4\xd6\x3b\xd5\xba\xb1\
-\x68\x8e\xe2\x92\x4a\x57\x04\x2d\x5e\x43\xf6\x82\xd7\xe3\xaf\xce\
-\xec\xbb\xe1\xd6\xde\xd7\xdf\xfe\xe1\xfb\xbe\x59\xc3\x7d\x24\x72\
-\x34\x57\x5b\x7c\xed\xf3\x57\xc6\xf6\xac\xcf\xec\x3b\x96\xd1\x00\
-\x93\xe9\x96\x1f\x64\x32\x19\x8c\x12\xc0\x42\x09\xf4\x99\x12\x28\
-\x4f\x78\x59\xbd\x97\xfd\xaa\x27\xaf\xfe\xd1\x67\x4a\x65\x70\xad\
-\x72\x7b\x75\x8f\x71\x30\x57\x70\xd3\xe7\xe6\xf4\xad\x68\x0d\xe3\
-\x53\xf2\x09\xa4\x6f\x83\xb2\xa2\x41\x08\x08\x03\x43\x06\x6e\xfe\
-\x84\x95\x74\x07\xa2\x07\xa7\x69\xd7\x22\x45\x04\xdf\x09\x19\x56\
-\xc2\x4e\xa6\x2e\x33\x43\x8e\x8c\x24\xd0\x9d\x80\xa5\x7a\x7f\x88\
-\x20\x01\xb1\xb5\x3f\xc9\x3d\xe0\x8a\x82\x0e\x21\xe1\x48\xc6\x55\
-\x74\xe8\xe6\xcf\x73\x9b\x41\x2f\x71\x6e\x95\x0b\x06\x8e\x19\x19\
-\x0d\x20\xca\x28\x40\x27\xd3\x14\x96\x6a\xcb\x0c\x5e\xbe\x6e\x7d\
-\xff\x92\x1f\x5e\x32\x7f\xde\xe7\xbe\xbe\xf9\x06\xb2\x2e\x79\x86\
-\x9f\x66\xfb\x17\x34\xec\xc7\x31\x4e\x4d\x9f\x1c\x87\xf0\xeb\x27\
-\xbe\x73\xf2\xc0\x25\x78\xee\xdf\xdc\xb9\xc8\xbe\xc8\x5c\xad\x00\
-\xa6\xea\xcf\x9c\xac\x15\x40\xa6\x86\xcf\xa6\x6f\xbb\x69\xbe\xa2\
-\xa7\xa4\x9c\xe9\x40\x59\xb0\x6a\xe8\x0e\x0c\x52\x2b\xeb\x08\xd4\
-\x0f\x2a\x84\x44\x65\xe0\xce\xfd\x03\x2f\xb1\xc7\xb8\x3d\xc8\xa1\
-\x3f\x98\x04\xad\x3b\x56\xf7\x4e\xe3\x56\x48\x3f\xc8\x89\x24\x49\
-\xcd\x28\xc5\x7e\x75\x22\x94\xc6\xc0\xdf\x08\xcf\x05\xde\x97\x03\
-\x76\xb7\xa1\x26\xbd\xef\x0b\x5c\xa8\x91\xa6\x22\xc9\x35\xa1\xf3\
-\x49\xd1\x00\xa9\xca\x61\x66\x0e\xd7\x6f\xdc\x8c\x77\x97\xf7\xd7\
-\x6f\xca\xd7\x5d\x77\xf3\xe2\xed\x27\xfd\xef\x96\x1b\x3d\xe6\xda\
-\xc2\x7d\x6d\x38\xe7\x89\xe0\x57\xf2\x54\x08\x3f\x4a\xcd\x42\x47\
-\x52\x00\x4d\xfd\x32\xc5\xa9\x39\x4a\x45\xb3\xe8\x6a\x45\xd0\x2f\
-\x14\x01\x45\x03\x13\x6c\xcf\xea\x5b\xa7\xd5\xfe\x12\x22\x00\x24\
-\x17\xb7\xef\x25\xe4\x28\xb9\xfd\x56\x6a\x1f\x10\x89\xe1\x07\x90\
-\x17\x78\x48\x21\xa4\x28\x03\x00\x06\x5d\x09\xc3\x49\x4b\xae\x1d\
-\x7e\x80\x91\x84\x4f\x7b\xe1\xed\xff\xae\x86\xe8\x1f\xd7\x6d\x23\
-\xaf\x3f\x7e\x4b\x3b\xf9\x70\xe1\xd7\xc6\xaa\x62\xfa\xa9\xf0\x8b\
-\x8a\x79\x24\x04\x10\x80\x67\x8d\x96\xbf\x41\x5c\xbf\xf3\xc5\x5a\
-\x11\xbc\xec\x4e\xad\xdd\x32\x26\xec\xd9\x56\xb2\xfe\x14\x05\x98\
-\xc6\x09\x10\x63\xa0\xc4\x6e\xc0\x20\x6b\x05\x44\x9f\xe4\x0a\x28\
-\xcc\x60\x8b\x2b\x90\x95\x01\x86\xc6\xe2\x00\xf9\x68\x69\x82\xa7\
-\x7e\x3d\x67\x24\x19\x3a\x8b\x4f\x46\x43\xdd\xb6\x94\xc2\x8f\x4c\
-\xf8\x7b\x44\xf8\xf5\x6e\xba\xfb\x18\xc1\x17\x85\x1f\xc7\xa1\x00\
-\x7c\x7b\x96\x0c\xfb\x1b\x7c\x62\xfd\x3e\x67\x9d\x72\x80\xf6\xb9\
-\x4d\xbd\xf2\x9f\xbe\xf4\x0e\x50\x4b\x97\x8d\xdf\xf4\x63\xe0\xa5\
-\x67\x1f\x8c\x6e\xb6\x0e\xf8\xec\x7b\x6a\x4b\x20\xde\x49\x54\xe4\
-\x00\x30\xc8\x73\x62\x48\x19\xa0\xcb\x19\x48\xa3\xba\x4d\xff\x43\
-\xc5\x11\x41\xd4\x0f\xa7\xa1\xa5\xa1\xea\xc8\xbb\x6d\xa8\x75\x97\
-\x33\x05\xd0\x17\xf6\x5c\x12\x7c\xbd\x84\xb0\x69\x80\xe3\x50\x24\
-\xa0\x37\xca\x69\x34\xcb\x1f\x8b\x1a\xe8\xf7\xf9\xee\x97\x0f\xf0\
-\x8a\xcc\x1b\x33\xc5\xf4\x53\x19\x8f\x5c\xd8\xe7\x32\x52\x4e\x9b\
-\xe9\x09\x65\x19\xd4\x8f\xc1\x3e\x17\x89\xf3\xf3\x84\x39\x29\xcb\
-\x4f\x8c\x77\x43\x80\x14\xe4\xe5\xb2\x88\x61\x84\x80\x7e\x64\xc1\
-\x43\x05\x6c\xa8\x1e\x80\xcf\x92\x8b\x68\xc0\xbe\xa7\x76\x87\x68\
-\x58\xa9\xdb\xb6\x2e\x0a\xc8\x85\x5b\x55\x0a\xbe\x11\x76\x15\xe2\
-\x33\x70\x69\xa6\x03\x8f\x2c\xfc\x10\xe0\x0d\x20\x24\xe0\xcd\xc2\
-\x0f\x0a\xc2\x18\x81\xcf\x17\xf5\xb4\x42\x44\xa1\x80\x7f\x18\x44\
-\x08\xfd\x28\x00\x08\xf8\x31\xb4\x27\x62\x9c\x00\x20\x08\xc1\x69\
-\xdc\xc1\x85\x3a\x5d\x11\x48\x68\x80\x15\xf7\xf5\x09\x41\xbb\xd0\
-\xc9\xe7\x56\x55\x02\xd5\xfd\xb3\x3f\x6b\x85\x9d\x5a\xf8\x98\xe0\
-\xab\x25\xe1\x00\xc6\x24\xfc\xaa\xc1\xea\xb7\x11\x7c\xc7\xea\x37\
-\xcc\xf5\x04\x25\xc0\x78\x41\x2a\x01\x12\x47\x72\xb5\x99\x08\x0c\
-\xb1\x13\x12\xdd\x7b\x56\x86\xcb\x10\x02\x53\x04\x5e\x6c\x1f\x12\
-\x78\x02\xcf\xe2\x83\xd3\xb8\x85\xc3\xd0\xdf\xfc\xf4\x90\xbe\x5e\
-\x4c\x79\x4e\x86\x92\x92\xd8\xb5\xa1\x0e\x72\xf7\xcb\xe4\x1e\x8b\
-\xee\xc7\xd9\xad\x8e\x6b\x8a\x0c\xb0\xcf\x13\x13\x69\xec\x39\x98\
-\xe7\x72\x4b\xf0\xe8\x61\xb0\xa6\xab\x6e\x6e\xcf\x51\xaa\x5c\xd4\
-\x77\xe8\x31\x0e\xa9\xaa\xe2\xc2\xd6\x46\x08\x51\x48\x74\x75\xbf\
-\x5b\x9a\xe0\x8f\x4b\xf8\x2b\x05\x10\xab\x3c\x1b\xd9\xf2\x8b\x06\
-\x2f\x22\xfc\xa1\x29\x45\x31\x96\x20\x46\xdd\x87\x2c\x79\x72\xe0\
-\x31\x65\xf4\x6c\xe4\x18\x29\x15\x57\xf0\xf5\x91\xd5\xe5\x4b\xbc\
-\x01\x8a\x30\x5f\x91\x76\xec\x3e\x59\xa8\x2f\x4d\x8e\x16\x0d\x00\
-\x04\x32\x05\x6a\x1d\x51\xe6\x86\xe7\x2c\x49\xc9\xe6\x09\x95\xbd\
-\x1a\x88\x12\x10\xf9\x05\xa8\x3e\x03\x85\x90\x68\x28\x47\x00\x48\
-\xe3\x52\x2d\xc0\xa0\x02\xe1\x2e\xd4\xb1\xce\x88\x69\x65\x75\xf6\
-\xfa\x1a\x04\xbb\x19\xa1\x4d\x96\xc2\x31\x08\x5b\x53\x4e\x41\x30\
-\x57\x2a\x20\xf8\x21\xab\x3f\xe6\x28\x00\x04\xfd\xd2\xd6\xc2\xdf\
-\x60\xf9\x5b\xc3\xfd\x58\xe7\x1c\xce\xc1\xa5\x08\x3c\x13\x5e\x77\
-\x8a\x31\x43\x0b\x52\xd3\x52\x8f\x2b\x00\x9b\x0a\x8c\x34\x18\x20\
-\xa4\xfb\x89\xe1\x3f\xc1\x55\x40\xe5\x0f\xe2\x88\x20\x82\xc1\x2c\
-\x85\x62\xa1\x03\x49\x89\xd6\xe9\xd5\xe8\x2a\x90\x9b\x2f\x3a\xe4\
-\x72\x2a\x28\xae\x4c\x0e\x06\xba\x54\x82\x98\x11\x81\x0c\x28\x81\
-\x92\x53\xc9\x73\x41\x09\x50\xfb\x19\x52\x02\x31\x4d\x14\xd5\xad\
-\xe0\xa0\x13\x27\x63\xc9\xfd\x9b\xb7\x17\x8f\x3f\xa4\x53\x9b\xc5\
-\xe6\x21\xb4\x59\xa9\x52\x5e\x6f\xc3\x54\x6b\xdf\x06\x21\x60\xa3\
-\x62\xc0\xe8\xeb\x38\xc6\x98\xcd\x64\x9a\xaf\x3e\xaa\xf0\x47\x30\
-\x71\x13\xdc\x87\xd0\x87\xba\x0f\xd3\x04\x5e\x11\x61\x77\x67\x0f\
-\x34\x36\x05\x4e\xcc\x12\x74\xb8\x05\xc6\x0e\x8a\xa1\x1b\xf0\x15\
-\x81\x51\x06\x11\x44\x40\xfb\x02\x52\x21\xa0\x2d\xd8\x8d\xd0\x65\
-\x84\x17\xd0\x8a\x2a\x47\x47\x7f\xe6\xe8\xba\x0e\xa0\xa1\x40\x50\
-\x09\x28\x83\xad\x0d\x6a\xd0\xbf\x07\x06\x0d\xb5\xab\x04\x24\x14\
-\xc0\xd5\x73\x48\x09\x40\x58\x48\xb1\xbe\x80\xbd\x1e\x3e\xe0\x0f\
-\x5f\x7a\xf7\xa4\x76\x77\x7e\x70\xca\xfe\xb6\x2d\x65\x4e\xfa\xef\
-\x2b\xdd\x75\x48\x1e\xc6\x21\x09\x5d\x8a\x10\xa6\xe4\x16\x61\x20\
-\x2e\x1c\x44\x0c\x18\x7f\xff\xb6\x5b\x16\x15\xdc\xa6\x76\xd5\x21\
-\xe1\x07\x59\xf8\xa5\x5e\x83\x1e\xe4\x8f\x32\x70\xbe\x99\x6f\xe6\
-\xd7\xc0\xe9\xd1\xef\x09\x3b\x04\x04\xbc\xb1\x55\x57\x22\x5f\xc0\
-\xbd\x95\x50\xa7\x62\x10\x90\x4c\x68\x22\x71\xc4\x85\xb2\x33\x14\
-\xfc\x91\xe8\x4e\x2a\x43\xe6\xa2\x31\xb1\x67\x62\x1d\x3d\xa1\xef\
-\x13\x6a\x58\xe2\x5f\x53\x3e\xab\xa1\x05\x6c\x8e\x55\x0e\x42\x40\
-\xd0\x04\xfb\x31\xb7\xa0\xa6\x8b\x9b\x15\x6a\x90\x81\x3a\xf1\x47\
-\x7f\x7d\x37\x50\xcb\x2f\xcd\xda\x53\x42\x49\x2f\xef\xf4\x9b\xd2\
-\x28\x24\x4f\xec\x18\xcc\xcb\xd8\x43\x95\x90\x5e\xc7\xa3\xf1\x21\
-\x00\x90\xe7\xc8\x8d\x02\xfb\x95\x2c\xfc\x41\xc8\x9f\x62\xf5\x85\
-\xcf\x80\xa0\x83\x6f\x4b\x84\x21\xd2\x5e\x5b\x25\x2e\xce\xa1\x37\
-\x88\x9b\x05\x5b\x09\xc9\x5e\x84\x30\x67\x80\x8c\x30\x04\xc9\x2d\
-\xb0\xaa\xcf\x44\x0a\x40\x09\xb9\xfb\x24\x3d\x58\xff\xa6\xb9\xb2\
-\x15\x81\xfa\x18\x40\x17\x09\x58\x2b\xef\x16\x07\xf9\xb5\x03\x2e\
-\x0c\x70\xcf\x11\xbc\xe1\x97\x9c\x0f\xa0\x15\x73\x82\x5a\x37\x35\
-\x09\x86\x60\x24\x3d\x11\x4b\xe4\x30\x37\x8f\x65\x0d\xca\x1e\x6a\
-\x90\x4f\x3f\xab\x4c\x65\x30\xba\x31\x39\x8c\xfb\xe2\xd8\xd6\xf2\
-\x63\x3a\x26\x68\x42\x16\x88\xcd\xa8\x62\x34\x05\xc0\x7a\xfb\x8f\
-\x1b\xf6\x43\xf0\x3d\x20\xc1\xd7\x87\xb0\x72\x69\xb0\xb2\x41\x4b\
-\x1d\xe3\x11\x9b\x5a\x00\x2a\xbf\x7f\x07\x30\x8b\xed\x72\x00\x0d\
-\x4a\x81\x85\xef\x10\x21\xee\x22\xf0\x96\x57\x60\xbb\x31\x92\x0a\
-\x6b\x27\xfa\x97\x95\x6d\xd6\xb1\x2e\x8f\x36\xf0\x5e\x4b\xba\x85\
-\xcb\x5a\x72\x34\xb2\x2f\x8f\xa9\xca\x86\x75\x6f\x3d\x41\xc0\x40\
-\xbb\x03\x60\x3f\xdf\x87\xfd\xa0\x9c\xb8\xb5\xc4\x07\x34\x71\xad\
-\xbc\x2a\xda\x68\x1a\xa6\x60\x58\xc6\xdc\xfc\x3c\x4e\xd5\x08\x40\
-\xb7\xd1\x72\x46\x26\xf8\xa4\x20\xb8\xc8\x80\x17\x2a\x25\x29\x00\
-\x1c\x89\x20\x4c\x15\xfa\x31\xe7\x01\x40\x7c\xf4\x52\x2a\xec\x97\
-\xde\x20\xd5\xdf\x8f\x9c\x40\x5c\xf0\xc1\x81\xb6\x4d\x1c\x80\x52\
-\xb2\x00\xfb\xce\xa5\xd8\x73\x3b\x10\x4b\xb4\x19\x36\x9a\x65\x07\
-\x88\xe6\xfe\x88\xca\x00\x18\xa6\x47\x21\xa3\xcf\x23\x0c\x51\x20\
-\xce\xdc\x53\x92\x8b\x94\xca\x84\x28\xa2\x04\x00\xc9\xf8\x36\x2d\
-\xcf\x44\x09\xd0\x81\x2f\x12\xf3\x1f\x52\x02\x98\x4a\x0a\x32\x3e\
-\x60\x40\x2c\xda\x49\xc7\x8a\x23\x18\xce\x79\x08\x97\xb6\x8f\x38\
-\xa1\xe1\xbf\x76\x77\xbd\xd1\x5b\x5e\x68\xce\xf6\x47\x90\x49\xb7\
-\xf6\x02\x3e\x0e\xb2\x70\x29\x84\xdf\x25\x01\x61\xfc\xc2\xef\xe7\
-\x03\x8d\xc1\xea\xfb\xef\x96\x88\x0a\x02\x6a\x25\x94\xf3\x9f\x52\
-\x12\xcc\xdb\xf9\x40\xe8\xc4\xd1\x6f\xc5\x87\xa9\xc8\xc0\x8e\x57\
-\x93\x08\x43\x87\x2c\x44\x94\xcb\x02\x28\x74\xc8\x90\xc0\xfb\xda\
-\xc5\x60\x4a\x40\x23\x04\xa1\xef\x46\x64\xf9\x13\x4b\x4f\x3d\x03\
-\xa2\x4f\x81\x75\xf0\xf1\x14\x24\xca\xc1\x00\xc7\xcf\x6f\x22\x04\
-\x13\x22\xb7\x20\xbc\x1f\xb2\x52\xe2\x50\xda\xed\x68\x2e\x40\x82\
-\x22\xd8\x0a\x42\xef\xbb\x00\x63\xb6\xfc\x22\x39\xd5\x90\xd4\xc3\
-\xa5\x3e\x86\x48\xa4\x81\x24\x31\xc1\x17\xcc\xce\xd2\xce\x94\xf6\
-\x33\x94\x3c\x13\x16\x45\x07\x10\x52\x04\xe8\xbb\x01\x84\x84\x2b\
-\x6b\xdd\x3d\x6e\xc0\x4c\x09\x1a\xf8\xf0\x50\x87\xf1\x9c\x2a\xe2\
-\x88\x12\x70\xa2\x0d\xf5\x44\xc7\x5c\x44\x01\x2a\xea\xfb\x78\xcd\
-\x44\x80\x71\x05\xc1\xa2\x27\x3a\x3c\x46\xe8\x5f\x28\x7d\x5e\x44\
-\x09\xa0\x8a\xf4\x2e\x14\x92\x81\x78\x23\x8f\xb6\xc2\x38\x6c\xb4\
-\x60\xa9\x05\xdf\x47\x00\x8d\x8b\x39\x8d\xf0\x6b\x2a\x15\x6e\x84\
-\xfc\x10\x13\xfc\x04\x92\xcd\x89\x0e\xf0\xca\x3e\x88\xbb\x05\x4a\
-\xc5\x3b\x01\x2b\x79\x74\x80\xc7\xb0\x43\x13\xe4\x87\x34\x65\xe0\
-\x29\x02\xf0\xdc\x82\x20\x49\x28\x10\x84\x90\x59\x25\x80\x8c\x70\
-\x04\xc7\x62\x13\x22\x95\xfb\xf4\x35\x29\x88\x3c\xf3\x30\x60\xf1\
-\x73\x8c\x48\x66\x02\x1f\x80\xfc\x82\x86\xe4\x9d\xff\x5d\x2a\x0a\
-\xf0\x84\x11\x9d\x0c\x41\x4c\xf4\xd3\x93\x94\xc1\x18\x95\xc6\xb8\
-\x94\xc3\x24\x40\xb3\x65\x86\x36\x71\xfe\x14\xcb\xdf\x34\x26\x3a\
-\x45\xf8\x63\x42\xac\x04\xa9\x94\xf4\x04\x13\xd8\x2c\x0b\x5f\xe8\
-\xd0\xe7\x87\x5e\x6b\xe4\x00\x02\xd9\x3f\x62\x1b\x40\xf0\x79\x02\
-\xd1\x2d\xa0\xd1\x00\xe6\x12\x18\x59\xad\x95\x40\x59\x34\x95\x13\
-\xf2\xb0\xa6\x05\x06\x04\x20\x0c\x2c\x76\x95\xd1\xa7\x9f\x67\xd1\
-\x83\xac\x4c\x9f\xe5\xd0\xbb\xf6\xdb\xbd\x8e\x41\x3c\x02\x10\xe8\
-\x26\x84\x81\x1e\x80\x3c\x42\x38\x98\x98\xd3\x82\x5f\x91\x50\x80\
-\x14\xf2\x53\x34\x2f\xc0\x6f\xa3\x86\xf9\x68\x82\x3d\x2e\x41\x1e\
-\x3b\x07\x10\xb3\x58\xc1\x36\x7d\xd0\xe0\xf3\x43\x0b\xb2\x0f\x12\
-\x05\x3f\xe6\xdf\x43\x44\x11\x29\x9f\xc1\x8f\xfb\xf4\x02\x1f\xa0\
-\x04\x7e\x00\x98\x10\xc6\xb2\x82\x9b\xac\x3c\x63\xf6\xc4\xdf\x84\
-\x45\x6b\xa4\xdf\xac\x4a\xca\xe1\xa8\xcc\x74\x56\x76\x09\xb4\x66\
-\x25\xc0\x3e\x37\xf3\xc3\x83\x68\x04\xdf\x3d\x51\x2d\x3e\x96\xd0\
-\x73\xbf\x84\xe4\x87\x37\x66\x09\x46\xb1\x32\x25\x19\x46\x87\xe4\
-\xe1\xbc\xfc\xe1\x05\x7e\x14\xc1\x5d\x3a\x0e\x40\x25\xfa\xfd\xa3\
-\x0a\x3f\x34\x99\xfc\x76\x56\xdf\xf3\xef\x1b\x42\x7c\x51\x81\xe7\
-\xd9\x2d\xad\xb8\x01\x10\x50\x07\x1a\x21\x90\x46\x75\x37\x2b\x03\
-\x3f\x6f\x1f\x03\x35\x00\xda\x5a\xd1\xe7\x9d\xcc\x3c\x01\x70\x00\
-\xe9\xb7\xe7\x28\x01\x0e\xe7\x49\x5e\xbf\x24\xb0\x5e\x33\x02\xc1\
-\x95\xb7\xb9\xf8\x18\xb7\xf8\x31\xe1\x22\xb3\x0c\x34\xaa\x11\x3d\
-\x0b\x94\x23\x02\x4d\x82\xc5\xad\x3f\x27\x29\x42\xde\xc7\x52\xfa\
-\xe7\xb8\x95\x5a\xb4\x4c\x26\xfb\xfd\x4a\x05\x31\x3a\xb4\x26\xfc\
-\xe2\x96\x3f\x66\xf5\x41\x09\x82\x0f\x31\x54\x10\x80\x01\x91\xbf\
-\x69\x1a\x03\xe8\xf9\xff\x5e\x2f\x11\x08\x28\x39\x39\xf1\x25\xa8\
-\x0c\x84\x76\xdc\x32\x4b\xee\x87\x07\x32\xc5\xbb\x9f\xd6\x48\x20\
-\xa6\x04\x94\xb5\xf4\x86\x00\x44\x32\x87\x31\x12\x19\xf0\x49\x32\
-\xda\x7c\x73\x20\xb4\x9b\x67\xf1\xaa\x4d\x9b\xf2\x6b\x49\xa7\xdc\
-\x89\xbd\xf6\x9c\x78\xd4\xf2\x65\x70\x68\x1b\x66\xdf\x42\xf2\x76\
-\x04\xa0\x13\xad\x50\x72\x63\x66\x9e\x17\x30\x2a\x09\xb8\x3d\x09\
-\x7b\x73\x14\xc0\x61\xf7\x9b\x18\xff\x06\x61\x1d\x12\xf6\x37\x09\
-\x7f\x0a\xf3\x6f\x2f\x6c\x5d\xe8\x03\x24\xde\x15\x10\xf8\xd6\x6c\
-\x4e\xe4\xb3\x41\xf8\x3e\xe8\xe5\xab\x62\x10\x19\xf8\xd6\x1e\x7c\
-\x34\x00\x36\x63\x2f\x94\x48\x64\x12\xf5\x48\xa8\x30\x55\x09\x70\
-\x24\xe0\x91\x82\xec\x3d\xd1\xc9\x1e\xb4\x7c\xc0\xdc\x7c\xff\x96\
-\xab\xae\x5b\x38\xf9\x84\x2f\x6f\xfc\xfe\x4f\x2f\x9b\xdb\xa8\xfc\
-\xde\x78\xea\x88\xc3\x77\xdf\xf7\xc8\xe7\xef\xfe\xac\x87\x1d\x3c\
-\xf5\x37\x93\x93\xb0\x2f\x4d\xc3\x50\x5e\x6b\x72\x15\x8c\x08\xc4\
-\xf2\x02\xc6\x25\xa0\xdb\xd2\x5f\xdf\x6a\x08\x00\x52\x19\xff\x50\
-\x92\xcf\x98\x85\x1f\x9a\x30\x7d\x6c\xf0\xa7\x37\x70\xcf\x9d\x72\
-\x13\x4c\x15\x76\x5c\x04\x95\x34\x13\x20\x85\xa0\x44\x94\x5c\x0d\
-\x8c\xc6\xc0\x39\x9d\xef\xf9\xe7\x1e\x41\x88\xbe\xae\x49\x50\x02\
-\x34\xbd\x96\x12\x8a\x40\x90\x40\x28\x54\x67\x94\x80\xed\x2e\x3c\
-\x7f\xd5\xb5\xf3\x1f\xfd\xfb\x77\xac\xf9\xfa\x96\x99\xbc\xaf\xdc\
-\xb6\xd7\x4e\x7b\xf6\x6f\x9f\xbb\xe5\xb6\x62\x3f\xe9\xb7\x0e\x9e\
-\x3a\xf5\x83\xef\xdc\xfb\xef\x1e\x72\xe0\xd4\x6b\x8a\xd3\xc8\xb8\
-\xb2\x45\x29\xe9\xa9\x45\xa1\x90\xe8\x4e\x61\xf8\xef\x30\xe0\x89\
-\x28\xdc\x31\x84\x3b\x65\xcb\x14\xf3\xf3\x83\x04\x7d\x42\x8a\x6f\
-\x2b\xe1\x8f\xb5\xd5\x0a\xe6\x0f\x27\xc4\xff\x99\xe0\x07\xdd\x81\
-\x90\x80\x0b\xa8\x27\x04\xfd\x45\xa4\x93\x54\x10\x24\x44\x2d\x20\
-\x1e\x45\xe0\x3f\x84\xf7\x1e\x10\x56\xe0\xe5\xc3\x8c\x65\x33\xd2\
-\x1c\x26\xa8\x95\xaa\x2e\x24\xa2\x23\x63\x4d\x64\x04\xe8\x73\x71\
-\xe8\x35\xbf\x80\x77\x9f\x72\xda\xc6\x57\x1d\xf5\xfa\xbb\x4f\x2d\
-\x84\x5f\x37\xb8\xd4\x23\xe4\xca\x36\x64\xe5\x78\xab\x4d\x6c\xdf\
-\xfc\x9b\x5b\x16\xef\xfd\x8b\xff\xbb\xfa\xa3\xdf\xfb\xc9\xec\xab\
-\x0b\x05\xb2\xc1\xf5\x31\x02\x8d\xa6\x40\xb5\x0b\x01\x04\xcd\x59\
-\xf8\x58\xd8\x01\x2d\x7b\xb2\x02\x80\x98\xdf\x0f\x2d\xc3\x7d\x6d\
-\x2c\xbf\x0a\x08\xbf\x28\xdf\x90\x96\x13\x20\x08\x7e\x54\xe8\xb9\
-\xb0\x79\x82\xde\x0c\x01\x68\x8f\x80\xa0\x82\x80\x30\xda\x71\x22\
-\x18\xc2\x49\xcb\xef\xa7\x3f\x5b\x98\x54\x1c\x81\x50\x41\x25\xa0\
-\xac\x12\xa0\x8a\x9c\x47\x88\xab\xea\xc0\x98\xe2\x29\xf6\x5e\x1f\
-\xd7\xbc\xff\xbf\xee\x79\xc5\x87\x3e\x75\xdf\xaf\x95\x6d\x09\x5f\
-\x4d\x91\x2e\xf6\xd2\x05\x58\x5f\xec\x1b\x84\x5d\x3f\xbf\xe9\x1d\
-\x1f\xb8\xe7\xbc\xaf\x9f\xb5\xf9\x65\x79\x5e\x29\x8a\x06\xbf\x93\
-\x3c\x9d\x25\x54\x1f\x42\xbb\xc7\xc3\x16\x04\xed\x58\x08\x20\x02\
-\xfd\x5b\x91\x7e\xa3\x5a\x7e\xc9\xb0\x33\xc8\x1f\xb6\xc0\x89\x82\
-\x2f\x0a\xab\x8f\xf9\x11\xdb\x8e\x06\x12\x14\x83\x24\x9c\x29\x59\
-\x8b\x01\x45\x10\xba\xc6\x8e\x32\xc9\xe8\x5b\xc8\x4a\xc0\x34\x55\
-\x05\xbf\x8e\xc2\xfe\xbd\xfb\xb7\x99\xf0\xc1\x7e\x6f\x13\xc8\x4f\
-\x3d\x7d\xf3\xdb\x0a\x38\xbf\x5a\xd9\x41\x2c\xda\xe2\x6f\xa8\x15\
-\xc0\xe6\x5a\x19\xcc\x28\x5b\xa5\x37\xa3\xec\xe0\xcb\xf2\x98\x8d\
-\xc7\x1e\xbf\xfe\xe7\x97\x5f\x33\xff\x96\xa8\x9b\x28\xd9\x2d\x8a\
-\x64\x62\x9e\x61\x2a\x0a\x68\x4c\x49\xdf\xb1\xb7\xc9\x18\xea\x86\
-\x26\xe5\xdb\x18\xee\x6b\x6f\xf9\x63\x33\x64\xe3\x99\x80\x28\x4e\
-\x37\x42\xfd\x3c\xb8\x88\xc2\x10\x84\x4a\x80\xe1\xd0\x72\x0f\x9e\
-\x32\x55\x9a\x3e\x89\x27\x39\x9b\x00\xc2\x31\x18\x22\x09\x65\x5e\
-\xc0\x34\x00\x41\xb9\x0d\x17\xd4\xaa\x5f\x93\x76\x74\xe8\xab\x49\
-\x37\xe6\x53\x81\x15\xe9\x2c\x24\x34\xff\x28\x9f\xbb\xed\xce\xc5\
-\x53\xfe\xfd\xe3\xf7\x5e\xc9\x84\x5f\x0b\xba\x99\xca\xf4\x8b\xb3\
-\x1e\x8c\x3c\xe9\xa7\xbc\x3e\xbf\xf7\xdc\xdb\x69\x7f\xfc\xde\x2b\
-\xde\xbe\xf6\x5b\x3f\xf8\xea\x83\x9e\xb7\xe7\xca\xec\x08\x69\x31\
-\xe8\x31\xf3\x49\x9d\xdb\x46\xda\x96\xfc\x03\xb6\x25\x02\x00\x3f\
-\x63\x0e\x12\xfc\xfe\x61\x84\x1f\x9a\x61\x7f\xcc\x62\x8b\xaf\xa9\
-\x38\x91\x47\xad\x3c\x2a\x81\x14\x8c\xf2\x0e\x2d\xda\x30\x71\x62\
-\x2e\x08\xc9\xc1\x77\x15\x9a\x3a\x95\xc6\xd0\x80\x33\xdd\xd8\xa7\
-\x4c\x2a\xff\x3f\x0b\x8c\xef\xce\x94\x3c\xf0\x15\x7c\xb7\x20\xf8\
-\x3b\x83\x21\xfd\x66\xfe\xed\xa3\xf7\x7e\x41\xd9\x96\xe3\x1a\xf6\
-\x6f\xd1\x0a\xe0\x17\xdf\x3d\xa8\x5f\x0a\xbf\x88\x1e\x8a\x67\x7f\
-\x7e\xe6\x81\x58\xec\x8e\xdb\xf0\xa3\x8b\xe7\x8e\xa9\x5c\x89\xa6\
-\x09\x56\x6d\xe5\xb9\xcd\xe3\x9d\x78\xcb\x82\x17\x47\x12\xfe\x54\
-\x98\x30\x84\xf0\xbb\xfe\x7e\xe3\xbc\x32\xd5\x54\x0d\xe8\x42\x3d\
-\xf7\x83\x90\xf7\xdf\x92\xdc\xf5\x48\x5e\x80\x8a\xf5\x0b\x88\x72\
-\x0e\x3e\xc4\xf0\x14\x81\xf0\xf9\x2a\xe6\x3a\x25\x44\x66\x34\x71\
-\x07\x52\x1b\x75\x70\xf9\x00\xd3\xfd\x27\x10\xd5\x81\x40\x8e\xc8\
-\xda\x7b\xfb\xe7\xfd\xf8\x92\xd9\x0d\xca\x1f\x67\x5d\x8d\x62\xfb\
-\xe5\xd9\x07\x61\x34\x62\x43\x7e\xcf\x42\x09\x98\xb1\xd8\xef\xf9\
-\xaf\x7b\xaf\x99\x5f\xc0\x0b\x64\xe4\x08\x43\x91\x81\xd0\x96\x0c\
-\xdc\x89\xdd\x80\x2c\x9a\xeb\xa3\x54\x9c\xf4\x6b\xd0\xa2\x6d\x84\
-\x5f\xf2\x15\x7c\xcb\x1f\x2b\xf2\xe7\x94\x81\x3d\x16\x11\x83\x04\
-\x23\x15\xea\x41\x32\x59\xe2\x40\xc8\x14\x9e\x41\xa5\xf4\x2a\xb4\
-\x8a\xa0\x79\x15\x46\xae\x4f\x04\x09\x38\x8c\x36\x8f\x8a\x06\x84\
-\x09\x40\xc9\xbd\x17\x81\x2e\x1a\x2b\x19\x57\x5e\x33\xff\x7d\xe5\
-\x4e\x1c\xd2\xb0\xbf\x12\x7e\x2f\x69\x09\x82\xf3\x52\xb5\x12\x30\
-\xb3\x0b\x66\xe7\xf1\x8c\xb6\x46\x5d\x6d\xfb\x3f\xd8\x81\x10\x00\
-\x8c\x19\xfa\x43\x9c\xac\x4a\x15\x7e\x09\xe6\x8a\x02\x29\x85\xd5\
-\x54\xc0\x72\x2a\xb7\xd7\x1e\xed\x0c\xcb\x25\x0b\x15\xa4\xa7\x04\
-\x02\x44\x11\x7c\x34\xdf\x40\x10\xce\xb0\x22\x6c\x72\x09\x22\x39\
-\x1a\xa0\x9c\xde\x88\xdc\x7a\x02\x40\x40\x97\x83\xe8\x5e\xd0\x03\
-\xcf\xfb\xf1\xcc\xd5\xca\x86\xfb\xe6\xa9\xf0\x87\xdc\x06\x05\x61\
-\x14\x50\x29\x81\x33\x2a\x25\xd0\x9b\x99\xcd\x7f\x12\x5e\x4b\xe0\
-\xb7\xb3\x1b\xd6\xcd\xdf\x05\xdd\x80\x2c\x85\xf5\x8f\x42\xff\xc4\
-\x9e\xff\xd0\xd4\x07\x20\x9a\x10\x14\x98\xd5\x07\x01\xe1\x87\xb0\
-\xe0\x7b\xe1\x9c\x40\x2c\x2d\xdc\xbb\x3d\x54\xef\x8e\xa2\x42\x40\
-\x14\x60\xbd\x8a\x59\x68\x08\x16\x2d\x79\x91\x82\x21\x94\x80\x84\
-\x69\x33\x4f\xe1\x80\xcc\xaa\x4b\x4b\xa2\xcc\x20\xcc\xd5\xfc\xff\
-\x9e\xb5\x79\xb5\xb2\xe3\xe0\x2b\xc2\xef\xf2\xef\x1d\x9c\xab\x48\
-\xc4\x26\x10\x49\xe0\xc7\xe3\xbd\xeb\xf3\x9b\x83\xd7\xbc\xad\xc1\
-\x86\xa4\x97\x77\x19\x37\x20\x1b\x9a\xf5\x4f\xf1\xfb\x1b\xae\x30\
-\xb4\x15\xfe\x20\xc9\x27\xbb\x06\x94\x02\xe0\x35\xed\x88\x2a\x3c\
-\xfa\x1c\x1d\x07\x42\x85\xa2\x73\x8d\xb3\x45\x42\xe8\x00\x84\xee\
-\xba\x10\x51\xbe\x89\xab\xb5\x0d\x12\x08\xb9\x76\xa2\x94\x07\xac\
-\x77\x66\xa3\x12\x33\xca\x0e\xbb\xd4\xd3\x6d\xf3\x24\x8b\xdb\x90\
-\xce\x5d\xa2\x80\xbf\x79\xf3\x9a\x75\x51\x44\xa9\xdc\xc1\x47\xa3\
-\x54\xeb\x21\x26\x2e\xde\x9d\x92\x04\x84\x26\xf2\xa4\xa1\xc2\xaf\
-\xb5\xdf\x3f\x84\xf0\x7b\xc2\x08\x36\x64\xe6\x0d\xd6\x50\x61\x13\
-\xca\x41\x05\x9f\xc9\x97\xd0\x31\x08\xd9\xf1\x10\x03\x4d\x29\x8a\
-\x80\xfd\x06\xdc\x12\x4b\xdf\x3d\x0e\xad\x62\x4a\x00\x82\x5e\x5b\
-\xa3\xeb\xc7\x3f\x25\x83\x65\xca\x9d\x78\x6b\x46\x8e\x43\xb0\xd8\
-\x02\x52\x97\x9d\x3a\xff\x2b\x0f\xda\xcd\x4f\xd0\xf1\x63\xa7\xcd\
-\x02\xec\xba\x8e\xc1\x91\x6d\xbb\x90\x1b\x90\xa9\x48\x77\x2c\x48\
-\x98\x7b\x27\x9b\xa2\x44\xbf\x7f\x04\xe1\x0f\xe1\x32\x20\xc2\x1f\
-\xec\xe2\x82\x6e\x2a\x3f\xaf\x66\x73\x16\x13\xd4\x71\x6e\x48\x57\
-\x0e\xda\xd5\x30\x82\x8a\x0d\xa8\x00\x62\x85\x4e\xd0\x1c\x09\x00\
-\x68\xbc\x8e\x10\x19\x92\x22\x02\x80\xc0\xc0\x14\x60\xe1\xd3\x7a\
-\x0a\xf3\x6e\xff\xe7\x69\xbb\xed\xa9\xec\xcc\xfb\xfc\x8a\xf3\x0f\
-\x46\x87\x0c\x85\x04\x77\xd2\x37\x35\xd5\x6b\xbb\xaf\x80\x83\x42\
-\x7f\x8b\xc3\x18\x69\x76\x8d\x46\xca\xec\x83\x1d\x5d\x01\x04\x70\
-\x7b\xa3\xf6\x87\x00\xf4\x4f\x16\x7e\x18\x41\xf8\x21\x28\xfc\x7e\
-\x88\x0f\x1c\xbf\xd2\x71\x0b\x5c\x56\x7f\x83\x75\x17\xa8\x86\xa8\
-\xbf\x39\x0e\x86\x6d\x54\xb7\x48\x04\x01\xac\x92\x08\x85\x17\xa3\
-\xa3\xcd\x68\x1d\x46\xd0\x02\xc5\xc3\x85\xc9\xd7\x33\x81\x0f\x80\
-\x21\xe1\xfa\x91\xcf\xdf\xe3\x31\x8a\xb5\xe3\x08\xf1\x15\xd1\x72\
-\x73\xe1\x1c\xa7\x26\xe1\x89\xae\xd0\x63\x23\x77\x97\xda\x7d\xb7\
-\x95\xf0\x0b\x44\xe5\x0e\x8f\x00\xa0\x0d\x4b\x92\x02\xfd\x23\xbf\
-\x2d\x24\xa9\xcd\x14\xe1\x57\xe2\x3c\x40\x8f\xf1\x03\xbf\xfc\x97\
-\xb7\x79\x32\xe1\xbf\x1c\xef\xab\x1a\x4a\xa0\x9d\xac\xa3\xeb\xf1\
-\xe5\xc1\x8c\x75\x0a\x5c\xbd\xdb\x7f\x16\x29\x60\xd4\x6f\x90\x2f\
-\x56\xcc\x25\x68\x46\x59\x71\x25\x20\x65\x19\xda\x4a\x3f\xe2\x06\
-\x81\x9b\x7a\x28\x45\x05\x9c\x1c\x83\xe2\xfe\xa3\x7e\x7b\xd9\x33\
-\x55\x24\xb0\x1e\xec\xce\xc6\xc7\xb5\x67\xe2\x31\xcf\x73\x06\x80\
-\x48\x42\x0d\xe0\xc1\x82\xf9\x45\xdc\x10\x77\xe1\x30\x78\x3e\x5e\
-\xb5\xe5\x30\x0a\x63\x87\xe3\x00\x5a\xfa\x7e\xaa\x29\x17\x20\x00\
-\xef\xc2\xd0\x3f\x51\xf8\x03\x06\x4e\x24\xf6\xe8\xa8\x6c\xe6\xef\
-\x99\x41\x19\x83\xe5\x79\xab\x5e\xdc\x48\x90\x84\x71\x03\x94\x6d\
-\xab\xe5\xb9\x02\x84\x3f\x30\x64\x14\xda\xf7\x12\x09\x4c\x3e\x02\
-\xaa\x46\x2a\x7c\x3e\xbc\x1b\xa1\x84\x70\xc9\x74\x83\x12\xc0\xc8\
-\xe2\xe5\x29\xc6\xb1\x91\xed\xa1\xdf\x78\xef\xbd\x27\xfe\xe4\x8f\
-\x9f\x5e\xb9\x01\x55\x7e\xe1\xef\x3e\xf3\x16\x17\xec\x01\x34\xab\
-\x7e\x39\x2c\x7a\x40\xb1\x1f\x61\x5c\x37\xb2\x46\xa4\x71\xdb\xf4\
-\x7a\x6f\xd8\x94\xaf\x89\xf1\x37\xe9\x46\x69\x67\xe6\x00\x52\xfd\
-\x9a\x61\xac\x7f\x2b\xd2\x6f\x38\xcb\xaf\x20\x02\x3b\x40\xd0\xf8\
-\x24\xc3\xcd\x0a\x7f\x39\x44\x42\x5d\x8d\x0a\xfd\xbe\xf0\x10\x48\
-\x07\x26\xf3\xe5\x1c\x21\x75\x50\x06\x1a\x24\xe1\x19\x7e\x68\xee\
-\x4e\x0e\x2c\x17\xdf\x0e\xae\x50\xc1\x39\x72\xd2\xd0\x0b\x9e\x84\
-\x43\x7f\x1f\x29\x41\x87\x9f\x84\x90\x47\xe5\xa1\x80\x89\x4c\xad\
-\x7c\xf7\x1b\xef\xff\x0f\x6a\x50\x5f\x32\xa1\x22\x13\xe3\xdd\x04\
-\x2c\x68\xaa\xa9\xf8\x40\xb1\x4f\xab\x64\xc5\x21\x46\x03\x9c\xcb\
-\x1f\x9d\xc9\xd0\xa4\x0e\x24\x37\x00\x76\x0a\x05\x20\x5f\x85\x91\
-\xac\x7f\x32\xe9\xd7\x42\xf8\xa9\x95\x05\x56\x18\xe3\xdc\x45\xd1\
-\x2a\x18\xcb\x8c\x56\x29\x54\xd9\x26\x3d\xbc\x90\x5b\x4a\x3e\x40\
-\x92\x0b\x5e\x68\x24\x95\x72\xdc\x00\x3b\xae\xdb\xa2\x0b\x72\x2c\
-\x4f\xf0\x8b\x11\x84\x21\x62\x30\x44\x8e\x46\xe0\x12\x55\x70\x22\
-\x2c\x66\xaf\x39\xc7\x06\x04\x66\xbf\x7d\x26\xff\xfa\xbf\xde\xbf\
-\xef\xef\xd6\x4a\x20\xe3\x10\x1f\xda\x1a\x17\x05\xcf\x2c\x9e\x3a\
-\x2a\x06\xc5\x1d\x64\x43\xa3\x01\x01\x9e\x70\x18\x04\xbf\x73\x96\
-\x01\x69\x05\x90\xd2\x88\xb3\xc9\xfa\x27\x15\xf9\xc4\xfc\xd3\x98\
-\x66\x0f\x30\xfd\x2c\x88\xae\x95\x82\xd4\x2d\xc7\x90\x77\x26\xb2\
-\xcf\x2d\xb5\x52\xf7\xde\xd3\xbf\x00\xd9\x94\x18\x0f\x42\xd3\x5e\
-\x72\xbc\x2b\x30\xe5\x13\xbc\xe1\x92\xf5\xbf\x1a\x11\xd0\x70\xaa\
-\xa3\xa4\xb8\x4b\x20\xbd\x26\x21\x01\xc1\xe2\xd3\xbf\x97\x94\x14\
-\x85\xfd\x1c\x04\x78\x23\xb8\x00\x44\x41\x00\xf6\xa3\x14\x28\x60\
-\xb7\xc3\x9f\xbe\xdb\x89\x6f\x7f\xed\xde\xfb\x97\x4a\xa0\x70\x03\
-\x32\xd7\xbf\x0f\x31\x4e\xa2\x46\x29\xfb\x04\x7e\xb5\xb8\x9d\x48\
-\xe1\x89\xb8\x52\x26\x27\xcc\x07\xf7\xfa\x8a\x04\xdd\x6b\xba\xb3\
-\xfa\xfb\x61\x04\x30\x4c\x5e\x74\x2b\xe8\xaf\x9a\x5b\x0d\x25\x76\
-\x04\x0e\x76\x25\x56\x2a\x3e\x87\x50\xc5\xdb\x3d\xff\xf1\xf3\x6f\
-\xbc\xa5\x9f\xab\x6b\x14\xe9\xe4\x4b\x8f\x01\xb2\x2a\x80\x2d\x1c\
-\x3a\x57\x0a\x4c\x44\xc0\x9f\x38\xa3\x27\xd9\xe8\xd4\x63\x8e\x1a\
-\x14\x04\x90\xd1\xb0\x48\x20\x98\x34\x03\xc2\x00\x4a\x14\x85\x0b\
-\xe5\x39\x1e\x41\xa3\x30\x39\x09\x0f\x7e\xe9\x0b\xf7\xfc\xd6\xa7\
-\xff\x63\xbf\x87\x96\xae\x40\xc5\x05\x30\xc2\x10\xb2\xc6\x05\x56\
-\xa2\x88\x73\x8a\x7d\x9f\x54\xcb\xec\xaf\x17\x54\xe7\xfe\x64\xf6\
-\x52\xef\x50\x9a\xfe\x9d\x10\x25\xd8\xa5\x38\x80\x28\xf9\xd7\x3a\
-\x77\x32\x21\xe4\xd7\x28\xfc\x89\x2d\xc9\x3d\x22\x90\x89\x3e\x70\
-\x6b\x61\x4d\x03\x98\xc4\x01\x85\x8b\x0b\xf8\x75\x87\x84\x33\x3b\
-\x04\x77\x07\x1d\x30\x2b\x04\x10\xf0\xcf\xf9\x69\x81\x30\xa3\x7e\
-\x2c\x48\x00\x3c\x45\x44\xaf\x0f\x45\x27\x12\xa9\x26\xb1\xec\xa0\
-\x22\x29\xb8\xf5\x35\x9e\x5e\x06\xbf\xfd\xb4\x27\xae\xf8\xfe\x0f\
-\x4f\x3b\xf0\x85\x5a\x09\x40\xa8\x0b\xb3\xf2\x0a\x25\x5f\x5e\xfc\
-\xff\xd3\x62\x3f\xc4\x53\xe1\xc2\x80\x20\x6f\xac\x57\x7d\xbd\xca\
-\xf2\xe4\x33\xce\x9f\x59\xc3\xf5\x45\xd2\xd4\xe6\x5d\x88\x16\xcc\
-\x42\xdf\x38\xdc\xda\x1b\xe2\x44\x4c\x5b\xe8\x9f\x98\x7c\x2d\x25\
-\xa9\x84\x2d\x3f\x15\x0a\xf4\x17\x3f\x79\x4f\xb2\x20\xf0\xce\xd5\
-\xbd\x53\x8a\x27\xfb\x56\xf0\xc0\x58\x0b\x57\xb0\xe8\x7b\xd6\x24\
-\x1f\xfa\xfe\x3d\x8d\x16\x78\xc2\xa9\xd8\x84\x1a\xb4\x6e\x82\x76\
-\x34\x34\x5a\x40\xa5\xc8\x7d\x14\xef\x13\x47\x83\xfd\xa3\x42\x4e\
-\x9e\xaf\xef\x53\x25\xa5\x94\x00\x85\xa5\xa4\x2a\xa7\x2f\xa7\x1c\
-\xf9\xcb\x32\xb5\xef\x03\xf6\x9e\xf8\xda\xe5\xe7\x1f\x7c\xfe\x25\
-\x67\x1d\xf4\xdc\x4b\x7e\x35\x37\x09\x10\x64\xec\x56\x14\xef\xf3\
-\xc2\xe2\xee\x2f\x8a\xfd\xf3\xc5\xe3\x95\xcd\xc2\x19\x4f\xea\xdf\
-\xb4\x39\xbf\x82\x7c\x83\x7c\xac\xee\xfc\x4e\x44\x04\x4e\xb6\x4a\
-\x5c\x19\xe6\xfb\x36\x77\x19\x6d\xf4\xfb\x9b\x84\x1f\x49\x17\x5b\
-\xea\xe7\x8b\x89\x35\x7c\x38\x65\x5d\x4d\x76\xe5\xc5\x0f\xc7\xdf\
-\x79\xd2\x75\x37\xfe\xea\xc2\x87\x9f\xb1\x6c\x99\x7a\x81\xe7\xc7\
-\xb3\x99\xf1\x9c\x25\x73\xe7\x65\x80\x43\xa6\x19\x7f\x5b\x77\xd0\
-\x41\xf9\x42\x21\xef\xba\xcb\x49\xce\xda\xfd\xf0\xa7\x06\xc9\x23\
-\x7c\x81\x7e\xc7\x1c\x85\x48\x86\x3d\xd8\x83\xfa\x28\x71\x19\xa5\
-\xa2\xcb\xa3\xe4\x18\xfd\xcc\xf2\xbb\x4e\x64\xf8\xf4\x15\xcb\xe1\
-\xe9\x4f\x7c\xec\xf2\x0d\xc5\x9f\x7e\xaf\x78\xfa\x9e\xe2\x90\xcb\
-\x8a\xd3\x99\xae\xa1\xfe\xfe\xc5\xe3\xc3\x8b\x43\x57\xf8\xef\xa1\
-\xc4\x41\x22\xa1\xa1\x9e\x46\x39\x17\xff\xd6\xdc\xd3\xbf\x84\x08\
-\x7f\x6e\x94\x00\x81\xff\x1c\x59\x39\x17\x70\xe7\x6d\x02\xc4\x14\
-\x40\x4c\xa0\x23\xe4\x1f\x67\x78\x65\xdf\x7f\x18\xe8\x1f\x83\xfd\
-\x11\xe5\xe2\xc0\x5a\xdf\x9d\x41\x06\x77\x90\x2d\xf6\xfa\xfc\xf2\
-\x5b\x6f\x5f\xfc\xf7\x43\x1f\x3a\xfd\x82\xd2\x42\x3a\xa4\x61\xfd\
-\xae\x4e\x12\x8d\x7e\x4e\xbf\x97\x81\xe1\xc8\xf2\x16\xd8\x54\x5c\
-\x49\x7a\xd8\x30\x0d\xe0\xc2\x50\x3f\xa0\xf0\xdb\x6d\x53\x4d\xc6\
-\x73\x2b\x15\x9c\xc0\xe3\x8d\xea\x42\x37\x45\x5a\x09\x42\x56\xb5\
-\xf9\x77\xc6\xfd\x28\x27\x97\x81\xb6\x13\x97\x04\xa7\xbe\x14\xab\
-\x8a\xfd\x2f\xcc\x73\x99\x30\x6b\x2f\x28\x74\x7e\xbe\x2e\x36\x30\
-\xf5\x67\x5f\x30\xfb\x3d\xc5\x6a\x13\xbe\x77\xf2\x03\xd1\x6b\x21\
-\x16\x68\xf3\x8d\x3b\x51\xeb\xef\x34\x12\x10\x02\xec\x6e\x1a\x67\
-\x1b\xf0\xfd\x87\x84\x10\x10\x0d\x0b\xb4\x22\x13\x91\x11\x77\x48\
-\xfc\x44\xcf\x0a\x14\x0b\xe5\xf9\x2f\xbe\xe9\x57\x73\x73\xf9\x37\
-\x2c\x2c\xa7\xc7\xa1\x97\x50\x84\xc4\xb1\xf7\x27\xcc\x68\x88\x6e\
-\xdd\x83\x3c\x57\x7e\xf8\x90\x92\x81\x08\x61\x66\x9f\x72\x02\x4d\
-\x7c\x40\x43\x6e\x80\xf5\x41\xc0\xce\x0e\x60\xef\x85\xa8\xbc\xbc\
-\x06\x4f\xa9\xc0\x10\x1d\x73\x01\xa2\x3f\x67\x6c\x04\x97\x34\xc5\
-\x07\x89\x65\x2f\x1f\x6f\x9e\xc1\x5f\x7e\xf5\x8c\x2d\xb7\x12\x05\
-\xd0\x57\x4d\xd5\x89\x09\x3c\xc0\xce\xa8\x0c\xb2\xc6\x8b\xd0\x26\
-\x23\x2c\xc9\xf7\x4f\x80\xfe\x2a\x01\xfa\x4b\x64\xa5\x40\x64\xf1\
-\xd6\x57\xca\x8b\x0a\x58\xd6\xff\xca\x4b\x1e\x5e\x75\xa1\x39\xed\
-\xdb\x1b\xdf\xd2\xcf\xd5\x7a\x54\x3e\x79\x57\x1e\x9f\x7b\xa4\x1e\
-\x51\x14\x82\x80\xe7\x39\x7a\x33\xe8\x78\x1c\x9b\x2b\x81\x52\x51\
-\xe4\xd8\x40\x0c\x2a\x59\xc0\xc5\xc7\x5a\x09\xe5\xfc\xbd\xc2\x90\
-\x1a\x1d\x25\x87\xce\x67\x83\x92\xa7\xf9\x0a\xf4\xac\xdc\x16\xdd\
-\x0f\x2a\x89\x8b\x0a\x51\x26\x00\x11\x95\xd8\x04\xb6\xdc\x7e\x78\
-\xd1\xdc\xf1\xca\x0e\x21\x59\xac\x6f\xd1\xc9\xeb\x40\xd9\x85\xd8\
-\xd5\xb6\x2c\x5d\x1b\xb6\x24\xff\x5a\xe4\x13\x04\xeb\x06\x9a\x98\
-\xd9\x48\xa2\x12\x6f\xaa\x8b\x52\xe6\x1e\xb2\x8a\xc0\x1a\x05\x1c\
-\x73\xec\xea\xd5\x77\xdc\xb9\xf8\x36\xfa\x37\xa5\x40\xda\x05\x33\
-\x50\x02\x54\x40\x4b\x21\xaf\x04\x9d\x52\x04\x52\xaa\x6a\x29\xdc\
-\x48\xc3\x81\x32\xb1\xa7\x85\x34\xaf\x3f\xbb\xfa\x9b\xdc\xdf\x95\
-\xf7\xdc\xc0\x24\xa3\x3e\x5f\x2d\xf0\xf5\x6b\x22\xaa\x40\xf0\x94\
-\x07\x0f\x97\x85\xb2\x22\xd1\x97\xe2\x66\x81\x8f\x70\x08\x7e\xc3\
-\x16\xff\xf3\xf8\xf9\x53\x62\x76\xc3\xe6\xfc\xc7\x1f\xf8\xe4\xfa\
-\xcb\x88\xf0\x2f\xa6\x20\x80\xe1\x94\xc0\x8e\x4f\x04\x66\x0d\x5f\
-\x69\x64\x72\x10\x92\xaf\x50\xa4\xd7\x00\x24\xb6\x26\x13\xd6\x22\
-\x0a\x2b\xd1\x4f\xb1\x45\x1a\xbe\xab\x12\x03\x0f\x7f\xfe\x8d\x5f\
-\xdb\xb0\xa1\xff\x25\x54\x72\x28\x4d\x3f\x97\x4b\xca\x21\xaf\x51\
-\x02\xb3\xb8\x54\xd3\x54\x42\x97\xb3\xe4\x15\x76\x1f\xbc\x64\x02\
-\x6d\x89\x49\x64\xc0\x79\x0e\x89\x9b\x42\x94\x0a\x92\xa8\x02\x7b\
-\x5e\xef\x39\xb2\xe8\x01\x53\x96\xbc\x6e\xc1\x70\x88\x4a\xce\xad\
-\xb0\x23\x38\x41\x14\x30\x94\xac\x7d\x60\x89\xd0\xb9\x8a\x54\x11\
-\x71\xe1\x2f\x2f\xfb\x37\xcf\xd9\x72\x9c\xfe\x0d\xa9\x02\x38\xf7\
-\xe4\xfd\x11\x55\x20\x3f\x83\x69\x1f\xe3\x4a\x25\x2c\xf4\x1d\x1d\
-\x3c\x64\xaa\xa5\xc0\x43\x92\xb5\x87\x96\xd6\x3f\x52\x92\x1a\x29\
-\x19\x15\xe3\xd1\x94\xd4\x51\xee\xc2\xd1\x7c\x40\x2c\x67\xfe\x8a\
-\x4b\x0e\xd3\xcc\xf1\xe2\x6b\xff\xe9\xce\xb7\xcd\xcc\xe4\x3f\xe5\
-\x21\x32\x07\x82\x2b\xb7\x90\xc7\x2a\x03\x8b\x08\x72\x02\xe1\x1d\
-\x65\xa1\xdf\x27\xb7\x1c\x82\x28\x74\x31\xa8\x1f\x7a\xae\xc9\x15\
-\x20\x7b\x2e\x58\x55\x4d\x14\x4a\x50\x99\x73\x10\x22\x79\xa8\xc2\
-\x73\x10\xc4\xde\x0b\xa2\x20\x46\x3e\xdf\xb8\x53\xf6\x2f\x6f\xb9\
-\xa3\xf7\xb9\x13\xbe\xba\xe9\x7a\x62\xfd\xe7\x09\x02\x10\x8d\x1c\
-\xb6\xb1\xdc\x3b\x61\x62\x40\x96\xe6\xdf\x43\xbb\xeb\x33\xea\x85\
-\x4a\x82\xfe\x01\x85\x22\x3c\x72\x86\x5c\x00\x49\xe9\x0d\xc4\xe5\
-\xaf\xbc\xf4\xb0\x4a\x01\x5c\xf6\x8b\x99\x8d\xef\xf9\xd7\xbb\x5f\
-\x36\x3b\x9b\xff\x82\x5a\x78\x0f\x8a\xd7\x16\x34\x47\x9b\x20\xa4\
-\x05\x7d\xe0\xff\xd7\x16\xd6\x0e\xce\x24\x8a\x80\x28\x8e\xbc\x86\
-\xfb\x39\x85\xfd\x96\x0f\xc8\x73\xc6\x07\xd0\x74\xdf\x10\x21\xc8\
-\x85\x1d\xed\xfb\xa3\x70\x1e\xbe\xbb\x53\x7f\x17\x12\xcc\xe0\x49\
-\x4b\x8a\x90\xa1\x54\x28\xfd\x10\x9d\x2f\xe8\x1e\x8f\x40\x88\x4c\
-\xa0\x16\x5f\xf9\xc2\x4f\xdf\xf7\x9e\x0d\xf9\x79\x7f\xfd\x4f\x6b\
-\x3e\xad\xdc\xce\xc4\xf3\x35\x12\x40\x89\x4b\x69\x22\x19\x9b\xdc\
-\x95\x9d\x41\x27\x64\xa3\xc8\x25\x40\x12\xd9\x9b\x76\xa9\x22\xd6\
-\x3f\xa9\x53\x93\x57\x2c\xe2\x0b\xbf\x58\x12\x0b\xe0\x66\xdb\x55\
-\x96\x7b\x20\xa7\xc5\xbe\x70\xc6\x59\x1b\xd7\xbd\xfd\x9f\xef\x3a\
-\x72\xd3\xe6\xfc\x27\x94\x08\xf4\x8a\x7a\x08\xec\x1e\x08\x0c\x78\
-\x42\x96\xd7\xa8\x40\xfb\xfd\x9a\x37\xc8\x43\x16\x0e\xfd\xc8\x80\
-\x51\x06\x7c\x57\x81\xe7\x73\x57\xe0\x63\x88\xc1\x39\x4e\x24\x40\
-\x39\x31\x49\xdd\x08\x5f\x99\x2a\xe5\xc2\x75\x50\xbe\xef\xee\x94\
-\x58\xab\x70\xe6\xa4\x7b\x4e\xe8\xd4\x65\xcf\xcc\xe2\x75\xaf\x7f\
-\xdf\xba\xf7\xd6\xbf\x59\xaf\x16\xfc\x52\x01\x54\x9d\x89\xcf\x29\
-\xe1\x3f\xfa\x46\x2e\x16\xbd\x40\xdc\xa9\x0d\xbf\x10\x06\x54\x0d\
-\xa9\xbf\xc9\x64\xdf\x90\xf0\x3f\x95\x26\x60\xed\xb1\x50\x8c\x0f\
-\xfb\x39\xf4\x62\x88\x4e\x09\xbe\x79\x2d\xe0\x57\x5c\x7a\x98\x66\
-\x91\xe7\xcf\x39\x6f\xd3\xda\xa3\x5e\x7e\xcb\xcb\xd6\xac\xe9\x9d\
-\x6a\x05\x4a\x0b\xb0\x2b\x70\x96\x24\xc4\x81\x12\x40\xe6\x1a\x28\
-\x6b\xed\xa9\x90\xe5\x5a\x41\x94\xbb\x42\xef\x3e\xd2\xd7\x2b\x14\
-\x62\x95\x87\x21\x20\xcd\x73\x44\xb9\x48\x8f\x39\xd2\x20\x11\x07\
-\xc7\x0d\x30\x9c\x81\x45\x33\x54\x3a\x1d\xa1\x54\x42\xad\x05\x46\
-\x60\x7c\xa5\xd7\xc0\x25\x4c\x85\x63\x94\x47\xe0\xba\x96\xbf\x14\
-\xfe\x63\x3f\xb9\xfe\xf5\x05\xfc\x9f\xd3\xbf\x97\x1a\xcc\x24\x98\
-\xab\x91\x80\xd3\xf7\x43\xf3\x2e\x10\xe0\x26\x46\x45\xaa\x3b\x2e\
-\x02\x18\xf1\xcb\x40\x1b\xf3\xbc\x54\xd6\x1f\xe4\x48\x80\xd8\x0a\
-\x9c\xe4\xe7\x3a\x06\x85\x2c\xf6\x2b\x6a\x57\xa0\x5c\x4c\xd7\x5e\
-\x3f\xbf\xfe\x0f\x9e\x75\xc3\x5b\x7f\x79\xf9\xec\x5b\x7b\x7d\xb5\
-\xd9\x71\x09\xa8\x05\x25\xe4\x9f\x26\xdd\x3c\xeb\xac\x18\x89\xc8\
-\x14\x88\x4a\xa9\xf5\x57\x69\xfe\xbe\x18\xde\x73\xa0\x3a\x25\x02\
-\x99\x92\x71\xdc\x1e\xb7\x80\x49\x2b\x36\x95\xc0\x43\x28\x1e\xb6\
-\x54\xe1\x92\x6a\xcf\x6d\x11\x53\xb1\x07\xd7\x6a\xfd\xc6\xfc\xc7\
-\xaf\x7d\xef\xda\x57\x9d\xf7\xd3\xd9\x75\x44\xf8\xf5\x44\xa2\x05\
-\x4d\xfe\x89\x51\x85\x16\x11\x00\xdc\x89\xb5\x40\x36\xec\xf7\x69\
-\x07\xff\x13\x5f\x87\xa6\xb8\x60\xda\xf5\xd7\x29\xb5\x1c\x60\x98\
-\xb4\x58\x9e\xd7\xce\xeb\x05\xa8\xc5\x73\x67\xdd\x6d\x3e\xf2\x65\
-\xb7\x7c\xed\xdf\x8e\x5d\xfd\xec\xb5\xeb\x7a\xa7\x5b\x88\x8d\x26\
-\xd6\x6f\x60\xb4\x72\xfd\xfa\xc1\x63\x72\x9c\xe7\x6b\xdb\x10\x21\
-\xf5\xf9\x1d\xff\x5f\xf3\x01\x39\xe3\x0c\x10\x64\xab\x9e\xfb\xef\
-\x11\x74\x21\xb8\xe0\xb2\xd0\x22\x12\xc5\xe6\xb8\x09\x9e\x5b\x00\
-\x8d\x6e\x04\xb5\xfa\x5c\x81\xe5\xc8\x05\xdf\x57\xd0\xfd\x42\x01\
-\x5f\x75\xfd\xc2\x07\x9f\xfb\x77\x77\xbd\xe9\xba\x1b\x17\xb7\x08\
-\xc2\x5f\xf9\xfe\xe7\xd6\xd0\x5f\xe2\x21\x50\x61\x70\xd2\x53\xe3\
-\x04\x28\xa6\x19\x76\xe4\x50\x60\x96\x64\xdb\x47\x4a\xfc\x6f\x30\
-\xdd\x09\x2d\x08\x9b\x50\x46\x68\xf4\x17\x0f\x4d\xf1\xee\x36\x9c\
-\x13\xf0\x5b\x70\x29\x75\xf9\x20\x39\x28\xa7\x4a\xe0\xcb\x5f\xbb\
-\xef\xe6\xa7\x3d\xf3\x86\x37\x7f\xed\x7f\xd6\xbf\xe4\xbe\xf5\xfd\
-\xf3\xad\xbf\x8d\x36\x0c\x98\x93\x05\x4d\x04\x95\xe6\x0c\xe4\x24\
-\x04\xe7\x42\xf4\x1a\xce\x0b\xcf\x3b\xc2\x8c\xbe\xa0\x53\x24\x12\
-\xdc\xab\x63\xc1\x51\x24\x34\x6f\x00\x05\x01\xa6\x8a\x8d\x66\x35\
-\x72\x25\x96\xe7\x3e\x1a\xc8\xb9\xc5\xe7\xdc\x83\x23\xe0\xe8\x24\
-\x4f\x39\xc4\x67\xae\x16\xef\x58\xdd\x3f\xf5\xad\xff\xef\x9e\x23\
-\x5e\x7d\xf4\xda\x53\x89\xcf\x5f\xc2\x7d\x3d\x88\xb4\x82\xfe\xe7\
-\x7e\xf1\x81\x39\x0d\x35\x7a\x61\x3f\x04\x37\x71\xcc\x13\xe6\xd4\
-\x98\xf7\x8e\x1d\x08\x9c\x5c\x72\x77\x67\xdc\x1a\x31\xa1\x99\x88\
-\x2e\x59\xd5\x0d\x28\x4c\xb1\x10\x0e\xea\xd1\x91\x17\xcb\xe8\xc8\
-\x34\xf5\x49\x99\x12\x78\xf4\x13\xaf\xd3\x23\xaf\x4d\xff\xfb\xf7\
-\x1e\x73\xf7\x25\xc5\x7e\xc5\x5f\xbe\x78\xaf\x03\x5e\xf2\x17\x7b\
-\x1d\x7e\xe0\x81\x53\x4f\x5f\xb5\xe7\xc4\x53\xb2\x4c\x65\xb6\x1e\
-\x40\x37\x24\xd1\x05\x4a\x6e\xba\xa2\xe9\x3d\xe0\xc4\xa4\x90\x3d\
-\xc7\xc2\x63\x2a\xd0\xf2\x06\x59\x61\x0f\xed\xec\x21\x84\xea\x94\
-\x94\xda\x1b\xc8\x81\x77\x2a\x17\xe9\xb9\x6a\x2e\x25\x47\xe7\xa3\
-\x68\x64\xc0\x75\xe8\x07\x6e\x06\x7d\xac\xbf\x8f\xdc\xc6\xac\xb8\
-\xe8\x0b\x78\xe7\x5d\x6b\xfb\xe7\x7c\xeb\xec\x2d\xdf\xfa\xca\xb7\
-\x37\xdd\xa6\x6c\x96\x9f\x9e\x44\xa4\x2d\xbf\x26\xfe\x72\x25\x19\
-\x00\xae\xf0\x73\x29\xb4\x1c\x7f\xec\xd7\x2b\x80\xdc\x5c\x74\x47\
-\x51\x00\x20\x11\x80\xc9\x61\x80\x21\xe8\xf9\x44\xf2\xaf\x15\xac\
-\x02\xb7\xcb\x4d\xc8\xe7\x30\x85\x3f\x19\xc9\x04\x04\x5a\x17\x42\
-\x0a\x7e\xd8\x87\x5f\x3e\xc8\x0f\x28\x14\xc1\xb5\x8b\xca\xe6\x98\
-\x57\xc9\x26\x5f\xfd\xfa\xfa\x9b\x8b\xfd\xa4\xe2\xfe\x97\x9e\xfc\
-\xc4\xdd\xf6\xfc\xfb\x57\xdc\xff\xa9\x87\x3e\x74\xfa\x29\xbb\xef\
-\x96\x1d\x30\x35\x05\x7b\xee\xbe\x7b\xf6\x08\xb3\xd8\x69\x6b\x32\
-\xf0\xfd\x60\xe7\x0b\x09\x0b\x50\xaa\x97\x41\x41\xc8\xb8\xf3\xca\
-\xbb\xe5\xe4\x39\x57\x2a\xf4\x31\x0a\x0a\x01\x9d\xd0\x1d\x57\x22\
-\x7e\xc7\x64\x57\xf7\x28\x92\x6c\xe5\x84\x14\xc9\xb1\xe5\xdd\xb9\
-\x39\xbc\xa1\x5f\x58\xfa\x8d\x9b\xfb\xd7\x6d\xd9\x92\xdf\x71\xf6\
-\x0f\x67\xce\x3b\xf9\x1b\x9b\x6e\x21\x67\xa3\xad\xfe\x22\x61\xfb\
-\x67\x95\x8d\xf9\xe7\xdf\x3b\xe5\x81\x38\x40\x36\x2e\x95\x8f\x79\
-\x40\xa8\x71\x74\x9b\xb4\xa3\xaa\x80\xc9\x61\xcc\x37\x34\x0d\x06\
-\x1e\x65\xc2\x0a\x44\x46\x3a\x43\x5b\xa5\x80\x66\x32\x0d\xbd\xcf\
-\x7f\xfb\x8c\x2c\x48\xa7\xc2\x0f\x5c\x08\x59\x3e\x2c\x14\x41\x5e\
-\x28\x01\x54\x6e\xae\x79\x69\x75\xca\xe9\x38\xd3\x17\x5d\x32\x33\
-\x5f\xec\x67\x16\xf7\xbf\x5b\xbf\xb5\xd0\x3f\xb8\xdb\x12\x36\x9e\
-\x1f\x99\x33\xab\xaf\x85\x5f\x0b\x7e\x15\xef\x2f\xa0\xbf\xf5\xfb\
-\x6b\x0d\xeb\x45\x16\xb4\x32\x00\xe5\x24\x08\x23\xee\x04\x12\xbd\
-\xeb\x05\x32\xb6\xe9\xb5\x2b\xf7\x89\x5a\x91\x96\x7b\x59\xe3\x3e\
-\x45\xf6\x89\x7a\xcf\x3a\x25\x30\x94\x02\xa0\xf5\xfc\x3d\xe5\x0e\
-\x1f\xd5\xbb\xae\xf6\xc3\xee\x92\xf9\xdb\x23\xff\xf0\xad\xe3\xe1\
-\x00\xba\x2d\xb8\x40\x39\x12\xa0\x0a\x41\xef\x5a\x09\x64\x9d\x02\
-\x68\x2d\xfc\x7d\x62\xf9\x7b\xc4\xda\xf7\x15\x6d\xf4\xd1\x6d\x1d\
-\x02\xd8\x4e\xae\x67\x46\x90\x41\xd6\x21\x80\x91\x95\x2b\xed\xe8\
-\xc3\x85\xbe\xb3\xfa\x9d\x02\xd8\xee\x5d\x04\x2e\xf8\xdd\x35\x6f\
-\xef\xff\x07\xdb\x7a\x77\x5b\xb7\x75\x5b\xb7\x75\x5b\xb7\x75\x5b\
-\xb7\x75\x5b\x6b\x98\xca\x8b\x69\x00\x3a\x84\xda\x6d\xdd\xb6\xab\
-\x6c\x59\x77\x09\xba\xad\xdb\x3a\x04\xd0\x6d\xdd\xd6\x6d\x1d\x02\
-\xe8\xb6\x6e\xeb\xb6\x4e\x01\x74\x5b\xb7\x75\xdb\x2e\xb1\xfd\x7f\
-\x01\x06\x00\x25\x55\x46\xec\x38\xcf\x47\x91\x00\x00\x00\x00\x49\
-\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x1a\x6f\
-\x3c\
-\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
-\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x55\x54\x46\
-\x2d\x38\x22\x20\x73\x74\x61\x6e\x64\x61\x6c\x6f\x6e\x65\x3d\x22\
-\x6e\x6f\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x43\x72\x65\x61\x74\
-\x65\x64\x20\x77\x69\x74\x68\x20\x53\x6f\x64\x69\x70\x6f\x64\x69\
-\x20\x28\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x73\x6f\
-\x64\x69\x70\x6f\x64\x69\x2e\x63\x6f\x6d\x2f\x22\x29\x20\x2d\x2d\
-\x3e\x0a\x3c\x73\x76\x67\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\
-\x64\x63\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x70\x75\x72\x6c\x2e\
-\x6f\x72\x67\x2f\x64\x63\x2f\x65\x6c\x65\x6d\x65\x6e\x74\x73\x2f\
-\x31\x2e\x31\x2f\x22\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x63\
-\x63\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x63\x72\x65\x61\x74\x69\
-\x76\x65\x63\x6f\x6d\x6d\x6f\x6e\x73\x2e\x6f\x72\x67\x2f\x6e\x73\
-\x23\x22\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\
-\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\
-\x72\x67\x2f\x31\x39\x39\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\
-\x66\x2d\x73\x79\x6e\x74\x61\x78\x2d\x6e\x73\x23\x22\x0a\x20\x20\
-\x20\x78\x6d\x6c\x6e\x73\x3a\x73\x76\x67\x3d\x22\x68\x74\x74\x70\
-\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
-\x30\x30\x2f\x73\x76\x67\x22\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\
-\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\
-\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\x22\x0a\x20\x20\
-\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\x69\x6e\x6b\x3d\x22\x68\x74\
-\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\
-\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\x6b\x22\x0a\x20\x20\x20\x78\
-\x6d\x6c\x6e\x73\x3a\x73\x6f\x64\x69\x70\x6f\x64\x69\x3d\x22\x68\
-\x74\x74\x70\x3a\x2f\x2f\x73\x6f\x64\x69\x70\x6f\x64\x69\x2e\x73\
-\x6f\x75\x72\x63\x65\x66\x6f\x72\x67\x65\x2e\x6e\x65\x74\x2f\x44\
-\x54\x44\x2f\x73\x6f\x64\x69\x70\x6f\x64\x69\x2d\x30\x2e\x64\x74\
-\x64\x22\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x69\x6e\x6b\x73\
-\x63\x61\x70\x65\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\
-\x2e\x69\x6e\x6b\x73\x63\x61\x70\x65\x2e\x6f\x72\x67\x2f\x6e\x61\
-\x6d\x65\x73\x70\x61\x63\x65\x73\x2f\x69\x6e\x6b\x73\x63\x61\x70\
-\x65\x22\x0a\x20\x20\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
-\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x0a\x20\x20\x20\x77\x69\
-\x64\x74\x68\x3d\x22\x31\x32\x38\x70\x74\x22\x0a\x20\x20\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x31\x32\x38\x70\x74\x22\x0a\x20\x20\
-\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x35\x30\
-\x37\x2e\x39\x34\x36\x20\x35\x30\x37\x2e\x39\x34\x36\x22\x0a\x20\
-\x20\x20\x69\x64\x3d\x22\x73\x76\x67\x34\x39\x22\x0a\x20\x20\x20\
-\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x76\x65\x72\x73\x69\x6f\x6e\
-\x3d\x22\x30\x2e\x33\x32\x22\x0a\x20\x20\x20\x73\x6f\x64\x69\x70\
-\x6f\x64\x69\x3a\x64\x6f\x63\x6e\x61\x6d\x65\x3d\x22\x66\x69\x76\
-\x65\x5f\x6e\x69\x6e\x65\x74\x79\x66\x69\x76\x65\x2e\x73\x76\x67\
-\x22\x0a\x20\x20\x20\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x64\x6f\
-\x63\x62\x61\x73\x65\x3d\x22\x2f\x6d\x6e\x74\x2f\x77\x69\x6e\x64\
-\x6f\x77\x73\x2f\x74\x68\x65\x6d\x65\x73\x2f\x57\x6f\x72\x6b\x2f\
-\x42\x6c\x75\x65\x2d\x53\x70\x68\x65\x72\x65\x2f\x22\x0a\x20\x20\
-\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x76\x65\x72\x73\x69\x6f\
-\x6e\x3d\x22\x30\x2e\x34\x36\x22\x0a\x20\x20\x20\x69\x6e\x6b\x73\
-\x63\x61\x70\x65\x3a\x6f\x75\x74\x70\x75\x74\x5f\x65\x78\x74\x65\
-\x6e\x73\x69\x6f\x6e\x3d\x22\x6f\x72\x67\x2e\x69\x6e\x6b\x73\x63\
-\x61\x70\x65\x2e\x6f\x75\x74\x70\x75\x74\x2e\x73\x76\x67\x2e\x69\
-\x6e\x6b\x73\x63\x61\x70\x65\x22\x3e\x3c\x6d\x65\x74\x61\x64\x61\
-\x74\x61\x0a\x20\x20\x20\x69\x64\x3d\x22\x6d\x65\x74\x61\x64\x61\
-\x74\x61\x32\x32\x22\x3e\x3c\x72\x64\x66\x3a\x52\x44\x46\x3e\x3c\
-\x63\x63\x3a\x57\x6f\x72\x6b\x0a\x20\x20\x20\x20\x20\x20\x20\x72\
-\x64\x66\x3a\x61\x62\x6f\x75\x74\x3d\x22\x22\x3e\x3c\x64\x63\x3a\
-\x66\x6f\x72\x6d\x61\x74\x3e\x69\x6d\x61\x67\x65\x2f\x73\x76\x67\
-\x2b\x78\x6d\x6c\x3c\x2f\x64\x63\x3a\x66\x6f\x72\x6d\x61\x74\x3e\
-\x3c\x64\x63\x3a\x74\x79\x70\x65\x0a\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x72\x64\x66\x3a\x72\x65\x73\x6f\x75\x72\x63\x65\x3d\x22\
-\x68\x74\x74\x70\x3a\x2f\x2f\x70\x75\x72\x6c\x2e\x6f\x72\x67\x2f\
-\x64\x63\x2f\x64\x63\x6d\x69\x74\x79\x70\x65\x2f\x53\x74\x69\x6c\
-\x6c\x49\x6d\x61\x67\x65\x22\x20\x2f\x3e\x3c\x2f\x63\x63\x3a\x57\
-\x6f\x72\x6b\x3e\x3c\x2f\x72\x64\x66\x3a\x52\x44\x46\x3e\x3c\x2f\
-\x6d\x65\x74\x61\x64\x61\x74\x61\x3e\x0a\x20\x20\x3c\x64\x65\x66\
-\x73\x0a\x20\x20\x20\x69\x64\x3d\x22\x64\x65\x66\x73\x36\x32\x22\
-\x3e\x3c\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x70\x65\x72\x73\x70\
-\x65\x63\x74\x69\x76\x65\x0a\x20\x20\x20\x73\x6f\x64\x69\x70\x6f\
-\x64\x69\x3a\x74\x79\x70\x65\x3d\x22\x69\x6e\x6b\x73\x63\x61\x70\
-\x65\x3a\x70\x65\x72\x73\x70\x33\x64\x22\x0a\x20\x20\x20\x69\x6e\
-\x6b\x73\x63\x61\x70\x65\x3a\x76\x70\x5f\x78\x3d\x22\x30\x20\x3a\
-\x20\x38\x30\x20\x3a\x20\x31\x22\x0a\x20\x20\x20\x69\x6e\x6b\x73\
-\x63\x61\x70\x65\x3a\x76\x70\x5f\x79\x3d\x22\x30\x20\x3a\x20\x31\
-\x30\x30\x30\x20\x3a\x20\x30\x22\x0a\x20\x20\x20\x69\x6e\x6b\x73\
-\x63\x61\x70\x65\x3a\x76\x70\x5f\x7a\x3d\x22\x31\x36\x30\x20\x3a\
-\x20\x38\x30\x20\x3a\x20\x31\x22\x0a\x20\x20\x20\x69\x6e\x6b\x73\
-\x63\x61\x70\x65\x3a\x70\x65\x72\x73\x70\x33\x64\x2d\x6f\x72\x69\
-\x67\x69\x6e\x3d\x22\x38\x30\x20\x3a\x20\x35\x33\x2e\x33\x33\x33\
-\x33\x33\x33\x20\x3a\x20\x31\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\
-\x70\x65\x72\x73\x70\x65\x63\x74\x69\x76\x65\x32\x34\x22\x20\x2f\
-\x3e\x0a\x20\x20\x20\x20\x3c\x72\x61\x64\x69\x61\x6c\x47\x72\x61\
-\x64\x69\x65\x6e\x74\x0a\x20\x20\x20\x69\x64\x3d\x22\x72\x61\x64\
-\x69\x61\x6c\x47\x72\x61\x64\x69\x65\x6e\x74\x39\x33\x22\x0a\x20\
-\x20\x20\x63\x78\x3d\x22\x32\x31\x38\x2e\x39\x34\x30\x34\x22\x0a\
-\x20\x20\x20\x63\x79\x3d\x22\x32\x31\x39\x2e\x37\x37\x31\x35\x22\
-\x0a\x20\x20\x20\x72\x3d\x22\x31\x35\x30\x2e\x37\x30\x36\x33\x22\
-\x0a\x20\x20\x20\x66\x78\x3d\x22\x32\x31\x38\x2e\x39\x34\x30\x34\
-\x22\x0a\x20\x20\x20\x66\x79\x3d\x22\x32\x31\x39\x2e\x37\x37\x31\
-\x35\x22\x0a\x20\x20\x20\x67\x72\x61\x64\x69\x65\x6e\x74\x55\x6e\
-\x69\x74\x73\x3d\x22\x75\x73\x65\x72\x53\x70\x61\x63\x65\x4f\x6e\
-\x55\x73\x65\x22\x0a\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\x73\
-\x74\x72\x6f\x6b\x65\x3a\x23\x30\x30\x30\x30\x30\x30\x3b\x73\x74\
-\x72\x6f\x6b\x65\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\x30\x2e\x39\
-\x38\x36\x30\x31\x34\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\
-\x74\x68\x3a\x30\x2e\x39\x38\x31\x36\x31\x32\x3b\x22\x3e\x0a\x20\
-\x20\x20\x20\x20\x20\x3c\x73\x74\x6f\x70\x0a\x20\x20\x20\x6f\x66\
-\x66\x73\x65\x74\x3d\x22\x30\x2e\x30\x30\x30\x30\x30\x30\x22\x0a\
-\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\x73\x74\x6f\x70\x2d\x63\
-\x6f\x6c\x6f\x72\x3a\x23\x32\x35\x61\x36\x63\x61\x3b\x73\x74\x6f\
-\x70\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\x31\x3b\x22\x0a\x20\x20\
-\x20\x69\x64\x3d\x22\x73\x74\x6f\x70\x39\x34\x22\x20\x2f\x3e\x0a\
-\x20\x20\x20\x20\x20\x20\x3c\x73\x74\x6f\x70\x0a\x20\x20\x20\x6f\
-\x66\x66\x73\x65\x74\x3d\x22\x31\x2e\x30\x30\x30\x30\x30\x30\x22\
-\x0a\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\x73\x74\x6f\x70\x2d\
-\x63\x6f\x6c\x6f\x72\x3a\x23\x32\x65\x61\x36\x62\x39\x3b\x73\x74\
-\x6f\x70\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\x30\x2e\x38\x34\x33\
-\x31\x33\x37\x3b\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x73\x74\x6f\
-\x70\x39\x35\x22\x20\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x2f\x72\x61\
-\x64\x69\x61\x6c\x47\x72\x61\x64\x69\x65\x6e\x74\x3e\x0a\x20\x20\
-\x20\x20\x3c\x72\x61\x64\x69\x61\x6c\x47\x72\x61\x64\x69\x65\x6e\
-\x74\x0a\x20\x20\x20\x69\x64\x3d\x22\x61\x69\x67\x72\x64\x31\x22\
-\x0a\x20\x20\x20\x63\x78\x3d\x22\x32\x31\x38\x2e\x39\x34\x30\x34\
-\x22\x0a\x20\x20\x20\x63\x79\x3d\x22\x32\x31\x39\x2e\x37\x37\x31\
-\x35\x22\x0a\x20\x20\x20\x72\x3d\x22\x31\x35\x30\x2e\x37\x30\x36\
-\x33\x22\x0a\x20\x20\x20\x66\x78\x3d\x22\x32\x31\x38\x2e\x39\x34\
-\x30\x34\x22\x0a\x20\x20\x20\x66\x79\x3d\x22\x32\x31\x39\x2e\x37\
-\x37\x31\x35\x22\x0a\x20\x20\x20\x67\x72\x61\x64\x69\x65\x6e\x74\
-\x55\x6e\x69\x74\x73\x3d\x22\x75\x73\x65\x72\x53\x70\x61\x63\x65\
-\x4f\x6e\x55\x73\x65\x22\x0a\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\
-\x22\x73\x74\x72\x6f\x6b\x65\x3a\x23\x30\x30\x30\x30\x30\x30\x3b\
-\x73\x74\x72\x6f\x6b\x65\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\x30\
-\x2e\x39\x38\x36\x30\x31\x34\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x77\
-\x69\x64\x74\x68\x3a\x30\x2e\x39\x38\x31\x36\x31\x32\x3b\x22\x3e\
-\x0a\x20\x20\x20\x20\x20\x20\x3c\x73\x74\x6f\x70\x0a\x20\x20\x20\
-\x6f\x66\x66\x73\x65\x74\x3d\x22\x30\x22\x0a\x20\x20\x20\x73\x74\
-\x79\x6c\x65\x3d\x22\x73\x74\x6f\x70\x2d\x63\x6f\x6c\x6f\x72\x3a\
-\x23\x37\x33\x66\x66\x66\x66\x3b\x73\x74\x72\x6f\x6b\x65\x3a\x23\
-\x30\x30\x30\x30\x30\x30\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6f\x70\
-\x61\x63\x69\x74\x79\x3a\x30\x2e\x39\x38\x36\x30\x31\x34\x3b\x73\
-\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3a\x30\x2e\x39\x38\
-\x31\x36\x31\x32\x3b\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x73\x74\
-\x6f\x70\x35\x33\x22\x20\x2f\x3e\x0a\x20\x20\x20\x20\x20\x20\x3c\
-\x73\x74\x6f\x70\x0a\x20\x20\x20\x6f\x66\x66\x73\x65\x74\x3d\x22\
-\x30\x2e\x32\x38\x30\x39\x22\x0a\x20\x20\x20\x73\x74\x79\x6c\x65\
-\x3d\x22\x73\x74\x6f\x70\x2d\x63\x6f\x6c\x6f\x72\x3a\x23\x32\x45\
-\x41\x36\x42\x39\x3b\x73\x74\x72\x6f\x6b\x65\x3a\x23\x30\x30\x30\
-\x30\x30\x30\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6f\x70\x61\x63\x69\
-\x74\x79\x3a\x30\x2e\x39\x38\x36\x30\x31\x34\x3b\x73\x74\x72\x6f\
-\x6b\x65\x2d\x77\x69\x64\x74\x68\x3a\x30\x2e\x39\x38\x31\x36\x31\
-\x32\x3b\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x73\x74\x6f\x70\x35\
-\x34\x22\x20\x2f\x3e\x0a\x20\x20\x20\x20\x20\x20\x3c\x73\x74\x6f\
-\x70\x0a\x20\x20\x20\x6f\x66\x66\x73\x65\x74\x3d\x22\x31\x22\x0a\
-\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\x73\x74\x6f\x70\x2d\x63\
-\x6f\x6c\x6f\x72\x3a\x23\x30\x30\x36\x62\x38\x62\x3b\x73\x74\x72\
-\x6f\x6b\x65\x3a\x23\x30\x30\x30\x30\x30\x30\x3b\x73\x74\x72\x6f\
-\x6b\x65\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\x30\x2e\x39\x38\x36\
-\x30\x31\x34\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\
-\x3a\x30\x2e\x39\x38\x31\x36\x31\x32\x3b\x22\x0a\x20\x20\x20\x69\
-\x64\x3d\x22\x73\x74\x6f\x70\x35\x35\x22\x20\x2f\x3e\x0a\x20\x20\
-\x20\x20\x3c\x2f\x72\x61\x64\x69\x61\x6c\x47\x72\x61\x64\x69\x65\
-\x6e\x74\x3e\x0a\x20\x20\x20\x20\x3c\x6c\x69\x6e\x65\x61\x72\x47\
-\x72\x61\x64\x69\x65\x6e\x74\x0a\x20\x20\x20\x78\x6c\x69\x6e\x6b\
-\x3a\x68\x72\x65\x66\x3d\x22\x23\x61\x69\x67\x72\x64\x31\x22\x0a\
-\x20\x20\x20\x69\x64\x3d\x22\x6c\x69\x6e\x65\x61\x72\x47\x72\x61\
-\x64\x69\x65\x6e\x74\x39\x31\x22\x0a\x20\x20\x20\x78\x31\x3d\x22\
-\x2d\x30\x2e\x32\x39\x35\x37\x32\x33\x22\x0a\x20\x20\x20\x79\x31\
-\x3d\x22\x2d\x30\x2e\x32\x36\x34\x35\x39\x31\x22\x0a\x20\x20\x20\
-\x78\x32\x3d\x22\x30\x2e\x36\x32\x32\x35\x37\x34\x22\x0a\x20\x20\
-\x20\x79\x32\x3d\x22\x30\x2e\x33\x36\x35\x37\x36\x32\x22\x0a\x20\
-\x20\x20\x67\x72\x61\x64\x69\x65\x6e\x74\x55\x6e\x69\x74\x73\x3d\
-\x22\x6f\x62\x6a\x65\x63\x74\x42\x6f\x75\x6e\x64\x69\x6e\x67\x42\
-\x6f\x78\x22\x0a\x20\x20\x20\x67\x72\x61\x64\x69\x65\x6e\x74\x54\
-\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\
-\x28\x30\x2e\x39\x39\x36\x31\x31\x34\x2c\x30\x2c\x30\x2c\x31\x2e\
-\x30\x30\x33\x39\x2c\x30\x2e\x34\x39\x36\x31\x32\x34\x2c\x30\x2e\
-\x34\x39\x32\x31\x38\x36\x29\x22\x0a\x20\x20\x20\x73\x70\x72\x65\
-\x61\x64\x4d\x65\x74\x68\x6f\x64\x3d\x22\x70\x61\x64\x22\x20\x2f\
-\x3e\x0a\x20\x20\x20\x20\x3c\x72\x61\x64\x69\x61\x6c\x47\x72\x61\
-\x64\x69\x65\x6e\x74\x0a\x20\x20\x20\x78\x6c\x69\x6e\x6b\x3a\x68\
-\x72\x65\x66\x3d\x22\x23\x61\x69\x67\x72\x64\x31\x22\x0a\x20\x20\
-\x20\x69\x64\x3d\x22\x72\x61\x64\x69\x61\x6c\x47\x72\x61\x64\x69\
-\x65\x6e\x74\x39\x32\x22\x0a\x20\x20\x20\x63\x78\x3d\x22\x2d\x38\
-\x2e\x30\x39\x33\x34\x34\x65\x2d\x30\x35\x22\x0a\x20\x20\x20\x63\
-\x79\x3d\x22\x2d\x37\x2e\x36\x38\x38\x36\x37\x65\x2d\x30\x35\x22\
-\x0a\x20\x20\x20\x66\x78\x3d\x22\x2d\x38\x2e\x30\x39\x33\x34\x34\
-\x65\x2d\x30\x35\x22\x0a\x20\x20\x20\x66\x79\x3d\x22\x2d\x37\x2e\
-\x36\x38\x38\x36\x37\x65\x2d\x30\x35\x22\x0a\x20\x20\x20\x72\x3d\
-\x22\x30\x2e\x37\x38\x39\x31\x32\x37\x22\x0a\x20\x20\x20\x67\x72\
-\x61\x64\x69\x65\x6e\x74\x55\x6e\x69\x74\x73\x3d\x22\x6f\x62\x6a\
-\x65\x63\x74\x42\x6f\x75\x6e\x64\x69\x6e\x67\x42\x6f\x78\x22\x0a\
-\x20\x20\x20\x67\x72\x61\x64\x69\x65\x6e\x74\x54\x72\x61\x6e\x73\
-\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x31\x2e\x30\
-\x36\x37\x38\x34\x2c\x30\x2c\x30\x2c\x30\x2e\x39\x33\x36\x34\x36\
-\x39\x2c\x30\x2e\x33\x34\x32\x32\x31\x39\x2c\x30\x2e\x33\x34\x34\
-\x37\x31\x32\x29\x22\x0a\x20\x20\x20\x73\x70\x72\x65\x61\x64\x4d\
-\x65\x74\x68\x6f\x64\x3d\x22\x70\x61\x64\x22\x20\x2f\x3e\x0a\x20\
-\x20\x20\x20\x3c\x72\x61\x64\x69\x61\x6c\x47\x72\x61\x64\x69\x65\
-\x6e\x74\x0a\x20\x20\x20\x78\x6c\x69\x6e\x6b\x3a\x68\x72\x65\x66\
-\x3d\x22\x23\x61\x69\x67\x72\x64\x31\x22\x0a\x20\x20\x20\x69\x64\
-\x3d\x22\x72\x61\x64\x69\x61\x6c\x47\x72\x61\x64\x69\x65\x6e\x74\
-\x31\x35\x39\x34\x22\x0a\x20\x20\x20\x63\x78\x3d\x22\x31\x2e\x33\
-\x37\x31\x35\x37\x65\x2d\x32\x35\x22\x0a\x20\x20\x20\x63\x79\x3d\
-\x22\x34\x2e\x38\x32\x37\x38\x33\x65\x2d\x32\x36\x22\x0a\x20\x20\
-\x20\x66\x78\x3d\x22\x31\x2e\x33\x37\x31\x35\x37\x65\x2d\x32\x35\
-\x22\x0a\x20\x20\x20\x66\x79\x3d\x22\x34\x2e\x38\x32\x37\x38\x33\
-\x65\x2d\x32\x36\x22\x0a\x20\x20\x20\x72\x3d\x22\x30\x2e\x37\x36\
-\x36\x33\x35\x38\x22\x0a\x20\x20\x20\x67\x72\x61\x64\x69\x65\x6e\
-\x74\x55\x6e\x69\x74\x73\x3d\x22\x6f\x62\x6a\x65\x63\x74\x42\x6f\
-\x75\x6e\x64\x69\x6e\x67\x42\x6f\x78\x22\x0a\x20\x20\x20\x67\x72\
-\x61\x64\x69\x65\x6e\x74\x54\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\
-\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x39\x32\x30\x36\x37\x39\
-\x2c\x2d\x30\x2e\x30\x32\x38\x35\x38\x32\x34\x2c\x30\x2e\x30\x33\
-\x33\x36\x31\x36\x38\x2c\x31\x2e\x30\x38\x35\x31\x31\x2c\x30\x2e\
-\x33\x37\x33\x34\x33\x36\x2c\x30\x2e\x33\x38\x34\x38\x35\x34\x29\
-\x22\x0a\x20\x20\x20\x73\x70\x72\x65\x61\x64\x4d\x65\x74\x68\x6f\
-\x64\x3d\x22\x70\x61\x64\x22\x20\x2f\x3e\x0a\x20\x20\x3c\x2f\x64\
-\x65\x66\x73\x3e\x0a\x20\x20\x3c\x73\x6f\x64\x69\x70\x6f\x64\x69\
-\x3a\x6e\x61\x6d\x65\x64\x76\x69\x65\x77\x0a\x20\x20\x20\x69\x64\
-\x3d\x22\x62\x61\x73\x65\x22\x0a\x20\x20\x20\x73\x68\x6f\x77\x67\
-\x72\x69\x64\x3d\x22\x66\x61\x6c\x73\x65\x22\x0a\x20\x20\x20\x69\
-\x6e\x6b\x73\x63\x61\x70\x65\x3a\x7a\x6f\x6f\x6d\x3d\x22\x32\x2e\
-\x36\x38\x37\x35\x22\x0a\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\
-\x65\x3a\x63\x78\x3d\x22\x38\x2e\x37\x34\x37\x31\x36\x32\x39\x22\
-\x0a\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x63\x79\x3d\
-\x22\x31\x33\x39\x2e\x31\x33\x36\x31\x37\x22\x0a\x20\x20\x20\x69\
-\x6e\x6b\x73\x63\x61\x70\x65\x3a\x77\x69\x6e\x64\x6f\x77\x2d\x77\
-\x69\x64\x74\x68\x3d\x22\x31\x36\x30\x30\x22\x0a\x20\x20\x20\x69\
-\x6e\x6b\x73\x63\x61\x70\x65\x3a\x77\x69\x6e\x64\x6f\x77\x2d\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x31\x31\x33\x37\x22\x0a\x20\x20\x20\
-\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x77\x69\x6e\x64\x6f\x77\x2d\
-\x78\x3d\x22\x2d\x34\x22\x0a\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x3a\x77\x69\x6e\x64\x6f\x77\x2d\x79\x3d\x22\x2d\x34\x22\
-\x0a\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x63\x75\x72\
-\x72\x65\x6e\x74\x2d\x6c\x61\x79\x65\x72\x3d\x22\x73\x76\x67\x34\
-\x39\x22\x3e\x0a\x20\x20\x20\x20\x3c\x73\x6f\x64\x69\x70\x6f\x64\
-\x69\x3a\x67\x75\x69\x64\x65\x0a\x20\x20\x20\x6f\x72\x69\x65\x6e\
-\x74\x61\x74\x69\x6f\x6e\x3d\x22\x76\x65\x72\x74\x69\x63\x61\x6c\
-\x22\x0a\x20\x20\x20\x70\x6f\x73\x69\x74\x69\x6f\x6e\x3d\x22\x37\
-\x33\x2e\x36\x39\x30\x38\x34\x39\x22\x0a\x20\x20\x20\x69\x64\x3d\
-\x22\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x67\x75\x69\x64\x65\x31\
-\x32\x37\x22\x20\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x73\x6f\x64\x69\
-\x70\x6f\x64\x69\x3a\x67\x75\x69\x64\x65\x0a\x20\x20\x20\x6f\x72\
-\x69\x65\x6e\x74\x61\x74\x69\x6f\x6e\x3d\x22\x76\x65\x72\x74\x69\
-\x63\x61\x6c\x22\x0a\x20\x20\x20\x70\x6f\x73\x69\x74\x69\x6f\x6e\
-\x3d\x22\x31\x30\x31\x2e\x31\x34\x38\x32\x36\x32\x22\x0a\x20\x20\
-\x20\x69\x64\x3d\x22\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x67\x75\
-\x69\x64\x65\x32\x32\x22\x20\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x73\
-\x6f\x64\x69\x70\x6f\x64\x69\x3a\x67\x75\x69\x64\x65\x0a\x20\x20\
-\x20\x6f\x72\x69\x65\x6e\x74\x61\x74\x69\x6f\x6e\x3d\x22\x76\x65\
-\x72\x74\x69\x63\x61\x6c\x22\x0a\x20\x20\x20\x70\x6f\x73\x69\x74\
-\x69\x6f\x6e\x3d\x22\x35\x37\x2e\x39\x34\x33\x32\x31\x38\x22\x0a\
-\x20\x20\x20\x69\x64\x3d\x22\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\
-\x67\x75\x69\x64\x65\x32\x33\x22\x20\x2f\x3e\x0a\x20\x20\x20\x20\
-\x3c\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x67\x75\x69\x64\x65\x0a\
-\x20\x20\x20\x6f\x72\x69\x65\x6e\x74\x61\x74\x69\x6f\x6e\x3d\x22\
-\x76\x65\x72\x74\x69\x63\x61\x6c\x22\x0a\x20\x20\x20\x70\x6f\x73\
-\x69\x74\x69\x6f\x6e\x3d\x22\x33\x30\x2e\x38\x38\x39\x35\x38\x39\
-\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x73\x6f\x64\x69\x70\x6f\x64\
-\x69\x3a\x67\x75\x69\x64\x65\x31\x35\x39\x33\x22\x20\x2f\x3e\x0a\
-\x20\x20\x20\x20\x3c\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x67\x75\
-\x69\x64\x65\x0a\x20\x20\x20\x6f\x72\x69\x65\x6e\x74\x61\x74\x69\
-\x6f\x6e\x3d\x22\x68\x6f\x72\x69\x7a\x6f\x6e\x74\x61\x6c\x22\x0a\
-\x20\x20\x20\x70\x6f\x73\x69\x74\x69\x6f\x6e\x3d\x22\x36\x31\x2e\
-\x39\x38\x31\x30\x37\x31\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x73\
-\x6f\x64\x69\x70\x6f\x64\x69\x3a\x67\x75\x69\x64\x65\x31\x36\x36\
-\x32\x22\x20\x2f\x3e\x0a\x20\x20\x3c\x2f\x73\x6f\x64\x69\x70\x6f\
-\x64\x69\x3a\x6e\x61\x6d\x65\x64\x76\x69\x65\x77\x3e\x0a\x20\x20\
-\x0a\x20\x20\x0a\x3c\x74\x65\x78\x74\x0a\x20\x20\x20\x78\x6d\x6c\
-\x3a\x73\x70\x61\x63\x65\x3d\x22\x70\x72\x65\x73\x65\x72\x76\x65\
-\x22\x0a\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\x66\x6f\x6e\x74\
-\x2d\x73\x69\x7a\x65\x3a\x32\x34\x70\x78\x3b\x66\x6f\x6e\x74\x2d\
-\x73\x74\x79\x6c\x65\x3a\x6e\x6f\x72\x6d\x61\x6c\x3b\x66\x6f\x6e\
-\x74\x2d\x76\x61\x72\x69\x61\x6e\x74\x3a\x6e\x6f\x72\x6d\x61\x6c\
-\x3b\x66\x6f\x6e\x74\x2d\x77\x65\x69\x67\x68\x74\x3a\x6e\x6f\x72\
-\x6d\x61\x6c\x3b\x66\x6f\x6e\x74\x2d\x73\x74\x72\x65\x74\x63\x68\
-\x3a\x6e\x6f\x72\x6d\x61\x6c\x3b\x74\x65\x78\x74\x2d\x61\x6c\x69\
-\x67\x6e\x3a\x73\x74\x61\x72\x74\x3b\x6c\x69\x6e\x65\x2d\x68\x65\
-\x69\x67\x68\x74\x3a\x31\x30\x30\x25\x3b\x77\x72\x69\x74\x69\x6e\
-\x67\x2d\x6d\x6f\x64\x65\x3a\x6c\x72\x2d\x74\x62\x3b\x74\x65\x78\
-\x74\x2d\x61\x6e\x63\x68\x6f\x72\x3a\x73\x74\x61\x72\x74\x3b\x66\
-\x69\x6c\x6c\x3a\x23\x30\x30\x30\x30\x30\x30\x3b\x66\x69\x6c\x6c\
-\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\x31\x3b\x73\x74\x72\x6f\x6b\
-\x65\x3a\x6e\x6f\x6e\x65\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\
-\x64\x74\x68\x3a\x31\x70\x78\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6c\
-\x69\x6e\x65\x63\x61\x70\x3a\x62\x75\x74\x74\x3b\x73\x74\x72\x6f\
-\x6b\x65\x2d\x6c\x69\x6e\x65\x6a\x6f\x69\x6e\x3a\x6d\x69\x74\x65\
-\x72\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6f\x70\x61\x63\x69\x74\x79\
-\x3a\x31\x3b\x66\x6f\x6e\x74\x2d\x66\x61\x6d\x69\x6c\x79\x3a\x42\
-\x69\x74\x73\x74\x72\x65\x61\x6d\x20\x56\x65\x72\x61\x20\x53\x61\
-\x6e\x73\x3b\x2d\x69\x6e\x6b\x73\x63\x61\x70\x65\x2d\x66\x6f\x6e\
-\x74\x2d\x73\x70\x65\x63\x69\x66\x69\x63\x61\x74\x69\x6f\x6e\x3a\
-\x42\x69\x74\x73\x74\x72\x65\x61\x6d\x20\x56\x65\x72\x61\x20\x53\
-\x61\x6e\x73\x22\x0a\x20\x20\x20\x78\x3d\x22\x32\x30\x30\x2e\x38\
-\x31\x35\x38\x36\x22\x0a\x20\x20\x20\x79\x3d\x22\x32\x35\x33\x2e\
-\x39\x37\x33\x30\x31\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x74\x65\
-\x78\x74\x33\x31\x36\x39\x22\x0a\x20\x20\x20\x73\x6f\x64\x69\x70\
-\x6f\x64\x69\x3a\x6c\x69\x6e\x65\x73\x70\x61\x63\x69\x6e\x67\x3d\
-\x22\x31\x30\x30\x25\x22\x3e\x3c\x74\x73\x70\x61\x6e\x0a\x20\x20\
-\x20\x20\x20\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x72\x6f\x6c\x65\
-\x3d\x22\x6c\x69\x6e\x65\x22\x0a\x20\x20\x20\x20\x20\x69\x64\x3d\
-\x22\x74\x73\x70\x61\x6e\x33\x31\x37\x31\x22\x0a\x20\x20\x20\x20\
-\x20\x78\x3d\x22\x32\x30\x30\x2e\x38\x31\x35\x38\x36\x22\x0a\x20\
-\x20\x20\x20\x20\x79\x3d\x22\x32\x35\x33\x2e\x39\x37\x33\x30\x31\
-\x22\x20\x2f\x3e\x3c\x2f\x74\x65\x78\x74\x3e\x0a\x0a\x0a\x0a\x0a\
-\x0a\x0a\x3c\x74\x65\x78\x74\x0a\x20\x20\x20\x78\x6d\x6c\x3a\x73\
-\x70\x61\x63\x65\x3d\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x0a\
-\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\x66\x6f\x6e\x74\x2d\x73\
-\x69\x7a\x65\x3a\x32\x30\x33\x2e\x31\x37\x38\x34\x30\x35\x37\x36\
-\x70\x78\x3b\x66\x6f\x6e\x74\x2d\x73\x74\x79\x6c\x65\x3a\x6e\x6f\
-\x72\x6d\x61\x6c\x3b\x66\x6f\x6e\x74\x2d\x76\x61\x72\x69\x61\x6e\
-\x74\x3a\x6e\x6f\x72\x6d\x61\x6c\x3b\x66\x6f\x6e\x74\x2d\x77\x65\
-\x69\x67\x68\x74\x3a\x6e\x6f\x72\x6d\x61\x6c\x3b\x66\x6f\x6e\x74\
-\x2d\x73\x74\x72\x65\x74\x63\x68\x3a\x6e\x6f\x72\x6d\x61\x6c\x3b\
-\x74\x65\x78\x74\x2d\x61\x6c\x69\x67\x6e\x3a\x73\x74\x61\x72\x74\
-\x3b\x6c\x69\x6e\x65\x2d\x68\x65\x69\x67\x68\x74\x3a\x31\x30\x30\
-\x25\x3b\x77\x72\x69\x74\x69\x6e\x67\x2d\x6d\x6f\x64\x65\x3a\x6c\
-\x72\x2d\x74\x62\x3b\x74\x65\x78\x74\x2d\x61\x6e\x63\x68\x6f\x72\
-\x3a\x73\x74\x61\x72\x74\x3b\x66\x69\x6c\x6c\x3a\x23\x30\x30\x30\
-\x30\x30\x30\x3b\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\x69\x74\x79\
-\x3a\x31\x3b\x73\x74\x72\x6f\x6b\x65\x3a\x6e\x6f\x6e\x65\x3b\x73\
-\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3a\x31\x70\x78\x3b\
-\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3a\x62\
-\x75\x74\x74\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x6a\
-\x6f\x69\x6e\x3a\x6d\x69\x74\x65\x72\x3b\x73\x74\x72\x6f\x6b\x65\
-\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\x31\x3b\x66\x6f\x6e\x74\x2d\
-\x66\x61\x6d\x69\x6c\x79\x3a\x42\x69\x74\x73\x74\x72\x65\x61\x6d\
-\x20\x56\x65\x72\x61\x20\x53\x61\x6e\x73\x3b\x2d\x69\x6e\x6b\x73\
-\x63\x61\x70\x65\x2d\x66\x6f\x6e\x74\x2d\x73\x70\x65\x63\x69\x66\
-\x69\x63\x61\x74\x69\x6f\x6e\x3a\x42\x69\x74\x73\x74\x72\x65\x61\
-\x6d\x20\x56\x65\x72\x61\x20\x53\x61\x6e\x73\x22\x0a\x20\x20\x20\
-\x78\x3d\x22\x35\x35\x2e\x35\x31\x39\x36\x38\x22\x0a\x20\x20\x20\
-\x79\x3d\x22\x32\x30\x39\x2e\x39\x37\x30\x36\x39\x22\x0a\x20\x20\
-\x20\x69\x64\x3d\x22\x74\x65\x78\x74\x32\x33\x39\x39\x22\x0a\x20\
-\x20\x20\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x6c\x69\x6e\x65\x73\
-\x70\x61\x63\x69\x6e\x67\x3d\x22\x31\x30\x30\x25\x22\x3e\x3c\x74\
-\x73\x70\x61\x6e\x0a\x20\x20\x20\x20\x20\x73\x6f\x64\x69\x70\x6f\
-\x64\x69\x3a\x72\x6f\x6c\x65\x3d\x22\x6c\x69\x6e\x65\x22\x0a\x20\
-\x20\x20\x20\x20\x69\x64\x3d\x22\x74\x73\x70\x61\x6e\x32\x34\x30\
-\x31\x22\x0a\x20\x20\x20\x20\x20\x78\x3d\x22\x35\x35\x2e\x35\x31\
-\x39\x36\x38\x22\x0a\x20\x20\x20\x20\x20\x79\x3d\x22\x32\x30\x39\
-\x2e\x39\x37\x30\x36\x39\x22\x3e\x35\x3c\x2f\x74\x73\x70\x61\x6e\
-\x3e\x3c\x2f\x74\x65\x78\x74\x3e\x0a\x3c\x74\x65\x78\x74\x0a\x20\
-\x20\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\x22\x70\x72\x65\
-\x73\x65\x72\x76\x65\x22\x0a\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\
-\x22\x66\x6f\x6e\x74\x2d\x73\x69\x7a\x65\x3a\x34\x38\x70\x78\x3b\
-\x66\x6f\x6e\x74\x2d\x73\x74\x79\x6c\x65\x3a\x6e\x6f\x72\x6d\x61\
-\x6c\x3b\x66\x6f\x6e\x74\x2d\x76\x61\x72\x69\x61\x6e\x74\x3a\x6e\
-\x6f\x72\x6d\x61\x6c\x3b\x66\x6f\x6e\x74\x2d\x77\x65\x69\x67\x68\
-\x74\x3a\x6e\x6f\x72\x6d\x61\x6c\x3b\x66\x6f\x6e\x74\x2d\x73\x74\
-\x72\x65\x74\x63\x68\x3a\x6e\x6f\x72\x6d\x61\x6c\x3b\x74\x65\x78\
-\x74\x2d\x61\x6c\x69\x67\x6e\x3a\x73\x74\x61\x72\x74\x3b\x6c\x69\
-\x6e\x65\x2d\x68\x65\x69\x67\x68\x74\x3a\x31\x30\x30\x25\x3b\x77\
-\x72\x69\x74\x69\x6e\x67\x2d\x6d\x6f\x64\x65\x3a\x6c\x72\x2d\x74\
-\x62\x3b\x74\x65\x78\x74\x2d\x61\x6e\x63\x68\x6f\x72\x3a\x73\x74\
-\x61\x72\x74\x3b\x66\x69\x6c\x6c\x3a\x23\x30\x30\x30\x30\x30\x30\
-\x3b\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\x31\x3b\
-\x73\x74\x72\x6f\x6b\x65\x3a\x6e\x6f\x6e\x65\x3b\x73\x74\x72\x6f\
-\x6b\x65\x2d\x77\x69\x64\x74\x68\x3a\x31\x70\x78\x3b\x73\x74\x72\
-\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3a\x62\x75\x74\x74\
-\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x6a\x6f\x69\x6e\
-\x3a\x6d\x69\x74\x65\x72\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6f\x70\
-\x61\x63\x69\x74\x79\x3a\x31\x3b\x66\x6f\x6e\x74\x2d\x66\x61\x6d\
-\x69\x6c\x79\x3a\x43\x6f\x75\x72\x69\x65\x72\x20\x4e\x65\x77\x3b\
-\x2d\x69\x6e\x6b\x73\x63\x61\x70\x65\x2d\x66\x6f\x6e\x74\x2d\x73\
-\x70\x65\x63\x69\x66\x69\x63\x61\x74\x69\x6f\x6e\x3a\x43\x6f\x75\
-\x72\x69\x65\x72\x20\x4e\x65\x77\x22\x0a\x20\x20\x20\x78\x3d\x22\
-\x32\x31\x32\x2e\x36\x32\x38\x35\x36\x22\x0a\x20\x20\x20\x79\x3d\
-\x22\x32\x34\x36\x2e\x38\x38\x35\x33\x38\x22\x0a\x20\x20\x20\x69\
-\x64\x3d\x22\x74\x65\x78\x74\x32\x34\x30\x33\x22\x0a\x20\x20\x20\
-\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x6c\x69\x6e\x65\x73\x70\x61\
-\x63\x69\x6e\x67\x3d\x22\x31\x30\x30\x25\x22\x3e\x3c\x74\x73\x70\
-\x61\x6e\x0a\x20\x20\x20\x20\x20\x73\x6f\x64\x69\x70\x6f\x64\x69\
-\x3a\x72\x6f\x6c\x65\x3d\x22\x6c\x69\x6e\x65\x22\x0a\x20\x20\x20\
-\x20\x20\x69\x64\x3d\x22\x74\x73\x70\x61\x6e\x32\x34\x30\x35\x22\
-\x0a\x20\x20\x20\x20\x20\x78\x3d\x22\x32\x31\x32\x2e\x36\x32\x38\
-\x35\x36\x22\x0a\x20\x20\x20\x20\x20\x79\x3d\x22\x32\x34\x36\x2e\
-\x38\x38\x35\x33\x38\x22\x20\x2f\x3e\x3c\x2f\x74\x65\x78\x74\x3e\
-\x0a\x3c\x74\x65\x78\x74\x0a\x20\x20\x20\x78\x6d\x6c\x3a\x73\x70\
-\x61\x63\x65\x3d\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x0a\x20\
-\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\x66\x6f\x6e\x74\x2d\x73\x69\
-\x7a\x65\x3a\x32\x30\x33\x2e\x31\x37\x38\x34\x30\x35\x37\x36\x70\
-\x78\x3b\x66\x6f\x6e\x74\x2d\x73\x74\x79\x6c\x65\x3a\x6e\x6f\x72\
-\x6d\x61\x6c\x3b\x66\x6f\x6e\x74\x2d\x76\x61\x72\x69\x61\x6e\x74\
-\x3a\x6e\x6f\x72\x6d\x61\x6c\x3b\x66\x6f\x6e\x74\x2d\x77\x65\x69\
-\x67\x68\x74\x3a\x6e\x6f\x72\x6d\x61\x6c\x3b\x66\x6f\x6e\x74\x2d\
-\x73\x74\x72\x65\x74\x63\x68\x3a\x6e\x6f\x72\x6d\x61\x6c\x3b\x74\
-\x65\x78\x74\x2d\x61\x6c\x69\x67\x6e\x3a\x73\x74\x61\x72\x74\x3b\
-\x6c\x69\x6e\x65\x2d\x68\x65\x69\x67\x68\x74\x3a\x31\x30\x30\x25\
-\x3b\x77\x72\x69\x74\x69\x6e\x67\x2d\x6d\x6f\x64\x65\x3a\x6c\x72\
-\x2d\x74\x62\x3b\x74\x65\x78\x74\x2d\x61\x6e\x63\x68\x6f\x72\x3a\
-\x73\x74\x61\x72\x74\x3b\x66\x69\x6c\x6c\x3a\x23\x30\x30\x30\x30\
-\x30\x30\x3b\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\
-\x31\x3b\x73\x74\x72\x6f\x6b\x65\x3a\x6e\x6f\x6e\x65\x3b\x73\x74\
-\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3a\x31\x70\x78\x3b\x73\
-\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3a\x62\x75\
-\x74\x74\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x6a\x6f\
-\x69\x6e\x3a\x6d\x69\x74\x65\x72\x3b\x73\x74\x72\x6f\x6b\x65\x2d\
-\x6f\x70\x61\x63\x69\x74\x79\x3a\x31\x3b\x66\x6f\x6e\x74\x2d\x66\
-\x61\x6d\x69\x6c\x79\x3a\x42\x69\x74\x73\x74\x72\x65\x61\x6d\x20\
-\x56\x65\x72\x61\x20\x53\x61\x6e\x73\x3b\x2d\x69\x6e\x6b\x73\x63\
-\x61\x70\x65\x2d\x66\x6f\x6e\x74\x2d\x73\x70\x65\x63\x69\x66\x69\
-\x63\x61\x74\x69\x6f\x6e\x3a\x42\x69\x74\x73\x74\x72\x65\x61\x6d\
-\x20\x56\x65\x72\x61\x20\x53\x61\x6e\x73\x22\x0a\x20\x20\x20\x78\
-\x3d\x22\x32\x31\x39\x2e\x30\x32\x36\x33\x34\x22\x0a\x20\x20\x20\
-\x79\x3d\x22\x34\x32\x37\x2e\x35\x39\x32\x30\x31\x22\x0a\x20\x20\
-\x20\x69\x64\x3d\x22\x74\x65\x78\x74\x32\x34\x30\x37\x22\x0a\x20\
-\x20\x20\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x6c\x69\x6e\x65\x73\
-\x70\x61\x63\x69\x6e\x67\x3d\x22\x31\x30\x30\x25\x22\x3e\x3c\x74\
-\x73\x70\x61\x6e\x0a\x20\x20\x20\x20\x20\x73\x6f\x64\x69\x70\x6f\
-\x64\x69\x3a\x72\x6f\x6c\x65\x3d\x22\x6c\x69\x6e\x65\x22\x0a\x20\
-\x20\x20\x20\x20\x69\x64\x3d\x22\x74\x73\x70\x61\x6e\x32\x34\x30\
-\x39\x22\x0a\x20\x20\x20\x20\x20\x78\x3d\x22\x32\x31\x39\x2e\x30\
-\x32\x36\x33\x34\x22\x0a\x20\x20\x20\x20\x20\x79\x3d\x22\x34\x32\
-\x37\x2e\x35\x39\x32\x30\x31\x22\x3e\x39\x35\x3c\x2f\x74\x73\x70\
-\x61\x6e\x3e\x3c\x2f\x74\x65\x78\x74\x3e\x0a\x3c\x70\x61\x74\x68\
-\x0a\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\x66\x69\x6c\x6c\x3a\
-\x6e\x6f\x6e\x65\x3b\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3a\x65\
-\x76\x65\x6e\x6f\x64\x64\x3b\x73\x74\x72\x6f\x6b\x65\x3a\x23\x30\
-\x30\x30\x30\x30\x30\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\
-\x74\x68\x3a\x31\x36\x2e\x35\x30\x38\x32\x34\x35\x3b\x73\x74\x72\
-\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3a\x62\x75\x74\x74\
-\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x6a\x6f\x69\x6e\
-\x3a\x6d\x69\x74\x65\x72\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6f\x70\
-\x61\x63\x69\x74\x79\x3a\x31\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6d\
-\x69\x74\x65\x72\x6c\x69\x6d\x69\x74\x3a\x34\x3b\x73\x74\x72\x6f\
-\x6b\x65\x2d\x64\x61\x73\x68\x61\x72\x72\x61\x79\x3a\x6e\x6f\x6e\
-\x65\x22\x0a\x20\x20\x20\x64\x3d\x22\x4d\x20\x37\x37\x2e\x39\x36\
-\x33\x38\x30\x35\x2c\x33\x39\x34\x2e\x35\x34\x34\x31\x20\x4c\x20\
-\x33\x38\x30\x2e\x33\x36\x38\x38\x37\x2c\x36\x36\x2e\x31\x35\x31\
-\x31\x30\x37\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x70\x61\x74\x68\
-\x32\x34\x31\x37\x22\x20\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
-\x00\x00\x02\xd4\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x96\x00\x00\x00\xe1\x08\x06\x00\x00\x00\x2a\x26\x4c\x9b\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0f\x61\x00\x00\x0f\x61\
-\x01\xa8\x3f\xa7\x69\x00\x00\x02\x76\x49\x44\x41\x54\x78\x9c\xed\
-\xd2\xb1\x0d\x83\x00\x10\xc0\xc0\x4f\x94\x8a\x8e\x19\x18\x81\xfd\
-\x2b\x06\xa2\xa3\x4d\x96\x88\x85\x84\xee\x26\x70\xe1\xd7\xcc\x7c\
-\x97\x65\x19\xf8\x97\xeb\xba\xe6\xb3\x6d\xdb\x1c\xc7\x71\x77\x0b\
-\x0f\xb2\xef\xfb\xbc\xef\x8e\xe0\x99\x8c\x45\xc2\x58\x24\x8c\x45\
-\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\
-\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\
-\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\
-\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\
-\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\
-\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\
-\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\
-\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\
-\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\
-\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\
-\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\
-\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\
-\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\
-\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\
-\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\
-\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\
-\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\
-\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\
-\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\
-\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\
-\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\
-\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\
-\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\
-\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\
-\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\
-\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\
-\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\
-\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\
-\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\
-\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\
-\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\
-\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\
-\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\
-\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\x45\xc2\x58\x24\x8c\
-\x45\xe2\x35\x33\xdf\x75\x5d\xef\xee\xe0\x41\xce\xf3\x9c\x1f\x89\
-\x9d\x0d\x0c\x64\x63\xaf\xcd\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
-\x42\x60\x82\
-"
-
-qt_resource_name = "\
-\x00\x0e\
-\x03\xbb\xc8\x47\
-\x00\x72\
-\x00\x6f\x00\x69\x00\x5f\x00\x6e\x00\x63\x00\x6f\x00\x75\x00\x6e\x00\x74\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x10\
-\x05\x14\x8d\x07\
-\x00\x72\
-\x00\x6f\x00\x69\x00\x5f\x00\x61\x00\x6e\x00\x61\x00\x6c\x00\x79\x00\x73\x00\x69\x00\x73\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x14\
-\x09\x89\x1b\x67\
-\x00\x76\
-\x00\x69\x00\x65\x00\x77\x00\x6c\x00\x69\x00\x6d\x00\x69\x00\x74\x00\x73\x00\x5f\x00\x70\x00\x6f\x00\x70\x00\x75\x00\x70\x00\x2e\
-\x00\x73\x00\x76\x00\x67\
-\x00\x08\
-\x0a\x61\x5a\xa7\
-\x00\x69\
-\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x16\
-\x0c\x15\xc7\xa7\
-\x00\x64\
-\x00\x65\x00\x66\x00\x61\x00\x75\x00\x6c\x00\x74\x00\x5f\x00\x76\x00\x69\x00\x65\x00\x77\x00\x6c\x00\x69\x00\x6d\x00\x69\x00\x74\
-\x00\x73\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x10\
-\x0a\xa0\xfe\xe7\
-\x00\x73\
-\x00\x70\x00\x6c\x00\x61\x00\x73\x00\x68\x00\x73\x00\x63\x00\x72\x00\x65\x00\x65\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x13\
-\x0c\x6f\xff\x27\
-\x00\x66\
-\x00\x69\x00\x76\x00\x65\x00\x5f\x00\x6e\x00\x69\x00\x6e\x00\x65\x00\x74\x00\x79\x00\x66\x00\x69\x00\x76\x00\x65\x00\x2e\x00\x73\
-\x00\x76\x00\x67\
-\x00\x0c\
-\x05\x1f\x5d\x67\
-\x00\x62\
-\x00\x6c\x00\x61\x00\x6e\x00\x6b\x00\x69\x00\x6d\x00\x67\x00\x2e\x00\x70\x00\x6e\x00\x67\
-"
-
-qt_resource_struct = "\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x08\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x00\x22\x00\x00\x00\x00\x00\x01\x00\x00\x18\x4f\
-\x00\x00\x01\x10\x00\x00\x00\x00\x00\x01\x00\x01\x5c\xba\
-\x00\x00\x00\x48\x00\x00\x00\x00\x00\x01\x00\x00\x2f\xac\
-\x00\x00\x00\x76\x00\x00\x00\x00\x00\x01\x00\x00\x47\xd1\
-\x00\x00\x00\xbe\x00\x00\x00\x00\x00\x01\x00\x00\xd1\xcb\
-\x00\x00\x00\x8c\x00\x00\x00\x00\x00\x01\x00\x00\xb8\x4d\
-\x00\x00\x00\xe4\x00\x00\x00\x00\x00\x01\x00\x01\x42\x47\
-"
-
-def qInitResources():
-    QtCore.qRegisterResourceData(0x01, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(0x01, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
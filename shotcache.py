@@ -0,0 +1,322 @@
+#!/usr/bin/env python
+"""A persistent on-disk cache for processed shots and fit results.
+
+Loading and fitting an image is deterministic: the result only depends on
+the data file and on the settings used to process it. The cache stores
+results under a key that is derived from the file path, size and
+modification time together with all relevant settings (import settings, ROI,
+fit function, etc.). If any of these change, the key changes and the result
+is computed again.
+
+Arrays (transmission and OD images, raw frames) are stored as .npz files,
+other results (fits) are pickled, and files like png thumbnails can be
+stored as they are. The total size of the cache is bounded; when it grows
+beyond `maxsize` the least recently used entries are removed.
+
+Typical use::
+
+    cache = ShotCache()
+    key = cache.make_key(fname, 'fit', roi, fitfunc)
+    fitresult = cache.cached_call(key, fit_img, transimg, fitfunc=fitfunc)
+
+"""
+
+import os
+import shutil
+import types
+import thread
+import threading
+import hashlib
+import cPickle as pickle
+
+import numpy as np
+
+
+DEFAULT_CACHEDIR = os.path.join(os.path.expanduser('~'), '.odysseus', 'cache')
+
+
+def settings_fingerprint(settings):
+    """Return a string that uniquely describes a (nested) settings object
+
+    Handles dicts, lists, tuples, arrays and instances (like FrameSetting) in
+    a way that does not depend on dict ordering or object identity. Instance
+    attributes starting with an underscore are private state, not settings,
+    and are ignored.
+
+    **Inputs**
+
+      * settings: any object that describes how a result was obtained
+
+    **Outputs**
+
+      * fingerprint: str
+
+    """
+
+    if isinstance(settings, dict):
+        items = sorted([(str(key), settings_fingerprint(val)) for key, val \
+                        in settings.iteritems()])
+        return '{%s}'%', '.join(['%s: %s'%item for item in items])
+    elif isinstance(settings, (list, tuple)):
+        return '[%s]'%', '.join([settings_fingerprint(val) for val in settings])
+    elif isinstance(settings, np.ndarray):
+        return 'array(%s)'%settings_fingerprint(settings.tolist())
+    elif hasattr(settings, '__dict__') and not callable(settings):
+        attrs = dict([(key, val) for key, val in vars(settings).iteritems() \
+                      if not key.startswith('_')])
+        return '%s%s'%(settings.__class__.__name__, settings_fingerprint(attrs))
+    elif hasattr(settings, 'func_code'):
+        # two lambdas share a name, the code tells them apart
+        return '%s<%s>'%(settings.__name__, _code_fingerprint(settings.func_code))
+    elif callable(settings):
+        return getattr(settings, '__name__', repr(settings))
+    elif isinstance(settings, types.CodeType):
+        return 'code<%s>'%_code_fingerprint(settings)
+    else:
+        return repr(settings)
+
+
+def _code_fingerprint(code):
+    """Hash of the bytecode, constants and names of a code object"""
+
+    parts = [code.co_code, settings_fingerprint(code.co_consts),
+             settings_fingerprint(code.co_names)]
+    return hashlib.md5('|'.join(parts)).hexdigest()
+
+
+class ShotCache(object):
+    """Content-addressed store of processed shots with LRU eviction."""
+
+    def __init__(self, cachedir=None, maxsize=512*2**20):
+        """Open (and if necessary create) the cache directory
+
+        **Inputs**
+
+          * cachedir: str, directory of the cache. Default is
+                      ~/.odysseus/cache.
+          * maxsize: int, the maximum total size of the cache in bytes.
+
+        """
+
+        if cachedir is None:
+            cachedir = DEFAULT_CACHEDIR
+        self.cachedir = cachedir
+        self.maxsize = maxsize
+        try:
+            os.makedirs(self.cachedir)
+        except OSError:
+            # cache directory already exists
+            pass
+
+        # path -> [size, last used], used to find the LRU entries
+        self._entries = {}
+        # guards _entries and size, shots are cached from several threads
+        self._lock = threading.Lock()
+        self.size = 0
+        for dirpath, dirnames, filenames in os.walk(self.cachedir):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                self._entries[path] = [st.st_size, st.st_mtime]
+                self.size += st.st_size
+
+
+    def make_key(self, fname, *settings):
+        """Return the cache key for a data file processed with `settings`
+
+        **Inputs**
+
+          * fname: str, path to the data file
+          * settings: any number of objects that influence the result, for
+                      example import settings, ROI and fit function name.
+
+        **Outputs**
+
+          * key: str, hexadecimal sha1 digest, or None if fname does not exist
+
+        """
+
+        fname = os.path.abspath(str(fname))
+        try:
+            st = os.stat(fname)
+        except OSError:
+            return None
+
+        sha = hashlib.sha1()
+        sha.update('%s\n%s\n%r\n'%(fname, st.st_size, st.st_mtime))
+        sha.update(settings_fingerprint(settings))
+
+        return sha.hexdigest()
+
+
+    def _path(self, key, ext):
+        return os.path.join(self.cachedir, key[:2], ''.join([key, ext]))
+
+
+    def _touch(self, path):
+        """Mark an entry as recently used"""
+        try:
+            os.utime(path, None)
+            mtime = os.path.getmtime(path)
+        except OSError:
+            return
+        with self._lock:
+            if path in self._entries:
+                self._entries[path][1] = mtime
+
+
+    def _add(self, tmppath, path):
+        """Move a completely written file into place and account for it"""
+
+        with self._lock:
+            os.rename(tmppath, path)
+            size = os.path.getsize(path)
+            if path in self._entries:
+                self.size -= self._entries[path][0]
+            self._entries[path] = [size, os.path.getmtime(path)]
+            self.size += size
+        self.evict()
+
+
+    def _tmppath(self, path):
+        try:
+            os.mkdir(os.path.dirname(path))
+        except OSError:
+            pass
+        # unique per process and thread, so concurrent writers do not clash
+        return '%s.%s.%s.tmp'%(path, os.getpid(), thread.get_ident())
+
+
+    def get_arrays(self, key):
+        """Return a dict of arrays stored under `key`, or None"""
+
+        if key is None:
+            return None
+        path = self._path(key, '.npz')
+        try:
+            npzfile = np.load(path)
+            try:
+                arrays = dict([(name, npzfile[name]) for name in npzfile.files])
+            finally:
+                npzfile.close()
+        except (IOError, ValueError, KeyError):
+            return None
+        self._touch(path)
+
+        return arrays
+
+
+    def put_arrays(self, key, **arrays):
+        """Store the keyword arguments (all arrays) under `key`"""
+
+        if key is None:
+            return
+        path = self._path(key, '.npz')
+        tmppath = self._tmppath(path)
+        f = open(tmppath, 'wb')
+        try:
+            np.savez(f, **dict([(name, np.asarray(arr)) for name, arr \
+                                in arrays.iteritems()]))
+        finally:
+            f.close()
+        self._add(tmppath, path)
+
+
+    def get_result(self, key, default=None):
+        """Return the (pickled) result stored under `key`, or `default`"""
+
+        if key is None:
+            return default
+        path = self._path(key, '.pkl')
+        try:
+            f = open(path, 'rb')
+            try:
+                result = pickle.load(f)
+            finally:
+                f.close()
+        except (IOError, EOFError, pickle.UnpicklingError):
+            return default
+        self._touch(path)
+
+        return result
+
+
+    def put_result(self, key, result):
+        """Store any picklable result under `key`"""
+
+        if key is None:
+            return
+        path = self._path(key, '.pkl')
+        tmppath = self._tmppath(path)
+        f = open(tmppath, 'wb')
+        try:
+            pickle.dump(result, f, pickle.HIGHEST_PROTOCOL)
+        finally:
+            f.close()
+        self._add(tmppath, path)
+
+
+    def get_file(self, key, ext):
+        """Return the path of a file (e.g. a thumbnail) stored under `key`"""
+
+        if key is None:
+            return None
+        path = self._path(key, ext)
+        if not os.path.isfile(path):
+            return None
+        self._touch(path)
+
+        return path
+
+
+    def put_file(self, key, srcpath, ext):
+        """Store a copy of the file `srcpath` under `key`"""
+
+        if key is None:
+            return
+        path = self._path(key, ext)
+        tmppath = self._tmppath(path)
+        shutil.copyfile(srcpath, tmppath)
+        self._add(tmppath, path)
+
+
+    def cached_call(self, key, func, *args, **kwargs):
+        """Return func(*args, **kwargs), computing it only if not cached"""
+
+        result = self.get_result(key)
+        if result is None:
+            result = func(*args, **kwargs)
+            self.put_result(key, result)
+
+        return result
+
+
+    def evict(self):
+        """Remove least recently used entries until the size is below max"""
+
+        self._evict(self.maxsize)
+
+
+    def _evict(self, maxsize):
+        with self._lock:
+            if self.size <= maxsize:
+                return
+            lru = sorted(self._entries.items(), key=lambda item: item[1][1])
+            for path, (size, lastused) in lru:
+                if self.size <= maxsize:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                del self._entries[path]
+                self.size -= size
+
+
+    def clear(self):
+        """Remove all entries from the cache"""
+
+        self._evict(-1)
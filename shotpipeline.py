@@ -0,0 +1,279 @@
+#!/usr/bin/env python
+"""A staged, concurrent pipeline for processing new shots.
+
+A shot passes through a number of stages (for example load, absorption
+image, thumbnail, fit), each of which runs in its own worker thread(s).
+Stages are connected by bounded queues: when a stage falls behind, the
+stages before it block on a full queue instead of piling up shots in
+memory (backpressure). Finished shots are handed to a `publish` callback in
+the order in which they were submitted.
+
+A stage can be marked `latest_only`. Such a stage only processes the newest
+shot waiting in its queue, older shots skip it and are passed on unchanged.
+This is useful for fitting, where only the result for the most recent shot
+is of interest when shots arrive faster than they can be fitted.
+
+The pipeline does not depend on Qt. A GUI can pass a `publish` function
+that emits a signal, so that results are handled in the GUI thread.
+
+Typical use::
+
+    def load(shot):
+        shot.transimg = ...
+
+    pipeline = ShotPipeline([Stage('load', load, workers=2),
+                             Stage('fit', fit, latest_only=True)],
+                            publish=show_result)
+    pipeline.start()
+    pipeline.submit('/data/img0001.TIF', roi=roi)
+    ...
+    pipeline.stop()
+
+"""
+
+import time
+import heapq
+import threading
+import traceback
+import Queue
+
+
+class Shot(object):
+    """A single shot and everything computed from it by the stages.
+
+    Stage functions store their results as attributes of the shot. `error`
+    is set if a stage failed, the remaining stages are then skipped.
+
+    """
+
+    def __init__(self, fname, seqno, settings):
+        self.fname = fname
+        self.seqno = seqno
+        # snapshot of the settings at the time the shot was submitted
+        self.settings = settings
+        self.error = None
+        # names of the stages that were skipped for a newer shot
+        self.skipped = []
+        # seconds spent in each stage
+        self.timings = {}
+
+
+    def __cmp__(self, other):
+        return cmp(self.seqno, other.seqno)
+
+
+class Stage(object):
+    """A processing step of the pipeline."""
+
+    def __init__(self, name, func, workers=1, maxsize=4, latest_only=False):
+        """
+        **Inputs**
+
+          * name: str, name of the stage
+          * func: function, called as func(shot) in a worker thread. It
+                  should store its results on the shot.
+          * workers: int, number of worker threads for this stage
+          * maxsize: int, number of shots that can wait for this stage
+          * latest_only: bool, if True only the newest waiting shot is
+                         processed, older ones skip this stage.
+
+        """
+
+        self.name = name
+        self.func = func
+        self.workers = workers
+        self.maxsize = maxsize
+        self.latest_only = latest_only
+        self.queue = None
+
+
+class ShotPipeline(object):
+    """Runs shots through a list of stages and publishes the results."""
+
+    def __init__(self, stages, publish, maxsize=16):
+        """
+        **Inputs**
+
+          * stages: list of Stage instances, in the order they are applied
+          * publish: function, called as publish(shot) for every finished
+                     shot, in order of submission, from the publishing thread
+          * maxsize: int, number of finished shots that can wait for
+                     publishing
+
+        """
+
+        self.stages = stages
+        self.publish = publish
+        self.maxsize = maxsize
+        self._threads = []
+        self._seqno = 0
+        self._lock = threading.Lock()
+        self._submitlock = threading.Lock()
+        self._running = False
+
+
+    def start(self):
+        """Start the worker threads"""
+
+        if self._running:
+            return
+        for stage in self.stages:
+            stage.queue = Queue.Queue(stage.maxsize)
+        self._done = Queue.Queue(self.maxsize)
+        self._seqno = 0
+        for idx, stage in enumerate(self.stages):
+            for i in xrange(stage.workers):
+                self._start_thread(self._work, stage, self._next_queue(idx))
+        self._start_thread(self._publish)
+        self._running = True
+
+
+    def _start_thread(self, target, *args):
+        thread = threading.Thread(target=target, args=args)
+        thread.daemon = True
+        thread.start()
+        self._threads.append(thread)
+
+
+    def _next_queue(self, idx):
+        if idx + 1 < len(self.stages):
+            return self.stages[idx+1].queue
+        return self._done
+
+
+    def submit(self, fname, block=True, **settings):
+        """Add a new shot to the pipeline
+
+        Blocks if the first stage is full, unless `block` is False.
+
+        **Inputs**
+
+          * fname: str, path to the data file of the shot
+          * settings: keyword arguments, available to the stages as
+                      shot.settings
+
+        **Outputs**
+
+          * shot: Shot instance
+
+        **Optional inputs**
+
+          * block: bool, if False raise Queue.Full instead of waiting for
+                   room in the first stage. A GUI thread should not block.
+
+        """
+
+        queue = self.stages[0].queue if self.stages else self._done
+        with self._submitlock:
+            # the publisher waits for every sequence number, so a number is
+            # only used up if the shot is accepted
+            shot = Shot(fname, self._seqno, settings)
+            queue.put(shot, block)
+            self._seqno += 1
+
+        return shot
+
+
+    def pending(self):
+        """Return the number of shots waiting in each stage"""
+
+        return dict([(stage.name, stage.queue.qsize()) for stage in \
+                     self.stages])
+
+
+    def stop(self, timeout=None):
+        """Stop the worker threads after the shots already submitted"""
+
+        if not self._running:
+            return
+        # the stop request travels through the stages behind the last shot
+        if self.stages:
+            for i in xrange(self.stages[0].workers):
+                self.stages[0].queue.put(None)
+        else:
+            self._done.put(None)
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        self._running = False
+
+
+    def _work(self, stage, outqueue):
+        """Worker thread of a stage"""
+
+        while True:
+            shot = stage.queue.get()
+            if shot is None:
+                # the next stage stops when all workers of this one stopped
+                self._stopped(stage, outqueue)
+                return
+            if stage.latest_only:
+                shot = self._skip_stale(shot, stage, outqueue)
+            if shot.error is None:
+                t0 = time.time()
+                try:
+                    stage.func(shot)
+                except Exception, e:
+                    shot.error = '%s failed: %s'%(stage.name, e)
+                    traceback.print_exc()
+                shot.timings[stage.name] = time.time() - t0
+            outqueue.put(shot)
+
+
+    def _skip_stale(self, shot, stage, outqueue):
+        """Pass on all but the newest waiting shot, return the newest"""
+
+        while True:
+            try:
+                newer = stage.queue.get_nowait()
+            except Queue.Empty:
+                return shot
+            if newer is None:
+                # put the stop request back, handle it after this shot
+                stage.queue.put(None)
+                return shot
+            shot.skipped.append(stage.name)
+            outqueue.put(shot)
+            shot = newer
+
+
+    def _stopped(self, stage, outqueue):
+        """Count stopped workers, stop the next stage after the last one"""
+
+        with self._lock:
+            stage._nstopped = getattr(stage, '_nstopped', 0) + 1
+            last = stage._nstopped == stage.workers
+            if last:
+                stage._nstopped = 0
+        if not last:
+            return
+        if outqueue is self._done:
+            outqueue.put(None)
+        else:
+            nextstage = [st for st in self.stages if st.queue is outqueue][0]
+            for i in xrange(nextstage.workers):
+                outqueue.put(None)
+
+
+    def _publish(self):
+        """Publishing thread, hands out finished shots in submission order"""
+
+        waiting = []
+        nextseqno = 0
+        while True:
+            shot = self._done.get()
+            if shot is None:
+                break
+            heapq.heappush(waiting, shot)
+            while waiting and waiting[0].seqno == nextseqno:
+                self._call_publish(heapq.heappop(waiting))
+                nextseqno += 1
+        for shot in sorted(waiting):
+            self._call_publish(shot)
+
+
+    def _call_publish(self, shot):
+        try:
+            self.publish(shot)
+        except Exception:
+            traceback.print_exc()
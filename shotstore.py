@@ -0,0 +1,315 @@
+#!/usr/bin/env python
+"""Compact in-memory storage of the shots shown in the GUI.
+
+For display, a shot used to be a float32 array of shape (M, N, nframes+1),
+with the transmission image followed by the raw frames. A StoredShot can be
+used in the same way (`shot[:, :, k]`, `shot[y, x, k]`, `shot.shape`), but
+keeps the raw frames in the smallest integer type that holds them exactly
+(usually uint16) and only the transmission image as float32. Raw frames that
+are passed in as a LazyStack stay lazy, they are decoded from the image file
+when they are accessed. Once all of them are decoded they are kept compact
+like the frames of other shots.
+
+A ShotStore keeps the total memory used by its shots below a budget. When
+the budget is exceeded, the least recently used shots are moved to
+memory-mapped scratch files; they can still be accessed the same way. The
+frames of lazy shots are decoded first, so a spilled shot no longer depends
+on its image file.
+
+"""
+
+import os
+import tempfile
+import threading
+
+import numpy as np
+
+from imageio import LazyStack
+from imageprocess import ImageHistogram
+
+
+def compact_frames(frames):
+    """Return the frames in the smallest type that holds them exactly
+
+    **Inputs**
+
+      * frames: 3D array of shape (nframes, M, N), or a list of 2D arrays
+
+    **Outputs**
+
+      * frames: 3D array, of type uint8, uint16, int16 or the original type
+
+    """
+
+    frames = np.asarray(frames)
+    if frames.dtype.kind in 'ui' and frames.dtype.itemsize <= 2:
+        return frames
+    if frames.dtype.kind not in 'uif' or not np.all(np.isfinite(frames)):
+        return frames
+
+    fmin, fmax = frames.min(), frames.max()
+    for dtype in [np.uint8, np.uint16, np.int16]:
+        info = np.iinfo(dtype)
+        if fmin >= info.min and fmax <= info.max:
+            compact = frames.astype(dtype)
+            if np.all(compact == frames):
+                return compact
+            break
+
+    return frames
+
+
+class StoredShot(object):
+    """A shot in a ShotStore, indexed like the (M, N, nframes+1) array of
+    transmission image and raw frames.
+
+    Index 0 along the last axis is the transmission image, k > 0 is raw frame
+    k-1. Selected frames are returned as float32, like the original array.
+
+    """
+
+    dtype = np.dtype(np.float32)
+    ndim = 3
+
+    def __init__(self, store, frames, transimg, odsat=None):
+        self._store = store
+        # a 3D array (nframes, M, N) or a LazyStack
+        self.frames = frames
+        self.lazy = isinstance(frames, LazyStack)
+        self.transimg = transimg
+        # summed-area table of the OD, see imageprocess.integral_image
+        self.odsat = odsat
+        self.histograms = [None] * (len(frames) + 1)
+        self.shape = transimg.shape + (len(frames) + 1, )
+        self.lastused = 0
+        # paths of the scratch files, if the shot was spilled to disk
+        self.scratchfiles = []
+
+
+    def nbytes(self):
+        """Return the number of bytes held in memory"""
+
+        nbytes = 0
+        if self.lazy:
+            nbytes += self.frames.decoded_nbytes()
+        elif not isinstance(self.frames, np.memmap):
+            nbytes += self.frames.nbytes
+        if not isinstance(self.transimg, np.memmap):
+            nbytes += self.transimg.nbytes
+        if self.odsat is not None and not isinstance(self.odsat, np.memmap):
+            nbytes += self.odsat.nbytes
+
+        return nbytes
+
+
+    def is_spilled(self):
+        return bool(self.scratchfiles)
+
+
+    def frame(self, k):
+        """Return frame k, 0 is the transmission image, as float32 array"""
+
+        self._store._touch(self)
+        if k < 0:
+            k += self.shape[2]
+        if k == 0:
+            return self.transimg
+        elif 0 < k < self.shape[2]:
+            return np.asarray(self._raw(k-1), dtype=np.float32)
+        else:
+            raise IndexError, 'frame %s out of range'%k
+
+
+    def _raw(self, k):
+        """Return raw frame k, decoding it if necessary"""
+
+        if self.lazy and not self.frames.is_decoded(k):
+            frame = self.frames[k]
+            if all([self.frames.is_decoded(i) for i in \
+                    xrange(len(self.frames))]):
+                self._load()
+            self._store._decoded(self)
+            return frame
+        return self.frames[k]
+
+
+    def _load(self):
+        """Decode all frames of a lazy shot and keep them compact"""
+
+        frames = compact_frames(list(self.frames))
+        self.frames.release()
+        self.frames = frames
+        self.lazy = False
+
+
+    def histogram(self, k):
+        """Return the ImageHistogram of frame k, computed only once"""
+
+        if self.histograms[k] is None:
+            self.histograms[k] = ImageHistogram(self.frame(k))
+        return self.histograms[k]
+
+
+    def __getitem__(self, item):
+        if isinstance(item, tuple) and len(item) == 3 and \
+           isinstance(item[2], (int, long, np.integer)):
+            if item[2] == 0 or item[2] == -self.shape[2]:
+                self._store._touch(self)
+                return self.transimg[item[:2]]
+            # select before converting to float
+            self._store._touch(self)
+            k = item[2] % self.shape[2]
+            if not 0 < k < self.shape[2]:
+                raise IndexError, 'frame %s out of range'%item[2]
+            return np.asarray(self._raw(k-1)[item[:2]], dtype=np.float32)
+        return np.asarray(self)[item]
+
+
+    def __len__(self):
+        return self.shape[0]
+
+
+    def __array__(self, dtype=None):
+        img = np.empty(self.shape, dtype=np.float32)
+        for k in xrange(self.shape[2]):
+            img[:, :, k] = self.frame(k)
+        if dtype is not None:
+            img = img.astype(dtype)
+        return img
+
+
+class ShotStore(object):
+    """Holds StoredShots within a memory budget, spilling to scratch files."""
+
+    def __init__(self, budget=256*2**20, scratchdir=None):
+        """
+        **Inputs**
+
+          * budget: int, maximum number of bytes of shots kept in memory
+          * scratchdir: str, directory for the scratch files. Default is the
+                        system temporary directory.
+
+        """
+
+        self.budget = budget
+        self.scratchdir = scratchdir
+        self.shots = []
+        self._clock = 0
+        self._lock = threading.Lock()
+
+
+    def _touch(self, shot):
+        self._clock += 1
+        shot.lastused = self._clock
+
+
+    def add(self, rawframes, transimg, odsat=None):
+        """Store a shot and return it as StoredShot
+
+        **Inputs**
+
+          * rawframes: the raw frames, a 3D array (M, N, nframes), a
+                       LazyStack or a list of 2D arrays. A LazyStack is kept
+                       as it is, its frames are decoded when accessed.
+          * transimg: 2D array, the transmission image
+          * odsat: 2D array, the summed-area table of the OD. It counts
+                   in the budget and is spilled like the images.
+
+        """
+
+        if isinstance(rawframes, LazyStack):
+            frames = rawframes
+        else:
+            frames = compact_frames([rawframes[:, :, k] for k in \
+                                     xrange(rawframes.shape[2])])
+        transimg = np.asarray(transimg, dtype=np.float32)
+        shot = StoredShot(self, frames, transimg, odsat=odsat)
+        with self._lock:
+            self._touch(shot)
+            self.shots.append(shot)
+            self._enforce_budget()
+
+        return shot
+
+
+    def memory_used(self):
+        """Return the number of bytes of the shots that are in memory"""
+
+        return sum([shot.nbytes() for shot in self.shots])
+
+
+    def _decoded(self, shot):
+        """A lazy frame was decoded, the shot uses more memory now"""
+
+        with self._lock:
+            self._enforce_budget()
+
+
+    def _enforce_budget(self):
+        shots = sorted(self.shots, key=lambda shot: shot.lastused)
+        used = sum([shot.nbytes() for shot in shots])
+        # the newest shot always stays in memory
+        for shot in shots[:-1]:
+            if used <= self.budget:
+                break
+            used -= shot.nbytes()
+            self._spill(shot)
+
+
+    def _spill(self, shot):
+        """Move the arrays of a shot to memory-mapped scratch files
+
+        The frames of a lazy shot are decoded and spilled as well. If its
+        image file was changed or removed, the decoded frames are dropped
+        and accessing them raises an IOError.
+
+        """
+
+        if shot.lazy:
+            try:
+                shot._load()
+            except IOError:
+                shot.frames.release()
+        if not shot.lazy and not isinstance(shot.frames, np.memmap):
+            shot.frames = self._scratch(shot, shot.frames)
+        if not isinstance(shot.transimg, np.memmap):
+            shot.transimg = self._scratch(shot, shot.transimg)
+        if shot.odsat is not None and not isinstance(shot.odsat, np.memmap):
+            shot.odsat = self._scratch(shot, shot.odsat)
+
+
+    def _scratch(self, shot, arr):
+        """Copy an array to a new scratch file of the shot"""
+
+        fd, path = tempfile.mkstemp(suffix='.shot', dir=self.scratchdir)
+        os.close(fd)
+        mapped = np.memmap(path, dtype=arr.dtype, mode='w+', shape=arr.shape)
+        mapped[...] = arr
+        mapped.flush()
+        shot.scratchfiles.append(path)
+
+        return mapped
+
+
+    def discard(self, shot):
+        """Remove a shot from the store and delete its scratch files"""
+
+        with self._lock:
+            if shot in self.shots:
+                self.shots.remove(shot)
+        if shot.lazy and shot.frames is not None:
+            shot.frames.release()
+        shot.frames = shot.transimg = shot.odsat = None
+        for path in shot.scratchfiles:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        shot.scratchfiles = []
+
+
+    def clear(self):
+        """Remove all shots"""
+
+        for shot in list(self.shots):
+            self.discard(shot)
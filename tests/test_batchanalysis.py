@@ -0,0 +1,66 @@
+import os
+import csv
+import shutil
+import tempfile
+
+import numpy as np
+from numpy.testing import assert_approx_equal
+
+from odysseus import imageio
+from odysseus.imageprocess import atom_number
+from odysseus.importprocessing import FrameSetting
+from odysseus.batchanalysis import find_shots, run_batch, write_csv
+
+
+class TestBatchAnalysis:
+    def setup(self):
+        self.tmpdir = tempfile.mkdtemp()
+        # a single frame in kinetics mode, with strips of 256 lines for
+        # the probe with atoms, the probe without atoms and the dark field
+        frame = np.zeros((768, 40), dtype=np.float32)
+        frame[:256] = 50.
+        frame[256:512] = 100.
+        for i in range(3):
+            imageio.save_tifimage(frame, 'shot%s.tif'%i, dirname=self.tmpdir)
+        importdict = {'1':FrameSetting(kinetics=True, startat='TL')}
+        self.settings = dict(importdict=importdict, roi=None,
+                             ncount_roi=[0, 10, 0, 20], fitfunc='none',
+                             ellipse=False, pixcal=10e-6, cachedir=None)
+
+    def teardown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_batch_ncount(self):
+        fnames = find_shots([self.tmpdir], ext='tif')
+        assert len(fnames) == 3
+        rows = run_batch(fnames, self.settings, workers=1)
+        assert [row['fname'] for row in rows] == fnames
+        assert sorted([row['shotcounter'] for row in rows]) == [0, 1, 2]
+        for row in rows:
+            assert row['error'] == ''
+            assert_approx_equal(row['ncount'],
+                                atom_number(200*np.log(2), 10e-6))
+            assert row['t_total'] >= row['t_import']
+
+    def test_batch_pool_csv(self):
+        fnames = find_shots([os.path.join(self.tmpdir, '*.tif')])
+        fnames.append(os.path.join(self.tmpdir, 'missing.tif'))
+        rows = run_batch(fnames, self.settings, workers=2)
+        assert [row['fname'] for row in rows] == fnames
+        assert rows[-1]['error']
+
+        csvname = os.path.join(self.tmpdir, 'results.csv')
+        write_csv(rows, csvname)
+        table = list(csv.reader(open(csvname, 'rb')))
+        assert table[0][:2] == ['fname', 'shotcounter']
+        assert len(table) == 5
+        assert_approx_equal(float(table[1][table[0].index('ncount')]),
+                            rows[0]['ncount'])
+
+    def test_batch_size(self):
+        fnames = find_shots([self.tmpdir], ext='tif')
+        fnames.insert(1, os.path.join(self.tmpdir, 'missing.tif'))
+        rows = run_batch(fnames, self.settings, workers=1, batchsize=3)
+        assert [row['fname'] for row in rows] == fnames
+        assert rows[1]['error']
+        assert_approx_equal(rows[0]['ncount'], rows[3]['ncount'])
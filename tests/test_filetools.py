@@ -1,4 +1,6 @@
 import os
+import shutil
+import tempfile
 
 from nose import SkipTest
 
@@ -22,4 +24,107 @@ class TestGetFilesInDir:
     def test_get_files_in_dir_args(self):
         curdirlist = filetools.get_files_in_dir(os.curdir, ext='py',
                                                 globexpr='*.py', sort=False)
-        assert isinstance(curdirlist, list)
\ No newline at end of file
+        assert isinstance(curdirlist, list)
+
+class TestDirectoryIndex:
+    def setup(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.names = ['img%s.TIF'%i for i in range(5)]
+        for i, name in enumerate(self.names):
+            self._touch(name, 1000. + i)
+        self._touch('notes.txt', 1002.5)
+        self.index = filetools.DirectoryIndex(self.tmpdir)
+
+    def teardown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _touch(self, name, mtime):
+        fname = os.path.join(self.tmpdir, name)
+        open(fname, 'w').close()
+        os.utime(fname, (mtime, mtime))
+
+    def _names(self, paths):
+        return [os.path.basename(path) for path in paths]
+
+    def test_directory_index_newest(self):
+        assert len(self.index) == 5
+        assert self._names(self.index.newest(2)) == ['img4.TIF', 'img3.TIF']
+        assert self._names(self.index.newest()) == self.names[::-1]
+
+    def test_directory_index_between(self):
+        assert self._names(self.index.between(1001, 1003)) == self.names[1:4]
+        assert self._names(self.index.between(tstop=1000.5)) == ['img0.TIF']
+
+    def test_directory_index_glob(self):
+        assert self._names(self.index.glob('img[13]*')) == ['img1.TIF',
+                                                             'img3.TIF']
+
+    def test_directory_index_update(self):
+        self._touch('img1.TIF', 2000.)
+        self._touch('img9.TIF', 1500.)
+        self.index.update('img1.TIF')
+        self.index.update(os.path.join(self.tmpdir, 'img9.TIF'))
+        assert self._names(self.index.newest(2)) == ['img1.TIF', 'img9.TIF']
+        os.remove(os.path.join(self.tmpdir, 'img9.TIF'))
+        self.index.update('img9.TIF')
+        assert 'img9.TIF' not in self.index
+        assert len(self.index) == 5
+
+    def test_directory_index_save_load(self):
+        indexfile = os.path.join(self.tmpdir, 'index.pkl')
+        assert self.index.save(indexfile)
+        index2 = filetools.DirectoryIndex(self.tmpdir, indexfile=indexfile)
+        assert index2.load()
+        assert list(index2) == list(self.index)
+
+    def test_directory_index_load_rewritten(self):
+        indexfile = os.path.join(self.tmpdir, 'index.pkl')
+        assert self.index.save(indexfile)
+        dirmtime = os.stat(self.tmpdir).st_mtime
+        # rewrite a file in place, the directory mtime does not change
+        self._touch('img1.TIF', 2000.)
+        os.utime(self.tmpdir, (dirmtime, dirmtime))
+        index2 = filetools.DirectoryIndex(self.tmpdir, indexfile=indexfile)
+        assert self._names(index2.newest(1)) == ['img1.TIF']
+        assert index2.mtime('img1.TIF') == 2000.
+
+    def test_directory_index_update_size(self):
+        fname = os.path.join(self.tmpdir, 'img2.TIF')
+        f = open(fname, 'w')
+        f.write('data')
+        f.close()
+        os.utime(fname, (1002., 1002.))
+        selection = self.index.select(by='time')
+        self.index.update('img2.TIF')
+        # the entry is replaced, the earlier selection is unchanged
+        assert len(self.index) == 5
+        assert self._names(selection) == self.names
+        assert self.index._stats['img2.TIF'] == (1002., 4)
+
+    def test_directory_index_select(self):
+        assert self._names(self.index.select('img1', 'img3')) == \
+               self.names[1:4]
+        assert self._names(self.index.select('img3')) == self.names[3:]
+        assert len(self.index.select('img7', 'img3')) == 0
+        times = self.index.select(1000.5, 1002, by='time')
+        assert self._names(times) == self.names[1:3]
+        counters = self.index.select(2, 4, by='counter')
+        assert self._names(counters) == self.names[2:5]
+        assert self._names(counters[::-1]) == self.names[4:1:-1]
+        assert os.path.basename(counters[-1]) == 'img4.TIF'
+
+    def test_directory_index_select_view(self):
+        selection = self.index.select(by='time')
+        self._touch('img9.TIF', 3000.)
+        self.index.update('img9.TIF')
+        assert len(selection) == 5
+        assert len(self.index.select(by='time')) == 6
+
+    def test_find_imgnames_index(self):
+        assert self._names(filetools.find_imgnames(self.index, 'img1',
+                                                   'img2')) == self.names[1:3]
+        assert filetools.find_imgnames(self.index, 'nomatch', 'img2') == []
+
+    def test_parse_shotcounter(self):
+        assert filetools.parse_shotcounter('/data/shot_0042.TIF') == 42
+        assert filetools.parse_shotcounter('noise.TIF') is None
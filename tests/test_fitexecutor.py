@@ -0,0 +1,88 @@
+import time
+
+from odysseus.fitexecutor import FitExecutor, fit_transimg
+from odysseus.fitfuncs import WarmStart
+from odysseus.refimages import generate_image
+
+
+def square(x, delay=0.):
+    time.sleep(delay)
+    return x**2
+
+
+def fail(x):
+    raise ValueError, 'no atoms'
+
+
+class TestFitExecutor:
+    def setup(self):
+        self.executor = FitExecutor(processes=2, timeout=1.)
+
+    def teardown(self):
+        self.executor.shutdown()
+
+    def _wait(self, maxtime=5.):
+        finished = []
+        t0 = time.time()
+        while self.executor.pending() and time.time() - t0 < maxtime:
+            finished.extend(self.executor.poll())
+            time.sleep(0.01)
+        return finished
+
+    def test_fit_executor_order(self):
+        self.executor.submit(square, (2, 0.2), context='a', supersede=False)
+        self.executor.submit(square, (3, ), context='b', supersede=False)
+        assert self.executor.pending() == 2
+        finished = self._wait()
+        assert [job.result for job in finished] == [4, 9]
+        assert [job.context for job in finished] == ['a', 'b']
+
+    def test_fit_executor_latest_wins(self):
+        for x in range(5):
+            self.executor.submit(square, (x, 0.05))
+        assert self.executor.pending() == 1
+        finished = self._wait()
+        assert [job.result for job in finished] == [16]
+
+    def test_fit_executor_error(self):
+        self.executor.submit(fail, (1, ))
+        finished = self._wait()
+        assert finished[0].error.startswith('Fit failed')
+
+    def test_fit_executor_timeout(self):
+        self.executor.submit(square, (2, 10.))
+        finished = self._wait()
+        assert 'timed out' in finished[0].error
+        self.executor.submit(square, (3, ))
+        assert [job.result for job in self._wait()] == [9]
+
+
+class TestFitWarmStart:
+    def setup(self):
+        self.executor = FitExecutor(processes=2, timeout=30.)
+        self.warmstart = WarmStart()
+
+    def teardown(self):
+        self.executor.shutdown()
+
+    def _fit(self, img):
+        self.executor.submit(fit_transimg, (img, 'gaussian', False, 10e-6,
+                                            self.warmstart, 'roi'))
+        finished = []
+        t0 = time.time()
+        while not finished and time.time() - t0 < 30.:
+            finished = self.executor.poll()
+            time.sleep(0.01)
+        fitresult, nfev, warmstart = finished[0].result
+        self.warmstart.update(warmstart)
+        return warmstart
+
+    def test_warmstart_between_workers(self):
+        first = self._fit(generate_image(dims=(120, 100), cloudradius=60))
+        assert not first.warm
+        # the parameters come with the job, any worker can run the next fit
+        for i in range(3):
+            second = self._fit(generate_image(dims=(120, 100),
+                                              cloudradius=61))
+            assert second.warm
+            assert second.nfev < first.nfev
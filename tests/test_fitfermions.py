@@ -1,6 +1,8 @@
+import numpy as np
 from nose import SkipTest
 
-from odysseus.fitfermions import find_ellipticity
+from odysseus.fitfermions import find_ellipticity, do_fit
+from odysseus.fitfuncs import ideal_fermi_radial, fugacity_from_temp
 from odysseus.refimages import generate_image, stretch_img
 
 
@@ -21,8 +23,22 @@ class TestFindEllipticity:
 
 
 class TestDoFit:
-    def test_do_fit(self):
-        raise SkipTest # TODO: implement your test here
+    def setup(self):
+        self.rcoord = np.linspace(0, 100, 300)
+        self.od_prof = ideal_fermi_radial(self.rcoord, 1.2, 1.5, 50.)
+        self.guess = (1., 1., 40.)
+
+    def test_do_fit_fixedT(self):
+        ToverTF, N, ans = do_fit(self.rcoord, self.od_prof, 0, self.guess,
+                                 10e-6, fitfunc='idealfermi_fixedT', T=0.3)
+        assert np.allclose(ans[1], fugacity_from_temp(0.3))
+
+    def test_do_fit_err(self):
+        ToverTF, N, ans = do_fit(self.rcoord, self.od_prof, 0, self.guess,
+                                 10e-6, fitfunc='idealfermi_err')
+        assert np.allclose(ans[0], (1.2, 1.5, 50.), rtol=1e-4)
+        # the bracketing fits are colder and hotter than the free fit
+        assert ans[1][1] < ans[0][1] < ans[2][1]
 
 
 class TestFitImg:
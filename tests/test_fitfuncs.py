@@ -0,0 +1,86 @@
+import numpy as np
+from scipy import optimize
+
+from odysseus.fitfuncs import fit1dfunc, gaussian, WarmStart, \
+     ideal_fermi_radial, fugacity_from_temp, fit_idealfermi_fixedT
+from odysseus.polylog import fermi_poly3
+
+
+class TestWarmStart:
+    def setup(self):
+        self.x = np.linspace(0, 50, 200)
+        self.data = gaussian(self.x, 1.2, 8.)
+        self.guess = [0.5, 20.]
+        self.warmstart = WarmStart()
+
+    def test_warmstart_fewer_evaluations(self):
+        ans = fit1dfunc(gaussian, self.x, self.data, self.guess,
+                        warmstart=self.warmstart, warmkey='roi')
+        coldnfev = self.warmstart.nfev
+        assert not self.warmstart.warm
+        assert np.allclose(ans, [1.2, 8.], rtol=1e-4)
+        data2 = gaussian(self.x, 1.25, 8.1)
+        ans2 = fit1dfunc(gaussian, self.x, data2, self.guess,
+                         warmstart=self.warmstart, warmkey='roi')
+        assert self.warmstart.warm
+        assert self.warmstart.nfev < coldnfev
+        assert np.allclose(ans2, [1.25, 8.1], rtol=1e-4)
+
+    def test_warmstart_fallback(self):
+        # previous parameters that are worse than the fresh guess
+        self.warmstart.params['roi'] = np.array([50., 0.5])
+        ans = fit1dfunc(gaussian, self.x, self.data, self.guess,
+                        warmstart=self.warmstart, warmkey='roi')
+        assert not self.warmstart.warm
+        assert np.allclose(ans, [1.2, 8.], rtol=1e-4)
+
+    def test_warmstart_disabled(self):
+        warmstart = WarmStart(enabled=False)
+        for i in range(2):
+            fit1dfunc(gaussian, self.x, self.data, self.guess,
+                      warmstart=warmstart, warmkey='roi')
+            assert not warmstart.warm
+            assert warmstart.nfev > 0
+
+
+class TestFugacityFromTemp:
+    def test_fugacity_from_temp(self):
+        temps = np.array([0.002, 0.05, 0.3, 1., 5.])
+        q = fugacity_from_temp(temps)
+        assert q.shape == temps.shape
+        assert np.allclose((6*fermi_poly3(q))**(-1./3), temps, rtol=1e-8)
+
+    def test_fugacity_from_temp_scalar(self):
+        assert np.allclose(fugacity_from_temp(0.3), fugacity_from_temp([0.3]))
+        assert isinstance(fugacity_from_temp(0.3), float)
+
+
+class TestFitIdealFermiFixedT:
+    def setup(self):
+        self.r = np.linspace(0, 100, 300)
+        noise = np.random.RandomState(0).normal(0, 0.01, self.r.size)
+        self.data = ideal_fermi_radial(self.r, 1.2, 1.5, 50.) + noise
+        self.guess = [1.2, 50.]
+
+    def test_fixedT_matches_leastsq(self):
+        temps = np.linspace(0.01, 2, 7)*0.2
+        ans, success = fit_idealfermi_fixedT(self.r, self.data, temps,
+                                             self.guess)
+        assert ans.shape == (7, 3) and np.all(success)
+        for fitparams in ans:
+            q = fitparams[1]
+            residuals = lambda p: ideal_fermi_radial(self.r, p[0], q, p[1]) \
+                                  - self.data
+            ls_ans = optimize.leastsq(residuals, self.guess)[0]
+            assert np.allclose(fitparams[[0, 2]], ls_ans, rtol=1e-5)
+
+    def test_fixedT_scan(self):
+        temps = np.linspace(0.05, 1., 50)
+        ans, success = fit_idealfermi_fixedT(self.r, self.data, temps,
+                                             self.guess)
+        assert np.all(success)
+        cost = [np.sum((ideal_fermi_radial(self.r, *fitparams) -
+                        self.data)**2) for fitparams in ans]
+        # the best temperature is close to the true one
+        truetemp = (6*fermi_poly3(1.5))**(-1./3)
+        assert abs(temps[np.argmin(cost)] - truetemp) < 0.03
@@ -1,6 +1,17 @@
 """Normally one does not do IO in unit tests. So how to test this module?"""
 
+import os
+import sys
+import shutil
+import tempfile
+import subprocess
+
 from nose import SkipTest
+from nose.tools import assert_raises
+import numpy as np
+
+from odysseus import imageio
+
 
 class TestImgimportIntelligent:
     def test_imgimport_intelligent(self):
@@ -22,3 +33,272 @@ class TestSaveTifimage:
     def test_save_tifimage(self):
         raise SkipTest # TODO: implement your test here
 
+
+class TestTiffComplete:
+    def setup(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.fname = os.path.join(self.tmpdir, 'img.tif')
+        imageio.save_tifimage(np.arange(400, dtype=np.float32).reshape((20, 20)),
+                              self.fname)
+
+    def teardown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_tiff_complete(self):
+        assert imageio.tiff_complete(self.fname)
+
+    def test_tiff_complete_truncated(self):
+        data = open(self.fname, 'rb').read()
+        for size in [0, 6, len(data)//2]:
+            open(self.fname, 'wb').write(data[:size])
+            assert not imageio.tiff_complete(self.fname)
+
+    def test_tiff_complete_next_page(self):
+        # the data of a second page is written, its IFD is not there yet
+        f = open(self.fname, 'ab')
+        f.write('\0'*400)
+        f.close()
+        assert not imageio.tiff_complete(self.fname)
+
+    def test_tiff_complete_pagenumber(self):
+        from PIL import TiffImagePlugin
+        ifd = TiffImagePlugin.ImageFileDirectory_v2()
+        ifd[297] = (0, 3)
+        ifd.tagtype[297] = 3
+        img = imageio.Image.fromarray(np.ones((20, 20), dtype=np.float32))
+        img.save(self.fname, tiffinfo=ifd)
+        assert not imageio.tiff_complete(self.fname)
+        ifd[297] = (0, 1)
+        img.save(self.fname, tiffinfo=ifd)
+        assert imageio.tiff_complete(self.fname)
+
+    def test_tiff_complete_multipage(self):
+        frames = [imageio.Image.fromarray(np.ones((20, 20),
+                                                  dtype=np.float32)*i) \
+                  for i in range(3)]
+        frames[0].save(self.fname, save_all=True, append_images=frames[1:])
+        assert imageio.tiff_complete(self.fname)
+
+
+class TestKineticsStrips:
+    def setup(self):
+        self.frame = np.arange(8*6, dtype=np.float32).reshape((8, 6))
+
+    def test_kinetics_strips_vertical(self):
+        strips = imageio.kinetics_strips(self.frame, 3, 2, startat='TL')
+        assert strips.shape == (2, 3, 6)
+        assert np.all(strips[1] == self.frame[3:6])
+        strips = imageio.kinetics_strips(self.frame, 3, 2, startat='BR')
+        assert np.all(strips[0] == self.frame[5:8])
+        assert np.all(strips[1] == self.frame[2:5])
+        # a view, not a copy
+        assert strips.base is not None
+
+    def test_kinetics_strips_horizontal(self):
+        strips = imageio.kinetics_strips(self.frame, 2, 3, orientation='H',
+                                         startat='TL')
+        assert strips.shape == (3, 8, 2)
+        assert np.all(strips[2] == self.frame[:, 4:6])
+        strips = imageio.kinetics_strips(self.frame, 2, 2, orientation='H',
+                                         startat='BR')
+        assert np.all(strips[0] == self.frame[:, 4:6])
+        assert np.all(strips[1] == self.frame[:, 2:4])
+
+
+class TestLazyStack:
+    def setup(self):
+        self.decoded = []
+        self.stack = imageio.LazyStack(self._getframe, 3, (2, 4))
+
+    def _getframe(self, k):
+        self.decoded.append(k)
+        return np.ones((2, 4))*k
+
+    def test_lazy_stack_decodes_on_access(self):
+        assert self.stack.shape == (2, 4, 3)
+        assert np.all(self.stack[:, :, 2] == 2)
+        assert np.all(self.stack[2][1, :] == 2)
+        assert self.decoded == [2]
+
+    def test_lazy_stack_asarray(self):
+        img_array = np.asarray(self.stack)
+        assert img_array.shape == (2, 4, 3)
+        assert np.all(img_array[:, :, 1] == 1)
+
+    def test_lazy_stack_release(self):
+        self.stack[0]
+        self.stack[1]
+        assert self.stack.is_decoded(1) and not self.stack.is_decoded(2)
+        assert self.stack.decoded_nbytes() == 2*8*8
+        self.stack.release()
+        assert self.stack.decoded_nbytes() == 0
+        self.stack[1]
+        assert self.decoded == [0, 1, 1]
+
+    def test_lazy_stack_sources(self):
+        # strips of the frames, like kinetics mode
+        strips = imageio.LazyStack(lambda k: self.stack[k // 2][k % 2], 6,
+                                   (4, ), sources=[self.stack])
+        assert np.all(strips[3] == 1)
+        # the strips are views, the frame is counted once
+        assert strips.decoded_nbytes() == 8*8
+        strips.release()
+        assert self.stack.decoded_nbytes() == 0
+
+
+class TestFrameStack:
+    def setup(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.frame = np.arange(12, dtype=np.float32).reshape((3, 4))
+        imageio.save_tifimage(self.frame, 'frame.tif', dirname=self.tmpdir)
+        self.fname = os.path.join(self.tmpdir, 'frame.tif')
+
+    def teardown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _open_files(self):
+        fds = os.listdir('/proc/self/fd')
+        return [os.readlink('/proc/self/fd/%s'%fd) for fd in fds \
+                if os.path.exists('/proc/self/fd/%s'%fd)]
+
+    def test_frame_stack_closes_file(self):
+        if not os.path.isdir('/proc/self/fd'):
+            raise SkipTest
+        stack = imageio.FrameStack(self.fname)
+        assert self.fname not in self._open_files()
+        assert np.all(stack[0] == self.frame)
+        assert self.fname not in self._open_files()
+
+    def test_frame_stack_changed(self):
+        stack = imageio.FrameStack(self.fname)
+        imageio.save_tifimage(self.frame[:2], 'frame.tif', dirname=self.tmpdir)
+        assert_raises(IOError, stack.__getitem__, 0)
+
+
+class TestFramesChecksum:
+    def test_frames_checksum_equal(self):
+        frames = np.arange(24, dtype=np.int16).reshape((2, 4, 3))
+        assert imageio.frames_checksum(frames) == \
+               imageio.frames_checksum(frames.copy())
+
+    def test_frames_checksum_changed(self):
+        frames = np.arange(24, dtype=np.int16).reshape((2, 4, 3))
+        changed = frames.copy()
+        changed[1, 2, 2] += 1
+        assert imageio.frames_checksum(frames) != \
+               imageio.frames_checksum(changed)
+
+    def test_frames_checksum_dtype(self):
+        frames = np.arange(24, dtype=np.int16).reshape((2, 4, 3))
+        assert imageio.frames_checksum(frames) != \
+               imageio.frames_checksum(frames.astype(np.float32))
+
+
+class TestReadConversionManifest:
+    def setup(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.manifest = os.path.join(self.tmpdir, 'test.manifest')
+
+    def teardown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_read_conversion_manifest_missing(self):
+        assert imageio.read_conversion_manifest(self.manifest) == {}
+
+    def test_read_conversion_manifest(self):
+        f = open(self.manifest, 'w')
+        f.write('abc  /data/shot 1.xraw0\n\ndef  /data/shot2.xraw0\n')
+        f.close()
+        done = imageio.read_conversion_manifest(self.manifest)
+        assert done == {'/data/shot 1.xraw0':'abc', '/data/shot2.xraw0':'def'}
+
+
+class TestBatchConvertXcamera:
+    def setup(self):
+        if not imageio.tables.available():
+            raise SkipTest
+        self.tmpdir = tempfile.mkdtemp()
+        self.manifest = os.path.join(self.tmpdir, 'test.manifest')
+        self.frames = np.arange(12, dtype=np.int16).reshape((3, 4))
+        self.imglist = [self._write_shot('shot%s'%i, self.frames + i) \
+                        for i in range(3)]
+        # a file that was cut off while it was written
+        corrupt = self._write_shot('corrupt', self.frames)
+        f = open(corrupt, 'w')
+        f.write('1 2 3\n4 5\n')
+        f.close()
+        self.imglist.append(corrupt)
+
+    def teardown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _write_shot(self, name, pwa):
+        basename = os.path.join(self.tmpdir, name)
+        for k, frame in enumerate([pwa, pwa + 100, pwa*0]):
+            np.savetxt('%s.xraw%s'%(basename, k), frame, fmt='%d')
+        return '%s.xraw0'%basename
+
+    def test_batch_convert_resume(self):
+        # an interrupted conversion, only the first two shots are done
+        stats = imageio.batch_convert_xcamera(self.imglist[:2],
+                                              manifest=self.manifest,
+                                              processes=2, report=False)
+        assert stats['converted'] == 2 and stats['failed'] == []
+
+        stats = imageio.batch_convert_xcamera(self.imglist,
+                                              manifest=self.manifest,
+                                              processes=2, report=False)
+        assert stats['skipped'] == 2
+        assert stats['converted'] == 1
+        assert [img for img, reason in stats['failed']] == [self.imglist[3]]
+        done = imageio.read_conversion_manifest(self.manifest)
+        assert sorted(done.keys()) == sorted(self.imglist[:3])
+        imgarray = imageio.load_hdfimage(self.imglist[2])
+        assert np.all(imgarray[:, :, 0] == self.frames + 2)
+        assert done[self.imglist[2]] == imageio.frames_checksum(imgarray)
+
+        # the failed shot is tried again, the others are not
+        stats = imageio.batch_convert_xcamera(self.imglist,
+                                              manifest=self.manifest,
+                                              processes=2, report=False)
+        assert stats['skipped'] == 3 and stats['converted'] == 0
+        assert len(stats['failed']) == 1
+
+    def test_batch_convert_archive(self):
+        archive = os.path.join(self.tmpdir, 'run.h5')
+        stats = imageio.batch_convert_xcamera(self.imglist, archive=archive,
+                                              processes=2, report=False)
+        assert stats['converted'] == 3 and len(stats['failed']) == 1
+        assert os.path.exists(os.path.join(self.tmpdir, 'run.manifest'))
+        h5file = imageio.tables.openFile(archive, mode='r')
+        try:
+            pwoa = np.asarray(h5file.root.shots.shot_shot1.pwoa)
+        finally:
+            h5file.close()
+        assert np.all(pwoa == self.frames + 101)
+
+
+class TestLazyModule:
+    def test_lazy_module_missing(self):
+        missing = imageio._LazyModule('no_such_module_odysseus')
+        assert not missing.available()
+
+    def test_lazy_module_import(self):
+        lazy = imageio._LazyModule('no_such_module_odysseus', 'zlib')
+        assert lazy.available()
+        assert lazy.crc32('abc') == __import__('zlib').crc32('abc')
+
+
+class TestHeadlessImport:
+    def test_core_modules_without_matplotlib(self):
+        # in a fresh interpreter, the other tests have imported matplotlib
+        script = ('import sys; import odysseus.fitfermions, odysseus.imageio;'
+                  'print [m for m in sys.modules if m.split(".")[0] in '
+                  '("matplotlib", "pylab", "PyQt4")]')
+        pkgdir = os.path.dirname(os.path.dirname(
+            os.path.abspath(imageio.__file__)))
+        proc = subprocess.Popen([sys.executable, '-c', script], cwd=pkgdir,
+                                stdout=subprocess.PIPE)
+        out = proc.communicate()[0]
+        assert proc.returncode == 0
+        assert out.strip() == '[]'
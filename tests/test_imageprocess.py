@@ -24,6 +24,65 @@ class TestThresholdImage:
         raise SkipTest # TODO: implement your test here
 
 
+class TestIntegralImage:
+    def test_roi_sum(self):
+        img = np.arange(20.).reshape(4, 5)
+        sat = imageprocess.integral_image(img)
+        assert sat.shape == (5, 6)
+        assert_approx_equal(imageprocess.roi_sum(sat), img.sum())
+        assert_approx_equal(imageprocess.roi_sum(sat, [1, 4, 2, 4]),
+                            img[2:4, 1:4].sum())
+        # clipped to the image
+        assert_approx_equal(imageprocess.roi_sum(sat, [-3, 2, 1, 10]),
+                            img[1:, :2].sum())
+
+    def test_roi_stats(self):
+        img = np.ones((6, 6))
+        img[0, 0] = np.nan
+        sat = imageprocess.integral_image(img)
+        total, mean, npixels = imageprocess.roi_stats(sat, [2, 5, 1, 3])
+        assert npixels == 6
+        assert_approx_equal(total, 6)
+        assert_approx_equal(mean, 1)
+        assert imageprocess.roi_stats(sat, [3, 3, 0, 6])[2] == 0
+
+class TestImageHistogram:
+    def setup(self):
+        self.img = np.random.normal(size=(100, 120))
+        self.img[0, 0] = 50.
+
+    def test_percentile_approx(self):
+        hist = imageprocess.ImageHistogram(self.img)
+        assert hist.npixels == self.img.size
+        for q in [5, 50, 95]:
+            exact = np.percentile(self.img, q)
+            assert abs(hist.percentile(q) - exact) < hist.binwidth()
+
+    def test_percentile_exact(self):
+        hist = imageprocess.ImageHistogram(self.img, bins=16)
+        for q in [0, 5, 95, 100]:
+            assert_approx_equal(hist.percentile(q, self.img, precision=1e-6),
+                                np.percentile(self.img, q))
+
+    def test_percentile_outlier(self):
+        hist = imageprocess.ImageHistogram(self.img)
+        # the outlier does not widen the bins
+        assert hist.edges[-1] < 10
+        assert hist.above >= 1
+        assert hist.npixels == hist.below + hist.counts.sum() + hist.above
+        assert not hist.resolves(100, 1.)
+        assert hist.percentile(100) == hist.edges[-1]
+        assert hist.percentile(100, self.img, precision=1e-6) == 50.
+        assert_approx_equal(hist.percentile(0, self.img, precision=1e-6),
+                            self.img.min())
+
+    def test_percentile_nonfinite(self):
+        img = np.ones((10, 10))
+        img[:5] = np.nan
+        hist = imageprocess.ImageHistogram(img)
+        assert hist.npixels == 50
+        assert_approx_equal(hist.percentile(50, img, precision=1e-6), 1)
+
 class TestFindFitrange:
     def test_find_fitrange_withcut(self):
         testprof= np.arange(4, 0, -0.1)
@@ -0,0 +1,107 @@
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from odysseus import imageio, importprocessing
+from odysseus.importprocessing import FrameSetting, save_profile, \
+     load_profile, process_import, process_import_batch
+
+
+class TestProfile:
+    def setup(self):
+        fd, self.fname = tempfile.mkstemp(suffix='.ini')
+        os.close(fd)
+
+    def teardown(self):
+        os.remove(self.fname)
+
+    def test_profile_roundtrip(self):
+        fsett = FrameSetting(pwa=1, pwoa=0, kinetics=True, orientation='H')
+        fsett.usetext = True
+        fsett.text = 'result = (pwa - df1)/(pwoa - df2)\n# done'
+        save_profile(self.fname, {'2':fsett, '3':FrameSetting()})
+        dct = load_profile(self.fname)
+        assert sorted(dct.keys()) == ['2', '3']
+        loaded = dct['2']
+        for name in ['pwa', 'pwoa', 'df1', 'df2', 'kinetics', 'lineshift',
+                     'orientation', 'startat', 'usetext', 'text']:
+            assert getattr(loaded, name) == getattr(fsett, name)
+        assert loaded.custom_func() is not None
+
+
+class TestCustomFunc:
+    def setup(self):
+        self.compiled = []
+        self._compile = importprocessing._compile_custom_func
+        def counting_compile(rawinput):
+            self.compiled.append(rawinput)
+            return self._compile(rawinput)
+        importprocessing._compile_custom_func = counting_compile
+        self.fsett = FrameSetting()
+        self.fsett.usetext = True
+        self.fsett.text = 'nom = pwa - df1\nresult = nom/(pwoa - df2 + 1.)'
+        rand = np.random.RandomState(0)
+        self.frames = [rand.rand(4, 5)*100 for i in range(3)]
+
+    def teardown(self):
+        importprocessing._compile_custom_func = self._compile
+
+    def _exec_per_call(self, text, pwa, pwoa, df1, df2, frames):
+        # how process_import used to run the custom function for every shot
+        namespace = {}
+        exec importprocessing._construct_custom_func(text) in \
+             dict(vars(importprocessing)), namespace
+        return namespace['imgfunc'](pwa, pwoa, df1, df2, frames)
+
+    def test_custom_func_compiled_once(self):
+        for i in range(3):
+            func = self.fsett.custom_func()
+        assert self.compiled == [self.fsett.text]
+        self.fsett.text = 'result = pwa/pwoa'
+        assert self.fsett.custom_func() is not func
+        assert len(self.compiled) == 2
+
+    def test_custom_func_same_result(self):
+        pwa, pwoa, df = self.frames
+        args = (pwa, pwoa, df, df, self.frames)
+        assert np.all(self.fsett.custom_func()(*args) ==
+                      self._exec_per_call(self.fsett.text, *args))
+
+
+class TestImportBatch:
+    def setup(self):
+        self.tmpdir = tempfile.mkdtemp()
+        rand = np.random.RandomState(0)
+        self.fnames = []
+        for i in range(3):
+            frame = (rand.rand(90, 12)*100 + 10).astype(np.float32)
+            imageio.save_tifimage(frame, 'shot%s.tif'%i, dirname=self.tmpdir)
+            self.fnames.append(os.path.join(self.tmpdir, 'shot%s.tif'%i))
+        fsett = FrameSetting(kinetics=True, lineshift=30, startat='TL')
+        fsett.usetext = True
+        fsett.text = 'result = (pwa - df1)/(pwoa - df2 + 1.)'
+        self.dct = {'1':fsett}
+
+    def teardown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_batch_same_as_single(self):
+        rawframes, transimgs, odimgs, errors = process_import_batch(
+            self.fnames, dct=self.dct)
+        assert errors == [None]*3
+        for i, fname in enumerate(self.fnames):
+            raw, transimg, odimg = process_import(fname, dct=self.dct)
+            assert np.all(np.asarray(rawframes[i]) == np.asarray(raw))
+            assert np.allclose(transimgs[i], transimg)
+            assert np.allclose(odimgs[i], odimg)
+
+    def test_batch_errors(self):
+        fnames = self.fnames + [os.path.join(self.tmpdir, 'missing.tif')]
+        rawframes, transimgs, odimgs, errors = process_import_batch(
+            fnames, dct=self.dct)
+        assert errors[:3] == [None]*3
+        assert errors[3]
+        assert transimgs[3] is None and odimgs[3] is None
+        assert transimgs[0].shape == (30, 12)
@@ -0,0 +1,20 @@
+import numpy as np
+
+from odysseus.analysis.kapitzadirac import bandgap_dE, lat_depth, Er
+from odysseus.analysis.constants import hbar
+
+
+class TestBandgap:
+    def test_bandgap_exact(self):
+        # free particle, the third band starts at 4 Er
+        assert np.allclose(bandgap_dE(0., exact=True), 4*Er)
+        # the approximation is good at low depths
+        assert np.allclose(bandgap_dE(5., exact=True), bandgap_dE(5.),
+                           rtol=0.02)
+        depths = np.array([2., 5., 8.])
+        assert np.allclose(bandgap_dE(depths, exact=True),
+                           [bandgap_dE(depth, exact=True) for depth in depths])
+
+    def test_lat_depth_exact(self):
+        freq = bandgap_dE(20., exact=True)/hbar
+        assert np.allclose(lat_depth(freq, exact=True), 20., rtol=1e-6)
@@ -0,0 +1,71 @@
+import numpy as np
+
+from odysseus.analysis import lattice
+from odysseus.analysis.lattice import bandstructure, latt_energies
+
+
+class TestBandstructure:
+    def setup(self):
+        self.jmax = 5
+        self.nstates = 2*self.jmax + 1
+
+    def _hamiltonian(self, U0, qk):
+        v_kin = (np.arange(-self.jmax, self.jmax+1)*2 + qk)**2 + U0/2.
+        v_hop = -np.ones(2*self.jmax)*U0/4.
+        return np.diag(v_hop, 1) + np.diag(v_hop, -1) + np.diag(v_kin, 0)
+
+    def test_bandstructure(self):
+        energies, coeffs = bandstructure(4., jmax=self.jmax, numq=7)
+        assert energies.shape == (self.nstates, 7)
+        assert coeffs.shape == (self.nstates, self.nstates, 7)
+        for ii, qk in enumerate(np.linspace(0, 1, 7)):
+            ham = self._hamiltonian(4., qk)
+            assert np.allclose(energies[:, ii], np.linalg.eigvalsh(ham))
+            # the Bloch states belong to the sorted energies
+            assert np.allclose(np.dot(ham, coeffs[:, :, ii]),
+                               coeffs[:, :, ii]*energies[:, ii])
+
+    def test_bandstructure_grid(self):
+        depths = np.array([0., 2., 10.])
+        energies, coeffs = bandstructure(depths, jmax=self.jmax, numq=5,
+                                         nbands=3)
+        assert energies.shape == (3, 3, 5)
+        assert coeffs.shape == (3, self.nstates, 3, 5)
+        for i, U0 in enumerate(depths):
+            single = bandstructure(U0, jmax=self.jmax, numq=5)[0]
+            assert np.allclose(energies[i], single[:3])
+        # free particle at q=0: 0, 4, 4
+        assert np.allclose(energies[0, :, 0], [0, 4, 4])
+
+    def test_bandstructure_chunks(self):
+        depths = np.array([0., 2., 10.])
+        energies, coeffs = bandstructure(depths, jmax=self.jmax, numq=5,
+                                         nbands=2)
+        chunkbytes = lattice._CHUNKBYTES
+        # 4 Hamiltonians per chunk, chunks end inside a depth
+        lattice._CHUNKBYTES = 4*8*self.nstates**2
+        try:
+            chunked = bandstructure(depths, jmax=self.jmax, numq=5, nbands=2)
+        finally:
+            lattice._CHUNKBYTES = chunkbytes
+        assert np.allclose(chunked[0], energies)
+        # eigenvectors are defined up to the sign
+        assert np.allclose(np.abs(chunked[1]), np.abs(coeffs))
+
+    def test_bandstructure_no_coeffs(self):
+        energies, coeffs = bandstructure(3., numq=4, nbands=2, coeffs=False)
+        assert coeffs is None
+        assert energies.shape == (2, 4)
+
+
+class TestLattEnergies:
+    def test_latt_energies(self):
+        depths = np.array([1., 5., 10.])
+        bands, bandwidth, bandgap, tJ = latt_energies(depths, nbands=2)
+        assert bands.shape[:2] == (3, 2)
+        for i, U0 in enumerate(depths):
+            single = latt_energies(U0)
+            assert np.allclose([bandwidth[i], bandgap[i], tJ[i]], single[1:])
+        # deeper lattices have narrower bands and wider gaps
+        assert np.all(np.diff(bandwidth) < 0)
+        assert np.all(np.diff(bandgap) > 0)
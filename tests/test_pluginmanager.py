@@ -0,0 +1,119 @@
+import os
+import shutil
+import tempfile
+import ConfigParser
+
+from nose import SkipTest
+
+try:
+    # the plugin dialogs need PyQt4, the index itself does not use Qt
+    from odysseus import pluginmanager
+except ImportError:
+    pluginmanager = None
+
+
+INFO = """\
+[Core]
+Name = %s
+Module = %s
+
+[Documentation]
+Author = Tester
+Version = 0.1
+Description = A plugin for the tests.
+"""
+
+GOOD = """\
+from odysseus.pluginmanager import IPlugin
+
+class GoodPlugin(IPlugin):
+    pass
+"""
+
+BROKEN = """\
+raise ImportError('a missing module')
+"""
+
+
+class TestIndexedPluginManager:
+    def setup(self):
+        if pluginmanager is None:
+            raise SkipTest
+        self.tmpdir = tempfile.mkdtemp()
+        self.plugindir = os.path.join(self.tmpdir, 'plugins')
+        os.mkdir(self.plugindir)
+        self.indexfile = os.path.join(self.tmpdir, 'plugins.index')
+        self._write_plugin('good', GOOD)
+        self._write_plugin('broken', BROKEN)
+
+    def teardown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _write_plugin(self, name, code):
+        f = open(os.path.join(self.plugindir, '%s.odysseus-plugin'%name), 'w')
+        f.write(INFO%(name, name))
+        f.close()
+        self._write_module(name, code)
+
+    def _write_module(self, name, code, age=10):
+        path = os.path.join(self.plugindir, '%s.py'%name)
+        f = open(path, 'w')
+        f.write(code)
+        f.close()
+        # distinct modification times, independent of the file system
+        mtime = os.path.getmtime(path) - age
+        os.utime(path, (mtime, mtime))
+
+    def _manager(self):
+        return pluginmanager.IndexedPluginManager(
+            directories_list=[self.plugindir],
+            plugin_info_ext='odysseus-plugin', index_file=self.indexfile)
+
+    def _collect(self):
+        manager = self._manager()
+        executed = []
+        manager.locatePlugins()
+        manager.loadPlugins(callback=lambda info: executed.append(info.name))
+        return manager, executed
+
+    def test_write_index(self):
+        manager, executed = self._collect()
+        assert manager.index_refreshed
+        assert sorted(executed) == ['broken', 'good']
+        assert [info.name for info in manager.getPluginsOfCategory('Default')] \
+               == ['good']
+        index = ConfigParser.RawConfigParser()
+        index.read(self.indexfile)
+        categories = dict([(index.get(section, 'name'),
+                            index.get(section, 'category')) for section \
+                           in index.sections() if section.startswith('Plugin ')])
+        assert categories == {'good':'Default', 'broken':''}
+
+    def test_index_is_current(self):
+        manager = self._manager()
+        assert not manager._indexIsCurrent(manager._readIndex())
+        self._collect()
+        assert manager._indexIsCurrent(manager._readIndex())
+
+    def test_locate_from_index(self):
+        self._collect()
+        manager, executed = self._collect()
+        assert not manager.index_refreshed
+        # neither plugin is executed, the broken one is not retried
+        assert executed == []
+        plugins = manager.getPluginsOfCategory('Default')
+        assert [info.name for info in plugins] == ['good']
+        assert not plugins[0].isLoaded()
+        assert plugins[0].plugin_object is not None
+
+    def test_fixed_plugin(self):
+        self._collect()
+        # edited in place, the directory does not change
+        self._write_module('broken', GOOD.replace('GoodPlugin', 'FixedPlugin'),
+                           age=0)
+        manager, executed = self._collect()
+        assert manager.index_refreshed
+        assert executed == ['broken']
+        assert sorted([info.name for info in \
+                       manager.getPluginsOfCategory('Default')]) == \
+               ['broken', 'good']
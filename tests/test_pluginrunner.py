@@ -0,0 +1,240 @@
+import os
+import time
+import shutil
+import tempfile
+
+import numpy as np
+from nose import SkipTest
+
+from odysseus import imageio
+from odysseus.importprocessing import FrameSetting
+from odysseus.pluginrunner import PluginJob, SequenceJob, SharedArray
+
+
+PLUGIN = """\
+import os
+import time
+
+class SumPlugin(object):
+    def compute(self, rawframes, img, roi, path, progress):
+        progress(0.5, 'summing')
+        img[...] = 0  # must not change the image of the GUI
+        return rawframes.sum(), path
+
+class FailPlugin(object):
+    def compute(self, rawframes, img, roi, path, progress):
+        raise ValueError('no atoms')
+
+class CrashPlugin(object):
+    def compute(self, rawframes, img, roi, path, progress):
+        os._exit(3)
+
+class SlowPlugin(object):
+    def compute(self, rawframes, img, roi, path, progress):
+        time.sleep(10)
+
+class PoolPlugin(object):
+    def compute(self, rawframes, img, roi, path, progress):
+        import multiprocessing
+        pool = multiprocessing.Pool(2)
+        # busy workers do not notice that the worker has ended
+        for i in range(2):
+            pool.apply_async(time.sleep, (30, ))
+        progress(0.1, repr([proc.pid for proc in pool._pool]))
+        time.sleep(30)
+
+class FigurePlugin(object):
+    def compute(self, rawframes, img, roi, path, progress):
+        import matplotlib.pyplot as plt
+        fig = plt.figure()
+        return fig.canvas.__class__.__name__
+
+class MeanSequence(object):
+    def kernel(self, rawframes, img, roi, path):
+        return img[roi].mean()
+
+    def start(self):
+        return []
+
+    def reduce(self, state, path, result):
+        return state + [(os.path.basename(path), result)]
+"""
+
+
+def _alive(pid):
+    """True if the process exists and is not a zombie"""
+    try:
+        status = open('/proc/%s/status'%pid).read()
+    except IOError:
+        return False
+    state = [line for line in status.split('\n') \
+             if line.startswith('State:')][0]
+    return 'Z' not in state
+
+
+class _GuiFigureManager(object):
+    """Stands in for the manager of a figure in a Qt window of the GUI"""
+
+    _cidgcf = None
+
+    def __init__(self, marker):
+        self.marker = marker
+        self.canvas = self
+
+    def mpl_disconnect(self, cid):
+        pass
+
+    def destroy(self):
+        open(self.marker, 'w').close()
+
+
+class TestSharedArray:
+    def setup(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def teardown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_shared_array(self):
+        arr = np.arange(12, dtype=np.uint16).reshape((3, 4))
+        shared = SharedArray(arr, tmpdir=self.tmpdir)
+        attached = shared.attach()
+        assert attached.dtype == np.uint16
+        assert np.all(attached == arr)
+        attached[0, 0] = 100
+        assert shared.attach()[0, 0] == 0
+        shared.release()
+        assert not os.listdir(self.tmpdir)
+
+
+class TestPluginJob:
+    def setup(self):
+        self.tmpdir = tempfile.mkdtemp()
+        fname = os.path.join(self.tmpdir, 'test_plugin.py')
+        f = open(fname, 'w')
+        f.write(PLUGIN)
+        f.close()
+        self.plugins = {'__file__':fname}
+        execfile(fname, self.plugins)
+        self.frames = np.ones((10, 20, 3), dtype=np.float32)
+        self.img = np.ones((10, 20))
+        self.roi = (slice(2, 8), slice(5, 15))
+
+    def teardown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _start(self, name):
+        return PluginJob(self.plugins[name], self.frames, self.img, self.roi,
+                         path='shot.TIF', tmpdir=self.tmpdir)
+
+    def _wait(self, job, maxtime=10.):
+        t0 = time.time()
+        while not job.poll() and time.time() - t0 < maxtime:
+            time.sleep(0.01)
+        return job
+
+    def test_plugin_job_result(self):
+        job = self._wait(self._start('SumPlugin'))
+        assert job.error is None
+        assert job.result == (600, 'shot.TIF')
+        assert job.progress == 0.5 and job.message == 'summing'
+        assert np.all(self.img == 1)
+        # the shared arrays are removed when the job is done
+        assert os.listdir(self.tmpdir) == ['test_plugin.py']
+
+    def test_plugin_job_error(self):
+        job = self._wait(self._start('FailPlugin'))
+        assert job.result is None
+        assert 'no atoms' in job.error
+
+    def test_plugin_job_crash(self):
+        job = self._wait(self._start('CrashPlugin'))
+        assert job.done
+        assert job.error == 'Plugin crashed, exit code 3'
+
+    def test_plugin_job_cancel_pool(self):
+        if not os.path.isdir('/proc/self'):
+            raise SkipTest
+        job = self._start('PoolPlugin')
+        t0 = time.time()
+        while not job.message and time.time() - t0 < 10:
+            job.poll()
+            time.sleep(0.01)
+        pids = eval(job.message)
+        assert len(pids) == 2 and all([_alive(pid) for pid in pids])
+        job.cancel()
+        t0 = time.time()
+        while any([_alive(pid) for pid in pids]) and time.time() - t0 < 5:
+            time.sleep(0.01)
+        assert not any([_alive(pid) for pid in pids])
+        assert job.cancelled
+
+    def test_plugin_job_inherited_figures(self):
+        from matplotlib import _pylab_helpers
+        marker = os.path.join(self.tmpdir, 'destroyed')
+        _pylab_helpers.Gcf.figs[999] = _GuiFigureManager(marker)
+        try:
+            job = self._wait(self._start('FigurePlugin'))
+        finally:
+            del _pylab_helpers.Gcf.figs[999]
+        assert job.error is None
+        assert job.result == 'FigureCanvasAgg'
+        # the worker must not close the windows of the GUI
+        assert not os.path.exists(marker)
+
+    def test_plugin_job_cancel(self):
+        job = self._start('SlowPlugin')
+        assert not job.poll()
+        job.cancel()
+        assert job.poll()
+        assert job.cancelled and job.result is None
+
+
+class TestSequenceJob:
+    def setup(self):
+        self.tmpdir = tempfile.mkdtemp()
+        fname = os.path.join(self.tmpdir, 'test_plugin.py')
+        f = open(fname, 'w')
+        f.write(PLUGIN)
+        f.close()
+        plugins = {'__file__':fname}
+        execfile(fname, plugins)
+        self.plugin = plugins['MeanSequence']()
+        # kinetics frames, the transmission image is probe/(probe - dark)
+        self.paths = []
+        for i in range(4):
+            frame = np.zeros((768, 40), dtype=np.float32)
+            frame[:256] = 10.*(i + 1)
+            frame[256:512] = 100.
+            imageio.save_tifimage(frame, 'shot%s.tif'%i, dirname=self.tmpdir)
+            self.paths.append(os.path.join(self.tmpdir, 'shot%s.tif'%i))
+        self.importdict = {'1':FrameSetting(kinetics=True, startat='TL')}
+
+    def teardown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _wait(self, job, maxtime=20.):
+        t0 = time.time()
+        while not job.poll() and time.time() - t0 < maxtime:
+            time.sleep(0.01)
+        return job
+
+    def test_sequence_job(self):
+        paths = self.paths + [os.path.join(self.tmpdir, 'missing.tif')]
+        roi = (slice(10, 20), slice(5, 30))
+        job = self._wait(SequenceJob(self.plugin, paths, self.importdict, roi,
+                                     processes=2))
+        assert job.error is None
+        assert job.ndone == 5 and job.progress == 1.
+        # the results are reduced in the order of the shots
+        assert [name for name, mean in job.result] == \
+               ['shot%s.tif'%i for i in range(4)]
+        assert np.allclose([mean for name, mean in job.result],
+                           [0.1, 0.2, 0.3, 0.4])
+        assert len(job.errors) == 1 and job.errors[0][0] == paths[-1]
+
+    def test_sequence_job_cancel(self):
+        job = SequenceJob(self.plugin, self.paths*20, self.importdict,
+                          (slice(None), slice(None)), processes=1)
+        job.cancel()
+        assert job.poll() and job.cancelled
@@ -0,0 +1,102 @@
+import os
+import shutil
+import tempfile
+import threading
+
+import numpy as np
+from numpy.testing import assert_array_equal
+
+from odysseus.shotcache import ShotCache, settings_fingerprint
+
+
+class TestSettingsFingerprint:
+    def test_settings_fingerprint_dictorder(self):
+        assert settings_fingerprint({'a':1, 'b':(2, 3)}) == \
+               settings_fingerprint({'b':(2, 3), 'a':1})
+
+    def test_settings_fingerprint_private_attrs(self):
+        class Settings(object):
+            def __init__(self):
+                self.pwa = 1
+        s1 = Settings()
+        s2 = Settings()
+        s2._compiled = object()
+        assert settings_fingerprint(s1) == settings_fingerprint(s2)
+        s2.pwa = 2
+        assert settings_fingerprint(s1) != settings_fingerprint(s2)
+
+    def test_settings_fingerprint_functions(self):
+        func1 = lambda img: img[:, :, 0]
+        func2 = lambda img: img[:, :, 1]
+        func3 = lambda img: img[:, :, 0]
+        assert settings_fingerprint(func1) != settings_fingerprint(func2)
+        assert settings_fingerprint(func1) == settings_fingerprint(func3)
+        nested1 = lambda img: (lambda x: x + 1)(img)
+        nested2 = lambda img: (lambda x: x + 2)(img)
+        assert settings_fingerprint(nested1) != settings_fingerprint(nested2)
+
+
+class TestShotCache:
+    def setup(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.cache = ShotCache(os.path.join(self.tmpdir, 'cache'))
+        self.fname = os.path.join(self.tmpdir, 'shot.TIF')
+        f = open(self.fname, 'w')
+        f.write('data')
+        f.close()
+
+    def teardown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_make_key(self):
+        key = self.cache.make_key(self.fname, 'fit', [1, 2, 3, 4])
+        assert key == self.cache.make_key(self.fname, 'fit', [1, 2, 3, 4])
+        assert key != self.cache.make_key(self.fname, 'fit', [1, 2, 3, 5])
+
+    def test_make_key_missing_file(self):
+        assert self.cache.make_key(self.fname + 'x') is None
+
+    def test_arrays(self):
+        key = self.cache.make_key(self.fname)
+        assert self.cache.get_arrays(key) is None
+        img = np.arange(12.).reshape((3, 4))
+        self.cache.put_arrays(key, transimg=img)
+        assert_array_equal(self.cache.get_arrays(key)['transimg'], img)
+
+    def test_cached_call(self):
+        key = self.cache.make_key(self.fname, 'result')
+        calls = []
+        def func(x):
+            calls.append(x)
+            return (x, 2*x)
+        assert self.cache.cached_call(key, func, 3) == (3, 6)
+        assert self.cache.cached_call(key, func, 3) == (3, 6)
+        assert len(calls) == 1
+
+    def test_evict(self):
+        self.cache.maxsize = 3000
+        keys = [self.cache.make_key(self.fname, i) for i in range(4)]
+        for key in keys:
+            self.cache.put_arrays(key, img=np.zeros(200))
+        assert self.cache.size <= self.cache.maxsize
+        assert self.cache.get_arrays(keys[0]) is None
+        assert self.cache.get_arrays(keys[-1]) is not None
+
+    def test_evict_threads(self):
+        self.cache.maxsize = 5000
+        def put(start):
+            for i in range(start, start + 20):
+                key = self.cache.make_key(self.fname, i)
+                self.cache.put_arrays(key, img=np.zeros(100))
+        threads = [threading.Thread(target=put, args=(20*i,)) \
+                   for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        ondisk = [os.path.join(dirpath, fname) for dirpath, dirnames, fnames \
+                  in os.walk(self.cache.cachedir) for fname in fnames]
+        assert sorted(ondisk) == sorted(self.cache._entries.keys())
+        assert self.cache.size == sum([os.path.getsize(path) for path \
+                                       in ondisk])
+        assert self.cache.size <= self.cache.maxsize
@@ -0,0 +1,92 @@
+import time
+import threading
+import Queue
+
+from odysseus.shotpipeline import ShotPipeline, Stage
+
+
+class TestShotPipeline:
+    def setup(self):
+        self.published = []
+
+    def _publish(self, shot):
+        self.published.append(shot)
+
+    def test_pipeline_order(self):
+        def load(shot):
+            # later shots finish first
+            time.sleep(0.01*(5 - shot.seqno))
+            shot.value = shot.fname * 2
+        def double(shot):
+            shot.value *= 2
+
+        pipeline = ShotPipeline([Stage('load', load, workers=3),
+                                 Stage('double', double)], self._publish)
+        pipeline.start()
+        for i in range(5):
+            pipeline.submit(i)
+        pipeline.stop()
+        assert [shot.fname for shot in self.published] == range(5)
+        assert [shot.value for shot in self.published] == [0, 4, 8, 12, 16]
+        assert 'load' in self.published[0].timings
+
+    def test_pipeline_latest_only(self):
+        release = threading.Event()
+        def wait(shot):
+            release.wait()
+        def fit(shot):
+            shot.fitted = True
+
+        pipeline = ShotPipeline([Stage('wait', wait, maxsize=10),
+                                 Stage('fit', fit, maxsize=10,
+                                       latest_only=True)],
+                                self._publish)
+        pipeline.start()
+        for i in range(4):
+            pipeline.submit(i)
+        release.set()
+        pipeline.stop()
+        assert len(self.published) == 4
+        assert getattr(self.published[-1], 'fitted', False)
+        fitted = [shot for shot in self.published if hasattr(shot, 'fitted')]
+        skipped = [shot for shot in self.published if 'fit' in shot.skipped]
+        assert len(fitted) + len(skipped) == 4
+
+    def test_pipeline_error(self):
+        def fail(shot):
+            raise ValueError, 'no atoms'
+        def never(shot):
+            shot.reached = True
+
+        pipeline = ShotPipeline([Stage('fail', fail), Stage('never', never)],
+                                self._publish)
+        pipeline.start()
+        pipeline.submit('img')
+        pipeline.stop()
+        assert self.published[0].error.startswith('fail failed')
+        assert not hasattr(self.published[0], 'reached')
+
+    def test_pipeline_submit_nonblocking(self):
+        release = threading.Event()
+        def wait(shot):
+            release.wait()
+
+        pipeline = ShotPipeline([Stage('wait', wait, maxsize=1)],
+                                self._publish)
+        pipeline.start()
+        pipeline.submit(0)
+        # the worker holds one shot, the queue the next one
+        while pipeline.pending()['wait']:
+            time.sleep(0.01)
+        pipeline.submit(1)
+        try:
+            pipeline.submit(2, block=False)
+        except Queue.Full:
+            pass
+        else:
+            raise AssertionError, 'submit should not block on a full stage'
+        release.set()
+        pipeline.submit(3)
+        pipeline.stop()
+        assert [shot.fname for shot in self.published] == [0, 1, 3]
+        assert [shot.seqno for shot in self.published] == [0, 1, 2]
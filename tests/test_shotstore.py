@@ -0,0 +1,122 @@
+import os
+import shutil
+import tempfile
+
+import numpy as np
+from nose.tools import assert_raises
+
+from odysseus import imageio
+from odysseus.imageio import LazyStack
+from odysseus.shotstore import ShotStore, compact_frames
+
+
+def test_compact_frames():
+    frames = np.arange(12, dtype=np.float32).reshape(3, 2, 2)*1000
+    assert compact_frames(frames).dtype == np.uint16
+    assert compact_frames(frames - 5000).dtype == np.int16
+    assert compact_frames(frames + 0.5).dtype == np.float32
+
+
+class TestShotStore:
+    def setup(self):
+        self.scratchdir = tempfile.mkdtemp()
+        self.raw = np.random.randint(0, 4000, size=(20, 30, 3)).astype(np.float32)
+        self.transimg = np.random.rand(20, 30)
+
+    def teardown(self):
+        shutil.rmtree(self.scratchdir)
+
+    def test_shotstore_indexing(self):
+        store = ShotStore(scratchdir=self.scratchdir)
+        shot = store.add(self.raw, self.transimg)
+        assert shot.shape == (20, 30, 4)
+        assert shot.frames.dtype == np.uint16
+        assert np.allclose(shot[:, :, 0], self.transimg)
+        assert np.all(shot[:, :, 2] == self.raw[:, :, 1])
+        assert shot[:, :, 2].dtype == np.float32
+        assert shot[3, 4, 3] == self.raw[3, 4, 2]
+        assert np.all(shot[2:5, 3:7, -1] == self.raw[2:5, 3:7, 2])
+        assert np.all(np.asarray(shot)[:, :, 1:] == self.raw)
+
+    def test_shotstore_histogram(self):
+        store = ShotStore(scratchdir=self.scratchdir)
+        shot = store.add(self.raw, self.transimg)
+        hist = shot.histogram(1)
+        assert hist.npixels == 600
+        assert shot.histogram(1) is hist
+        # the interpolated value lies in the bin of the lower median pixel,
+        # the upper one can be several (empty) bins further
+        lower = np.sort(self.raw[:, :, 0].ravel())[299]
+        assert abs(hist.percentile(50) - lower) <= hist.binwidth()
+        assert hist.percentile(50, shot.frame(1), precision=1e-6) == \
+               np.median(self.raw[:, :, 0])
+
+    def test_shotstore_spill(self):
+        # room for about two shots
+        store = ShotStore(budget=2*(20*30*(3*2 + 4)), scratchdir=self.scratchdir)
+        shots = [store.add(self.raw, self.transimg) for i in range(4)]
+        assert store.memory_used() <= store.budget
+        assert shots[0].is_spilled()
+        assert not shots[-1].is_spilled()
+        assert len(os.listdir(self.scratchdir)) == 4
+        assert np.all(shots[0][:, :, 1] == self.raw[:, :, 0])
+
+        store.discard(shots[0])
+        assert len(os.listdir(self.scratchdir)) == 2
+        store.clear()
+        assert store.shots == []
+        assert os.listdir(self.scratchdir) == []
+
+    def test_shotstore_spill_odsat(self):
+        odsat = np.random.rand(21, 31)
+        store = ShotStore(budget=20*30*(3*2 + 4) + odsat.nbytes,
+                          scratchdir=self.scratchdir)
+        shots = [store.add(self.raw, self.transimg, odsat=odsat.copy()) \
+                 for i in range(2)]
+        assert shots[1].nbytes() == 20*30*(3*2 + 4) + odsat.nbytes
+        assert isinstance(shots[0].odsat, np.memmap)
+        assert np.all(shots[0].odsat == odsat)
+        assert len(os.listdir(self.scratchdir)) == 3
+        store.clear()
+
+    def test_shotstore_lazy(self):
+        decoded = []
+        def getframe(k):
+            decoded.append(k)
+            return self.raw[:, :, k].astype(np.uint16)
+        # room for the transmission images and one frame
+        store = ShotStore(budget=2*20*30*4 + 20*30*2,
+                          scratchdir=self.scratchdir)
+        shot1 = store.add(LazyStack(getframe, 3, (20, 30)), self.transimg)
+        shot2 = store.add(LazyStack(getframe, 3, (20, 30)), self.transimg)
+        assert decoded == []
+        assert np.all(shot1[:, :, 2] == self.raw[:, :, 1])
+        assert np.all(shot2[3, 4, 3] == self.raw[3, 4, 2])
+        # shot1 was spilled to stay within the budget, with all its frames
+        assert decoded == [1, 2, 0, 2]
+        assert store.memory_used() <= store.budget
+        assert shot1.is_spilled() and not shot1.lazy
+        assert shot1.frames.dtype == np.uint16
+        assert np.all(shot1[:, :, 2] == self.raw[:, :, 1])
+        assert decoded == [1, 2, 0, 2]
+        store.clear()
+        assert os.listdir(self.scratchdir) == []
+
+    def test_shotstore_lazy_file(self):
+        fname = os.path.join(self.scratchdir, 'shot.tif')
+        imageio.save_tifimage(self.raw[:, :, 0], fname)
+        # room for one transmission image
+        store = ShotStore(budget=20*30*4, scratchdir=self.scratchdir)
+        shot1 = store.add(imageio.FrameStack(fname), self.transimg)
+        # decoding the only frame keeps it compact in memory
+        assert np.all(shot1[:, :, 1] == self.raw[:, :, 0])
+        assert not shot1.lazy and shot1.frames.dtype == np.uint16
+
+        shot2 = store.add(imageio.FrameStack(fname), self.transimg)
+        shot3 = store.add(imageio.FrameStack(fname), self.transimg)
+        assert shot2.is_spilled() and shot2.frames.dtype == np.uint16
+        os.remove(fname)
+        # spilled shots do not read the image file again
+        assert np.all(shot2[:, :, 1] == self.raw[:, :, 0])
+        assert_raises(IOError, shot3.frame, 1)
+        store.clear()
@@ -0,0 +1,89 @@
+import os
+import shutil
+import tempfile
+import multiprocessing
+
+import numpy as np
+
+from odysseus import texreport
+from odysseus.fitfuncs import ideal_fermi_radial
+from odysseus.importprocessing import FrameSetting
+from odysseus.shotcache import ShotCache
+
+
+class TestFitSeveralFixedT:
+    def setup(self):
+        self.rcoord = np.linspace(0, 100, 300)
+        self.ans = (1.2, 1.5, 50.)
+        self.od_prof = ideal_fermi_radial(self.rcoord, *self.ans)
+
+    def test_fit_several_fixedT(self):
+        ans_gaussian, ans2, temps = texreport.fit_several_fixedT(
+            self.rcoord, self.od_prof, 0, self.ans, 0.2, 10e-6)
+        assert len(ans_gaussian) == 2
+        assert len(ans2) == 7
+        assert np.allclose(temps, np.linspace(0.01, 2, 7)*0.2)
+
+
+class TestReportPool:
+    def test_report_pool_reused(self):
+        pool = texreport._report_pool(2)
+        assert texreport._report_pool(2) is pool
+        assert pool.apply(os.getpid) != os.getpid()
+
+
+class TestFitKey:
+    def setup(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.fname = os.path.join(self.tmpdir, 'shot.tif')
+        open(self.fname, 'w').close()
+        self.cache = ShotCache(os.path.join(self.tmpdir, 'cache'))
+
+    def teardown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_fit_key_like_gui(self):
+        importdict = {'3':FrameSetting()}
+        # the GUI has the analysis ROI as [x0, x1, y0, y1]
+        guikey = self.cache.make_key(self.fname, 'fit', importdict,
+                                     np.array([10, 50, 20, 80], np.int32),
+                                     'idealfermi', True, 10e-6)
+        roi = (slice(20, 80), slice(10, 50))
+        assert texreport._fit_key(self.cache, self.fname, importdict, roi,
+                                  10e-6) == guikey
+class TestSeveralTempsFigure:
+    def setup(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def teardown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_several_temps_figure_in_pool(self):
+        rcoord = np.linspace(0, 100, 300)
+        ans = (1.2, 1.5, 50.)
+        od_prof = ideal_fermi_radial(rcoord, *ans)
+        figname = os.path.join(self.tmpdir, 'several_temps')
+        pool = multiprocessing.Pool(1, initializer=texreport._init_worker)
+        try:
+            pool.apply(texreport._several_temps_figure,
+                       (rcoord, od_prof, od_prof, ans, (1., 30.), [ans],
+                        10e-6, figname))
+        finally:
+            pool.close()
+            pool.join()
+        assert os.listdir(self.tmpdir) == ['several_temps.png']
+
+    def test_save_figure_in_pool(self):
+        rcoord = np.linspace(0, 100, 300)
+        od_prof = ideal_fermi_radial(rcoord, 1.2, 1.5, 50.)
+        figname = os.path.join(self.tmpdir, 'residuals')
+        pool = multiprocessing.Pool(1, initializer=texreport._init_worker)
+        try:
+            # the figure is saved, not sent back
+            assert pool.apply(texreport._save_figure,
+                              (texreport.show_residuals, rcoord, od_prof,
+                               od_prof), {'figname':figname}) is None
+        finally:
+            pool.close()
+            pool.join()
+        assert os.listdir(self.tmpdir) == ['residuals.png']
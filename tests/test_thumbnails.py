@@ -0,0 +1,56 @@
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from odysseus import thumbnails
+from odysseus.imageio import Image
+
+
+class TestThumbnailShape:
+    def test_thumbnail_shape(self):
+        assert thumbnails.thumbnail_shape((100, 200)) == (75, 150)
+        assert thumbnails.thumbnail_shape((1000, 100)) == (220, 22)
+
+    def test_thumbnail_shape_tall(self):
+        # like the former 1.5 x 2.2 inch figure at 100 dpi
+        assert thumbnails.thumbnail_shape((200, 100)) == (300, 150)
+        assert thumbnails.thumbnail_shape((300, 100)) == (220, 73)
+
+
+class TestDownsample:
+    def test_downsample_blocks(self):
+        img = np.arange(16, dtype=float).reshape((4, 4))
+        small = thumbnails.downsample(img, (2, 2))
+        assert np.allclose(small, [[2.5, 4.5], [10.5, 12.5]])
+
+    def test_downsample_shape(self):
+        small = thumbnails.downsample(np.ones((101, 203)), (30, 61))
+        assert small.shape == (30, 61)
+
+
+class TestApplyLut:
+    def test_apply_lut_clipping(self):
+        lut = thumbnails.make_lut()
+        rgb = thumbnails.apply_lut(np.array([[-1., 0., 0.5, 1., 2., np.nan]]),
+                                   0., 1., lut)
+        assert rgb.shape == (1, 6, 3)
+        assert list(rgb[0, :, 0]) == [0, 0, 128, 255, 255, 0]
+
+
+class TestRenderThumbnail:
+    def setup(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def teardown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_render_thumbnail(self):
+        img = np.linspace(0, 1.35, 300*400).reshape((300, 400))
+        pngpath = os.path.join(self.tmpdir, 'img.png')
+        thumbnails.render_thumbnail(img, pngpath)
+        png = Image.open(pngpath)
+        assert png.size == (150, 113)
+        pixels = np.asarray(png)
+        assert pixels[0, 0, 0] < 5 and pixels[-1, -1, 0] > 250
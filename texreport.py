@@ -1,12 +1,18 @@
 import os
 import re
-import popen2
+import shutil
 import platform
+import tempfile
+import subprocess
+import multiprocessing
 
 import numpy as np
-import matplotlib as mpl
-from pylab import figure, savefig, show, close
+import pylab
+from pylab import close
 
+import importprocessing
+import shotcache
+from pluginrunner import use_agg
 from fitfermions import fit_img, do_fit, find_ellipticity
 from imageprocess import *
 from fitfuncs import *
@@ -156,89 +162,235 @@ def write_TeXreport(texname, img_name, ellip, ellip_figname, fitresults):
     return
 
 
-def generate_report(rawframes, transimg, img_name, pixcal, showpdf=True):
-    """Generate a report with several image diagnostics
+# the pool of generate_report, kept for the next report
+_pool = None
+# (processes, pid) of _pool, a forked process can not use the parent's pool
+_pool_owner = None
 
-    The report comes in the form of a pdf file that has the name
-    ``img_name``.pdf and is put in the same directory as the image.
+
+def _init_worker():
+    """Workers only save figures, they never show them"""
+    use_agg()
+
+
+def _report_pool(processes):
+    """Return the pool for the figures of a report, started only once"""
+
+    global _pool, _pool_owner
+    owner = (processes, os.getpid())
+    if _pool is None or _pool_owner != owner:
+        if _pool is not None and _pool_owner[1] == os.getpid():
+            _pool.terminate()
+        _pool = multiprocessing.Pool(processes, initializer=_init_worker)
+        _pool_owner = owner
+    return _pool
+
+
+def _fit_key(cache, img_name, importdict, roi, pixcal):
+    """Return the cache key of the GUI for the fit of a report
+
+    The GUI fits with the analysis ROI as [x0, x1, y0, y1] and with the
+    ellipticity determined first, see fitImage in odysseusgui.
+
+    """
+
+    if roi is not None:
+        roi = np.array([roi[1].start, roi[1].stop, roi[0].start,
+                        roi[0].stop], dtype=np.int32)
+    return cache.make_key(img_name, 'fit', importdict, roi, 'idealfermi',
+                          True, pixcal)
+
+
+class _Done(object):
+    """The result of a call that was made right away, like an AsyncResult"""
+
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+def _submit(pool, func, *args, **kwargs):
+    """Run func in the pool, or right away if pool is None"""
+
+    if pool is None:
+        return _Done(func(*args, **kwargs))
+    return pool.apply_async(func, args, kwargs)
+
+
+def _save_figure(plotfunc, *args, **kwargs):
+    """Call a plotting function that saves its figure, and close it
+
+    The figure is not returned, so it is not sent back from a pool worker.
+
+    """
+
+    close(plotfunc(*args, **kwargs))
+
+
+def _ellipticity_figure(rprofiles, angles, rad_profile, od_cutoff, figname):
+    radialprofile_errors(rprofiles, angles, rad_profile, od_cutoff,
+                         showfig=True, savefig_name=figname, report=False)
+    close()
+
+
+def _several_temps_figure(rcoord, od_prof, fit_prof, ans, ans_gaussian, ans2,
+                          pixcal, figname):
+    fig = plot_several_temp(rcoord, od_prof, fit_prof, ans, ans_gaussian, ans2,
+                            pixcal)
+    fig.savefig(''.join([figname, '.png']))
+    close(fig)
+
+
+def report_figures(rawframes, transimg, pixcal, figdir, pool=None,
+                   fits=None):
+    """Fit an image and save the figures for its report
+
+    The figures do not depend on each other, they are saved concurrently in
+    `pool` while the fits are done in this process.
 
     **Inputs**
 
       * rawframes: 3D array, containing the three raw frames
       * transimg: 2D array, containing the transmission image (properly ROIed)
-      * img_name: string, the name of the image
       * pixcal: float, pixel size calibration in m/pix.
-      * showpdf: bool, if True Acrobat Reader is launched to view the report
+      * figdir: str, directory where the png figures are saved
+      * pool: multiprocessing.Pool, if None everything is done in this
+              process
+      * fits: dict, fit results of a previous call for the same image, these
+              fits are not repeated
+
+    **Outputs**
+
+      * fits: dict, the fit results, with keys 'ellip', 'fit' and 'fixedT'
 
     """
 
+    if fits is None:
+        fits = {}
+    figname = lambda name: os.path.join(figdir, name)
+    figures = [_submit(pool, _save_figure, show_rawframes, rawframes,
+                       figname=figname('trans_rawframes'))]
+
     odimg = trans2od(transimg)
     com = center_of_mass(odimg)
-
-    rawfig = show_rawframes(rawframes)
-    savefig('trans_rawframes.jpg')
-    close()
-
-    ellip = find_ellipticity(transimg)
-    ellip_figname = 'ellipfit'
+    if 'ellip' not in fits:
+        fits['ellip'] = find_ellipticity(transimg)
+    ellip = fits['ellip']
 
     # figure out how good the ellipticity determination is and create polar plot
     rcoord, rad_profile, rprofiles, angles = radial_interpolate(odimg, com,\
                                     0.3, elliptic=(ellip, 0), full_output=True)
     od_cutoff = find_fitrange(rad_profile)
-    av_err = radialprofile_errors(rprofiles, angles, rad_profile, od_cutoff, \
-                        showfig=True, savefig_name=ellip_figname, report=False)
+    figures.append(_submit(pool, _ellipticity_figure, rprofiles, angles,
+                           rad_profile, od_cutoff, figname('ellipfit')))
 
     # fit the image
-    ToverTF, N, com, ans, rcoord, od_prof, fit_prof = fit_img(transimg, \
-            showfig=False, elliptic=(ellip, 0), full_output='odysseus')
-    # save the fit figure
-    show_fitresult(rcoord, od_prof, fit_prof, ToverTF, N, figname='fitresult')
-
-    # plot the residuals
-    show_residuals(rcoord, od_prof, fit_prof, figname='residuals')
-    fitresults = (ToverTF[0], N, ans[1], ans[2])
+    if 'fit' not in fits:
+        fits['fit'] = fit_img(transimg, showfig=False, elliptic=(ellip, 0),
+                              pixcal=pixcal, full_output='odysseus')
+    ToverTF, N, com, ans, rcoord, od_prof, fit_prof = fits['fit']
+    # save the fit figure and plot the residuals
+    figures.append(_submit(pool, _save_figure, show_fitresult, rcoord,
+                           od_prof, fit_prof, ToverTF, N,
+                           figname=figname('fitresult')))
+    figures.append(_submit(pool, _save_figure, show_residuals, rcoord,
+                           od_prof, fit_prof, figname=figname('residuals')))
 
     # fit with several fixed temperatures
-    ans_gaussian, ans2, temps = fit_several_fixedT(rcoord, od_prof, od_cutoff,
-                                                   ans, ToverTF, pixcal)
-    fig = plot_several_temp(rcoord, od_prof, fit_prof, ans, ans_gaussian, ans2,
-                            pixcal)
-    fig.savefig('several_temps.png')
-    close(fig)
+    if 'fixedT' not in fits:
+        fits['fixedT'] = fit_several_fixedT(rcoord, od_prof, od_cutoff, ans,
+                                            ToverTF, pixcal)
+    ans_gaussian, ans2, temps = fits['fixedT']
+    figures.append(_submit(pool, _several_temps_figure, rcoord, od_prof,
+                           fit_prof, ans, ans_gaussian, ans2, pixcal,
+                           figname('several_temps')))
 
     # save a figure zoomed in around the wing of the distribution
     ind = round(ans2[0][2])
-    istep = round(1./(rcoord[1]-rcoord[0]))*15
-    ind = mpl.mlab.find(rcoord>ind).min()
-    fig2 = plot_several_temp(rcoord[ind-istep:ind+istep], od_prof[ind-istep:ind+istep], \
-                            fit_prof[ind-istep:ind+istep], ans, ans_gaussian,
-                            ans2, pixcal)
-    fig2.savefig('several_temps_zoomed.png')
-    close(fig2)
-
-    # create the report
-    write_TeXreport('imgreport', img_name, ellip, ellip_figname, fitresults)
-    print 'written TeX'
-    pdfname = os.path.splitext(img_name)[0]
-    TeX2pdf('imgreport', pdfname)
-    print 'written pdf'
-
-    # clean up image files
-    pngfiles = ['ellipfit', 'fitresult', 'residuals', 'several_temps', \
-                'several_temps_zoomed']
-    for pngfile in pngfiles:
-        try:
-            os.unlink(''.join([pngfile, '.png']))
-        except OSError:
-            print "file %s.png does not exist, so can't clean it up" %pngfile
-
-    jpgfiles = ['trans_rawframes']
-    for jpgfile in jpgfiles:
-        try:
-            os.unlink(''.join([jpgfile, '.jpg']))
-        except OSError:
-            print "file %s.jpg does not exist, so can't clean it up" %jpgfile
+    istep = int(round(1./(rcoord[1]-rcoord[0]))*15)
+    ind = np.flatnonzero(rcoord>ind).min()
+    zoom = slice(max(ind-istep, 0), ind+istep)
+    figures.append(_submit(pool, _several_temps_figure, rcoord[zoom],
+                           od_prof[zoom], fit_prof[zoom], ans, ans_gaussian,
+                           ans2, pixcal, figname('several_temps_zoomed')))
+
+    for result in figures:
+        result.get()
+
+    return fits
+
+
+def generate_report(rawframes, transimg, img_name, pixcal, showpdf=True,
+                    processes=None, cache=None,
+                    importdict=importprocessing.image_import_dict, roi=None):
+    """Generate a report with several image diagnostics
+
+    The report comes in the form of a pdf file that has the name
+    ``img_name``.pdf and is put in the same directory as the image. The
+    figures and the TeX file are made in a temporary directory, so several
+    reports can be generated at the same time.
+
+    **Inputs**
+
+      * rawframes: 3D array, containing the three raw frames
+      * transimg: 2D array, containing the transmission image (properly ROIed)
+      * img_name: string, the name of the image
+      * pixcal: float, pixel size calibration in m/pix.
+      * showpdf: bool, if True Acrobat Reader is launched to view the report
+      * processes: int, number of processes for the figures, default is the
+                   number of CPUs. The processes are kept for the next
+                   report. With 1 everything is done in this process.
+      * cache: ShotCache instance, if given the fit results are reused for
+               the same image file and settings. The fit is cached under the
+               same key as in the GUI, so a fit done there is reused.
+      * importdict: dict, the import settings that gave transimg
+      * roi: tuple of slices, the ROI of transimg in the full transmission
+             image, as passed to plugins. Default is the whole image.
+
+    **Outputs**
+
+      * pdfname: str, path of the pdf file
+
+    """
+
+    fits, key, fitkey = None, None, None
+    if cache is not None:
+        key = cache.make_key(img_name, 'texreport', importdict, roi, pixcal)
+        fitkey = _fit_key(cache, img_name, importdict, roi, pixcal)
+        if key is not None:
+            fits = cache.get_result(key) or {}
+            fit = cache.get_result(fitkey)
+            if fit is not None:
+                fits['fit'] = fit
+
+    tmpdir = tempfile.mkdtemp(prefix='texreport-')
+    if processes == 1:
+        pool = None
+    else:
+        pool = _report_pool(processes)
+    try:
+        fits = report_figures(rawframes, transimg, pixcal, tmpdir, pool=pool,
+                              fits=fits)
+        if key is not None:
+            cache.put_result(fitkey, fits['fit'])
+            cache.put_result(key, {'ellip':fits['ellip'],
+                                   'fixedT':fits['fixedT']})
+
+        # create the report
+        ToverTF, N, com, ans = fits['fit'][:4]
+        fitresults = (ToverTF[0], N, ans[1], ans[2])
+        texname = os.path.join(tmpdir, 'imgreport')
+        write_TeXreport(texname, img_name, fits['ellip'], 'ellipfit',
+                        fitresults)
+        print 'written TeX'
+        pdfname = os.path.splitext(img_name)[0]
+        TeX2pdf(texname, pdfname)
+        print 'written pdf'
+    finally:
+        # the figures are removed together with the directory
+        shutil.rmtree(tmpdir, ignore_errors=True)
 
     if showpdf:
         # launch acrobat reader with the report
@@ -251,7 +403,66 @@ def generate_report(rawframes, transimg, img_name, pixcal, showpdf=True):
             acrocmd = re.sub(r"acroread", r"xdg-open", acrocmd)
             os.system(acrocmd)
 
-    return
+    return ''.join([pdfname, '.pdf'])
+
+
+# settings of the batch report workers, set by _init_batch_worker
+_batch_settings = None
+
+
+def _init_batch_worker(settings):
+    global _batch_settings
+    _init_worker()
+    _batch_settings = settings
+
+
+def _batch_report(fname):
+    """Generate the report of one shot in a batch worker"""
+
+    importdict, roi, pixcal, cachedir = _batch_settings
+    try:
+        rawframes, transimg, odimg = importprocessing.process_import(fname,
+                                                            dct=importdict)
+        if roi is not None:
+            transimg = transimg[roi]
+        cache = shotcache.ShotCache(cachedir) if cachedir else None
+        # the batch is parallel over the shots, a report uses one process
+        return generate_report(np.asarray(rawframes), transimg, fname, pixcal,
+                               showpdf=False, processes=1, cache=cache,
+                               importdict=importdict, roi=roi), None
+    except Exception, e:
+        return None, 'Report failed: %s'%e
+
+
+def generate_reports(fnames, pixcal, roi=None,
+                     importdict=importprocessing.image_import_dict,
+                     processes=None, cachedir=None):
+    """Generate the reports for a list of shots in a pool of processes
+
+    **Inputs**
+
+      * fnames: list of str, paths to the image files
+      * pixcal: float, pixel size calibration in m/pix.
+      * roi: tuple of slices, the part of the transmission image that is
+             fitted, default is the whole image
+      * importdict: dict, the import settings
+      * processes: int, number of processes, default is the number of CPUs
+      * cachedir: str, directory of a ShotCache for the fit results
+
+    **Outputs**
+
+      * reports: list of (pdfname, error) tuples, one per shot. pdfname is
+                 None if the report failed, error is None if it succeeded.
+
+    """
+
+    pool = multiprocessing.Pool(processes, initializer=_init_batch_worker,
+                                initargs=((importdict, roi, pixcal, cachedir), ))
+    try:
+        return pool.map(_batch_report, fnames, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
 
 
 def fit_several_fixedT(rcoord, od_prof, od_cutoff, guess, ToverTF, pixcal):
@@ -277,14 +488,14 @@ def fit_several_fixedT(rcoord, od_prof, od_cutoff, guess, ToverTF, pixcal):
 
     """
 
-    u, uu, ans_gaussian = do_fit(rcoord, od_prof, od_cutoff, guess, pixcal,
-                                 fitfunc='gaussian')
-    ans2 = []
+    # a 1D fit of the radial profile, too short to send to a worker
+    ans_gaussian = do_fit(rcoord, od_prof, od_cutoff, guess, pixcal,
+                          fitfunc='gaussian')[2]
     temps = np.linspace(0.01, 2, 7)*ToverTF
-    for temp in temps:
-        u, uu, ans2_temp = do_fit(rcoord, od_prof, od_cutoff, guess, pixcal,
-                                  fitfunc='idealfermi_fixedT', T=temp)
-        ans2.append(ans2_temp)
+    fixedfits, success = fit_idealfermi_fixedT(rcoord[od_cutoff:],
+                            od_prof[od_cutoff:], temps, [guess[0], guess[2]])
+    ans2 = [tuple(fitparams) for fitparams in fixedfits]
+
     return (ans_gaussian, ans2, temps)
 
 
@@ -333,24 +544,26 @@ def plot_several_temp(rcoord, od_prof, fit_prof, ans, ans_gaussian, ans2, pixcal
 def TeX2pdf(texname, pdfname=None):
     """ Compiles a TeX file with pdfLaTeX and cleans up the mess afterwards
 
+    pdfLaTeX runs in the directory of the TeX file, so the figures are looked
+    up there.
+
     From pyreport (Gael Varoquaux), with GPL license.
 
     """
 
     print "Compiling document to pdf"
-    texname = os.path.splitext(texname)[0]
-    texcmd = "pdflatex --interaction scrollmode %s.tex" %texname
-    os.system(texcmd)
-    (err_out, stdin) = popen2.popen4(texcmd)
-    output = []
-    while True:
-        line = err_out.readline()
-        if not line:
-            break
-        output.append(line)
+    texname = os.path.splitext(os.path.abspath(texname))[0]
+    texdir, texbase = os.path.split(texname)
+    texcmd = ["pdflatex", "--interaction", "scrollmode", texbase+".tex"]
+    # run twice, for the references
+    for i in range(2):
+        proc = subprocess.Popen(texcmd, cwd=texdir, stdout=subprocess.PIPE,
+                                stderr=subprocess.STDOUT)
+        proc.communicate()
     print "Cleaning up"
     os.unlink(texname+".tex")
     os.unlink(texname+".log")
     os.unlink(texname+".aux")
     if pdfname:
-        os.rename(texname+".pdf", pdfname+".pdf")
\ No newline at end of file
+        # the pdf is usually moved out of a temporary directory
+        shutil.move(texname+".pdf", pdfname+".pdf")
@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+"""Fast rendering of png thumbnails of images.
+
+Instead of drawing each thumbnail with matplotlib, the image is downsampled
+by area averaging, mapped to colors through a precomputed lookup table
+(LUT) and encoded as png directly. Only numpy, zlib and struct are used, so
+thumbnails can be rendered from any thread.
+
+"""
+
+import os
+import zlib
+import struct
+
+import numpy as np
+
+
+_luts = {}
+
+
+def make_lut(cmap='gray', ncolors=256):
+    """Return a lookup table that maps uint8 values to RGB colors
+
+    **Inputs**
+
+      * cmap: str, name of a matplotlib colormap. 'gray' does not need
+              matplotlib.
+      * ncolors: int, number of entries of the LUT
+
+    **Outputs**
+
+      * lut: array of shape (ncolors, 3) and dtype uint8
+
+    """
+
+    key = (cmap, ncolors)
+    if key not in _luts:
+        if cmap == 'gray':
+            ramp = np.linspace(0, 255, ncolors).round().astype(np.uint8)
+            lut = np.column_stack([ramp, ramp, ramp])
+        else:
+            import matplotlib.cm
+            colors = matplotlib.cm.get_cmap(cmap, ncolors)(np.arange(ncolors))
+            lut = (colors[:, :3]*255).round().astype(np.uint8)
+        _luts[key] = lut
+
+    return _luts[key]
+
+
+def thumbnail_shape(shape, width=150, maxheight=220, maxaspect=2.2):
+    """Return the (rows, columns) of a thumbnail of an image with `shape`
+
+    The thumbnail is `width` pixels wide, unless the image is more than
+    `maxaspect` times higher than wide; then it is `maxheight` pixels high.
+    The aspect ratio of the image is kept.
+
+    """
+
+    aspect = float(shape[0])/shape[1]
+    if aspect < maxaspect:
+        return max(1, int(round(width*aspect))), width
+    else:
+        return maxheight, max(1, int(round(maxheight/aspect)))
+
+
+def downsample(img, shape):
+    """Downsample an image to `shape` by averaging over blocks of pixels
+
+    **Inputs**
+
+      * img: 2D array
+      * shape: tuple, (rows, columns) of the result, should not be larger
+               than img.shape
+
+    **Outputs**
+
+      * small: 2D float array of shape `shape`
+
+    """
+
+    img = np.asarray(img, dtype=np.float32)
+    # average over integer blocks that keep the result at least as big as
+    # shape, then pick the nearest of those pixels
+    fy = max(1, img.shape[0] // shape[0])
+    fx = max(1, img.shape[1] // shape[1])
+    ny = img.shape[0] // fy
+    nx = img.shape[1] // fx
+    small = img[:ny*fy, :nx*fx].reshape(ny, fy, nx, fx).mean(axis=3).mean(axis=1)
+
+    rows = (np.arange(shape[0])*ny) // shape[0]
+    cols = (np.arange(shape[1])*nx) // shape[1]
+
+    return small[rows[:, np.newaxis], cols]
+
+
+def apply_lut(img, vmin, vmax, lut):
+    """Map an image to RGB colors, values are clipped to [vmin, vmax]
+
+    **Outputs**
+
+      * rgb: uint8 array of shape img.shape + (3, )
+
+    """
+
+    ncolors = lut.shape[0]
+    scaled = (np.asarray(img, dtype=np.float32) - vmin)*((ncolors - 1.)/
+                                                          (vmax - vmin))
+    # NaN becomes the lowest color
+    scaled = np.where(np.isfinite(scaled), scaled, 0)
+    idx = np.clip(scaled + 0.5, 0, ncolors - 1).astype(np.intp)
+
+    return lut[idx]
+
+
+def _png_chunk(chunktype, data):
+    chunk = chunktype + data
+    return ''.join([struct.pack('>I', len(data)), chunk,
+                    struct.pack('>I', zlib.crc32(chunk) & 0xffffffff)])
+
+
+def encode_png(rgb, level=6):
+    """Encode an image as png
+
+    **Inputs**
+
+      * rgb: uint8 array, of shape (M, N, 3) for color or (M, N) for gray
+      * level: int, zlib compression level
+
+    **Outputs**
+
+      * png: str, the contents of the png file
+
+    """
+
+    rgb = np.ascontiguousarray(rgb, dtype=np.uint8)
+    height, width = rgb.shape[:2]
+    colortype = 2 if rgb.ndim == 3 else 0
+    # every row starts with filter type 0 (none)
+    rows = rgb.reshape(height, -1)
+    raw = np.empty((height, rows.shape[1] + 1), dtype=np.uint8)
+    raw[:, 0] = 0
+    raw[:, 1:] = rows
+
+    header = struct.pack('>IIBBBBB', width, height, 8, colortype, 0, 0, 0)
+    return ''.join(['\x89PNG\r\n\x1a\n',
+                    _png_chunk('IHDR', header),
+                    _png_chunk('IDAT', zlib.compress(raw.tostring(), level)),
+                    _png_chunk('IEND', '')])
+
+
+def render_thumbnail(img, pngpath, vmin=0., vmax=1.35, width=150,
+                     maxheight=220, maxaspect=2.2, cmap='gray'):
+    """Save a thumbnail of an image as png file
+
+    **Inputs**
+
+      * img: 2D array, usually the transmission image
+      * pngpath: str, the path of the png file
+      * vmin: float, the value shown as the lowest color
+      * vmax: float, the value shown as the highest color
+      * width: int, width of the thumbnail in pixels
+      * maxheight: int, height of the thumbnail in pixels for images that
+                   are higher than `maxaspect`
+      * maxaspect: float, the aspect ratio above which the height is fixed
+      * cmap: str, name of the colormap, see make_lut
+
+    """
+
+    shape = thumbnail_shape(img.shape, width=width, maxheight=maxheight,
+                            maxaspect=maxaspect)
+    rgb = apply_lut(downsample(img, shape), vmin, vmax, make_lut(cmap))
+
+    # write to a temporary file first, so a png is never read half-written
+    tmppath = '%s.%s.tmp'%(pngpath, os.getpid())
+    f = open(tmppath, 'wb')
+    try:
+        f.write(encode_png(rgb))
+    finally:
+        f.close()
+    if os.name == 'nt' and os.path.exists(pngpath):
+        os.remove(pngpath)
+    os.rename(tmppath, pngpath)
@@ -1,12 +1,13 @@
 #!/usr/bin/env python
 """Functions to create and/or save plots of images and fit results.
 
+pylab is only imported when a plot is made, so importing this module (also
+through fitfermions) is fast and does not need a GUI.
+
 """
 
 import numpy as np
 import scipy as sp
-import matplotlib as mpl
-import pylab
 
 from imageprocess import calc_absimage
 
@@ -38,6 +39,8 @@ def show_fitresult(rcoord, od_prof, fit_prof, T, N, figname=None, showfig=False)
 
     """
 
+    import pylab
+
     fig = pylab.figure()
     ax1 = fig.add_subplot(111)
     ax1.plot(rcoord, od_prof, 'b-', label=r'data')
@@ -90,6 +93,8 @@ def show_fitresult_errorbars(rcoord, od_prof, fit_profs, T, N, linestyles=None,
 
     """
 
+    import pylab
+
     if not linestyles:
         linestyles = ['r-']
         for i in range(len(fit_profs)-1):
@@ -135,6 +140,8 @@ def show_rawframes(rawdata, figname=None, showfig=False):
 
     """
 
+    import pylab
+
     transimg, odimg = calc_absimage(rawdata)
     aspect = transimg.shape[0]/float(transimg.shape[1])
 
@@ -181,6 +188,8 @@ def show_transimg(img, vmin=0, vmax=1.35, cmap=None, com=None, colorbar=False,
 
     """
 
+    import pylab
+
     if not cmap:
         cmap = pylab.cm.gray
 
@@ -218,6 +227,8 @@ def contourplot(img, numlines=100, filter=None, figname=None, showfig=False):
 
     """
 
+    import pylab
+
     if filter:
         img = sp.ndimage.gaussian_filter(img, filter)
     aspect = img.shape[1]/float(img.shape[0])
@@ -231,7 +242,7 @@ def contourplot(img, numlines=100, filter=None, figname=None, showfig=False):
     return fig
 
 
-def show_img_and_com(img, com, cmap=pylab.cm.gray, figname=None, showfig=False):
+def show_img_and_com(img, com, cmap=None, figname=None, showfig=False):
     """Show the image and mark the center of mass with a cross
 
 
@@ -239,7 +250,8 @@ def show_img_and_com(img, com, cmap=pylab.cm.gray, figname=None, showfig=False):
 
       * img: 2D array, containing the image
       * com: sequence, containing the two coordinates of the center of mass
-      * cmap: colormap, a valid colormap from the matplotlib.cm module
+      * cmap: colormap, a valid colormap from the matplotlib.cm module,
+              default is gray
       * figname: str, if not None the figure is saved with this filename
       * showfig: bool, if True pop up a figure with pylab.show()
 
@@ -249,6 +261,10 @@ def show_img_and_com(img, com, cmap=pylab.cm.gray, figname=None, showfig=False):
 
     """
 
+    import pylab
+
+    if cmap is None:
+        cmap = pylab.cm.gray
     fig = pylab.figure()
     ax = fig.add_subplot(111)
 
@@ -281,6 +297,8 @@ def show_residuals(rcoord, od_prof, fit_prof, figname=None, showfig=False):
 
     """
 
+    import pylab
+
     fig = pylab.figure(figsize=(12,4))
     ax1 = fig.add_subplot(121)
     ax1.plot(rcoord, od_prof - fit_prof, 'b-')
@@ -305,6 +323,8 @@ def show_residuals(rcoord, od_prof, fit_prof, figname=None, showfig=False):
 def _save_or_show(figname=None, showfig=False):
     """Save and/or show figure depending on inputs"""
 
+    import pylab
+
     if figname:
         pylab.savefig(''.join([figname, '.png']))
         pylab.close()